@@ -10,6 +10,8 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+
 logger = logging.getLogger(__name__)
 
 # TED XML namespaces
@@ -41,7 +43,7 @@ NOTICE_DISPATCH_DATE_XPATHS = [
 ]
 
 
-def parse_notice_dispatch_date(xml_content: str | bytes) -> str | None:
+def parse_notice_dispatch_date(xml_content: XMLContent) -> str | None:
     """Parse the notice dispatch date (BT-05) from TED XML content.
 
     Extracts the dispatch date from TED XML and converts it to ISO format.
@@ -57,10 +59,7 @@ def parse_notice_dispatch_date(xml_content: str | bytes) -> str | None:
         etree.XMLSyntaxError: If XML content is invalid
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         for xpath in NOTICE_DISPATCH_DATE_XPATHS:
             date_nodes = root.xpath(xpath + "/text()")
@@ -9,6 +9,8 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+
 logger = logging.getLogger(__name__)
 
 # TED form types that may contain cross border law information
@@ -25,7 +27,7 @@ TED_FORM_TYPES = [
 ]
 
 
-def parse_cross_border_law(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_cross_border_law(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the cross border law description (BT-09) from TED XML content.
 
     Extracts the PROCUREMENT_LAW element from various TED form types and
@@ -39,11 +41,8 @@ def parse_cross_border_law(xml_content: str | bytes) -> dict[str, Any] | None:
         {'tender': {'crossBorderLaw': '<law description>'}}
         or None if not found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Invalid XML content provided")
         return None
@@ -8,7 +8,7 @@ Also extracts contracting authority type information.
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -142,7 +142,7 @@ def _process_ca_types(ca_types, ca_type_others, org_classifications, org_id) ->
         org_classifications[org_id].append(classification)
 
 
-def parse_authority_activity(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_authority_activity(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the authority activity (BT-10) and authority type from TED XML content.
 
     Extracts authority activity codes and authority types for each contracting party and maps them
@@ -154,9 +154,7 @@ def parse_authority_activity(xml_content: str | bytes) -> dict[str, Any] | None:
     Returns:
         Dictionary containing party classifications or None if no relevant data found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Define XPaths for various TED form sections that contain activity information
     activity_xpaths = [
@@ -6,27 +6,24 @@ classifications using the eu-buyer-legal-type scheme.
 
 import logging
 
-from lxml import etree
-
 from src.ted_and_doffin_to_ocds.converters.eforms.bt_11_procedure_buyer import (
     BUYER_LEGAL_TYPE_CODES,
     NAMESPACES,
 )
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
 def parse_ted_buyer_legal_type(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict]] | None:
     """Parse buyer legal type information from TED XML and map to OCDS classifications.
 
     Extracts the organization ID and buyer legal type using various TED XPath expressions.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except Exception:
         logger.exception("Error parsing XML")
         return None
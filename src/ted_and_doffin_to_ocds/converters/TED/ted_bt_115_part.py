@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_gpa_coverage_part(xml_content: str | bytes) -> dict | None:
+def parse_gpa_coverage_part(xml_content: XMLContent) -> dict | None:
     """Parse GPA coverage information from TED XML for the part.
 
     Extract information about whether the procurement is covered by the
@@ -27,9 +27,7 @@ def parse_gpa_coverage_part(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Check for GPA coverage in different TED form types
     gpa_paths = [
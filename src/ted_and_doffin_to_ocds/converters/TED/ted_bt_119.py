@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_dps_termination(xml_content: str | bytes) -> dict | None:
+def parse_dps_termination(xml_content: XMLContent) -> dict | None:
     """Parse dynamic purchasing system termination information from TED XML.
 
     Extract information about whether the dynamic purchasing system is terminated
@@ -32,9 +32,7 @@ def parse_dps_termination(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Check for DPS termination in F03 form
     termination_path = (
@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_no_negotiation_necessary(xml_content: str | bytes) -> dict | None:
+def parse_no_negotiation_necessary(xml_content: XMLContent) -> dict | None:
     """Parse no negotiation necessary information from TED XML.
 
     Extract information about whether the buyer reserves the right to award the contract
@@ -30,9 +30,7 @@ def parse_no_negotiation_necessary(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Check for the presence of the RIGHT_CONTRACT_INITIAL_TENDERS element in F02 form
     # Its presence indicates the right is reserved (true).
@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_electronic_auction_description(xml_content: str | bytes) -> dict | None:
+def parse_electronic_auction_description(xml_content: XMLContent) -> dict | None:
     """Parse electronic auction description from TED XML.
 
     Extract additional information about the electronic auction as defined in BT-122.
@@ -31,9 +31,7 @@ def parse_electronic_auction_description(xml_content: str | bytes) -> dict | Non
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Define XPaths for different TED forms
     # Note: The defence form path seems related to *use* not description, sticking to F01/F02/F04/F05
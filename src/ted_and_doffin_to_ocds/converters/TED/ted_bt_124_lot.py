@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tool_atypical_url(xml_content: str | bytes) -> dict | None:
+def parse_tool_atypical_url(xml_content: XMLContent) -> dict | None:
     """Parse atypical tool URL information from TED XML for each lot.
 
     Extract information about URLs for tools and devices that are not generally
@@ -34,9 +34,7 @@ def parse_tool_atypical_url(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
     namespaces = {
         "ted": "http://publications.europa.eu/resource/schema/ted/R2.0.9/publication",
         "n2016": "http://publications.europa.eu/resource/schema/ted/2016/nuts",
@@ -2,6 +2,8 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+
 logger = logging.getLogger(__name__)
 
 # Mapping for TED procedure type codes to relationship types
@@ -53,7 +55,7 @@ def _extract_identifier_from_node(node: etree._Element) -> str | None:
     return None
 
 
-def parse_direct_award_justification(xml_content: str | bytes) -> dict | None:
+def parse_direct_award_justification(xml_content: XMLContent) -> dict | None:
     """Parse BT-1252: Direct award justification identifiers from TED format.
 
     Extracts identifiers of previous procedures that justify direct award,
@@ -76,9 +78,7 @@ def parse_direct_award_justification(xml_content: str | bytes) -> dict | None:
         Returns None if no relevant data found or on error
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"relatedProcesses": []}
 
         # For each procedure type, check all possible XPath locations
@@ -1,12 +1,12 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
 def parse_previous_planning_identifier_lot(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the previous planning identifier information from TED XML data.
 
@@ -33,9 +33,7 @@ def parse_previous_planning_identifier_lot(
     Raises:
         etree.XMLSyntaxError: If the input is not valid XML.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # TED XML paths for different form types based on BT-125(i)-Lot metadata
     form_paths = [
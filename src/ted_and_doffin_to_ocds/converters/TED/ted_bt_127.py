@@ -3,6 +3,7 @@ import logging
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +16,7 @@ TED_XPATH_TEMPLATES = [
 ]
 
 
-def parse_future_notice_date(xml_content: str | bytes) -> str | None:
+def parse_future_notice_date(xml_content: XMLContent) -> str | None:
     """Parse the future notice date (BT-127) from TED format XML content.
 
     Args:
@@ -26,9 +27,7 @@ def parse_future_notice_date(xml_content: str | bytes) -> str | None:
         Format example: "2020-03-15T00:00:00+01:00"
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         # Try all XPath patterns
         for xpath in TED_XPATH_TEMPLATES:
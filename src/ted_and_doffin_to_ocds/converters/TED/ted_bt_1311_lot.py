@@ -3,11 +3,12 @@ import logging
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import convert_to_iso_format
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_deadline_receipt_requests(xml_content: str | bytes) -> dict | None:
+def parse_deadline_receipt_requests(xml_content: XMLContent) -> dict | None:
     """Parse BT-1311: Time limit for receipt of requests to participate from TED format.
 
     Extracts date and time components for participation request deadline from TED XML.
@@ -32,9 +33,7 @@ def parse_deadline_receipt_requests(xml_content: str | bytes) -> dict | None:
         Returns None if no relevant data found or on error
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
         # Check different potential paths for defense contracts
@@ -3,11 +3,12 @@ import logging
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import convert_to_iso_format
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_public_opening_date(xml_content: str | bytes) -> dict | None:
+def parse_lot_public_opening_date(xml_content: XMLContent) -> dict | None:
     """Parse the public opening date from TED XML data.
 
     Args:
@@ -33,9 +34,7 @@ def parse_lot_public_opening_date(xml_content: str | bytes) -> dict | None:
         }
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
         # Try F02_2014 and F05_2014 forms
@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bid_opening_location(xml_content: str | bytes) -> dict | None:
+def parse_bid_opening_location(xml_content: XMLContent) -> dict | None:
     """Parse the public opening place information from TED XML content.
 
     Args:
@@ -24,10 +24,7 @@ def parse_bid_opening_location(xml_content: str | bytes) -> dict | None:
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Try to extract public opening place from both F02 and F05 form types
     xpath_queries = [
@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_direct_award_justification_rationale(xml_content: str | bytes) -> dict | None:
+def parse_direct_award_justification_rationale(xml_content: XMLContent) -> dict | None:
     """Parse the direct award justification text (BT-135) from TED XML content.
 
     Maps to tender.procurementMethodRationale in OCDS.
@@ -22,10 +22,7 @@ def parse_direct_award_justification_rationale(xml_content: str | bytes) -> dict
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Try to extract direct award justification from multiple TED form types based on BT-135 mapping
     xpath_queries = [
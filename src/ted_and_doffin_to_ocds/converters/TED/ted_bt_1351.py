@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_accelerated_procedure_justification(xml_content: str | bytes) -> dict | None:
+def parse_accelerated_procedure_justification(xml_content: XMLContent) -> dict | None:
     """Parse the accelerated procedure justification text (BT-1351) from TED XML content.
 
     Maps to tender.procedure.acceleratedRationale in OCDS.
@@ -24,10 +24,7 @@ def parse_accelerated_procedure_justification(xml_content: str | bytes) -> dict
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Try to extract accelerated procedure justification from multiple TED form types based on BT-1351 mapping
     xpath_queries = [
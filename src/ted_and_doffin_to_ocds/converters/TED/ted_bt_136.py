@@ -1,6 +1,6 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +78,7 @@ JUSTIFICATION_CODES = {
 }
 
 
-def parse_direct_award_justification_code(xml_content: str | bytes) -> dict | None:
+def parse_direct_award_justification_code(xml_content: XMLContent) -> dict | None:
     """Parse direct award justification codes from TED XML content.
 
     Maps to tender.procurementMethodRationaleClassifications in OCDS.
@@ -101,10 +101,7 @@ def parse_direct_award_justification_code(xml_content: str | bytes) -> dict | No
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Expanded XPath for all TED form types that can contain direct award justifications
     form_types = [
@@ -174,13 +171,13 @@ def parse_direct_award_justification_code(xml_content: str | bytes) -> dict | No
                 "id": code,
                 "description": JUSTIFICATION_CODES.get(code, "Unknown"),
             }
-            for code in justification_codes
+            for code in sorted(justification_codes)
         ]
 
         logger.info(
             "Found %s direct award justification code(s): %s",
             len(justification_codes),
-            ", ".join(justification_codes),
+            ", ".join(sorted(justification_codes)),
         )
         return {
             "tender": {"procurementMethodRationaleClassifications": classifications}
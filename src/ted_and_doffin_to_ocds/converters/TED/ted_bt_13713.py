@@ -2,7 +2,7 @@ import logging
 import re
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 LOT_ID_PATTERN = re.compile(r"^LOT-\d{4}$")
 
 
-def parse_lot_result_identifier(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_lot_result_identifier(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse lot result identifier (BT-13713) from TED XML content.
 
     Gets award and lot identifiers from each award contract section. Creates/updates
@@ -26,11 +26,8 @@ def parse_lot_result_identifier(xml_content: str | bytes) -> dict[str, Any] | No
         According to TED guidance, if a lot number isn't specified, it defaults to '1'.
         The lot ID must follow the pattern ^LOT-\\d{4}$ (LOT- followed by exactly 4 digits).
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"awards": []}
 
         # TED XML doesn't use namespaces in the same way as eForms
@@ -125,7 +122,7 @@ def merge_lot_result_identifier(
         if existing_award:
             existing_lots = set(existing_award.get("relatedLots", []))
             existing_lots.update(new_award["relatedLots"])
-            existing_award["relatedLots"] = list(existing_lots)
+            existing_award["relatedLots"] = sorted(existing_lots)
             logger.info("Updated relatedLots for award %s", new_award["id"])
         else:
             existing_awards.append(new_award)
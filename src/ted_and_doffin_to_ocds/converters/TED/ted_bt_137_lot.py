@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_purpose_lot_identifier(xml_content: str | bytes) -> dict | None:
+def parse_purpose_lot_identifier(xml_content: XMLContent) -> dict | None:
     """Parse the lot identifiers from TED XML data.
 
     Args:
@@ -27,10 +27,7 @@ def parse_purpose_lot_identifier(xml_content: str | bytes) -> dict | None:
     Note:
         According to TED guidance, if a lot number isn't specified, it defaults to '1'.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # TED XML doesn't use namespaces in the same way as eForms
     # Try to extract lot numbers from various possible paths
@@ -1,11 +1,11 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_identifier(xml_content: str | bytes) -> dict | None:
+def parse_part_identifier(xml_content: XMLContent) -> dict | None:
     r"""Parse the part identifier from TED XML data.
 
     Args:
@@ -24,10 +24,7 @@ def parse_part_identifier(xml_content: str | bytes) -> dict | None:
         According to TED guidance, if a lot/part number isn't specified, it defaults to '1'.
         The part identifier must follow the pattern ^PAR-\d{4}$ (PAR- followed by exactly 4 digits).
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # TED XML doesn't use namespaces in the same way as eForms
     # Try to extract part/lot numbers from various possible paths
@@ -5,6 +5,7 @@ from typing import Any
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +21,7 @@ TED_XPATH_TEMPLATES = [
 
 
 def parse_additional_info_deadline(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> list[dict[str, Any]] | None:
     """Parse the additional information deadline from TED XML content.
 
@@ -32,9 +33,7 @@ def parse_additional_info_deadline(
                                       or None if no valid data is found
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         deadline_text = None
 
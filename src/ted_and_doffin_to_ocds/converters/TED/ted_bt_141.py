@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 # OCDS Mapping: tender.amendments[].description
 
 
-def parse_change_description(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_change_description(xml_content: XMLContent) -> dict[str, Any] | None:
     """
     Parse the change description from TED XML.
 
@@ -23,11 +23,8 @@ def parse_change_description(xml_content: str | bytes) -> dict[str, Any] | None:
         or None if not found.
         Example: {"tender": {"amendments": [{"description": "The changes have been applied to..."}]}}
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         # XPath for F20_2014 forms
         xpath = "FORM_SECTION/F20_2014/MODIFICATIONS_CONTRACT/INFO_MODIFICATIONS/SHORT_DESCR/text()"
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +22,7 @@ STATUS_CODE_MAPPING = {
 }
 
 
-def parse_winner_chosen(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_winner_chosen(xml_content: XMLContent) -> dict[str, Any] | None:
     """
     Parse the winner chosen status from TED XML.
 
@@ -51,11 +51,8 @@ def parse_winner_chosen(xml_content: str | bytes) -> dict[str, Any] | None:
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         result = {"awards": [], "tender": {"lots": []}}
 
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ REASON_CODE_MAPPING = {
 }
 
 
-def parse_not_awarded_reason(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_not_awarded_reason(xml_content: XMLContent) -> dict[str, Any] | None:
     """
     Parse the not awarded reason from TED XML.
 
@@ -49,11 +49,8 @@ def parse_not_awarded_reason(xml_content: str | bytes) -> dict[str, Any] | None:
             ]
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         result = {"awards": []}
 
@@ -1,9 +1,8 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +17,7 @@ logger = logging.getLogger(__name__)
 
 
 def parse_contract_conclusion_date(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses the contract conclusion date from TED XML content.
 
@@ -29,11 +28,8 @@ def parse_contract_conclusion_date(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing contract conclusion dates,
         or None if no contracts are found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"contracts": []}
 
         # List of forms to check
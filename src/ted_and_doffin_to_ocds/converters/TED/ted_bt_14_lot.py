@@ -1,12 +1,12 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_documents_restricted(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_lot_documents_restricted(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse restricted document references from TED XML content.
 
     Args:
@@ -19,11 +19,8 @@ def parse_lot_documents_restricted(xml_content: str | bytes) -> dict[str, Any] |
         According to TED guidance, document restrictions are represented as a
         participation fee of type 'document'
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"participationFees": []}}
 
         # Check the paths for document restricted flags in different form types
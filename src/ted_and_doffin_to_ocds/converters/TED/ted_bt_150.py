@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,7 @@ logger = logging.getLogger(__name__)
 
 
 def parse_contract_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses contract identifiers from TED XML content.
 
@@ -27,11 +27,8 @@ def parse_contract_identifier(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing contract identifiers,
         or None if no contracts are found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"contracts": []}
 
         # List of forms to check
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +21,7 @@ logger = logging.getLogger(__name__)
 
 
 def parse_lot_documents_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, Any]]]] | None:
     """Parses document URLs for lots from TED XML content.
 
@@ -32,11 +32,8 @@ def parse_lot_documents_url(
         Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]]: A dictionary containing document URLs,
         or None if no documents are found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"documents": []}}
 
         # List of forms to check
@@ -138,7 +135,7 @@ def merge_lot_documents_url(
                     existing_document["relatedLots"] = []
 
                 # Add new lot references and ensure uniqueness
-                existing_document["relatedLots"] = list(
+                existing_document["relatedLots"] = sorted(
                     set(existing_document["relatedLots"] + new_document["relatedLots"])
                 )
         else:
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +13,7 @@ logger = logging.getLogger(__name__)
 
 
 def parse_part_documents_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, Any]]]] | None:
     """Parses document URLs for parts from TED XML content.
 
@@ -24,11 +24,8 @@ def parse_part_documents_url(
         Optional[Dict[str, Dict[str, List[Dict[str, Any]]]]]: A dictionary containing document URLs,
         or None if no documents are found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"documents": []}}
 
         # Handle defense contract forms which have different XPaths
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ GOVERNMENT_CHARGE_TITLE = "Prizes, payments or other financial advantages provid
 
 
 def parse_concession_revenue_buyer(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses concession revenue buyer information from TED XML content.
 
@@ -25,11 +25,8 @@ def parse_concession_revenue_buyer(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing concession revenue data,
         or None if no data is found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"contracts": []}
 
         # Check for F23_2014 form
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 
 
 def parse_notice_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses notice value from TED XML content.
 
@@ -25,11 +25,8 @@ def parse_notice_value(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing notice value data,
         or None if no notice value is found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"contracts": []}
 
         # Form types to check
@@ -1,7 +1,7 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +14,7 @@ USER_CHARGE_TITLE = "The estimated revenue coming from the users of the concessi
 
 
 def parse_concession_revenue_user(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses user concession revenue from TED XML content.
 
@@ -25,11 +25,8 @@ def parse_concession_revenue_user(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing user concession revenue data,
         or None if no revenue data is found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"contracts": []}
 
         # Form F23_2014 contains concession revenue information
@@ -3,6 +3,8 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+
 logger = logging.getLogger(__name__)
 
 # BT-163: Concession Value Description
@@ -109,7 +111,7 @@ def _process_object_contract(
 
 
 def parse_concession_value_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses the concession value description from TED XML content.
 
@@ -120,11 +122,8 @@ def parse_concession_value_description(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing award information,
         or None if no data is found.
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"awards": []}
 
         # Forms to check for different XPaths
@@ -192,7 +191,7 @@ def merge_concession_value_description(
             if "relatedLots" in new_award:
                 existing_lots = set(existing_award.get("relatedLots", []))
                 existing_lots.update(new_award["relatedLots"])
-                existing_award["relatedLots"] = list(existing_lots)
+                existing_award["relatedLots"] = sorted(existing_lots)
         else:
             existing_awards.append(new_award)
 
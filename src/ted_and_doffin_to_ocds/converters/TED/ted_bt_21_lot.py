@@ -1,12 +1,12 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_title(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_lot_title(xml_content: XMLContent) -> dict[str, Any] | None:
     """
     Parses the lot title (BT-21-Lot) from TED XML content.
 
@@ -22,9 +22,7 @@ def parse_lot_title(xml_content: str | bytes) -> dict[str, Any] | None:
         under `tender.lots`, or None if no lots are found.
         Example: {'tender': {'lots': [{'id': 'lot-1', 'title': 'Lot Title 1'}]}}
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
     namespaces = {}
 
     result = {"tender": {"lots": []}}
@@ -2,12 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_electronic_auction(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_767_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_AUCTION_CONSTRAINT_INDICATOR = register_xpath(
+    "bt_767_lot.XPATH_AUCTION_CONSTRAINT_INDICATOR",
+    "cac:TenderingProcess/cac:AuctionTerms/cbc:AuctionConstraintIndicator/text()",
+)
+
+
+def parse_electronic_auction(xml_content: XMLContent) -> dict | None:
     """Parse electronic auction information from XML content.
 
     Args:
@@ -30,32 +38,14 @@ def parse_electronic_auction(xml_content: str | bytes) -> dict | None:
             Returns None if no valid lots are found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
+    document = get_document(xml_content)
     result: dict[str, dict] = {"tender": {"lots": []}}
 
-    lots: list = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots: list = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        auction_indicator: list = lot.xpath(
-            "cac:TenderingProcess/cac:AuctionTerms/cbc:AuctionConstraintIndicator/text()",
-            namespaces=namespaces,
-        )
+        lot_id: str = XPATH_ID(lot)[0]
+        auction_indicator: list = XPATH_AUCTION_CONSTRAINT_INDICATOR(lot)
 
         if auction_indicator:
             result["tender"]["lots"].append(
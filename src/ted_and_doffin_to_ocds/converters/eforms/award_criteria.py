@@ -0,0 +1,186 @@
+"""Converter for the award criteria of lots and lot groups.
+
+Each cac:AwardingCriterion of a lot or lot group is visited once. Every
+cac:SubordinateAwardingCriterion becomes one criterion, with all of its
+fields, and the criteria array of each lot and lot group is emitted
+complete:
+
+- awardCriteria.weightingDescription (BT-543) and orderRationale (BT-733)
+- criteria: type (BT-539), name (BT-734) and description (BT-540)
+- criteria.numbers: one number per efac:AwardCriterionParameter, with the
+  number (BT-541) and its weight (BT-5421), fixed (BT-5422) or threshold
+  (BT-5423) code
+"""
+
+import logging
+from collections.abc import Mapping
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.code_lists import (
+    NUMBER_THRESHOLD_CODES,
+    NUMBER_WEIGHT_CODES,
+)
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+logger = logging.getLogger(__name__)
+
+# The OCDS field of each parameter list, and how its codes are mapped
+# (None keeps the code as it is)
+PARAMETER_FIELDS: Final[dict[str, tuple[str, Mapping[str, str] | None]]] = {
+    "number-weight": ("weight", NUMBER_WEIGHT_CODES),
+    "number-fixed": ("fixed", None),
+    "number-threshold": ("threshold", NUMBER_THRESHOLD_CODES),
+}
+
+XPATH_ID = register_xpath("award_criteria.XPATH_ID", "cbc:ID/text()")
+XPATH_AWARDING_CRITERION = register_xpath(
+    "award_criteria.XPATH_AWARDING_CRITERION",
+    "cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion",
+)
+XPATH_CALCULATION_EXPRESSION = register_xpath(
+    "award_criteria.XPATH_CALCULATION_EXPRESSION", "cbc:CalculationExpression/text()"
+)
+XPATH_DESCRIPTION = register_xpath(
+    "award_criteria.XPATH_DESCRIPTION", "cbc:Description/text()"
+)
+XPATH_SUBORDINATE_AWARDING_CRITERION = register_xpath(
+    "award_criteria.XPATH_SUBORDINATE_AWARDING_CRITERION",
+    "cac:SubordinateAwardingCriterion",
+)
+XPATH_TYPE = register_xpath(
+    "award_criteria.XPATH_TYPE",
+    "cbc:AwardingCriterionTypeCode[@listName='award-criterion-type']/text()",
+)
+XPATH_NAME = register_xpath("award_criteria.XPATH_NAME", "cbc:Name/text()")
+XPATH_AWARD_CRITERION_PARAMETER = register_xpath(
+    "award_criteria.XPATH_AWARD_CRITERION_PARAMETER",
+    "ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension"
+    "/efac:AwardCriterionParameter",
+)
+XPATH_PARAMETER_CODE = register_xpath(
+    "award_criteria.XPATH_PARAMETER_CODE", "efbc:ParameterCode"
+)
+XPATH_PARAMETER_NUMERIC = register_xpath(
+    "award_criteria.XPATH_PARAMETER_NUMERIC", "efbc:ParameterNumeric/text()"
+)
+
+
+def _number(parameter: etree._Element) -> dict[str, Any]:
+    number: dict[str, Any] = {}
+    numeric = XPATH_PARAMETER_NUMERIC(parameter)
+    if numeric:
+        number["number"] = float(numeric[0])
+    for code in XPATH_PARAMETER_CODE(parameter):
+        field, mapping = PARAMETER_FIELDS.get(code.get("listName"), (None, None))
+        value = (code.text or "").strip()
+        if field is None or not value:
+            continue
+        if mapping is None:
+            number[field] = value
+        elif value in mapping:
+            number[field] = mapping[value]
+    return number
+
+
+def _criterion(subordinate: etree._Element) -> dict[str, Any]:
+    criterion: dict[str, Any] = {}
+    if criterion_type := XPATH_TYPE(subordinate):
+        criterion["type"] = criterion_type[0]
+    if name := XPATH_NAME(subordinate):
+        criterion["name"] = name[0].strip()
+    if description := XPATH_DESCRIPTION(subordinate):
+        criterion["description"] = description[0]
+    numbers = [
+        number
+        for parameter in XPATH_AWARD_CRITERION_PARAMETER(subordinate)
+        if (number := _number(parameter))
+    ]
+    if numbers:
+        criterion["numbers"] = numbers
+    return criterion
+
+
+def _award_criteria(lot: etree._Element) -> dict[str, Any]:
+    award_criteria: dict[str, Any] = {}
+    criteria = []
+    for awarding_criterion in XPATH_AWARDING_CRITERION(lot):
+        if "weightingDescription" not in award_criteria and (
+            expression := XPATH_CALCULATION_EXPRESSION(awarding_criterion)
+        ):
+            award_criteria["weightingDescription"] = expression[0]
+        if "orderRationale" not in award_criteria and (
+            rationale := XPATH_DESCRIPTION(awarding_criterion)
+        ):
+            award_criteria["orderRationale"] = rationale[0].strip()
+        criteria.extend(
+            criterion
+            for subordinate in XPATH_SUBORDINATE_AWARDING_CRITERION(awarding_criterion)
+            if (criterion := _criterion(subordinate))
+        )
+    if criteria:
+        award_criteria["criteria"] = criteria
+    return award_criteria
+
+
+def parse_award_criteria(xml_content: XMLContent) -> dict[str, Any] | None:
+    """Parse the award criteria of every lot and lot group.
+
+    Args:
+        xml_content: The XML content to parse, or a parsed NoticeDocument
+
+    Returns:
+        A dictionary with the "lots" and "lotGroups" of the tender that have
+        award criteria, each with its complete "awardCriteria" object, or
+        None if no lot or lot group has award criteria
+
+    """
+    document = get_document(xml_content)
+    tender: dict[str, list[dict[str, Any]]] = {}
+    for scheme_name, key in (("Lot", "lots"), ("LotsGroup", "lotGroups")):
+        for lot in document.procurement_project_lots(scheme_name):
+            award_criteria = _award_criteria(lot)
+            if award_criteria:
+                tender.setdefault(key, []).append(
+                    {"id": XPATH_ID(lot)[0], "awardCriteria": award_criteria}
+                )
+    return {"tender": tender} if tender else None
+
+
+def merge_award_criteria(
+    release_json: dict[str, Any], award_criteria_data: dict[str, Any] | None
+) -> None:
+    """Merge the award criteria of lots and lot groups into the release.
+
+    Lots and lot groups are matched by id. Since the parsed criteria array
+    is complete, it replaces any criteria the lot or lot group already has.
+
+    Args:
+        release_json: The release to update in place
+        award_criteria_data: The output of parse_award_criteria()
+
+    """
+    if not award_criteria_data:
+        logger.info("No award criteria to merge")
+        return
+
+    tender = release_json.setdefault("tender", {})
+    for key, lots in award_criteria_data["tender"].items():
+        existing_lots = tender.setdefault(key, [])
+        for lot in lots:
+            existing_lot = find_by_id(existing_lots, lot["id"])
+            if existing_lot is None:
+                existing_lots.append(lot)
+            else:
+                existing_lot.setdefault("awardCriteria", {}).update(
+                    lot["awardCriteria"]
+                )
+
+    logger.info(
+        "Merged award criteria of %d lots and %d lot groups",
+        len(award_criteria_data["tender"].get("lots", [])),
+        len(award_criteria_data["tender"].get("lotGroups", [])),
+    )
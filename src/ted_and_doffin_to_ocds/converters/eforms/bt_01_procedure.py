@@ -5,17 +5,11 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-# Constants for XML namespaces
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 # Constants for legal basis identifiers
 CROSS_BORDER_LAW = "CrossBorderLaw"
@@ -24,11 +18,25 @@ ELI_PREFIX = "http://data.europa.eu/eli/dir"
 OTHER_VALUE = "other"
 
 # XPath expressions
-XPATH_LEGAL_BASIS_ID = f"//cac:ProcurementLegislationDocumentReference[not(cbc:ID='{CROSS_BORDER_LAW}' or cbc:ID='{LOCAL_LEGAL_BASIS}')]/cbc:ID"
-XPATH_LEGAL_BASIS_DESC = f"//cac:ProcurementLegislationDocumentReference[not(cbc:ID='{CROSS_BORDER_LAW}' or cbc:ID='{LOCAL_LEGAL_BASIS}')]/cbc:DocumentDescription"
-XPATH_LOCAL_LEGAL_BASIS_ID = f"//cac:ProcurementLegislationDocumentReference[cbc:ID='{LOCAL_LEGAL_BASIS}']/cbc:ID"
-XPATH_LOCAL_LEGAL_BASIS_DESC = f"//cac:ProcurementLegislationDocumentReference[cbc:ID='{LOCAL_LEGAL_BASIS}']/cbc:DocumentDescription"
-XPATH_REGULATORY_DOMAIN = "//cbc:RegulatoryDomain"
+XPATH_LEGAL_BASIS_ID = register_xpath(
+    "bt_01_procedure.XPATH_LEGAL_BASIS_ID",
+    f"//cac:ProcurementLegislationDocumentReference[not(cbc:ID='{CROSS_BORDER_LAW}' or cbc:ID='{LOCAL_LEGAL_BASIS}')]/cbc:ID",
+)
+XPATH_LEGAL_BASIS_DESC = register_xpath(
+    "bt_01_procedure.XPATH_LEGAL_BASIS_DESC",
+    f"//cac:ProcurementLegislationDocumentReference[not(cbc:ID='{CROSS_BORDER_LAW}' or cbc:ID='{LOCAL_LEGAL_BASIS}')]/cbc:DocumentDescription",
+)
+XPATH_LOCAL_LEGAL_BASIS_ID = register_xpath(
+    "bt_01_procedure.XPATH_LOCAL_LEGAL_BASIS_ID",
+    f"//cac:ProcurementLegislationDocumentReference[cbc:ID='{LOCAL_LEGAL_BASIS}']/cbc:ID",
+)
+XPATH_LOCAL_LEGAL_BASIS_DESC = register_xpath(
+    "bt_01_procedure.XPATH_LOCAL_LEGAL_BASIS_DESC",
+    f"//cac:ProcurementLegislationDocumentReference[cbc:ID='{LOCAL_LEGAL_BASIS}']/cbc:DocumentDescription",
+)
+XPATH_REGULATORY_DOMAIN = register_xpath(
+    "bt_01_procedure.XPATH_REGULATORY_DOMAIN", "//cbc:RegulatoryDomain"
+)
 
 
 def _parse_multilingual_descriptions(descriptions: list) -> list:
@@ -51,7 +59,7 @@ def _parse_multilingual_descriptions(descriptions: list) -> list:
 
 def _process_legal_basis_id(root: etree.Element, result: dict[str, Any]) -> None:
     """Process legal basis ID from XML."""
-    legal_basis_nodes = root.xpath(XPATH_LEGAL_BASIS_ID, namespaces=NAMESPACES)
+    legal_basis_nodes = XPATH_LEGAL_BASIS_ID(root)
     if legal_basis_nodes:
         legal_basis_id = legal_basis_nodes[0].text
         result["tender"]["legalBasis"]["id"] = legal_basis_id
@@ -66,7 +74,7 @@ def _process_legal_basis_description(
     root: etree.Element, result: dict[str, Any]
 ) -> None:
     """Process legal basis description from XML."""
-    legal_basis_descriptions = root.xpath(XPATH_LEGAL_BASIS_DESC, namespaces=NAMESPACES)
+    legal_basis_descriptions = XPATH_LEGAL_BASIS_DESC(root)
     if legal_basis_descriptions:
         # For simple case, keep backward compatibility
         result["tender"]["legalBasis"]["description"] = legal_basis_descriptions[0].text
@@ -83,7 +91,7 @@ def _process_legal_basis_description(
 
 def _process_legal_basis_noid(root: etree.Element, result: dict[str, Any]) -> None:
     """Process legal basis NoID from XML."""
-    legal_basis_noid = root.xpath(XPATH_LOCAL_LEGAL_BASIS_ID, namespaces=NAMESPACES)
+    legal_basis_noid = XPATH_LOCAL_LEGAL_BASIS_ID(root)
     if legal_basis_noid:
         result["tender"]["legalBasis"]["id"] = legal_basis_noid[0].text
 
@@ -92,9 +100,7 @@ def _process_legal_basis_noid_description(
     root: etree.Element, result: dict[str, Any]
 ) -> None:
     """Process legal basis NoID description from XML."""
-    legal_basis_noid_descriptions = root.xpath(
-        XPATH_LOCAL_LEGAL_BASIS_DESC, namespaces=NAMESPACES
-    )
+    legal_basis_noid_descriptions = XPATH_LOCAL_LEGAL_BASIS_DESC(root)
     if legal_basis_noid_descriptions:
         result["tender"]["legalBasis"]["description"] = legal_basis_noid_descriptions[
             0
@@ -112,7 +118,7 @@ def _process_legal_basis_noid_description(
 
 def _process_regulatory_domain(root: etree.Element, result: dict[str, Any]) -> None:
     """Process regulatory domain from XML."""
-    regulatory_domain = root.xpath(XPATH_REGULATORY_DOMAIN, namespaces=NAMESPACES)
+    regulatory_domain = XPATH_REGULATORY_DOMAIN(root)
     if regulatory_domain and regulatory_domain[0].text != OTHER_VALUE:
         result["tender"]["legalBasis"]["wasDerivedFrom"] = {
             "scheme": "CELEX",
@@ -121,7 +127,7 @@ def _process_regulatory_domain(root: etree.Element, result: dict[str, Any]) -> N
 
 
 def parse_procedure_legal_basis(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """
     Parse legal basis information from XML content according to BT-01 specifications.
@@ -133,9 +139,7 @@ def parse_procedure_legal_basis(
         Dictionary containing legal basis information or None if no data found
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
         result = {"tender": {"legalBasis": {}}}
 
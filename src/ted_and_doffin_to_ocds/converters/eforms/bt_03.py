@@ -10,6 +10,9 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 # Form type mapping according to EU Vocabularies form type authority table
@@ -26,8 +29,13 @@ form_type_mapping: dict[str, dict[str, list[str] | str | None]] = {
 }
 
 
+XPATH_NOTICE_TYPE_CODE = register_xpath(
+    "bt_03.XPATH_NOTICE_TYPE_CODE", "//cbc:NoticeTypeCode[@listName]"
+)
+
+
 def parse_form_type(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[str] | dict[str, str]] | None:
     """Parse the form type from XML content and return corresponding OCDS mapping.
 
@@ -45,17 +53,9 @@ def parse_form_type(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
-        namespaces = {
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        }
+        root = get_root(xml_content)
 
-        notice_type_code = root.xpath(
-            "//cbc:NoticeTypeCode[@listName]", namespaces=namespaces
-        )
+        notice_type_code = XPATH_NOTICE_TYPE_CODE(root)
 
         if not notice_type_code:
             logger.warning("No NoticeTypeCode found in the XML.")
@@ -10,19 +10,18 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_CONTRACT_FOLDER_ID = register_xpath(
+    "bt_04_procedure.XPATH_CONTRACT_FOLDER_ID", "//cbc:ContractFolderID"
+)
 
 
-def parse_procedure_identifier(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_procedure_identifier(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the procedure identifier (BT-04) from XML content.
 
     Maps the ContractFolderID element value to tender.id in OCDS format.
@@ -40,14 +39,8 @@ def parse_procedure_identifier(xml_content: str | bytes) -> dict[str, Any] | Non
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
-        contract_folder_id_elements = root.xpath(
-            "//cbc:ContractFolderID",
-            namespaces=NAMESPACES,
-        )
+        root = get_root(xml_content)
+        contract_folder_id_elements = XPATH_CONTRACT_FOLDER_ID(root)
 
         if contract_folder_id_elements:
             contract_folder_id = contract_folder_id_elements[0].text
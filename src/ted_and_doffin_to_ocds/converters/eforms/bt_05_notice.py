@@ -10,19 +10,21 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ISSUE_DATE = register_xpath(
+    "bt_05_notice.XPATH_ISSUE_DATE", "/*/cbc:IssueDate/text()"
+)
+XPATH_ISSUE_TIME = register_xpath(
+    "bt_05_notice.XPATH_ISSUE_TIME", "/*/cbc:IssueTime/text()"
+)
 
 
-def parse_notice_dispatch_date_time(xml_content: str | bytes) -> str | None:
+def parse_notice_dispatch_date_time(xml_content: XMLContent) -> str | None:
     """Parse the notice dispatch date/time (BT-05) from XML content.
 
     Combines IssueDate and IssueTime elements into an ISO formatted datetime string.
@@ -39,12 +41,9 @@ def parse_notice_dispatch_date_time(xml_content: str | bytes) -> str | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
-        issue_date = root.xpath("/*/cbc:IssueDate/text()", namespaces=NAMESPACES)
-        issue_time = root.xpath("/*/cbc:IssueTime/text()", namespaces=NAMESPACES)
+        root = get_root(xml_content)
+        issue_date = XPATH_ISSUE_DATE(root)
+        issue_time = XPATH_ISSUE_TIME(root)
 
         if not (issue_date and issue_time):
             logger.warning("Missing issue date or time in XML")
@@ -8,12 +8,12 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 STRATEGIC_PROCUREMENT_MAPPING = {
     "env-imp": "environmental",
@@ -30,7 +30,16 @@ DEFAULT_STRATEGIES = [
 ]
 
 
-def parse_strategic_procurement(xml_content: str | bytes) -> dict | None:
+XPATH_ID_LOT = register_xpath(
+    "bt_06_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_STRATEGIC_PR = register_xpath(
+    "bt_06_lot.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_STRATEGIC_PR",
+    "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='strategic-procurement']/cbc:ProcurementTypeCode/text()",
+)
+
+
+def parse_strategic_procurement(xml_content: XMLContent) -> dict | None:
     """Parse strategic procurement information from XML.
 
     Args:
@@ -41,24 +50,16 @@ def parse_strategic_procurement(xml_content: str | bytes) -> dict | None:
         None: If no strategic procurement data found or if parsing fails
     """
     try:
-        root = etree.fromstring(
-            xml_content if isinstance(xml_content, bytes) else xml_content.encode()
-        )
+        document = get_document(xml_content)
 
         result = {"tender": {"lots": []}}
 
         # Find all lots with proper schemeName attribute
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
             # Get lot ID, ensuring the schemeName attribute is correct
-            lot_ids = lot.xpath(
-                "cbc:ID[@schemeName='Lot']/text()",
-                namespaces=NAMESPACES,
-            )
+            lot_ids = XPATH_ID_LOT(lot)
             if not lot_ids:
                 logger.warning("Lot found without valid ID, skipping")
                 continue
@@ -66,9 +67,8 @@ def parse_strategic_procurement(xml_content: str | bytes) -> dict | None:
             lot_id = lot_ids[0]
 
             # Get strategic procurement codes
-            codes = lot.xpath(
-                "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='strategic-procurement']/cbc:ProcurementTypeCode/text()",
-                namespaces=NAMESPACES,
+            codes = XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_STRATEGIC_PR(
+                lot
             )
 
             if not codes:
@@ -123,9 +123,7 @@ def merge_strategic_procurement(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in strategic_procurement_data["tender"]["lots"]:
-        matching_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]), None
-        )
+        matching_lot = find_by_id(existing_lots, new_lot["id"])
         if matching_lot:
             matching_lot["hasSustainability"] = new_lot["hasSustainability"]
             matching_lot["sustainability"] = new_lot["sustainability"]
@@ -7,21 +7,22 @@ from DocumentDescription to OCDS tender.crossBorderLaw field.
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
+XPATH_TENDERING_TERMS_PROCUREMENT_LEGISLATION_DOCUMENT_REFERENCE_C = register_xpath(
+    "bt_09_procedure.XPATH_TENDERING_TERMS_PROCUREMENT_LEGISLATION_DOCUMENT_REFERENCE_C",
+    "/*/cac:TenderingTerms/cac:ProcurementLegislationDocumentReference[cbc:ID/text()='CrossBorderLaw']",
+)
+XPATH_DOCUMENT_DESCRIPTION = register_xpath(
+    "bt_09_procedure.XPATH_DOCUMENT_DESCRIPTION", "cbc:DocumentDescription"
+)
 
-def parse_cross_border_law(xml_content: str | bytes) -> dict[str, Any] | None:
+
+def parse_cross_border_law(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the cross border law description (BT-09) from XML content.
 
     Extracts both the ID (BT-09(a)) and DocumentDescription (BT-09(b)) from
@@ -36,14 +37,11 @@ def parse_cross_border_law(xml_content: str | bytes) -> dict[str, Any] | None:
         {'tender': {'crossBorderLaw': '<law description>'}}
         or None if not found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Use absolute XPath as specified in eForms documentation for BT-09
-    cross_border_law_refs = root.xpath(
-        "/*/cac:TenderingTerms/cac:ProcurementLegislationDocumentReference[cbc:ID/text()='CrossBorderLaw']",
-        namespaces=NAMESPACES,
+    cross_border_law_refs = (
+        XPATH_TENDERING_TERMS_PROCUREMENT_LEGISLATION_DOCUMENT_REFERENCE_C(root)
     )
 
     if not cross_border_law_refs:
@@ -51,7 +49,7 @@ def parse_cross_border_law(xml_content: str | bytes) -> dict[str, Any] | None:
         return None
 
     ref = cross_border_law_refs[0]
-    descriptions = ref.xpath("cbc:DocumentDescription", namespaces=NAMESPACES)
+    descriptions = XPATH_DOCUMENT_DESCRIPTION(ref)
 
     if not descriptions:
         logger.warning("No Cross Border Law Description (BT-09(b)) found in the XML")
@@ -7,19 +7,12 @@ Handles both COFOG and EU-specific activity classifications.
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
-
 # Authority activity descriptions for non-COFOG activities
 AUTHORITY_TABLE = {
     "gas-oil": "Activities related to the exploitation of a geographical area for the purpose of extracting oil or gas.",
@@ -49,7 +42,24 @@ COFOG_TABLE = {
 }
 
 
-def parse_authority_activity(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_CONTRACTING_PARTY = register_xpath(
+    "bt_10.XPATH_CONTRACTING_PARTY", "//cac:ContractingParty"
+)
+XPATH_PARTY_PARTY_IDENTIFICATION_ID_ORGANIZATION = register_xpath(
+    "bt_10.XPATH_PARTY_PARTY_IDENTIFICATION_ID_ORGANIZATION",
+    "cac:Party/cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_AUTHORITY_ACTIVITY = register_xpath(
+    "bt_10.XPATH_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_AUTHORITY_ACTIVITY",
+    "cac:ContractingActivity/cbc:ActivityTypeCode[@listName='authority-activity']/text()",
+)
+XPATH_AUTHORITY_ACTIVITY_TYPE_CODE = register_xpath(
+    "bt_10.XPATH_AUTHORITY_ACTIVITY_TYPE_CODE",
+    "//cac:ContractingParty/cac:ContractingActivity/cbc:ActivityTypeCode[@listName='authority-activity']",
+)
+
+
+def parse_authority_activity(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the authority activity (BT-10) from XML content.
 
     Extracts authority activity codes for each contracting party and maps them
@@ -74,13 +84,10 @@ def parse_authority_activity(xml_content: str | bytes) -> dict[str, Any] | None:
         }
         or None if no authority activity found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ContractingParty/cac:ContractingActivity/cbc:ActivityTypeCode[@listName='authority-activity']"
-    if not root.xpath(relevant_xpath, namespaces=NAMESPACES):
+    if not XPATH_AUTHORITY_ACTIVITY_TYPE_CODE(root):
         logger.info(
             "No authority activity data found. Skipping parse_authority_activity."
         )
@@ -89,16 +96,12 @@ def parse_authority_activity(xml_content: str | bytes) -> dict[str, Any] | None:
     result = {"parties": []}
 
     # Process each contracting party
-    contracting_parties = root.xpath("//cac:ContractingParty", namespaces=NAMESPACES)
+    contracting_parties = XPATH_CONTRACTING_PARTY(root)
 
     for party in contracting_parties:
-        organization_id = party.xpath(
-            "cac:Party/cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
-            namespaces=NAMESPACES,
-        )
-        activity_code = party.xpath(
-            "cac:ContractingActivity/cbc:ActivityTypeCode[@listName='authority-activity']/text()",
-            namespaces=NAMESPACES,
+        organization_id = XPATH_PARTY_PARTY_IDENTIFICATION_ID_ORGANIZATION(party)
+        activity_code = (
+            XPATH_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_AUTHORITY_ACTIVITY(party)
         )
 
         if organization_id and activity_code:
@@ -151,10 +154,7 @@ def merge_authority_activity(
     existing_parties = release_json.setdefault("parties", [])
 
     for new_party in authority_activity_data["parties"]:
-        existing_party = next(
-            (party for party in existing_parties if party["id"] == new_party["id"]),
-            None,
-        )
+        existing_party = find_by_id(existing_parties, new_party["id"])
 
         if existing_party:
             existing_details = existing_party.setdefault("details", {})
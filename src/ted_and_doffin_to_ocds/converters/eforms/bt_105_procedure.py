@@ -4,14 +4,16 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 # Constants for XML processing
-XPATH_PROCEDURE_CODE = "//cac:TenderingProcess/cbc:ProcedureCode[@listName='procurement-procedure-type']/text()"
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+XPATH_PROCEDURE_CODE = register_xpath(
+    "bt_105_procedure.XPATH_PROCEDURE_CODE",
+    "//cac:TenderingProcess/cbc:ProcedureCode[@listName='procurement-procedure-type']/text()",
+)
 
 # Error messages
 ERR_EMPTY_XML = "XML content cannot be None or empty"
@@ -75,7 +77,7 @@ def validate_xml_content(xml_content: str | bytes) -> bytes:
     return xml_content
 
 
-def parse_procedure_type(xml_content: str | bytes) -> dict | None:
+def parse_procedure_type(xml_content: XMLContent) -> dict | None:
     """Parse procurement procedure type information from XML.
 
     Extract information about the type of procurement procedure as defined in BT-105.
@@ -97,12 +99,9 @@ def parse_procedure_type(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
-    procedure_elements = root.xpath(XPATH_PROCEDURE_CODE, namespaces=NAMESPACES)
+    procedure_elements = XPATH_PROCEDURE_CODE(root)
 
     if not procedure_elements:
         return None
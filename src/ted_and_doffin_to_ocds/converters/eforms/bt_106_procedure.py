@@ -4,15 +4,20 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 # Constants
-XPATH_PROCEDURE_ACCELERATED = "//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReasonCode/text()"
-XPATH_PROCEDURE_RATIONALE = "//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReason/text()"
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+XPATH_PROCEDURE_ACCELERATED = register_xpath(
+    "bt_106_procedure.XPATH_PROCEDURE_ACCELERATED",
+    "//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReasonCode/text()",
+)
+XPATH_PROCEDURE_RATIONALE = register_xpath(
+    "bt_106_procedure.XPATH_PROCEDURE_RATIONALE",
+    "//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReason/text()",
+)
 
 # Error messages
 ERR_EMPTY_XML = "XML content cannot be None or empty"
@@ -23,14 +28,14 @@ VALID_TRUE_VALUES = {"true", "1", "yes"}
 VALID_FALSE_VALUES = {"false", "0", "no"}
 
 
-def validate_xml_content(xml_content: str | bytes) -> bytes:
-    """Validate and prepare XML content for processing.
+def validate_xml_content(xml_content: XMLContent) -> etree._Element:
+    """Validate XML content and return its root element.
 
     Args:
         xml_content: The XML content to validate.
 
     Returns:
-        bytes: The validated XML content.
+        etree._Element: The root element of the validated XML content.
 
     Raises:
         ValueError: If the input is None or empty.
@@ -40,19 +45,14 @@ def validate_xml_content(xml_content: str | bytes) -> bytes:
     if not xml_content:
         raise ValueError(ERR_EMPTY_XML)
 
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        etree.fromstring(xml_content)
+        return get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Invalid XML content")
         raise
 
-    return xml_content
-
 
-def parse_procedure_accelerated(xml_content: str | bytes) -> dict | None:
+def parse_procedure_accelerated(xml_content: XMLContent) -> dict | None:
     """Parse procedure acceleration information from XML.
 
     Extract information about whether the time limit can be reduced due to urgency
@@ -78,10 +78,9 @@ def parse_procedure_accelerated(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
         ValueError: If the XML content is empty or None.
     """
-    xml_content = validate_xml_content(xml_content)
-    root = etree.fromstring(xml_content)
+    root = validate_xml_content(xml_content)
 
-    procedure_elements = root.xpath(XPATH_PROCEDURE_ACCELERATED, namespaces=NAMESPACES)
+    procedure_elements = XPATH_PROCEDURE_ACCELERATED(root)
     if not procedure_elements:
         logger.debug("No accelerated procedure information found in XML")
         return None
@@ -93,9 +92,7 @@ def parse_procedure_accelerated(xml_content: str | bytes) -> dict | None:
         is_accelerated = True
         result = {"tender": {"procedure": {"isAccelerated": is_accelerated}}}
 
-        rationale_elements = root.xpath(
-            XPATH_PROCEDURE_RATIONALE, namespaces=NAMESPACES
-        )
+        rationale_elements = XPATH_PROCEDURE_RATIONALE(root)
         if rationale_elements and rationale_elements[0].strip():
             result["tender"]["procedure"]["acceleratedRationale"] = rationale_elements[
                 0
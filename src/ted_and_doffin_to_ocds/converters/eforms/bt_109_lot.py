@@ -4,28 +4,39 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 # Constants
 XPATH_FRAMEWORK_JUSTIFICATION = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess/cac:FrameworkAgreement/cbc:Justification"
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 # Error messages
 ERR_EMPTY_XML = "XML content cannot be None or empty"
 ERR_INVALID_RELEASE_JSON = "release_json must be a dictionary"
 
 
-def validate_xml_content(xml_content: str | bytes) -> bytes:
-    """Validate and prepare XML content for processing.
+XPATH_PROCUREMENT_PROJECT_LOT_LOT = register_xpath(
+    "bt_109_lot.XPATH_PROCUREMENT_PROJECT_LOT_LOT",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+)
+XPATH_ID = register_xpath("bt_109_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_JUSTIFICATION = register_xpath(
+    "bt_109_lot.XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_JUSTIFICATION",
+    ".//cac:TenderingProcess/cac:FrameworkAgreement/cbc:Justification/text()",
+)
+
+
+def validate_xml_content(xml_content: XMLContent) -> etree._Element:
+    """Validate XML content and return its root element.
 
     Args:
         xml_content: The XML content to validate.
 
     Returns:
-        bytes: The validated XML content.
+        etree._Element: The root element of the validated XML content.
 
     Raises:
         ValueError: If the input is None or empty.
@@ -35,19 +46,14 @@ def validate_xml_content(xml_content: str | bytes) -> bytes:
     if not xml_content:
         raise ValueError(ERR_EMPTY_XML)
 
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        etree.fromstring(xml_content)
+        return get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Invalid XML content")
         raise
 
-    return xml_content
-
 
-def parse_framework_duration_justification(xml_content: str | bytes) -> dict | None:
+def parse_framework_duration_justification(xml_content: XMLContent) -> dict | None:
     """Parse framework agreement duration justification from XML for each lot.
 
     Extract information about justification for exceptional cases when the duration
@@ -78,22 +84,15 @@ def parse_framework_duration_justification(xml_content: str | bytes) -> dict | N
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    xml_content = validate_xml_content(xml_content)
-    root = etree.fromstring(xml_content)
+    root = validate_xml_content(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=NAMESPACES,
-    )
+    lots = XPATH_PROCUREMENT_PROJECT_LOT_LOT(root)
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-        justification = lot.xpath(
-            ".//cac:TenderingProcess/cac:FrameworkAgreement/cbc:Justification/text()",
-            namespaces=NAMESPACES,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        justification = XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_JUSTIFICATION(lot)
 
         if justification and justification[0].strip():
             lot_data = {
@@ -139,10 +138,7 @@ def merge_framework_duration_justification(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in framework_justification_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             techniques = existing_lot.setdefault("techniques", {})
             framework = techniques.setdefault("frameworkAgreement", {})
@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_framework_buyer_categories(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_111_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_FRAMEWORK_AGREEMENT_SUBSEQUENT_PROCESS_TENDER_REQUIREMENT_BU = register_xpath(
+    "bt_111_lot.XPATH_FRAMEWORK_AGREEMENT_SUBSEQUENT_PROCESS_TENDER_REQUIREMENT_BU",
+    ".//cac:TenderingProcess/cac:FrameworkAgreement/cac:SubsequentProcessTenderRequirement[cbc:Name/text()='buyer-categories']/cbc:Description/text()",
+)
+
+
+def parse_framework_buyer_categories(xml_content: XMLContent) -> dict | None:
     """Parse framework agreement buyer categories from XML for each lot.
 
     Extract information about additional categories of buyers participating in the
@@ -38,29 +47,15 @@ def parse_framework_buyer_categories(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        buyer_categories = lot.xpath(
-            ".//cac:TenderingProcess/cac:FrameworkAgreement/cac:SubsequentProcessTenderRequirement[cbc:Name/text()='buyer-categories']/cbc:Description/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        buyer_categories = (
+            XPATH_FRAMEWORK_AGREEMENT_SUBSEQUENT_PROCESS_TENDER_REQUIREMENT_BU(lot)
         )
 
         if buyer_categories:
@@ -101,10 +96,7 @@ def merge_framework_buyer_categories(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in framework_buyer_categories_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("techniques", {}).setdefault(
                 "frameworkAgreement",
@@ -1,11 +1,20 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_framework_max_participants(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_113_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_MAXIMUM_OPERATOR_QUANT = register_xpath(
+    "bt_113_lot.XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_MAXIMUM_OPERATOR_QUANT",
+    "cac:TenderingProcess/cac:FrameworkAgreement/cbc:MaximumOperatorQuantity/text()",
+)
+
+
+def parse_framework_max_participants(xml_content: XMLContent) -> dict | None:
     """Parse framework agreement maximum participants from XML for each lot.
 
     Extract information about the maximum number of participants in the framework
@@ -36,9 +45,8 @@ def parse_framework_max_participants(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    document = get_document(xml_content)
+    root = document.root
     namespaces = {
         "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
         "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
@@ -52,17 +60,13 @@ def parse_framework_max_participants(xml_content: str | bytes) -> dict | None:
     result = {"tender": {"lots": []}}
 
     # Try eForms format first
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     if lots:
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-            max_participants = lot.xpath(
-                "cac:TenderingProcess/cac:FrameworkAgreement/cbc:MaximumOperatorQuantity/text()",
-                namespaces=namespaces,
+            lot_id = XPATH_ID(lot)[0]
+            max_participants = (
+                XPATH_TENDERING_PROCESS_FRAMEWORK_AGREEMENT_MAXIMUM_OPERATOR_QUANT(lot)
             )
 
             if max_participants:
@@ -140,10 +144,7 @@ def merge_framework_max_participants(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in framework_max_participants_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             techniques = existing_lot.setdefault("techniques", {})
             framework = techniques.setdefault("frameworkAgreement", {})
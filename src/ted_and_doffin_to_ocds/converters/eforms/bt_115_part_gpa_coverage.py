@@ -1,11 +1,18 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_gpa_coverage_part(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_PROCESS_GOVERNMENT_AGREEMENT_CONSTRAINT_INDICATOR = register_xpath(
+    "bt_115_part_gpa_coverage.XPATH_TENDERING_PROCESS_GOVERNMENT_AGREEMENT_CONSTRAINT_INDICATOR",
+    "cac:TenderingProcess/cbc:GovernmentAgreementConstraintIndicator/text()",
+)
+
+
+def parse_gpa_coverage_part(xml_content: XMLContent) -> dict | None:
     """Parse GPA coverage information from XML for the part.
 
     Extract information about whether the procurement is covered by the
@@ -27,28 +34,14 @@ def parse_gpa_coverage_part(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    part = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    document = get_document(xml_content)
+
+    part = document.procurement_project_lots("Part")
     if not part:
         return None
 
-    gpa_coverage = part[0].xpath(
-        "cac:TenderingProcess/cbc:GovernmentAgreementConstraintIndicator/text()",
-        namespaces=namespaces,
+    gpa_coverage = XPATH_TENDERING_PROCESS_GOVERNMENT_AGREEMENT_CONSTRAINT_INDICATOR(
+        part[0]
     )
 
     if gpa_coverage and gpa_coverage[0].lower() == "true":
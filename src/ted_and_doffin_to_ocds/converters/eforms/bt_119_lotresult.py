@@ -1,11 +1,35 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_dps_termination(xml_content: str | bytes) -> dict | None:
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT = register_xpath(
+    "bt_119_lotresult.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult",
+)
+XPATH_LOT_RESULT_TRUE = register_xpath(
+    "bt_119_lotresult.XPATH_LOT_RESULT_TRUE",
+    "efac:LotResult[efbc:DPSTerminationIndicator='true']",
+)
+XPATH_TENDER_LOT = register_xpath("bt_119_lotresult.XPATH_TENDER_LOT", "efac:TenderLot")
+XPATH_ID_LOT_TEXT = register_xpath(
+    "bt_119_lotresult.XPATH_ID_LOT_TEXT",
+    "cbc:ID[@schemeName='Lot']/text() | cbc:ID[not(@schemeName)]/text()",
+)
+XPATH_ID_LOT = register_xpath(
+    "bt_119_lotresult.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_PRECEDING_LOT_RESULT_COUNT = register_xpath(
+    "bt_119_lotresult.XPATH_PRECEDING_LOT_RESULT_COUNT",
+    "count(preceding-sibling::efac:LotResult)",
+)
+
+
+def parse_dps_termination(xml_content: XMLContent) -> dict | None:
     """Parse dynamic purchasing system termination information from XML.
 
     Extract information about whether the dynamic purchasing system is terminated
@@ -36,54 +60,28 @@ def parse_dps_termination(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
+    root = get_root(xml_content)
     result = {"tender": {"lots": []}}
 
     # Find all NoticeResult sections
-    notice_results = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult",
-        namespaces=namespaces,
-    )
+    notice_results = XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT(root)
 
     for notice_result in notice_results:
         # Find LotResults with DPS termination indicator set to true
-        lot_results = notice_result.xpath(
-            "efac:LotResult[efbc:DPSTerminationIndicator='true']",
-            namespaces=namespaces,
-        )
+        lot_results = XPATH_LOT_RESULT_TRUE(notice_result)
 
         # Get all TenderLots in this NoticeResult
-        tender_lots = notice_result.xpath(
-            "efac:TenderLot",
-            namespaces=namespaces,
-        )
+        tender_lots = XPATH_TENDER_LOT(notice_result)
 
         # For each LotResult with DPS termination
         for lot_result in lot_results:
             # Get the lot ID reference if available
-            lot_reference = lot_result.xpath(
-                "cbc:ID[@schemeName='Lot']/text() | cbc:ID[not(@schemeName)]/text()",
-                namespaces=namespaces,
-            )
+            lot_reference = XPATH_ID_LOT_TEXT(lot_result)
 
             if lot_reference:
                 # Find the matching TenderLot
                 for tender_lot in tender_lots:
-                    lot_id = tender_lot.xpath(
-                        "cbc:ID[@schemeName='Lot']/text()",
-                        namespaces=namespaces,
-                    )
+                    lot_id = XPATH_ID_LOT(tender_lot)
                     if lot_id and lot_id[0] == lot_reference[0]:
                         result["tender"]["lots"].append(
                             {
@@ -96,18 +94,11 @@ def parse_dps_termination(xml_content: str | bytes) -> dict | None:
                         break
             else:
                 # If no reference is found, use the sequential position as a fallback
-                lot_position = notice_result.xpath(
-                    "count(efac:LotResult[. << $current])",
-                    namespaces=namespaces,
-                    current=lot_result,
-                )
+                lot_position = XPATH_PRECEDING_LOT_RESULT_COUNT(lot_result)
 
                 # If we can find a TenderLot at the same position
                 if int(lot_position) < len(tender_lots):
-                    lot_id = tender_lots[int(lot_position)].xpath(
-                        "cbc:ID[@schemeName='Lot']/text()",
-                        namespaces=namespaces,
-                    )
+                    lot_id = XPATH_ID_LOT(tender_lots[int(lot_position)])
                     if lot_id:
                         result["tender"]["lots"].append(
                             {
@@ -148,10 +139,7 @@ def merge_dps_termination(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in dps_termination_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             techniques = existing_lot.setdefault("techniques", {})
             techniques["dynamicPurchasingSystem"] = new_lot["techniques"][
@@ -7,18 +7,12 @@ classifications using the eu-buyer-legal-type scheme.
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 # Mapping of buyer legal type codes to descriptions
 BUYER_LEGAL_TYPE_CODES = {
@@ -47,8 +41,21 @@ BUYER_LEGAL_TYPE_CODES = {
 }
 
 
+XPATH_CONTRACTING_PARTY = register_xpath(
+    "bt_11_procedure_buyer.XPATH_CONTRACTING_PARTY", "//cac:ContractingParty"
+)
+XPATH_PARTY_IDENTIFICATION_ID_ORGANIZATION = register_xpath(
+    "bt_11_procedure_buyer.XPATH_PARTY_IDENTIFICATION_ID_ORGANIZATION",
+    ".//cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_CONTRACTING_PARTY_TYPE_PARTY_TYPE_CODE_BUYER_LEGAL_TYPE = register_xpath(
+    "bt_11_procedure_buyer.XPATH_CONTRACTING_PARTY_TYPE_PARTY_TYPE_CODE_BUYER_LEGAL_TYPE",
+    ".//cac:ContractingPartyType/cbc:PartyTypeCode[@listName='buyer-legal-type']/text()",
+)
+
+
 def parse_buyer_legal_type(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parse buyer legal type information from XML and map to OCDS classifications.
 
@@ -79,21 +86,15 @@ def parse_buyer_legal_type(
         Returns None if no buyer legal type data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
+    root = get_root(xml_content)
 
     result = {"parties": []}
-    contracting_parties = root.xpath("//cac:ContractingParty", namespaces=NAMESPACES)
+    contracting_parties = XPATH_CONTRACTING_PARTY(root)
 
     for party in contracting_parties:
-        org_id = party.xpath(
-            ".//cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
-            namespaces=NAMESPACES,
-        )
-        legal_type = party.xpath(
-            ".//cac:ContractingPartyType/cbc:PartyTypeCode[@listName='buyer-legal-type']/text()",
-            namespaces=NAMESPACES,
+        org_id = XPATH_PARTY_IDENTIFICATION_ID_ORGANIZATION(party)
+        legal_type = XPATH_CONTRACTING_PARTY_TYPE_PARTY_TYPE_CODE_BUYER_LEGAL_TYPE(
+            party
         )
 
         if org_id and legal_type:
@@ -154,14 +155,7 @@ def merge_buyer_legal_type(
         release_json["parties"] = []
 
     for new_party in buyer_legal_type_data["parties"]:
-        existing_party = next(
-            (
-                party
-                for party in release_json["parties"]
-                if party["id"] == new_party["id"]
-            ),
-            None,
-        )
+        existing_party = find_by_id(release_json["parties"], new_party["id"])
         if existing_party:
             if "details" not in existing_party:
                 existing_party["details"] = {}
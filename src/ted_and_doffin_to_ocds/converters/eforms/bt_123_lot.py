@@ -1,11 +1,20 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_electronic_auction_url(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_123_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_AUCTION_TERMS_AUCTION_URI = register_xpath(
+    "bt_123_lot.XPATH_TENDERING_PROCESS_AUCTION_TERMS_AUCTION_URI",
+    "cac:TenderingProcess/cac:AuctionTerms/cbc:AuctionURI/text()",
+)
+
+
+def parse_electronic_auction_url(xml_content: XMLContent) -> dict | None:
     """Parse electronic auction URL from XML for each lot.
 
     Extract information about the internet address of the electronic auction
@@ -36,31 +45,15 @@ def parse_electronic_auction_url(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        auction_url = lot.xpath(
-            "cac:TenderingProcess/cac:AuctionTerms/cbc:AuctionURI/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        auction_url = XPATH_TENDERING_PROCESS_AUCTION_TERMS_AUCTION_URI(lot)
 
         if auction_url:
             lot_data = {
@@ -99,10 +92,7 @@ def merge_electronic_auction_url(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in auction_url_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             techniques = existing_lot.setdefault("techniques", {})
             electronic_auction = techniques.setdefault("electronicAuction", {})
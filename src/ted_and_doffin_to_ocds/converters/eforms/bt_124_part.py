@@ -1,11 +1,18 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tool_atypical_url_part(xml_content: str | bytes) -> dict | None:
+XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_PROCESS_ACCESS_TOOLS = register_xpath(
+    "bt_124_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_PROCESS_ACCESS_TOOLS",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cbc:AccessToolsURI/text()",
+)
+
+
+def parse_tool_atypical_url_part(xml_content: XMLContent) -> dict | None:
     """Parse atypical tool URL information from XML for the part.
 
     Extract information about URLs for tools and devices that are not generally
@@ -29,22 +36,9 @@ def parse_tool_atypical_url_part(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    urls = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cbc:AccessToolsURI/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    urls = XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_PROCESS_ACCESS_TOOLS(root)
 
     if urls:
         return {"tender": {"communication": {"atypicalToolUrl": urls[0]}}}
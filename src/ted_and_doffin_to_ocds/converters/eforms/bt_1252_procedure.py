@@ -4,16 +4,11 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 RELATIONSHIP_MAPPING = {
     # Maps reason codes to relationship types
@@ -25,7 +20,20 @@ RELATIONSHIP_MAPPING = {
 }
 
 
-def parse_direct_award_justification(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI = register_xpath(
+    "bt_1252_procedure.XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI",
+    "//cac:TenderingProcess/cac:ProcessJustification"
+    "[cbc:ProcessReasonCode/@listName='direct-award-justification']",
+)
+XPATH_DESCRIPTION = register_xpath(
+    "bt_1252_procedure.XPATH_DESCRIPTION", "cbc:Description/text()"
+)
+XPATH_PROCESS_REASON_CODE = register_xpath(
+    "bt_1252_procedure.XPATH_PROCESS_REASON_CODE", "cbc:ProcessReasonCode/text()"
+)
+
+
+def parse_direct_award_justification(xml_content: XMLContent) -> dict | None:
     """Parse BT-1252: Direct award justification identifiers.
 
     Extracts identifiers of previous procedures that justify direct award,
@@ -49,27 +57,19 @@ def parse_direct_award_justification(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"relatedProcesses": []}
 
         # XPath based on eForms definition for BT-1252 context
-        justifications = root.xpath(
-            "//cac:TenderingProcess/cac:ProcessJustification"
-            "[cbc:ProcessReasonCode/@listName='direct-award-justification']",
-            namespaces=NAMESPACES,
+        justifications = (
+            XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI(root)
         )
 
         for justification in justifications:
             # Extract BT-1252 value
-            identifier = justification.xpath(
-                "cbc:Description/text()", namespaces=NAMESPACES
-            )
+            identifier = XPATH_DESCRIPTION(justification)
             # Extract reason code for mapping relationship
-            reason_code = justification.xpath(
-                "cbc:ProcessReasonCode/text()", namespaces=NAMESPACES
-            )
+            reason_code = XPATH_PROCESS_REASON_CODE(justification)
 
             if identifier:
                 process = {
@@ -2,13 +2,24 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_125_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE = register_xpath(
+    "bt_125_lot.XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE",
+    "cac:TenderingProcess/cac:NoticeDocumentReference",
+)
+XPATH_ID_NOTICE_ID_REF = register_xpath(
+    "bt_125_lot.XPATH_ID_NOTICE_ID_REF", "cbc:ID[@schemeName='notice-id-ref']/text()"
+)
+
+
 def parse_previous_planning_identifier_lot(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the previous planning identifier information from lot-level XML data.
 
@@ -31,44 +42,25 @@ def parse_previous_planning_identifier_lot(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"relatedProcesses": []}
     related_process_id = 1
 
     # Find all Procurement Project Lots
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
         # Extract Lot ID
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
+        lot_id = XPATH_ID(lot)
         lot_id = lot_id[0] if lot_id else None
 
         # Find Notice Document References within the Tendering Process for the lot
-        notice_refs = lot.xpath(
-            "cac:TenderingProcess/cac:NoticeDocumentReference",
-            namespaces=namespaces,
-        )
+        notice_refs = XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE(lot)
 
         for notice_ref in notice_refs:
             # Extract the Previous Planning Identifier (BT-125(i)-Lot)
-            identifier = notice_ref.xpath(
-                "cbc:ID[@schemeName='notice-id-ref']/text()",
-                namespaces=namespaces,
-            )
+            identifier = XPATH_ID_NOTICE_ID_REF(notice_ref)
 
             # Check if identifier matches the required pattern
             if identifier:
@@ -126,7 +118,7 @@ def merge_previous_planning_identifier_lot(
                 existing_process.setdefault("relatedLots", []).extend(
                     new_process["relatedLots"],
                 )
-                existing_process["relatedLots"] = list(
+                existing_process["relatedLots"] = sorted(
                     set(existing_process["relatedLots"]),
                 )
         else:
@@ -2,13 +2,27 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE = register_xpath(
+    "bt_125_part.XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE",
+    "cac:TenderingProcess/cac:NoticeDocumentReference",
+)
+XPATH_ID_NOTICE_ID_REF = register_xpath(
+    "bt_125_part.XPATH_ID_NOTICE_ID_REF", "cbc:ID[@schemeName='notice-id-ref']/text()"
+)
+XPATH_REFERENCED_DOCUMENT_INTERNAL_ADDRESS = register_xpath(
+    "bt_125_part.XPATH_REFERENCED_DOCUMENT_INTERNAL_ADDRESS",
+    "cbc:ReferencedDocumentInternalAddress/text()",
+)
+
+
 def parse_previous_planning_identifier_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the previous planning identifier information from part-level XML data.
 
@@ -30,41 +44,19 @@ def parse_previous_planning_identifier_part(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"relatedProcesses": []}
     related_process_id = 1
 
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    parts = document.procurement_project_lots("Part")
 
     for part in parts:
-        notice_refs = part.xpath(
-            "cac:TenderingProcess/cac:NoticeDocumentReference",
-            namespaces=namespaces,
-        )
+        notice_refs = XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE(part)
 
         for notice_ref in notice_refs:
-            identifier = notice_ref.xpath(
-                "cbc:ID[@schemeName='notice-id-ref']/text()",
-                namespaces=namespaces,
-            )
-            part_identifier = notice_ref.xpath(
-                "cbc:ReferencedDocumentInternalAddress/text()",
-                namespaces=namespaces,
-            )
+            identifier = XPATH_ID_NOTICE_ID_REF(notice_ref)
+            part_identifier = XPATH_REFERENCED_DOCUMENT_INTERNAL_ADDRESS(notice_ref)
 
             if identifier and part_identifier:
                 full_identifier = f"{identifier[0]}-{part_identifier[0]}"
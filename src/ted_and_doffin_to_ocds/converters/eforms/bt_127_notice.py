@@ -2,14 +2,19 @@
 
 import logging
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_future_notice_date(xml_content: str | bytes) -> str | None:
+XPATH_PLANNED_DATE = register_xpath(
+    "bt_127_notice.XPATH_PLANNED_DATE", "/*/cbc:PlannedDate/text()"
+)
+
+
+def parse_future_notice_date(xml_content: XMLContent) -> str | None:
     """Parse the future notice date from XML content.
 
     Args:
@@ -20,19 +25,9 @@ def parse_future_notice_date(xml_content: str | bytes) -> str | None:
         Format example: "2020-03-15T00:00:00+01:00"
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    planned_date = root.xpath("/*/cbc:PlannedDate/text()", namespaces=namespaces)
+    root = get_root(xml_content)
+
+    planned_date = XPATH_PLANNED_DATE(root)
     if planned_date:
         try:
             return start_date(planned_date[0])
@@ -2,14 +2,24 @@
 
 import logging
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_dispatch_invitation_tender(xml_content: str | bytes) -> dict | None:
+XPATH_ID_LOT = register_xpath(
+    "bt_130_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_TENDERING_PROCESS_INVITATION_SUBMISSION_PERIOD_START_DATE = register_xpath(
+    "bt_130_lot.XPATH_TENDERING_PROCESS_INVITATION_SUBMISSION_PERIOD_START_DATE",
+    "cac:TenderingProcess/cac:InvitationSubmissionPeriod/cbc:StartDate/text()",
+)
+
+
+def parse_dispatch_invitation_tender(xml_content: XMLContent) -> dict | None:
     """Parse the dispatch invitation tender dates from lot-level XML data.
 
     Args:
@@ -32,30 +42,16 @@ def parse_dispatch_invitation_tender(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces)[0]
-        invitation_date = lot.xpath(
-            "cac:TenderingProcess/cac:InvitationSubmissionPeriod/cbc:StartDate/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID_LOT(lot)[0]
+        invitation_date = (
+            XPATH_TENDERING_PROCESS_INVITATION_SUBMISSION_PERIOD_START_DATE(lot)
         )
 
         if invitation_date:
@@ -97,10 +93,7 @@ def merge_dispatch_invitation_tender(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in dispatch_invitation_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("secondStage", {}).update(new_lot["secondStage"])
         else:
@@ -5,16 +5,25 @@ import logging
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import convert_to_iso_format
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
+XPATH_ID = register_xpath("bt_1311_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END = register_xpath(
+    "bt_1311_lot.XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END",
+    "cac:TenderingProcess/cac:ParticipationRequestReceptionPeriod/cbc:EndDate/text()",
+)
+XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END_2 = register_xpath(
+    "bt_1311_lot.XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END_2",
+    "cac:TenderingProcess/cac:ParticipationRequestReceptionPeriod/cbc:EndTime/text()",
+)
 
-def parse_deadline_receipt_requests(xml_content: str | bytes) -> dict | None:
+
+def parse_deadline_receipt_requests(xml_content: XMLContent) -> dict | None:
     """Parse BT-1311: Time limit for receipt of requests to participate.
 
     Combines date and time components for participation request deadline.
@@ -40,28 +49,23 @@ def parse_deadline_receipt_requests(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)
+            lot_id = XPATH_ID(lot)
             if not lot_id:
                 continue
 
-            end_date = lot.xpath(
-                "cac:TenderingProcess/cac:ParticipationRequestReceptionPeriod/cbc:EndDate/text()",
-                namespaces=NAMESPACES,
+            end_date = (
+                XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END(lot)
             )
-            end_time = lot.xpath(
-                "cac:TenderingProcess/cac:ParticipationRequestReceptionPeriod/cbc:EndTime/text()",
-                namespaces=NAMESPACES,
+            end_time = (
+                XPATH_TENDERING_PROCESS_PARTICIPATION_REQUEST_RECEPTION_PERIOD_END_2(
+                    lot
+                )
             )
 
             if end_date:
@@ -139,7 +143,7 @@ def merge_deadline_receipt_requests(
     lots = tender.setdefault("lots", [])
 
     for new_lot in deadline_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             tender_period = existing_lot.setdefault("tenderPeriod", {})
             tender_period["endDate"] = new_lot["tenderPeriod"]["endDate"]
@@ -2,14 +2,28 @@
 
 import logging
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_deadline_receipt_tenders(xml_content: str | bytes) -> dict | None:
+XPATH_ID_LOT = register_xpath(
+    "bt_131_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_DATE = register_xpath(
+    "bt_131_lot.XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_DATE",
+    "cac:TenderingProcess/cac:TenderSubmissionDeadlinePeriod/cbc:EndDate/text()",
+)
+XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_TIME = register_xpath(
+    "bt_131_lot.XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_TIME",
+    "cac:TenderingProcess/cac:TenderSubmissionDeadlinePeriod/cbc:EndTime/text()",
+)
+
+
+def parse_deadline_receipt_tenders(xml_content: XMLContent) -> dict | None:
     """Parse the tender submission deadline from lot-level XML data.
 
     Args:
@@ -32,34 +46,19 @@ def parse_deadline_receipt_tenders(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces)[0]
-        end_date_str = lot.xpath(
-            "cac:TenderingProcess/cac:TenderSubmissionDeadlinePeriod/cbc:EndDate/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID_LOT(lot)[0]
+        end_date_str = (
+            XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_DATE(lot)
         )
-        end_time_str = lot.xpath(
-            "cac:TenderingProcess/cac:TenderSubmissionDeadlinePeriod/cbc:EndTime/text()",
-            namespaces=namespaces,
+        end_time_str = (
+            XPATH_TENDERING_PROCESS_TENDER_SUBMISSION_DEADLINE_PERIOD_END_TIME(lot)
         )
 
         if end_date_str:
@@ -100,10 +99,7 @@ def merge_deadline_receipt_tenders(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in deadline_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("tenderPeriod", {}).update(new_lot["tenderPeriod"])
             logger.info("Updated existing lot %s with tenderPeriod data", new_lot["id"])
@@ -1,13 +1,27 @@
 import logging
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_public_opening_date(xml_content: str | bytes) -> dict | None:
+XPATH_ID_LOT = register_xpath(
+    "bt_132_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_DATE = register_xpath(
+    "bt_132_lot.XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_DATE",
+    "cac:TenderingProcess/cac:OpenTenderEvent/cbc:OccurrenceDate/text()",
+)
+XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_TIME = register_xpath(
+    "bt_132_lot.XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_TIME",
+    "cac:TenderingProcess/cac:OpenTenderEvent/cbc:OccurrenceTime/text()",
+)
+
+
+def parse_lot_public_opening_date(xml_content: XMLContent) -> dict | None:
     """Parse the public opening date from lot-level XML data.
 
     Args:
@@ -33,35 +47,16 @@ def parse_lot_public_opening_date(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces)[0]
-        date = lot.xpath(
-            "cac:TenderingProcess/cac:OpenTenderEvent/cbc:OccurrenceDate/text()",
-            namespaces=namespaces,
-        )
-        time = lot.xpath(
-            "cac:TenderingProcess/cac:OpenTenderEvent/cbc:OccurrenceTime/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID_LOT(lot)[0]
+        date = XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_DATE(lot)
+        time = XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_OCCURRENCE_TIME(lot)
 
         if date:
             try:
@@ -103,10 +98,7 @@ def merge_lot_public_opening_date(
     tender_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_public_opening_date_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("awardPeriod", {}).update(new_lot["awardPeriod"])
             existing_lot["bidOpening"] = new_lot["bidOpening"]
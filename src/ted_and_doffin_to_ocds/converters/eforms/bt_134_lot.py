@@ -1,12 +1,23 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_LOT = register_xpath(
+    "bt_134_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_DESCRIPTION = register_xpath(
+    "bt_134_lot.XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_DESCRIPTION",
+    "cac:TenderingProcess/cac:OpenTenderEvent/cbc:Description/text()",
+)
+
+
 def parse_lot_public_opening_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the public opening description from lot-level XML data.
 
@@ -30,31 +41,15 @@ def parse_lot_public_opening_description(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces)[0]
-        description = lot.xpath(
-            "cac:TenderingProcess/cac:OpenTenderEvent/cbc:Description/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID_LOT(lot)[0]
+        description = XPATH_TENDERING_PROCESS_OPEN_TENDER_EVENT_DESCRIPTION(lot)
 
         if description:
             lot_data = {
@@ -88,10 +83,7 @@ def merge_lot_public_opening_description(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_public_opening_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("bidOpening", {}).update(new_lot["bidOpening"])
         else:
@@ -3,13 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ACCELERATED_PROCEDURE_PROCESS_REASON = register_xpath(
+    "bt_1351_procedure.XPATH_ACCELERATED_PROCEDURE_PROCESS_REASON",
+    "/*/cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReason",
+)
+
+
 def parse_accelerated_procedure_justification(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the accelerated procedure justification (BT-1351) from XML content.
 
@@ -28,20 +35,9 @@ def parse_accelerated_procedure_justification(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    xpath = "/*/cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='accelerated-procedure']/cbc:ProcessReason"
-    process_reason = root.xpath(xpath, namespaces=namespaces)
+    root = get_root(xml_content)
+
+    process_reason = XPATH_ACCELERATED_PROCEDURE_PROCESS_REASON(root)
 
     if process_reason:
         return {
@@ -2,13 +2,22 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI = register_xpath(
+    "bt_135_procedure.XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI",
+    "/*/cac:TenderingProcess/cac:ProcessJustification"
+    "[cbc:ProcessReasonCode/@listName='direct-award-justification']"
+    "/cbc:ProcessReason/text()",
+)
+
+
 def parse_direct_award_justification_rationale(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the direct award justification rationale from XML data.
 
@@ -25,24 +34,9 @@ def parse_direct_award_justification_rationale(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    reasons = root.xpath(
-        "/*/cac:TenderingProcess/cac:ProcessJustification"
-        "[cbc:ProcessReasonCode/@listName='direct-award-justification']"
-        "/cbc:ProcessReason/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    reasons = XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI(root)
 
     if reasons:
         rationale = " ".join(reason.strip() for reason in reasons if reason.strip())
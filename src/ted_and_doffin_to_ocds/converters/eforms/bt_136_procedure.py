@@ -2,7 +2,8 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -56,8 +57,16 @@ JUSTIFICATION_CODES = {
 }
 
 
+XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI = register_xpath(
+    "bt_136_procedure.XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI",
+    "/*/cac:TenderingProcess/cac:ProcessJustification"
+    "[cbc:ProcessReasonCode/@listName='direct-award-justification']"
+    "/cbc:ProcessReasonCode/text()",
+)
+
+
 def parse_direct_award_justification_code(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the direct award justification code from XML data.
 
@@ -80,24 +89,9 @@ def parse_direct_award_justification_code(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    codes = root.xpath(
-        "/*/cac:TenderingProcess/cac:ProcessJustification"
-        "[cbc:ProcessReasonCode/@listName='direct-award-justification']"
-        "/cbc:ProcessReasonCode/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    codes = XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_DIRECT_AWARD_JUSTIFI(root)
 
     if codes:
         classifications = [
@@ -4,22 +4,32 @@ import logging
 import re
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 # Pattern for valid lot IDs as per specification
 LOT_ID_PATTERN = re.compile(r"^LOT-\d{4}$")
 
 
-def parse_lot_result_identifier(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT = register_xpath(
+    "bt_13713_lotresult.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_13713_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_13713_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_lot_result_identifier(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse lot result identifier (BT-13713) from XML content.
 
     Gets award and lot identifiers from each lot result. Creates/updates
@@ -32,25 +42,16 @@ def parse_lot_result_identifier(xml_content: str | bytes) -> dict[str, Any] | No
         Dictionary containing awards with lot references or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"awards": []}
 
         # Get all LotResult elements
-        lot_results = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
-            namespaces=NAMESPACES,
-        )
+        lot_results = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT(root)
 
         for lot_result in lot_results:
             try:
-                award_id = lot_result.xpath(
-                    "cbc:ID[@schemeName='result']/text()", namespaces=NAMESPACES
-                )
+                award_id = XPATH_ID_RESULT(lot_result)
 
                 # Properly handle missing award ID
                 if not award_id:
@@ -63,10 +64,7 @@ def parse_lot_result_identifier(xml_content: str | bytes) -> dict[str, Any] | No
                     logger.warning("Invalid award ID in lot result, skipping")
                     continue
 
-                lot_ids = lot_result.xpath(
-                    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                    namespaces=NAMESPACES,
-                )
+                lot_ids = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
                 # If no lot ID is set, set it to '1' as per TED guidance
                 if not lot_ids:
@@ -122,15 +120,12 @@ def merge_lot_result_identifier(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in lot_result_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
 
         if existing_award:
             existing_lots = set(existing_award.get("relatedLots", []))
             existing_lots.update(new_award["relatedLots"])
-            existing_award["relatedLots"] = list(existing_lots)
+            existing_award["relatedLots"] = sorted(existing_lots)
             logger.info("Updated relatedLots for award %s", new_award["id"])
         else:
             existing_awards.append(new_award)
@@ -4,22 +4,31 @@ import logging
 import re
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 # Pattern for validating lot identifiers according to the spec
 LOT_ID_PATTERN = re.compile(r"^(LOT|GLO)-\d{4}$")
 
 
-def parse_tender_lot_identifier(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "bt_13714_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_13714_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_13714_tender.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+
+
+def parse_tender_lot_identifier(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse tender lot identifier (BT-13714) from XML content.
 
     Gets tender and lot identifiers from each lot tender. Creates/updates
@@ -32,26 +41,16 @@ def parse_tender_lot_identifier(xml_content: str | bytes) -> dict[str, Any] | No
         Dictionary containing bids with lot references or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"bids": {"details": []}}
 
-        lot_tenders = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-            namespaces=NAMESPACES,
-        )
+        lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
         for lot_tender in lot_tenders:
             try:
                 # Get tender ID
-                tender_id_nodes = lot_tender.xpath(
-                    "cbc:ID[@schemeName='tender']/text()",
-                    namespaces=NAMESPACES,
-                )
+                tender_id_nodes = XPATH_ID_TENDER(lot_tender)
 
                 if not tender_id_nodes:
                     logger.warning("No tender ID found for lot tender")
@@ -60,10 +59,7 @@ def parse_tender_lot_identifier(xml_content: str | bytes) -> dict[str, Any] | No
                 tender_id = tender_id_nodes[0]
 
                 # Get lot ID according to the absolute XPath specified in BT-13714
-                lot_id_nodes = lot_tender.xpath(
-                    "efac:TenderLot/cbc:ID/text()",
-                    namespaces=NAMESPACES,
-                )
+                lot_id_nodes = XPATH_TENDER_LOT_ID(lot_tender)
 
                 if not lot_id_nodes:
                     logger.warning("No lot ID found for tender %s", tender_id)
@@ -123,10 +119,7 @@ def merge_tender_lot_identifier(
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
 
     for new_bid in tender_lot_data["bids"]["details"]:
-        existing_bid = next(
-            (bid for bid in existing_bids if bid["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid.setdefault("relatedLots", []).extend(
                 lot
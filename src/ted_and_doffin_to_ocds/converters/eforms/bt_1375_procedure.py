@@ -1,11 +1,26 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_group_lot_identifier(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_LOTS_GROUP = register_xpath(
+    "bt_1375_procedure.XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_LOTS_GROUP",
+    "//cac:TenderingTerms/cac:LotDistribution/cac:LotsGroup",
+)
+XPATH_LOTS_GROUP_ID = register_xpath(
+    "bt_1375_procedure.XPATH_LOTS_GROUP_ID", "cbc:LotsGroupID/text()"
+)
+XPATH_PROCUREMENT_PROJECT_LOT_REFERENCE_ID_LOT = register_xpath(
+    "bt_1375_procedure.XPATH_PROCUREMENT_PROJECT_LOT_REFERENCE_ID_LOT",
+    "cac:ProcurementProjectLotReference/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_group_lot_identifier(xml_content: XMLContent) -> dict | None:
     """Parse group lot identifier information from XML content.
 
     Extracts lot group information from the XML document following BT-1375 specification.
@@ -19,31 +34,15 @@ def parse_group_lot_identifier(xml_content: str | bytes) -> dict | None:
         Format: {"tender": {"lotGroups": [{"id": str, "relatedLots": list[str]}]}}
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lots_groups = root.xpath(
-        "//cac:TenderingTerms/cac:LotDistribution/cac:LotsGroup",
-        namespaces=namespaces,
-    )
+    lots_groups = XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_LOTS_GROUP(root)
 
     for group in lots_groups:
-        group_id = group.xpath("cbc:LotsGroupID/text()", namespaces=namespaces)[0]
-        lot_ids = group.xpath(
-            "cac:ProcurementProjectLotReference/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        group_id = XPATH_LOTS_GROUP_ID(group)[0]
+        lot_ids = XPATH_PROCUREMENT_PROJECT_LOT_REFERENCE_ID_LOT(group)
 
         if group_id and lot_ids:
             lot_group = {"id": group_id, "relatedLots": lot_ids}
@@ -76,14 +75,11 @@ def merge_group_lot_identifier(release_json: dict, group_lot_data: dict | None)
     )
 
     for new_group in group_lot_data["tender"]["lotGroups"]:
-        existing_group = next(
-            (group for group in existing_lot_groups if group["id"] == new_group["id"]),
-            None,
-        )
+        existing_group = find_by_id(existing_lot_groups, new_group["id"])
         if existing_group:
             existing_related_lots = set(existing_group.get("relatedLots", []))
             existing_related_lots.update(new_group["relatedLots"])
-            existing_group["relatedLots"] = list(existing_related_lots)
+            existing_group["relatedLots"] = sorted(existing_related_lots)
         else:
             existing_lot_groups.append(new_group)
 
@@ -5,13 +5,26 @@ import re
 from datetime import datetime
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_13_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END = register_xpath(
+    "bt_13_lot.XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END",
+    "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndDate/text()",
+)
+XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2 = register_xpath(
+    "bt_13_lot.XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2",
+    "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndTime/text()",
+)
+
+
 def parse_additional_info_deadline(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> list[dict[str, Any]] | None:
     """Parse the additional information deadline from XML content for each lot.
 
@@ -23,34 +36,19 @@ def parse_additional_info_deadline(
                                       or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     lots_data = []
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot in lot_elements:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        end_date = lot.xpath(
-            "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndDate/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        end_date = XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END(
+            lot
         )
-        end_time = lot.xpath(
-            "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndTime/text()",
-            namespaces=namespaces,
+        end_time = XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2(
+            lot
         )
 
         if end_date and end_time:
@@ -128,14 +126,7 @@ def merge_additional_info_deadline(
             release_json["tender"]["lots"] = []
 
         for lot_data in lots_data:
-            existing_lot = next(
-                (
-                    lot
-                    for lot in release_json["tender"]["lots"]
-                    if lot["id"] == lot_data["id"]
-                ),
-                None,
-            )
+            existing_lot = find_by_id(release_json["tender"]["lots"], lot_data["id"])
             if existing_lot:
                 existing_lot["enquiryPeriod"] = lot_data["enquiryPeriod"]
             else:
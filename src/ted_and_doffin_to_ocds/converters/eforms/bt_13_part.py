@@ -4,12 +4,23 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_additional_info_deadline_part(xml_content: str | bytes) -> str | None:
+XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END = register_xpath(
+    "bt_13_part.XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END",
+    "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndDate/text()",
+)
+XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2 = register_xpath(
+    "bt_13_part.XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2",
+    "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndTime/text()",
+)
+
+
+def parse_additional_info_deadline_part(xml_content: XMLContent) -> str | None:
     """Parse the additional information deadline from XML content for the part.
 
     Args:
@@ -19,31 +30,16 @@ def parse_additional_info_deadline_part(xml_content: str | bytes) -> str | None:
         Optional[str]: ISO formatted datetime string for the enquiry period end date, or None if not found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    part_element = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    document = get_document(xml_content)
+
+    part_element = document.procurement_project_lots("Part")
 
     if part_element:
-        end_date = part_element[0].xpath(
-            "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndDate/text()",
-            namespaces=namespaces,
+        end_date = XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END(
+            part_element[0]
         )
-        end_time = part_element[0].xpath(
-            "cac:TenderingProcess/cac:AdditionalInformationRequestPeriod/cbc:EndTime/text()",
-            namespaces=namespaces,
+        end_time = XPATH_TENDERING_PROCESS_ADDITIONAL_INFORMATION_REQUEST_PERIOD_END_2(
+            part_element[0]
         )
 
         if end_date and end_time:
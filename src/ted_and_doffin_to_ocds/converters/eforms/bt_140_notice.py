@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +21,22 @@ REASON_CODE_MAPPING = {
 }
 
 
-def parse_change_reason_code(xml_content: str | bytes) -> dict | None:
+XPATH_CHANGES = register_xpath("bt_140_notice.XPATH_CHANGES", "//efac:Changes")
+XPATH_CHANGE_REASON_REASON_CODE_CHANGE_CORRIG_JUSTIFICATION = register_xpath(
+    "bt_140_notice.XPATH_CHANGE_REASON_REASON_CODE_CHANGE_CORRIG_JUSTIFICATION",
+    "efac:ChangeReason/cbc:ReasonCode[@listName='change-corrig-justification']/text()",
+)
+XPATH_CHANGE = register_xpath("bt_140_notice.XPATH_CHANGE", "efac:Change")
+XPATH_CHANGED_SECTION_IDENTIFIER = register_xpath(
+    "bt_140_notice.XPATH_CHANGED_SECTION_IDENTIFIER",
+    "efbc:ChangedSectionIdentifier/text()",
+)
+XPATH_CHANGE_DESCRIPTION = register_xpath(
+    "bt_140_notice.XPATH_CHANGE_DESCRIPTION", "efbc:ChangeDescription/text()"
+)
+
+
+def parse_change_reason_code(xml_content: XMLContent) -> dict | None:
     """Parse the change reason code from XML data.
 
     Args:
@@ -30,26 +47,15 @@ def parse_change_reason_code(xml_content: str | bytes) -> dict | None:
         The structure follows the format shown in the example output
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"amendments": []}, "awards": []}
     amendment_id = 1
 
-    changes_elements = root.xpath("//efac:Changes", namespaces=namespaces)
+    changes_elements = XPATH_CHANGES(root)
     for changes_element in changes_elements:
-        reason_code = changes_element.xpath(
-            "efac:ChangeReason/cbc:ReasonCode[@listName='change-corrig-justification']/text()",
-            namespaces=namespaces,
+        reason_code = XPATH_CHANGE_REASON_REASON_CODE_CHANGE_CORRIG_JUSTIFICATION(
+            changes_element
         )
         if not reason_code:
             continue
@@ -61,13 +67,9 @@ def parse_change_reason_code(xml_content: str | bytes) -> dict | None:
             "description": REASON_CODE_MAPPING.get(reason_code, "Unknown"),
         }
 
-        for change in changes_element.xpath("efac:Change", namespaces=namespaces):
-            section_id = change.xpath(
-                "efbc:ChangedSectionIdentifier/text()", namespaces=namespaces
-            )
-            description = change.xpath(
-                "efbc:ChangeDescription/text()", namespaces=namespaces
-            )
+        for change in XPATH_CHANGE(changes_element):
+            section_id = XPATH_CHANGED_SECTION_IDENTIFIER(change)
+            description = XPATH_CHANGE_DESCRIPTION(change)
 
             if not section_id:
                 continue
@@ -124,10 +126,7 @@ def merge_change_reason_code(
 
     existing_awards = release_json.setdefault("awards", [])
     for new_award in change_reason_data["awards"]:
-        existing_award = next(
-            (a for a in existing_awards if a["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award.setdefault("amendments", []).extend(new_award["amendments"])
         else:
@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,20 @@ STATUS_CODE_MAPPING = {
 }
 
 
-def parse_winner_chosen(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_142_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_RESULT_CODE_WINNER_SELECTION_STATUS = register_xpath(
+    "bt_142_lotresult.XPATH_TENDER_RESULT_CODE_WINNER_SELECTION_STATUS",
+    "cbc:TenderResultCode[@listName='winner-selection-status']/text()",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_142_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_winner_chosen(xml_content: XMLContent) -> dict | None:
     """Parse the winner chosen status from XML data.
 
     Args:
@@ -43,38 +58,18 @@ def parse_winner_chosen(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": [], "tender": {"lots": []}}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        result_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        tender_result_code = lot_result.xpath(
-            "cbc:TenderResultCode[@listName='winner-selection-status']/text()",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        result_id = XPATH_ID_RESULT(lot_result)
+        tender_result_code = XPATH_TENDER_RESULT_CODE_WINNER_SELECTION_STATUS(
+            lot_result
         )
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if result_id and tender_result_code and lot_id:
             result_id = result_id[0]
@@ -120,10 +115,7 @@ def merge_winner_chosen(release_json: dict, winner_chosen_data: dict | None) ->
 
     existing_awards = release_json.setdefault("awards", [])
     for new_award in winner_chosen_data["awards"]:
-        existing_award = next(
-            (a for a in existing_awards if a["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award.update(new_award)
         else:
@@ -140,10 +132,7 @@ def merge_winner_chosen(release_json: dict, winner_chosen_data: dict | None) ->
 
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
     for new_lot in winner_chosen_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.update(new_lot)
         else:
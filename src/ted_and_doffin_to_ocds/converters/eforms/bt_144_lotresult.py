@@ -1,6 +1,8 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,20 @@ REASON_CODE_MAPPING = {
 }
 
 
-def parse_not_awarded_reason(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_144_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_DECISION_REASON_DECISION_REASON_CODE_NON_AWARD_JUSTIFICATION = register_xpath(
+    "bt_144_lotresult.XPATH_DECISION_REASON_DECISION_REASON_CODE_NON_AWARD_JUSTIFICATION",
+    "efac:DecisionReason/efbc:DecisionReasonCode[@listName='non-award-justification']/text()",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_144_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_not_awarded_reason(xml_content: XMLContent) -> dict | None:
     """Parse the not awarded reason from XML data.
 
     Args:
@@ -41,39 +56,21 @@ def parse_not_awarded_reason(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
     # Using the XPath from the eForms example
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        result_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        reason_code = lot_result.xpath(
-            "efac:DecisionReason/efbc:DecisionReasonCode[@listName='non-award-justification']/text()",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        result_id = XPATH_ID_RESULT(lot_result)
+        reason_code = (
+            XPATH_DECISION_REASON_DECISION_REASON_CODE_NON_AWARD_JUSTIFICATION(
+                lot_result
+            )
         )
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if result_id and reason_code and lot_id:
             # Following eForms guidance: Set status to 'unsuccessful' and map the code to statusDetails
@@ -107,10 +104,7 @@ def merge_not_awarded_reason(
 
     existing_awards = release_json.setdefault("awards", [])
     for new_award in not_awarded_reason_data["awards"]:
-        existing_award = next(
-            (a for a in existing_awards if a["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award.update(new_award)
         else:
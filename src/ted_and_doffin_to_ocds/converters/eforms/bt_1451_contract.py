@@ -2,14 +2,37 @@
 
 import logging
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_winner_decision_date(xml_content: str | bytes) -> dict | None:
+XPATH_NOTICE_RESULT = register_xpath(
+    "bt_1451_contract.XPATH_NOTICE_RESULT", "//efac:NoticeResult"
+)
+XPATH_SETTLED_CONTRACT = register_xpath(
+    "bt_1451_contract.XPATH_SETTLED_CONTRACT", "efac:SettledContract"
+)
+XPATH_LOT_RESULT = register_xpath("bt_1451_contract.XPATH_LOT_RESULT", "efac:LotResult")
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_1451_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_AWARD_DATE = register_xpath(
+    "bt_1451_contract.XPATH_AWARD_DATE", "cbc:AwardDate/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_1451_contract.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_1451_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
+def parse_winner_decision_date(xml_content: XMLContent) -> dict | None:
     """Parse winner decision date information from XML content following BT-1451.
 
     Extracts award dates from settled contracts and maps them to corresponding lot results.
@@ -23,52 +46,27 @@ def parse_winner_decision_date(xml_content: str | bytes) -> dict | None:
         Format: {"awards": [{"id": str, "date": str}]}
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"awards": []}
 
-    notice_results = root.xpath("//efac:NoticeResult", namespaces=namespaces)
+    notice_results = XPATH_NOTICE_RESULT(root)
 
     for notice_result in notice_results:
-        settled_contracts = notice_result.xpath(
-            "efac:SettledContract",
-            namespaces=namespaces,
-        )
-        lot_results = notice_result.xpath("efac:LotResult", namespaces=namespaces)
+        settled_contracts = XPATH_SETTLED_CONTRACT(notice_result)
+        lot_results = XPATH_LOT_RESULT(notice_result)
 
         for settled_contract in settled_contracts:
-            contract_id = settled_contract.xpath(
-                "cbc:ID[@schemeName='contract']/text()",
-                namespaces=namespaces,
-            )
-            award_date = settled_contract.xpath(
-                "cbc:AwardDate/text()",
-                namespaces=namespaces,
-            )
+            contract_id = XPATH_ID_CONTRACT(settled_contract)
+            award_date = XPATH_AWARD_DATE(settled_contract)
 
             if contract_id and award_date:
                 contract_id = contract_id[0]
                 award_date = end_date(award_date[0])
 
                 for lot_result in lot_results:
-                    lot_contract_id = lot_result.xpath(
-                        "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-                        namespaces=namespaces,
-                    )
-                    lot_result_id = lot_result.xpath(
-                        "cbc:ID[@schemeName='result']/text()",
-                        namespaces=namespaces,
-                    )
+                    lot_contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
+                    lot_result_id = XPATH_ID_RESULT(lot_result)
 
                     if (
                         lot_contract_id
@@ -104,10 +102,7 @@ def merge_winner_decision_date(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in winner_decision_date_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             if (
                 "date" not in existing_award
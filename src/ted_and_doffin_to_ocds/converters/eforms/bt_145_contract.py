@@ -6,21 +6,39 @@ from typing import Any
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID_RESULT = register_xpath(
+    "bt_145_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_145_contract.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    ".//efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_145_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    """
+        //efac:NoticeResult/efac:SettledContract |
+        //efac:NoticeResult/efac:SettledContract |
+        //ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/
+        efext:EformsExtension/efac:NoticeResult/efac:SettledContract
+        """,
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_145_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_ISSUE_DATE = register_xpath(
+    "bt_145_contract.XPATH_ISSUE_DATE", "cbc:IssueDate/text()"
+)
 
 
 def parse_contract_conclusion_date(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parses the contract conclusion date from XML content in both old and new formats.
 
@@ -31,10 +49,9 @@ def parse_contract_conclusion_date(
         Optional[Dict[str, List[Dict[str, Any]]]]: A dictionary containing contract conclusion dates, or None if no contracts are found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
@@ -43,20 +60,11 @@ def parse_contract_conclusion_date(
     contract_awards = {}
 
     # First find all lot results to map contracts to awards
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=NAMESPACES,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=NAMESPACES,
-        )
-        contract_id = lot_result.xpath(
-            ".//efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=NAMESPACES,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
         if award_id and contract_id:
             contract_awards[contract_id[0]] = award_id[0]
 
@@ -64,25 +72,11 @@ def parse_contract_conclusion_date(
     result = {"contracts": []}
 
     # Try different XPath patterns for settled contracts
-    settled_contracts = root.xpath(
-        """
-        //efac:NoticeResult/efac:SettledContract |
-        //efac:NoticeResult/efac:SettledContract |
-        //ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/
-        efext:EformsExtension/efac:NoticeResult/efac:SettledContract
-        """,
-        namespaces=NAMESPACES,
-    )
+    settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     for settled_contract in settled_contracts:
-        contract_id = settled_contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=NAMESPACES,
-        )
-        issue_date = settled_contract.xpath(
-            "cbc:IssueDate/text()",
-            namespaces=NAMESPACES,
-        )
+        contract_id = XPATH_ID_CONTRACT(settled_contract)
+        issue_date = XPATH_ISSUE_DATE(settled_contract)
 
         if contract_id and issue_date:
             contract = {"id": contract_id[0], "dateSigned": end_date(issue_date[0])}
@@ -118,14 +112,7 @@ def merge_contract_conclusion_date(
     existing_contracts = release_json.setdefault("contracts", [])
 
     for new_contract in contract_conclusion_date_data["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in existing_contracts
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_contract["dateSigned"] = new_contract["dateSigned"]
         else:
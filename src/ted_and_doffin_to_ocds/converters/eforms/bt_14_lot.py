@@ -3,12 +3,24 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_documents_restricted(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_14_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE = register_xpath(
+    "bt_14_lot.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE",
+    "./cac:TenderingTerms/cac:CallForTendersDocumentReference",
+)
+XPATH_DOCUMENT_TYPE = register_xpath(
+    "bt_14_lot.XPATH_DOCUMENT_TYPE", "cbc:DocumentType/text()"
+)
+
+
+def parse_lot_documents_restricted(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse restricted document references for each lot from XML content.
 
     Args:
@@ -19,35 +31,21 @@ def parse_lot_documents_restricted(xml_content: str | bytes) -> dict[str, Any] |
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        document_references = lot.xpath(
-            "./cac:TenderingTerms/cac:CallForTendersDocumentReference",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        document_references = XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE(
+            lot
         )
 
         for doc_ref in document_references:
-            doc_id = doc_ref.xpath("cbc:ID/text()", namespaces=namespaces)
-            doc_type = doc_ref.xpath("cbc:DocumentType/text()", namespaces=namespaces)
+            doc_id = XPATH_ID(doc_ref)
+            doc_type = XPATH_DOCUMENT_TYPE(doc_ref)
 
             if doc_id and doc_type and doc_type[0].lower() == "restricted-document":
                 document_data = {
@@ -81,16 +79,13 @@ def merge_lot_documents_restricted(
     )
 
     for new_document in lot_documents_restricted_data["tender"]["documents"]:
-        existing_document = next(
-            (doc for doc in existing_documents if doc["id"] == new_document["id"]),
-            None,
-        )
+        existing_document = find_by_id(existing_documents, new_document["id"])
         if existing_document:
             existing_document.update(new_document)
             existing_document.setdefault("relatedLots", []).extend(
                 new_document["relatedLots"],
             )
-            existing_document["relatedLots"] = list(
+            existing_document["relatedLots"] = sorted(
                 set(existing_document["relatedLots"]),
             )  # Remove duplicates
         else:
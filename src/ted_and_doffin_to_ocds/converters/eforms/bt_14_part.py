@@ -3,12 +3,27 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_documents_restricted(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER = register_xpath(
+    "bt_14_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:CallForTendersDocumentReference",
+)
+XPATH_ID = register_xpath("bt_14_part.XPATH_ID", "cbc:ID/text()")
+XPATH_DOCUMENT_TYPE = register_xpath(
+    "bt_14_part.XPATH_DOCUMENT_TYPE", "cbc:DocumentType/text()"
+)
+XPATH_DOCUMENT_DESCRIPTION = register_xpath(
+    "bt_14_part.XPATH_DOCUMENT_DESCRIPTION", "cbc:DocumentDescription/text()"
+)
+
+
+def parse_part_documents_restricted(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse restricted document references from XML content for the procurement part.
 
     Args:
@@ -19,34 +34,21 @@ def parse_part_documents_restricted(xml_content: str | bytes) -> dict[str, Any]
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    document_references = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:CallForTendersDocumentReference",
-        namespaces=namespaces,
+    document_references = (
+        XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER(root)
     )
 
     for doc_ref in document_references:
-        doc_id = doc_ref.xpath("cbc:ID/text()", namespaces=namespaces)
-        doc_type = doc_ref.xpath("cbc:DocumentType/text()", namespaces=namespaces)
+        doc_id = XPATH_ID(doc_ref)
+        doc_type = XPATH_DOCUMENT_TYPE(doc_ref)
 
         if doc_id and doc_type and doc_type[0].lower() == "restricted-document":
             # Extract existing access details if present
-            access_details = doc_ref.xpath(
-                "cbc:DocumentDescription/text()", namespaces=namespaces
-            )
+            access_details = XPATH_DOCUMENT_DESCRIPTION(doc_ref)
             access_text = access_details[0] if access_details else ""
 
             # Prepend "Restricted." to access details as per eForms guidance
@@ -85,10 +87,7 @@ def merge_part_documents_restricted(
     )
 
     for new_document in part_documents_restricted_data["tender"]["documents"]:
-        existing_document = next(
-            (doc for doc in existing_documents if doc["id"] == new_document["id"]),
-            None,
-        )
+        existing_document = find_by_id(existing_documents, new_document["id"])
         if existing_document:
             existing_document.update(new_document)
         else:
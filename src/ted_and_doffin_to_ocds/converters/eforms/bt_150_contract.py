@@ -1,11 +1,33 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_contract_identifier(xml_content: str | bytes) -> dict | None:
+XPATH_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_150_contract.XPATH_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_150_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_150_contract.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_150_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_CONTRACT_REFERENCE_ID = register_xpath(
+    "bt_150_contract.XPATH_CONTRACT_REFERENCE_ID",
+    "efac:ContractReference/cbc:ID/text()",
+)
+
+
+def parse_contract_identifier(xml_content: XMLContent) -> dict | None:
     """Parse contract identifiers from XML data.
 
     Args:
@@ -30,53 +52,26 @@ def parse_contract_identifier(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
-    settled_contracts = root.xpath(
-        "//efac:NoticeResult/efac:SettledContract",
-        namespaces=namespaces,
-    )
+    settled_contracts = XPATH_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     # First map contracts to awards
     contract_awards = {}
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        contract_id = lot_result.xpath(
-            "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
         if award_id and contract_id:
             contract_awards[contract_id[0]] = award_id[0]
 
     # Process each contract
     for contract in settled_contracts:
-        contract_id = contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
-        reference_id = contract.xpath(
-            "efac:ContractReference/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        contract_id = XPATH_ID_CONTRACT(contract)
+        reference_id = XPATH_CONTRACT_REFERENCE_ID(contract)
 
         if contract_id and reference_id:
             contract_data = {
@@ -114,10 +109,7 @@ def merge_contract_identifier(
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in contract_identifier_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_contract.setdefault("identifiers", []).extend(
                 new_contract["identifiers"]
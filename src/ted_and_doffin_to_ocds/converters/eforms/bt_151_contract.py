@@ -2,12 +2,31 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_contract_url(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_151_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_151_contract.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_151_contract.XPATH_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_151_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_URI = register_xpath("bt_151_contract.XPATH_URI", "cbc:URI/text()")
+
+
+def parse_contract_url(xml_content: XMLContent) -> dict | None:
     """Parse contract URLs from XML data.
 
     Args:
@@ -33,54 +52,27 @@ def parse_contract_url(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
     document_id = 1
 
     # First map contracts to awards
     contract_awards = {}
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        contract_id = lot_result.xpath(
-            "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
         if award_id and contract_id:
             contract_awards[contract_id[0]] = award_id[0]
 
     # Process contracts
-    contracts = root.xpath(
-        "//efac:NoticeResult/efac:SettledContract",
-        namespaces=namespaces,
-    )
+    contracts = XPATH_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     for contract in contracts:
-        contract_id = contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
-        contract_url = contract.xpath(
-            "cbc:URI/text()",
-            namespaces=namespaces,
-        )
+        contract_id = XPATH_ID_CONTRACT(contract)
+        contract_url = XPATH_URI(contract)
 
         if contract_id and contract_url:
             contract_data = {
@@ -118,10 +110,7 @@ def merge_contract_url(release_json: dict, contract_url_data: dict | None) -> No
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in contract_url_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_contract.setdefault("documents", []).extend(
                 new_contract["documents"]
@@ -5,10 +5,25 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
-def parse_documents_url(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_15_lot_part.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_NON_REST = register_xpath(
+    "bt_15_lot_part.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_NON_REST",
+    "cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType='non-restricted-document' and cac:Attachment/cac:ExternalReference/cbc:URI]",
+)
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "bt_15_lot_part.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
+
+
+def parse_documents_url(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse document URLs from XML content for lots and parts.
 
     Args:
@@ -19,33 +34,17 @@ def parse_documents_url(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        process_document_references(lot, result, namespaces, is_lot=True)
+        process_document_references(lot, result, is_lot=True)
 
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    parts = document.procurement_project_lots("Part")
     for part in parts:
-        process_document_references(part, result, namespaces, is_lot=False)
+        process_document_references(part, result, is_lot=False)
 
     return result if result["tender"]["documents"] else None
 
@@ -53,7 +52,6 @@ def parse_documents_url(xml_content: str | bytes) -> dict[str, Any] | None:
 def process_document_references(
     element: etree._Element,
     result: dict[str, Any],
-    namespaces: dict[str, str],
     is_lot: bool,
 ) -> None:
     """Process document references from a lot or part element.
@@ -61,22 +59,17 @@ def process_document_references(
     Args:
         element (etree._Element): The XML element containing document references
         result (Dict[str, Any]): Dictionary to store the processed documents
-        namespaces (Dict[str, str]): XML namespaces
         is_lot (bool): Whether processing a lot (True) or part (False)
 
     """
-    element_id = element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-    document_references = element.xpath(
-        "cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType='non-restricted-document' and cac:Attachment/cac:ExternalReference/cbc:URI]",
-        namespaces=namespaces,
+    element_id = XPATH_ID(element)[0]
+    document_references = (
+        XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_NON_REST(element)
     )
 
     for doc_ref in document_references:
-        doc_id = doc_ref.xpath("cbc:ID/text()", namespaces=namespaces)
-        doc_url = doc_ref.xpath(
-            "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-            namespaces=namespaces,
-        )
+        doc_id = XPATH_ID(doc_ref)
+        doc_url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(doc_ref)
 
         if doc_id and doc_url:
             document = {
@@ -109,10 +102,7 @@ def merge_documents_url(
     )
 
     for new_document in documents_url_data["tender"]["documents"]:
-        existing_document = next(
-            (doc for doc in existing_documents if doc["id"] == new_document["id"]),
-            None,
-        )
+        existing_document = find_by_id(existing_documents, new_document["id"])
         if existing_document:
             # Update only specific fields we care about
             existing_document["url"] = new_document["url"]
@@ -124,7 +114,7 @@ def merge_documents_url(
                     existing_document["relatedLots"] = []
 
                 # Add new lot references and ensure uniqueness
-                existing_document["relatedLots"] = list(
+                existing_document["relatedLots"] = sorted(
                     set(existing_document["relatedLots"] + new_document["relatedLots"])
                 )
         else:
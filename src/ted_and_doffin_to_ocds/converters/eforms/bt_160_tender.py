@@ -1,13 +1,50 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 GOVERNMENT_CHARGE_TITLE = "The estimated revenue coming from the buyer who granted the concession (e.g. prizes and payments)."
 
 
-def parse_concession_revenue_buyer(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_160_tender.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_160_tender.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_160_tender.XPATH_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_160_tender.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_LOT_TENDER_ID_TENDER = register_xpath(
+    "bt_160_tender.XPATH_LOT_TENDER_ID_TENDER",
+    "efac:LotTender/cbc:ID[@schemeName='tender']/text()",
+)
+XPATH_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "bt_160_tender.XPATH_NOTICE_RESULT_LOT_TENDER",
+    "//efac:NoticeResult/efac:LotTender[efac:ConcessionRevenue/efbc:RevenueBuyerAmount]",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_160_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT = register_xpath(
+    "bt_160_tender.XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT",
+    "efac:ConcessionRevenue/efbc:RevenueBuyerAmount/text()",
+)
+XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_160_tender.XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT_CURRENCY_ID",
+    "efac:ConcessionRevenue/efbc:RevenueBuyerAmount/@currencyID",
+)
+
+
+def parse_concession_revenue_buyer(xml_content: XMLContent) -> dict | None:
     """Parse concession revenue from XML data.
 
     Args:
@@ -39,75 +76,36 @@ def parse_concession_revenue_buyer(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
     # First map contracts to awards
     contract_awards = {}
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        contract_id = lot_result.xpath(
-            "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
         if award_id and contract_id:
             contract_awards[contract_id[0]] = award_id[0]
 
     # Create mapping between tender IDs and contract IDs
     tender_contracts = {}
-    settled_contracts = root.xpath(
-        "//efac:NoticeResult/efac:SettledContract",
-        namespaces=namespaces,
-    )
+    settled_contracts = XPATH_NOTICE_RESULT_SETTLED_CONTRACT(root)
     for contract in settled_contracts:
-        contract_id = contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
-        tender_id = contract.xpath(
-            "efac:LotTender/cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
+        contract_id = XPATH_ID_CONTRACT(contract)
+        tender_id = XPATH_LOT_TENDER_ID_TENDER(contract)
         if contract_id and tender_id:
             tender_contracts[tender_id[0]] = contract_id[0]
 
     # Process lot tenders with concession revenue
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender[efac:ConcessionRevenue/efbc:RevenueBuyerAmount]",
-        namespaces=namespaces,
-    )
+    lot_tenders = XPATH_NOTICE_RESULT_LOT_TENDER(root)
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        revenue = lot_tender.xpath(
-            "efac:ConcessionRevenue/efbc:RevenueBuyerAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_tender.xpath(
-            "efac:ConcessionRevenue/efbc:RevenueBuyerAmount/@currencyID",
-            namespaces=namespaces,
-        )
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        revenue = XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT(lot_tender)
+        currency = XPATH_CONCESSION_REVENUE_REVENUE_BUYER_AMOUNT_CURRENCY_ID(lot_tender)
 
         if not (tender_id and revenue and currency):
             logger.warning("Incomplete concession revenue data found in tender")
@@ -166,10 +164,7 @@ def merge_concession_revenue_buyer(
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in concession_revenue_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_implementation = existing_contract.setdefault("implementation", {})
             existing_charges = existing_implementation.setdefault("charges", [])
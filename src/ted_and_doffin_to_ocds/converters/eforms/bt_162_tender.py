@@ -2,14 +2,39 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 USER_CHARGE_TITLE = "The estimated revenue coming from the users of the concession (e.g. fees and fines)."
 
 
-def parse_concession_revenue_user(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_162_tender.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "bt_162_tender.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_162_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT = register_xpath(
+    "bt_162_tender.XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT",
+    "efac:ConcessionRevenue/efbc:RevenueUserAmount/text()",
+)
+XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_162_tender.XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT_CURRENCY_ID",
+    "efac:ConcessionRevenue/efbc:RevenueUserAmount/@currencyID",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_162_tender.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+
+
+def parse_concession_revenue_user(xml_content: XMLContent) -> dict | None:
     """Parse user concession revenue from XML data.
 
     Args:
@@ -41,69 +66,32 @@ def parse_concession_revenue_user(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"contracts": []}
 
     # First map contracts to awards
     contract_awards = {}
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        contract_id = lot_result.xpath(
-            "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
         if award_id and contract_id:
             contract_awards[contract_id[0]] = award_id[0]
 
     # Process lot tenders
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        revenue = lot_tender.xpath(
-            "efac:ConcessionRevenue/efbc:RevenueUserAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_tender.xpath(
-            "efac:ConcessionRevenue/efbc:RevenueUserAmount/@currencyID",
-            namespaces=namespaces,
-        )
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        revenue = XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT(lot_tender)
+        currency = XPATH_CONCESSION_REVENUE_REVENUE_USER_AMOUNT_CURRENCY_ID(lot_tender)
 
         if tender_id and revenue and currency:
             # Find corresponding contract
-            contract = root.xpath(
-                f"//efac:NoticeResult/efac:SettledContract[efac:LotTender/cbc:ID[@schemeName='tender']='{tender_id[0]}']",
-                namespaces=namespaces,
-            )
+            contract = document.index.contracts_for_tender(tender_id[0])
             if contract:
-                contract_id = contract[0].xpath(
-                    "cbc:ID[@schemeName='contract']/text()",
-                    namespaces=namespaces,
-                )
+                contract_id = XPATH_ID_CONTRACT(contract[0])
                 if contract_id:
                     contract_data = {
                         "id": contract_id[0],
@@ -147,10 +135,7 @@ def merge_concession_revenue_user(
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in concession_revenue_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_implementation = existing_contract.setdefault("implementation", {})
             existing_charges = existing_implementation.setdefault("charges", [])
@@ -2,13 +2,31 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_TENDER = register_xpath(
+    "bt_163_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_CONCESSION_REVENUE_VALUE_DESCRIPTION = register_xpath(
+    "bt_163_tender.XPATH_CONCESSION_REVENUE_VALUE_DESCRIPTION",
+    "efac:ConcessionRevenue/efbc:ValueDescription/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_163_tender.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_163_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_concession_value_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse concession value description from XML data.
 
@@ -29,51 +47,23 @@ def parse_concession_value_description(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
     # Process lot tenders with value descriptions
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        value_desc = lot_tender.xpath(
-            "efac:ConcessionRevenue/efbc:ValueDescription/text()",
-            namespaces=namespaces,
-        )
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        value_desc = XPATH_CONCESSION_REVENUE_VALUE_DESCRIPTION(lot_tender)
 
         if tender_id and value_desc:
             # Find corresponding lot result
-            lot_result = root.xpath(
-                f"//efac:NoticeResult/efac:LotResult[efac:LotTender/cbc:ID[@schemeName='tender']='{tender_id[0]}']",
-                namespaces=namespaces,
-            )
+            lot_result = document.index.lot_results_for_tender(tender_id[0])
             if lot_result:
-                result_id = lot_result[0].xpath(
-                    "cbc:ID[@schemeName='result']/text()",
-                    namespaces=namespaces,
-                )
-                lot_id = lot_result[0].xpath(
-                    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                    namespaces=namespaces,
-                )
+                result_id = XPATH_ID_RESULT(lot_result[0])
+                lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result[0])
 
                 if result_id and lot_id:
                     award = {
@@ -102,16 +92,13 @@ def merge_concession_value_description(
 
     existing_awards = release_json.setdefault("awards", [])
     for new_award in value_description_data["awards"]:
-        existing_award = next(
-            (a for a in existing_awards if a["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award["valueCalculationMethod"] = new_award[
                 "valueCalculationMethod"
             ]
             existing_lots = set(existing_award.get("relatedLots", []))
             existing_lots.update(new_award["relatedLots"])
-            existing_award["relatedLots"] = list(existing_lots)
+            existing_award["relatedLots"] = sorted(existing_lots)
         else:
             existing_awards.append(new_award)
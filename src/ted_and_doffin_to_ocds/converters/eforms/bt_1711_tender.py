@@ -1,11 +1,29 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tender_ranked(xml_content: str | bytes) -> dict | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER_TENDER = register_xpath(
+    "bt_1711_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER_TENDER",
+    "//efext:EformsExtension/efac:NoticeResult/efac:LotTender[efbc:TenderRankedIndicator and cbc:ID[@schemeName='tender']]",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_1711_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_TENDER_RANKED_INDICATOR = register_xpath(
+    "bt_1711_tender.XPATH_TENDER_RANKED_INDICATOR", "efbc:TenderRankedIndicator/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_1711_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_tender_ranked(xml_content: XMLContent) -> dict | None:
     """Parse tender ranked information from XML content following BT-1711.
 
     Extracts tender ranking indicator information and maps it to bid details.
@@ -19,39 +37,17 @@ def parse_tender_ranked(xml_content: str | bytes) -> dict | None:
         Format: {"bids": {"details": [{"id": str, "hasRank": bool, "relatedLots": list[str]}]}}
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"bids": {"details": []}}
 
-    lot_tenders = root.xpath(
-        "//efext:EformsExtension/efac:NoticeResult/efac:LotTender[efbc:TenderRankedIndicator and cbc:ID[@schemeName='tender']]",
-        namespaces=namespaces,
-    )
+    lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER_TENDER(root)
 
     for lot_tender in lot_tenders:
         try:
-            tender_id = lot_tender.xpath(
-                "cbc:ID[@schemeName='tender']/text()",
-                namespaces=namespaces,
-            )[0]
-            ranked_indicator = lot_tender.xpath(
-                "efbc:TenderRankedIndicator/text()",
-                namespaces=namespaces,
-            )[0]
-            lot_id = lot_tender.xpath(
-                "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                namespaces=namespaces,
-            )[0]
+            tender_id = XPATH_ID_TENDER(lot_tender)[0]
+            ranked_indicator = XPATH_TENDER_RANKED_INDICATOR(lot_tender)[0]
+            lot_id = XPATH_TENDER_LOT_ID_LOT(lot_tender)[0]
 
             bid = {
                 "id": tender_id,
@@ -87,10 +83,7 @@ def merge_tender_ranked(release_json: dict, tender_ranked_data: dict | None) ->
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
 
     for new_bid in tender_ranked_data["bids"]["details"]:
-        existing_bid = next(
-            (bid for bid in existing_bids if bid["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid.update(new_bid)
         else:
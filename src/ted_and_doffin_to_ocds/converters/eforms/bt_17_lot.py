@@ -3,12 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_submission_electronic(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_17_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_SUBMISSION_METHOD_CODE_ESUBMISSION = register_xpath(
+    "bt_17_lot.XPATH_TENDERING_PROCESS_SUBMISSION_METHOD_CODE_ESUBMISSION",
+    "cac:TenderingProcess/cbc:SubmissionMethodCode[@listName='esubmission']/text()",
+)
+
+
+def parse_submission_electronic(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse electronic submission policy for each lot from XML content.
 
     Args:
@@ -19,17 +28,7 @@ def parse_submission_electronic(xml_content: str | bytes) -> dict[str, Any] | No
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     # Map of XML submission values to OCDS permission codelist values
     # Based on the eForms permission codelist values
@@ -41,16 +40,12 @@ def parse_submission_electronic(xml_content: str | bytes) -> dict[str, Any] | No
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
-        submission_method = lot.xpath(
-            "cac:TenderingProcess/cbc:SubmissionMethodCode[@listName='esubmission']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)
+        submission_method = XPATH_TENDERING_PROCESS_SUBMISSION_METHOD_CODE_ESUBMISSION(
+            lot
         )
 
         if lot_id and submission_method:
@@ -84,10 +79,7 @@ def merge_submission_electronic(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in submission_electronic_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 new_lot["submissionTerms"],
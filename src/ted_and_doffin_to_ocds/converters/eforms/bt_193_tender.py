@@ -2,12 +2,26 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tender_variant(xml_content: str | bytes) -> dict | None:
+XPATH_ID_TENDER = register_xpath(
+    "bt_193_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_TENDER_VARIANT_INDICATOR = register_xpath(
+    "bt_193_tender.XPATH_TENDER_VARIANT_INDICATOR", "efbc:TenderVariantIndicator/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_193_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
+def parse_tender_variant(xml_content: XMLContent) -> dict | None:
     """Parse tender variant information from XML data.
 
     Args:
@@ -29,38 +43,16 @@ def parse_tender_variant(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"bids": {"details": []}}
 
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        variant = lot_tender.xpath(
-            "efbc:TenderVariantIndicator/text()",
-            namespaces=namespaces,
-        )
-        lot_id = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        variant = XPATH_TENDER_VARIANT_INDICATOR(lot_tender)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_tender)
 
         if tender_id and lot_id:
             bid_data = {"id": tender_id[0], "relatedLots": [lot_id[0]]}
@@ -87,10 +79,7 @@ def merge_tender_variant(release_json: dict, tender_variant_data: dict | None) -
 
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
     for new_bid in tender_variant_data["bids"]["details"]:
-        existing_bid = next(
-            (b for b in existing_bids if b["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid.update(new_bid)
         else:
@@ -5,6 +5,10 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 JUSTIFICATION_CODES = {
@@ -16,8 +20,15 @@ JUSTIFICATION_CODES = {
 }
 
 
+XPATH_ID = register_xpath("bt_19_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI = register_xpath(
+    "bt_19_lot.XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI",
+    "cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:ProcessReasonCode/text()",
+)
+
+
 def parse_submission_nonelectronic_justification(
-    xml_content: str,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse non-electronic submission justification for each lot from XML content.
 
@@ -29,40 +40,25 @@ def parse_submission_nonelectronic_justification(
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
+        lot_id = XPATH_ID(lot)
         if not lot_id:
             logger.warning("Lot ID not found")
             continue
 
         lot_id = lot_id[0]
-        justification_code = lot.xpath(
-            "cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:ProcessReasonCode/text()",
-            namespaces=namespaces,
+        justification_code = (
+            XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI(lot)
         )
 
         if justification_code:
@@ -97,10 +93,7 @@ def merge_submission_nonelectronic_justification(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in justification_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).setdefault(
                 "nonElectronicSubmission",
@@ -1,9 +1,11 @@
 # converters/bt_200_Contract.py
 
 import logging
-import uuid
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.identifiers import new_id
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +21,24 @@ REASON_DESCRIPTIONS = {
 }
 
 
+XPATH_CONTRACT_MODIFICATION = register_xpath(
+    "bt_200_contract.XPATH_CONTRACT_MODIFICATION", "//efac:ContractModification"
+)
+XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER = register_xpath(
+    "bt_200_contract.XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER",
+    "efac:Change/efac:ChangedSection/efbc:ChangedSectionIdentifier/text()",
+)
+XPATH_CHANGE_REASON_REASON_CODE_MODIFICATION_JUSTIFICATION = register_xpath(
+    "bt_200_contract.XPATH_CHANGE_REASON_REASON_CODE_MODIFICATION_JUSTIFICATION",
+    "efac:ChangeReason/cbc:ReasonCode[@listName='modification-justification']/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_200_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
 def parse_contract_modification_reason(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse contract modification reason from XML data.
 
@@ -32,47 +50,34 @@ def parse_contract_modification_reason(
         The structure follows the format shown in the example output
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
-    modifications = root.xpath(
-        "//efac:ContractModification",
-        namespaces=namespaces,
-    )
+    modifications = XPATH_CONTRACT_MODIFICATION(root)
 
-    for modification in modifications:
-        contract_id = modification.xpath(
-            "efac:Change/efac:ChangedSection/efbc:ChangedSectionIdentifier/text()",
-            namespaces=namespaces,
+    for position, modification in enumerate(modifications):
+        contract_id = XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER(
+            modification
         )
-        reason_code = modification.xpath(
-            "efac:ChangeReason/cbc:ReasonCode[@listName='modification-justification']/text()",
-            namespaces=namespaces,
+        reason_code = XPATH_CHANGE_REASON_REASON_CODE_MODIFICATION_JUSTIFICATION(
+            modification
         )
 
         if contract_id and reason_code:
             # Find all related lot results
-            lot_results = root.xpath(
-                f"//efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID[@schemeName='contract']='{contract_id[0]}']",
-                namespaces=namespaces,
-            )
-
+            lot_results = document.index.lot_results_for_contract(contract_id[0])
             contract_data = {
                 "id": contract_id[0],
                 "amendments": [
                     {
-                        "id": str(uuid.uuid4()),
+                        "id": new_id(
+                            document.notice_id,
+                            "BT-200-Contract",
+                            str(position),
+                            contract_id[0],
+                        ),
                         "rationaleClassifications": [
                             {
                                 "id": reason_code[0],
@@ -88,13 +93,7 @@ def parse_contract_modification_reason(
 
             # Handle award IDs based on number of lot results
             award_ids = [
-                lot.xpath("cbc:ID[@schemeName='result']/text()", namespaces=namespaces)[
-                    0
-                ]
-                for lot in lot_results
-                if lot.xpath(
-                    "cbc:ID[@schemeName='result']/text()", namespaces=namespaces
-                )
+                XPATH_ID_RESULT(lot)[0] for lot in lot_results if XPATH_ID_RESULT(lot)
             ]
 
             if len(award_ids) == 1:
@@ -123,10 +122,7 @@ def merge_contract_modification_reason(
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in modification_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_amendments = existing_contract.setdefault("amendments", [])
             existing_amendments.extend(new_contract["amendments"])
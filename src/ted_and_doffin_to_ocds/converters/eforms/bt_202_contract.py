@@ -1,15 +1,33 @@
 # converters/bt_202_Contract.py
 
 import logging
-import uuid
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.identifiers import new_id
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_CONTRACT_MODIFICATION = register_xpath(
+    "bt_202_contract.XPATH_CONTRACT_MODIFICATION", "//efac:ContractModification"
+)
+XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER = register_xpath(
+    "bt_202_contract.XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER",
+    "efac:Change/efac:ChangedSection/efbc:ChangedSectionIdentifier/text()",
+)
+XPATH_CHANGE_CHANGE_DESCRIPTION = register_xpath(
+    "bt_202_contract.XPATH_CHANGE_CHANGE_DESCRIPTION",
+    "efac:Change/efbc:ChangeDescription/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_202_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
 def parse_contract_modification_summary(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse contract modification summary from XML data.
 
@@ -35,58 +53,40 @@ def parse_contract_modification_summary(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
-    modifications = root.xpath(
-        "//efac:ContractModification",
-        namespaces=namespaces,
-    )
+    modifications = XPATH_CONTRACT_MODIFICATION(root)
 
-    for modification in modifications:
-        contract_id = modification.xpath(
-            "efac:Change/efac:ChangedSection/efbc:ChangedSectionIdentifier/text()",
-            namespaces=namespaces,
-        )
-        change_desc = modification.xpath(
-            "efac:Change/efbc:ChangeDescription/text()",
-            namespaces=namespaces,
+    for position, modification in enumerate(modifications):
+        contract_id = XPATH_CHANGE_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER(
+            modification
         )
+        change_desc = XPATH_CHANGE_CHANGE_DESCRIPTION(modification)
 
         if contract_id and change_desc:
             # Find all related lot results
-            lot_results = root.xpath(
-                f"//efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID[@schemeName='contract']='{contract_id[0]}']",
-                namespaces=namespaces,
-            )
-
+            lot_results = document.index.lot_results_for_contract(contract_id[0])
             contract_data = {
                 "id": contract_id[0],
                 "amendments": [
-                    {"id": str(uuid.uuid4()), "description": change_desc[0]}
+                    {
+                        "id": new_id(
+                            document.notice_id,
+                            "BT-202-Contract",
+                            str(position),
+                            contract_id[0],
+                        ),
+                        "description": change_desc[0],
+                    }
                 ],
             }
 
             # Handle award IDs based on number of lot results
             award_ids = [
-                lot.xpath("cbc:ID[@schemeName='result']/text()", namespaces=namespaces)[
-                    0
-                ]
-                for lot in lot_results
-                if lot.xpath(
-                    "cbc:ID[@schemeName='result']/text()", namespaces=namespaces
-                )
+                XPATH_ID_RESULT(lot)[0] for lot in lot_results if XPATH_ID_RESULT(lot)
             ]
 
             if len(award_ids) == 1:
@@ -115,16 +115,12 @@ def merge_contract_modification_summary(
 
     existing_contracts = release_json.setdefault("contracts", [])
     for new_contract in modification_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             for new_amendment in new_contract["amendments"]:
                 existing_amendments = existing_contract.setdefault("amendments", [])
-                existing_amendment = next(
-                    (a for a in existing_amendments if a["id"] == new_amendment["id"]),
-                    None,
+                existing_amendment = find_by_id(
+                    existing_amendments, new_amendment["id"]
                 )
                 if existing_amendment:
                     existing_amendment.update(new_amendment)
@@ -3,12 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_title(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_21_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_NAME = register_xpath(
+    "bt_21_lot.XPATH_PROCUREMENT_PROJECT_NAME", "cac:ProcurementProject/cbc:Name/text()"
+)
+
+
+def parse_lot_title(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse lot titles from XML content.
 
     Args:
@@ -19,31 +27,15 @@ def parse_lot_title(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        lot_title = lot.xpath(
-            "cac:ProcurementProject/cbc:Name/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        lot_title = XPATH_PROCUREMENT_PROJECT_NAME(lot)
 
         if lot_title:
             result["tender"]["lots"].append({"id": lot_id, "title": lot_title[0]})
@@ -67,10 +59,7 @@ def merge_lot_title(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_title_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["title"] = new_lot["title"]
         else:
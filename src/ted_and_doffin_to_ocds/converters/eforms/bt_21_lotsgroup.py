@@ -1,12 +1,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lots_group_title(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_21_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_NAME = register_xpath(
+    "bt_21_lotsgroup.XPATH_PROCUREMENT_PROJECT_NAME",
+    "cac:ProcurementProject/cbc:Name/text()",
+)
+
+
+def parse_lots_group_title(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse lot group titles from XML content.
 
     Args:
@@ -17,31 +26,15 @@ def parse_lots_group_title(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lot_groups = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lot_groups = document.procurement_project_lots("LotsGroup")
 
     for lot_group in lot_groups:
-        lot_group_id = lot_group.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        lot_group_title = lot_group.xpath(
-            "cac:ProcurementProject/cbc:Name/text()",
-            namespaces=namespaces,
-        )
+        lot_group_id = XPATH_ID(lot_group)[0]
+        lot_group_title = XPATH_PROCUREMENT_PROJECT_NAME(lot_group)
 
         if lot_group_title:
             result["tender"]["lotGroups"].append(
@@ -70,14 +63,7 @@ def merge_lots_group_title(
     )
 
     for new_lot_group in lots_group_title_data["tender"]["lotGroups"]:
-        existing_lot_group = next(
-            (
-                group
-                for group in existing_lot_groups
-                if group["id"] == new_lot_group["id"]
-            ),
-            None,
-        )
+        existing_lot_group = find_by_id(existing_lot_groups, new_lot_group["id"])
         if existing_lot_group:
             existing_lot_group["title"] = new_lot_group["title"]
         else:
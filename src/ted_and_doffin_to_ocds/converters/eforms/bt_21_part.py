@@ -1,12 +1,19 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_title(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NAME = register_xpath(
+    "bt_21_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NAME",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:Name",
+)
+
+
+def parse_part_title(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse part title from XML content.
 
     Args:
@@ -17,24 +24,13 @@ def parse_part_title(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {}}
 
     # Use the exact XPath provided in the specification
-    part_title_elements = root.xpath(
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:Name",
-        namespaces=namespaces,
+    part_title_elements = XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NAME(
+        root
     )
 
     if part_title_elements:
@@ -1,12 +1,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_internal_identifier(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_22_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID = register_xpath(
+    "bt_22_lot.XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID",
+    "cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
+)
+
+
+def parse_lot_internal_identifier(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse internal identifiers for each lot from XML content.
 
     Args:
@@ -41,32 +50,16 @@ def parse_lot_internal_identifier(xml_content: str | bytes) -> dict[str, Any] |
             }
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
     # Using the absolute xpath from the specification
-    lots = root.xpath(
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot", top_level=True)
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        internal_id = lot.xpath(
-            "cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        internal_id = XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID(lot)
 
         if internal_id:
             result["tender"]["lots"].append(
@@ -95,10 +88,7 @@ def merge_lot_internal_identifier(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_internal_identifier_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["identifiers"] = new_lot["identifiers"]
         else:
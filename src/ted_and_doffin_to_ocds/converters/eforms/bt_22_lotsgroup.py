@@ -1,13 +1,22 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_22_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID = register_xpath(
+    "bt_22_lotsgroup.XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID",
+    "cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
+)
+
+
 def parse_lots_group_internal_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse internal identifiers for lot groups from XML content.
 
@@ -19,31 +28,15 @@ def parse_lots_group_internal_identifier(
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lot_groups = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lot_groups = document.procurement_project_lots("LotsGroup")
 
     for lot_group in lot_groups:
-        lot_group_id = lot_group.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        internal_id = lot_group.xpath(
-            "cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
-            namespaces=namespaces,
-        )
+        lot_group_id = XPATH_ID(lot_group)[0]
+        internal_id = XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID(lot_group)
 
         if internal_id:
             result["tender"]["lotGroups"].append(
@@ -77,14 +70,7 @@ def merge_lots_group_internal_identifier(
     )
 
     for new_lot_group in lots_group_internal_identifier_data["tender"]["lotGroups"]:
-        existing_lot_group = next(
-            (
-                group
-                for group in existing_lot_groups
-                if group["id"] == new_lot_group["id"]
-            ),
-            None,
-        )
+        existing_lot_group = find_by_id(existing_lot_groups, new_lot_group["id"])
         if existing_lot_group:
             existing_lot_group["identifiers"] = new_lot_group["identifiers"]
         else:
@@ -1,13 +1,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID = register_xpath(
+    "bt_22_procedure.XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID",
+    "/*/cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
+)
+
+
 def parse_procedure_internal_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse internal identifier from procedure XML content.
 
@@ -19,22 +26,9 @@ def parse_procedure_internal_identifier(
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    internal_id = root.xpath(
-        "/*/cac:ProcurementProject/cbc:ID[@schemeName='InternalID']/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    internal_id = XPATH_PROCUREMENT_PROJECT_ID_INTERNAL_ID(root)
 
     if internal_id:
         return {
@@ -3,12 +3,19 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_main_nature_part(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_PROCUREMENT = register_xpath(
+    "bt_23_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_PROCUREMENT",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:ProcurementTypeCode[@listName='contract-nature']/text()",
+)
+
+
+def parse_main_nature_part(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse main procurement nature from part XML content.
 
     Args:
@@ -19,23 +26,12 @@ def parse_main_nature_part(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {}}
 
-    procurement_type = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:ProcurementTypeCode[@listName='contract-nature']/text()",
-        namespaces=namespaces,
+    procurement_type = (
+        XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_PROCUREMENT(root)
     )
 
     if procurement_type:
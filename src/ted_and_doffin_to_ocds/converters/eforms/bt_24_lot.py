@@ -3,12 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_description(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_24_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_DESCRIPTION = register_xpath(
+    "bt_24_lot.XPATH_PROCUREMENT_PROJECT_DESCRIPTION",
+    "cac:ProcurementProject/cbc:Description/text()",
+)
+
+
+def parse_lot_description(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse descriptions for each lot from XML content.
 
     Args:
@@ -19,31 +28,15 @@ def parse_lot_description(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        description = lot_element.xpath(
-            "cac:ProcurementProject/cbc:Description/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot_element)[0]
+        description = XPATH_PROCUREMENT_PROJECT_DESCRIPTION(lot_element)
 
         if description:
             lot = {"id": lot_id, "description": description[0]}
@@ -69,10 +62,7 @@ def merge_lot_description(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["description"] = new_lot["description"]
         else:
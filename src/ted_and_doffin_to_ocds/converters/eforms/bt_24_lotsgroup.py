@@ -3,12 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lots_group_description(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_24_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_DESCRIPTION = register_xpath(
+    "bt_24_lotsgroup.XPATH_PROCUREMENT_PROJECT_DESCRIPTION",
+    "cac:ProcurementProject/cbc:Description/text()",
+)
+
+
+def parse_lots_group_description(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse descriptions for lot groups from XML content.
 
     Args:
@@ -19,34 +28,15 @@ def parse_lots_group_description(xml_content: str | bytes) -> dict[str, Any] | N
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lots_group_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lots_group_elements = document.procurement_project_lots("LotsGroup")
 
     for lots_group_element in lots_group_elements:
-        lots_group_id = lots_group_element.xpath(
-            "cbc:ID/text()",
-            namespaces=namespaces,
-        )[0]
-        description = lots_group_element.xpath(
-            "cac:ProcurementProject/cbc:Description/text()",
-            namespaces=namespaces,
-        )
+        lots_group_id = XPATH_ID(lots_group_element)[0]
+        description = XPATH_PROCUREMENT_PROJECT_DESCRIPTION(lots_group_element)
 
         if description:
             lot_group = {"id": lots_group_id, "description": description[0]}
@@ -75,14 +65,7 @@ def merge_lots_group_description(
     )
 
     for new_lot_group in lots_group_description_data["tender"]["lotGroups"]:
-        existing_lot_group = next(
-            (
-                group
-                for group in existing_lot_groups
-                if group["id"] == new_lot_group["id"]
-            ),
-            None,
-        )
+        existing_lot_group = find_by_id(existing_lot_groups, new_lot_group["id"])
         if existing_lot_group:
             existing_lot_group["description"] = new_lot_group["description"]
         else:
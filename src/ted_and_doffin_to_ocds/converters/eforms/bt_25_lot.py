@@ -3,12 +3,24 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_quantity(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_25_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY = register_xpath(
+    "bt_25_lot.XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY",
+    "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/text()",
+)
+XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT = register_xpath(
+    "bt_25_lot.XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT",
+    "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/@unitCode",
+)
+
+
+def parse_lot_quantity(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse quantities for each lot from XML content.
 
     Args:
@@ -19,34 +31,17 @@ def parse_lot_quantity(xml_content: str | bytes) -> dict[str, Any] | None:
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for i, lot in enumerate(lots, start=1):
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        quantity = lot.xpath(
-            "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/text()",
-            namespaces=namespaces,
-        )
-        unit_code = lot.xpath(
-            "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/@unitCode",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        quantity = XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY(lot)
+        unit_code = XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT(
+            lot
         )
 
         if quantity:
@@ -2,11 +2,18 @@
 
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+XPATH_ID = register_xpath("bt_262_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS = register_xpath(
+    "bt_262_lot.XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS",
+    "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
+)
 
 
 def parse_main_classification_code_lot(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the XML content to extract main classification codes for each lot.
 
@@ -34,25 +41,16 @@ def parse_main_classification_code_lot(
         Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
     # Process each lot
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        classifications = lot.xpath(
-            "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        classifications = (
+            XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS(lot)
         )
 
         if classifications:
@@ -1,10 +1,17 @@
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS = register_xpath(
+    "bt_262_part.XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS",
+    "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode/text()",
+)
 
 
 def parse_main_classification_code_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the XML content to extract main classification codes for each part.
 
@@ -31,24 +38,15 @@ def parse_main_classification_code_part(
         Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
     # Process each part
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']", namespaces=namespaces
-    )
+    parts = document.procurement_project_lots("Part")
     for part in parts:
-        classification = part.xpath(
-            "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode/text()",
-            namespaces=namespaces,
+        classification = (
+            XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS(part)
         )
 
         if classification:
@@ -83,9 +81,7 @@ def merge_main_classification_code_part(
     items = tender.setdefault("items", [])
 
     for new_item in classification_code_data["tender"]["items"]:
-        existing_item = next(
-            (item for item in items if item["id"] == new_item["id"]), None
-        )
+        existing_item = find_by_id(items, new_item["id"])
 
         if existing_item:
             # Update or create classification
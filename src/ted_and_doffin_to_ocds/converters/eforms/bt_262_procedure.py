@@ -1,10 +1,17 @@
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS = register_xpath(
+    "bt_262_procedure.XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS",
+    "/*/cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
+)
 
 
 def parse_main_classification_code_procedure(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the XML content to extract main classification code for the procedure.
 
@@ -31,18 +38,11 @@ def parse_main_classification_code_procedure(
         Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
     # Check for procedure-level main classification code
-    classification = root.xpath(
-        "/*/cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
-        namespaces=namespaces,
+    classification = XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS(
+        root
     )
 
     if not classification or not classification[0].text:
@@ -85,7 +85,7 @@ def merge_main_classification_code_procedure(
     items = tender.setdefault("items", [])
 
     new_item = classification_code_data["tender"]["items"][0]
-    existing_item = next((item for item in items if item["id"] == new_item["id"]), None)
+    existing_item = find_by_id(items, new_item["id"])
 
     if existing_item:
         # Preserve existing scheme if available
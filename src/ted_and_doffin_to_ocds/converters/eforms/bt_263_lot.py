@@ -3,13 +3,25 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_263_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM = register_xpath(
+    "bt_263_lot.XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM",
+    "cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
+)
+XPATH_LOT_ADDITIONAL_CLASSIFICATION_CODE = register_xpath(
+    "bt_263_lot.XPATH_LOT_ADDITIONAL_CLASSIFICATION_CODE",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
+)
+
+
 def parse_additional_classification_code(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse classification codes from lot XML content.
 
@@ -21,31 +33,22 @@ def parse_additional_classification_code(
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if any additional classification codes exist
-    xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode"
-    if not root.xpath(xpath, namespaces=namespaces):
+    if not XPATH_LOT_ADDITIONAL_CLASSIFICATION_CODE(root):
         logger.info("No additional classification code data found.")
         return None
 
     result = {"tender": {"items": []}}
 
     # Update parsing to only capture classification IDs
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        classification_nodes = lot.xpath(
-            "cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        classification_nodes = (
+            XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM(lot)
         )
 
         if classification_nodes:
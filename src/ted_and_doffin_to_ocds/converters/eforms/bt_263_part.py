@@ -1,13 +1,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM = register_xpath(
+    "bt_263_part.XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
+)
+
+
 def parse_additional_classification_code_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse classification codes from part XML content.
 
@@ -19,18 +27,11 @@ def parse_additional_classification_code_part(
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
     # Get all classification code elements
-    code_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
-        namespaces=namespaces,
+    code_elements = XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM(
+        root
     )
 
     if code_elements:
@@ -72,7 +73,7 @@ def merge_additional_classification_code_part(
     items = tender.setdefault("items", [])
 
     new_item = additional_classification_data["tender"]["items"][0]
-    existing_item = next((item for item in items if item["id"] == new_item["id"]), None)
+    existing_item = find_by_id(items, new_item["id"])
 
     if existing_item:
         existing_classifications = existing_item.setdefault(
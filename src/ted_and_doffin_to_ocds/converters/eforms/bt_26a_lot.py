@@ -3,12 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_classification_type(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_26a_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM = register_xpath(
+    "bt_26a_lot.XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM",
+    "cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
+)
+
+
+def parse_classification_type(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse classification schemes from lot XML content.
 
     Args:
@@ -19,27 +27,18 @@ def parse_classification_type(xml_content: str | bytes) -> dict[str, Any] | None
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
     # Process each lot
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+        lot_id = XPATH_ID(lot)[0]
 
         # Get all classification elements
-        classifications = lot.xpath(
-            "cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode",
-            namespaces=namespaces,
+        classifications = (
+            XPATH_PROCUREMENT_PROJECT_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM(lot)
         )
 
         if classifications:
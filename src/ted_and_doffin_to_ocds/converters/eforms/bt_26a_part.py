@@ -1,12 +1,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_classification_type_part(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM_CLASSIFICATION_CODE = register_xpath(
+    "bt_26a_part.XPATH_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM_CLASSIFICATION_CODE",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode/@listName",
+)
+
+
+def parse_classification_type_part(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse classification schemes for part from XML content.
 
     Args:
@@ -17,20 +25,13 @@ def parse_classification_type_part(xml_content: str | bytes) -> dict[str, Any] |
                                  or None if no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"items": []}}
 
     # Simplify to handle only schemes
-    classification_types = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:AdditionalCommodityClassification/cbc:ItemClassificationCode/@listName",
-        namespaces=namespaces,
+    classification_types = (
+        XPATH_ADDITIONAL_COMMODITY_CLASSIFICATION_ITEM_CLASSIFICATION_CODE(root)
     )
 
     if classification_types:
@@ -70,9 +71,7 @@ def merge_classification_type_part(
     existing_items = tender.setdefault("items", [])
 
     for new_item in classification_type_data["tender"]["items"]:
-        existing_item = next(
-            (item for item in existing_items if item["id"] == new_item["id"]), None
-        )
+        existing_item = find_by_id(existing_items, new_item["id"])
 
         if existing_item:
             existing_classifications = existing_item.setdefault(
@@ -2,10 +2,17 @@
 
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
+XPATH_ID = register_xpath("bt_26m_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS = register_xpath(
+    "bt_26m_lot.XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS",
+    "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
+)
 
-def parse_main_classification_type_lot(xml_content: str | bytes) -> dict[str, Any]:
+
+def parse_main_classification_type_lot(xml_content: XMLContent) -> dict[str, Any]:
     """Parse the classification type (e.g. CPV) from procurement project lots in XML content.
 
     Args:
@@ -28,30 +35,16 @@ def parse_main_classification_type_lot(xml_content: str | bytes) -> dict[str, An
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        classification = lot.xpath(
-            "cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        classification = (
+            XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS(lot)
         )
 
         if classification:
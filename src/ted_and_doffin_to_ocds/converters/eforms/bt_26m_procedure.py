@@ -2,11 +2,18 @@
 
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS = register_xpath(
+    "bt_26m_procedure.XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS",
+    "//cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
+)
 
 
 def parse_main_classification_type_procedure(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any]:
     """Parse the classification type (e.g. CPV) from procurement project in XML content.
 
@@ -29,23 +36,12 @@ def parse_main_classification_type_procedure(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"items": []}}
 
-    classifications = root.xpath(
-        "//cac:ProcurementProject/cac:MainCommodityClassification/cbc:ItemClassificationCode",
-        namespaces=namespaces,
+    classifications = (
+        XPATH_PROCUREMENT_PROJECT_MAIN_COMMODITY_CLASSIFICATION_ITEM_CLASS(root)
     )
 
     if classifications:
@@ -73,10 +69,7 @@ def merge_main_classification_type_procedure(
     existing_items = release_json.setdefault("tender", {}).setdefault("items", [])
 
     for new_item in classification_type_data["tender"]["items"]:
-        existing_item = next(
-            (item for item in existing_items if item["id"] == new_item["id"]),
-            None,
-        )
+        existing_item = find_by_id(existing_items, new_item["id"])
 
         if existing_item:
             existing_item["classification"] = new_item["classification"]
@@ -2,12 +2,23 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bt_271_lot(xml_content: str | bytes) -> dict | None:
+XPATH_ID_LOT = register_xpath(
+    "bt_271_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT = register_xpath(
+    "bt_271_lot.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
+)
+
+
+def parse_bt_271_lot(xml_content: XMLContent) -> dict | None:
     """Parse framework maximum value from lot-level XML data.
 
     Args:
@@ -35,33 +46,16 @@ def parse_bt_271_lot(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath(
-            "cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
-        amount_element = lot.xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
-            namespaces=namespaces,
+        lot_id = XPATH_ID_LOT(lot)
+        amount_element = (
+            XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT(lot)
         )
 
         if lot_id and amount_element:
@@ -100,10 +94,7 @@ def merge_bt_271_lot(release_json: dict, bt_271_lot_data: dict | None) -> None:
 
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
     for new_lot in bt_271_lot_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("techniques", {}).setdefault(
                 "frameworkAgreement", {}
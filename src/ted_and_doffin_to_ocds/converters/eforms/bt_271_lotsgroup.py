@@ -1,11 +1,20 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bt_271_lots_group(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_271_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT = register_xpath(
+    "bt_271_lotsgroup.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
+)
+
+
+def parse_bt_271_lots_group(xml_content: XMLContent) -> dict | None:
     """Parse framework maximum value from lot group-level XML data.
 
     Args:
@@ -33,33 +42,16 @@ def parse_bt_271_lots_group(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lot_groups = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lot_groups = document.procurement_project_lots("LotsGroup")
 
     for lot_group in lot_groups:
-        group_id = lot_group.xpath(
-            "cbc:ID/text()",
-            namespaces=namespaces,
-        )
-        amount_element = lot_group.xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
-            namespaces=namespaces,
+        group_id = XPATH_ID(lot_group)
+        amount_element = (
+            XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT(lot_group)
         )
 
         if group_id and amount_element:
@@ -105,10 +97,7 @@ def merge_bt_271_lots_group(
     )
 
     for new_group in bt_271_lots_group_data["tender"]["lotGroups"]:
-        existing_group = next(
-            (g for g in existing_lot_groups if g["id"] == new_group["id"]),
-            None,
-        )
+        existing_group = find_by_id(existing_lot_groups, new_group["id"])
         if existing_group:
             existing_group.setdefault("techniques", {}).setdefault(
                 "frameworkAgreement", {}
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bt_271_procedure(xml_content: str | bytes) -> dict | None:
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT = register_xpath(
+    "bt_271_procedure.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT",
+    "/*/cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
+)
+
+
+def parse_bt_271_procedure(xml_content: XMLContent) -> dict | None:
     """Parse framework maximum value from procedure-level XML data.
 
     Args:
@@ -30,21 +37,10 @@ def parse_bt_271_procedure(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    amount_element = root.xpath(
-        "/*/cac:ProcurementProject/cac:RequestedTenderTotal/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:FrameworkMaximumAmount",
-        namespaces=namespaces,
+    root = get_root(xml_content)
+
+    amount_element = XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_FRAMEWORK_MAXIMUM_AMOUNT(
+        root
     )
 
     if amount_element:
@@ -1,12 +1,25 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_estimated_value(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_27_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL = register_xpath(
+    "bt_27_lot.XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount/text()",
+)
+XPATH_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL_CONTRACT_AMOUNT_CUR = register_xpath(
+    "bt_27_lot.XPATH_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL_CONTRACT_AMOUNT_CUR",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount/@currencyID",
+)
+
+
+def parse_lot_estimated_value(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the estimated value for each procurement lot from XML content.
 
     Args:
@@ -29,30 +42,19 @@ def parse_lot_estimated_value(xml_content: str | bytes) -> dict[str, Any] | None
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        estimated_value = lot.xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        estimated_value = (
+            XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL(lot)
         )
-        currency = lot.xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount/@currencyID",
-            namespaces=namespaces,
+        currency = XPATH_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL_CONTRACT_AMOUNT_CUR(
+            lot
         )
 
         if estimated_value and currency:
@@ -88,10 +90,7 @@ def merge_lot_estimated_value(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in lot_estimated_value_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["value"] = new_lot["value"]
         else:
@@ -3,12 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bt_27_lots_group(xml_content: str | bytes) -> dict[str, Any]:
+XPATH_ID = register_xpath("bt_27_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL = register_xpath(
+    "bt_27_lotsgroup.XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount",
+)
+
+
+def parse_bt_27_lots_group(xml_content: XMLContent) -> dict[str, Any]:
     """Parse the estimated value for each lot group from XML content.
 
     Args:
@@ -31,30 +40,18 @@ def parse_bt_27_lots_group(xml_content: str | bytes) -> dict[str, Any]:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lot_group_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lot_group_elements = document.procurement_project_lots("LotsGroup")
 
     for lot_group_element in lot_group_elements:
-        lot_group_id = lot_group_element.xpath("cbc:ID/text()", namespaces=namespaces)
-        amount_element = lot_group_element.xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount",
-            namespaces=namespaces,
+        lot_group_id = XPATH_ID(lot_group_element)
+        amount_element = (
+            XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL(
+                lot_group_element
+            )
         )
 
         if lot_group_id and amount_element:
@@ -93,14 +90,7 @@ def merge_bt_27_lots_group(
     )
 
     for new_lot_group in bt_27_lots_group_data["tender"]["lotGroups"]:
-        existing_lot_group = next(
-            (
-                group
-                for group in existing_lot_groups
-                if group["id"] == new_lot_group["id"]
-            ),
-            None,
-        )
+        existing_lot_group = find_by_id(existing_lot_groups, new_lot_group["id"])
         if existing_lot_group:
             existing_lot_group["maximumValue"] = new_lot_group["maximumValue"]
         else:
@@ -3,12 +3,19 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_bt_27_part(xml_content: str | bytes) -> dict[str, Any]:
+XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL = register_xpath(
+    "bt_27_part.XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL",
+    "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount",
+)
+
+
+def parse_bt_27_part(xml_content: XMLContent) -> dict[str, Any]:
     """Parse the estimated value from procurement project part XML content.
 
     Args:
@@ -26,29 +33,17 @@ def parse_bt_27_part(xml_content: str | bytes) -> dict[str, Any]:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {}}
 
-    part_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    part_elements = document.procurement_project_lots("Part")
 
     if part_elements:
-        amount_element = part_elements[0].xpath(
-            "cac:ProcurementProject/cac:RequestedTenderTotal/cbc:EstimatedOverallContractAmount",
-            namespaces=namespaces,
+        amount_element = (
+            XPATH_PROCUREMENT_PROJECT_REQUESTED_TENDER_TOTAL_ESTIMATED_OVERALL(
+                part_elements[0]
+            )
         )
 
         if amount_element:
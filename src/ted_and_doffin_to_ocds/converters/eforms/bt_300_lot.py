@@ -2,12 +2,22 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_additional_info(xml_content: str | bytes) -> dict | None:
+XPATH_PROCUREMENT_PROJECT_LOT_LOT_PROCUREMENT_PROJECT_NOTE = register_xpath(
+    "bt_300_lot.XPATH_PROCUREMENT_PROJECT_LOT_LOT_PROCUREMENT_PROJECT_NOTE",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cbc:Note",
+)
+XPATH_ID_LOT = register_xpath(
+    "bt_300_lot.XPATH_ID_LOT", "../../cbc:ID[@schemeName='Lot']/text()"
+)
+
+
+def parse_lot_additional_info(xml_content: XMLContent) -> dict | None:
     """Parse additional information from lot-level XML data.
 
     Args:
@@ -26,30 +36,14 @@ def parse_lot_additional_info(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {}
 
-    lot_notes = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cbc:Note",
-        namespaces=namespaces,
-    )
+    lot_notes = XPATH_PROCUREMENT_PROJECT_LOT_LOT_PROCUREMENT_PROJECT_NOTE(root)
 
     for note in lot_notes:
-        lot_id = note.xpath(
-            "../../cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )[0]
+        lot_id = XPATH_ID_LOT(note)[0]
         note_text = note.text
         language = note.get("languageID", "en")
 
@@ -1,11 +1,22 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lotsgroup_additional_info(xml_content: str | bytes) -> dict | None:
+XPATH_PROCUREMENT_PROJECT_LOT_LOTS_GROUP_PROCUREMENT_PROJECT_NOTE = register_xpath(
+    "bt_300_lotsgroup.XPATH_PROCUREMENT_PROJECT_LOT_LOTS_GROUP_PROCUREMENT_PROJECT_NOTE",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']/cac:ProcurementProject/cbc:Note",
+)
+XPATH_ID_LOTS_GROUP = register_xpath(
+    "bt_300_lotsgroup.XPATH_ID_LOTS_GROUP",
+    "../../cbc:ID[@schemeName='LotsGroup']/text()",
+)
+
+
+def parse_lotsgroup_additional_info(xml_content: XMLContent) -> dict | None:
     """Parse additional information from lot group-level XML data.
 
     Args:
@@ -24,30 +35,16 @@ def parse_lotsgroup_additional_info(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {}
 
-    group_notes = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']/cac:ProcurementProject/cbc:Note",
-        namespaces=namespaces,
+    group_notes = XPATH_PROCUREMENT_PROJECT_LOT_LOTS_GROUP_PROCUREMENT_PROJECT_NOTE(
+        root
     )
 
     for note in group_notes:
-        group_id = note.xpath(
-            "../../cbc:ID[@schemeName='LotsGroup']/text()",
-            namespaces=namespaces,
-        )[0]
+        group_id = XPATH_ID_LOTS_GROUP(note)[0]
         note_text = note.text
         language = note.get("languageID", "en")
 
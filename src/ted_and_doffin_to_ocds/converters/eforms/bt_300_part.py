@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_additional_info(xml_content: str | bytes) -> list[dict] | None:
+XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NOTE = register_xpath(
+    "bt_300_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NOTE",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:Note",
+)
+
+
+def parse_part_additional_info(xml_content: XMLContent) -> list[dict] | None:
     """Parse additional information from part-level XML data.
 
     Args:
@@ -24,24 +31,11 @@ def parse_part_additional_info(xml_content: str | bytes) -> list[dict] | None:
         ]
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = []
 
-    notes = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cbc:Note",
-        namespaces=namespaces,
-    )
+    notes = XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_NOTE(root)
 
     result = [
         {"text": note.text, "language": note.get("languageID", "en")} for note in notes
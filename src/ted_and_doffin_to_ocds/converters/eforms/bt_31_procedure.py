@@ -3,12 +3,19 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_max_lots_allowed(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_MAXIMUM_LOTS_SUBMITTED_NUME = register_xpath(
+    "bt_31_procedure.XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_MAXIMUM_LOTS_SUBMITTED_NUME",
+    "//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsSubmittedNumeric",
+)
+
+
+def parse_max_lots_allowed(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the maximum number of lots a supplier can bid for from XML content.
 
     Args:
@@ -25,21 +32,10 @@ def parse_max_lots_allowed(xml_content: str | bytes) -> dict[str, Any] | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    max_lots_element = root.xpath(
-        "//cac:TenderingTerms/cac:LotDistribution/cbc:MaximumLotsSubmittedNumeric",
-        namespaces=namespaces,
+    root = get_root(xml_content)
+
+    max_lots_element = (
+        XPATH_TENDERING_TERMS_LOT_DISTRIBUTION_MAXIMUM_LOTS_SUBMITTED_NUME(root)
     )
 
     if max_lots_element:
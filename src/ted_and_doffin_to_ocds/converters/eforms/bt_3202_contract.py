@@ -10,41 +10,62 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import (
+    NoticeIndex,
+    XMLContent,
+    get_document,
+)
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
-def _get_settled_contracts(notice_result, namespaces) -> list[etree._Element]:
+XPATH_SETTLED_CONTRACT = register_xpath(
+    "bt_3202_contract.XPATH_SETTLED_CONTRACT", "efac:SettledContract"
+)
+XPATH_LOT_TENDER_ID = register_xpath(
+    "bt_3202_contract.XPATH_LOT_TENDER_ID", "efac:LotTender/cbc:ID/text()"
+)
+XPATH_TENDERING_PARTY_ID = register_xpath(
+    "bt_3202_contract.XPATH_TENDERING_PARTY_ID", "efac:TenderingParty/cbc:ID/text()"
+)
+XPATH_TENDERER = register_xpath("bt_3202_contract.XPATH_TENDERER", "efac:Tenderer")
+XPATH_ID = register_xpath("bt_3202_contract.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_3202_contract.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT = register_xpath(
+    "bt_3202_contract.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult",
+)
+
+
+def _get_settled_contracts(notice_result) -> list[etree._Element]:
     """Get settled contracts from notice result."""
-    return notice_result.xpath("efac:SettledContract", namespaces=namespaces)
+    return XPATH_SETTLED_CONTRACT(notice_result)
 
 
-def _get_lot_tender_id(settled_contract, contract_id, namespaces) -> str | None:
+def _get_lot_tender_id(settled_contract, contract_id) -> str | None:
     """Get lot tender ID from settled contract."""
-    lot_tender_ids = settled_contract.xpath(
-        "efac:LotTender/cbc:ID/text()", namespaces=namespaces
-    )
+    lot_tender_ids = XPATH_LOT_TENDER_ID(settled_contract)
     if not lot_tender_ids:
         logger.warning("No LotTender ID found for contract %s", contract_id)
         return None
     return lot_tender_ids[0]
 
 
-def _get_lot_tender(notice_result, lot_tender_id, namespaces) -> etree._Element | None:
+def _get_lot_tender(index: NoticeIndex, lot_tender_id) -> etree._Element | None:
     """Get lot tender with specified ID."""
-    lot_tenders = notice_result.xpath(
-        f"efac:LotTender[cbc:ID/text()='{lot_tender_id}']", namespaces=namespaces
-    )
-    if not lot_tenders:
+    lot_tender = index.lot_tenders.get(lot_tender_id)
+    if lot_tender is None:
         logger.warning("Cannot find LotTender with ID %s", lot_tender_id)
-        return None
-    return lot_tenders[0]
+    return lot_tender
 
 
-def _get_tendering_party_id(lot_tender, lot_tender_id, namespaces) -> str | None:
+def _get_tendering_party_id(lot_tender, lot_tender_id) -> str | None:
     """Get tendering party ID from lot tender."""
-    tendering_party_ids = lot_tender.xpath(
-        "efac:TenderingParty/cbc:ID/text()", namespaces=namespaces
-    )
+    tendering_party_ids = XPATH_TENDERING_PARTY_ID(lot_tender)
     if not tendering_party_ids:
         logger.warning("No TenderingParty ID found for LotTender %s", lot_tender_id)
         return None
@@ -52,29 +73,25 @@ def _get_tendering_party_id(lot_tender, lot_tender_id, namespaces) -> str | None
 
 
 def _get_tendering_party(
-    notice_result, tendering_party_id, namespaces
+    index: NoticeIndex, tendering_party_id
 ) -> etree._Element | None:
     """Get tendering party with specified ID."""
-    tendering_parties = notice_result.xpath(
-        f"efac:TenderingParty[cbc:ID/text()='{tendering_party_id}']",
-        namespaces=namespaces,
-    )
-    if not tendering_parties:
+    tendering_party = index.tendering_parties.get(tendering_party_id)
+    if tendering_party is None:
         logger.warning("Cannot find TenderingParty with ID %s", tendering_party_id)
-        return None
-    return tendering_parties[0]
+    return tendering_party
 
 
-def _get_tenderers(tendering_party, namespaces) -> list[etree._Element]:
+def _get_tenderers(tendering_party) -> list[etree._Element]:
     """Get tenderers from tendering party."""
-    return tendering_party.xpath("efac:Tenderer", namespaces=namespaces)
+    return XPATH_TENDERER(tendering_party)
 
 
-def _collect_supplier_ids(tenderers, result, namespaces) -> list[str]:
+def _collect_supplier_ids(tenderers, result) -> list[str]:
     """Collect supplier IDs from tenderers."""
     supplier_ids = []
     for tenderer in tenderers:
-        org_ids = tenderer.xpath("cbc:ID/text()", namespaces=namespaces)
+        org_ids = XPATH_ID(tenderer)
         if not org_ids:
             continue
 
@@ -82,7 +99,7 @@ def _collect_supplier_ids(tenderers, result, namespaces) -> list[str]:
         supplier_ids.append(org_id)
 
         new_party = {"id": org_id, "roles": ["supplier"]}
-        existing_party = next((p for p in result["parties"] if p["id"] == org_id), None)
+        existing_party = find_by_id(result["parties"], org_id)
         if existing_party:
             if "supplier" not in existing_party["roles"]:
                 existing_party["roles"].append("supplier")
@@ -92,25 +109,20 @@ def _collect_supplier_ids(tenderers, result, namespaces) -> list[str]:
     return supplier_ids
 
 
-def _get_lot_results(notice_result, contract_id, namespaces) -> list[etree._Element]:
+def _get_lot_results(index: NoticeIndex, contract_id) -> list[etree._Element]:
     """Get lot results for a contract ID."""
-    return notice_result.xpath(
-        f".//efac:LotResult[efac:SettledContract/cbc:ID/text()='{contract_id}']",
-        namespaces=namespaces,
-    )
+    return index.lot_results_for_contract(contract_id)
 
 
-def _process_lot_results(lot_results, supplier_ids, result, namespaces) -> None:
+def _process_lot_results(lot_results, supplier_ids, result) -> None:
     """Process lot results to extract awards."""
     for lot_result in lot_results:
-        award_ids = lot_result.xpath("cbc:ID/text()", namespaces=namespaces)
+        award_ids = XPATH_ID(lot_result)
         if not award_ids:
             continue
         award_id = award_ids[0]
 
-        lot_ids = lot_result.xpath(
-            "efac:TenderLot/cbc:ID/text()", namespaces=namespaces
-        )
+        lot_ids = XPATH_TENDER_LOT_ID(lot_result)
         if not lot_ids:
             continue
         lot_id = lot_ids[0]
@@ -126,7 +138,7 @@ def _process_lot_results(lot_results, supplier_ids, result, namespaces) -> None:
             )
 
 
-def parse_contract_tender_id(xml_content: str | bytes) -> dict | None:
+def parse_contract_tender_id(xml_content: XMLContent) -> dict | None:
     """Parse contract and tender relationships following BT-3202.
 
     For each SettledContract:
@@ -159,72 +171,53 @@ def parse_contract_tender_id(xml_content: str | bytes) -> dict | None:
             }
         Returns None if no relevant data found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
     result = {"parties": [], "awards": [], "contracts": []}
 
-    notice_results = root.xpath(
-        "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult",
-        namespaces=namespaces,
+    notice_results = XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_NOTICE_RESULT(
+        document.root
     )
 
     if not notice_results:
         return None
 
     for notice_result in notice_results:
-        settled_contracts = _get_settled_contracts(notice_result, namespaces)
+        settled_contracts = _get_settled_contracts(notice_result)
 
         for settled_contract in settled_contracts:
             try:
-                contract_id_elements = settled_contract.xpath(
-                    "cbc:ID/text()", namespaces=namespaces
-                )
+                contract_id_elements = XPATH_ID(settled_contract)
                 if not contract_id_elements:
                     continue
                 contract_id = contract_id_elements[0]
 
-                lot_tender_id = _get_lot_tender_id(
-                    settled_contract, contract_id, namespaces
-                )
+                lot_tender_id = _get_lot_tender_id(settled_contract, contract_id)
                 if lot_tender_id is None:
                     continue
 
-                lot_tender = _get_lot_tender(notice_result, lot_tender_id, namespaces)
+                lot_tender = _get_lot_tender(document.index, lot_tender_id)
                 if lot_tender is None:
                     continue
 
-                tendering_party_id = _get_tendering_party_id(
-                    lot_tender, lot_tender_id, namespaces
-                )
+                tendering_party_id = _get_tendering_party_id(lot_tender, lot_tender_id)
                 if tendering_party_id is None:
                     continue
 
                 tendering_party = _get_tendering_party(
-                    notice_result, tendering_party_id, namespaces
+                    document.index, tendering_party_id
                 )
                 if tendering_party is None:
                     continue
 
-                tenderers = _get_tenderers(tendering_party, namespaces)
-                supplier_ids = _collect_supplier_ids(tenderers, result, namespaces)
+                tenderers = _get_tenderers(tendering_party)
+                supplier_ids = _collect_supplier_ids(tenderers, result)
 
-                lot_results = _get_lot_results(notice_result, contract_id, namespaces)
+                lot_results = _get_lot_results(document.index, contract_id)
 
                 # Add contract to result
                 result["contracts"].append(
@@ -232,7 +225,7 @@ def parse_contract_tender_id(xml_content: str | bytes) -> dict | None:
                 )
 
                 # Process lot results to extract awards
-                _process_lot_results(lot_results, supplier_ids, result, namespaces)
+                _process_lot_results(lot_results, supplier_ids, result)
 
             except (IndexError, AttributeError) as e:
                 logger.warning("Skipping incomplete contract data: %s", e)
@@ -260,7 +253,7 @@ def merge_contract_tender_id(release_json: dict, contract_tender_id_data: dict)
     existing_parties = {party["id"]: party for party in release_json.get("parties", [])}
     for new_party in contract_tender_id_data["parties"]:
         if new_party["id"] in existing_parties:
-            existing_parties[new_party["id"]]["roles"] = list(
+            existing_parties[new_party["id"]]["roles"] = sorted(
                 set(
                     existing_parties[new_party["id"]].get("roles", [])
                     + new_party["roles"]
@@ -283,7 +276,7 @@ def merge_contract_tender_id(release_json: dict, contract_tender_id_data: dict)
                     + new_award["suppliers"]
                 }.values()
             )
-            existing_award["relatedLots"] = list(
+            existing_award["relatedLots"] = sorted(
                 set(existing_award.get("relatedLots", []) + new_award["relatedLots"])
             )
         else:
@@ -297,7 +290,7 @@ def merge_contract_tender_id(release_json: dict, contract_tender_id_data: dict)
     for new_contract in contract_tender_id_data["contracts"]:
         if new_contract["id"] in existing_contracts:
             # Update related bids
-            existing_contracts[new_contract["id"]]["relatedBids"] = list(
+            existing_contracts[new_contract["id"]]["relatedBids"] = sorted(
                 set(
                     existing_contracts[new_contract["id"]].get("relatedBids", [])
                     + new_contract["relatedBids"]
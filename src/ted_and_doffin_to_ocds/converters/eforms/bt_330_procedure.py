@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_group_identifier(xml_content: str | bytes) -> dict | None:
+XPATH_LOT_DISTRIBUTION_LOTS_GROUP_LOTS_GROUP_ID_LOTS_GROUP = register_xpath(
+    "bt_330_procedure.XPATH_LOT_DISTRIBUTION_LOTS_GROUP_LOTS_GROUP_ID_LOTS_GROUP",
+    "/*/cac:TenderingTerms/cac:LotDistribution/cac:LotsGroup/cbc:LotsGroupID[@schemeName='LotsGroup']/text()",
+)
+
+
+def parse_group_identifier(xml_content: XMLContent) -> dict | None:
     """Parse lot group identifiers from XML data.
 
     Args:
@@ -27,22 +34,9 @@ def parse_group_identifier(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    group_ids = root.xpath(
-        "/*/cac:TenderingTerms/cac:LotDistribution/cac:LotsGroup/cbc:LotsGroupID[@schemeName='LotsGroup']/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    group_ids = XPATH_LOT_DISTRIBUTION_LOTS_GROUP_LOTS_GROUP_ID_LOTS_GROUP(root)
 
     if group_ids:
         return {"tender": {"lotGroups": [{"id": group_id} for group_id in group_ids]}}
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_max_lots_awarded(xml_content: str | bytes) -> dict | None:
+XPATH_LOT_DISTRIBUTION_MAXIMUM_LOTS_AWARDED_NUMERIC = register_xpath(
+    "bt_33_procedure.XPATH_LOT_DISTRIBUTION_MAXIMUM_LOTS_AWARDED_NUMERIC",
+    "//cac:LotDistribution/cbc:MaximumLotsAwardedNumeric/text()",
+)
+
+
+def parse_max_lots_awarded(xml_content: XMLContent) -> dict | None:
     """Parse the maximum number of lots that can be awarded to one tenderer from XML content.
 
     Args:
@@ -18,22 +25,9 @@ def parse_max_lots_awarded(xml_content: str | bytes) -> dict | None:
                     or None if the information is not found or invalid.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    max_lots_awarded = root.xpath(
-        "//cac:LotDistribution/cbc:MaximumLotsAwardedNumeric/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    max_lots_awarded = XPATH_LOT_DISTRIBUTION_MAXIMUM_LOTS_AWARDED_NUMERIC(root)
 
     if max_lots_awarded:
         try:
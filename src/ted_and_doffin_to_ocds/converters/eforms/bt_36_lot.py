@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_duration(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_36_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE = register_xpath(
+    "bt_36_lot.XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE",
+    "cac:ProcurementProject/cac:PlannedPeriod/cbc:DurationMeasure",
+)
+
+
+def parse_lot_duration(xml_content: XMLContent) -> dict | None:
     """Parse the duration period for each lot from XML content.
 
     Args:
@@ -18,30 +27,16 @@ def parse_lot_duration(xml_content: str | bytes) -> dict | None:
                     or None if no valid durations are found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        duration_measure = lot.xpath(
-            "cac:ProcurementProject/cac:PlannedPeriod/cbc:DurationMeasure",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        duration_measure = XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE(
+            lot
         )
 
         if duration_measure:
@@ -84,10 +79,7 @@ def merge_lot_duration(release_json: dict, lot_duration_data: dict | None) -> No
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_duration_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractPeriod", {}).update(
                 new_lot["contractPeriod"],
@@ -3,21 +3,19 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
+XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE = register_xpath(
+    "bt_36_part.XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:PlannedPeriod/cbc:DurationMeasure",
+)
 
-def parse_part_duration(xml_content: str | bytes) -> dict[str, Any] | None:
+
+def parse_part_duration(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the contract duration from XML content.
 
     Args:
@@ -27,14 +25,8 @@ def parse_part_duration(xml_content: str | bytes) -> dict[str, Any] | None:
         Dictionary containing tender contract period duration or None if not found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    duration_measures = root.xpath(
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:PlannedPeriod/cbc:DurationMeasure",
-        namespaces=NAMESPACES,
-    )
+    root = get_root(xml_content)
+    duration_measures = XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_DURATION_MEASURE(root)
 
     if not duration_measures:
         logger.debug("No duration measure found in XML")
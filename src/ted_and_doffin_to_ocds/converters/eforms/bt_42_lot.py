@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_jury_decision_binding(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_42_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_AWARDING_TERMS_BINDING_ON_BUYER_INDICATOR = register_xpath(
+    "bt_42_lot.XPATH_TENDERING_TERMS_AWARDING_TERMS_BINDING_ON_BUYER_INDICATOR",
+    "./cac:TenderingTerms/cac:AwardingTerms/cbc:BindingOnBuyerIndicator/text()",
+)
+
+
+def parse_lot_jury_decision_binding(xml_content: XMLContent) -> dict | None:
     """Parse lot jury decision binding information from XML content.
 
     Extracts information about lots where the jury's decision is binding on the buyer.
@@ -21,30 +30,16 @@ def parse_lot_jury_decision_binding(xml_content: str | bytes) -> dict | None:
         None if no relevant data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        binding_on_buyer_indicator = lot.xpath(
-            "./cac:TenderingTerms/cac:AwardingTerms/cbc:BindingOnBuyerIndicator/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        binding_on_buyer_indicator = (
+            XPATH_TENDERING_TERMS_AWARDING_TERMS_BINDING_ON_BUYER_INDICATOR(lot)
         )
 
         if (
@@ -79,10 +74,7 @@ def merge_lot_jury_decision_binding(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_jury_decision_binding_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("designContest", {}).update(
                 new_lot["designContest"],
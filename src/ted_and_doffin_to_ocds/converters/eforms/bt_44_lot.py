@@ -2,12 +2,22 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_prize_rank(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_44_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE = register_xpath(
+    "bt_44_lot.XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE",
+    ".//cac:TenderingTerms/cac:AwardingTerms/cac:Prize",
+)
+XPATH_RANK_CODE = register_xpath("bt_44_lot.XPATH_RANK_CODE", "cbc:RankCode/text()")
+
+
+def parse_prize_rank(xml_content: XMLContent) -> dict | None:
     """Parse prize rank information from XML content.
 
     Extracts information about prizes and their ranks in design contests.
@@ -21,37 +31,22 @@ def parse_prize_rank(xml_content: str | bytes) -> dict | None:
         None if no relevant data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        prizes = lot.xpath(
-            ".//cac:TenderingTerms/cac:AwardingTerms/cac:Prize", namespaces=namespaces
-        )
+        lot_id = XPATH_ID(lot)[0]
+        prizes = XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE(lot)
 
         if prizes:
             lot_data = {"id": lot_id, "designContest": {"prizes": {"details": []}}}
             prize_list = []
 
             for prize in prizes:
-                rank_code = prize.xpath("cbc:RankCode/text()", namespaces=namespaces)
+                rank_code = XPATH_RANK_CODE(prize)
                 prize_data = {"id": ""}  # ID will be set after sorting
                 if rank_code:
                     prize_data["rank"] = int(rank_code[0])
@@ -95,10 +90,7 @@ def merge_prize_rank(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in prize_rank_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("designContest", {}).setdefault("prizes", {})[
                 "details"
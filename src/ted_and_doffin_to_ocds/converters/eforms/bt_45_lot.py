@@ -2,12 +2,24 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_rewards_other(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_45_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE = register_xpath(
+    "bt_45_lot.XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE",
+    ".//cac:TenderingTerms/cac:AwardingTerms/cac:Prize",
+)
+XPATH_DESCRIPTION = register_xpath(
+    "bt_45_lot.XPATH_DESCRIPTION", "cbc:Description/text()"
+)
+
+
+def parse_lot_rewards_other(xml_content: XMLContent) -> dict | None:
     """Parse lot rewards and prize descriptions from XML content.
 
     Extracts information about prizes and their descriptions for each lot.
@@ -21,36 +33,20 @@ def parse_lot_rewards_other(xml_content: str | bytes) -> dict | None:
         None if no relevant data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        prizes = lot.xpath(
-            ".//cac:TenderingTerms/cac:AwardingTerms/cac:Prize",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        prizes = XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE(lot)
 
         lot_data = {"id": lot_id, "designContest": {"prizes": {"details": []}}}
 
         for idx, prize in enumerate(prizes):
-            description = prize.xpath("cbc:Description/text()", namespaces=namespaces)
+            description = XPATH_DESCRIPTION(prize)
             if description:
                 prize_data = {"id": str(idx), "description": description[0]}
                 lot_data["designContest"]["prizes"]["details"].append(prize_data)
@@ -83,10 +79,7 @@ def merge_lot_rewards_other(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_rewards_other_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_prizes = (
                 existing_lot.setdefault("designContest", {})
@@ -94,14 +87,7 @@ def merge_lot_rewards_other(
                 .setdefault("details", [])
             )
             for new_prize in new_lot["designContest"]["prizes"]["details"]:
-                existing_prize = next(
-                    (
-                        prize
-                        for prize in existing_prizes
-                        if prize["id"] == new_prize["id"]
-                    ),
-                    None,
-                )
+                existing_prize = find_by_id(existing_prizes, new_prize["id"])
                 if existing_prize:
                     existing_prize.update(new_prize)
                 else:
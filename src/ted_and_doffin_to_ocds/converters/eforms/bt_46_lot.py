@@ -2,12 +2,25 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_jury_member_name(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_46_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_AWARDING_TERMS_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME = register_xpath(
+    "bt_46_lot.XPATH_AWARDING_TERMS_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME",
+    ".//cac:TenderingTerms/cac:AwardingTerms/cac:TechnicalCommitteePerson/cbc:FamilyName/text()",
+)
+XPATH_LOT_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME = register_xpath(
+    "bt_46_lot.XPATH_LOT_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cac:AwardingTerms/cac:TechnicalCommitteePerson/cbc:FamilyName",
+)
+
+
+def parse_jury_member_name(xml_content: XMLContent) -> dict | None:
     """Parse jury member names from XML content.
 
     Extracts names of jury members for each lot in a design contest.
@@ -21,36 +34,22 @@ def parse_jury_member_name(xml_content: str | bytes) -> dict | None:
         None if no relevant data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']//cac:TenderingTerms/cac:AwardingTerms/cac:TechnicalCommitteePerson/cbc:FamilyName"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME(root):
         logger.info("No jury member data found. Skipping parse_jury_member_name.")
         return None
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        jury_members = lot_element.xpath(
-            ".//cac:TenderingTerms/cac:AwardingTerms/cac:TechnicalCommitteePerson/cbc:FamilyName/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot_element)[0]
+        jury_members = XPATH_AWARDING_TERMS_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME(
+            lot_element
         )
 
         if jury_members:
@@ -86,10 +85,7 @@ def merge_jury_member_name(
     tender_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in jury_member_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_design_contest = existing_lot.setdefault("designContest", {})
             existing_jury_members = existing_design_contest.setdefault(
@@ -1,11 +1,24 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_participant_name(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_47_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PRE_SELECTED_PARTY_PARTY_NAME_NAME = register_xpath(
+    "bt_47_lot.XPATH_PRE_SELECTED_PARTY_PARTY_NAME_NAME",
+    ".//cac:TenderingTerms/cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name/text()",
+)
+XPATH_LOT_PRE_SELECTED_PARTY_NAME = register_xpath(
+    "bt_47_lot.XPATH_LOT_PRE_SELECTED_PARTY_NAME",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name",
+)
+
+
+def parse_participant_name(xml_content: XMLContent) -> dict | None:
     """Parse participant names from XML content for design contest lots.
 
     This function extracts participant names from ProcurementProjectLot elements in the XML
@@ -30,38 +43,22 @@ def parse_participant_name(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_PRE_SELECTED_PARTY_NAME(root):
         logger.info("No participant name data found. Skipping parse_participant_name.")
         return None
 
     result = {"parties": [], "tender": {"lots": []}}
     party_id_counter = 1
 
-    lot_elements = root.xpath(
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot", top_level=True)
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        participant_names = lot_element.xpath(
-            ".//cac:TenderingTerms/cac:EconomicOperatorShortList/cac:PreSelectedParty/cac:PartyName/cbc:Name/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot_element)[0]
+        participant_names = XPATH_PRE_SELECTED_PARTY_PARTY_NAME_NAME(lot_element)
 
         if participant_names:
             lot = {"id": lot_id, "designContest": {"selectedParticipants": []}}
@@ -105,22 +102,16 @@ def merge_participant_name(release_json: dict, participant_data: dict | None) ->
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_party in participant_data["parties"]:
-        existing_party = next(
-            (party for party in existing_parties if party["id"] == new_party["id"]),
-            None,
-        )
+        existing_party = find_by_id(existing_parties, new_party["id"])
         if existing_party:
-            existing_party["roles"] = list(
+            existing_party["roles"] = sorted(
                 set(existing_party.get("roles", []) + new_party["roles"]),
             )
         else:
             existing_parties.append(new_party)
 
     for new_lot in participant_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_design_contest = existing_lot.setdefault("designContest", {})
             existing_selected_participants = existing_design_contest.setdefault(
@@ -3,48 +3,39 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_5010_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_EFORMS_EXTENSION_FUNDING_FINANCING_IDENTIFIER = register_xpath(
+    "bt_5010_lot.XPATH_EFORMS_EXTENSION_FUNDING_FINANCING_IDENTIFIER",
+    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:Funding/efbc:FinancingIdentifier/text()",
+)
 
 
 def parse_eu_funds_financing_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse EU Funds Financing Identifier (BT-5010) from XML content."""
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
 
         result = {"parties": [], "planning": {"budget": {"finance": []}}}
 
         # Get all lots with financing identifiers using exact XPath
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         found_financing = False
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
+            lot_id = XPATH_ID(lot)[0]
 
             # Get financing identifiers using exact BT-5010 path
-            financing_ids = lot.xpath(
-                "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                "efext:EformsExtension/efac:Funding/efbc:FinancingIdentifier/text()",
-                namespaces=NAMESPACES,
-            )
+            financing_ids = XPATH_EFORMS_EXTENSION_FUNDING_FINANCING_IDENTIFIER(lot)
 
             for financing_id in financing_ids:
                 found_financing = True
@@ -102,9 +93,7 @@ def merge_eu_funds_financing_identifier(
     existing_finance = budget.setdefault("finance", [])
 
     for new_finance in eu_funds_data["planning"]["budget"]["finance"]:
-        existing_item = next(
-            (item for item in existing_finance if item["id"] == new_finance["id"]), None
-        )
+        existing_item = find_by_id(existing_finance, new_finance["id"])
 
         if existing_item:
             # Update existing finance entry
@@ -115,7 +104,7 @@ def merge_eu_funds_financing_identifier(
             # Merge relatedLots arrays
             existing_lots = existing_item.get("relatedLots", [])
             existing_lots.extend(new_finance["relatedLots"])
-            existing_item["relatedLots"] = list(set(existing_lots))
+            existing_item["relatedLots"] = sorted(set(existing_lots))
         else:
             # Add new finance entry with proper party reference
             new_finance["financingParty"]["id"] = eu_party["id"]
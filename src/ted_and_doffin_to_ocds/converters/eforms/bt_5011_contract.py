@@ -3,50 +3,45 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_5011_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/"
+    "efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_5011_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_FUNDING_FINANCING_IDENTIFIER = register_xpath(
+    "bt_5011_contract.XPATH_FUNDING_FINANCING_IDENTIFIER",
+    "efac:Funding/efbc:FinancingIdentifier/text()",
+)
 
 
 def parse_contract_eu_funds_financing_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse contract EU funds financing identifier (BT-5011) from XML content."""
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"parties": [], "contracts": []}
 
         # Get settled contracts using exact BT-5011 path
-        settled_contracts = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/"
-            "efac:NoticeResult/efac:SettledContract",
-            namespaces=NAMESPACES,
-        )
+        settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
         found_financing = False
         for contract in settled_contracts:
             try:
-                contract_id = contract.xpath(
-                    "cbc:ID[@schemeName='contract']/text()", namespaces=NAMESPACES
-                )[0]
+                contract_id = XPATH_ID_CONTRACT(contract)[0]
 
                 # Using exact XPath from BT-5011 definition
-                funding_elements = contract.xpath(
-                    "efac:Funding/efbc:FinancingIdentifier/text()",
-                    namespaces=NAMESPACES,
-                )
+                funding_elements = XPATH_FUNDING_FINANCING_IDENTIFIER(contract)
 
                 contract_finance = []
                 for financing_id in funding_elements:
@@ -110,16 +105,12 @@ def merge_contract_eu_funds_financing_identifier(
     existing_contracts = release_json.setdefault("contracts", [])
 
     for new_contract in eu_funds_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]), None
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
 
         if existing_contract:
             existing_finance = existing_contract.setdefault("finance", [])
             for new_finance in new_contract["finance"]:
-                existing_item = next(
-                    (f for f in existing_finance if f["id"] == new_finance["id"]), None
-                )
+                existing_item = find_by_id(existing_finance, new_finance["id"])
                 if existing_item:
                     # Update existing finance item with proper EU party reference
                     existing_item["financingParty"] = {
@@ -3,49 +3,41 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_LOT_LOT = register_xpath(
+    "bt_5071_lot.XPATH_PROCUREMENT_PROJECT_LOT_LOT",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+)
+XPATH_ID = register_xpath("bt_5071_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE = register_xpath(
+    "bt_5071_lot.XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
+)
+
+
 def parse_place_performance_country_subdivision(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse place performance country subdivision (BT-5071) from XML content."""
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"items": []}}
 
         # Get all lots using exact BT-5071 path
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces={
-                "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-                "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            },
-        )
+        lots = XPATH_PROCUREMENT_PROJECT_LOT_LOT(root)
 
         found_regions = False
         for lot in lots:
             try:
-                lot_id = lot.xpath(
-                    "cbc:ID/text()",
-                    namespaces={
-                        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-                    },
-                )[0]
+                lot_id = XPATH_ID(lot)[0]
 
                 # Get regions using exact path from specification
-                regions = lot.xpath(
-                    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
-                    namespaces={
-                        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-                        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-                    },
-                )
+                regions = XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE(lot)
 
                 if regions:
                     found_regions = True
@@ -2,13 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE = register_xpath(
+    "bt_5071_part.XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
+)
+
+
 def parse_place_performance_country_subdivision_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse country subdivision codes (NUTS3) from Part procurement projects.
     Maps to region in tender.deliveryAddresses objects.
@@ -21,24 +28,13 @@ def parse_place_performance_country_subdivision_part(
         None: If no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     addresses = []
-    parts = root.xpath(
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']", namespaces=namespaces
-    )
+    parts = document.procurement_project_lots("Part", top_level=True)
 
     for part in parts:
-        subdivisions = part.xpath(
-            "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
-            namespaces=namespaces,
-        )
+        subdivisions = XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE(part)
         addresses.extend(
             {"region": code.strip()} for code in subdivisions if code.strip()
         )
@@ -2,13 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE = register_xpath(
+    "bt_5071_procedure.XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE",
+    "/*/cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
+)
+
+
 def parse_place_performance_country_subdivision_procedure(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse country subdivision codes (NUTS3) from procurement project.
     Maps to region in tender.deliveryAddresses objects.
@@ -21,18 +28,9 @@ def parse_place_performance_country_subdivision_procedure(
         None: If no valid data is found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
-
-    subdivisions = root.xpath(
-        "/*/cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CountrySubentityCode/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    subdivisions = XPATH_REALIZED_LOCATION_ADDRESS_COUNTRY_SUBENTITY_CODE(root)
 
     addresses = [{"region": code.strip()} for code in subdivisions if code.strip()]
 
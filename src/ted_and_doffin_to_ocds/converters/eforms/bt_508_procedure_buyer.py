@@ -4,19 +4,26 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_CONTRACTING_PARTY = register_xpath(
+    "bt_508_procedure_buyer.XPATH_CONTRACTING_PARTY", "//cac:ContractingParty"
+)
+XPATH_BUYER_PROFILE_URI = register_xpath(
+    "bt_508_procedure_buyer.XPATH_BUYER_PROFILE_URI", "cbc:BuyerProfileURI/text()"
+)
+XPATH_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "bt_508_procedure_buyer.XPATH_PARTY_PARTY_IDENTIFICATION_ID",
+    "cac:Party/cac:PartyIdentification/cbc:ID/text()",
+)
 
 
-def parse_buyer_profile_url(xml_content: str | bytes) -> dict | None:
+def parse_buyer_profile_url(xml_content: XMLContent) -> dict | None:
     """Parse the buyer profile URL from contracting party information.
 
     Args:
@@ -39,14 +46,9 @@ def parse_buyer_profile_url(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
-        contracting_parties = root.xpath(
-            "//cac:ContractingParty", namespaces=NAMESPACES
-        )
+        contracting_parties = XPATH_CONTRACTING_PARTY(root)
         if not contracting_parties:
             logger.debug("No contracting parties found")
             return None
@@ -54,12 +56,8 @@ def parse_buyer_profile_url(xml_content: str | bytes) -> dict | None:
         result = {"parties": []}
 
         for party in contracting_parties:
-            buyer_profile = party.xpath(
-                "cbc:BuyerProfileURI/text()", namespaces=NAMESPACES
-            )
-            party_id = party.xpath(
-                "cac:Party/cac:PartyIdentification/cbc:ID/text()", namespaces=NAMESPACES
-            )
+            buyer_profile = XPATH_BUYER_PROFILE_URI(party)
+            party_id = XPATH_PARTY_PARTY_IDENTIFICATION_ID(party)
 
             if buyer_profile and party_id:
                 result["parties"].append(
@@ -112,9 +110,7 @@ def merge_buyer_profile_url(
 
     for new_party in buyer_profile_data["parties"]:
         # Find existing party by ID
-        existing_party = next(
-            (p for p in existing_parties if p["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(existing_parties, new_party["id"])
 
         if existing_party:
             # Update existing party
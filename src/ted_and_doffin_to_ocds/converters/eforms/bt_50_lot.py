@@ -2,12 +2,25 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_minimum_candidates(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_50_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_ECONOMIC_OPERATOR_SHORT_LIST_MINIMUM_QUANT = register_xpath(
+    "bt_50_lot.XPATH_TENDERING_PROCESS_ECONOMIC_OPERATOR_SHORT_LIST_MINIMUM_QUANT",
+    "./cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:MinimumQuantity/text()",
+)
+XPATH_LOT_MINIMUM_QUANTITY = register_xpath(
+    "bt_50_lot.XPATH_LOT_MINIMUM_QUANTITY",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:MinimumQuantity",
+)
+
+
+def parse_minimum_candidates(xml_content: XMLContent) -> dict | None:
     """Parse minimum number of candidates from XML content for lots.
 
     This function extracts the minimum number of candidates to be invited for the second stage
@@ -31,21 +44,11 @@ def parse_minimum_candidates(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists (only in TenderingProcess path)
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:MinimumQuantity"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_MINIMUM_QUANTITY(root):
         logger.info(
             "No minimum candidates data found. Skipping parse_minimum_candidates."
         )
@@ -53,17 +56,15 @@ def parse_minimum_candidates(xml_content: str | bytes) -> dict | None:
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+        lot_id = XPATH_ID(lot_element)[0]
         # Only use TenderingProcess path
-        minimum_quantity = lot_element.xpath(
-            "./cac:TenderingProcess/cac:EconomicOperatorShortList/cbc:MinimumQuantity/text()",
-            namespaces=namespaces,
+        minimum_quantity = (
+            XPATH_TENDERING_PROCESS_ECONOMIC_OPERATOR_SHORT_LIST_MINIMUM_QUANT(
+                lot_element
+            )
         )
 
         if minimum_quantity:
@@ -99,10 +100,7 @@ def merge_minimum_candidates(
     tender_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in minimum_candidates_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("secondStage", {}).update(new_lot["secondStage"])
         else:
@@ -1,60 +1,59 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION = register_xpath(
+    "bt_5101a_part.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION",
+    "cac:ProcurementProject/cac:RealizedLocation",
+)
+XPATH_ADDRESS_STREET_NAME = register_xpath(
+    "bt_5101a_part.XPATH_ADDRESS_STREET_NAME", "cac:Address/cbc:StreetName/text()"
+)
+XPATH_ADDRESS_ADDITIONAL_STREET_NAME = register_xpath(
+    "bt_5101a_part.XPATH_ADDRESS_ADDITIONAL_STREET_NAME",
+    "cac:Address/cbc:AdditionalStreetName/text()",
+)
+XPATH_ADDRESS_ADDRESS_LINE_LINE = register_xpath(
+    "bt_5101a_part.XPATH_ADDRESS_ADDRESS_LINE_LINE",
+    "cac:Address/cac:AddressLine/cbc:Line/text()",
+)
 
 
 def parse_part_place_performance_street(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse part place performance street (BT-5101(a)-Part) from XML content."""
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
         # Get all parts using exact BT-5101 path
-        parts = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=NAMESPACES,
-        )
+        parts = document.procurement_project_lots("Part", top_level=True)
 
         found_addresses = False
         for part in parts:
-            realized_locations = part.xpath(
-                "cac:ProcurementProject/cac:RealizedLocation", namespaces=NAMESPACES
-            )
+            realized_locations = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION(part)
 
             for location in realized_locations:
                 address_parts = []
 
                 # Get street name
-                street_name = location.xpath(
-                    "cac:Address/cbc:StreetName/text()", namespaces=NAMESPACES
-                )
+                street_name = XPATH_ADDRESS_STREET_NAME(location)
                 if street_name:
                     address_parts.append(street_name[0])
 
                 # Get additional street name
-                additional_street = location.xpath(
-                    "cac:Address/cbc:AdditionalStreetName/text()", namespaces=NAMESPACES
-                )
+                additional_street = XPATH_ADDRESS_ADDITIONAL_STREET_NAME(location)
                 if additional_street:
                     address_parts.append(additional_street[0])
 
                 # Get address lines
-                address_lines = location.xpath(
-                    "cac:Address/cac:AddressLine/cbc:Line/text()", namespaces=NAMESPACES
-                )
+                address_lines = XPATH_ADDRESS_ADDRESS_LINE_LINE(location)
                 address_parts.extend(address_lines)
 
                 if address_parts:
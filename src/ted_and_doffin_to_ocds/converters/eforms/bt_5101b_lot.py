@@ -3,41 +3,44 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("bt_5101b_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_ADDRESS = register_xpath(
+    "bt_5101b_lot.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_ADDRESS",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address",
+)
+XPATH_STREET_NAME = register_xpath(
+    "bt_5101b_lot.XPATH_STREET_NAME", "cbc:StreetName/text()"
+)
+XPATH_ADDITIONAL_STREET_NAME = register_xpath(
+    "bt_5101b_lot.XPATH_ADDITIONAL_STREET_NAME", "cbc:AdditionalStreetName/text()"
+)
+XPATH_ADDRESS_LINE_LINE = register_xpath(
+    "bt_5101b_lot.XPATH_ADDRESS_LINE_LINE", "cac:AddressLine/cbc:Line/text()"
+)
 
 
 def parse_lot_place_performance_streetline1(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse lot place performance streetline (BT-5101(b)) from XML content."""
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"items": []}}
 
         # Get all lots using exact BT-5101(b) path
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         found_addresses = False
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-                addresses = lot.xpath(
-                    "cac:ProcurementProject/cac:RealizedLocation/cac:Address",
-                    namespaces=NAMESPACES,
-                )
+                lot_id = XPATH_ID(lot)[0]
+                addresses = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_ADDRESS(lot)
 
                 if addresses:
                     delivery_addresses = []
@@ -45,21 +48,15 @@ def parse_lot_place_performance_streetline1(
                         street_parts = []
 
                         # Collect address components in specified order
-                        street_name = address.xpath(
-                            "cbc:StreetName/text()", namespaces=NAMESPACES
-                        )
+                        street_name = XPATH_STREET_NAME(address)
                         if street_name:
                             street_parts.append(street_name[0])
 
-                        additional_street = address.xpath(
-                            "cbc:AdditionalStreetName/text()", namespaces=NAMESPACES
-                        )
+                        additional_street = XPATH_ADDITIONAL_STREET_NAME(address)
                         if additional_street:
                             street_parts.append(additional_street[0])
 
-                        address_lines = address.xpath(
-                            "cac:AddressLine/cbc:Line/text()", namespaces=NAMESPACES
-                        )
+                        address_lines = XPATH_ADDRESS_LINE_LINE(address)
                         street_parts.extend(address_lines)
 
                         if street_parts:
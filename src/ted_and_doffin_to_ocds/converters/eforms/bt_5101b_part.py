@@ -2,11 +2,27 @@
 
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION = register_xpath(
+    "bt_5101b_part.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION",
+    "cac:ProcurementProject/cac:RealizedLocation",
+)
+XPATH_ADDRESS = register_xpath("bt_5101b_part.XPATH_ADDRESS", "cac:Address")
+XPATH_STREET_NAME = register_xpath(
+    "bt_5101b_part.XPATH_STREET_NAME", "cbc:StreetName/text()"
+)
+XPATH_ADDITIONAL_STREET_NAME = register_xpath(
+    "bt_5101b_part.XPATH_ADDITIONAL_STREET_NAME", "cbc:AdditionalStreetName/text()"
+)
+XPATH_ADDRESS_LINE_LINE = register_xpath(
+    "bt_5101b_part.XPATH_ADDRESS_LINE_LINE", "cac:AddressLine/cbc:Line/text()"
+)
 
 
 def parse_part_place_performance_streetline1(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the street address information from XML for place of performance.
 
@@ -20,53 +36,25 @@ def parse_part_place_performance_streetline1(
         Dictionary containing tender delivery addresses or None if no addresses found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"deliveryAddresses": []}}
 
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-        namespaces=namespaces,
-    )
+    parts = document.procurement_project_lots("Part")
 
     for part in parts:
-        realized_locations = part.xpath(
-            "cac:ProcurementProject/cac:RealizedLocation",
-            namespaces=namespaces,
-        )
+        realized_locations = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION(part)
 
         for location in realized_locations:
-            address = location.xpath("cac:Address", namespaces=namespaces)[0]
-            street_name = address.xpath("cbc:StreetName/text()", namespaces=namespaces)
-            additional_street_name = address.xpath(
-                "cbc:AdditionalStreetName/text()",
-                namespaces=namespaces,
-            )
-            address_lines = address.xpath(
-                "cac:AddressLine/cbc:Line/text()",
-                namespaces=namespaces,
-            )
+            address = XPATH_ADDRESS(location)[0]
+            street_name = XPATH_STREET_NAME(address)
+            additional_street_name = XPATH_ADDITIONAL_STREET_NAME(address)
+            address_lines = XPATH_ADDRESS_LINE_LINE(address)
 
             street_address_parts = []
-            street_name = address.xpath("cbc:StreetName/text()", namespaces=namespaces)
-            additional_street_name = address.xpath(
-                "cbc:AdditionalStreetName/text()",
-                namespaces=namespaces,
-            )
-            address_lines = address.xpath(
-                "cac:AddressLine/cbc:Line/text()",
-                namespaces=namespaces,
-            )
+            street_name = XPATH_STREET_NAME(address)
+            additional_street_name = XPATH_ADDITIONAL_STREET_NAME(address)
+            address_lines = XPATH_ADDRESS_LINE_LINE(address)
 
             # Ensure correct order and handle empty components
             if street_name:
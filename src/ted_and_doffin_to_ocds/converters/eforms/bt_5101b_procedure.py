@@ -3,13 +3,30 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION = register_xpath(
+    "bt_5101b_procedure.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION",
+    "//cac:ProcurementProject/cac:RealizedLocation",
+)
+XPATH_ADDRESS = register_xpath("bt_5101b_procedure.XPATH_ADDRESS", "cac:Address")
+XPATH_STREET_NAME = register_xpath(
+    "bt_5101b_procedure.XPATH_STREET_NAME", "cbc:StreetName/text()"
+)
+XPATH_ADDITIONAL_STREET_NAME = register_xpath(
+    "bt_5101b_procedure.XPATH_ADDITIONAL_STREET_NAME", "cbc:AdditionalStreetName/text()"
+)
+XPATH_ADDRESS_LINE_LINE = register_xpath(
+    "bt_5101b_procedure.XPATH_ADDRESS_LINE_LINE", "cac:AddressLine/cbc:Line/text()"
+)
+
+
 def parse_procedure_place_performance_streetline1(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse BT-5101(b) street address information for place of performance.
 
@@ -22,23 +39,14 @@ def parse_procedure_place_performance_streetline1(
     Returns:
         Dictionary with tender delivery addresses or None if no valid addresses
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"deliveryAddresses": []}}
 
-    realized_locations = root.xpath(
-        "//cac:ProcurementProject/cac:RealizedLocation", namespaces=namespaces
-    )
+    realized_locations = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION(root)
 
     for location in realized_locations:
-        address_elements = location.xpath("cac:Address", namespaces=namespaces)
+        address_elements = XPATH_ADDRESS(location)
         if not address_elements:
             logger.warning(
                 "No Address element found in RealizedLocation for BT-5101(b)"
@@ -50,19 +58,15 @@ def parse_procedure_place_performance_streetline1(
         # Get all address components in required order
         components = []
 
-        street_name = address.xpath("cbc:StreetName/text()", namespaces=namespaces)
+        street_name = XPATH_STREET_NAME(address)
         if street_name:
             components.append(street_name[0].strip())
 
-        additional_street = address.xpath(
-            "cbc:AdditionalStreetName/text()", namespaces=namespaces
-        )
+        additional_street = XPATH_ADDITIONAL_STREET_NAME(address)
         if additional_street:
             components.append(additional_street[0].strip())
 
-        address_lines = address.xpath(
-            "cac:AddressLine/cbc:Line/text()", namespaces=namespaces
-        )
+        address_lines = XPATH_ADDRESS_LINE_LINE(address)
         components.extend(line.strip() for line in address_lines if line.strip())
 
         if components:  # Only create address if we have components
@@ -3,13 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_5121_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE = register_xpath(
+    "bt_5121_lot.XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
+)
+
+
 def parse_place_performance_post_code(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse place performance postal code (BT-5121) from XML content.
 
@@ -23,31 +31,15 @@ def parse_place_performance_post_code(
         Dictionary containing tender items with delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        postal_zones = lot.xpath(
-            "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        postal_zones = XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE(lot)
 
         if postal_zones:
             item = {
@@ -3,18 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE = register_xpath(
+    "bt_5121_part.XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
+)
 
 
 def parse_place_performance_post_code_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse place performance postal code (BT-5121) from XML content.
 
@@ -28,25 +30,16 @@ def parse_place_performance_post_code_part(
         Dictionary containing tender delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        parts = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=NAMESPACES,
-        )
+        parts = document.procurement_project_lots("Part")
 
         found_postal_codes = False
         for part in parts:
             try:
-                postal_zones = part.xpath(
-                    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
-                    namespaces=NAMESPACES,
-                )
+                postal_zones = XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE(part)
 
                 for postal_zone in postal_zones:
                     if postal_zone.strip():
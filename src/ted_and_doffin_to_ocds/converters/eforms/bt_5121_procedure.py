@@ -1,18 +1,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE = register_xpath(
+    "bt_5121_procedure.XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE",
+    "//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
+)
 
 
 def parse_place_performance_post_code_procedure(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse place performance postal code (BT-5121) from XML content.
 
@@ -26,17 +28,11 @@ def parse_place_performance_post_code_procedure(
         Dictionary containing tender delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        postal_zones = root.xpath(
-            "//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:PostalZone/text()",
-            namespaces=NAMESPACES,
-        )
+        postal_zones = XPATH_REALIZED_LOCATION_ADDRESS_POSTAL_ZONE(root)
 
         for postal_zone in postal_zones:
             if postal_zone.strip():
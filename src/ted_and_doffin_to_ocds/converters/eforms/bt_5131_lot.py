@@ -1,17 +1,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
+XPATH_ID = register_xpath("bt_5131_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME = register_xpath(
+    "bt_5131_lot.XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME",
+    "./cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CityName/text()",
+)
 
-def parse_place_performance_city(xml_content: str | bytes) -> dict[str, Any] | None:
+
+def parse_place_performance_city(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse place performance city (BT-5131) from XML content.
 
     Gets city information for each lot's delivery address. Creates/updates
@@ -24,25 +28,16 @@ def parse_place_performance_city(xml_content: str | bytes) -> dict[str, Any] | N
         Dictionary containing tender items with delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"items": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-                cities = lot.xpath(
-                    "./cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:CityName/text()",
-                    namespaces=NAMESPACES,
-                )
+                lot_id = XPATH_ID(lot)[0]
+                cities = XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME(lot)
 
                 if cities:
                     filtered_cities = [city.strip() for city in cities if city.strip()]
@@ -125,13 +120,8 @@ def merge_place_performance_city(
 
     for new_item in place_performance_city_data["tender"]["items"]:
         try:
-            existing_item = next(
-                (
-                    item
-                    for item in release_json["tender"]["items"]
-                    if item.get("id") == new_item.get("id")
-                ),
-                None,
+            existing_item = find_by_id(
+                release_json["tender"]["items"], new_item.get("id")
             )
 
             if existing_item:
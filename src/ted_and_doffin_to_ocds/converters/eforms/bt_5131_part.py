@@ -1,18 +1,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME = register_xpath(
+    "bt_5131_part.XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME",
+    ".//cac:RealizedLocation/cac:Address/cbc:CityName/text()",
+)
 
 
 def parse_place_performance_city_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse place performance city (BT-5131) from XML content.
 
@@ -26,25 +28,16 @@ def parse_place_performance_city_part(
         Dictionary containing tender delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        parts = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=NAMESPACES,
-        )
+        parts = document.procurement_project_lots("Part")
 
         found_cities = False
         for part in parts:
             try:
-                cities = part.xpath(
-                    ".//cac:RealizedLocation/cac:Address/cbc:CityName/text()",
-                    namespaces=NAMESPACES,
-                )
+                cities = XPATH_REALIZED_LOCATION_ADDRESS_CITY_NAME(part)
 
                 for city in cities:
                     if city.strip():
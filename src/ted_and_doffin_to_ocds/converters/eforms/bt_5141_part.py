@@ -3,73 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.code_lists import COUNTRY_CODES
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-# ISO 3166-1 alpha-3 to alpha-2 conversion dictionary for European countries
-ISO_3166_CONVERSION = {
-    "ALB": "AL",
-    "AND": "AD",
-    "AUT": "AT",
-    "BLR": "BY",
-    "BEL": "BE",
-    "BIH": "BA",
-    "BGR": "BG",
-    "HRV": "HR",
-    "CYP": "CY",
-    "CZE": "CZ",
-    "DNK": "DK",
-    "EST": "EE",
-    "FIN": "FI",
-    "FRA": "FR",
-    "DEU": "DE",
-    "GRC": "GR",
-    "HUN": "HU",
-    "ISL": "IS",
-    "IRL": "IE",
-    "ITA": "IT",
-    "KAZ": "KZ",
-    "XKX": "XK",
-    "LVA": "LV",
-    "LIE": "LI",
-    "LTU": "LT",
-    "LUX": "LU",
-    "MLT": "MT",
-    "MDA": "MD",
-    "MCO": "MC",
-    "MNE": "ME",
-    "NLD": "NL",
-    "MKD": "MK",
-    "NOR": "NO",
-    "POL": "PL",
-    "PRT": "PT",
-    "ROU": "RO",
-    "RUS": "RU",
-    "SMR": "SM",
-    "SRB": "RS",
-    "SVK": "SK",
-    "SVN": "SI",
-    "ESP": "ES",
-    "SWE": "SE",
-    "CHE": "CH",
-    "TUR": "TR",
-    "UKR": "UA",
-    "GBR": "GB",
-    "VAT": "VA",
-}
-
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
-
-
-def parse_part_country(xml_content: str | bytes) -> dict[str, Any] | None:
+
+XPATH_ADDRESS_COUNTRY_IDENTIFICATION_CODE = register_xpath(
+    "bt_5141_part.XPATH_ADDRESS_COUNTRY_IDENTIFICATION_CODE",
+    ".//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cac:Country/cbc:IdentificationCode/text()",
+)
+
+
+def parse_part_country(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse place performance country code (BT-5141) from XML content.
 
     Gets country code information for each part's delivery address. Creates/updates
@@ -83,24 +30,15 @@ def parse_part_country(xml_content: str | bytes) -> dict[str, Any] | None:
         Dictionary containing tender with delivery addresses or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        parts = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=NAMESPACES,
-        )
+        parts = document.procurement_project_lots("Part")
 
         for part in parts:
             try:
-                country_codes = part.xpath(
-                    ".//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cac:Country/cbc:IdentificationCode/text()",
-                    namespaces=NAMESPACES,
-                )
+                country_codes = XPATH_ADDRESS_COUNTRY_IDENTIFICATION_CODE(part)
 
                 for code in country_codes:
                     if code.strip():
@@ -134,7 +72,7 @@ def convert_country_code(code: str) -> str:
         Corresponding alpha-2 code or original code if not found in conversion table
 
     """
-    converted = ISO_3166_CONVERSION.get(code.upper())
+    converted = COUNTRY_CODES.get(code.upper())
     if not converted:
         logger.warning("No conversion found for country code: %s", code)
         return code
@@ -2,12 +2,25 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_successive_reduction_indicator(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_52_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR = register_xpath(
+    "bt_52_lot.XPATH_TENDERING_PROCESS_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR",
+    "./cac:TenderingProcess/cbc:CandidateReductionConstraintIndicator/text()",
+)
+XPATH_LOT_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR = register_xpath(
+    "bt_52_lot.XPATH_LOT_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess/cbc:CandidateReductionConstraintIndicator",
+)
+
+
+def parse_successive_reduction_indicator(xml_content: XMLContent) -> dict | None:
     """Parse successive reduction indicator from XML content for lots.
 
     This function extracts the indicator of whether the procedure will take place in
@@ -31,21 +44,11 @@ def parse_successive_reduction_indicator(xml_content: str | bytes) -> dict | Non
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess/cbc:CandidateReductionConstraintIndicator"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR(root):
         logger.info(
             "No successive reduction indicator data found. Skipping parse_successive_reduction_indicator."
         )
@@ -53,16 +56,14 @@ def parse_successive_reduction_indicator(xml_content: str | bytes) -> dict | Non
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        reduction_indicator = lot_element.xpath(
-            "./cac:TenderingProcess/cbc:CandidateReductionConstraintIndicator/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot_element)[0]
+        reduction_indicator = (
+            XPATH_TENDERING_PROCESS_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR(
+                lot_element
+            )
         )
 
         if reduction_indicator:
@@ -100,10 +101,7 @@ def merge_successive_reduction_indicator(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in successive_reduction_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("secondStage", {}).update(new_lot["secondStage"])
         else:
@@ -3,13 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_CONTRACT_NAT = register_xpath(
+    "bt_531_part.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_CONTRACT_NAT",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='contract-nature']/cbc:ProcurementTypeCode/text()",
+)
+
+
 def parse_part_additional_nature(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the additional nature (BT-531) for procurement project parts from XML content.
 
@@ -26,27 +33,16 @@ def parse_part_additional_nature(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"additionalProcurementCategories": []}}
 
-    additional_natures = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='contract-nature']/cbc:ProcurementTypeCode/text()",
-        namespaces=namespaces,
+    additional_natures = (
+        XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_CONTRACT_NAT(root)
     )
 
     if additional_natures:
-        result["tender"]["additionalProcurementCategories"] = list(
+        result["tender"]["additionalProcurementCategories"] = sorted(
             set(additional_natures),
         )  # Remove duplicates
 
@@ -76,7 +72,7 @@ def merge_part_additional_nature(
         part_additional_nature_data["tender"]["additionalProcurementCategories"],
     )
 
-    combined_categories = list(existing_categories.union(new_categories))
+    combined_categories = sorted(existing_categories.union(new_categories))
     tender["additionalProcurementCategories"] = combined_categories
 
     logger.info(
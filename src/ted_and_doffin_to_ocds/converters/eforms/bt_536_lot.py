@@ -1,14 +1,22 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_start_date(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("bt_536_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_START_DATE = register_xpath(
+    "bt_536_lot.XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_START_DATE",
+    "cac:ProcurementProject/cac:PlannedPeriod/cbc:StartDate/text()",
+)
+
+
+def parse_lot_start_date(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the start date (BT-536) for procurement project lots from XML content.
 
     Args:
@@ -32,32 +40,16 @@ def parse_lot_start_date(xml_content: str | bytes) -> dict[str, Any] | None:
 
     """
     logger.info("Starting parse_lot_start_date function")
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
     logger.info("Found %d lots", len(lots))
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        date_to_start = lot.xpath(
-            "cac:ProcurementProject/cac:PlannedPeriod/cbc:StartDate/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        date_to_start = XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_START_DATE(lot)
 
         logger.info("Processing lot %s", lot_id)
 
@@ -99,10 +91,7 @@ def merge_lot_start_date(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in lot_start_date_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractPeriod", {}).update(
                 new_lot["contractPeriod"],
@@ -3,15 +3,23 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_537_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_END_DATE = register_xpath(
+    "bt_537_lot.XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_END_DATE",
+    "cac:ProcurementProject/cac:PlannedPeriod/cbc:EndDate/text()",
+)
+
+
 def parse_lot_duration_end_date(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the end date (BT-537) for procurement project lots from XML content.
 
@@ -35,31 +43,15 @@ def parse_lot_duration_end_date(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        date_to_end = lot_element.xpath(
-            "cac:ProcurementProject/cac:PlannedPeriod/cbc:EndDate/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot_element)[0]
+        date_to_end = XPATH_PROCUREMENT_PROJECT_PLANNED_PERIOD_END_DATE(lot_element)
 
         if date_to_end:
             try:
@@ -91,10 +83,7 @@ def merge_lot_duration_end_date(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in lot_duration_end_date_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractPeriod", {}).update(
                 new_lot["contractPeriod"],
@@ -1,129 +0,0 @@
-# converters/bt_540_Lot.py
-
-import logging
-from typing import Any
-
-from lxml import etree
-
-logger = logging.getLogger(__name__)
-
-
-def parse_award_criterion_description(
-    xml_content: str | bytes,
-) -> dict[str, Any] | None:
-    """Parse the award criterion description (BT-540) for procurement project lots from XML content.
-
-    Args:
-        xml_content: XML string or bytes containing the procurement data
-
-    Returns:
-        Dict containing the parsed award criterion description data in OCDS format, or None if no data found.
-        Format:
-        {
-            "tender": {
-                "lots": [
-                    {
-                        "id": "LOT-0001",
-                        "awardCriteria": {
-                            "criteria": [
-                                {
-                                    "description": "Tenders with a quality score less than 65..."
-                                }
-                            ]
-                        }
-                    }
-                ]
-            }
-        }
-
-    """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    result = {"tender": {"lots": []}}
-
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
-
-    for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-
-        criteria = lot.xpath(
-            ".//cac:TenderingTerms/cac:AwardingTerms/cac:AwardingCriterion/cac:SubordinateAwardingCriterion/cbc:Description/text()",
-            namespaces=namespaces,
-        )
-
-        if criteria:
-            lot_data = {
-                "id": lot_id,
-                "awardCriteria": {
-                    "criteria": [{"description": criterion} for criterion in criteria],
-                },
-            }
-            result["tender"]["lots"].append(lot_data)
-
-    return result if result["tender"]["lots"] else None
-
-
-def merge_award_criterion_description(
-    release_json: dict[str, Any],
-    award_criterion_description_data: dict[str, Any] | None,
-) -> None:
-    """Merge award criterion description data into the main release JSON.
-
-    Args:
-        release_json: The main release JSON to merge data into
-        award_criterion_description_data: The award criterion description data to merge from
-
-    Returns:
-        None - modifies release_json in place
-
-    """
-    if not award_criterion_description_data:
-        logger.warning("No Award Criterion Description data to merge")
-        return
-
-    tender = release_json.setdefault("tender", {})
-    existing_lots = tender.setdefault("lots", [])
-
-    for new_lot in award_criterion_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
-        if existing_lot:
-            existing_criteria = existing_lot.setdefault("awardCriteria", {}).setdefault(
-                "criteria",
-                [],
-            )
-            for new_criterion in new_lot["awardCriteria"]["criteria"]:
-                existing_criterion = next(
-                    (
-                        c
-                        for c in existing_criteria
-                        if c.get("description") == new_criterion["description"]
-                    ),
-                    None,
-                )
-                if existing_criterion:
-                    existing_criterion.update(new_criterion)
-                else:
-                    existing_criteria.append(new_criterion)
-        else:
-            existing_lots.append(new_lot)
-
-    logger.info(
-        "Merged Award Criterion Description data for %d lots",
-        len(award_criterion_description_data["tender"]["lots"]),
-    )
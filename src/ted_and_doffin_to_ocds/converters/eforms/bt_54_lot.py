@@ -2,12 +2,25 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_options_description(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_54_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_OPTIONS_DESCRIPTION = register_xpath(
+    "bt_54_lot.XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_OPTIONS_DESCRIPTION",
+    "./cac:ProcurementProject/cac:ContractExtension/cbc:OptionsDescription/text()",
+)
+XPATH_LOT_OPTIONS_DESCRIPTION = register_xpath(
+    "bt_54_lot.XPATH_LOT_OPTIONS_DESCRIPTION",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:ContractExtension/cbc:OptionsDescription",
+)
+
+
+def parse_options_description(xml_content: XMLContent) -> dict | None:
     """Parse options description from XML content for lots.
 
     This function extracts the options description from ProcurementProjectLot elements in the XML.
@@ -30,21 +43,11 @@ def parse_options_description(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:ContractExtension/cbc:OptionsDescription"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_OPTIONS_DESCRIPTION(root):
         logger.info(
             "No options description data found. Skipping parse_options_description."
         )
@@ -52,16 +55,12 @@ def parse_options_description(xml_content: str | bytes) -> dict | None:
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        description = lot_element.xpath(
-            "./cac:ProcurementProject/cac:ContractExtension/cbc:OptionsDescription/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot_element)[0]
+        description = XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_OPTIONS_DESCRIPTION(
+            lot_element
         )
 
         if description:
@@ -98,10 +97,7 @@ def merge_options_description(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in options_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("options", {}).update(new_lot["options"])
         else:
@@ -3,13 +3,32 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_TENDER = register_xpath(
+    "bt_553_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT = register_xpath(
+    "bt_553_tender.XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT",
+    "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermAmount/text()",
+)
+XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_553_tender.XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT_CURRENCY_ID",
+    "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermAmount/@currencyID",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_553_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_subcontracting_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the subcontracting value (BT-553) for procurement project tenders from XML content.
 
@@ -39,42 +58,21 @@ def parse_subcontracting_value(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"bids": {"details": []}}
 
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        subcontracting_amount = XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT(
+            lot_tender
         )
-        subcontracting_amount = lot_tender.xpath(
-            "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_tender.xpath(
-            "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermAmount/@currencyID",
-            namespaces=namespaces,
-        )
-        related_lot = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        currency = XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_AMOUNT_CURRENCY_ID(
+            lot_tender
         )
+        related_lot = XPATH_TENDER_LOT_ID_LOT(lot_tender)
 
         if tender_id and subcontracting_amount and currency:
             bid_data = {
@@ -113,10 +111,7 @@ def merge_subcontracting_value(
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
 
     for new_bid in subcontracting_data["bids"]["details"]:
-        existing_bid = next(
-            (bid for bid in existing_bids if bid["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid.setdefault("subcontracting", {}).update(
                 new_bid["subcontracting"],
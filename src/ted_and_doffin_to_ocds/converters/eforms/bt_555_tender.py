@@ -3,13 +3,28 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_TENDER = register_xpath(
+    "bt_555_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_PERCENT = register_xpath(
+    "bt_555_tender.XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_PERCENT",
+    "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermPercent/text()",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_555_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_subcontracting_percentage(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the subcontracting percentage (BT-555) for procurement project tenders from XML content.
 
@@ -37,38 +52,18 @@ def parse_subcontracting_percentage(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"bids": {"details": []}}
 
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        subcontracting_percentage = lot_tender.xpath(
-            "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermPercent/text()",
-            namespaces=namespaces,
-        )
-        related_lots = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        subcontracting_percentage = (
+            XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_PERCENT(lot_tender)
         )
+        related_lots = XPATH_TENDER_LOT_ID_LOT(lot_tender)
 
         if tender_id and subcontracting_percentage:
             percentage = float(subcontracting_percentage[0]) / 100
@@ -78,7 +73,7 @@ def parse_subcontracting_percentage(
                     "minimumPercentage": percentage,
                     "maximumPercentage": percentage,
                 },
-                "relatedLots": list(
+                "relatedLots": sorted(
                     set(related_lots),
                 ),  # Use a set to ensure unique lot IDs
             }
@@ -108,15 +103,12 @@ def merge_subcontracting_percentage(
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
 
     for new_bid in subcontracting_data["bids"]["details"]:
-        existing_bid = next(
-            (bid for bid in existing_bids if bid["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid.setdefault("subcontracting", {}).update(
                 new_bid["subcontracting"],
             )
-            existing_bid["relatedLots"] = list(
+            existing_bid["relatedLots"] = sorted(
                 set(
                     existing_bid.get("relatedLots", [])
                     + new_bid.get("relatedLots", []),
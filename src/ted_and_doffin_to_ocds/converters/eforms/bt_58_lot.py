@@ -2,12 +2,25 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_renewal_maximum(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_58_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERI = register_xpath(
+    "bt_58_lot.XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERI",
+    "./cac:ProcurementProject/cac:ContractExtension/cbc:MaximumNumberNumeric/text()",
+)
+XPATH_LOT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERIC = register_xpath(
+    "bt_58_lot.XPATH_LOT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERIC",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:ContractExtension/cbc:MaximumNumberNumeric",
+)
+
+
+def parse_renewal_maximum(xml_content: XMLContent) -> dict | None:
     """Parse maximum number of renewals from XML content for lots.
 
     This function extracts the maximum number of times the contract can be renewed from
@@ -31,36 +44,24 @@ def parse_renewal_maximum(xml_content: str | bytes) -> dict | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:ProcurementProject/cac:ContractExtension/cbc:MaximumNumberNumeric"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERIC(root):
         logger.info("No renewal maximum data found. Skipping parse_renewal_maximum.")
         return None
 
     result = {"tender": {"lots": []}}
 
-    lot_elements = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lot_elements = document.procurement_project_lots("Lot")
 
     for lot_element in lot_elements:
-        lot_id = lot_element.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        max_renewals = lot_element.xpath(
-            "./cac:ProcurementProject/cac:ContractExtension/cbc:MaximumNumberNumeric/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot_element)[0]
+        max_renewals = (
+            XPATH_PROCUREMENT_PROJECT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERI(
+                lot_element
+            )
         )
 
         if max_renewals:
@@ -94,10 +95,7 @@ def merge_renewal_maximum(release_json: dict, renewal_data: dict | None) -> None
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in renewal_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("renewal", {}).update(new_lot["renewal"])
         else:
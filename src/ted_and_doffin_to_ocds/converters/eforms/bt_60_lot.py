@@ -1,14 +1,36 @@
 # converters/bt_60_Lot.py
 
 import logging
-import uuid
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.identifiers import new_id
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_eu_funds(xml_content: str | bytes) -> dict | None:
+XPATH_PROCUREMENT_PROJECT_LOT = register_xpath(
+    "bt_60_lot.XPATH_PROCUREMENT_PROJECT_LOT", "ancestor::cac:ProcurementProjectLot[1]"
+)
+XPATH_ID_LOT = register_xpath(
+    "bt_60_lot.XPATH_ID_LOT", "cbc:ID[@schemeName='Lot']/text()"
+)
+XPATH_TENDERING_TERMS_FUNDING_PROGRAM = register_xpath(
+    "bt_60_lot.XPATH_TENDERING_TERMS_FUNDING_PROGRAM",
+    "cac:TenderingTerms/cbc:FundingProgram/text()",
+)
+XPATH_FUNDING_FUNDING_PROJECT_IDENTIFIER = register_xpath(
+    "bt_60_lot.XPATH_FUNDING_FUNDING_PROJECT_IDENTIFIER",
+    "//efac:Funding/cbc:FundingProjectIdentifier/text()",
+)
+# The xpathAbsolute of the specification
+XPATH_LOT_FUNDING_PROGRAM_CODE_EU_FUNDED = register_xpath(
+    "bt_60_lot.XPATH_LOT_FUNDING_PROGRAM_CODE_EU_FUNDED",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cbc:FundingProgramCode[@listName='eu-funded']",
+)
+
+
+def parse_eu_funds(xml_content: XMLContent) -> dict | None:
     """Parse EU funds indicator from XML content.
 
     This function checks if the procurement is financed by EU funds by looking for
@@ -34,42 +56,23 @@ def parse_eu_funds(xml_content: str | bytes) -> dict | None:
             }]
         }
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    # Use the exact xpathAbsolute from the specification
-    xpath = "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cbc:FundingProgramCode[@listName='eu-funded']"
+    document = get_document(xml_content)
+    root = document.root
 
     lots_with_eu_funds = {}
 
-    funding_elements = root.xpath(xpath, namespaces=namespaces)
+    funding_elements = XPATH_LOT_FUNDING_PROGRAM_CODE_EU_FUNDED(root)
     for element in funding_elements:
         # Check if the element text is 'eu-funds' or 'true'
         if element.text in ("eu-funds", "true"):
             # Navigate up the tree to find the ProcurementProjectLot element
-            lot_element = element.xpath(
-                "ancestor::cac:ProcurementProjectLot[1]", namespaces=namespaces
-            )[0]
-            lot_id_elements = lot_element.xpath(
-                "cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces
-            )
+            lot_element = XPATH_PROCUREMENT_PROJECT_LOT(element)[0]
+            lot_id_elements = XPATH_ID_LOT(lot_element)
 
             if lot_id_elements:
                 lot_id = lot_id_elements[0]
 
-                funding_program = lot_element.xpath(
-                    "cac:TenderingTerms/cbc:FundingProgram/text()",
-                    namespaces=namespaces,
-                )
+                funding_program = XPATH_TENDERING_TERMS_FUNDING_PROGRAM(lot_element)
 
                 lots_with_eu_funds[lot_id] = {
                     "id": lot_id,
@@ -77,9 +80,7 @@ def parse_eu_funds(xml_content: str | bytes) -> dict | None:
                 }
 
     funding_project_id = None
-    funding_elements = root.xpath(
-        "//efac:Funding/cbc:FundingProjectIdentifier/text()", namespaces=namespaces
-    )
+    funding_elements = XPATH_FUNDING_FUNDING_PROJECT_IDENTIFIER(root)
     if funding_elements:
         funding_project_id = funding_elements[0]
 
@@ -87,7 +88,7 @@ def parse_eu_funds(xml_content: str | bytes) -> dict | None:
         logger.info("No EU funds indicator found. Skipping parse_eu_funds.")
         return None
 
-    eu_party_id = str(uuid.uuid4())
+    eu_party_id = new_id(document.notice_id, "BT-60-Lot", "parties")
     result = {
         "parties": [
             {
@@ -100,7 +101,7 @@ def parse_eu_funds(xml_content: str | bytes) -> dict | None:
     }
 
     finance_obj = {
-        "id": str(uuid.uuid4()),
+        "id": new_id(document.notice_id, "BT-60-Lot", "finance"),
         "financingParty": {"id": eu_party_id, "name": "European Union"},
         "relatedLots": list(lots_with_eu_funds.keys()),
     }
@@ -139,7 +140,7 @@ def merge_eu_funds(release_json: dict, eu_funds_data: dict | None) -> None:
 
     if eu_party:
         if "funder" not in eu_party.get("roles", []):
-            eu_party["roles"] = list({*eu_party.get("roles", []), "funder"})
+            eu_party["roles"] = [*eu_party.get("roles", []), "funder"]
     else:
         parties.append(eu_funds_data["parties"][0])
         eu_party = eu_funds_data["parties"][0]
@@ -3,7 +3,9 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -34,8 +36,18 @@ AUTHORITY_TABLE = {
 }
 
 
+XPATH_CONTRACTING_PARTY_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_EN = register_xpath(
+    "bt_610_procedure_buyer.XPATH_CONTRACTING_PARTY_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_EN",
+    "/*/cac:ContractingParty/cac:ContractingActivity/cbc:ActivityTypeCode[@listName='entity-activity']",
+)
+XPATH_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "bt_610_procedure_buyer.XPATH_PARTY_PARTY_IDENTIFICATION_ID",
+    "cac:Party/cac:PartyIdentification/cbc:ID/text()",
+)
+
+
 def parse_activity_entity(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the main activity (BT-610) for contracting entities from XML content.
 
@@ -66,24 +78,13 @@ def parse_activity_entity(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"parties": []}
 
     # Using the exact XPath from the specification
-    activity_elements = root.xpath(
-        "/*/cac:ContractingParty/cac:ContractingActivity/cbc:ActivityTypeCode[@listName='entity-activity']",
-        namespaces=namespaces,
+    activity_elements = (
+        XPATH_CONTRACTING_PARTY_CONTRACTING_ACTIVITY_ACTIVITY_TYPE_CODE_EN(root)
     )
 
     for activity_element in activity_elements:
@@ -91,10 +92,7 @@ def parse_activity_entity(
         party_element = activity_element.getparent().getparent()
 
         # Extract the buyer ID
-        buyer_id = party_element.xpath(
-            "cac:Party/cac:PartyIdentification/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        buyer_id = XPATH_PARTY_PARTY_IDENTIFICATION_ID(party_element)
 
         if buyer_id:
             buyer_id = buyer_id[0]
@@ -152,10 +150,7 @@ def merge_activity_entity(
     existing_parties = release_json.setdefault("parties", [])
 
     for new_party in activity_data["parties"]:
-        existing_party = next(
-            (party for party in existing_parties if party["id"] == new_party["id"]),
-            None,
-        )
+        existing_party = find_by_id(existing_parties, new_party["id"])
         if existing_party:
             # Get or create the classifications list
             existing_classifications = existing_party.setdefault(
@@ -3,21 +3,34 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
-
-def parse_contract_eu_funds_details(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_6110_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_6110_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_FUNDING_FUNDING_PROGRAM = register_xpath(
+    "bt_6110_contract.XPATH_FUNDING_FUNDING_PROGRAM",
+    "efac:Funding/cbc:FundingProgram/text()",
+)
+XPATH_FUNDING_DESCRIPTION = register_xpath(
+    "bt_6110_contract.XPATH_FUNDING_DESCRIPTION", "efac:Funding/cbc:Description/text()"
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_6110_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
+def parse_contract_eu_funds_details(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the XML content to extract contract EU funds details (BT-6110).
 
     Gets funding information from each contract. Creates/updates corresponding Finance
@@ -30,35 +43,20 @@ def parse_contract_eu_funds_details(xml_content: str | bytes) -> dict[str, Any]
         Dictionary containing contracts with funding details or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
         result = {"contracts": []}
 
-        settled_contracts = root.xpath(
-            "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-            namespaces=NAMESPACES,
-        )
+        settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
         for contract in settled_contracts:
             try:
-                contract_id = contract.xpath(
-                    "cbc:ID[@schemeName='contract']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
-
-                funding_programs = contract.xpath(
-                    "efac:Funding/cbc:FundingProgram/text()",
-                    namespaces=NAMESPACES,
-                )
+                contract_id = XPATH_ID_CONTRACT(contract)[0]
 
-                funding_descriptions = contract.xpath(
-                    "efac:Funding/cbc:Description/text()",
-                    namespaces=NAMESPACES,
-                )
+                funding_programs = XPATH_FUNDING_FUNDING_PROGRAM(contract)
+
+                funding_descriptions = XPATH_FUNDING_DESCRIPTION(contract)
 
                 # Combine both funding programs and descriptions
                 all_funding_details = list(funding_programs) + list(
@@ -73,12 +71,13 @@ def parse_contract_eu_funds_details(xml_content: str | bytes) -> dict[str, Any]
                         ],
                     }
 
-                    award_id = root.xpath(
-                        f"//efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID"
-                        f"[@schemeName='contract']/text()='{contract_id}']/"
-                        "cbc:ID[@schemeName='result']/text()",
-                        namespaces=NAMESPACES,
-                    )
+                    award_id = [
+                        result_id
+                        for lot_result in document.index.lot_results_for_contract(
+                            contract_id
+                        )
+                        for result_id in XPATH_ID_RESULT(lot_result)
+                    ]
                     if award_id:
                         contract_data["awardID"] = award_id[0]
 
@@ -121,14 +120,7 @@ def merge_contract_eu_funds_details(
     existing_contracts = release_json.setdefault("contracts", [])
 
     for new_contract in eu_funds_details["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in existing_contracts
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_contract.setdefault("finance", []).extend(new_contract["finance"])
             if "awardID" in new_contract:
@@ -5,19 +5,20 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_EFORMS_EXTENSION_FUNDING_DESCRIPTION = register_xpath(
+    "bt_6140_lot.XPATH_EFORMS_EXTENSION_FUNDING_DESCRIPTION",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:Funding/cbc:Description/text()",
+)
 
 
-def parse_lot_eu_funds_details(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_lot_eu_funds_details(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse the XML content to extract lot EU funds details.
 
     This function processes the BT-6140-Lot business term, which represents
@@ -32,19 +33,14 @@ def parse_lot_eu_funds_details(xml_content: str | bytes) -> dict[str, Any] | Non
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML")
         raise
 
     result = {"planning": {"budget": {"finance": []}}}
 
-    funding_descriptions = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:Funding/cbc:Description/text()",
-        namespaces=NAMESPACES,
-    )
+    funding_descriptions = XPATH_EFORMS_EXTENSION_FUNDING_DESCRIPTION(root)
 
     for index, description in enumerate(funding_descriptions, start=1):
         finance_data = {"id": str(index), "description": description}
@@ -78,10 +74,7 @@ def merge_lot_eu_funds_details(
     existing_finance = budget.setdefault("finance", [])
 
     for new_finance in eu_funds_details["planning"]["budget"]["finance"]:
-        existing_entry = next(
-            (entry for entry in existing_finance if entry["id"] == new_finance["id"]),
-            None,
-        )
+        existing_entry = find_by_id(existing_finance, new_finance["id"])
         if existing_entry:
             existing_entry["description"] = new_finance["description"]
         else:
@@ -3,13 +3,26 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_615_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_RESTRICT = register_xpath(
+    "bt_615_lot.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_RESTRICT",
+    "cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType/text()='restricted-document']",
+)
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "bt_615_lot.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
+
+
 def parse_documents_restricted_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the documents restricted URL (BT-615) for procurement project lots from XML content.
 
@@ -34,38 +47,21 @@ def parse_documents_restricted_url(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        documents = lot.xpath(
-            "cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType/text()='restricted-document']",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        documents = XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_RESTRICT(
+            lot
         )
 
         for document in documents:
-            doc_id = document.xpath("cbc:ID/text()", namespaces=namespaces)
-            url = document.xpath(
-                "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-                namespaces=namespaces,
-            )
+            doc_id = XPATH_ID(document)
+            url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(document)
 
             if doc_id and url:
                 doc_data = {
@@ -102,14 +98,11 @@ def merge_documents_restricted_url(
     )
 
     for new_doc in documents_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["accessDetailsURL"] = new_doc["accessDetailsURL"]
             existing_doc.setdefault("relatedLots", []).extend(new_doc["relatedLots"])
-            existing_doc["relatedLots"] = list(
+            existing_doc["relatedLots"] = sorted(
                 set(existing_doc["relatedLots"]),
             )  # Remove duplicates
         else:
@@ -3,13 +3,26 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER = register_xpath(
+    "bt_615_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType/text()='restricted-document']",
+)
+XPATH_ID = register_xpath("bt_615_part.XPATH_ID", "cbc:ID/text()")
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "bt_615_part.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
+
+
 def parse_documents_restricted_url_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the documents restricted URL (BT-615) for procurement project parts from XML content.
 
@@ -31,31 +44,15 @@ def parse_documents_restricted_url_part(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    documents = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:CallForTendersDocumentReference[cbc:DocumentType/text()='restricted-document']",
-        namespaces=namespaces,
-    )
+    documents = XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER(root)
 
     for document in documents:
-        doc_id = document.xpath("cbc:ID/text()", namespaces=namespaces)
-        url = document.xpath(
-            "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-            namespaces=namespaces,
-        )
+        doc_id = XPATH_ID(document)
+        url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(document)
 
         if doc_id and url:
             doc_data = {"id": doc_id[0], "accessDetailsURL": url[0]}
@@ -88,10 +85,7 @@ def merge_documents_restricted_url_part(
     )
 
     for new_doc in documents_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["accessDetailsURL"] = new_doc["accessDetailsURL"]
         else:
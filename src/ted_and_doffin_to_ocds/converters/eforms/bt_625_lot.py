@@ -3,7 +3,9 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -62,8 +64,15 @@ EU_MEASUREMENT_UNITS = {
 }
 
 
+XPATH_ID = register_xpath("bt_625_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT = register_xpath(
+    "bt_625_lot.XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT",
+    "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/@unitCode",
+)
+
+
 def parse_unit(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the unit (BT-625) for procurement project lots from XML content.
 
@@ -90,30 +99,16 @@ def parse_unit(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for index, lot in enumerate(lots, start=1):
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        unit_code = lot.xpath(
-            "cac:ProcurementProject/cbc:EstimatedOverallContractQuantity/@unitCode",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        unit_code = XPATH_PROCUREMENT_PROJECT_ESTIMATED_OVERALL_CONTRACT_QUANTITY_UNIT(
+            lot
         )
 
         if unit_code:
@@ -153,10 +148,7 @@ def merge_unit(
     existing_items = release_json.setdefault("tender", {}).setdefault("items", [])
 
     for new_item in unit_data["tender"]["items"]:
-        existing_item = next(
-            (item for item in existing_items if item["id"] == new_item["id"]),
-            None,
-        )
+        existing_item = find_by_id(existing_items, new_item["id"])
         if existing_item:
             existing_item["unit"] = new_item["unit"]
             existing_item["relatedLot"] = new_item["relatedLot"]
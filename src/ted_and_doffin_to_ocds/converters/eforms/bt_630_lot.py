@@ -3,15 +3,29 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import end_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_630_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_DATE = register_xpath(
+    "bt_630_lot.XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_DATE",
+    "cac:TenderingProcess/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:InterestExpressionReceptionPeriod/cbc:EndDate/text()",
+)
+XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_TIME = register_xpath(
+    "bt_630_lot.XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_TIME",
+    "cac:TenderingProcess/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:InterestExpressionReceptionPeriod/cbc:EndTime/text()",
+)
+
+
 def parse_deadline_receipt_expressions(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the deadline for receipt of expressions (BT-630) for procurement project lots from XML content.
 
@@ -35,31 +49,16 @@ def parse_deadline_receipt_expressions(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        end_date_xpath = ".//efac:InterestExpressionReceptionPeriod/cbc:EndDate/text()"
-        end_time_xpath = ".//efac:InterestExpressionReceptionPeriod/cbc:EndTime/text()"
+        lot_id = XPATH_ID(lot)[0]
 
-        end_date_value = lot.xpath(end_date_xpath, namespaces=namespaces)
-        end_time_value = lot.xpath(end_time_xpath, namespaces=namespaces)
+        end_date_value = XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_DATE(lot)
+        end_time_value = XPATH_INTEREST_EXPRESSION_RECEPTION_PERIOD_END_TIME(lot)
 
         if end_date_value:
             date_str = end_date_value[0]
@@ -104,10 +103,7 @@ def merge_deadline_receipt_expressions(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in deadline_receipt_expressions_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("tenderPeriod", {}).update(new_lot["tenderPeriod"])
         else:
@@ -3,15 +3,23 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_631_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_PARTICIPATION_INVITATION_PERIOD_START_DATE = register_xpath(
+    "bt_631_lot.XPATH_TENDERING_PROCESS_PARTICIPATION_INVITATION_PERIOD_START_DATE",
+    "cac:TenderingProcess/cac:ParticipationInvitationPeriod/cbc:StartDate",
+)
+
+
 def parse_dispatch_invitation_interest(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the dispatch invitation interest date (BT-631) for procurement project lots from XML content.
 
@@ -35,31 +43,17 @@ def parse_dispatch_invitation_interest(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+        lot_id = XPATH_ID(lot)[0]
         # Use the exact XPath as specified in the documentation
-        dispatch_date_nodes = lot.xpath(
-            "cac:TenderingProcess/cac:ParticipationInvitationPeriod/cbc:StartDate",
-            namespaces=namespaces,
+        dispatch_date_nodes = (
+            XPATH_TENDERING_PROCESS_PARTICIPATION_INVITATION_PERIOD_START_DATE(lot)
         )
 
         if dispatch_date_nodes:
@@ -107,10 +101,7 @@ def merge_dispatch_invitation_interest(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in dispatch_invitation_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("communication", {}).update(
                 new_lot["communication"],
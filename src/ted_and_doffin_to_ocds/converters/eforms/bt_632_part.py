@@ -3,13 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_ACCESS_TOOL_NAME = register_xpath(
+    "bt_632_part.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_ACCESS_TOOL_NAME",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:AccessToolName/text()",
+)
+
+
 def parse_tool_name_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the tool name (BT-632) for procurement project parts from XML content.
 
@@ -28,22 +35,9 @@ def parse_tool_name_part(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    tool_name = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efbc:AccessToolName/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    tool_name = XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_ACCESS_TOOL_NAME(root)
 
     if tool_name:
         return {"tender": {"communication": {"atypicalToolName": tool_name[0]}}}
@@ -3,13 +3,28 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_635_lotresult.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_NUME = register_xpath(
+    "bt_635_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_NUME",
+    "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']/efbc:StatisticsNumeric/text()",
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE = register_xpath(
+    "bt_635_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE",
+    "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']",
+)
+
+
 def parse_buyer_review_requests_count(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the buyer review requests count (BT-635) from XML content.
 
@@ -31,21 +46,11 @@ def parse_buyer_review_requests_count(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # XPath for BT-635: Number of buyer review requests
-    relevant_xpath = "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE(root):
         logger.info(
             "BT-635: No buyer review requests count data found in the document."
         )
@@ -53,21 +58,16 @@ def parse_buyer_review_requests_count(
 
     result = {"statistics": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_TENDER_LOT_ID(lot_result)
         if not lot_id:
             continue
 
-        appeal_requests = lot_result.xpath(
-            "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']/efbc:StatisticsNumeric/text()",
-            namespaces=namespaces,
+        appeal_requests = (
+            XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_NUME(
+                lot_result
+            )
         )
         if appeal_requests:
             statistic = {
@@ -102,10 +102,7 @@ def merge_buyer_review_requests_count(
     existing_statistics = release_json.setdefault("statistics", [])
 
     for new_statistic in buyer_review_requests_data["statistics"]:
-        existing_statistic = next(
-            (stat for stat in existing_statistics if stat["id"] == new_statistic["id"]),
-            None,
-        )
+        existing_statistic = find_by_id(existing_statistics, new_statistic["id"])
         if existing_statistic:
             existing_statistic.update(new_statistic)
         else:
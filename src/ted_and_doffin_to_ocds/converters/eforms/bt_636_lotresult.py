@@ -3,7 +3,9 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -44,8 +46,21 @@ IRREGULARITY_TYPE_MAPPING = {
 }
 
 
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_636_lotresult.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_CODE = register_xpath(
+    "bt_636_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_CODE",
+    "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']/efbc:StatisticsCode/text()",
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE = register_xpath(
+    "bt_636_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE",
+    "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']",
+)
+
+
 def parse_buyer_review_requests_irregularity_type(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the buyer review requests irregularity type (BT-636) from XML content.
 
@@ -68,21 +83,11 @@ def parse_buyer_review_requests_irregularity_type(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE(root):
         logger.info(
             "No buyer review requests irregularity type data found. Skipping parse_buyer_review_requests_irregularity_type."
         )
@@ -90,22 +95,17 @@ def parse_buyer_review_requests_irregularity_type(
 
     result = {"statistics": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_TENDER_LOT_ID(lot_result)
         if not lot_id:
             continue
 
-        irregularity_type = lot_result.xpath(
-            "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='irregularity-type']/efbc:StatisticsCode/text()",
-            namespaces=namespaces,
+        irregularity_type = (
+            XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE_STATISTICS_CODE(
+                lot_result
+            )
         )
 
         if irregularity_type:
@@ -145,10 +145,7 @@ def merge_buyer_review_requests_irregularity_type(
     existing_statistics = release_json.setdefault("statistics", [])
 
     for new_statistic in irregularity_type_data["statistics"]:
-        existing_statistic = next(
-            (stat for stat in existing_statistics if stat["id"] == new_statistic["id"]),
-            None,
-        )
+        existing_statistic = find_by_id(existing_statistics, new_statistic["id"])
         if existing_statistic:
             existing_statistic.update(new_statistic)
         else:
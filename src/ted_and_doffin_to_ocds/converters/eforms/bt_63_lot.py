@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -15,7 +17,18 @@ VARIANT_POLICY_MAPPING = {
 }
 
 
-def parse_variants(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_63_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_VARIANT_CONSTRAINT_CODE_PERMISSION = register_xpath(
+    "bt_63_lot.XPATH_TENDERING_TERMS_VARIANT_CONSTRAINT_CODE_PERMISSION",
+    "./cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']/text()",
+)
+XPATH_LOT_VARIANT_CONSTRAINT_CODE_PERMISSION = register_xpath(
+    "bt_63_lot.XPATH_LOT_VARIANT_CONSTRAINT_CODE_PERMISSION",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']",
+)
+
+
+def parse_variants(xml_content: XMLContent) -> dict | None:
     """Parse variants policy from XML for each lot.
 
     Extracts whether tenderers are required, allowed, or not allowed to submit variant
@@ -46,36 +59,22 @@ def parse_variants(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_LOT_VARIANT_CONSTRAINT_CODE_PERMISSION(root):
         logger.info("No variants policy data found. Skipping parse_variants.")
         return None
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        variant_constraint = lot.xpath(
-            "./cac:TenderingTerms/cbc:VariantConstraintCode[@listName='permission']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        variant_constraint = XPATH_TENDERING_TERMS_VARIANT_CONSTRAINT_CODE_PERMISSION(
+            lot
         )
 
         if variant_constraint:
@@ -114,10 +113,7 @@ def merge_variants(release_json: dict, variants_data: dict | None) -> None:
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in variants_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 new_lot["submissionTerms"]
@@ -3,13 +3,29 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_644_lot_prize_value.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE = register_xpath(
+    "bt_644_lot_prize_value.XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE",
+    "cac:TenderingTerms/cac:AwardingTerms/cac:Prize",
+)
+XPATH_VALUE_AMOUNT = register_xpath(
+    "bt_644_lot_prize_value.XPATH_VALUE_AMOUNT", "cbc:ValueAmount/text()"
+)
+XPATH_VALUE_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_644_lot_prize_value.XPATH_VALUE_AMOUNT_CURRENCY_ID",
+    "cbc:ValueAmount/@currencyID",
+)
+
+
 def parse_lot_prize_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the prize value (BT-644) for procurement project lots from XML content.
 
@@ -43,44 +59,22 @@ def parse_lot_prize_value(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        prizes = lot.xpath(
-            "cac:TenderingTerms/cac:AwardingTerms/cac:Prize",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        prizes = XPATH_TENDERING_TERMS_AWARDING_TERMS_PRIZE(lot)
 
         if prizes:
             lot_data = {"id": lot_id, "designContest": {"prizes": {"details": []}}}
 
             for i, prize in enumerate(prizes):
-                value_amount = prize.xpath(
-                    "cbc:ValueAmount/text()",
-                    namespaces=namespaces,
-                )
-                currency = prize.xpath(
-                    "cbc:ValueAmount/@currencyID",
-                    namespaces=namespaces,
-                )
+                value_amount = XPATH_VALUE_AMOUNT(prize)
+                currency = XPATH_VALUE_AMOUNT_CURRENCY_ID(prize)
 
                 if value_amount and currency:
                     prize_data = {
@@ -119,20 +113,14 @@ def merge_lot_prize_value(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in lot_prize_value_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             design_contest = existing_lot.setdefault("designContest", {})
             prizes = design_contest.setdefault("prizes", {})
             details = prizes.setdefault("details", [])
 
             for new_prize in new_lot["designContest"]["prizes"]["details"]:
-                existing_prize = next(
-                    (prize for prize in details if prize["id"] == new_prize["id"]),
-                    None,
-                )
+                existing_prize = find_by_id(details, new_prize["id"])
                 if existing_prize:
                     existing_prize.update(new_prize)
                 else:
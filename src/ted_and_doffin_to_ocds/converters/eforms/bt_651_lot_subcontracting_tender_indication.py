@@ -3,13 +3,24 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath(
+    "bt_651_lot_subcontracting_tender_indication.XPATH_ID", "cbc:ID/text()"
+)
+XPATH_EFORMS_EXTENSION_TENDER_SUBCONTRACTING_REQUIREMENTS_TENDER_S = register_xpath(
+    "bt_651_lot_subcontracting_tender_indication.XPATH_EFORMS_EXTENSION_TENDER_SUBCONTRACTING_REQUIREMENTS_TENDER_S",
+    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:TenderSubcontractingRequirements/efbc:TenderSubcontractingRequirementsCode[@listName='subcontracting-indication']/text()",
+)
+
+
 def parse_subcontracting_tender_indication(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the subcontracting tender indication (BT-651) for procurement project lots from XML content.
 
@@ -35,30 +46,16 @@ def parse_subcontracting_tender_indication(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        subcontracting_code = lot.xpath(
-            "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:TenderSubcontractingRequirements/efbc:TenderSubcontractingRequirementsCode[@listName='subcontracting-indication']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        subcontracting_code = (
+            XPATH_EFORMS_EXTENSION_TENDER_SUBCONTRACTING_REQUIREMENTS_TENDER_S(lot)
         )
 
         if subcontracting_code:
@@ -93,10 +90,7 @@ def merge_subcontracting_tender_indication(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in subcontracting_tender_indication_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             submission_terms = existing_lot.setdefault("submissionTerms", {})
             existing_clauses = submission_terms.setdefault("subcontractingClauses", [])
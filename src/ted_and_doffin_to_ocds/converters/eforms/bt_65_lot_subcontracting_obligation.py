@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,16 @@ SUBCONTRACTING_OBLIGATION_MAPPING = {
 }
 
 
-def parse_subcontracting_obligation(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath(
+    "bt_65_lot_subcontracting_obligation.XPATH_ID", "cbc:ID/text()"
+)
+XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL = register_xpath(
+    "bt_65_lot_subcontracting_obligation.XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL",
+    "cac:TenderingTerms/cac:AllowedSubcontractTerms[cbc:SubcontractingConditionsCode/@listName='subcontracting-obligation']/cbc:SubcontractingConditionsCode/text()",
+)
+
+
+def parse_subcontracting_obligation(xml_content: XMLContent) -> dict | None:
     """Parse the subcontracting obligations from XML for each lot.
 
     Extracts the subcontracting obligations that apply to the contract as defined
@@ -43,30 +54,16 @@ def parse_subcontracting_obligation(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        subcontracting_code = lot.xpath(
-            "cac:TenderingTerms/cac:AllowedSubcontractTerms[cbc:SubcontractingConditionsCode/@listName='subcontracting-obligation']/cbc:SubcontractingConditionsCode/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        subcontracting_code = (
+            XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL(lot)
         )
 
         if subcontracting_code and subcontracting_code[0] != "none":
@@ -108,10 +105,7 @@ def merge_subcontracting_obligation(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in subcontracting_obligation_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("subcontractingTerms", {}).update(
                 new_lot["subcontractingTerms"],
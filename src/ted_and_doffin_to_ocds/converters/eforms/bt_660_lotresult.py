@@ -3,13 +3,32 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_RESULT = register_xpath(
+    "bt_660_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT = register_xpath(
+    "bt_660_lotresult.XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT",
+    "efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount/text()",
+)
+XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT_CURRENCY = register_xpath(
+    "bt_660_lotresult.XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT_CURRENCY",
+    "efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount/@currencyID",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_660_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_framework_reestimated_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the framework re-estimated value (BT-660) from XML content.
 
@@ -35,42 +54,21 @@ def parse_framework_reestimated_value(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
+        award_id = XPATH_ID_RESULT(lot_result)
+        reestimated_value = XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT(
+            lot_result
         )
-        reestimated_value = lot_result.xpath(
-            "efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_result.xpath(
-            "efac:FrameworkAgreementValues/efbc:ReestimatedValueAmount/@currencyID",
-            namespaces=namespaces,
-        )
-        related_lot = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        currency = XPATH_FRAMEWORK_AGREEMENT_VALUES_REESTIMATED_VALUE_AMOUNT_CURRENCY(
+            lot_result
         )
+        related_lot = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if award_id and reestimated_value and currency:
             award_data = {
@@ -108,17 +106,14 @@ def merge_framework_reestimated_value(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in framework_reestimated_value_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award["estimatedValue"] = new_award["estimatedValue"]
             if "relatedLots" in new_award:
                 existing_award.setdefault("relatedLots", []).extend(
                     new_award["relatedLots"],
                 )
-                existing_award["relatedLots"] = list(
+                existing_award["relatedLots"] = sorted(
                     set(existing_award["relatedLots"]),
                 )  # Remove duplicates
         else:
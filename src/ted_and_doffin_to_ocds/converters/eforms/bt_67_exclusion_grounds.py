@@ -4,6 +4,9 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 EXCLUSION_GROUND_MAPPING = {
@@ -34,7 +37,20 @@ EXCLUSION_GROUND_MAPPING = {
 }
 
 
-def parse_exclusion_grounds(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_EXCLUSION_GRO = register_xpath(
+    "bt_67_exclusion_grounds.XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_EXCLUSION_GRO",
+    "//cac:TenderingTerms/cac:TendererQualificationRequest[cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode/@listName='exclusion-ground']/cac:SpecificTendererRequirement",
+)
+XPATH_TENDERER_REQUIREMENT_TYPE_CODE_EXCLUSION_GROUND = register_xpath(
+    "bt_67_exclusion_grounds.XPATH_TENDERER_REQUIREMENT_TYPE_CODE_EXCLUSION_GROUND",
+    "cbc:TendererRequirementTypeCode[@listName='exclusion-ground']/text()",
+)
+XPATH_DESCRIPTION = register_xpath(
+    "bt_67_exclusion_grounds.XPATH_DESCRIPTION", "cbc:Description/text()"
+)
+
+
+def parse_exclusion_grounds(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract exclusion grounds information.
 
     Extracts criteria regarding personal situation of tenderers that may lead to
@@ -63,37 +79,21 @@ def parse_exclusion_grounds(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
     result = {"tender": {"exclusionGrounds": {"criteria": []}}}
 
-    exclusion_grounds = root.xpath(
-        "//cac:TenderingTerms/cac:TendererQualificationRequest[cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode/@listName='exclusion-ground']/cac:SpecificTendererRequirement",
-        namespaces=namespaces,
+    exclusion_grounds = (
+        XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_EXCLUSION_GRO(root)
     )
 
     for ground in exclusion_grounds:
-        type_code = ground.xpath(
-            "cbc:TendererRequirementTypeCode[@listName='exclusion-ground']/text()",
-            namespaces=namespaces,
-        )
-        description = ground.xpath("cbc:Description/text()", namespaces=namespaces)
+        type_code = XPATH_TENDERER_REQUIREMENT_TYPE_CODE_EXCLUSION_GROUND(ground)
+        description = XPATH_DESCRIPTION(ground)
 
         if type_code:
             criterion = {
@@ -2,10 +2,21 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
-def parse_foreign_subsidies_regulation(xml_content: str) -> dict | None:
+XPATH_ID = register_xpath("bt_681_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_FSR_EXECUTION = register_xpath(
+    "bt_681_lot.XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_FSR_EXECUTION",
+    "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='fsr']/cbc:ExecutionRequirementCode/text()",
+)
+
+
+def parse_foreign_subsidies_regulation(xml_content: XMLContent) -> dict | None:
     """Parses the XML content to extract the Foreign Subsidies Regulation (FSR) applicability.
 
     Args:
@@ -15,40 +26,25 @@ def parse_foreign_subsidies_regulation(xml_content: str) -> dict | None:
         dict | None: A dictionary containing the parsed data or None if no lots are found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
+        lot_id = XPATH_ID(lot)
         if not lot_id:
             logger.warning("Lot ID not found")
             continue
 
         lot_id = lot_id[0]
-        fsr_code = lot.xpath(
-            "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='fsr']/cbc:ExecutionRequirementCode/text()",
-            namespaces=namespaces,
+        fsr_code = XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_FSR_EXECUTION(
+            lot
         )
 
         if fsr_code and fsr_code[0].lower() == "true":
@@ -82,10 +78,7 @@ def merge_foreign_subsidies_regulation(
     existing_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in fsr_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             if "coveredBy" not in existing_lot:
                 existing_lot["coveredBy"] = new_lot["coveredBy"]
@@ -2,10 +2,31 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
-def parse_foreign_subsidies_measures(xml_content: str) -> dict | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "bt_682_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_682_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_682_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_FOREIGN_SUBSIDIES_MEASURES_CODE_FOREIGN_SUBSIDY_MEASURE_CONC = register_xpath(
+    "bt_682_tender.XPATH_FOREIGN_SUBSIDIES_MEASURES_CODE_FOREIGN_SUBSIDY_MEASURE_CONC",
+    "efbc:ForeignSubsidiesMeasuresCode[@listName='foreign-subsidy-measure-conclusion']/text()",
+)
+
+
+def parse_foreign_subsidies_measures(xml_content: XMLContent) -> dict | None:
     """Parses the XML content to extract the Foreign Subsidies Measures.
 
     Args:
@@ -15,40 +36,21 @@ def parse_foreign_subsidies_measures(xml_content: str) -> dict | None:
         dict | None: A dictionary containing the parsed data or None if no bids are found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
     result = {"bids": {"details": []}}
 
-    lot_tenders = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
     for tender in lot_tenders:
-        tender_id = tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()", namespaces=namespaces
-        )
-        lot_id = tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()", namespaces=namespaces
-        )
-        measures_code = tender.xpath(
-            "efbc:ForeignSubsidiesMeasuresCode[@listName='foreign-subsidy-measure-conclusion']/text()",
-            namespaces=namespaces,
+        tender_id = XPATH_ID_TENDER(tender)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(tender)
+        measures_code = (
+            XPATH_FOREIGN_SUBSIDIES_MEASURES_CODE_FOREIGN_SUBSIDY_MEASURE_CONC(tender)
         )
 
         if tender_id and lot_id and measures_code:
@@ -83,10 +85,7 @@ def merge_foreign_subsidies_measures(
     existing_bids = release_json.setdefault("bids", {}).setdefault("details", [])
 
     for new_bid in measures_data["bids"]["details"]:
-        existing_bid = next(
-            (bid for bid in existing_bids if bid["id"] == new_bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(existing_bids, new_bid["id"])
         if existing_bid:
             existing_bid["foreignSubsidyMeasures"] = new_bid["foreignSubsidyMeasures"]
             existing_bid.setdefault("relatedLots", []).extend(new_bid["relatedLots"])
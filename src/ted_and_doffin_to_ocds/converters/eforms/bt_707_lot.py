@@ -5,16 +5,12 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 JUSTIFICATION_MAPPING = {
     "ipr-iss": "Intellectual property right issues",
@@ -25,8 +21,19 @@ JUSTIFICATION_MAPPING = {
 }
 
 
+XPATH_ID = register_xpath("bt_707_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE = register_xpath(
+    "bt_707_lot.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE",
+    "cac:TenderingTerms/cac:CallForTendersDocumentReference",
+)
+XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION = register_xpath(
+    "bt_707_lot.XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION",
+    "cbc:DocumentTypeCode[@listName='communication-justification']/text()",
+)
+
+
 def parse_lot_documents_restricted_justification(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the documents restricted justification (BT-707) for procurement project lots from XML content.
 
@@ -52,29 +59,19 @@ def parse_lot_documents_restricted_justification(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"documents": []}}
 
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            documents = lot.xpath(
-                "cac:TenderingTerms/cac:CallForTendersDocumentReference",
-                namespaces=NAMESPACES,
-            )
+            lot_id = XPATH_ID(lot)[0]
+            documents = XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE(lot)
 
             for doc in documents:
-                doc_id = doc.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-                justification_code = doc.xpath(
-                    "cbc:DocumentTypeCode[@listName='communication-justification']/text()",
-                    namespaces=NAMESPACES,
+                doc_id = XPATH_ID(doc)[0]
+                justification_code = (
+                    XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION(doc)
                 )
 
                 if justification_code:
@@ -116,14 +113,11 @@ def merge_lot_documents_restricted_justification(
     existing_documents = tender.setdefault("documents", [])
 
     for new_doc in lot_documents_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["accessDetails"] = new_doc["accessDetails"]
             existing_doc.setdefault("relatedLots", []).extend(new_doc["relatedLots"])
-            existing_doc["relatedLots"] = list(set(existing_doc["relatedLots"]))
+            existing_doc["relatedLots"] = sorted(set(existing_doc["relatedLots"]))
         else:
             existing_documents.append(new_doc)
 
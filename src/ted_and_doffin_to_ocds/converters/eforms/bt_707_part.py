@@ -5,16 +5,12 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 JUSTIFICATION_MAPPING = {
     "ipr-iss": "Intellectual property right issues",
@@ -25,8 +21,21 @@ JUSTIFICATION_MAPPING = {
 }
 
 
+XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER = register_xpath(
+    "bt_707_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER",
+    """//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/
+               cac:TenderingTerms/cac:CallForTendersDocumentReference""",
+)
+XPATH_ID = register_xpath("bt_707_part.XPATH_ID", "cbc:ID/text()")
+XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION = register_xpath(
+    "bt_707_part.XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION",
+    """cbc:DocumentTypeCode[@listName='communication-justification']/
+                   text()""",
+)
+
+
 def parse_part_documents_restricted_justification(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the documents restricted justification (BT-707) for procurement project parts from XML content.
 
@@ -49,26 +58,17 @@ def parse_part_documents_restricted_justification(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"documents": []}}
 
         # Find all parts and their document references
-        document_refs = root.xpath(
-            """//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/
-               cac:TenderingTerms/cac:CallForTendersDocumentReference""",
-            namespaces=NAMESPACES,
+        document_refs = (
+            XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_CALL_FOR_TENDER(root)
         )
 
         for doc in document_refs:
-            doc_id = doc.xpath("cbc:ID/text()", namespaces=NAMESPACES)
-            justification = doc.xpath(
-                """cbc:DocumentTypeCode[@listName='communication-justification']/
-                   text()""",
-                namespaces=NAMESPACES,
-            )
+            doc_id = XPATH_ID(doc)
+            justification = XPATH_DOCUMENT_TYPE_CODE_COMMUNICATION_JUSTIFICATION(doc)
 
             if doc_id and justification:
                 document = {
@@ -108,10 +108,7 @@ def merge_part_documents_restricted_justification(
     existing_documents = tender.setdefault("documents", [])
 
     for new_doc in part_documents_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["accessDetails"] = new_doc["accessDetails"]
         else:
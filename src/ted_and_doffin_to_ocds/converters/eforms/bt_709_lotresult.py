@@ -3,13 +3,32 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_RESULT = register_xpath(
+    "bt_709_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT = register_xpath(
+    "bt_709_lotresult.XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT",
+    "efac:FrameworkAgreementValues/cbc:MaximumValueAmount/text()",
+)
+XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_709_lotresult.XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT_CURRENCY_ID",
+    "efac:FrameworkAgreementValues/cbc:MaximumValueAmount/@currencyID",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_709_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_framework_maximum_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the framework maximum value (BT-709) from XML content.
 
@@ -35,42 +54,19 @@ def parse_framework_maximum_value(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        max_value = lot_result.xpath(
-            "efac:FrameworkAgreementValues/cbc:MaximumValueAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_result.xpath(
-            "efac:FrameworkAgreementValues/cbc:MaximumValueAmount/@currencyID",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
+        award_id = XPATH_ID_RESULT(lot_result)
+        max_value = XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT(lot_result)
+        currency = XPATH_FRAMEWORK_AGREEMENT_VALUES_MAXIMUM_VALUE_AMOUNT_CURRENCY_ID(
+            lot_result
         )
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if award_id and max_value and currency and lot_id:
             award_data = {
@@ -107,16 +103,13 @@ def merge_framework_maximum_value(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in framework_max_value_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_award["maximumValue"] = new_award["maximumValue"]
             existing_award.setdefault("relatedLots", []).extend(
                 new_award["relatedLots"],
             )
-            existing_award["relatedLots"] = list(
+            existing_award["relatedLots"] = sorted(
                 set(existing_award["relatedLots"]),
             )  # Remove duplicates
         else:
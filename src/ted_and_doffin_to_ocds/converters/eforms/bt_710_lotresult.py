@@ -3,11 +3,23 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
+XPATH_LOWER_TENDER_AMOUNT = register_xpath(
+    "bt_710_lotresult.XPATH_LOWER_TENDER_AMOUNT", "cbc:LowerTenderAmount"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_710_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_tender_value_lowest(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the tender value lowest (BT-710) from XML content.
 
@@ -32,44 +44,23 @@ def parse_tender_value_lowest(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("BT-710: Failed to parse XML")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
     result = {"bids": {"statistics": []}}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     if not lot_results:
         logger.debug("BT-710: No LotResult elements found in XML")
         return None
 
     for i, lot_result in enumerate(lot_results, 1):
-        lower_tender_amount = lot_result.xpath(
-            "cbc:LowerTenderAmount",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        lower_tender_amount = XPATH_LOWER_TENDER_AMOUNT(lot_result)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if lower_tender_amount and lot_id:
             try:
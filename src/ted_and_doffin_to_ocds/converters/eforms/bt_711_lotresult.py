@@ -3,13 +3,23 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_HIGHER_TENDER_AMOUNT = register_xpath(
+    "bt_711_lotresult.XPATH_HIGHER_TENDER_AMOUNT", "cbc:HigherTenderAmount"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_711_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+
+
 def parse_tender_value_highest(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the tender value highest (BT-711) from XML content.
 
@@ -34,35 +44,15 @@ def parse_tender_value_highest(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"bids": {"statistics": []}}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for i, lot_result in enumerate(lot_results, 1):
-        higher_tender_amount = lot_result.xpath(
-            "cbc:HigherTenderAmount",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        higher_tender_amount = XPATH_HIGHER_TENDER_AMOUNT(lot_result)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
         if higher_tender_amount and lot_id:
             statistic = {
@@ -1,13 +1,31 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_712a_lotresult.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_CODE = register_xpath(
+    "bt_712a_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_CODE",
+    "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsCode/text()",
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC = register_xpath(
+    "bt_712a_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC",
+    "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsNumeric/text()",
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE = register_xpath(
+    "bt_712a_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE",
+    "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']",
+)
+
+
 def parse_buyer_review_complainants_code(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the buyer review complainants code (BT-712(a)) from XML content.
 
@@ -29,20 +47,10 @@ def parse_buyer_review_complainants_code(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    relevant_xpath = "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    document = get_document(xml_content)
+    root = document.root
+
+    if not XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE(root):
         logger.info(
             "BT-712(a): No buyer review complainants code data found in the document."
         )
@@ -50,27 +58,19 @@ def parse_buyer_review_complainants_code(
 
     result = {"statistics": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for i, lot_result in enumerate(lot_results, 1):
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_TENDER_LOT_ID(lot_result)
         if not lot_id:
             continue
 
-        complainants_code = lot_result.xpath(
-            "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsCode/text()",
-            namespaces=namespaces,
+        complainants_code = (
+            XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_CODE(lot_result)
         )
 
-        complainants_value = lot_result.xpath(
-            "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsNumeric/text()",
-            namespaces=namespaces,
+        complainants_value = (
+            XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC(lot_result)
         )
 
         if complainants_code and complainants_code[0] == "complainants":
@@ -114,18 +114,20 @@ def merge_buyer_review_complainants_code(
     existing_statistics = release_json.setdefault("statistics", [])
 
     for new_statistic in complainants_code_data["statistics"]:
-        existing_index = next(
+        existing_statistic = next(
             (
-                i
-                for i, stat in enumerate(existing_statistics)
+                stat
+                for stat in existing_statistics
                 if stat.get("measure") == "complainants"
                 and stat.get("relatedLot") == new_statistic["relatedLot"]
             ),
             None,
         )
-        if existing_index is not None:
-            # Replace the existing statistic entirely with the new one
-            existing_statistics[existing_index] = new_statistic
+        if existing_statistic is not None:
+            # Replace the content of the existing statistic entirely, in place
+            # so that the statistics index keeps pointing at it
+            existing_statistic.clear()
+            existing_statistic.update(new_statistic)
         else:
             existing_statistics.append(new_statistic)
 
@@ -1,13 +1,27 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDER_LOT_ID = register_xpath(
+    "bt_712b_lotresult.XPATH_TENDER_LOT_ID", "efac:TenderLot/cbc:ID/text()"
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC = register_xpath(
+    "bt_712b_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC",
+    "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsNumeric/text()",
+)
+XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE = register_xpath(
+    "bt_712b_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE",
+    "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']",
+)
+
+
 def parse_buyer_review_complainants_number(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the buyer review complainants number (BT-712(b)) from XML content.
 
@@ -30,21 +44,11 @@ def parse_buyer_review_complainants_number(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     # Check if the relevant XPath exists
-    relevant_xpath = "//efac:NoticeResult/efac:LotResult/efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']"
-    if not root.xpath(relevant_xpath, namespaces=namespaces):
+    if not XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE(root):
         logger.info(
             "BT-712(b): No buyer review complainants number data found in the document."
         )
@@ -52,22 +56,15 @@ def parse_buyer_review_complainants_number(
 
     result = {"statistics": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for i, lot_result in enumerate(lot_results, 1):
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_TENDER_LOT_ID(lot_result)
         if not lot_id:
             continue
 
-        complainants_number = lot_result.xpath(
-            "efac:AppealRequestsStatistics[efbc:StatisticsCode/@listName='review-type']/efbc:StatisticsNumeric/text()",
-            namespaces=namespaces,
+        complainants_number = (
+            XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE_STATISTICS_NUMERIC(lot_result)
         )
         if complainants_number:
             statistic = {
@@ -3,13 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_717_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_EFORMS_EXTENSION_STRATEGIC_PROCUREMENT_APPLICABLE_LEGAL_BASI = register_xpath(
+    "bt_717_lot.XPATH_EFORMS_EXTENSION_STRATEGIC_PROCUREMENT_APPLICABLE_LEGAL_BASI",
+    ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:StrategicProcurement/efbc:ApplicableLegalBasis[@listName='cvd-scope']/text()",
+)
+
+
 def parse_clean_vehicles_directive(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the clean vehicles directive (BT-717) from XML content.
 
@@ -33,30 +41,16 @@ def parse_clean_vehicles_directive(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        applicable_legal_basis = lot.xpath(
-            ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:StrategicProcurement/efbc:ApplicableLegalBasis[@listName='cvd-scope']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        applicable_legal_basis = (
+            XPATH_EFORMS_EXTENSION_STRATEGIC_PROCUREMENT_APPLICABLE_LEGAL_BASI(lot)
         )
 
         if applicable_legal_basis and applicable_legal_basis[0].lower() == "true":
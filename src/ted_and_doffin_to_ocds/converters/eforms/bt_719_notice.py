@@ -1,15 +1,28 @@
 import logging
 from typing import Any
 
-from lxml import etree
-
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_CHANGES_CHANGE = register_xpath(
+    "bt_719_notice.XPATH_CHANGES_CHANGE", "//efac:Changes/efac:Change"
+)
+XPATH_PROCUREMENT_DOCUMENTS_CHANGE_DATE = register_xpath(
+    "bt_719_notice.XPATH_PROCUREMENT_DOCUMENTS_CHANGE_DATE",
+    "efbc:ProcurementDocumentsChangeDate/text()",
+)
+XPATH_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER_LOT = register_xpath(
+    "bt_719_notice.XPATH_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER_LOT",
+    "efac:ChangedSection/efbc:ChangedSectionIdentifier[starts-with(text(), 'LOT-')]/text()",
+)
+
+
 def parse_procurement_documents_change_date(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the procurement documents change date (BT-719) from XML content.
 
@@ -34,30 +47,14 @@ def parse_procurement_documents_change_date(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    changes = root.xpath(
-        "//efac:Changes/efac:Change",
-        namespaces=namespaces,
-    )
+    changes = XPATH_CHANGES_CHANGE(root)
 
     for change in changes:
-        change_date = change.xpath(
-            "efbc:ProcurementDocumentsChangeDate/text()",
-            namespaces=namespaces,
-        )
+        change_date = XPATH_PROCUREMENT_DOCUMENTS_CHANGE_DATE(change)
         if not change_date:
             continue
 
@@ -65,10 +62,7 @@ def parse_procurement_documents_change_date(
         iso_date = start_date(change_date[0])
 
         # Get lot identifiers if they exist
-        lot_identifiers = change.xpath(
-            "efac:ChangedSection/efbc:ChangedSectionIdentifier[starts-with(text(), 'LOT-')]/text()",
-            namespaces=namespaces,
-        )
+        lot_identifiers = XPATH_CHANGED_SECTION_CHANGED_SECTION_IDENTIFIER_LOT(change)
 
         document = {"dateModified": iso_date, "documentType": "biddingDocuments"}
 
@@ -4,10 +4,29 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
-def parse_reserved_participation(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_71_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_LOT = register_xpath(
+    "bt_71_lot.XPATH_PROCUREMENT_PROJECT_LOT",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+)
+XPATH_RESERVED_PROCUREMENT_TYPE_CODE = register_xpath(
+    "bt_71_lot.XPATH_RESERVED_PROCUREMENT_TYPE_CODE",
+    "cac:TenderingTerms/cac:TendererQualificationRequest"
+    "[not(cbc:CompanyLegalFormCode)]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='missing-info-submission'])]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='selection-criteria-source'])]"
+    "/cac:SpecificTendererRequirement[cbc:TendererRequirementTypeCode/@listName='reserved-procurement']/cbc:TendererRequirementTypeCode/text()",
+)
+
+
+def parse_reserved_participation(xml_content: XMLContent) -> dict | None:
     """Parse reserved participation information from XML for each lot.
 
     Extracts whether participation is reserved for specific organisations
@@ -39,44 +58,24 @@ def parse_reserved_participation(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except etree.XMLSyntaxError:
         logger.exception("Failed to parse XML content")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
     result = {"tender": {"lots": []}}
 
-    xpath_query = "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']"
-    lots = root.xpath(xpath_query, namespaces=namespaces)
+    lots = XPATH_PROCUREMENT_PROJECT_LOT(root)
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
+        lot_id = XPATH_ID(lot)
         if not lot_id:
             logger.warning("Lot ID not found")
             continue
 
         lot_id = lot_id[0]
-        xpath_reserved = (
-            "cac:TenderingTerms/cac:TendererQualificationRequest"
-            "[not(cbc:CompanyLegalFormCode)]"
-            "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='missing-info-submission'])]"
-            "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='selection-criteria-source'])]"
-            "/cac:SpecificTendererRequirement[cbc:TendererRequirementTypeCode/@listName='reserved-procurement']/cbc:TendererRequirementTypeCode/text()"
-        )
-        reserved_code = lot.xpath(xpath_reserved, namespaces=namespaces)
+        reserved_code = XPATH_RESERVED_PROCUREMENT_TYPE_CODE(lot)
 
         if reserved_code:
             reserved_type = None
@@ -123,10 +122,7 @@ def merge_reserved_participation(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in reserved_participation_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("otherRequirements", {}).update(
                 new_lot["otherRequirements"],
@@ -4,8 +4,26 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
+
+XPATH_PART_RESERVED_PROCUREMENT_TYPE_CODE = register_xpath(
+    "bt_71_part.XPATH_PART_RESERVED_PROCUREMENT_TYPE_CODE",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:TenderingTerms/cac:TendererQualificationRequest"
+    "[not(cbc:CompanyLegalFormCode)]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode"
+    "[@listName='missing-info-submission'])]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode"
+    "[@listName='selection-criteria-source'])]"
+    "/cac:SpecificTendererRequirement"
+    "[cbc:TendererRequirementTypeCode/@listName='reserved-procurement']"
+    "/cbc:TendererRequirementTypeCode/text()",
+)
+
 # Constants for code mapping
 RESERVED_CODE_MAPPING = {
     "res-pub-ser": "publicServiceMissionOrganization",
@@ -13,7 +31,7 @@ RESERVED_CODE_MAPPING = {
 }
 
 
-def parse_reserved_participation_part(xml_content: str | bytes) -> dict | None:
+def parse_reserved_participation_part(xml_content: XMLContent) -> dict | None:
     """Parse reserved participation information from XML.
 
     Extracts whether participation is reserved for specific organisations
@@ -44,37 +62,13 @@ def parse_reserved_participation_part(xml_content: str | bytes) -> dict | None:
         return None
 
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
     except (etree.XMLSyntaxError, ValueError):
         logger.warning("Invalid XML content provided")
         return None
 
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    xpath_query = (
-        "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-        "/cac:TenderingTerms/cac:TendererQualificationRequest"
-        "[not(cbc:CompanyLegalFormCode)]"
-        "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode"
-        "[@listName='missing-info-submission'])]"
-        "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode"
-        "[@listName='selection-criteria-source'])]"
-        "/cac:SpecificTendererRequirement"
-        "[cbc:TendererRequirementTypeCode/@listName='reserved-procurement']"
-        "/cbc:TendererRequirementTypeCode/text()"
-    )
-
     try:
-        reserved_codes = root.xpath(xpath_query, namespaces=namespaces)
+        reserved_codes = XPATH_PART_RESERVED_PROCUREMENT_TYPE_CODE(root)
     except etree.XPathError:
         logger.warning("Invalid XPath query or namespace")
         return None
@@ -89,7 +83,7 @@ def parse_reserved_participation_part(xml_content: str | bytes) -> dict | None:
             return {
                 "tender": {
                     "otherRequirements": {
-                        "reservedParticipation": list(reserved_types),
+                        "reservedParticipation": sorted(reserved_types),
                     },
                 },
             }
@@ -131,7 +125,7 @@ def merge_reserved_participation_part(
                 "reservedParticipation"
             ],
         )
-        other_requirements["reservedParticipation"] = list(
+        other_requirements["reservedParticipation"] = sorted(
             existing_reserved.union(new_reserved),
         )
 
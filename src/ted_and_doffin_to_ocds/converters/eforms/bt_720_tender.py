@@ -2,13 +2,39 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "bt_720_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_ID_TENDER = register_xpath(
+    "bt_720_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT = register_xpath(
+    "bt_720_tender.XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT",
+    "cac:LegalMonetaryTotal/cbc:PayableAmount/text()",
+)
+XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT_CURRENCY_ID = register_xpath(
+    "bt_720_tender.XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT_CURRENCY_ID",
+    "cac:LegalMonetaryTotal/cbc:PayableAmount/@currencyID",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_720_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_720_tender.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
 def parse_tender_value(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict]] | list[dict]] | None:
     """Parse the XML content to extract the tender value information.
 
@@ -19,43 +45,18 @@ def parse_tender_value(
         Optional[Dict]: A dictionary containing the parsed data if found, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"bids": {"details": []}, "awards": []}
 
-    lot_tenders = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-        namespaces=namespaces,
-    )
+    lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
     for lot_tender in lot_tenders:
-        tender_id = lot_tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
-        payable_amount = lot_tender.xpath(
-            "cac:LegalMonetaryTotal/cbc:PayableAmount/text()",
-            namespaces=namespaces,
-        )
-        currency = lot_tender.xpath(
-            "cac:LegalMonetaryTotal/cbc:PayableAmount/@currencyID",
-            namespaces=namespaces,
-        )
-        lot_id = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        tender_id = XPATH_ID_TENDER(lot_tender)
+        payable_amount = XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT(lot_tender)
+        currency = XPATH_LEGAL_MONETARY_TOTAL_PAYABLE_AMOUNT_CURRENCY_ID(lot_tender)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_tender)
 
         if tender_id and payable_amount and currency and lot_id:
             bid = {
@@ -65,15 +66,9 @@ def parse_tender_value(
             result["bids"]["details"].append(bid)
 
             # Find corresponding LotResult
-            lot_result = root.xpath(
-                f"//efac:LotResult[efac:LotTender/cbc:ID[@schemeName='tender']/text()='{tender_id[0]}']",
-                namespaces=namespaces,
-            )
+            lot_result = document.index.lot_results_for_tender(tender_id[0])
             if lot_result:
-                result_id = lot_result[0].xpath(
-                    "cbc:ID[@schemeName='result']/text()",
-                    namespaces=namespaces,
-                )
+                result_id = XPATH_ID_RESULT(lot_result[0])
                 if result_id:
                     award = {
                         "id": result_id[0],
@@ -111,10 +106,7 @@ def merge_tender_value(
         release_json["bids"] = {"details": []}
 
     for bid in tender_value_data["bids"]["details"]:
-        existing_bid = next(
-            (b for b in release_json["bids"]["details"] if b["id"] == bid["id"]),
-            None,
-        )
+        existing_bid = find_by_id(release_json["bids"]["details"], bid["id"])
         if existing_bid:
             existing_bid.update(bid)
         else:
@@ -125,10 +117,7 @@ def merge_tender_value(
         release_json["awards"] = []
 
     for award in tender_value_data["awards"]:
-        existing_award = next(
-            (a for a in release_json["awards"] if a["id"] == award["id"]),
-            None,
-        )
+        existing_award = find_by_id(release_json["awards"], award["id"])
         if existing_award:
             existing_award.update(award)
         else:
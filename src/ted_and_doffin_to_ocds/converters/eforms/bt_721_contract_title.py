@@ -2,13 +2,28 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_721_contract_title.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_721_contract_title.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_TITLE = register_xpath("bt_721_contract_title.XPATH_TITLE", "cbc:Title/text()")
+XPATH_ID_RESULT = register_xpath(
+    "bt_721_contract_title.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
 def parse_contract_title(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, str]]] | None:
     """Parse the XML content to extract contract title information.
 
@@ -20,47 +35,24 @@ def parse_contract_title(
         None: If no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
-    settled_contracts = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-        namespaces=namespaces,
-    )
+    settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     for settled_contract in settled_contracts:
-        contract_id = settled_contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
-        contract_title = settled_contract.xpath(
-            "cbc:Title/text()", namespaces=namespaces
-        )
+        contract_id = XPATH_ID_CONTRACT(settled_contract)
+        contract_title = XPATH_TITLE(settled_contract)
 
         if contract_id and contract_title:
             contract = {"id": contract_id[0], "title": contract_title[0]}
 
             # Find corresponding LotResult
-            lot_result = root.xpath(
-                f"//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID[@schemeName='contract']/text()='{contract_id[0]}']",
-                namespaces=namespaces,
-            )
+            lot_result = document.index.lot_results_for_contract(contract_id[0])
             if lot_result:
-                result_id = lot_result[0].xpath(
-                    "cbc:ID[@schemeName='result']/text()",
-                    namespaces=namespaces,
-                )
+                result_id = XPATH_ID_RESULT(lot_result[0])
                 if result_id:
                     contract["awardID"] = result_id[0]
 
@@ -90,14 +82,7 @@ def merge_contract_title(
         release_json["contracts"] = []
 
     for new_contract in contract_title_data["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in release_json["contracts"]
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(release_json["contracts"], new_contract["id"])
         if existing_contract:
             existing_contract.update(new_contract)
         else:
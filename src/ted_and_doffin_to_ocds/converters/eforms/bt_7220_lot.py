@@ -5,20 +5,22 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_7220_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_EFORMS_EXTENSION_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME = register_xpath(
+    "bt_7220_lot.XPATH_EFORMS_EXTENSION_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME",
+    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:Funding/cbc:FundingProgramCode[@listName='eu-programme']",
+)
 
 
 def parse_lot_eu_funds(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, Any]]] | None:
     """Parse EU funds programme information for each lot.
 
@@ -33,25 +35,19 @@ def parse_lot_eu_funds(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
 
         result = {"lots": []}
 
         # Find all lots
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)
+            lot_id = XPATH_ID(lot)
 
             # Get all funding programs for this lot
-            funding_elements = lot.xpath(
-                "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:Funding/cbc:FundingProgramCode[@listName='eu-programme']",
-                namespaces=NAMESPACES,
+            funding_elements = (
+                XPATH_EFORMS_EXTENSION_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME(lot)
             )
 
             if lot_id and funding_elements:
@@ -114,10 +110,7 @@ def merge_lot_eu_funds(
     # Process each lot with EU funds data
     for new_lot in lot_eu_funds_data["lots"]:
         # Find existing lot or add new one
-        existing_lot = next(
-            (lot for lot in release_json["lots"] if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(release_json["lots"], new_lot["id"])
 
         if existing_lot:
             # Ensure planning.budget.finance structure exists
@@ -128,9 +121,7 @@ def merge_lot_eu_funds(
             # Update/append finance entries
             for new_finance in new_lot["planning"]["budget"]["finance"]:
                 # Check if finance entry with same ID exists
-                existing_finance = next(
-                    (f for f in finance if f["id"] == new_finance["id"]), None
-                )
+                existing_finance = find_by_id(finance, new_finance["id"])
                 if existing_finance:
                     existing_finance.update(new_finance)
                 else:
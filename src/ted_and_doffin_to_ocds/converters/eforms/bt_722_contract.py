@@ -2,13 +2,31 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "bt_722_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "bt_722_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME = register_xpath(
+    "bt_722_contract.XPATH_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME",
+    "efac:Funding/cbc:FundingProgramCode[@listName='eu-programme']/text()",
+)
+XPATH_ID_RESULT = register_xpath(
+    "bt_722_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+
+
 def parse_contract_eu_funds(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list[dict[str, str]]] | None:
     """Parse the XML content to extract contract EU funds programme information.
 
@@ -20,33 +38,17 @@ def parse_contract_eu_funds(
         None: If no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"contracts": []}
 
-    settled_contracts = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-        namespaces=namespaces,
-    )
+    settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     for settled_contract in settled_contracts:
-        contract_id = settled_contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
-        funding_programs = settled_contract.xpath(
-            "efac:Funding/cbc:FundingProgramCode[@listName='eu-programme']/text()",
-            namespaces=namespaces,
+        contract_id = XPATH_ID_CONTRACT(settled_contract)
+        funding_programs = XPATH_FUNDING_FUNDING_PROGRAM_CODE_EU_PROGRAMME(
+            settled_contract
         )
 
         if contract_id and funding_programs:
@@ -56,15 +58,9 @@ def parse_contract_eu_funds(
             }
 
             # Find corresponding LotResult
-            lot_result = root.xpath(
-                f"//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotResult[efac:SettledContract/cbc:ID[@schemeName='contract']/text()='{contract_id[0]}']",
-                namespaces=namespaces,
-            )
+            lot_result = document.index.lot_results_for_contract(contract_id[0])
             if lot_result:
-                result_id = lot_result[0].xpath(
-                    "cbc:ID[@schemeName='result']/text()",
-                    namespaces=namespaces,
-                )
+                result_id = XPATH_ID_RESULT(lot_result[0])
                 if result_id:
                     contract["awardID"] = result_id[0]
 
@@ -94,14 +90,7 @@ def merge_contract_eu_funds(
         release_json["contracts"] = []
 
     for new_contract in contract_eu_funds_data["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in release_json["contracts"]
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(release_json["contracts"], new_contract["id"])
         if existing_contract:
             if "finance" not in existing_contract:
                 existing_contract["finance"] = []
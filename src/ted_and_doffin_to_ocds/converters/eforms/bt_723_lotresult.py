@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -18,7 +20,20 @@ VEHICLE_CATEGORY_MAPPING = {
 }
 
 
-def parse_vehicle_category(xml_content: str | bytes) -> dict | None:
+XPATH_ID_RESULT = register_xpath(
+    "bt_723_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_723_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_STRATEGIC_PROCUREMENT_INFORMATION_PROCUREMENT_DETAILS_ASSET = register_xpath(
+    "bt_723_lotresult.XPATH_STRATEGIC_PROCUREMENT_INFORMATION_PROCUREMENT_DETAILS_ASSET",
+    "efac:StrategicProcurement/efac:StrategicProcurementInformation/efac:ProcurementDetails/efbc:AssetCategoryCode[@listName='vehicle-category']/text()",
+)
+
+
+def parse_vehicle_category(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract vehicle category information for lot results.
 
     This function processes XML content to extract vehicle category information from lot results,
@@ -53,37 +68,19 @@ def parse_vehicle_category(xml_content: str | bytes) -> dict | None:
             Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        result_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
-        vehicle_category = lot_result.xpath(
-            "efac:StrategicProcurement/efac:StrategicProcurementInformation/efac:ProcurementDetails/efbc:AssetCategoryCode[@listName='vehicle-category']/text()",
-            namespaces=namespaces,
+        result_id = XPATH_ID_RESULT(lot_result)
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
+        vehicle_category = (
+            XPATH_STRATEGIC_PROCUREMENT_INFORMATION_PROCUREMENT_DETAILS_ASSET(
+                lot_result
+            )
         )
 
         if result_id and lot_id and vehicle_category:
@@ -143,14 +140,7 @@ def merge_vehicle_category(
         release_json["awards"] = []
 
     for new_award in vehicle_category_data["awards"]:
-        existing_award = next(
-            (
-                award
-                for award in release_json["awards"]
-                if award["id"] == new_award["id"]
-            ),
-            None,
-        )
+        existing_award = find_by_id(release_json["awards"], new_award["id"])
         if existing_award:
             if "items" not in existing_award:
                 existing_award["items"] = []
@@ -163,7 +153,7 @@ def merge_vehicle_category(
                 )
             else:
                 existing_award["items"].extend(new_award["items"])
-            existing_award["relatedLots"] = list(
+            existing_award["relatedLots"] = sorted(
                 set(existing_award.get("relatedLots", []) + new_award["relatedLots"]),
             )
         else:
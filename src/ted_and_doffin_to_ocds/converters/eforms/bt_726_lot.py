@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lot_sme_suitability(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_726_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR = register_xpath(
+    "bt_726_lot.XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR",
+    "cac:ProcurementProject/cbc:SMESuitableIndicator/text()",
+)
+
+
+def parse_lot_sme_suitability(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract SME suitability information for lots.
 
     This function processes XML content to extract whether lots are marked as
@@ -33,31 +42,15 @@ def parse_lot_sme_suitability(xml_content: str | bytes) -> dict | None:
             Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)
-        sme_suitable = lot.xpath(
-            "cac:ProcurementProject/cbc:SMESuitableIndicator/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)
+        sme_suitable = XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR(lot)
 
         if lot_id and sme_suitable:
             lot_data = {
@@ -100,14 +93,7 @@ def merge_lot_sme_suitability(
         release_json["tender"]["lots"] = []
 
     for new_lot in lot_sme_suitability_data["tender"]["lots"]:
-        existing_lot = next(
-            (
-                lot
-                for lot in release_json["tender"]["lots"]
-                if lot["id"] == new_lot["id"]
-            ),
-            None,
-        )
+        existing_lot = find_by_id(release_json["tender"]["lots"], new_lot["id"])
         if existing_lot:
             if "suitability" not in existing_lot:
                 existing_lot["suitability"] = {}
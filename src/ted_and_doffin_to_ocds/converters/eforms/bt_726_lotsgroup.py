@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lots_group_sme_suitability(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_726_lotsgroup.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR = register_xpath(
+    "bt_726_lotsgroup.XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR",
+    "cac:ProcurementProject/cbc:SMESuitableIndicator/text()",
+)
+
+
+def parse_lots_group_sme_suitability(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract SME suitability information for lot groups.
 
     This function processes XML content to extract whether lot groups are marked as
@@ -33,31 +42,15 @@ def parse_lots_group_sme_suitability(xml_content: str | bytes) -> dict | None:
             Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lotGroups": []}}
 
-    lot_groups = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']",
-        namespaces=namespaces,
-    )
+    lot_groups = document.procurement_project_lots("LotsGroup")
 
     for lot_group in lot_groups:
-        lot_group_id = lot_group.xpath("cbc:ID/text()", namespaces=namespaces)
-        sme_suitable = lot_group.xpath(
-            "cac:ProcurementProject/cbc:SMESuitableIndicator/text()",
-            namespaces=namespaces,
-        )
+        lot_group_id = XPATH_ID(lot_group)
+        sme_suitable = XPATH_PROCUREMENT_PROJECT_SME_SUITABLE_INDICATOR(lot_group)
 
         if lot_group_id and sme_suitable:
             lot_group_data = {
@@ -100,13 +93,8 @@ def merge_lots_group_sme_suitability(
         release_json["tender"]["lotGroups"] = []
 
     for new_lot_group in lots_group_sme_suitability_data["tender"]["lotGroups"]:
-        existing_lot_group = next(
-            (
-                lg
-                for lg in release_json["tender"]["lotGroups"]
-                if lg["id"] == new_lot_group["id"]
-            ),
-            None,
+        existing_lot_group = find_by_id(
+            release_json["tender"]["lotGroups"], new_lot_group["id"]
         )
         if existing_lot_group:
             if "suitability" not in existing_lot_group:
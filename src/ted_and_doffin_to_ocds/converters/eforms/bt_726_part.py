@@ -5,19 +5,20 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_STRING_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_SME_SUITABL = register_xpath(
+    "bt_726_part.XPATH_STRING_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_SME_SUITABL",
+    "string(/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:ProcurementProject/cbc:SMESuitableIndicator)",
+)
 
 
-def parse_part_sme_suitability(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_part_sme_suitability(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse BT-726-Part suitable for SMEs indicator from XML.
 
     Extracts whether this procurement part is indicated as suitable for
@@ -39,14 +40,11 @@ def parse_part_sme_suitability(xml_content: str | bytes) -> dict[str, Any] | Non
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
-        sme_suitable = root.xpath(
-            "string(/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-            "/cac:ProcurementProject/cbc:SMESuitableIndicator)",
-            namespaces=NAMESPACES,
+        root = get_root(xml_content)
+        sme_suitable = (
+            XPATH_STRING_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_SME_SUITABL(
+                root
+            )
         )
 
         if sme_suitable:
@@ -2,7 +2,8 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -13,7 +14,14 @@ REGION_MAPPING = {
 }
 
 
-def parse_lot_place_performance(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_727_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_REALIZED_LOCATION_ADDRESS_REGION = register_xpath(
+    "bt_727_lot.XPATH_REALIZED_LOCATION_ADDRESS_REGION",
+    "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:Region/text()",
+)
+
+
+def parse_lot_place_performance(xml_content: XMLContent) -> dict | None:
     """Parse place of performance information for lots.
 
     Extracts region codes from RealizedLocation elements and maps them to
@@ -42,31 +50,15 @@ def parse_lot_place_performance(xml_content: str | bytes) -> dict | None:
         Returns None if no relevant data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"items": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        regions = lot.xpath(
-            "cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:Region/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        regions = XPATH_REALIZED_LOCATION_ADDRESS_REGION(lot)
 
         if regions:
             item = {
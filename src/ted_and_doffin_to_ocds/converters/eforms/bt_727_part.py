@@ -2,16 +2,11 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 REGION_MAPPING = {
     "anyw": "Anywhere",
@@ -20,7 +15,15 @@ REGION_MAPPING = {
 }
 
 
-def parse_part_place_performance(xml_content: str | bytes) -> dict | None:
+XPATH_REALIZED_LOCATION_ADDRESS_REGION = register_xpath(
+    "bt_727_part.XPATH_REALIZED_LOCATION_ADDRESS_REGION",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:ProcurementProject/cac:RealizedLocation"
+    "/cac:Address/cbc:Region",
+)
+
+
+def parse_part_place_performance(xml_content: XMLContent) -> dict | None:
     """Parse BT-727: Other restrictions on the place of performance.
 
     This field maps to the same Address objects as created for BT-728-Part,
@@ -44,18 +47,10 @@ def parse_part_place_performance(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"deliveryLocations": []}}
 
-        region_elements = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-            "/cac:ProcurementProject/cac:RealizedLocation"
-            "/cac:Address/cbc:Region",
-            namespaces=NAMESPACES,
-        )
+        region_elements = XPATH_REALIZED_LOCATION_ADDRESS_REGION(root)
 
         for region_elem in region_elements:
             clean_code = region_elem.text.strip()
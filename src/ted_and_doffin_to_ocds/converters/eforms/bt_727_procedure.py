@@ -4,16 +4,11 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 REGION_MAPPING = {
     "anyw": "Anywhere",
@@ -22,7 +17,13 @@ REGION_MAPPING = {
 }
 
 
-def parse_procedure_place_performance(xml_content: str | bytes) -> dict | None:
+XPATH_REALIZED_LOCATION_ADDRESS_REGION = register_xpath(
+    "bt_727_procedure.XPATH_REALIZED_LOCATION_ADDRESS_REGION",
+    "//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:Region/text()",
+)
+
+
+def parse_procedure_place_performance(xml_content: XMLContent) -> dict | None:
     """Parse BT-727: Other restrictions on the place of performance.
 
     This field maps to the same Address objects as created for BT-728-Procedure,
@@ -47,16 +48,10 @@ def parse_procedure_place_performance(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"deliveryLocations": []}}
 
-        regions = root.xpath(
-            "//cac:ProcurementProject/cac:RealizedLocation/cac:Address/cbc:Region/text()",
-            namespaces=NAMESPACES,
-        )
+        regions = XPATH_REALIZED_LOCATION_ADDRESS_REGION(root)
 
         for region in regions:
             clean_code = region.strip()
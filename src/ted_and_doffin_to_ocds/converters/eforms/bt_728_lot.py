@@ -3,41 +3,34 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_728_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION = register_xpath(
+    "bt_728_lot.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION",
+    "./cac:ProcurementProject/cac:RealizedLocation/cbc:Description/text()",
+)
 
 
 def parse_lot_place_performance_additional(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse additional place of performance information for lots (BT-728)."""
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"items": []}}
 
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-                descriptions = lot.xpath(
-                    "./cac:ProcurementProject/cac:RealizedLocation/cbc:Description/text()",
-                    namespaces=NAMESPACES,
+                lot_id = XPATH_ID(lot)[0]
+                descriptions = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION(
+                    lot
                 )
 
                 if descriptions:
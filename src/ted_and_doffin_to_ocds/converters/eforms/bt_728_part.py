@@ -4,20 +4,22 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_REALIZED_LO = register_xpath(
+    "bt_728_part.XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_REALIZED_LO",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:ProcurementProject/cac:RealizedLocation",
+)
+XPATH_DESCRIPTION = register_xpath("bt_728_part.XPATH_DESCRIPTION", "cbc:Description")
 
 
 def parse_part_place_performance_additional(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse BT-728: Additional information about place of performance.
 
@@ -42,22 +44,15 @@ def parse_part_place_performance_additional(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        locations = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-            "/cac:ProcurementProject/cac:RealizedLocation",
-            namespaces=NAMESPACES,
+        locations = XPATH_PROCUREMENT_PROJECT_LOT_PART_PROCUREMENT_PROJECT_REALIZED_LO(
+            root
         )
 
         for location in locations:
-            description_elements = location.xpath(
-                "cbc:Description", namespaces=NAMESPACES
-            )
+            description_elements = XPATH_DESCRIPTION(location)
 
             for desc_elem in description_elements:
                 description = desc_elem.text
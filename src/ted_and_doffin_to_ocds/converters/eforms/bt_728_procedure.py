@@ -2,20 +2,20 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION = register_xpath(
+    "bt_728_procedure.XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION",
+    "/*/cac:ProcurementProject/cac:RealizedLocation/cbc:Description",
+)
 
 
 def parse_procedure_place_performance_additional(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse BT-728: Additional information about place of performance.
 
@@ -41,15 +41,11 @@ def parse_procedure_place_performance_additional(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"deliveryAddresses": []}}
 
-        description_elements = root.xpath(
-            "/*/cac:ProcurementProject/cac:RealizedLocation/cbc:Description",
-            namespaces=NAMESPACES,
+        description_elements = XPATH_PROCUREMENT_PROJECT_REALIZED_LOCATION_DESCRIPTION(
+            root
         )
 
         for element in description_elements:
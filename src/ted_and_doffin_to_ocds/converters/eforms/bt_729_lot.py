@@ -4,20 +4,22 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_729_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL = register_xpath(
+    "bt_729_lot.XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL",
+    "cac:TenderingTerms/cac:AllowedSubcontractTerms[cbc:SubcontractingConditionsCode/@listName='subcontracting-obligation']/cbc:MaximumPercent/text()",
+)
 
 
 def parse_lot_subcontracting_obligation_maximum(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse BT-729: Maximum subcontracting percentage for competitive procedure.
 
@@ -45,21 +47,15 @@ def parse_lot_subcontracting_obligation_maximum(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            max_percent = lot.xpath(
-                "cac:TenderingTerms/cac:AllowedSubcontractTerms[cbc:SubcontractingConditionsCode/@listName='subcontracting-obligation']/cbc:MaximumPercent/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            max_percent = (
+                XPATH_TENDERING_TERMS_ALLOWED_SUBCONTRACT_TERMS_SUBCONTRACTING_OBL(lot)
             )
 
             if max_percent:
@@ -115,10 +111,7 @@ def merge_lot_subcontracting_obligation_maximum(
     tender.setdefault("lots", [])
 
     for new_lot in lot_subcontracting_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender["lots"] if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender["lots"], new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("subcontractingTerms", {})
             existing_lot["subcontractingTerms"]["competitiveMaximumPercentage"] = (
@@ -6,7 +6,9 @@ contract type information from eForms notices to OCDS format.
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,15 @@ CVD_CONTRACT_TYPE_LABELS = {
 }
 
 
+XPATH_ID = register_xpath("bt_735_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC = register_xpath(
+    "bt_735_lot.XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC",
+    ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode[@listName='cvd-contract-type']/text()",
+)
+
+
 def parse_cvd_contract_type(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, str]]]] | None:
     """Parse the CVD (Clean Vehicle Directive) contract type for each lot.
 
@@ -50,30 +59,16 @@ def parse_cvd_contract_type(
         None: If no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        cvd_code = lot.xpath(
-            ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode[@listName='cvd-contract-type']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        cvd_code = XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC(
+            lot
         )
 
         if cvd_code:
@@ -121,10 +116,7 @@ def merge_cvd_contract_type(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in cvd_contract_type_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_classifications = existing_lot.setdefault(
                 "additionalClassifications",
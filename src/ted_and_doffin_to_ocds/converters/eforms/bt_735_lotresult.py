@@ -7,7 +7,9 @@ contract type information from eForms LotResult elements to OCDS award items.
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +20,18 @@ CVD_CONTRACT_TYPE_LABELS = {
 }
 
 
+XPATH_LOT_RESULT = register_xpath(
+    "bt_735_lotresult.XPATH_LOT_RESULT", "//efac:LotResult"
+)
+XPATH_ID = register_xpath("bt_735_lotresult.XPATH_ID", "cbc:ID/text()")
+XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC = register_xpath(
+    "bt_735_lotresult.XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC",
+    "efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode[@listName='cvd-contract-type']/text()",
+)
+
+
 def parse_cvd_contract_type_lotresult(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the CVD contract type for each LotResult into award items.
 
@@ -54,35 +66,24 @@ def parse_cvd_contract_type_lotresult(
             Returns None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
-        namespaces = {
-            "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-            "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-            "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-        }
+        root = get_root(xml_content)
 
         result = {"awards": []}
-        lot_results = root.xpath("//efac:LotResult", namespaces=namespaces)
+        lot_results = XPATH_LOT_RESULT(root)
 
         for lot_result in lot_results:
             try:
-                lot_result_ids = lot_result.xpath(
-                    "cbc:ID/text()", namespaces=namespaces
-                )
+                lot_result_ids = XPATH_ID(lot_result)
                 if not lot_result_ids:
                     logger.warning("Skipping lot result without ID")
                     continue
 
                 lot_result_id = lot_result_ids[0]
-                cvd_code = lot_result.xpath(
-                    "efac:StrategicProcurement/efac:StrategicProcurementInformation/efbc:ProcurementCategoryCode[@listName='cvd-contract-type']/text()",
-                    namespaces=namespaces,
+                cvd_code = (
+                    XPATH_STRATEGIC_PROCUREMENT_STRATEGIC_PROCUREMENT_INFORMATION_PROC(
+                        lot_result
+                    )
                 )
 
                 if cvd_code:
@@ -142,9 +143,7 @@ def merge_cvd_contract_type_lotresult(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in cvd_contract_type_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]), None
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_items = existing_award.setdefault("items", [])
             if existing_items:
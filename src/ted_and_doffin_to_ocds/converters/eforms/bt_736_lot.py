@@ -7,13 +7,22 @@ under sheltered employment programmes.
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_736_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_RESERVED_EXEC = register_xpath(
+    "bt_736_lot.XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_RESERVED_EXEC",
+    "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='reserved-execution']/cbc:ExecutionRequirementCode/text()",
+)
+
+
 def parse_reserved_execution(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, str | bool]]]] | None:
     """Parse whether lots are reserved for sheltered employment programmes.
 
@@ -41,29 +50,15 @@ def parse_reserved_execution(
         None: If no relevant data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        reserved_execution = lot.xpath(
-            "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='reserved-execution']/cbc:ExecutionRequirementCode/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        reserved_execution = (
+            XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_RESERVED_EXEC(lot)
         )
 
         if reserved_execution and reserved_execution[0].lower() == "yes":
@@ -98,10 +93,7 @@ def merge_reserved_execution(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in reserved_execution_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractTerms", {}).update(
                 new_lot["contractTerms"],
@@ -7,13 +7,20 @@ performed under sheltered employment programmes.
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PART_RESERVED_EXECUTION_CODE = register_xpath(
+    "bt_736_part.XPATH_PART_RESERVED_EXECUTION_CODE",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='reserved-execution']/cbc:ExecutionRequirementCode",
+)
+
+
 def parse_reserved_execution_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, bool]] | None:
     """Parse whether a part is reserved for sheltered employment programmes.
 
@@ -36,20 +43,9 @@ def parse_reserved_execution_part(
         None: If no relevant data found or value is not "yes"
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    xpath_query = "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='reserved-execution']/cbc:ExecutionRequirementCode"
-    reserved_execution = root.xpath(xpath_query, namespaces=namespaces)
+    root = get_root(xml_content)
+
+    reserved_execution = XPATH_PART_RESERVED_EXECUTION_CODE(root)
 
     if reserved_execution and reserved_execution[0].text.lower() == "yes":
         return {"tender": {"contractTerms": {"reservedExecution": True}}}
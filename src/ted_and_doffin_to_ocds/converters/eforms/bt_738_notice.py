@@ -9,16 +9,20 @@ import logging
 from lxml import etree
 
 from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_REQUESTED_PUBLICATION_DATE = register_xpath(
+    "bt_738_notice.XPATH_REQUESTED_PUBLICATION_DATE",
+    "/*/cbc:RequestedPublicationDate/text()",
+)
 
 
 def parse_notice_preferred_publication_date(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the preferred TED publication date from RequestedPublicationDate.
 
@@ -41,13 +45,9 @@ def parse_notice_preferred_publication_date(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
 
-        requested_date = root.xpath(
-            "/*/cbc:RequestedPublicationDate/text()", namespaces=NAMESPACES
-        )
+        requested_date = XPATH_REQUESTED_PUBLICATION_DATE(root)
 
         if requested_date:
             try:
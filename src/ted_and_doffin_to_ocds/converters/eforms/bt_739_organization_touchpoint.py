@@ -2,18 +2,36 @@ import logging
 
 from lxml import etree
 
-logger = logging.getLogger(__name__)
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-}
+logger = logging.getLogger(__name__)
 
 
-def parse_touchpoint_contact_fax(xml_content: str | bytes) -> dict | None:
+XPATH_EFORMS_EXTENSION_ORGANIZATIONS_ORGANIZATION = register_xpath(
+    "bt_739_organization_touchpoint.XPATH_EFORMS_EXTENSION_ORGANIZATIONS_ORGANIZATION",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:Organizations/efac:Organization",
+)
+XPATH_COMPANY_PARTY_LEGAL_ENTITY_COMPANY_ID = register_xpath(
+    "bt_739_organization_touchpoint.XPATH_COMPANY_PARTY_LEGAL_ENTITY_COMPANY_ID",
+    "efac:Company/cac:PartyLegalEntity/cbc:companyID/text()",
+)
+XPATH_TOUCH_POINT = register_xpath(
+    "bt_739_organization_touchpoint.XPATH_TOUCH_POINT", "efac:TouchPoint"
+)
+XPATH_PARTY_IDENTIFICATION_ID_TOUCHPOINT = register_xpath(
+    "bt_739_organization_touchpoint.XPATH_PARTY_IDENTIFICATION_ID_TOUCHPOINT",
+    "cac:PartyIdentification/cbc:ID[@schemeName='touchpoint']/text()",
+)
+XPATH_CONTACT_TELEFAX = register_xpath(
+    "bt_739_organization_touchpoint.XPATH_CONTACT_TELEFAX",
+    "cac:Contact/cbc:Telefax/text()",
+)
+
+
+def parse_touchpoint_contact_fax(xml_content: XMLContent) -> dict | None:
     """Parse BT-739: Organization touchpoint contact fax number.
 
     Extracts fax numbers for contacting organizations via their touchpoints,
@@ -42,33 +60,18 @@ def parse_touchpoint_contact_fax(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"parties": []}
 
-        organizations = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
-            "/efext:EformsExtension/efac:Organizations/efac:Organization",
-            namespaces=NAMESPACES,
-        )
+        organizations = XPATH_EFORMS_EXTENSION_ORGANIZATIONS_ORGANIZATION(root)
 
         for org in organizations:
-            company_id = org.xpath(
-                "efac:Company/cac:PartyLegalEntity/cbc:companyID/text()",
-                namespaces=NAMESPACES,
-            )
+            company_id = XPATH_COMPANY_PARTY_LEGAL_ENTITY_COMPANY_ID(org)
 
-            touchpoints = org.xpath("efac:TouchPoint", namespaces=NAMESPACES)
+            touchpoints = XPATH_TOUCH_POINT(org)
             for touchpoint in touchpoints:
-                tp_id = touchpoint.xpath(
-                    "cac:PartyIdentification/cbc:ID[@schemeName='touchpoint']/text()",
-                    namespaces=NAMESPACES,
-                )
-                fax = touchpoint.xpath(
-                    "cac:Contact/cbc:Telefax/text()",
-                    namespaces=NAMESPACES,
-                )
+                tp_id = XPATH_PARTY_IDENTIFICATION_ID_TOUCHPOINT(touchpoint)
+                fax = XPATH_CONTACT_TELEFAX(touchpoint)
 
                 if tp_id and fax:
                     party_data = {
@@ -122,9 +125,7 @@ def merge_touchpoint_contact_fax(
     parties = release_json.setdefault("parties", [])
 
     for new_party in touchpoint_data["parties"]:
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             contact_point = existing_party.setdefault("contactPoint", {})
             contact_point["faxNumber"] = new_party["contactPoint"]["faxNumber"]
@@ -2,13 +2,12 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 # Mapping for BT-740: Buyer contracting entity status
 BUYER_TYPE_MAPPING = {
@@ -17,7 +16,21 @@ BUYER_TYPE_MAPPING = {
 }
 
 
-def parse_buyer_contracting_type(xml_content: str | bytes) -> dict | None:
+XPATH_CONTRACTING_PARTY_CONTRACTING_PARTY_TYPE = register_xpath(
+    "bt_740_procedure_buyer.XPATH_CONTRACTING_PARTY_CONTRACTING_PARTY_TYPE",
+    "/*/cac:ContractingParty/cac:ContractingPartyType",
+)
+XPATH_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "bt_740_procedure_buyer.XPATH_PARTY_PARTY_IDENTIFICATION_ID",
+    "cac:Party/cac:PartyIdentification/cbc:ID/text()",
+)
+XPATH_PARTY_TYPE_CODE_BUYER_CONTRACTING_TYPE = register_xpath(
+    "bt_740_procedure_buyer.XPATH_PARTY_TYPE_CODE_BUYER_CONTRACTING_TYPE",
+    "cbc:PartyTypeCode[@listName='buyer-contracting-type']/text()",
+)
+
+
+def parse_buyer_contracting_type(xml_content: XMLContent) -> dict | None:
     """Parse BT-740: Buyer contracting entity status.
 
     Extracts whether buyers are contracting entities and maps their classification
@@ -49,25 +62,16 @@ def parse_buyer_contracting_type(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"parties": []}
 
         # Find ContractingPartyType elements as per BT-740 XPath:
         # /*/cac:ContractingParty/cac:ContractingPartyType/cbc:PartyTypeCode[@listName='buyer-contracting-type']
-        contracting_parties = root.xpath(
-            "/*/cac:ContractingParty/cac:ContractingPartyType", namespaces=NAMESPACES
-        )
+        contracting_parties = XPATH_CONTRACTING_PARTY_CONTRACTING_PARTY_TYPE(root)
 
         for party in contracting_parties:
-            org_id = party.xpath(
-                "cac:Party/cac:PartyIdentification/cbc:ID/text()", namespaces=NAMESPACES
-            )
-            type_code = party.xpath(
-                "cbc:PartyTypeCode[@listName='buyer-contracting-type']/text()",
-                namespaces=NAMESPACES,
-            )
+            org_id = XPATH_PARTY_PARTY_IDENTIFICATION_ID(party)
+            type_code = XPATH_PARTY_TYPE_CODE_BUYER_CONTRACTING_TYPE(party)
 
             if org_id and type_code:
                 code = type_code[0]
@@ -127,7 +131,7 @@ def merge_buyer_contracting_type(
     parties = release_json.setdefault("parties", [])
 
     for new_party in buyer_type_data["parties"]:
-        existing_party = next((p for p in parties if p["id"] == new_party["id"]), None)
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             details = existing_party.setdefault("details", {})
             classifications = details.setdefault("classifications", [])
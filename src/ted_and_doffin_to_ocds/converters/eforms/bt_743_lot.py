@@ -2,16 +2,12 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 EINVOICING_MAPPING = {
     "required": "required",
@@ -20,7 +16,15 @@ EINVOICING_MAPPING = {
 }
 
 
-def parse_lot_einvoicing_policy(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_743_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_EINVOICING_EX = register_xpath(
+    "bt_743_lot.XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_EINVOICING_EX",
+    "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='einvoicing']"
+    "/cbc:ExecutionRequirementCode/text()",
+)
+
+
+def parse_lot_einvoicing_policy(xml_content: XMLContent) -> dict | None:
     """Parse BT-743: Electronic invoicing policy for lots.
 
     Extracts whether buyers will require, allow or not allow electronic invoices
@@ -47,22 +51,15 @@ def parse_lot_einvoicing_policy(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            einvoicing_code = lot.xpath(
-                "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='einvoicing']"
-                "/cbc:ExecutionRequirementCode/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            einvoicing_code = (
+                XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_EINVOICING_EX(lot)
             )
 
             if einvoicing_code:
@@ -115,7 +112,7 @@ def merge_lot_einvoicing_policy(
     lots = tender.setdefault("lots", [])
 
     for new_lot in einvoicing_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             contract_terms = existing_lot.setdefault("contractTerms", {})
             contract_terms["electronicInvoicingPolicy"] = new_lot["contractTerms"][
@@ -4,16 +4,22 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("bt_744_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_CONTRACT_EXECUTION_REQUIREMENT_ESIGNATURE_SUBMISSION_EXECUTI = register_xpath(
+    "bt_744_lot.XPATH_CONTRACT_EXECUTION_REQUIREMENT_ESIGNATURE_SUBMISSION_EXECUTI",
+    ".//cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='esignature-submission']"
+    "/cbc:ExecutionRequirementCode/text()",
+)
 
 
-def parse_lot_esignature_requirement(xml_content: str | bytes) -> dict | None:
+def parse_lot_esignature_requirement(xml_content: XMLContent) -> dict | None:
     """Parse BT-744: Electronic signature requirement for lots.
 
     Extracts whether advanced or qualified electronic signature/seal is required
@@ -40,22 +46,15 @@ def parse_lot_esignature_requirement(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            esignature = lot.xpath(
-                ".//cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='esignature-submission']"
-                "/cbc:ExecutionRequirementCode/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            esignature = (
+                XPATH_CONTRACT_EXECUTION_REQUIREMENT_ESIGNATURE_SUBMISSION_EXECUTI(lot)
             )
 
             if esignature:
@@ -106,7 +105,7 @@ def merge_lot_esignature_requirement(
     lots = tender.setdefault("lots", [])
 
     for new_lot in esignature_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             submission_terms = existing_lot.setdefault("submissionTerms", {})
             submission_terms["advancedElectronicSignatureRequired"] = new_lot[
@@ -3,13 +3,30 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_745_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI = register_xpath(
+    "bt_745_lot.XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI",
+    ".//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:Description[not(@languageID) or @languageID!='']/text()",
+)
+XPATH_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTIFICATION_DESCRIPTI = register_xpath(
+    "bt_745_lot.XPATH_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTIFICATION_DESCRIPTI",
+    ".//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:Description/@languageID",
+)
+XPATH_PROCUREMENT_PROJECT_LOT = register_xpath(
+    "bt_745_lot.XPATH_PROCUREMENT_PROJECT_LOT",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+)
+
+
 def parse_submission_nonelectronic_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the XML content to extract the submission non-electronic description for each lot.
 
@@ -21,32 +38,19 @@ def parse_submission_nonelectronic_description(
         None: If no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    xpath_query = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']"
-    lots = root.xpath(xpath_query, namespaces=namespaces)
+    lots = XPATH_PROCUREMENT_PROJECT_LOT(root)
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        description = lot.xpath(
-            ".//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:Description[not(@languageID) or @languageID!='']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        description = (
+            XPATH_TENDERING_PROCESS_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTI(lot)
         )
-        language_id = lot.xpath(
-            ".//cac:TenderingProcess/cac:ProcessJustification[cbc:ProcessReasonCode/@listName='no-esubmission-justification']/cbc:Description/@languageID",
-            namespaces=namespaces,
+        language_id = (
+            XPATH_PROCESS_JUSTIFICATION_NO_ESUBMISSION_JUSTIFICATION_DESCRIPTI(lot)
         )
 
         if description:
@@ -80,10 +84,7 @@ def merge_submission_nonelectronic_description(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in submission_nonelectronic_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["submissionMethodDetails"] = new_lot["submissionMethodDetails"]
         else:
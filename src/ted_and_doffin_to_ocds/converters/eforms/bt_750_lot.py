@@ -3,13 +3,37 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA = register_xpath(
+    "bt_750_lot.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA",
+    "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
+)
+XPATH_ID = register_xpath("bt_750_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_CALCULATION_EXPRESSION_CODE_USAGE = register_xpath(
+    "bt_750_lot.XPATH_CALCULATION_EXPRESSION_CODE_USAGE",
+    "cbc:CalculationExpressionCode[@listName='usage']/text()",
+)
+XPATH_NAME = register_xpath("bt_750_lot.XPATH_NAME", "cbc:Name/text()")
+XPATH_DESCRIPTION = register_xpath(
+    "bt_750_lot.XPATH_DESCRIPTION", "cbc:Description/text()"
+)
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA_2 = register_xpath(
+    "bt_750_lot.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA_2",
+    ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
+)
+XPATH_DESCRIPTION_2 = register_xpath(
+    "bt_750_lot.XPATH_DESCRIPTION_2", "cbc:Description"
+)
+
+
 def parse_selection_criteria(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse the XML content to extract the selection criteria name and description for each lot.
 
@@ -22,54 +46,36 @@ def parse_selection_criteria(
 
     """
     logger.debug("Starting parse_selection_criteria")
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"tender": {"lots": []}}
 
     # Get all lots
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
     logger.debug("Found %d lots", len(lots))
 
     # Get root level selection criteria first
-    root_selection_criteria = root.xpath(
-        "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
-        namespaces=namespaces,
+    root_selection_criteria = (
+        XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA(root)
     )
     logger.debug("Found %d root selection criteria", len(root_selection_criteria))
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+        lot_id = XPATH_ID(lot)[0]
         logger.debug("Processing lot with ID: %s", lot_id)
 
         lot_data = {"id": lot_id, "selectionCriteria": {"criteria": []}}
 
         # Process root level criteria
         for criterion in root_selection_criteria:
-            usage = criterion.xpath(
-                "cbc:CalculationExpressionCode[@listName='usage']/text()",
-                namespaces=namespaces,
-            )
+            usage = XPATH_CALCULATION_EXPRESSION_CODE_USAGE(criterion)
             if usage and usage[0] != "used":
                 logger.debug("Skipping root criterion with usage: %s", usage[0])
                 continue
 
-            name = criterion.xpath("cbc:Name/text()", namespaces=namespaces)
-            description = criterion.xpath(
-                "cbc:Description/text()",
-                namespaces=namespaces,
-            )
+            name = XPATH_NAME(criterion)
+            description = XPATH_DESCRIPTION(criterion)
 
             logger.debug("Root criterion name: %s, description: %s", name, description)
 
@@ -87,25 +93,18 @@ def parse_selection_criteria(
                 logger.debug("Added root criterion: %s", criterion_data)
 
         # Process lot level criteria (BT-750)
-        lot_selection_criteria = lot.xpath(
-            ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
-            namespaces=namespaces,
+        lot_selection_criteria = (
+            XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA_2(lot)
         )
         logger.debug("Found %d lot selection criteria", len(lot_selection_criteria))
 
         for criterion in lot_selection_criteria:
-            usage = criterion.xpath(
-                "cbc:CalculationExpressionCode[@listName='usage']/text()",
-                namespaces=namespaces,
-            )
+            usage = XPATH_CALCULATION_EXPRESSION_CODE_USAGE(criterion)
             if usage and usage[0] != "used":
                 logger.debug("Skipping lot criterion with usage: %s", usage[0])
                 continue
 
-            description_element = criterion.xpath(
-                "cbc:Description",
-                namespaces=namespaces,
-            )
+            description_element = XPATH_DESCRIPTION_2(criterion)
             if description_element:
                 description = description_element[0].text
                 language_id = description_element[0].get("languageID")
@@ -146,10 +145,7 @@ def merge_selection_criteria(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in selection_criteria_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_criteria = existing_lot.setdefault(
                 "selectionCriteria",
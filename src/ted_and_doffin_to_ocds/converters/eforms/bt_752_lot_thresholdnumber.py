@@ -4,20 +4,34 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_752_lot_thresholdnumber.XPATH_ID", "cbc:ID/text()")
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA = register_xpath(
+    "bt_752_lot_thresholdnumber.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA",
+    ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
+)
+XPATH_CALCULATION_EXPRESSION_CODE_USAGE = register_xpath(
+    "bt_752_lot_thresholdnumber.XPATH_CALCULATION_EXPRESSION_CODE_USAGE",
+    "cbc:CalculationExpressionCode[@listName='usage']/text()",
+)
+XPATH_ID_2 = register_xpath("bt_752_lot_thresholdnumber.XPATH_ID_2", "efbc:ID/text()")
+XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD = register_xpath(
+    "bt_752_lot_thresholdnumber.XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD",
+    "efac:CriterionParameter[efbc:ParameterCode/@listName='number-threshold']",
+)
+XPATH_PARAMETER_NUMERIC = register_xpath(
+    "bt_752_lot_thresholdnumber.XPATH_PARAMETER_NUMERIC", "efbc:ParameterNumeric/text()"
+)
 
 
 def parse_selection_criteria_threshold_number(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse BT-752: Selection criteria threshold numbers for lots.
 
@@ -54,21 +68,15 @@ def parse_selection_criteria_threshold_number(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            selection_criteria = lot.xpath(
-                ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            selection_criteria = (
+                XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA(lot)
             )
 
             if not selection_criteria:
@@ -79,13 +87,10 @@ def parse_selection_criteria_threshold_number(
             for criterion in selection_criteria:
                 # No longer skipping criteria marked as "not-used"
                 # Get usage for logging purposes only
-                usage_code = criterion.xpath(
-                    "cbc:CalculationExpressionCode[@listName='usage']/text()",
-                    namespaces=NAMESPACES,
-                )
+                usage_code = XPATH_CALCULATION_EXPRESSION_CODE_USAGE(criterion)
 
                 # Extract criterion ID or use a position-based identifier if ID not available
-                criterion_id = criterion.xpath("efbc:ID/text()", namespaces=NAMESPACES)
+                criterion_id = XPATH_ID_2(criterion)
                 criterion_id = (
                     criterion_id[0]
                     if criterion_id
@@ -93,9 +98,8 @@ def parse_selection_criteria_threshold_number(
                 )
 
                 # Find threshold parameters for this criterion
-                threshold_parameters = criterion.xpath(
-                    "efac:CriterionParameter[efbc:ParameterCode/@listName='number-threshold']",
-                    namespaces=NAMESPACES,
+                threshold_parameters = XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD(
+                    criterion
                 )
 
                 if not threshold_parameters:
@@ -104,9 +108,7 @@ def parse_selection_criteria_threshold_number(
                 criterion_data = {"id": criterion_id, "numbers": []}
 
                 for param in threshold_parameters:
-                    threshold = param.xpath(
-                        "efbc:ParameterNumeric/text()", namespaces=NAMESPACES
-                    )
+                    threshold = XPATH_PARAMETER_NUMERIC(param)
                     if threshold:
                         try:
                             number = float(threshold[0])
@@ -168,10 +170,7 @@ def merge_selection_criteria_threshold_number(
     updated_criteria = 0
 
     for new_lot in threshold_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
 
         if not existing_lot:
             # If lot doesn't exist yet, add it with the threshold data
@@ -193,9 +192,7 @@ def merge_selection_criteria_threshold_number(
 
             # First attempt to match by ID if available
             if criterion_id:
-                existing_criterion = next(
-                    (c for c in existing_criteria if c.get("id") == criterion_id), None
-                )
+                existing_criterion = find_by_id(existing_criteria, criterion_id)
 
             # If no match by ID and no ID provided, find first criterion without numbers
             if not existing_criterion:
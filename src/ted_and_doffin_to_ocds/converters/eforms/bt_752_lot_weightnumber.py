@@ -4,20 +4,25 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_752_lot_weightnumber.XPATH_ID", "cbc:ID/text()")
+XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_CRITERION_PARAMETER_NUMB = register_xpath(
+    "bt_752_lot_weightnumber.XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_CRITERION_PARAMETER_NUMB",
+    ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria/efac:CriterionParameter[efbc:ParameterCode/@listName='number-weight']",
+)
+XPATH_PARAMETER_NUMERIC = register_xpath(
+    "bt_752_lot_weightnumber.XPATH_PARAMETER_NUMERIC", "efbc:ParameterNumeric/text()"
+)
 
 
 def parse_selection_criteria_weight_number(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse BT-752: Selection criteria weight numbers for lots.
 
@@ -53,30 +58,22 @@ def parse_selection_criteria_weight_number(
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            criteria = lot.xpath(
-                ".//cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:SelectionCriteria/efac:CriterionParameter[efbc:ParameterCode/@listName='number-weight']",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            criteria = (
+                XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_CRITERION_PARAMETER_NUMB(lot)
             )
 
             if criteria:
                 lot_data = {"id": lot_id, "selectionCriteria": {"criteria": []}}
 
                 for criterion in criteria:
-                    weight = criterion.xpath(
-                        "efbc:ParameterNumeric/text()", namespaces=NAMESPACES
-                    )
+                    weight = XPATH_PARAMETER_NUMERIC(criterion)
                     if weight:
                         try:
                             number = float(weight[0])
@@ -127,7 +124,7 @@ def merge_selection_criteria_weight_number(
     lots = tender.setdefault("lots", [])
 
     for new_lot in weight_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             existing_criteria = existing_lot.setdefault(
                 "selectionCriteria", {}
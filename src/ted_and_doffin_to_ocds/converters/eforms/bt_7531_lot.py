@@ -3,7 +3,9 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +19,26 @@ WEIGHT_MAPPING = {
     "ord": "order",
 }
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_ID = register_xpath("bt_7531_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA = register_xpath(
+    "bt_7531_lot.XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA",
+    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:SelectionCriteria",
+)
+XPATH_CALCULATION_EXPRESSION_CODE_USAGE = register_xpath(
+    "bt_7531_lot.XPATH_CALCULATION_EXPRESSION_CODE_USAGE",
+    "cbc:CalculationExpressionCode[@listName='usage']/text()",
+)
+XPATH_CRITERION_PARAMETER_NUMBER_WEIGHT_PARAMETER_CODE = register_xpath(
+    "bt_7531_lot.XPATH_CRITERION_PARAMETER_NUMBER_WEIGHT_PARAMETER_CODE",
+    "efac:CriterionParameter[efbc:ParameterCode/@listName='number-weight']"
+    "/efbc:ParameterCode/text()",
+)
 
 
 def parse_selection_criteria_number_weight(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse selection criteria number weight (BT-7531) from XML content.
 
@@ -42,26 +52,18 @@ def parse_selection_criteria_number_weight(
         Dictionary containing lots with selection criteria or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot")
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
+                lot_id = XPATH_ID(lot)[0]
 
-                selection_criteria = lot.xpath(
-                    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                    "efext:EformsExtension/efac:SelectionCriteria",
-                    namespaces=NAMESPACES,
+                selection_criteria = (
+                    XPATH_EXTENSION_CONTENT_EFORMS_EXTENSION_SELECTION_CRITERIA(lot)
                 )
 
                 if selection_criteria:
@@ -71,17 +73,14 @@ def parse_selection_criteria_number_weight(
                     }
 
                     for criterion in selection_criteria:
-                        usage = criterion.xpath(
-                            "cbc:CalculationExpressionCode[@listName='usage']/text()",
-                            namespaces=NAMESPACES,
-                        )
+                        usage = XPATH_CALCULATION_EXPRESSION_CODE_USAGE(criterion)
                         if usage and usage[0] != "used":
                             continue
 
-                        weights = criterion.xpath(
-                            "efac:CriterionParameter[efbc:ParameterCode/@listName='number-weight']"
-                            "/efbc:ParameterCode/text()",
-                            namespaces=NAMESPACES,
+                        weights = (
+                            XPATH_CRITERION_PARAMETER_NUMBER_WEIGHT_PARAMETER_CODE(
+                                criterion
+                            )
                         )
 
                         if weights:
@@ -142,10 +141,7 @@ def merge_selection_criteria_number_weight(
     valid_lot_ids = {lot["id"] for lot in number_weight_data["tender"]["lots"]}
 
     for new_lot in number_weight_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["selectionCriteria"] = new_lot["selectionCriteria"]
         else:
@@ -2,13 +2,29 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_7532_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_SELECTION_CRITERIA_USAGE = register_xpath(
+    "bt_7532_lot.XPATH_SELECTION_CRITERIA_USAGE",
+    ".//efac:SelectionCriteria[cbc:CalculationExpressionCode[@listName='usage'] = 'used']",
+)
+XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD = register_xpath(
+    "bt_7532_lot.XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD",
+    ".//efac:CriterionParameter[efbc:ParameterCode/@listName='number-threshold']",
+)
+XPATH_PARAMETER_CODE = register_xpath(
+    "bt_7532_lot.XPATH_PARAMETER_CODE", "efbc:ParameterCode/text()"
+)
+
+
 def parse_selection_criteria_number_threshold(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse the XML content to extract the selection criteria number threshold information.
 
@@ -19,17 +35,7 @@ def parse_selection_criteria_number_threshold(
         Optional[Dict]: A dictionary containing the parsed data, or None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     threshold_mapping: dict[str, str] = {
         "min-score": "minimumScore",
@@ -38,17 +44,11 @@ def parse_selection_criteria_number_threshold(
 
     result: dict[str, dict[str, list[dict]]] = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        criteria = lot.xpath(
-            ".//efac:SelectionCriteria[cbc:CalculationExpressionCode[@listName='usage'] = 'used']",
-            namespaces=namespaces,
-        )
+        lot_id: str = XPATH_ID(lot)[0]
+        criteria = XPATH_SELECTION_CRITERIA_USAGE(lot)
 
         lot_data: dict[str, str | dict[str, list]] = {
             "id": lot_id,
@@ -57,16 +57,10 @@ def parse_selection_criteria_number_threshold(
 
         for criterion in criteria:
             criterion_data: dict[str, list] = {"numbers": []}
-            parameters = criterion.xpath(
-                ".//efac:CriterionParameter[efbc:ParameterCode/@listName='number-threshold']",
-                namespaces=namespaces,
-            )
+            parameters = XPATH_CRITERION_PARAMETER_NUMBER_THRESHOLD(criterion)
 
             for parameter in parameters:
-                threshold_code: str = parameter.xpath(
-                    "efbc:ParameterCode/text()",
-                    namespaces=namespaces,
-                )[0]
+                threshold_code: str = XPATH_PARAMETER_CODE(parameter)[0]
                 threshold_value: str | None = threshold_mapping.get(threshold_code)
 
                 if threshold_value:
@@ -105,34 +99,21 @@ def merge_selection_criteria_number_threshold(
     )
 
     for new_lot in parsed_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_criteria = existing_lot.setdefault(
                 "selectionCriteria",
                 {},
             ).setdefault("criteria", [])
             for new_criterion in new_lot["selectionCriteria"]["criteria"]:
-                existing_criterion = next(
-                    (
-                        c
-                        for c in existing_criteria
-                        if c.get("id") == new_criterion.get("id")
-                    ),
-                    None,
+                existing_criterion = find_by_id(
+                    existing_criteria, new_criterion.get("id")
                 )
                 if existing_criterion:
                     existing_numbers = existing_criterion.setdefault("numbers", [])
                     for new_number in new_criterion["numbers"]:
-                        existing_number = next(
-                            (
-                                n
-                                for n in existing_numbers
-                                if n.get("id") == new_number.get("id")
-                            ),
-                            None,
+                        existing_number = find_by_id(
+                            existing_numbers, new_number.get("id")
                         )
                         if existing_number:
                             existing_number.update(new_number)
@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_accessibility_criteria(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_754_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ACCESSIBILIT = register_xpath(
+    "bt_754_lot.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ACCESSIBILIT",
+    "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='accessibility']/cbc:ProcurementTypeCode/text()",
+)
+
+
+def parse_accessibility_criteria(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the accessibility criteria information for each lot.
 
     Args:
@@ -17,30 +26,16 @@ def parse_accessibility_criteria(xml_content: str | bytes) -> dict | None:
         Optional[Dict]: A dictionary containing the parsed data, or None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result: dict[str, dict[str, list]] = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        accessibility_code = lot.xpath(
-            "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='accessibility']/cbc:ProcurementTypeCode/text()",
-            namespaces=namespaces,
+        lot_id: str = XPATH_ID(lot)[0]
+        accessibility_code = (
+            XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ACCESSIBILIT(lot)
         )
 
         lot_data: dict[str, str | bool | None] = {
@@ -81,10 +76,7 @@ def merge_accessibility_criteria(release_json: dict, parsed_data: dict | None) -
     tender_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in parsed_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_lot["hasAccessibilityCriteria"] = new_lot[
                 "hasAccessibilityCriteria"
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_pin_competition_termination(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_PROCESS_TERMINATED_INDICATOR = register_xpath(
+    "bt_756_procedure.XPATH_TENDERING_PROCESS_TERMINATED_INDICATOR",
+    "//cac:TenderingProcess/cbc:TerminatedIndicator/text()",
+)
+
+
+def parse_pin_competition_termination(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the PIN competition termination information.
 
     Args:
@@ -17,22 +24,9 @@ def parse_pin_competition_termination(xml_content: str | bytes) -> dict | None:
         Optional[Dict]: A dictionary containing the parsed data, or None if no relevant data is found.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    terminated_indicator = root.xpath(
-        "//cac:TenderingProcess/cbc:TerminatedIndicator/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    terminated_indicator = XPATH_TENDERING_PROCESS_TERMINATED_INDICATOR(root)
 
     if terminated_indicator and terminated_indicator[0].lower() == "true":
         return {"tender": {"status": "complete"}}
@@ -1,20 +1,27 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT = register_xpath(
+    "bt_759_lotresult.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:NoticeResult/efac:LotResult",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_759_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_RECEIVED_SUBMISSIONS_STATISTICS_STATISTICS_NUMERIC = register_xpath(
+    "bt_759_lotresult.XPATH_RECEIVED_SUBMISSIONS_STATISTICS_STATISTICS_NUMERIC",
+    "efac:ReceivedSubmissionsStatistics/efbc:StatisticsNumeric/text()",
+)
 
-def parse_received_submissions_count(xml_content: str | bytes) -> dict | None:
+
+def parse_received_submissions_count(xml_content: XMLContent) -> dict | None:
     """Parse BT-759: Number of received submissions for lots.
 
     Counts tenders or participation requests, with variants or multiple tenders
@@ -41,33 +48,20 @@ def parse_received_submissions_count(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
         result = {"bids": {"statistics": []}}
 
         # Try both the extended path and a simpler direct path
-        lot_results = root.xpath(
-            "//efac:NoticeResult/efac:LotResult",
-            namespaces=NAMESPACES,
-        )
+        lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
         if not lot_results:
             # Try original complex path if simple path didn't work
-            lot_results = root.xpath(
-                "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
-                "/efext:EformsExtension/efac:NoticeResult/efac:LotResult",
-                namespaces=NAMESPACES,
-            )
+            lot_results = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT(root)
 
         for lot_result in lot_results:
-            lot_id = lot_result.xpath(
-                "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()", namespaces=NAMESPACES
-            )
-            count = lot_result.xpath(
-                "efac:ReceivedSubmissionsStatistics/efbc:StatisticsNumeric/text()",
-                namespaces=NAMESPACES,
-            )
+            lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
+            count = XPATH_RECEIVED_SUBMISSIONS_STATISTICS_STATISTICS_NUMERIC(lot_result)
 
             if lot_id and count:
                 try:
@@ -1,12 +1,25 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_75_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_REQUIRED_FINANCIAL_GUARANTEE_DESCRIPTION = register_xpath(
+    "bt_75_lot.XPATH_TENDERING_TERMS_REQUIRED_FINANCIAL_GUARANTEE_DESCRIPTION",
+    "cac:TenderingTerms/cac:RequiredFinancialGuarantee/cbc:Description/text()",
+)
+XPATH_PROCUREMENT_PROJECT_LOT = register_xpath(
+    "bt_75_lot.XPATH_PROCUREMENT_PROJECT_LOT",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+)
+
+
 def parse_guarantee_required_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse guarantee required description from XML for each lot.
 
@@ -36,28 +49,16 @@ def parse_guarantee_required_description(
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    xpath_query = "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']"
-    lots = root.xpath(xpath_query, namespaces=namespaces)
+    lots = XPATH_PROCUREMENT_PROJECT_LOT(root)
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        guarantee_description = lot.xpath(
-            "cac:TenderingTerms/cac:RequiredFinancialGuarantee/cbc:Description/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        guarantee_description = (
+            XPATH_TENDERING_TERMS_REQUIRED_FINANCIAL_GUARANTEE_DESCRIPTION(lot)
         )
 
         if guarantee_description:
@@ -97,10 +98,7 @@ def merge_guarantee_required_description(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in guarantee_description_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 new_lot["submissionTerms"],
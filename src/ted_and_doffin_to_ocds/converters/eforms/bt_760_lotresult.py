@@ -4,16 +4,11 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
 SUBMISSION_TYPE_MAPPING = {
     "part-req": "requests",
@@ -33,7 +28,29 @@ SUBMISSION_TYPE_MAPPING = {
 }
 
 
-def parse_received_submissions_type(xml_content: str | bytes) -> dict | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT = register_xpath(
+    "bt_760_lotresult.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:NoticeResult/efac:LotResult",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "bt_760_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_RECEIVED_SUBMISSIONS_STATISTICS = register_xpath(
+    "bt_760_lotresult.XPATH_RECEIVED_SUBMISSIONS_STATISTICS",
+    "efac:ReceivedSubmissionsStatistics",
+)
+XPATH_STATISTICS_CODE_RECEIVED_SUBMISSION_TYPE = register_xpath(
+    "bt_760_lotresult.XPATH_STATISTICS_CODE_RECEIVED_SUBMISSION_TYPE",
+    "efbc:StatisticsCode[@listName='received-submission-type']/text()",
+)
+XPATH_STATISTICS_NUMERIC = register_xpath(
+    "bt_760_lotresult.XPATH_STATISTICS_NUMERIC", "efbc:StatisticsNumeric/text()"
+)
+
+
+def parse_received_submissions_type(xml_content: XMLContent) -> dict | None:
     """Parse BT-760: Types of received submissions for lots.
 
     Maps counts of different submission types (SME, micro, foreign, etc).
@@ -60,21 +77,13 @@ def parse_received_submissions_type(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"bids": {"statistics": []}}
 
-        lot_results = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
-            "/efext:EformsExtension/efac:NoticeResult/efac:LotResult",
-            namespaces=NAMESPACES,
-        )
+        lot_results = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT(root)
 
         for lot_result in lot_results:
-            lot_id = lot_result.xpath(
-                "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()", namespaces=NAMESPACES
-            )
+            lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)
 
             if not lot_id:
                 continue
@@ -82,27 +91,18 @@ def parse_received_submissions_type(xml_content: str | bytes) -> dict | None:
             lot_id = lot_id[0]
 
             # Find all ReceivedSubmissionsStatistics elements
-            statistics_elements = lot_result.xpath(
-                "efac:ReceivedSubmissionsStatistics",
-                namespaces=NAMESPACES,
-            )
+            statistics_elements = XPATH_RECEIVED_SUBMISSIONS_STATISTICS(lot_result)
 
             for stat_element in statistics_elements:
                 # Get the type code
-                stat_code = stat_element.xpath(
-                    "efbc:StatisticsCode[@listName='received-submission-type']/text()",
-                    namespaces=NAMESPACES,
-                )
+                stat_code = XPATH_STATISTICS_CODE_RECEIVED_SUBMISSION_TYPE(stat_element)
                 if not stat_code:
                     continue
 
                 stat_code = stat_code[0]
 
                 # Get the corresponding count value
-                stat_value = stat_element.xpath(
-                    "efbc:StatisticsNumeric/text()",
-                    namespaces=NAMESPACES,
-                )
+                stat_value = XPATH_STATISTICS_NUMERIC(stat_element)
 
                 # If no value is provided, skip this statistic
                 if not stat_value:
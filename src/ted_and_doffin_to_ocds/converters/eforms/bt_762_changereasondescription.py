@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_change_reason_description(xml_content: str) -> list[dict[str, str]] | None:
+XPATH_CHANGES_CHANGE_REASON_REASON_DESCRIPTION = register_xpath(
+    "bt_762_changereasondescription.XPATH_CHANGES_CHANGE_REASON_REASON_DESCRIPTION",
+    "//efac:Changes/efac:ChangeReason/efbc:ReasonDescription/text()",
+)
+
+
+def parse_change_reason_description(
+    xml_content: XMLContent,
+) -> list[dict[str, str]] | None:
     """Parse the XML content to extract the change reason description.
 
     Args:
@@ -22,22 +31,9 @@ def parse_change_reason_description(xml_content: str) -> list[dict[str, str]] |
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    change_reasons = root.xpath(
-        "//efac:Changes/efac:ChangeReason/efbc:ReasonDescription/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    change_reasons = XPATH_CHANGES_CHANGE_REASON_REASON_DESCRIPTION(root)
 
     if change_reasons:
         return [{"rationale": reason.strip()} for reason in change_reasons]
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_lots_all_required(xml_content: str) -> dict | None:
+XPATH_TENDERING_PROCESS_PART_PRESENTATION_CODE_TENDERLOT_PRESENTAT = register_xpath(
+    "bt_763_lotsallrequired.XPATH_TENDERING_PROCESS_PART_PRESENTATION_CODE_TENDERLOT_PRESENTAT",
+    "//cac:TenderingProcess/cbc:partPresentationCode[@listName='tenderlot-presentation']/text()",
+)
+
+
+def parse_lots_all_required(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the partPresentationCode for Lots All Required.
 
     Args:
@@ -17,21 +24,10 @@ def parse_lots_all_required(xml_content: str) -> dict | None:
         Optional[Dict]: A dictionary containing the parsed data if 'all' is specified, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
-
-    part_presentation_code = root.xpath(
-        "//cac:TenderingProcess/cbc:partPresentationCode[@listName='tenderlot-presentation']/text()",
-        namespaces=namespaces,
+    root = get_root(xml_content)
+
+    part_presentation_code = (
+        XPATH_TENDERING_PROCESS_PART_PRESENTATION_CODE_TENDERLOT_PRESENTAT(root)
     )
 
     if part_presentation_code and part_presentation_code[0].lower() == "all":
@@ -2,12 +2,23 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_submission_electronic_catalogue(xml_content: str) -> list[dict] | None:
+XPATH_ID = register_xpath(
+    "bt_764_submissionelectroniccatalogue.XPATH_ID", "cbc:ID/text()"
+)
+XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_ECATALOG_SUBM = register_xpath(
+    "bt_764_submissionelectroniccatalogue.XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_ECATALOG_SUBM",
+    "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='ecatalog-submission']/cbc:ExecutionRequirementCode/text()",
+)
+
+
+def parse_submission_electronic_catalogue(xml_content: XMLContent) -> list[dict] | None:
     """Parse the XML content to extract the Submission Electronic Catalogue policy for each lot.
 
     Args:
@@ -17,17 +28,7 @@ def parse_submission_electronic_catalogue(xml_content: str) -> list[dict] | None
         Optional[List[Dict]]: A list of dictionaries containing the parsed data if found, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     policy_mapping = {
         "required": "required",
@@ -36,17 +37,11 @@ def parse_submission_electronic_catalogue(xml_content: str) -> list[dict] | None
     }
 
     lots_data = []
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        policy = lot.xpath(
-            "cac:TenderingTerms/cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='ecatalog-submission']/cbc:ExecutionRequirementCode/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        policy = XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_ECATALOG_SUBM(lot)
 
         if policy:
             mapped_policy = policy_mapping.get(policy[0], policy[0])
@@ -82,10 +77,7 @@ def merge_submission_electronic_catalogue(
     lots = tender.setdefault("lots", [])
 
     for lot_data in submission_electronic_catalogue_data:
-        existing_lot = next(
-            (lot for lot in lots if lot.get("id") == lot_data["id"]),
-            None,
-        )
+        existing_lot = find_by_id(lots, lot_data["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 lot_data["submissionTerms"],
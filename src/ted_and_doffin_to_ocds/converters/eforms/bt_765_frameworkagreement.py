@@ -2,12 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_framework_agreement(xml_content: str) -> dict[str, dict] | None:
+XPATH_ID = register_xpath("bt_765_frameworkagreement.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON = register_xpath(
+    "bt_765_frameworkagreement.XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON",
+    "cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='framework-agreement']/cbc:ContractingSystemTypeCode/text()",
+)
+
+
+def parse_framework_agreement(xml_content: XMLContent) -> dict[str, dict] | None:
     """Parse the XML content to extract the Framework Agreement details for each lot.
 
     Args:
@@ -17,17 +25,7 @@ def parse_framework_agreement(xml_content: str) -> dict[str, dict] | None:
         Optional[Dict[str, Dict]]: A dictionary mapping lot IDs to their framework agreement data if found, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     method_mapping = {
         "fa-mix": "withAndWithoutReopeningCompetition",
@@ -36,16 +34,12 @@ def parse_framework_agreement(xml_content: str) -> dict[str, dict] | None:
     }
 
     lots_data = {}
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        framework_agreement = lot.xpath(
-            "cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='framework-agreement']/cbc:ContractingSystemTypeCode/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        framework_agreement = (
+            XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON(lot)
         )
 
         if framework_agreement and framework_agreement[0] in method_mapping:
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_framework_agreement(xml_content: str) -> dict:
+XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON = register_xpath(
+    "bt_765_partframeworkagreement.XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='framework-agreement']/cbc:ContractingSystemTypeCode/text()",
+)
+
+
+def parse_part_framework_agreement(xml_content: XMLContent) -> dict:
     """Parse the XML content to extract the Framework Agreement details for the part.
 
     Args:
@@ -17,17 +24,7 @@ def parse_part_framework_agreement(xml_content: str) -> dict:
         Dict: A dictionary containing the parsed data.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     method_mapping = {
         "fa-mix": "withAndWithoutReopeningCompetition",
@@ -35,9 +32,8 @@ def parse_part_framework_agreement(xml_content: str) -> dict:
         "fa-wo-rc": "withoutReopeningCompetition",
     }
 
-    framework_agreement = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='framework-agreement']/cbc:ContractingSystemTypeCode/text()",
-        namespaces=namespaces,
+    framework_agreement = (
+        XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_FRAMEWORK_AGREEMENT_CON(root)
     )
 
     result = {"tender": {"techniques": {}}}
@@ -2,12 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_dynamic_purchasing_system(xml_content: str) -> dict[str, dict] | None:
+XPATH_ID = register_xpath("bt_766_dynamicpurchasingsystem.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S = register_xpath(
+    "bt_766_dynamicpurchasingsystem.XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S",
+    "cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']/cbc:ContractingSystemTypeCode/text()",
+)
+
+
+def parse_dynamic_purchasing_system(xml_content: XMLContent) -> dict[str, dict] | None:
     """Parse the XML content to extract the Dynamic Purchasing System details for each lot.
 
     Args:
@@ -17,31 +25,17 @@ def parse_dynamic_purchasing_system(xml_content: str) -> dict[str, dict] | None:
         Optional[Dict[str, Dict]]: A dictionary mapping lot IDs to their DPS data if found, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     type_mapping = {"dps-list": "closed", "dps-nlist": "open"}
 
     lots_data = {}
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        dps_usage = lot.xpath(
-            "cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']/cbc:ContractingSystemTypeCode/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        dps_usage = XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S(
+            lot
         )
 
         if dps_usage and dps_usage[0] != "none":
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_part_dynamic_purchasing_system(xml_content: str) -> dict | None:
+XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S = register_xpath(
+    "bt_766_partdynamicpurchasingsystem.XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S",
+    "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']/cbc:ContractingSystemTypeCode/text()",
+)
+
+
+def parse_part_dynamic_purchasing_system(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the Dynamic Purchasing System details for the part.
 
     Args:
@@ -17,24 +24,11 @@ def parse_part_dynamic_purchasing_system(xml_content: str) -> dict | None:
         Optional[Dict]: A dictionary containing the parsed data if found, None otherwise.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     type_mapping = {"dps-list": "closed", "dps-nlist": "open"}
 
-    dps_usage = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']/cac:TenderingProcess/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']/cbc:ContractingSystemTypeCode/text()",
-        namespaces=namespaces,
-    )
+    dps_usage = XPATH_TENDERING_PROCESS_CONTRACTING_SYSTEM_DPS_USAGE_CONTRACTING_S(root)
 
     if not dps_usage or dps_usage[0] == "none":
         return None
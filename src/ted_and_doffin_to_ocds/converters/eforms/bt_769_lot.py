@@ -2,12 +2,21 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_multiple_tenders(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_769_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_MULTIPLE_TENDERS_CODE_PERMISSION = register_xpath(
+    "bt_769_lot.XPATH_TENDERING_TERMS_MULTIPLE_TENDERS_CODE_PERMISSION",
+    "cac:TenderingTerms/cbc:MultipleTendersCode[@listName='permission']/text()",
+)
+
+
+def parse_multiple_tenders(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the multiple tenders information for each lot.
 
     Args:
@@ -33,31 +42,16 @@ def parse_multiple_tenders(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result: dict[str, dict] = {"tender": {"lots": []}}
 
-    lots: list = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots: list = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        multiple_tenders_code: list = lot.xpath(
-            "cac:TenderingTerms/cbc:MultipleTendersCode[@listName='permission']/text()",
-            namespaces=namespaces,
+        lot_id: str = XPATH_ID(lot)[0]
+        multiple_tenders_code: list = (
+            XPATH_TENDERING_TERMS_MULTIPLE_TENDERS_CODE_PERMISSION(lot)
         )
 
         if multiple_tenders_code:
@@ -96,10 +90,7 @@ def merge_multiple_tenders(
     existing_lots: list = tender.setdefault("lots", [])
 
     for new_lot in multiple_tenders_data["tender"]["lots"]:
-        existing_lot: dict | None = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot: dict | None = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 new_lot["submissionTerms"],
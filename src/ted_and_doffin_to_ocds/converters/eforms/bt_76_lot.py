@@ -1,11 +1,20 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tenderer_legal_form(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_76_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_COMPANY_LEGAL = register_xpath(
+    "bt_76_lot.XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_COMPANY_LEGAL",
+    "cac:TenderingTerms/cac:TendererQualificationRequest[not(cac:SpecificTendererRequirement)]/cbc:CompanyLegalForm",
+)
+
+
+def parse_tenderer_legal_form(xml_content: XMLContent) -> dict | None:
     """Parse tenderer legal form requirements from XML for each lot.
 
     Extract information about the legal form that must be taken by a group
@@ -35,30 +44,16 @@ def parse_tenderer_legal_form(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result: dict[str, dict[str, list]] = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        legal_form_elements = lot.xpath(
-            "cac:TenderingTerms/cac:TendererQualificationRequest[not(cac:SpecificTendererRequirement)]/cbc:CompanyLegalForm",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        legal_form_elements = (
+            XPATH_TENDERING_TERMS_TENDERER_QUALIFICATION_REQUEST_COMPANY_LEGAL(lot)
         )
 
         if legal_form_elements:
@@ -114,10 +109,7 @@ def merge_tenderer_legal_form(
     tender_lots = release_json.setdefault("tender", {}).setdefault("lots", [])
 
     for new_lot in tenderer_legal_form_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in tender_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(tender_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractTerms", {}).update(
                 new_lot["contractTerms"],
@@ -2,13 +2,27 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_772_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERER_QUALIFICATION_REQUEST_RESERVED_PROCUREMENT_SPECIFIC = register_xpath(
+    "bt_772_lot.XPATH_TENDERER_QUALIFICATION_REQUEST_RESERVED_PROCUREMENT_SPECIFIC",
+    "cac:TenderingTerms/cac:TendererQualificationRequest"
+    "[not(cbc:CompanyLegalFormCode)]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='reserved-procurement'])]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='selection-criteria-source'])]"
+    "/cac:SpecificTendererRequirement[cbc:TendererRequirementTypeCode/@listName='missing-info-submission']"
+    "/cbc:Description/text()",
+)
+
+
 def parse_late_tenderer_info_description(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, str]]]] | None:
     """Parse XML content to extract late tenderer information description (BT-772).
 
@@ -33,36 +47,16 @@ def parse_late_tenderer_info_description(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result: dict[str, dict] = {"tender": {"lots": []}}
 
-    lots: list = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots: list = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        description: list = lot.xpath(
-            "cac:TenderingTerms/cac:TendererQualificationRequest"
-            "[not(cbc:CompanyLegalFormCode)]"
-            "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='reserved-procurement'])]"
-            "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='selection-criteria-source'])]"
-            "/cac:SpecificTendererRequirement[cbc:TendererRequirementTypeCode/@listName='missing-info-submission']"
-            "/cbc:Description/text()",
-            namespaces=namespaces,
+        lot_id: str = XPATH_ID(lot)[0]
+        description: list = (
+            XPATH_TENDERER_QUALIFICATION_REQUEST_RESERVED_PROCUREMENT_SPECIFIC(lot)
         )
 
         if description:
@@ -97,10 +91,7 @@ def merge_late_tenderer_info_description(
     existing_lots: list = tender.setdefault("lots", [])
 
     for new_lot in late_tenderer_info_description["tender"]["lots"]:
-        existing_lot: dict | None = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot: dict | None = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             if "submissionMethodDetails" in existing_lot:
                 existing_lot["submissionMethodDetails"] += (
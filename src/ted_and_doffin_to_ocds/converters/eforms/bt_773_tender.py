@@ -2,12 +2,26 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_subcontracting(xml_content: str | bytes) -> dict | None:
+XPATH_ID_TENDER = register_xpath(
+    "bt_773_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_CODE = register_xpath(
+    "bt_773_tender.XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_CODE",
+    "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermCode/text()",
+)
+XPATH_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "bt_773_tender.XPATH_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+
+
+def parse_subcontracting(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the subcontracting information for each tender.
 
     Handles Business Term BT-773-Tender: Whether at least a part of the contract will be subcontracted.
@@ -33,28 +47,13 @@ def parse_subcontracting(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces: dict[str, str] = {
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
-
+    root = get_root(xml_content)
     result: dict[str, dict] = {"bids": {"details": []}}
 
-    xpath = "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/efac:NoticeResult/efac:LotTender"
-    tenders: list = root.xpath(xpath, namespaces=namespaces)
+    tenders: list = XPATH_NOTICE_RESULT_LOT_TENDER(root)
 
     for tender in tenders:
-        tender_id_elements = tender.xpath(
-            "cbc:ID[@schemeName='tender']/text()",
-            namespaces=namespaces,
-        )
+        tender_id_elements = XPATH_ID_TENDER(tender)
 
         if not tender_id_elements:
             logger.warning("Found tender without ID, skipping")
@@ -62,9 +61,8 @@ def parse_subcontracting(xml_content: str | bytes) -> dict | None:
 
         tender_id: str = tender_id_elements[0]
 
-        subcontracting_code: list = tender.xpath(
-            "efac:SubcontractingTerm[efbc:TermCode/@listName='applicability']/efbc:TermCode/text()",
-            namespaces=namespaces,
+        subcontracting_code: list = XPATH_SUBCONTRACTING_TERM_APPLICABILITY_TERM_CODE(
+            tender
         )
 
         if subcontracting_code:
@@ -2,7 +2,9 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +19,14 @@ ENVIRONMENTAL_IMPACT_MAPPING = {
 }
 
 
-def parse_green_procurement(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_774_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ENVIRONMENTA = register_xpath(
+    "bt_774_lot.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ENVIRONMENTA",
+    "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='environmental-impact']/cbc:ProcurementTypeCode/text()",
+)
+
+
+def parse_green_procurement(xml_content: XMLContent) -> dict | None:
     """Parse the XML content to extract the green procurement information for each lot.
 
     Args:
@@ -46,31 +55,16 @@ def parse_green_procurement(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result: dict[str, dict] = {"tender": {"lots": []}}
 
-    lots: list[etree._Element] = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id: str = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        environmental_impacts: list[str] = lot.xpath(
-            "cac:ProcurementProject/cac:ProcurementAdditionalType[cbc:ProcurementTypeCode/@listName='environmental-impact']/cbc:ProcurementTypeCode/text()",
-            namespaces=namespaces,
+        lot_id: str = XPATH_ID(lot)[0]
+        environmental_impacts: list[str] = (
+            XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_ENVIRONMENTA(lot)
         )
 
         if environmental_impacts:
@@ -107,10 +101,7 @@ def merge_green_procurement(
     existing_lots: list[dict] = tender.setdefault("lots", [])
 
     for new_lot in green_procurement_data["tender"]["lots"]:
-        existing_lot: dict | None = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot: dict | None = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["hasSustainability"] = new_lot["hasSustainability"]
             existing_lot["sustainability"] = new_lot["sustainability"]
@@ -1,12 +1,21 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("bt_79_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_REQUIRED_CURRICULA_CODE = register_xpath(
+    "bt_79_lot.XPATH_TENDERING_TERMS_REQUIRED_CURRICULA_CODE",
+    "cac:TenderingTerms/cbc:RequiredCurriculaCode/text()",
+)
+
+
 def parse_performing_staff_qualification(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict | None:
     """Parse performing staff qualification requirements from XML for each lot.
 
@@ -36,32 +45,15 @@ def parse_performing_staff_qualification(
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        curricula_code = lot.xpath(
-            "cac:TenderingTerms/cbc:RequiredCurriculaCode/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        curricula_code = XPATH_TENDERING_TERMS_REQUIRED_CURRICULA_CODE(lot)
 
         if curricula_code:
             code = curricula_code[0]
@@ -110,10 +102,7 @@ def merge_performing_staff_qualification(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in staff_qualification_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("otherRequirements", {}).update(
                 new_lot["otherRequirements"],
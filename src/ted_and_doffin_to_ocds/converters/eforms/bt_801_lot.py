@@ -2,16 +2,22 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("bt_801_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_CONTRACT_EXECUTION_REQUIREMENT_NDA_EXECUTION_REQUIREMENT_COD = register_xpath(
+    "bt_801_lot.XPATH_CONTRACT_EXECUTION_REQUIREMENT_NDA_EXECUTION_REQUIREMENT_COD",
+    ".//cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='nda']"
+    "/cbc:ExecutionRequirementCode/text()",
+)
 
 
-def parse_non_disclosure_agreement(xml_content: str | bytes) -> dict | None:
+def parse_non_disclosure_agreement(xml_content: XMLContent) -> dict | None:
     """Parse BT-801: Non-disclosure agreement requirement for lots.
 
     Extracts whether lots require a non-disclosure agreement.
@@ -37,22 +43,15 @@ def parse_non_disclosure_agreement(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            nda = lot.xpath(
-                ".//cac:ContractExecutionRequirement[cbc:ExecutionRequirementCode/@listName='nda']"
-                "/cbc:ExecutionRequirementCode/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            nda = XPATH_CONTRACT_EXECUTION_REQUIREMENT_NDA_EXECUTION_REQUIREMENT_COD(
+                lot
             )
 
             if nda and nda[0].lower() == "true":
@@ -94,7 +93,7 @@ def merge_non_disclosure_agreement(release_json: dict, nda_data: dict | None) ->
     lots = tender.setdefault("lots", [])
 
     for new_lot in nda_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             contract_terms = existing_lot.setdefault("contractTerms", {})
             contract_terms["hasNonDisclosureAgreement"] = True
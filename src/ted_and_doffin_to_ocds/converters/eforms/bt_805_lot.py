@@ -4,12 +4,12 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 GPP_CRITERIA_MAPPING = {
     "eu": "euGPPCriteria",
@@ -18,7 +18,15 @@ GPP_CRITERIA_MAPPING = {
 }
 
 
-def parse_gpp_criteria(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_805_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_PROCUREMENT = register_xpath(
+    "bt_805_lot.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_PROCUREMENT",
+    "cac:ProcurementProject/cac:ProcurementAdditionalType"
+    "/cbc:ProcurementTypeCode[@listName='gpp-criteria']/text()",
+)
+
+
+def parse_gpp_criteria(xml_content: XMLContent) -> dict | None:
     """Parse BT-805: Green public procurement criteria for lots.
 
     Extracts information about established GPP criteria usage, including national,
@@ -48,22 +56,15 @@ def parse_gpp_criteria(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            criteria = lot.xpath(
-                "cac:ProcurementProject/cac:ProcurementAdditionalType"
-                "/cbc:ProcurementTypeCode[@listName='gpp-criteria']/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            criteria = (
+                XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_PROCUREMENT(lot)
             )
 
             lot_data = {"id": lot_id, "hasSustainability": False, "sustainability": []}
@@ -117,7 +118,7 @@ def merge_gpp_criteria(release_json: dict, gpp_data: dict | None) -> None:
     lots = tender.setdefault("lots", [])
 
     for new_lot in gpp_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             existing_lot["hasSustainability"] = new_lot["hasSustainability"]
             sustainability = existing_lot.setdefault("sustainability", [])
@@ -1,12 +1,21 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERER_QUALIFICATION_REQUEST_SPECIFIC_TENDERER_REQUIREMENT = register_xpath(
+    "bt_806_procedure.XPATH_TENDERER_QUALIFICATION_REQUEST_SPECIFIC_TENDERER_REQUIREMENT",
+    "//cac:TenderingTerms/cac:TendererQualificationRequest"
+    "/cac:SpecificTendererRequirement"
+    "/cbc:TendererRequirementTypeCode[@listName='exclusion-grounds-source']/text()",
+)
+
+
 def parse_exclusion_grounds_sources(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, dict[str, list[str]]]] | None:
     """Parse XML content to extract exclusion grounds sources (BT-806).
 
@@ -28,20 +37,10 @@ def parse_exclusion_grounds_sources(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
-    sources: list = root.xpath(
-        "//cac:TenderingTerms/cac:TendererQualificationRequest"
-        "/cac:SpecificTendererRequirement"
-        "/cbc:TendererRequirementTypeCode[@listName='exclusion-grounds-source']/text()",
-        namespaces=namespaces,
+    sources: list = XPATH_TENDERER_QUALIFICATION_REQUEST_SPECIFIC_TENDERER_REQUIREMENT(
+        root
     )
 
     if not sources:
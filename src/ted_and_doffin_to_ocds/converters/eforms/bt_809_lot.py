@@ -1,6 +1,8 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -46,8 +48,17 @@ SELECTION_CRITERION_TYPE_MAP = {
 }
 
 
+XPATH_ID = register_xpath("bt_809_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_TENDERER_REQUIREMENT_TYP = register_xpath(
+    "bt_809_lot.XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_TENDERER_REQUIREMENT_TYP",
+    "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+    "/efext:EformsExtension/efac:SelectionCriteria/cbc:TendererRequirementTypeCode"
+    "[@listName='selection-criterion']/text()",
+)
+
+
 def parse_selection_criteria_809(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, dict[str, list[dict[str, str]]]] | None:
     """Parse XML content to extract selection criteria (BT-809).
 
@@ -59,32 +70,16 @@ def parse_selection_criteria_809(
         otherwise None.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root: etree._Element = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        criteria_codes = lot.xpath(
-            "cac:TenderingTerms/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
-            "/efext:EformsExtension/efac:SelectionCriteria/cbc:TendererRequirementTypeCode"
-            "[@listName='selection-criterion']/text()",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        criteria_codes = (
+            XPATH_EFORMS_EXTENSION_SELECTION_CRITERIA_TENDERER_REQUIREMENT_TYP(lot)
         )
 
         if criteria_codes:
@@ -120,10 +115,7 @@ def merge_selection_criteria_809(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in selection_criteria["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             if "selectionCriteria" not in existing_lot:
                 existing_lot["selectionCriteria"] = {"criteria": []}
@@ -2,15 +2,27 @@ import logging
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("bt_821_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERER_QUALIFICATION_REQUEST_MISSING_INFO_SUBMISSION_SPECI = register_xpath(
+    "bt_821_lot.XPATH_TENDERER_QUALIFICATION_REQUEST_MISSING_INFO_SUBMISSION_SPECI",
+    "cac:TenderingTerms/cac:TendererQualificationRequest"
+    "[not(cbc:CompanyLegalFormCode)]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='missing-info-submission'])]"
+    "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='reserved-procurement'])]"
+    "/cac:SpecificTendererRequirement"
+    "[cbc:TendererRequirementTypeCode/@listName='selection-criteria-source']"
+    "/cbc:TendererRequirementTypeCode/text()",
+)
 
 
-def parse_selection_criteria_source(xml_content: str | bytes) -> dict | None:
+def parse_selection_criteria_source(xml_content: XMLContent) -> dict | None:
     """Parse BT-821: Selection criteria source locations for lots.
 
     Extracts information about where selection criteria are defined (e.g. procurement
@@ -37,27 +49,15 @@ def parse_selection_criteria_source(xml_content: str | bytes) -> dict | None:
 
     """
     try:
-        if isinstance(xml_content, str):
-            xml_content = xml_content.encode("utf-8")
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
-            lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
-            sources = lot.xpath(
-                "cac:TenderingTerms/cac:TendererQualificationRequest"
-                "[not(cbc:CompanyLegalFormCode)]"
-                "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='missing-info-submission'])]"
-                "[not(cac:SpecificTendererRequirement/cbc:TendererRequirementTypeCode[@listName='reserved-procurement'])]"
-                "/cac:SpecificTendererRequirement"
-                "[cbc:TendererRequirementTypeCode/@listName='selection-criteria-source']"
-                "/cbc:TendererRequirementTypeCode/text()",
-                namespaces=NAMESPACES,
+            lot_id = XPATH_ID(lot)[0]
+            sources = (
+                XPATH_TENDERER_QUALIFICATION_REQUEST_MISSING_INFO_SUBMISSION_SPECI(lot)
             )
 
             if sources:
@@ -103,7 +103,7 @@ def merge_selection_criteria_source(
     lots = tender.setdefault("lots", [])
 
     for new_lot in source_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             criteria = existing_lot.setdefault("selectionCriteria", {})
             sources = criteria.setdefault("sources", [])
@@ -2,12 +2,19 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_procedure_features(xml_content: str | bytes) -> dict | None:
+XPATH_TENDERING_PROCESS_DESCRIPTION = register_xpath(
+    "bt_88_procedure.XPATH_TENDERING_PROCESS_DESCRIPTION",
+    "//cac:TenderingProcess/cbc:Description/text()",
+)
+
+
+def parse_procedure_features(xml_content: XMLContent) -> dict | None:
     """Parse procedure features from XML.
 
     Extract information about the main features of the procedure and references to
@@ -29,18 +36,9 @@ def parse_procedure_features(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
-
-    procedure_features = root.xpath(
-        "//cac:TenderingProcess/cbc:Description/text()",
-        namespaces=namespaces,
-    )
+    root = get_root(xml_content)
+
+    procedure_features = XPATH_TENDERING_PROCESS_DESCRIPTION(root)
 
     if procedure_features:
         return {"tender": {"procurementMethodDetails": procedure_features[0]}}
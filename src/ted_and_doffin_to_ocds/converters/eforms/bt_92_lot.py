@@ -2,12 +2,24 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_electronic_ordering(xml_content: str | bytes) -> dict | None:
+XPATH_PROCUREMENT_PROJECT_LOT = register_xpath(
+    "bt_92_lot.XPATH_PROCUREMENT_PROJECT_LOT", "//cac:ProcurementProjectLot"
+)
+XPATH_ID = register_xpath("bt_92_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_POST_AWARD_PROCESS_ELECTRONIC_ORDER_USAGE_IN = register_xpath(
+    "bt_92_lot.XPATH_TENDERING_TERMS_POST_AWARD_PROCESS_ELECTRONIC_ORDER_USAGE_IN",
+    "cac:TenderingTerms/cac:PostAwardProcess/cbc:ElectronicOrderUsageIndicator/text()",
+)
+
+
+def parse_electronic_ordering(xml_content: XMLContent) -> dict | None:
     """Parse electronic ordering information from XML for each lot.
 
     Extract information about whether electronic ordering will be used
@@ -36,35 +48,20 @@ def parse_electronic_ordering(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot",
-        namespaces=namespaces,
-    )
+    lots = XPATH_PROCUREMENT_PROJECT_LOT(root)
 
     for lot in lots:
-        lot_id_elements = lot.xpath("cbc:ID/text()", namespaces=namespaces)
+        lot_id_elements = XPATH_ID(lot)
         if not lot_id_elements:
             continue
 
         lot_id = lot_id_elements[0]
-        electronic_ordering = lot.xpath(
-            "cac:TenderingTerms/cac:PostAwardProcess/cbc:ElectronicOrderUsageIndicator/text()",
-            namespaces=namespaces,
+        electronic_ordering = (
+            XPATH_TENDERING_TERMS_POST_AWARD_PROCESS_ELECTRONIC_ORDER_USAGE_IN(lot)
         )
 
         if electronic_ordering:
@@ -106,7 +103,7 @@ def merge_electronic_ordering(
     lots = tender.setdefault("lots", [])
 
     for new_lot in electronic_ordering_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractTerms", {}).update(
                 new_lot["contractTerms"],
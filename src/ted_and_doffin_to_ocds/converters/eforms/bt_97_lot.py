@@ -2,206 +2,22 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.code_lists import LANGUAGE_CODES
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-# ISO 639-1 language code mapping
-ISO_639_1_MAPPING = {
-    "AAR": "aa",  # Afar
-    "ABK": "ab",  # Abkhazian
-    "AFR": "af",  # Afrikaans
-    "AKA": "ak",  # Akan
-    "ALB": "sq",  # Albanian
-    "AMH": "am",  # Amharic
-    "ARA": "ar",  # Arabic
-    "ARG": "an",  # Aragonese
-    "ARM": "hy",  # Armenian
-    "ASM": "as",  # Assamese
-    "AVA": "av",  # Avaric
-    "AVE": "ae",  # Avestan
-    "AYM": "ay",  # Aymara
-    "AZE": "az",  # Azerbaijani
-    "BAK": "ba",  # Bashkir
-    "BAM": "bm",  # Bambara
-    "BAQ": "eu",  # Basque
-    "BEL": "be",  # Belarusian
-    "BEN": "bn",  # Bengali
-    "BIH": "bh",  # Bihari languages
-    "BIS": "bi",  # Bislama
-    "BOD": "bo",  # Tibetan
-    "BOS": "bs",  # Bosnian
-    "BRE": "br",  # Breton
-    "BUL": "bg",  # Bulgarian
-    "BUR": "my",  # Burmese
-    "CAT": "ca",  # Catalan; Valencian
-    "CES": "cs",  # Czech
-    "CHA": "ch",  # Chamorro
-    "CHE": "ce",  # Chechen
-    "CHI": "zh",  # Chinese
-    "CHV": "cv",  # Chuvash
-    "COR": "kw",  # Cornish
-    "COS": "co",  # Corsican
-    "CRE": "cr",  # Cree
-    "CYM": "cy",  # Welsh
-    "DAN": "da",  # Danish
-    "DEU": "de",  # German
-    "DIV": "dv",  # Divehi; Dhivehi; Maldivian
-    "DZO": "dz",  # Dzongkha
-    "ELL": "el",  # Greek, Modern (1453-)
-    "ENG": "en",  # English
-    "EPO": "eo",  # Esperanto
-    "EST": "et",  # Estonian
-    "EUS": "eu",  # Basque
-    "EWE": "ee",  # Ewe
-    "FAO": "fo",  # Faroese
-    "FAS": "fa",  # Persian
-    "FIJ": "fj",  # Fijian
-    "FIN": "fi",  # Finnish
-    "FRA": "fr",  # French
-    "FRY": "fy",  # Western Frisian
-    "FUL": "ff",  # Fulah
-    "GAA": "ga",  # Ga
-    "GLA": "gd",  # Gaelic; Scottish Gaelic
-    "GLE": "ga",  # Irish
-    "GLG": "gl",  # Galician
-    "GLV": "gv",  # Manx
-    "GRN": "gn",  # Guarani
-    "GUJ": "gu",  # Gujarati
-    "HAT": "ht",  # Haitian; Haitian Creole
-    "HAU": "ha",  # Hausa
-    "HEB": "he",  # Hebrew
-    "HER": "hz",  # Herero
-    "HIN": "hi",  # Hindi
-    "HMO": "ho",  # Hiri Motu
-    "HRV": "hr",  # Croatian
-    "HUN": "hu",  # Hungarian
-    "IBO": "ig",  # Igbo
-    "ICE": "is",  # Icelandic
-    "IDO": "io",  # Ido
-    "III": "ii",  # Sichuan Yi; Nuosu
-    "IKU": "iu",  # Inuktitut
-    "ILE": "ie",  # Interlingue; Occidental
-    "INA": "ia",  # Interlingua (International Auxiliary Language Association)
-    "IND": "id",  # Indonesian
-    "IPK": "ik",  # Inupiaq
-    "ITA": "it",  # Italian
-    "JAV": "jv",  # Javanese
-    "JPN": "ja",  # Japanese
-    "KAL": "kl",  # Kalaallisut; Greenlandic
-    "KAN": "kn",  # Kannada
-    "KAS": "ks",  # Kashmiri
-    "KAU": "kr",  # Kanuri
-    "KAZ": "kk",  # Kazakh
-    "KHM": "km",  # Central Khmer
-    "KIK": "ki",  # Kikuyu; Gikuyu
-    "KIN": "rw",  # Kinyarwanda
-    "KIR": "ky",  # Kirghiz; Kyrgyz
-    "KOM": "kv",  # Komi
-    "KON": "kg",  # Kongo
-    "KOR": "ko",  # Korean
-    "KUA": "kj",  # Kuanyama; Kwanyama
-    "KUR": "ku",  # Kurdish
-    "LAO": "lo",  # Lao
-    "LAT": "la",  # Latin
-    "LAV": "lv",  # Latvian
-    "LIM": "li",  # Limburgan; Limburger; Limburgish
-    "LIN": "ln",  # Lingala
-    "LIT": "lt",  # Lithuanian
-    "LTZ": "lb",  # Luxembourgish; Letzeburgesch
-    "LUB": "lu",  # Luba-Katanga
-    "LUG": "lg",  # Ganda
-    "MAC": "mk",  # Macedonian
-    "MAH": "mh",  # Marshallese
-    "MAL": "ml",  # Malayalam
-    "MAO": "mi",  # Maori
-    "MAR": "mr",  # Marathi
-    "MAY": "ms",  # Malay
-    "MLG": "mg",  # Malagasy
-    "MLT": "mt",  # Maltese
-    "MON": "mn",  # Mongolian
-    "NAU": "na",  # Nauru
-    "NAV": "nv",  # Navajo; Navaho
-    "NBL": "nr",  # Ndebele, South; South Ndebele
-    "NDE": "nd",  # Ndebele, North; North Ndebele
-    "NDO": "ng",  # Ndonga
-    "NEP": "ne",  # Nepali
-    "NNO": "nn",  # Norwegian Nynorsk; Nynorsk, Norwegian
-    "NOB": "nb",  # Bokmål, Norwegian; Norwegian Bokmål
-    "NOR": "no",  # Norwegian
-    "NYA": "ny",  # Chichewa; Chewa; Nyanja
-    "OCI": "oc",  # Occitan (post 1500)
-    "OJI": "oj",  # Ojibwa
-    "ORI": "or",  # Oriya
-    "ORM": "om",  # Oromo
-    "OSS": "os",  # Ossetian; Ossetic
-    "PAN": "pa",  # Panjabi; Punjabi
-    "PER": "fa",  # Persian
-    "PLI": "pi",  # Pali
-    "POL": "pl",  # Polish
-    "POR": "pt",  # Portuguese
-    "PUS": "ps",  # Pushto; Pashto
-    "QUE": "qu",  # Quechua
-    "ROH": "rm",  # Romansh
-    "RON": "ro",  # Romanian; Moldavian; Moldovan
-    "RUM": "ro",  # Romanian; Moldavian; Moldovan
-    "RUN": "rn",  # Rundi
-    "RUS": "ru",  # Russian
-    "SAG": "sg",  # Sango
-    "SAN": "sa",  # Sanskrit
-    "SIN": "si",  # Sinhala; Sinhalese
-    "SLK": "sk",  # Slovak
-    "SLO": "sk",  # Slovak
-    "SLV": "sl",  # Slovenian
-    "SME": "se",  # Northern Sami
-    "SMO": "sm",  # Samoan
-    "SNA": "sn",  # Shona
-    "SND": "sd",  # Sindhi
-    "SOM": "so",  # Somali
-    "SOT": "st",  # Sotho, Southern
-    "SPA": "es",  # Spanish; Castilian
-    "SQI": "sq",  # Albanian
-    "SRD": "sc",  # Sardinian
-    "SRP": "sr",  # Serbian
-    "SSW": "ss",  # Swati
-    "SUN": "su",  # Sundanese
-    "SWA": "sw",  # Swahili
-    "SWE": "sv",  # Swedish
-    "TAH": "ty",  # Tahitian
-    "TAM": "ta",  # Tamil
-    "TAT": "tt",  # Tatar
-    "TEL": "te",  # Telugu
-    "TGK": "tg",  # Tajik
-    "TGL": "tl",  # Tagalog
-    "THA": "th",  # Thai
-    "TIB": "bo",  # Tibetan
-    "TIR": "ti",  # Tigrinya
-    "TON": "to",  # Tonga (Tonga Islands)
-    "TSN": "tn",  # Tswana
-    "TSO": "ts",  # Tsonga
-    "TUK": "tk",  # Turkmen
-    "TUR": "tr",  # Turkish
-    "TWI": "tw",  # Twi
-    "UIG": "ug",  # Uighur; Uyghur
-    "UKR": "uk",  # Ukrainian
-    "URD": "ur",  # Urdu
-    "UZB": "uz",  # Uzbek
-    "VEN": "ve",  # Venda
-    "VIE": "vi",  # Vietnamese
-    "VOL": "vo",  # Volapük
-    "WEL": "cy",  # Welsh
-    "WLN": "wa",  # Walloon
-    "WOL": "wo",  # Wolof
-    "XHO": "xh",  # Xhosa
-    "YID": "yi",  # Yiddish
-    "YOR": "yo",  # Yoruba
-    "ZHA": "za",  # Zhuang; Chuang
-    "ZHO": "zh",  # Chinese
-    "ZUL": "zu",  # Zulu
-}
 
+XPATH_ID = register_xpath("bt_97_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_LANGUAGE_ID = register_xpath(
+    "bt_97_lot.XPATH_TENDERING_TERMS_LANGUAGE_ID",
+    "cac:TenderingTerms/cac:Language/cbc:ID/text()",
+)
 
-def parse_submission_language(xml_content: str | bytes) -> dict | None:
+
+def parse_submission_language(xml_content: XMLContent) -> dict | None:
     """Parse submission language requirements from XML for each lot.
 
     Extract information about languages in which tenders, requests to participate,
@@ -230,38 +46,21 @@ def parse_submission_language(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        languages = lot.xpath(
-            "cac:TenderingTerms/cac:Language/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        languages = XPATH_TENDERING_TERMS_LANGUAGE_ID(lot)
 
         if languages:
             mapped_languages = [
-                ISO_639_1_MAPPING.get(lang.upper())
+                LANGUAGE_CODES.get(lang.upper())
                 for lang in languages
-                if ISO_639_1_MAPPING.get(lang.upper())  # Only include valid mappings
+                if LANGUAGE_CODES.get(lang.upper())  # Only include valid mappings
             ]
             if mapped_languages:  # Only create lot if we have valid languages
                 lot_data = {
@@ -300,7 +99,7 @@ def merge_submission_language(
     lots = tender.setdefault("lots", [])
 
     for new_lot in submission_language_data["tender"]["lots"]:
-        existing_lot = next((lot for lot in lots if lot["id"] == new_lot["id"]), None)
+        existing_lot = find_by_id(lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).update(
                 new_lot["submissionTerms"],
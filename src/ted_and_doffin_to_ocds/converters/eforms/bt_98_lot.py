@@ -1,13 +1,22 @@
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 DURATION_MULTIPLIERS = {"DAY": 1, "WEEK": 7, "MONTH": 30, "YEAR": 365}
 
 
-def parse_tender_validity_deadline(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("bt_98_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_TENDER_VALIDITY_PERIOD_DURATION_MEASURE = register_xpath(
+    "bt_98_lot.XPATH_TENDERING_TERMS_TENDER_VALIDITY_PERIOD_DURATION_MEASURE",
+    ".//cac:TenderingTerms/cac:TenderValidityPeriod/cbc:DurationMeasure",
+)
+
+
+def parse_tender_validity_deadline(xml_content: XMLContent) -> dict | None:
     """Parse tender validity deadline information from XML for each lot.
 
     Extract information about the period for which tenders must remain valid
@@ -38,30 +47,16 @@ def parse_tender_validity_deadline(xml_content: str | bytes) -> dict | None:
         etree.XMLSyntaxError: If the input is not valid XML.
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"lots": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-        namespaces=namespaces,
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        duration_measure = lot.xpath(
-            ".//cac:TenderingTerms/cac:TenderValidityPeriod/cbc:DurationMeasure",
-            namespaces=namespaces,
+        lot_id = XPATH_ID(lot)[0]
+        duration_measure = (
+            XPATH_TENDERING_TERMS_TENDER_VALIDITY_PERIOD_DURATION_MEASURE(lot)
         )
 
         if duration_measure:
@@ -111,10 +106,7 @@ def merge_tender_validity_deadline(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in tender_validity_deadline_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("submissionTerms", {}).setdefault(
                 "bidValidityPeriod",
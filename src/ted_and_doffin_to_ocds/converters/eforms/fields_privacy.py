@@ -0,0 +1,308 @@
+"""Converter for BT-195, BT-196, BT-197 and BT-198: unpublished fields.
+
+A buyer can withhold a field from publication by adding an efac:FieldsPrivacy
+element next to it, identified by an efbc:FieldIdentifierCode. This module
+maps every efac:FieldsPrivacy of a notice to a withheldInformation item in a
+single pass:
+
+- BT-195 (Unpublished Identifier): id, field and name of the item
+- BT-196 (Unpublished Justification Description): rationale
+- BT-197 (Unpublished Justification Code): rationaleClassifications
+- BT-198 (Unpublished Access Date): availabilityDate
+
+The fields that are mapped, their names and the entity whose identifier is
+part of the item id are listed in FIELDS_PRIVACY.
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.code_lists import NON_PUBLICATION_JUSTIFICATION
+from ted_and_doffin_to_ocds.utils.date_utils import start_date
+from ted_and_doffin_to_ocds.utils.notice_document import (
+    XMLContent,
+    get_document,
+    qualify,
+)
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PrivacyField:
+    """An unpublished field and how its withheldInformation item is identified.
+
+    Attributes:
+        name: The name of the business term, e.g. "Procedure Type"
+        scope: The entity whose identifier follows the field code in the item
+            id: "Procedure" (cbc:ContractFolderID), "Lot" (the lot or group
+            of lots), "LotResult" or "Tender"
+        scheme: The scheme of the BT-197 rationale classification
+
+    """
+
+    name: str
+    scope: str
+    scheme: str = "eu-non-publication-justification"
+
+
+# Field identifier code -> field, one entry per BT-195 business term
+FIELDS_PRIVACY: Final[dict[str, PrivacyField]] = {
+    # Procedure
+    "cro-bor-law": PrivacyField(
+        "Cross Border Law", "Procedure", scheme="non-publication-justification"
+    ),
+    "pro-typ": PrivacyField("Procedure Type", "Procedure"),
+    "pro-acc": PrivacyField("Procedure Accelerated", "Procedure"),
+    "pro-acc-jus": PrivacyField("Procedure Accelerated Justification", "Procedure"),
+    "pro-fea": PrivacyField("Procedure Features", "Procedure"),
+    "dir-awa-tex": PrivacyField("Direct Award Justification", "Procedure"),
+    "dir-awa-jus": PrivacyField("Direct Award Justification", "Procedure"),
+    "dir-awa-pre": PrivacyField(
+        "Direct Award Justification Previous Procedure Identifier", "Procedure"
+    ),
+    # Lot and LotsGroup
+    "awa-cri-typ": PrivacyField("Award Criterion Type", "Lot"),
+    "awa-cri-des": PrivacyField("Award Criterion Description", "Lot"),
+    "awa-cri-num": PrivacyField("Award Criterion Number", "Lot"),
+    "awa-cri-wei": PrivacyField("Award Criterion Number Weight", "Lot"),
+    "awa-cri-fix": PrivacyField("Award Criterion Number Fixed", "Lot"),
+    "awa-cri-thr": PrivacyField("Award Criterion Number Threshold", "Lot"),
+    "awa-cri-com": PrivacyField("Award Criteria Complicated", "Lot"),
+    "awa-cri-ord": PrivacyField("Award Criteria Order Justification", "Lot"),
+    "awa-cri-nam": PrivacyField("Award Criterion Name", "Lot"),
+    # LotResult
+    "win-cho": PrivacyField("Winner Chosen", "LotResult"),
+    "no-awa-rea": PrivacyField("Not Awarded Reason", "LotResult"),
+    "buy-rev-cou": PrivacyField("Buyer Review Request Count", "LotResult"),
+    "buy-rev-typ": PrivacyField("Buyer Review Request Irregularity Type", "LotResult"),
+    "ree-val": PrivacyField("Framework Re-estimated Value", "LotResult"),
+    "max-val": PrivacyField("Maximum Value", "LotResult"),
+    "ten-val-low": PrivacyField("Tender Lowest Value", "LotResult"),
+    "ten-val-hig": PrivacyField("Tender Highest Value", "LotResult"),
+    "rev-req": PrivacyField("Buyer Review Complainants", "LotResult"),
+    "rec-sub-cou": PrivacyField("Received Submissions Count", "LotResult"),
+    "rec-sub-typ": PrivacyField("Received Submissions Type", "LotResult"),
+    # Tender
+    "con-rev-buy": PrivacyField("Concession Revenue Buyer", "Tender"),
+    "con-rev-use": PrivacyField("Concession Revenue User", "Tender"),
+    "val-con-des": PrivacyField("Concession Value Description", "Tender"),
+    "ten-ran": PrivacyField("Tender Rank", "Tender"),
+    "cou-ori": PrivacyField("Country Origin", "Tender"),
+    "win-ten-var": PrivacyField("Winning Tender Variant", "Tender"),
+    "win-ten-val": PrivacyField("Winning Tender Value", "Tender"),
+    "sub-con": PrivacyField("Subcontracting", "Tender"),
+    "sub-val": PrivacyField("Subcontracting Value", "Tender"),
+    "sub-des": PrivacyField("Subcontracting Description", "Tender"),
+    "sub-per": PrivacyField("Subcontracting Percentage", "Tender"),
+}
+
+# BT-541 (awa-cri-num) is withheld per award criterion parameter; its kind is
+# part of the item id and name.
+AWARD_CRITERION_NUMBERS: Final[dict[str, str]] = {
+    "number-fixed": "fixed",
+    "number-threshold": "threshold",
+    "number-weight": "weight",
+}
+
+
+CBC_ID: Final[str] = qualify("cbc:ID")
+CONTRACT_FOLDER_ID: Final[str] = qualify("cbc:ContractFolderID")
+FIELD_IDENTIFIER_CODE: Final[str] = qualify("efbc:FieldIdentifierCode")
+REASON_CODE: Final[str] = qualify("cbc:ReasonCode")
+REASON_DESCRIPTION: Final[str] = qualify("efbc:ReasonDescription")
+PUBLICATION_DATE: Final[str] = qualify("efbc:PublicationDate")
+AWARD_CRITERION_PARAMETER: Final[str] = qualify("efac:AwardCriterionParameter")
+PARAMETER_CODE: Final[str] = qualify("efbc:ParameterCode")
+
+# The elements that own a field in each scope other than "Procedure"
+SCOPE_OWNERS: Final[dict[str, str]] = {
+    "Lot": qualify("cac:ProcurementProjectLot"),
+    "LotResult": qualify("efac:LotResult"),
+    "Tender": qualify("efac:LotTender"),
+}
+
+
+def _child_text(element: etree._Element, tag: str) -> str | None:
+    """Return the stripped text of the first child with a Clark tag, if any."""
+    child = next(element.iterchildren(tag), None)
+    if child is None or child.text is None:
+        return None
+    return child.text.strip() or None
+
+
+def _rationale(fields_privacy: etree._Element) -> str | dict[str, str] | None:
+    """Return the BT-196 justification in every language it is given in.
+
+    The rationale is a {languageID: text} dictionary if the descriptions have
+    a languageID, and the text of the description otherwise.
+    """
+    rationale, text_only = {}, None
+    for description in fields_privacy.iterchildren(REASON_DESCRIPTION):
+        text = (description.text or "").strip()
+        if not text:
+            continue
+        language_id = description.get("languageID")
+        if language_id:
+            rationale[language_id] = text
+        else:
+            text_only = text
+    return rationale or text_only
+
+
+def _owner_id(
+    fields_privacy: etree._Element, scope: str, folder_id: str | None
+) -> str | None:
+    """Return the identifier of the entity whose field is withheld."""
+    if scope == "Procedure":
+        return folder_id
+    owner = next(fields_privacy.iterancestors(SCOPE_OWNERS[scope]), None)
+    return None if owner is None else _child_text(owner, CBC_ID)
+
+
+def _award_criterion_number(fields_privacy: etree._Element) -> str | None:
+    """Return the kind of BT-541 number ("fixed", "threshold" or "weight")."""
+    parameter = fields_privacy.getparent()
+    if parameter is None or parameter.tag != AWARD_CRITERION_PARAMETER:
+        return None
+    code = next(parameter.iterchildren(PARAMETER_CODE), None)
+    return None if code is None else AWARD_CRITERION_NUMBERS.get(code.get("listName"))
+
+
+def _withheld_item(
+    fields_privacy: etree._Element, folder_id: str | None, unowned: Counter[str]
+) -> dict[str, Any] | None:
+    """Map one efac:FieldsPrivacy to a withheldInformation item.
+
+    unowned counts, per item key, the items whose entity has no identifier, so
+    that they are numbered in document order instead of sharing an id.
+    """
+    field_code = _child_text(fields_privacy, FIELD_IDENTIFIER_CODE)
+    field = FIELDS_PRIVACY.get(field_code)
+    if field is None:
+        return None
+    item_key, name = field_code, field.name
+    if field_code == "awa-cri-num":
+        number = _award_criterion_number(fields_privacy)
+        if number is None:
+            return None
+        item_key, name = f"{field_code}-{number}", f"{field.name} {number.title()}"
+
+    owner_id = _owner_id(fields_privacy, field.scope, folder_id)
+    if owner_id is None:
+        # Keep the rationale and date of the field, apart from the other
+        # unidentified items with the same code
+        logger.warning(
+            "No %s identifier found for unpublished field %s", field.scope, field_code
+        )
+        unowned[item_key] += 1
+        owner_id = str(unowned[item_key])
+    item = {"id": f"{item_key}-{owner_id}", "field": field_code, "name": name}
+
+    rationale = _rationale(fields_privacy)
+    if rationale:
+        item["rationale"] = rationale
+
+    reason_code = _child_text(fields_privacy, REASON_CODE)
+    if reason_code in NON_PUBLICATION_JUSTIFICATION:
+        item["rationaleClassifications"] = [
+            {
+                "scheme": field.scheme,
+                "id": reason_code,
+                **NON_PUBLICATION_JUSTIFICATION[reason_code],
+            }
+        ]
+
+    publication_date = _child_text(fields_privacy, PUBLICATION_DATE)
+    if publication_date:
+        try:
+            item["availabilityDate"] = start_date(publication_date)
+        except ValueError:
+            logger.warning(
+                "Invalid publication date %s for unpublished field %s",
+                publication_date,
+                field_code,
+            )
+    return item
+
+
+def parse_fields_privacy(xml_content: XMLContent) -> dict[str, Any] | None:
+    """Parse every unpublished field of a notice (BT-195, BT-196, BT-197, BT-198).
+
+    Args:
+        xml_content: The XML content to parse, or an already parsed notice
+
+    Returns:
+        A dictionary with one withheldInformation item per efac:FieldsPrivacy
+        of a field listed in FIELDS_PRIVACY, in document order, e.g.:
+            {
+                "withheldInformation": [
+                    {
+                        "id": "win-cho-RES-0001",
+                        "field": "win-cho",
+                        "name": "Winner Chosen",
+                        "rationale": {"ENG": "...", "FRA": "..."},
+                        "rationaleClassifications": [
+                            {
+                                "scheme": "eu-non-publication-justification",
+                                "id": "oth-int",
+                                "description": "Other public interest",
+                                "uri": "http://publications.europa.eu/...",
+                            }
+                        ],
+                        "availabilityDate": "2025-03-31T00:00:00+01:00",
+                    }
+                ]
+            }
+        or None if no field is withheld.
+
+    """
+    document = get_document(xml_content)
+    fields_privacy = document.elements("efac:FieldsPrivacy")
+    if not fields_privacy:
+        return None
+
+    folder_id = _child_text(document.root, CONTRACT_FOLDER_ID)
+    items = []
+    unowned: Counter[str] = Counter()
+    for element in fields_privacy:
+        item = _withheld_item(element, folder_id, unowned)
+        if item is not None:
+            items.append(item)
+    return {"withheldInformation": items} if items else None
+
+
+def merge_fields_privacy(
+    release_json: dict[str, Any], fields_privacy_data: dict[str, Any] | None
+) -> None:
+    """Merge unpublished fields into the withheldInformation of the release.
+
+    Items are matched by id, so a field withheld twice for the same entity
+    results in one item.
+
+    Args:
+        release_json: The release to update in place
+        fields_privacy_data: The output of parse_fields_privacy()
+
+    """
+    if not fields_privacy_data:
+        logger.info("No unpublished fields to merge")
+        return
+
+    withheld_information = release_json.setdefault("withheldInformation", [])
+    for item in fields_privacy_data["withheldInformation"]:
+        existing_item = find_by_id(withheld_information, item["id"])
+        if existing_item:
+            existing_item.update(item)
+        else:
+            withheld_information.append(item)
+
+    logger.info(
+        "Merged %d unpublished field(s)",
+        len(fields_privacy_data["withheldInformation"]),
+    )
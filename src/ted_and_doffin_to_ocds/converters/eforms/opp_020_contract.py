@@ -1,21 +1,42 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "opp_020_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opp_020_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_DURATION_JUSTIFICATION_EXTENDED_DURATION_INDICATOR = register_xpath(
+    "opp_020_contract.XPATH_DURATION_JUSTIFICATION_EXTENDED_DURATION_INDICATOR",
+    "efac:DurationJustification/efbc:ExtendedDurationIndicator/text()",
+)
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT = register_xpath(
+    "opp_020_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "opp_020_contract.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opp_020_contract.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='lot']/text()",
+)
 
 
 def parse_extended_duration_indicator(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse extended duration indicator (OPP-020) from XML content.
 
@@ -29,32 +50,21 @@ def parse_extended_duration_indicator(
         Dictionary containing lots with essential assets indicator or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
         # Get all settled contracts first
         settled_contracts = {}
-        contracts = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-            namespaces=NAMESPACES,
-        )
+        contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
         # Build a dictionary of contracts with their extended duration indicators
         for contract in contracts:
             try:
-                contract_id = contract.xpath(
-                    "cbc:ID[@schemeName='contract']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
-
-                extended_duration = contract.xpath(
-                    "efac:DurationJustification/efbc:ExtendedDurationIndicator/text()",
-                    namespaces=NAMESPACES,
+                contract_id = XPATH_ID_CONTRACT(contract)[0]
+
+                extended_duration = (
+                    XPATH_DURATION_JUSTIFICATION_EXTENDED_DURATION_INDICATOR(contract)
                 )
 
                 if extended_duration:
@@ -68,26 +78,16 @@ def parse_extended_duration_indicator(
                 )
 
         # Now get all lot results and link them to their contracts
-        lot_results = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
-            namespaces=NAMESPACES,
-        )
+        lot_results = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT(root)
 
         for lot_result in lot_results:
             try:
                 # Get the contract ID from the LotResult
-                contract_ref = lot_result.xpath(
-                    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-                    namespaces=NAMESPACES,
-                )
+                contract_ref = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
 
                 if not contract_ref:
                     # Try alternate path based on example
-                    contract_ref = lot_result.xpath(
-                        "cbc:ID[@schemeName='contract']/text()",
-                        namespaces=NAMESPACES,
-                    )
+                    contract_ref = XPATH_ID_CONTRACT(lot_result)
 
                 if not contract_ref:
                     logger.debug("No contract reference found for lot result")
@@ -98,10 +98,7 @@ def parse_extended_duration_indicator(
                 # If the contract has an extended duration indicator
                 if contract_id in settled_contracts:
                     # Get the lot ID
-                    lot_id = lot_result.xpath(
-                        "efac:TenderLot/cbc:ID[@schemeName='lot']/text()",
-                        namespaces=NAMESPACES,
-                    )[0]
+                    lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)[0]
 
                     result["tender"]["lots"].append(
                         {
@@ -147,10 +144,7 @@ def merge_extended_duration_indicator(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in duration_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot["hasEssentialAssets"] = new_lot["hasEssentialAssets"]
         else:
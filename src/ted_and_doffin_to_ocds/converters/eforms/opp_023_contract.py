@@ -1,20 +1,35 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
-
-def parse_asset_predominance(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "opp_023_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opp_023_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_DURATION_JUSTIFICATION_ASSETS_LIST_ASSET = register_xpath(
+    "opp_023_contract.XPATH_DURATION_JUSTIFICATION_ASSETS_LIST_ASSET",
+    "efac:DurationJustification/efac:AssetsList/efac:Asset",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opp_023_contract.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_ASSET_PREDOMINANCE = register_xpath(
+    "opp_023_contract.XPATH_ASSET_PREDOMINANCE", "efbc:AssetPredominance"
+)
+
+
+def parse_asset_predominance(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse asset predominance information (OPP-023) from XML content.
 
     Gets asset predominance values from each contract and maps them to
@@ -27,51 +42,28 @@ def parse_asset_predominance(xml_content: str | bytes) -> dict[str, Any] | None:
         Dictionary containing lots with asset predominance or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
         result = {"tender": {"lots": []}}
 
-        settled_contracts = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-            namespaces=NAMESPACES,
-        )
+        settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
         for contract in settled_contracts:
             try:
-                contract_id = contract.xpath(
-                    "cbc:ID[@schemeName='contract']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
+                contract_id = XPATH_ID_CONTRACT(contract)[0]
 
-                assets = contract.xpath(
-                    "efac:DurationJustification/efac:AssetsList/efac:Asset",
-                    namespaces=NAMESPACES,
-                )
+                assets = XPATH_DURATION_JUSTIFICATION_ASSETS_LIST_ASSET(contract)
 
                 if assets:
-                    lot_results = root.xpath(
-                        f"/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                        f"efext:EformsExtension/efac:NoticeResult/efac:LotResult"
-                        f"[efac:SettledContract/cbc:ID[@schemeName='contract']/text()='{contract_id}']",
-                        namespaces=NAMESPACES,
-                    )
+                    lot_results = document.index.lot_results_for_contract(contract_id)
 
                     for lot_result in lot_results:
-                        lot_id = lot_result.xpath(
-                            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                            namespaces=NAMESPACES,
-                        )[0]
+                        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)[0]
 
                         asset_data = []
                         for asset in assets:
-                            predominance_elements = asset.xpath(
-                                "efbc:AssetPredominance",
-                                namespaces=NAMESPACES,
-                            )
+                            predominance_elements = XPATH_ASSET_PREDOMINANCE(asset)
 
                             for predominance_element in predominance_elements:
                                 asset_info = {"predominance": predominance_element.text}
@@ -126,10 +118,7 @@ def merge_asset_predominance(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in predominance_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_assets = existing_lot.setdefault("essentialAssets", [])
             for new_asset in new_lot["essentialAssets"]:
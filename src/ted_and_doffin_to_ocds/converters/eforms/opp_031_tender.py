@@ -5,6 +5,10 @@ from typing import Any
 
 from lxml import etree
 
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 NAMESPACES = {
@@ -23,6 +27,32 @@ TERM_CODE_MAPPING = {
 }
 
 
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opp_031_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_CONTRACT_TERM_CONTRACT_DETAIL = register_xpath(
+    "opp_031_tender.XPATH_CONTRACT_TERM_CONTRACT_DETAIL",
+    "efac:ContractTerm[efbc:TermCode/@listName='contract-detail' and "
+    "not(efbc:TermCode/text()='all-rev-tic')]",
+)
+XPATH_TERM_CODE = register_xpath(
+    "opp_031_tender.XPATH_TERM_CODE", "efbc:TermCode/text()"
+)
+XPATH_TERM_DESCRIPTION = register_xpath(
+    "opp_031_tender.XPATH_TERM_DESCRIPTION", "efbc:TermDescription"
+)
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "opp_031_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_CONTRACT_TERM_CONTRACT_DETAIL_TERM_DESCRIPTION = register_xpath(
+    "opp_031_tender.XPATH_CONTRACT_TERM_CONTRACT_DETAIL_TERM_DESCRIPTION",
+    "efac:ContractTerm[efbc:TermCode/@listName='contract-detail']/efbc:TermDescription/text()",
+)
+
+
 def get_term_description_value(term_descriptions: list) -> str | None:
     """Extract the appropriate description value from term descriptions.
 
@@ -43,14 +73,11 @@ def get_term_description_value(term_descriptions: list) -> str | None:
     return term_descriptions[0].text
 
 
-def process_lot_tender_terms(
-    lot_tender: etree._Element, namespaces: dict
-) -> tuple[str | None, dict]:
+def process_lot_tender_terms(lot_tender: etree._Element) -> tuple[str | None, dict]:
     """Process contract terms for a lot tender.
 
     Args:
         lot_tender: The lot tender element to process
-        namespaces: XML namespaces dictionary
 
     Returns:
         Tuple of (lot_id, contract_terms) or (None, None) if processing fails
@@ -59,29 +86,19 @@ def process_lot_tender_terms(
     contract_terms = {}
 
     try:
-        lot_ids = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        lot_ids = XPATH_TENDER_LOT_ID_LOT(lot_tender)
         if not lot_ids:
             return None, None
 
         lot_id = lot_ids[0]
 
-        term_elements = lot_tender.xpath(
-            "efac:ContractTerm[efbc:TermCode/@listName='contract-detail' and "
-            "not(efbc:TermCode/text()='all-rev-tic')]",  # Explicitly exclude all-rev-tic
-            namespaces=namespaces,
-        )
+        term_elements = XPATH_CONTRACT_TERM_CONTRACT_DETAIL(lot_tender)
 
         for term in term_elements:
-            term_code = term.xpath("efbc:TermCode/text()", namespaces=namespaces)[0]
+            term_code = XPATH_TERM_CODE(term)[0]
 
             # Handle multilingual descriptions
-            term_descriptions = term.xpath(
-                "efbc:TermDescription",
-                namespaces=namespaces,
-            )
+            term_descriptions = XPATH_TERM_DESCRIPTION(term)
 
             description_value = get_term_description_value(term_descriptions)
 
@@ -96,7 +113,7 @@ def process_lot_tender_terms(
         return lot_id, contract_terms
 
 
-def parse_contract_conditions(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_contract_conditions(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse contract conditions information (OPP-031) from XML content.
 
     This mapping assumes that contract term values are consistent across all lot tenders
@@ -111,25 +128,18 @@ def parse_contract_conditions(xml_content: str | bytes) -> dict[str, Any] | None
     Returns:
         Dictionary containing lots with contract terms or None if no data found
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
-        lot_tenders = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-            namespaces=NAMESPACES,
-        )
+        lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
         # Check for inconsistent terms
-        check_inconsistent_terms(lot_tenders, NAMESPACES)
+        check_inconsistent_terms(lot_tenders)
 
         # Process each lot tender
         for lot_tender in lot_tenders:
-            lot_id, contract_terms = process_lot_tender_terms(lot_tender, NAMESPACES)
+            lot_id, contract_terms = process_lot_tender_terms(lot_tender)
             if lot_id and contract_terms:
                 result["tender"]["lots"].append(
                     {"id": lot_id, "contractTerms": contract_terms}
@@ -142,28 +152,21 @@ def parse_contract_conditions(xml_content: str | bytes) -> dict[str, Any] | None
         return None
 
 
-def check_inconsistent_terms(lot_tenders: list, namespaces: dict) -> None:
+def check_inconsistent_terms(lot_tenders: list) -> None:
     """Check for inconsistent terms across lot tenders for the same lot.
 
     Args:
         lot_tenders: List of lot tender elements
-        namespaces: XML namespaces dictionary
     """
     lot_terms = {}
     for lot_tender in lot_tenders:
-        lot_ids = lot_tender.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )
+        lot_ids = XPATH_TENDER_LOT_ID_LOT(lot_tender)
         if not lot_ids:
             logger.warning("Missing lot ID in lot tender")
             continue
 
         lot_id = lot_ids[0]
-        terms = lot_tender.xpath(
-            "efac:ContractTerm[efbc:TermCode/@listName='contract-detail']/efbc:TermDescription/text()",
-            namespaces=namespaces,
-        )
+        terms = XPATH_CONTRACT_TERM_CONTRACT_DETAIL_TERM_DESCRIPTION(lot_tender)
         if lot_id in lot_terms and lot_terms[lot_id] != terms:
             logger.warning(
                 "Inconsistent contract terms found for lot %s across different tenders. "
@@ -197,10 +200,7 @@ def merge_contract_conditions(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in conditions_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractTerms", {}).update(
                 new_lot["contractTerms"]
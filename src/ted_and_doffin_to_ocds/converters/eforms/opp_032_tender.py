@@ -1,20 +1,29 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "opp_032_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opp_032_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_CONTRACT_TERM_ALL_REV_TIC_TERM_PERCENT = register_xpath(
+    "opp_032_tender.XPATH_CONTRACT_TERM_ALL_REV_TIC_TERM_PERCENT",
+    "efac:ContractTerm[efbc:TermCode/text()='all-rev-tic']/efbc:TermPercent/text()",
+)
 
-def parse_revenues_allocation(xml_content: str | bytes) -> dict[str, Any] | None:
+
+def parse_revenues_allocation(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse revenues allocation information (OPP-032) from XML content.
 
     This mapping assumes that revenue percentages are consistent across all lot tenders
@@ -30,31 +39,19 @@ def parse_revenues_allocation(xml_content: str | bytes) -> dict[str, Any] | None
         Dictionary containing lots with revenue allocation or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
-        lot_tenders = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-            namespaces=NAMESPACES,
-        )
+        lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
         lot_revenues = {}
         for lot_tender in lot_tenders:
             try:
-                lot_id = lot_tender.xpath(
-                    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
-
-                revenue_percent = lot_tender.xpath(
-                    "efac:ContractTerm[efbc:TermCode/text()='all-rev-tic']/"
-                    "efbc:TermPercent/text()",
-                    namespaces=NAMESPACES,
+                lot_id = XPATH_TENDER_LOT_ID_LOT(lot_tender)[0]
+
+                revenue_percent = XPATH_CONTRACT_TERM_ALL_REV_TIC_TERM_PERCENT(
+                    lot_tender
                 )
 
                 if revenue_percent:
@@ -115,10 +112,7 @@ def merge_revenues_allocation(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in revenues_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             existing_lot.setdefault("contractTerms", {}).update(
                 new_lot["contractTerms"]
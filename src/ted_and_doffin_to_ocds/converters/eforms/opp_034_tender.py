@@ -1,38 +1,62 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
-
-
-def _process_lot_results(root, lot_data) -> None:
-    """Process lot results and populate lot_data dictionary."""
-    lot_results = root.xpath(
-        "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-        "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
-        namespaces=NAMESPACES,
-    )
+
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT = register_xpath(
+    "opp_034_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotResult",
+)
+XPATH_LOT_TENDER_ID_TENDER = register_xpath(
+    "opp_034_tender.XPATH_LOT_TENDER_ID_TENDER",
+    "efac:LotTender/cbc:ID[@schemeName='tender']/text()",
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opp_034_tender.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_CONTRACT_TERM_REWARDS_PENALTIES_TERM_DESCRIPTION = register_xpath(
+    "opp_034_tender.XPATH_CONTRACT_TERM_REWARDS_PENALTIES_TERM_DESCRIPTION",
+    "efac:ContractTerm[efbc:TermCode/@listName='rewards-penalties']/"
+    "efbc:TermDescription",
+)
+XPATH_CONTRACT_TERM_FINANCIAL_PERFORMANCE_REQUIREMENT = register_xpath(
+    "opp_034_tender.XPATH_CONTRACT_TERM_FINANCIAL_PERFORMANCE_REQUIREMENT",
+    "efac:ContractTerm/efac:FinancialPerformanceRequirement",
+)
+XPATH_FINANCIAL_PERFORMANCE_TYPE_CODE = register_xpath(
+    "opp_034_tender.XPATH_FINANCIAL_PERFORMANCE_TYPE_CODE",
+    "efbc:FinancialPerformanceTypeCode/text()",
+)
+XPATH_FINANCIAL_PERFORMANCE_DESCRIPTION = register_xpath(
+    "opp_034_tender.XPATH_FINANCIAL_PERFORMANCE_DESCRIPTION",
+    "efbc:FinancialPerformanceDescription/text()",
+)
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "opp_034_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_ID_TENDER = register_xpath(
+    "opp_034_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+
+
+def _process_lot_results(root, lot_data, tender_lots) -> None:
+    """Process lot results and populate lot_data and tender_lots dictionaries."""
+    lot_results = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_RESULT(root)
 
     for lot_result in lot_results:
         try:
-            tender_id = lot_result.xpath(
-                "efac:LotTender/cbc:ID[@schemeName='tender']/text()",
-                namespaces=NAMESPACES,
-            )[0]
+            tender_id = XPATH_LOT_TENDER_ID_TENDER(lot_result)[0]
 
-            lot_id = lot_result.xpath(
-                "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-                namespaces=NAMESPACES,
-            )[0]
+            lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)[0]
 
             if lot_id not in lot_data:
                 lot_data[lot_id] = {
@@ -43,6 +67,7 @@ def _process_lot_results(root, lot_data) -> None:
                 }
 
             lot_data[lot_id]["tenders"].add(tender_id)
+            tender_lots.setdefault(tender_id, {})[lot_id] = None
 
         except (IndexError, AttributeError) as e:
             logger.warning("Skipping incomplete lot result data: %s", e)
@@ -51,10 +76,8 @@ def _process_lot_results(root, lot_data) -> None:
 
 def _process_term_descriptions(lot_tender, associated_lots, lot_data) -> None:
     """Process term descriptions from lot tender."""
-    term_descriptions = lot_tender.xpath(
-        "efac:ContractTerm[efbc:TermCode/@listName='rewards-penalties']/"
-        "efbc:TermDescription",
-        namespaces=NAMESPACES,
+    term_descriptions = XPATH_CONTRACT_TERM_REWARDS_PENALTIES_TERM_DESCRIPTION(
+        lot_tender
     )
 
     if not term_descriptions:
@@ -87,25 +110,18 @@ def _process_term_descriptions(lot_tender, associated_lots, lot_data) -> None:
 
 def _process_performance_requirements(lot_tender, associated_lots, lot_data) -> None:
     """Process financial performance requirements from lot tender."""
-    performance_requirements = lot_tender.xpath(
-        "efac:ContractTerm/efac:FinancialPerformanceRequirement",
-        namespaces=NAMESPACES,
+    performance_requirements = XPATH_CONTRACT_TERM_FINANCIAL_PERFORMANCE_REQUIREMENT(
+        lot_tender
     )
 
     for req in performance_requirements:
-        type_code = req.xpath(
-            "efbc:FinancialPerformanceTypeCode/text()",
-            namespaces=NAMESPACES,
-        )
+        type_code = XPATH_FINANCIAL_PERFORMANCE_TYPE_CODE(req)
         if not type_code:
             continue
 
         type_code = type_code[0]
 
-        description = req.xpath(
-            "efbc:FinancialPerformanceDescription/text()",
-            namespaces=NAMESPACES,
-        )
+        description = XPATH_FINANCIAL_PERFORMANCE_DESCRIPTION(req)
         if not description:
             continue
 
@@ -126,31 +142,20 @@ def _process_performance_requirements(lot_tender, associated_lots, lot_data) ->
                 lot_data[lot_id]["penaltiesAndRewards"]["rewards"].append(description)
 
 
-def _process_lot_tenders(root, lot_data) -> None:
+def _process_lot_tenders(root, lot_data, tender_lots) -> None:
     """Process lot tenders and update lot_data dictionary."""
-    lot_tenders = root.xpath(
-        "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-        "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-        namespaces=NAMESPACES,
-    )
+    lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
     for lot_tender in lot_tenders:
         try:
-            tender_id = lot_tender.xpath(
-                "cbc:ID[@schemeName='tender']/text()",
-                namespaces=NAMESPACES,
-            )
+            tender_id = XPATH_ID_TENDER(lot_tender)
 
             if not tender_id:
                 continue
             tender_id = tender_id[0]
 
             # Find associated lots for this tender
-            associated_lots = [
-                lot_id
-                for lot_id, data in lot_data.items()
-                if tender_id in data["tenders"]
-            ]
+            associated_lots = list(tender_lots.get(tender_id, ()))
 
             if not associated_lots:
                 continue
@@ -166,7 +171,7 @@ def _process_lot_tenders(root, lot_data) -> None:
             continue
 
 
-def parse_penalties_and_rewards(xml_content: str | bytes) -> dict[str, Any] | None:
+def parse_penalties_and_rewards(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse penalties and rewards information (OPP-034) from XML content.
 
     This mapping assumes that rewards and penalties descriptions are consistent across all lot tenders
@@ -182,21 +187,19 @@ def parse_penalties_and_rewards(xml_content: str | bytes) -> dict[str, Any] | No
         Dictionary containing lots with penalties and rewards or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"lots": []}}
 
-        # Create a mapping to collect data per lot
+        # Create a mapping to collect data per lot, and the lots of each tender
         lot_data = {}
+        tender_lots = {}
 
         # Process lot results
-        _process_lot_results(root, lot_data)
+        _process_lot_results(root, lot_data, tender_lots)
 
         # Process lot tenders
-        _process_lot_tenders(root, lot_data)
+        _process_lot_tenders(root, lot_data, tender_lots)
 
         # Convert the lot data to the expected format
         for data in lot_data.values():
@@ -243,10 +246,7 @@ def merge_penalties_and_rewards(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in penalties_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             # Update contractTerms
             existing_lot.setdefault("contractTerms", {}).update(
@@ -3,21 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
 
+XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_TRANSPORT_SE = register_xpath(
+    "opp_040_procedure.XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_TRANSPORT_SE",
+    "//cac:ProcurementProject/cac:ProcurementAdditionalType"
+    "[cbc:ProcurementTypeCode/@listName='transport-service']"
+    "/cbc:ProcurementTypeCode/text()",
+)
 
-def parse_main_nature_sub_type(xml_content: str | bytes) -> dict[str, Any] | None:
+
+def parse_main_nature_sub_type(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse main nature sub type information (OPP-040) from XML content.
 
     Gets transport service type codes and adds them to the tender's
@@ -30,18 +30,12 @@ def parse_main_nature_sub_type(xml_content: str | bytes) -> dict[str, Any] | Non
         Dictionary containing procurement categories or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"additionalProcurementCategories": []}}
 
-        type_codes = root.xpath(
-            "//cac:ProcurementProject/cac:ProcurementAdditionalType"
-            "[cbc:ProcurementTypeCode/@listName='transport-service']"
-            "/cbc:ProcurementTypeCode/text()",
-            namespaces=NAMESPACES,
+        type_codes = XPATH_PROCUREMENT_PROJECT_PROCUREMENT_ADDITIONAL_TYPE_TRANSPORT_SE(
+            root
         )
 
         if type_codes:
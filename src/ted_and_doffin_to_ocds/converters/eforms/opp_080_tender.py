@@ -1,21 +1,35 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-}
+
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER = register_xpath(
+    "opp_080_tender.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
+)
+XPATH_ID_TENDER = register_xpath(
+    "opp_080_tender.XPATH_ID_TENDER", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_PUBLIC_TRANSPORTATION_CUMULATED_DISTANCE = register_xpath(
+    "opp_080_tender.XPATH_PUBLIC_TRANSPORTATION_CUMULATED_DISTANCE",
+    "efbc:PublicTransportationCumulatedDistance/text()",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opp_080_tender.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_ID_RESULT = register_xpath(
+    "opp_080_tender.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
 
 
 def parse_kilometers_public_transport(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse kilometers public transport information (OPP-080) from XML content.
 
@@ -29,56 +43,36 @@ def parse_kilometers_public_transport(
         Dictionary containing contracts with kilometers info or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
         result = {"contracts": []}
 
-        lot_tenders = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:LotTender",
-            namespaces=NAMESPACES,
-        )
+        lot_tenders = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_LOT_TENDER(root)
 
         for lot_tender in lot_tenders:
             try:
-                tender_id = lot_tender.xpath(
-                    "cbc:ID[@schemeName='tender']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
+                tender_id = XPATH_ID_TENDER(lot_tender)[0]
 
-                kilometers = lot_tender.xpath(
-                    "efbc:PublicTransportationCumulatedDistance/text()",
-                    namespaces=NAMESPACES,
-                )
+                kilometers = XPATH_PUBLIC_TRANSPORTATION_CUMULATED_DISTANCE(lot_tender)
 
                 if tender_id and kilometers:
                     kilometers_value = int(kilometers[0])
 
                     # Find corresponding contract through SettledContract
-                    contract = root.xpath(
-                        f"/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                        f"efext:EformsExtension/efac:NoticeResult/efac:SettledContract"
-                        f"[efac:LotTender/cbc:ID[@schemeName='tender']/text()='{tender_id}']",
-                        namespaces=NAMESPACES,
-                    )
+                    contract = document.index.contracts_for_tender(tender_id)
 
                     if contract:
-                        contract_id = contract[0].xpath(
-                            "cbc:ID[@schemeName='contract']/text()",
-                            namespaces=NAMESPACES,
-                        )[0]
+                        contract_id = XPATH_ID_CONTRACT(contract[0])[0]
 
                         # Find award ID through LotResult
-                        award_id = root.xpath(
-                            f"/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                            f"efext:EformsExtension/efac:NoticeResult/efac:LotResult"
-                            f"[efac:SettledContract/cbc:ID[@schemeName='contract']/text()='{contract_id}']"
-                            f"/cbc:ID[@schemeName='result']/text()",
-                            namespaces=NAMESPACES,
-                        )
+                        award_id = [
+                            result_id
+                            for lot_result in document.index.lot_results_for_contract(
+                                contract_id
+                            )
+                            for result_id in XPATH_ID_RESULT(lot_result)
+                        ]
 
                         contract_data = {
                             "id": contract_id,
@@ -126,10 +120,7 @@ def merge_kilometers_public_transport(
     existing_contracts = release_json.setdefault("contracts", [])
 
     for new_contract in kilometers_data["contracts"]:
-        existing_contract = next(
-            (c for c in existing_contracts if c["id"] == new_contract["id"]),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_contract.update(new_contract)
         else:
@@ -3,13 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE_ID_NOTICE_ID_REF = register_xpath(
+    "opp_090_procedure.XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE_ID_NOTICE_ID_REF",
+    "//cac:TenderingProcess/cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
+)
+
+
 def parse_previous_notice_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, list] | None:
     """Parse previous notice identifier from XML content.
 
@@ -21,23 +28,11 @@ def parse_previous_notice_identifier(
         or None if no related processes found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"relatedProcesses": []}
-    notice_refs = root.xpath(
-        "//cac:TenderingProcess/cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
-        namespaces=namespaces,
+    notice_refs = XPATH_TENDERING_PROCESS_NOTICE_DOCUMENT_REFERENCE_ID_NOTICE_ID_REF(
+        root
     )
 
     for identifier in notice_refs:
@@ -82,7 +77,7 @@ def merge_previous_notice_identifier(
         )
         if existing_process:
             # Update the existing process if needed
-            existing_process["relationship"] = list(
+            existing_process["relationship"] = sorted(
                 set(existing_process["relationship"] + new_process["relationship"])
             )
         else:
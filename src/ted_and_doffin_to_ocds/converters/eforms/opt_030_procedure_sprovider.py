@@ -3,15 +3,12 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 ROLE_MAPPING = {
     "ted-esen": "eSender",
@@ -19,7 +16,21 @@ ROLE_MAPPING = {
 }
 
 
-def parse_provided_service_type(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_CONTRACTING_PARTY_PARTY_SERVICE_PROVIDER_PARTY = register_xpath(
+    "opt_030_procedure_sprovider.XPATH_CONTRACTING_PARTY_PARTY_SERVICE_PROVIDER_PARTY",
+    "/*/cac:ContractingParty/cac:Party/cac:ServiceProviderParty",
+)
+XPATH_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "opt_030_procedure_sprovider.XPATH_PARTY_PARTY_IDENTIFICATION_ID",
+    "cac:Party/cac:PartyIdentification/cbc:ID/text()",
+)
+XPATH_SERVICE_TYPE_CODE_ORGANISATION_ROLE = register_xpath(
+    "opt_030_procedure_sprovider.XPATH_SERVICE_TYPE_CODE_ORGANISATION_ROLE",
+    "cbc:ServiceTypeCode[@listName='organisation-role']/text()",
+)
+
+
+def parse_provided_service_type(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse provided service type information (OPT-030) from XML content.
 
     Gets service provider organizations and maps their roles based on service type.
@@ -32,29 +43,17 @@ def parse_provided_service_type(xml_content: str | bytes) -> dict[str, Any] | No
         Dictionary containing parties with roles or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"parties": []}
 
-        providers = root.xpath(
-            "/*/cac:ContractingParty/cac:Party/cac:ServiceProviderParty",
-            namespaces=NAMESPACES,
-        )
+        providers = XPATH_CONTRACTING_PARTY_PARTY_SERVICE_PROVIDER_PARTY(root)
 
         for provider in providers:
             try:
-                org_id = provider.xpath(
-                    "cac:Party/cac:PartyIdentification/cbc:ID/text()",
-                    namespaces=NAMESPACES,
-                )[0]
+                org_id = XPATH_PARTY_PARTY_IDENTIFICATION_ID(provider)[0]
 
-                service_type = provider.xpath(
-                    "cbc:ServiceTypeCode[@listName='organisation-role']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
+                service_type = XPATH_SERVICE_TYPE_CODE_ORGANISATION_ROLE(provider)[0]
 
                 if org_id and service_type in ROLE_MAPPING:
                     result["parties"].append(
@@ -98,10 +97,7 @@ def merge_provided_service_type(
     parties = release_json.setdefault("parties", [])
 
     for new_party in service_type_data["parties"]:
-        existing_party = next(
-            (p for p in parties if p["id"] == new_party["id"]),
-            None,
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             existing_roles = existing_party.setdefault("roles", [])
             for role in new_party["roles"]:
@@ -3,15 +3,12 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
 
 CUSTOMER_SERVICE_CODES = {
     "assistance": "Assistance for persons with reduced mobility",
@@ -26,7 +23,16 @@ CUSTOMER_SERVICE_CODES = {
 }
 
 
-def parse_quality_target_code(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID = register_xpath("opt_071_lot.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_CUSTOMER_SERV = register_xpath(
+    "opt_071_lot.XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_CUSTOMER_SERV",
+    "cac:TenderingTerms/cac:ContractExecutionRequirement"
+    "[cbc:ExecutionRequirementCode/@listName='customer-service']"
+    "/cbc:ExecutionRequirementCode/text()",
+)
+
+
+def parse_quality_target_code(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse quality target code information (OPT-071) from XML content.
 
     Gets customer service codes for each lot and maps them to
@@ -39,27 +45,20 @@ def parse_quality_target_code(xml_content: str | bytes) -> dict[str, Any] | None
         Dictionary containing lots with customer services or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"lots": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
+                lot_id = XPATH_ID(lot)[0]
 
-                service_codes = lot.xpath(
-                    "cac:TenderingTerms/cac:ContractExecutionRequirement"
-                    "[cbc:ExecutionRequirementCode/@listName='customer-service']"
-                    "/cbc:ExecutionRequirementCode/text()",
-                    namespaces=NAMESPACES,
+                service_codes = (
+                    XPATH_TENDERING_TERMS_CONTRACT_EXECUTION_REQUIREMENT_CUSTOMER_SERV(
+                        lot
+                    )
                 )
 
                 if service_codes:
@@ -120,10 +119,7 @@ def merge_quality_target_code(
     existing_lots = tender.setdefault("lots", [])
 
     for new_lot in target_code_data["tender"]["lots"]:
-        existing_lot = next(
-            (lot for lot in existing_lots if lot["id"] == new_lot["id"]),
-            None,
-        )
+        existing_lot = find_by_id(existing_lots, new_lot["id"])
         if existing_lot:
             contract_terms = existing_lot.setdefault("contractTerms", {})
             customer_services = contract_terms.setdefault("customerServices", [])
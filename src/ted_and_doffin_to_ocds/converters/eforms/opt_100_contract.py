@@ -3,21 +3,32 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "opt_100_contract.XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT",
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
+    "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opt_100_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+XPATH_NOTICE_DOCUMENT_REFERENCE_ID = register_xpath(
+    "opt_100_contract.XPATH_NOTICE_DOCUMENT_REFERENCE_ID",
+    "cac:NoticeDocumentReference/cbc:ID",
+)
+XPATH_ID_RESULT = register_xpath(
+    "opt_100_contract.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
 
 
 def parse_framework_notice_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse framework notice identifier information (OPT-100) from XML content.
 
@@ -31,31 +42,19 @@ def parse_framework_notice_identifier(
         Dictionary containing contracts with related processes or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
+        root = document.root
         result = {"contracts": []}
 
         # Find all SettledContract elements as per OPT-100 implementation guidance
-        settled_contracts = root.xpath(
-            "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-            "efext:EformsExtension/efac:NoticeResult/efac:SettledContract",
-            namespaces=NAMESPACES,
-        )
+        settled_contracts = XPATH_EFORMS_EXTENSION_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
         for contract in settled_contracts:
             try:
-                contract_id = contract.xpath(
-                    "cbc:ID[@schemeName='contract']/text()",
-                    namespaces=NAMESPACES,
-                )[0]
+                contract_id = XPATH_ID_CONTRACT(contract)[0]
 
-                notice_ref = contract.xpath(
-                    "cac:NoticeDocumentReference/cbc:ID",
-                    namespaces=NAMESPACES,
-                )
+                notice_ref = XPATH_NOTICE_DOCUMENT_REFERENCE_ID(contract)
 
                 if contract_id and notice_ref:
                     notice_id = notice_ref[0]
@@ -75,13 +74,13 @@ def parse_framework_notice_identifier(
                     }
 
                     # Find award ID through LotResult
-                    award_id = root.xpath(
-                        f"/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/"
-                        f"efext:EformsExtension/efac:NoticeResult/efac:LotResult"
-                        f"[efac:SettledContract/cbc:ID[@schemeName='contract']/text()='{contract_id}']"
-                        f"/cbc:ID[@schemeName='result']/text()",
-                        namespaces=NAMESPACES,
-                    )
+                    award_id = [
+                        result_id
+                        for lot_result in document.index.lot_results_for_contract(
+                            contract_id
+                        )
+                        for result_id in XPATH_ID_RESULT(lot_result)
+                    ]
                     if award_id:
                         contract_data["awardID"] = award_id[0]
 
@@ -124,26 +123,14 @@ def merge_framework_notice_identifier(
     existing_contracts = release_json.setdefault("contracts", [])
 
     for new_contract in framework_data["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in existing_contracts
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(existing_contracts, new_contract["id"])
         if existing_contract:
             existing_related_processes = existing_contract.setdefault(
                 "relatedProcesses", []
             )
             new_related_process = new_contract["relatedProcesses"][0]
-            existing_related_process = next(
-                (
-                    rp
-                    for rp in existing_related_processes
-                    if rp["id"] == new_related_process["id"]
-                ),
-                None,
+            existing_related_process = find_by_id(
+                existing_related_processes, new_related_process["id"]
             )
             if existing_related_process:
                 existing_related_process.update(new_related_process)
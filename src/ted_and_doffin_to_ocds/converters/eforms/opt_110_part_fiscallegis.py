@@ -3,19 +3,27 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_FISCAL_LEGISLAT = register_xpath(
+    "opt_110_part_fiscallegis.XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_FISCAL_LEGISLAT",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:TenderingTerms/cac:FiscalLegislationDocumentReference",
+)
+XPATH_ID = register_xpath("opt_110_part_fiscallegis.XPATH_ID", "cbc:ID/text()")
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "opt_110_part_fiscallegis.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
 
 
 def parse_part_fiscal_legislation_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse part fiscal legislation URL information (OPT-110) from XML content.
 
@@ -29,26 +37,18 @@ def parse_part_fiscal_legislation_url(
         Dictionary containing documents with fiscal URLs or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"documents": []}}
 
-        fiscal_docs = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-            "/cac:TenderingTerms/cac:FiscalLegislationDocumentReference",
-            namespaces=NAMESPACES,
+        fiscal_docs = (
+            XPATH_PROCUREMENT_PROJECT_LOT_PART_TENDERING_TERMS_FISCAL_LEGISLAT(root)
         )
 
         for doc in fiscal_docs:
             try:
-                doc_id = doc.xpath("cbc:ID/text()", namespaces=NAMESPACES)
-                url = doc.xpath(
-                    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-                    namespaces=NAMESPACES,
-                )
+                doc_id = XPATH_ID(doc)
+                url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(doc)
 
                 if doc_id and url:
                     result["tender"]["documents"].append(
@@ -93,10 +93,7 @@ def merge_part_fiscal_legislation_url(
     existing_documents = tender.setdefault("documents", [])
 
     for new_doc in fiscal_url_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["url"] = new_doc["url"]
         else:
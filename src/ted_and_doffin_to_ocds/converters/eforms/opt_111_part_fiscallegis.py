@@ -3,19 +3,22 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_TENDERING_TERMS_FISCAL_LEGISLATION_DOCUMENT_REFERENCE_ID = register_xpath(
+    "opt_111_part_fiscallegis.XPATH_TENDERING_TERMS_FISCAL_LEGISLATION_DOCUMENT_REFERENCE_ID",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
+    "/cac:TenderingTerms/cac:FiscalLegislationDocumentReference/cbc:ID/text()",
+)
 
 
 def parse_part_fiscal_legislation_document_id(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse part fiscal legislation document ID information (OPT-111) from XML content.
 
@@ -29,17 +32,12 @@ def parse_part_fiscal_legislation_document_id(
         Dictionary containing documents with IDs or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        root = get_root(xml_content)
         result = {"tender": {"documents": []}}
 
-        fiscal_docs = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"
-            "/cac:TenderingTerms/cac:FiscalLegislationDocumentReference/cbc:ID/text()",
-            namespaces=NAMESPACES,
+        fiscal_docs = XPATH_TENDERING_TERMS_FISCAL_LEGISLATION_DOCUMENT_REFERENCE_ID(
+            root
         )
 
         for doc_id in fiscal_docs:
@@ -82,10 +80,7 @@ def merge_part_fiscal_legislation_document_id(
     existing_documents = tender.setdefault("documents", [])
 
     for new_doc in fiscal_doc_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_documents if doc["id"] == new_doc["id"]),
-            None,
-        )
+        existing_doc = find_by_id(existing_documents, new_doc["id"])
         if existing_doc:
             existing_doc["documentType"] = "legislation"
         else:
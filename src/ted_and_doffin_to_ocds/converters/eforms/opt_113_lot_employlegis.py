@@ -3,19 +3,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("opt_113_lot_employlegis.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE_ID = register_xpath(
+    "opt_113_lot_employlegis.XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE_ID",
+    "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference/cbc:ID/text()",
+)
 
 
 def parse_employment_legislation_document_id(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse employment legislation document ID information (OPT-113) from XML content.
 
@@ -29,25 +31,20 @@ def parse_employment_legislation_document_id(
         Dictionary containing documents with IDs or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"documents": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
+                lot_id = XPATH_ID(lot)[0]
 
-                empl_docs = lot.xpath(
-                    "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference/cbc:ID/text()",
-                    namespaces=NAMESPACES,
+                empl_docs = (
+                    XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE_ID(
+                        lot
+                    )
                 )
 
                 for doc_id in empl_docs:
@@ -3,19 +3,25 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
-NAMESPACES = {
-    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-}
+
+XPATH_ID = register_xpath("opt_120_lot_environlegis.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_ENVIRONMENTAL_LEGISLATION_DOCUMENT_REFERENCE = register_xpath(
+    "opt_120_lot_environlegis.XPATH_TENDERING_TERMS_ENVIRONMENTAL_LEGISLATION_DOCUMENT_REFERENCE",
+    "cac:TenderingTerms/cac:EnvironmentalLegislationDocumentReference",
+)
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "opt_120_lot_environlegis.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
 
 
 def parse_environmental_legislation_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse environmental legislation URL information (OPT-120) from XML content.
 
@@ -29,33 +35,25 @@ def parse_environmental_legislation_url(
         Dictionary containing documents with URLs or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-
     try:
-        root = etree.fromstring(xml_content)
+        document = get_document(xml_content)
         result = {"tender": {"documents": []}}
 
-        lots = root.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
-            namespaces=NAMESPACES,
-        )
+        lots = document.procurement_project_lots("Lot", top_level=True)
 
         for lot in lots:
             try:
-                lot_id = lot.xpath("cbc:ID/text()", namespaces=NAMESPACES)[0]
+                lot_id = XPATH_ID(lot)[0]
 
-                env_docs = lot.xpath(
-                    "cac:TenderingTerms/cac:EnvironmentalLegislationDocumentReference",
-                    namespaces=NAMESPACES,
+                env_docs = (
+                    XPATH_TENDERING_TERMS_ENVIRONMENTAL_LEGISLATION_DOCUMENT_REFERENCE(
+                        lot
+                    )
                 )
 
                 for doc in env_docs:
-                    doc_id = doc.xpath("cbc:ID/text()", namespaces=NAMESPACES)
-                    url = doc.xpath(
-                        "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-                        namespaces=NAMESPACES,
-                    )
+                    doc_id = XPATH_ID(doc)
+                    url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(doc)
 
                     if doc_id and url:
                         result["tender"]["documents"].append(
@@ -3,13 +3,25 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("opt_130_lot_employlegis.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE = register_xpath(
+    "opt_130_lot_employlegis.XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE",
+    "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
+)
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "opt_130_lot_employlegis.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
+
+
 def parse_employment_legislation_url(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse employment legislation URLs from XML content for procurement project lots.
 
@@ -34,33 +46,19 @@ def parse_employment_legislation_url(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        empl_docs = lot.xpath(
-            "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        empl_docs = XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE(lot)
 
         for doc in empl_docs:
-            doc_id = doc.xpath("cbc:ID/text()", namespaces=namespaces)
-            url = doc.xpath(
-                "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-                namespaces=namespaces,
-            )
+            doc_id = XPATH_ID(doc)
+            url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(doc)
 
             if doc_id and url:
                 result["tender"]["documents"].append(
@@ -3,13 +3,26 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE = register_xpath(
+    "opt_130_part_employlegis.XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE",
+    "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
+)
+XPATH_ID = register_xpath("opt_130_part_employlegis.XPATH_ID", "cbc:ID/text()")
+XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI = register_xpath(
+    "opt_130_part_employlegis.XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI",
+    "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
+)
+
+
 def parse_employment_legislation_url_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse employment legislation URLs from XML content for procurement project parts.
 
@@ -33,32 +46,20 @@ def parse_employment_legislation_url_part(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']", namespaces=namespaces
-    )
+    parts = document.procurement_project_lots("Part")
 
     for part in parts:
-        empl_docs = part.xpath(
-            "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
-            namespaces=namespaces,
+        empl_docs = XPATH_TENDERING_TERMS_EMPLOYMENT_LEGISLATION_DOCUMENT_REFERENCE(
+            part
         )
 
         for doc in empl_docs:
-            doc_id = doc.xpath("cbc:ID/text()", namespaces=namespaces)
-            url = doc.xpath(
-                "cac:Attachment/cac:ExternalReference/cbc:URI/text()",
-                namespaces=namespaces,
-            )
+            doc_id = XPATH_ID(doc)
+            url = XPATH_ATTACHMENT_EXTERNAL_REFERENCE_URI(doc)
 
             if doc_id and url:
                 result["tender"]["documents"].append({"id": doc_id[0], "url": url[0]})
@@ -88,9 +89,7 @@ def merge_employment_legislation_url_part(
     existing_docs = tender.setdefault("documents", [])
 
     for new_doc in empl_legislation_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_docs if doc["id"] == new_doc["id"]), None
-        )
+        existing_doc = find_by_id(existing_docs, new_doc["id"])
         if existing_doc:
             existing_doc["url"] = new_doc["url"]
         else:
@@ -3,13 +3,22 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID = register_xpath("opt_140_lot_procurement_docs.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID = register_xpath(
+    "opt_140_lot_procurement_docs.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID",
+    "cac:TenderingTerms/cac:CallForTendersDocumentReference/cbc:ID/text()",
+)
+
+
 def parse_procurement_documents_id(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse procurement document IDs from XML content for procurement project lots.
 
@@ -33,26 +42,15 @@ def parse_procurement_documents_id(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    lots = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']", namespaces=namespaces
-    )
+    lots = document.procurement_project_lots("Lot")
 
     for lot in lots:
-        lot_id = lot.xpath("cbc:ID/text()", namespaces=namespaces)[0]
-        doc_refs = lot.xpath(
-            "cac:TenderingTerms/cac:CallForTendersDocumentReference/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        lot_id = XPATH_ID(lot)[0]
+        doc_refs = XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID(lot)
 
         for doc_id in doc_refs:
             result["tender"]["documents"].append(
@@ -84,12 +82,10 @@ def merge_procurement_documents_id(
     existing_docs = tender.setdefault("documents", [])
 
     for new_doc in proc_docs_data["tender"]["documents"]:
-        existing_doc = next(
-            (doc for doc in existing_docs if doc["id"] == new_doc["id"]), None
-        )
+        existing_doc = find_by_id(existing_docs, new_doc["id"])
         if existing_doc:
             existing_doc.setdefault("relatedLots", []).extend(new_doc["relatedLots"])
-            existing_doc["relatedLots"] = list(
+            existing_doc["relatedLots"] = sorted(
                 set(existing_doc["relatedLots"])
             )  # Remove duplicates
         else:
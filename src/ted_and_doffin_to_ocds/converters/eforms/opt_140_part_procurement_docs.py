@@ -3,13 +3,20 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID = register_xpath(
+    "opt_140_part_procurement_docs.XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID",
+    "cac:TenderingTerms/cac:CallForTendersDocumentReference/cbc:ID/text()",
+)
+
+
 def parse_procurement_documents_id_part(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse procurement document IDs from XML content for procurement project parts.
 
@@ -32,25 +39,14 @@ def parse_procurement_documents_id_part(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    document = get_document(xml_content)
 
     result = {"tender": {"documents": []}}
 
-    parts = root.xpath(
-        "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']", namespaces=namespaces
-    )
+    parts = document.procurement_project_lots("Part")
 
     for part in parts:
-        doc_refs = part.xpath(
-            "cac:TenderingTerms/cac:CallForTendersDocumentReference/cbc:ID/text()",
-            namespaces=namespaces,
-        )
+        doc_refs = XPATH_TENDERING_TERMS_CALL_FOR_TENDERS_DOCUMENT_REFERENCE_ID(part)
 
         for doc_id in doc_refs:
             result["tender"]["documents"].append({"id": doc_id})
@@ -98,7 +94,7 @@ def merge_procurement_documents_id_part(
             if existing_party:
                 existing_roles = set(existing_party.get("roles", []))
                 existing_roles.update(new_party.get("roles", []))
-                existing_party["roles"] = list(existing_roles)
+                existing_party["roles"] = sorted(existing_roles)
             else:
                 parties.append(new_party)
 
@@ -3,7 +3,9 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,20 @@ VEHICLE_CODES = {
 }
 
 
-def parse_vehicle_type(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID_RESULT = register_xpath(
+    "opt_155_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opt_155_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_STRATEGIC_PROCUREMENT_STATISTICS_0_STATISTICS_CODE_VEHICLES = register_xpath(
+    "opt_155_lotresult.XPATH_STRATEGIC_PROCUREMENT_STATISTICS_0_STATISTICS_CODE_VEHICLES",
+    ".//efac:StrategicProcurementStatistics[efbc:StatisticsNumeric != '0']/efbc:StatisticsCode[@listName='vehicles']/text()",
+)
+
+
+def parse_vehicle_type(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse vehicle type information from LotResult elements in XML content.
 
     Only includes vehicle types where StatisticsNumeric is not 0.
@@ -48,37 +63,19 @@ def parse_vehicle_type(xml_content: str | bytes) -> dict[str, Any] | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )[0]
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )[0]
-
-        vehicle_types = lot_result.xpath(
-            ".//efac:StrategicProcurementStatistics[efbc:StatisticsNumeric != '0']/efbc:StatisticsCode[@listName='vehicles']/text()",
-            namespaces=namespaces,
+        award_id = XPATH_ID_RESULT(lot_result)[0]
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)[0]
+
+        vehicle_types = (
+            XPATH_STRATEGIC_PROCUREMENT_STATISTICS_0_STATISTICS_CODE_VEHICLES(
+                lot_result
+            )
         )
 
         if vehicle_types:
@@ -123,24 +120,18 @@ def merge_vehicle_type(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in vehicle_type_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_items = existing_award.setdefault("items", [])
             for new_item in new_award["items"]:
-                existing_item = next(
-                    (item for item in existing_items if item["id"] == new_item["id"]),
-                    None,
-                )
+                existing_item = find_by_id(existing_items, new_item["id"])
                 if existing_item:
                     existing_item.setdefault("additionalClassifications", []).extend(
                         new_item["additionalClassifications"],
                     )
                 else:
                     existing_items.append(new_item)
-            existing_award["relatedLots"] = list(
+            existing_award["relatedLots"] = sorted(
                 set(existing_award.get("relatedLots", []) + new_award["relatedLots"]),
             )
         else:
@@ -3,12 +3,33 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_vehicle_numeric(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_ID_RESULT = register_xpath(
+    "opt_156_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_TENDER_LOT_ID_LOT = register_xpath(
+    "opt_156_lotresult.XPATH_TENDER_LOT_ID_LOT",
+    "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
+)
+XPATH_STRATEGIC_PROCUREMENT_STATISTICS = register_xpath(
+    "opt_156_lotresult.XPATH_STRATEGIC_PROCUREMENT_STATISTICS",
+    ".//efac:StrategicProcurementStatistics",
+)
+XPATH_STATISTICS_CODE = register_xpath(
+    "opt_156_lotresult.XPATH_STATISTICS_CODE", "efbc:StatisticsCode/text()"
+)
+XPATH_STATISTICS_NUMERIC = register_xpath(
+    "opt_156_lotresult.XPATH_STATISTICS_NUMERIC", "efbc:StatisticsNumeric/text()"
+)
+
+
+def parse_vehicle_numeric(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse vehicle quantity information from LotResult elements in XML content.
 
     Handles three types of vehicle statistics:
@@ -47,38 +68,16 @@ def parse_vehicle_numeric(xml_content: str | bytes) -> dict[str, Any] | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult",
-        namespaces=namespaces,
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
     for lot_result in lot_results:
-        award_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()",
-            namespaces=namespaces,
-        )[0]
-        lot_id = lot_result.xpath(
-            "efac:TenderLot/cbc:ID[@schemeName='Lot']/text()",
-            namespaces=namespaces,
-        )[0]
-
-        statistics = lot_result.xpath(
-            ".//efac:StrategicProcurementStatistics",
-            namespaces=namespaces,
-        )
+        award_id = XPATH_ID_RESULT(lot_result)[0]
+        lot_id = XPATH_TENDER_LOT_ID_LOT(lot_result)[0]
+
+        statistics = XPATH_STRATEGIC_PROCUREMENT_STATISTICS(lot_result)
 
         award_data = {"id": award_id, "items": [], "relatedLots": [lot_id]}
 
@@ -87,9 +86,9 @@ def parse_vehicle_numeric(xml_content: str | bytes) -> dict[str, Any] | None:
         item_id = 1
 
         for stat in statistics:
-            code = stat.xpath("efbc:StatisticsCode/text()", namespaces=namespaces)[0]
+            code = XPATH_STATISTICS_CODE(stat)[0]
             numeric = int(
-                stat.xpath("efbc:StatisticsNumeric/text()", namespaces=namespaces)[0],
+                XPATH_STATISTICS_NUMERIC(stat)[0],
             )
 
             if numeric > 0:
@@ -149,22 +148,16 @@ def merge_vehicle_numeric(
     existing_awards = release_json.setdefault("awards", [])
 
     for new_award in vehicle_numeric_data["awards"]:
-        existing_award = next(
-            (award for award in existing_awards if award["id"] == new_award["id"]),
-            None,
-        )
+        existing_award = find_by_id(existing_awards, new_award["id"])
         if existing_award:
             existing_items = existing_award.setdefault("items", [])
             for new_item in new_award["items"]:
-                existing_item = next(
-                    (item for item in existing_items if item["id"] == new_item["id"]),
-                    None,
-                )
+                existing_item = find_by_id(existing_items, new_item["id"])
                 if existing_item:
                     existing_item.update(new_item)
                 else:
                     existing_items.append(new_item)
-            existing_award["relatedLots"] = list(
+            existing_award["relatedLots"] = sorted(
                 set(existing_award.get("relatedLots", []) + new_award["relatedLots"]),
             )
         else:
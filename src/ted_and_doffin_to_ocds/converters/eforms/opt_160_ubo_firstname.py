@@ -3,16 +3,34 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_ubo_firstname(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_COMPANY_PARTY_IDENTIFICATION_ID_ORGANIZATION = register_xpath(
+    "opt_160_ubo_firstname.XPATH_COMPANY_PARTY_IDENTIFICATION_ID_ORGANIZATION",
+    "efac:Company/cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_ID_UBO = register_xpath(
+    "opt_160_ubo_firstname.XPATH_ID_UBO", "cbc:ID[@schemeName='ubo']/text()"
+)
+XPATH_FIRST_NAME = register_xpath(
+    "opt_160_ubo_firstname.XPATH_FIRST_NAME", "cbc:FirstName/text()"
+)
+XPATH_UBO_REFERENCE_ID = register_xpath(
+    "opt_160_ubo_firstname.XPATH_UBO_REFERENCE_ID",
+    "efac:UltimateBeneficialOwner/cbc:ID[@schemeName='ubo']/text()",
+)
+
+
+def parse_ubo_firstname(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse ultimate beneficial owner (UBO) first names from XML content.
 
     Extracts UBO information for each organization, linking UBOs to their organizations
-    through the organization ID.
+    through the organization ID. An organization only lists the UBOs it refers to.
 
     Args:
         xml_content: XML content containing UBO data
@@ -35,45 +53,32 @@ def parse_ubo_firstname(xml_content: str | bytes) -> dict[str, Any] | None:
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"parties": []}
 
-    organizations = root.xpath(
-        "//efac:Organizations/efac:Organization", namespaces=namespaces
-    )
+    first_names = {}
+    for ubo in document.elements(
+        "efac:UltimateBeneficialOwner", parent="efac:Organizations"
+    ):
+        ubo_id = XPATH_ID_UBO(ubo)
+        firstname = XPATH_FIRST_NAME(ubo)
+        if ubo_id and firstname:
+            first_names.setdefault(ubo_id[0], firstname[0])
+
+    organizations = document.elements("efac:Organization", parent="efac:Organizations")
 
     for org in organizations:
-        org_id = org.xpath(
-            "efac:Company/cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
-            namespaces=namespaces,
-        )
+        org_id = XPATH_COMPANY_PARTY_IDENTIFICATION_ID_ORGANIZATION(org)
         if not org_id:
             continue
 
         org_id = org_id[0]
-        ubos = root.xpath(
-            "//efac:Organizations/efac:UltimateBeneficialOwner", namespaces=namespaces
-        )
-
-        beneficial_owners = []
-        for ubo in ubos:
-            ubo_id = ubo.xpath(
-                "cbc:ID[@schemeName='ubo']/text()", namespaces=namespaces
-            )
-            firstname = ubo.xpath("cbc:FirstName/text()", namespaces=namespaces)
-
-            if ubo_id and firstname:
-                beneficial_owners.append({"id": ubo_id[0], "name": firstname[0]})
+        beneficial_owners = [
+            {"id": ubo_id, "name": first_names[ubo_id]}
+            for ubo_id in dict.fromkeys(XPATH_UBO_REFERENCE_ID(org))
+            if ubo_id in first_names
+        ]
 
         if beneficial_owners:
             result["parties"].append(
@@ -104,22 +109,13 @@ def merge_ubo_firstname(
     parties = release_json.setdefault("parties", [])
 
     for new_party in ubo_data["parties"]:
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             existing_beneficial_owners = existing_party.setdefault(
                 "beneficialOwners", []
             )
             for new_bo in new_party["beneficialOwners"]:
-                existing_bo = next(
-                    (
-                        bo
-                        for bo in existing_beneficial_owners
-                        if bo["id"] == new_bo["id"]
-                    ),
-                    None,
-                )
+                existing_bo = find_by_id(existing_beneficial_owners, new_bo["id"])
                 if existing_bo:
                     existing_bo["name"] = new_bo["name"]
                 else:
@@ -3,12 +3,28 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tendering_party_leader(xml_content: str | bytes) -> dict[str, Any] | None:
+XPATH_TENDERING_PARTY_TENDERER = register_xpath(
+    "opt_170_tenderer_leader.XPATH_TENDERING_PARTY_TENDERER",
+    "//efac:TenderingParty/efac:Tenderer",
+)
+XPATH_ID_ORGANIZATION = register_xpath(
+    "opt_170_tenderer_leader.XPATH_ID_ORGANIZATION",
+    "cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_GROUP_LEAD_INDICATOR = register_xpath(
+    "opt_170_tenderer_leader.XPATH_GROUP_LEAD_INDICATOR",
+    "efbc:GroupLeadIndicator/text()",
+)
+
+
+def parse_tendering_party_leader(xml_content: XMLContent) -> dict[str, Any] | None:
     """Parse tendering party leader information from XML content.
 
     For each tenderer:
@@ -31,28 +47,15 @@ def parse_tendering_party_leader(xml_content: str | bytes) -> dict[str, Any] | N
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"parties": []}
 
-    tenderers = root.xpath("//efac:TenderingParty/efac:Tenderer", namespaces=namespaces)
+    tenderers = XPATH_TENDERING_PARTY_TENDERER(root)
 
     for tenderer in tenderers:
-        org_id = tenderer.xpath(
-            "cbc:ID[@schemeName='organization']/text()", namespaces=namespaces
-        )
-        is_leader = tenderer.xpath(
-            "efbc:GroupLeadIndicator/text()", namespaces=namespaces
-        )
+        org_id = XPATH_ID_ORGANIZATION(tenderer)
+        is_leader = XPATH_GROUP_LEAD_INDICATOR(tenderer)
 
         if org_id and is_leader:
             roles = ["tenderer"]
@@ -85,13 +88,11 @@ def merge_tendering_party_leader(
     parties = release_json.setdefault("parties", [])
 
     for new_party in leader_data["parties"]:
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             existing_roles = set(existing_party.get("roles", []))
             existing_roles.update(new_party["roles"])
-            existing_party["roles"] = list(existing_roles)
+            existing_party["roles"] = sorted(existing_roles)
         else:
             parties.append(new_party)
 
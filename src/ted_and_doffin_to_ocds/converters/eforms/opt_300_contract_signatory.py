@@ -3,13 +3,35 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_SIGNATORY_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "opt_300_contract_signatory.XPATH_SIGNATORY_PARTY_PARTY_IDENTIFICATION_ID",
+    "//efac:NoticeResult/efac:SettledContract/cac:SignatoryParty/cac:PartyIdentification/cbc:ID",
+)
+XPATH_COMPANY = register_xpath(
+    "opt_300_contract_signatory.XPATH_COMPANY", "efac:Company"
+)
+XPATH_PARTY_NAME_NAME = register_xpath(
+    "opt_300_contract_signatory.XPATH_PARTY_NAME_NAME", "cac:PartyName/cbc:Name/text()"
+)
+XPATH_SETTLED_CONTRACT = register_xpath(
+    "opt_300_contract_signatory.XPATH_SETTLED_CONTRACT",
+    "ancestor::efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opt_300_contract_signatory.XPATH_ID_CONTRACT",
+    "cbc:ID[@schemeName='contract']/text()",
+)
+
+
 def parse_signatory_identifier_reference(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse signatory party information for settled contracts.
 
@@ -45,23 +67,12 @@ def parse_signatory_identifier_reference(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"parties": [], "awards": []}
 
-    signatory_parties = root.xpath(
-        "//efac:NoticeResult/efac:SettledContract/cac:SignatoryParty/cac:PartyIdentification/cbc:ID",
-        namespaces=namespaces,
-    )
+    signatory_parties = XPATH_SIGNATORY_PARTY_PARTY_IDENTIFICATION_ID(root)
 
     for signatory in signatory_parties:
         org_id = signatory.text
@@ -69,14 +80,10 @@ def parse_signatory_identifier_reference(
             continue
 
         # Find the corresponding organization details
-        org = root.xpath(
-            f"//efac:Organizations/efac:Organization/efac:Company[cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()='{org_id}']",
-            namespaces=namespaces,
-        )
+        organization = document.index.organizations.get(org_id)
+        org = [] if organization is None else XPATH_COMPANY(organization)
         if org:
-            org_name = org[0].xpath(
-                "cac:PartyName/cbc:Name/text()", namespaces=namespaces
-            )
+            org_name = XPATH_PARTY_NAME_NAME(org[0])
             org_name = org_name[0] if org_name else None
 
             result["parties"].append(
@@ -84,12 +91,8 @@ def parse_signatory_identifier_reference(
             )
 
         # Find the corresponding SettledContract
-        contract = signatory.xpath(
-            "ancestor::efac:SettledContract", namespaces=namespaces
-        )[0]
-        contract_id = contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()", namespaces=namespaces
-        )
+        contract = XPATH_SETTLED_CONTRACT(signatory)[0]
+        contract_id = XPATH_ID_CONTRACT(contract)
         if contract_id:
             contract_id = contract_id[0]
             result["awards"].append({"id": contract_id, "buyers": [{"id": org_id}]})
@@ -120,11 +123,9 @@ def merge_signatory_identifier_reference(
     awards = release_json.setdefault("awards", [])
 
     for new_party in signatory_data.get("parties", []):
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
-            existing_party["roles"] = list(
+            existing_party["roles"] = sorted(
                 set(existing_party.get("roles", []) + new_party["roles"])
             )
             if "name" not in existing_party and "name" in new_party:
@@ -133,9 +134,7 @@ def merge_signatory_identifier_reference(
             parties.append(new_party)
 
     for new_award in signatory_data.get("awards", []):
-        existing_award = next(
-            (award for award in awards if award.get("id") == new_award["id"]), None
-        )
+        existing_award = find_by_id(awards, new_award["id"])
         if existing_award:
             existing_buyers = existing_award.setdefault("buyers", [])
             for new_buyer in new_award["buyers"]:
@@ -1,13 +1,21 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_CONTRACTING_PARTY_ID = register_xpath(
+    "opt_300_procedure_buyer.XPATH_CONTRACTING_PARTY_ID",
+    "/*/cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID",
+)
+
+
 def parse_buyer_technical_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse buyer technical identifiers from contracting party information.
 
@@ -32,18 +40,11 @@ def parse_buyer_technical_identifier(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-    }
+    root = get_root(xml_content)
 
     result = {"parties": []}
 
-    xpath_query = "/*/cac:ContractingParty/cac:Party/cac:PartyIdentification/cbc:ID"
-    buyer_id_elements = root.xpath(xpath_query, namespaces=namespaces)
+    buyer_id_elements = XPATH_CONTRACTING_PARTY_ID(root)
 
     if buyer_id_elements:
         # Take first buyer as main buyer
@@ -78,9 +79,7 @@ def merge_buyer_technical_identifier(
     parties = release_json.setdefault("parties", [])
 
     for new_party in buyer_data["parties"]:
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             if "buyer" not in existing_party.get("roles", []):
                 existing_party.setdefault("roles", []).append("buyer")
@@ -3,13 +3,27 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_PARTY_PARTY_IDENTIFICATION_ID = register_xpath(
+    "opt_300_procedure_sprovider.XPATH_PARTY_PARTY_IDENTIFICATION_ID",
+    "//cac:ContractingParty/cac:Party/cac:ServiceProviderParty/cac:Party/cac:PartyIdentification/cbc:ID",
+)
+XPATH_COMPANY = register_xpath(
+    "opt_300_procedure_sprovider.XPATH_COMPANY", "efac:Company"
+)
+XPATH_PARTY_NAME_NAME = register_xpath(
+    "opt_300_procedure_sprovider.XPATH_PARTY_NAME_NAME", "cac:PartyName/cbc:Name/text()"
+)
+
+
 def parse_service_provider_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse service provider information from XML content.
 
@@ -32,23 +46,12 @@ def parse_service_provider_identifier(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    document = get_document(xml_content)
+    root = document.root
 
     result = {"parties": []}
 
-    service_providers = root.xpath(
-        "//cac:ContractingParty/cac:Party/cac:ServiceProviderParty/cac:Party/cac:PartyIdentification/cbc:ID",
-        namespaces=namespaces,
-    )
+    service_providers = XPATH_PARTY_PARTY_IDENTIFICATION_ID(root)
 
     for provider in service_providers:
         org_id = provider.text
@@ -56,14 +59,10 @@ def parse_service_provider_identifier(
             continue
 
         # Find the corresponding organization details
-        org = root.xpath(
-            f"//efac:Organizations/efac:Organization/efac:Company[cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()='{org_id}']",
-            namespaces=namespaces,
-        )
+        organization = document.index.organizations.get(org_id)
+        org = [] if organization is None else XPATH_COMPANY(organization)
         if org:
-            org_name = org[0].xpath(
-                "cac:PartyName/cbc:Name/text()", namespaces=namespaces
-            )
+            org_name = XPATH_PARTY_NAME_NAME(org[0])
             org_name = org_name[0] if org_name else None
 
             result["parties"].append({"id": org_id, "name": org_name})
@@ -92,9 +91,7 @@ def merge_service_provider_identifier(
     parties = release_json.setdefault("parties", [])
 
     for new_party in provider_data["parties"]:
-        existing_party = next(
-            (party for party in parties if party["id"] == new_party["id"]), None
-        )
+        existing_party = find_by_id(parties, new_party["id"])
         if existing_party:
             if "name" not in existing_party and "name" in new_party:
                 existing_party["name"] = new_party["name"]
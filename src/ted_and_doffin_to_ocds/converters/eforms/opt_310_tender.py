@@ -2,12 +2,20 @@
 
 import logging
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
-def parse_tendering_party_id_reference(xml_content: str | bytes) -> dict | None:
+XPATH_ID = register_xpath("opt_310_tender.XPATH_ID", "cbc:ID/text()")
+XPATH_TENDERING_PARTY_ID = register_xpath(
+    "opt_310_tender.XPATH_TENDERING_PARTY_ID", "efac:TenderingParty/cbc:ID/text()"
+)
+XPATH_TENDERER = register_xpath("opt_310_tender.XPATH_TENDERER", "efac:Tenderer")
+
+
+def parse_tendering_party_id_reference(xml_content: XMLContent) -> dict | None:
     """Parse tendering party references and link tenderers to bids.
 
     Args:
@@ -17,47 +25,31 @@ def parse_tendering_party_id_reference(xml_content: str | bytes) -> dict | None:
         dict | None: Dictionary containing parties and bids data, or None if no data found
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-    }
+    document = get_document(xml_content)
 
     result = {"parties": [], "bids": {"details": []}}
 
     # Find all LotTender elements
-    lot_tenders = root.xpath(
-        "//efac:NoticeResult/efac:LotTender", namespaces=namespaces
-    )
+    lot_tenders = document.elements("efac:LotTender", parent="efac:NoticeResult")
 
     for lot_tender in lot_tenders:
         try:
             # Get tender ID
-            tender_id = lot_tender.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+            tender_id = XPATH_ID(lot_tender)[0]
 
             # Get tendering party reference ID
-            tendering_party_id = lot_tender.xpath(
-                "efac:TenderingParty/cbc:ID/text()", namespaces=namespaces
-            )[0]
+            tendering_party_id = XPATH_TENDERING_PARTY_ID(lot_tender)[0]
 
             # Find matching TenderingParty
-            tendering_party = root.xpath(
-                f"//efac:NoticeResult/efac:TenderingParty[cbc:ID/text()='{tendering_party_id}']",
-                namespaces=namespaces,
-            )[0]
+            tendering_party = document.index.tendering_parties[tendering_party_id]
 
             # Create bid object
             bid = {"id": tender_id, "tenderers": []}
 
             # Process all Tenderer elements
-            tenderers = tendering_party.xpath("efac:Tenderer", namespaces=namespaces)
+            tenderers = XPATH_TENDERER(tendering_party)
             for tenderer in tenderers:
-                org_id = tenderer.xpath("cbc:ID/text()", namespaces=namespaces)[0]
+                org_id = XPATH_ID(tenderer)[0]
 
                 # Add organization to parties if new
                 if not any(p["id"] == org_id for p in result["parties"]):
@@ -68,7 +60,7 @@ def parse_tendering_party_id_reference(xml_content: str | bytes) -> dict | None:
 
             result["bids"]["details"].append(bid)
 
-        except (IndexError, AttributeError) as e:
+        except (IndexError, KeyError, AttributeError) as e:
             logger.warning("Skipping incomplete tender data: %s", e)
             continue
 
@@ -3,13 +3,24 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_RESULT = register_xpath(
+    "opt_315_lotresult.XPATH_ID_RESULT", "cbc:ID[@schemeName='result']/text()"
+)
+XPATH_SETTLED_CONTRACT_ID_CONTRACT = register_xpath(
+    "opt_315_lotresult.XPATH_SETTLED_CONTRACT_ID_CONTRACT",
+    "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
+)
+
+
 def parse_contract_identifier_reference(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse contract identifier references from lot results.
 
@@ -33,32 +44,16 @@ def parse_contract_identifier_reference(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"contracts": []}
 
     # Parse LotResult information
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult", namespaces=namespaces
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        result_id = lot_result.xpath(
-            "cbc:ID[@schemeName='result']/text()", namespaces=namespaces
-        )
-        contract_id = lot_result.xpath(
-            "efac:SettledContract/cbc:ID[@schemeName='contract']/text()",
-            namespaces=namespaces,
-        )
+        result_id = XPATH_ID_RESULT(lot_result)
+        contract_id = XPATH_SETTLED_CONTRACT_ID_CONTRACT(lot_result)
 
         if result_id and contract_id:
             contract = {"id": contract_id[0], "awardID": result_id[0]}
@@ -88,14 +83,7 @@ def merge_contract_identifier_reference(
     contracts = release_json.setdefault("contracts", [])
 
     for new_contract in contract_identifier_data["contracts"]:
-        existing_contract = next(
-            (
-                contract
-                for contract in contracts
-                if contract["id"] == new_contract["id"]
-            ),
-            None,
-        )
+        existing_contract = find_by_id(contracts, new_contract["id"])
         if existing_contract:
             existing_contract["awardID"] = new_contract["awardID"]
         else:
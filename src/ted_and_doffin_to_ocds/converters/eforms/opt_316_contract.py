@@ -1,13 +1,23 @@
 import logging
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_root
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_NOTICE_RESULT_SETTLED_CONTRACT = register_xpath(
+    "opt_316_contract.XPATH_NOTICE_RESULT_SETTLED_CONTRACT",
+    "//efac:NoticeResult/efac:SettledContract",
+)
+XPATH_ID_CONTRACT = register_xpath(
+    "opt_316_contract.XPATH_ID_CONTRACT", "cbc:ID[@schemeName='contract']/text()"
+)
+
+
 def parse_contract_technical_identifier(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse contract technical identifiers from settled contracts.
 
@@ -31,28 +41,15 @@ def parse_contract_technical_identifier(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    root = get_root(xml_content)
 
     result = {"contracts": []}
 
     # Parse SettledContract information
-    settled_contracts = root.xpath(
-        "//efac:NoticeResult/efac:SettledContract", namespaces=namespaces
-    )
+    settled_contracts = XPATH_NOTICE_RESULT_SETTLED_CONTRACT(root)
 
     for settled_contract in settled_contracts:
-        contract_id = settled_contract.xpath(
-            "cbc:ID[@schemeName='contract']/text()", namespaces=namespaces
-        )
+        contract_id = XPATH_ID_CONTRACT(settled_contract)
 
         if contract_id:
             contract = {"id": contract_id[0]}
@@ -2,13 +2,21 @@ import logging
 import re
 from typing import Any
 
-from lxml import etree
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_LOT_TENDER_ID_TENDER = register_xpath(
+    "opt_320_lotresult.XPATH_LOT_TENDER_ID_TENDER",
+    "efac:LotTender/cbc:ID[@schemeName='tender']/text()",
+)
+XPATH_ID = register_xpath("opt_320_lotresult.XPATH_ID", "cbc:ID/text()")
+
+
 def parse_tender_identifier_reference(
-    xml_content: str | bytes,
+    xml_content: XMLContent,
 ) -> dict[str, Any] | None:
     """Parse tender identifier references from lot results.
 
@@ -31,35 +39,22 @@ def parse_tender_identifier_reference(
         }
 
     """
-    if isinstance(xml_content, str):
-        xml_content = xml_content.encode("utf-8")
-    root = etree.fromstring(xml_content)
-    namespaces = {
-        "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-        "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-        "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-        "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-        "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-    }
+    document = get_document(xml_content)
 
     result = {"awards": []}
     pattern = re.compile(r"^TEN-\d{4}$")
 
-    lot_results = root.xpath(
-        "//efac:NoticeResult/efac:LotResult", namespaces=namespaces
-    )
+    lot_results = document.elements("efac:LotResult", parent="efac:NoticeResult")
 
     for lot_result in lot_results:
-        lot_tenders = lot_result.xpath(
-            "efac:LotTender/cbc:ID[@schemeName='tender']/text()", namespaces=namespaces
-        )
+        lot_tenders = XPATH_LOT_TENDER_ID_TENDER(lot_result)
 
         # Filter out IDs that don't match the required pattern
         valid_lot_tenders = [tid for tid in lot_tenders if pattern.match(tid)]
 
         if valid_lot_tenders:
             # Get lot ID if available (optional, for better award mapping)
-            lot_id = lot_result.xpath("cbc:ID/text()", namespaces=namespaces)
+            lot_id = XPATH_ID(lot_result)
             award_entry = {"relatedBids": valid_lot_tenders}
 
             # Add lot ID reference if available
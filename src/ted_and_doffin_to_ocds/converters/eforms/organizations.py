@@ -0,0 +1,405 @@
+"""Converter for the organizations of a notice.
+
+Every efac:Organization, its efac:Company and efac:TouchPoint, and every
+efac:UltimateBeneficialOwner are visited once and mapped to complete party
+objects:
+
+- Company (party id OPT-200): name (BT-500, BT-16), additionalIdentifiers
+  (BT-501), contactPoint (BT-502, BT-503, BT-506, BT-739), address (BT-507,
+  BT-510(a-c), BT-512, BT-513, BT-514), details (BT-505, BT-165, BT-633,
+  BT-746), eDeliveryGateway (BT-509) and roles (OPP-050, OPP-051, OPP-052)
+- TouchPoint (party id OPT-201): the same fields, read from the touchpoint,
+  with the company identifier as an "internal" identifier
+- UltimateBeneficialOwner (id OPT-202, OPT-302): name (BT-500), telephone
+  (BT-503), email (BT-506), faxNumber (BT-739), address (BT-507,
+  BT-510(a-c), BT-512, BT-513, BT-514) and nationalities (BT-706), added to
+  the beneficialOwners of the organizations that refer to the owner
+"""
+
+import copy
+import logging
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.code_lists import COUNTRY_CODES
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+logger = logging.getLogger(__name__)
+
+
+# Organization indicators that give the company party a role
+ROLE_INDICATORS: Final[tuple[tuple[str, frozenset[str], str], ...]] = (
+    ("GroupLeadIndicator", frozenset({"true", "1"}), "leadBuyer"),
+    ("AwardingCPBIndicator", frozenset({"true"}), "procuringEntity"),
+    ("AcquiringCPBIndicator", frozenset({"true"}), "wholesaleBuyer"),
+)
+
+XPATH_COMPANY = register_xpath("organizations.XPATH_COMPANY", "efac:Company")
+XPATH_TOUCH_POINT = register_xpath("organizations.XPATH_TOUCH_POINT", "efac:TouchPoint")
+XPATH_UBO = register_xpath("organizations.XPATH_UBO", "efac:UltimateBeneficialOwner")
+XPATH_ORGANIZATION_ID = register_xpath(
+    "organizations.XPATH_ORGANIZATION_ID",
+    "cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_TOUCHPOINT_ID = register_xpath(
+    "organizations.XPATH_TOUCHPOINT_ID",
+    "cac:PartyIdentification/cbc:ID[@schemeName='touchpoint']/text()",
+)
+XPATH_UBO_ID = register_xpath(
+    "organizations.XPATH_UBO_ID", "cbc:ID[@schemeName='ubo']/text()"
+)
+XPATH_COMPANY_ID = register_xpath(
+    "organizations.XPATH_COMPANY_ID", "cac:PartyLegalEntity/cbc:CompanyID/text()"
+)
+# Some notices spell the element cbc:companyID
+XPATH_LOWERCASE_COMPANY_ID = register_xpath(
+    "organizations.XPATH_LOWERCASE_COMPANY_ID",
+    "cac:PartyLegalEntity/cbc:companyID/text()",
+)
+XPATH_NAME = register_xpath("organizations.XPATH_NAME", "cac:PartyName/cbc:Name/text()")
+XPATH_WEBSITE_URI = register_xpath(
+    "organizations.XPATH_WEBSITE_URI", "cbc:WebsiteURI/text()"
+)
+XPATH_ENDPOINT_ID = register_xpath(
+    "organizations.XPATH_ENDPOINT_ID", "cbc:EndpointID/text()"
+)
+XPATH_COMPANY_SIZE = register_xpath(
+    "organizations.XPATH_COMPANY_SIZE",
+    "efbc:CompanySizeCode[@listName='economic-operator-size']/text()",
+)
+XPATH_POSTAL_ADDRESS = register_xpath(
+    "organizations.XPATH_POSTAL_ADDRESS", "cac:PostalAddress"
+)
+XPATH_RESIDENCE_ADDRESS = register_xpath(
+    "organizations.XPATH_RESIDENCE_ADDRESS", "cac:ResidenceAddress"
+)
+XPATH_DEPARTMENT = register_xpath(
+    "organizations.XPATH_DEPARTMENT", "cac:PostalAddress/cbc:Department/text()"
+)
+
+XPATH_STREET_NAME = register_xpath(
+    "organizations.XPATH_STREET_NAME", "cbc:StreetName/text()"
+)
+XPATH_ADDITIONAL_STREET_NAME = register_xpath(
+    "organizations.XPATH_ADDITIONAL_STREET_NAME", "cbc:AdditionalStreetName/text()"
+)
+XPATH_ADDRESS_LINE = register_xpath(
+    "organizations.XPATH_ADDRESS_LINE", "cac:AddressLine/cbc:Line/text()"
+)
+XPATH_NUTS_CODE = register_xpath(
+    "organizations.XPATH_NUTS_CODE",
+    "cbc:CountrySubentityCode[@listName='nuts-lvl3']/text()",
+)
+XPATH_POSTAL_ZONE = register_xpath(
+    "organizations.XPATH_POSTAL_ZONE", "cbc:PostalZone/text()"
+)
+XPATH_CITY_NAME = register_xpath("organizations.XPATH_CITY_NAME", "cbc:CityName/text()")
+XPATH_COUNTRY_CODE = register_xpath(
+    "organizations.XPATH_COUNTRY_CODE", "cac:Country/cbc:IdentificationCode/text()"
+)
+XPATH_CONTACT_NAME = register_xpath(
+    "organizations.XPATH_CONTACT_NAME", "cac:Contact/cbc:Name/text()"
+)
+XPATH_CONTACT_TELEPHONE = register_xpath(
+    "organizations.XPATH_CONTACT_TELEPHONE", "cac:Contact/cbc:Telephone/text()"
+)
+XPATH_CONTACT_EMAIL = register_xpath(
+    "organizations.XPATH_CONTACT_EMAIL", "cac:Contact/cbc:ElectronicMail/text()"
+)
+XPATH_CONTACT_TELEFAX = register_xpath(
+    "organizations.XPATH_CONTACT_TELEFAX", "cac:Contact/cbc:Telefax/text()"
+)
+XPATH_FAMILY_NAME = register_xpath(
+    "organizations.XPATH_FAMILY_NAME", "cbc:FamilyName/text()"
+)
+XPATH_TELEPHONE = register_xpath(
+    "organizations.XPATH_TELEPHONE", "cbc:Telephone/text()"
+)
+XPATH_ELECTRONIC_MAIL = register_xpath(
+    "organizations.XPATH_ELECTRONIC_MAIL", "cbc:ElectronicMail/text()"
+)
+XPATH_NATIONALITY = register_xpath(
+    "organizations.XPATH_NATIONALITY", "efac:Nationality/cbc:NationalityID/text()"
+)
+XPATH_NATURAL_PERSON_INDICATOR = register_xpath(
+    "organizations.XPATH_NATURAL_PERSON_INDICATOR",
+    "efbc:NaturalPersonIndicator/text()",
+)
+XPATH_LISTED_ON_REGULATED_MARKET_INDICATOR = register_xpath(
+    "organizations.XPATH_LISTED_ON_REGULATED_MARKET_INDICATOR",
+    "efbc:ListedOnRegulatedMarketIndicator/text()",
+)
+XPATH_ROLE_INDICATORS = {
+    indicator: register_xpath(
+        f"organizations.XPATH_{indicator.upper()}", f"efbc:{indicator}/text()"
+    )
+    for indicator, _, _ in ROLE_INDICATORS
+}
+
+
+def _first(values: list[str]) -> str | None:
+    return values[0] if values else None
+
+
+def _address(element: etree._Element | None) -> dict[str, str]:
+    """Map a cac:PostalAddress or cac:ResidenceAddress to an OCDS address."""
+    address = {}
+    if element is None:
+        return address
+    street = [
+        *XPATH_STREET_NAME(element)[:1],
+        *XPATH_ADDITIONAL_STREET_NAME(element)[:1],
+        *XPATH_ADDRESS_LINE(element),
+    ]
+    if street:
+        address["streetAddress"] = ", ".join(street)
+    region = _first(XPATH_NUTS_CODE(element))
+    if region:
+        address["region"] = region
+    postal_code = _first(XPATH_POSTAL_ZONE(element))
+    if postal_code:
+        address["postalCode"] = postal_code
+    locality = _first(XPATH_CITY_NAME(element))
+    if locality:
+        address["locality"] = locality
+    country = _first(XPATH_COUNTRY_CODE(element))
+    if country:
+        address["country"] = COUNTRY_CODES.get(country, country)
+    return address
+
+
+def _party(element: etree._Element, party_id: str) -> dict[str, Any]:
+    """Map the fields shared by efac:Company and efac:TouchPoint."""
+    party: dict[str, Any] = {"id": party_id}
+
+    name = _first(XPATH_NAME(element))
+    if name:
+        department = _first(XPATH_DEPARTMENT(element))
+        party["name"] = f"{name} - {department}" if department else name
+
+    address = _address(_first(XPATH_POSTAL_ADDRESS(element)))
+    if address:
+        party["address"] = address
+
+    contact_point = {}
+    contact_name = _first(XPATH_CONTACT_NAME(element))
+    if contact_name:
+        contact_point["name"] = contact_name
+    telephone = _first(XPATH_CONTACT_TELEPHONE(element))
+    if telephone:
+        contact_point["telephone"] = telephone
+    email = _first(XPATH_CONTACT_EMAIL(element))
+    if email:
+        contact_point["email"] = email
+    fax = _first(XPATH_CONTACT_TELEFAX(element))
+    if fax:
+        contact_point["faxNumber"] = fax.strip()
+    if contact_point:
+        party["contactPoint"] = contact_point
+
+    url = _first(XPATH_WEBSITE_URI(element))
+    if url:
+        party["details"] = {"url": url}
+
+    endpoint = _first(XPATH_ENDPOINT_ID(element))
+    if endpoint:
+        party["eDeliveryGateway"] = endpoint
+    return party
+
+
+def _company_party(
+    organization: etree._Element, company: etree._Element, party_id: str
+) -> dict[str, Any]:
+    """Map an efac:Organization and its efac:Company to a party."""
+    party = _party(company, party_id)
+
+    company_id = _first(XPATH_COMPANY_ID(company))
+    if company_id:
+        party["additionalIdentifiers"] = [{"id": company_id, "scheme": "GB-COH"}]
+
+    details = {}
+    scale = _first(XPATH_COMPANY_SIZE(company))
+    if scale:
+        details["scale"] = scale
+    natural_person = _first(XPATH_NATURAL_PERSON_INDICATOR(organization))
+    if natural_person and natural_person.lower() == "true":
+        details["scale"] = "selfEmployed"
+    listed = _first(XPATH_LISTED_ON_REGULATED_MARKET_INDICATOR(organization))
+    if listed:
+        details["listedOnRegulatedMarket"] = listed.lower() == "true"
+    if details:
+        party.setdefault("details", {}).update(details)
+
+    roles = []
+    for indicator, values, role in ROLE_INDICATORS:
+        value = _first(XPATH_ROLE_INDICATORS[indicator](organization))
+        if value is not None and value.lower() in values:
+            roles.append(role)
+    if roles:
+        party["roles"] = roles
+    return party
+
+
+def _beneficial_owner(ubo: etree._Element, ubo_id: str) -> dict[str, Any]:
+    """Map an efac:UltimateBeneficialOwner to a beneficial owner."""
+    owner: dict[str, Any] = {"id": ubo_id}
+    name = _first(XPATH_FAMILY_NAME(ubo))
+    if name:
+        owner["name"] = name
+    telephone = _first(XPATH_TELEPHONE(ubo))
+    if telephone:
+        owner["telephone"] = telephone
+    email = _first(XPATH_ELECTRONIC_MAIL(ubo))
+    if email:
+        owner["email"] = email
+    fax = _first(XPATH_CONTACT_TELEFAX(ubo))
+    if fax:
+        owner["faxNumber"] = fax.strip()
+    address = _address(_first(XPATH_RESIDENCE_ADDRESS(ubo)))
+    if address:
+        owner["address"] = address
+    nationality = _first(XPATH_NATIONALITY(ubo))
+    if nationality:
+        owner["nationalities"] = [COUNTRY_CODES.get(nationality, nationality[:2])]
+    return owner
+
+
+def parse_organizations(xml_content: XMLContent) -> dict[str, Any] | None:
+    """Parse the organizations, touchpoints and beneficial owners of a notice.
+
+    Args:
+        xml_content: The XML content to parse, or an already parsed notice
+
+    Returns:
+        A dictionary with one party per organization (in document order)
+        followed by one party per touchpoint, e.g.:
+            {
+                "parties": [
+                    {
+                        "id": "ORG-0001",
+                        "name": "Ministry of Education",
+                        "address": {"locality": "Oslo", "country": "NO"},
+                        "contactPoint": {"email": "info@example.com"},
+                        "beneficialOwners": [{"id": "UBO-0001", "name": "Smith"}],
+                    },
+                    {
+                        "id": "TPO-0001",
+                        "name": "Ministry of Education - Procurement",
+                        "identifier": {"id": "998298", "scheme": "internal"},
+                    },
+                ]
+            }
+        or None if the notice has no identified organization.
+
+    """
+    document = get_document(xml_content)
+
+    beneficial_owners = {}
+    for ubo in document.elements(
+        "efac:UltimateBeneficialOwner", parent="efac:Organizations"
+    ):
+        ubo_id = _first(XPATH_UBO_ID(ubo))
+        if ubo_id:
+            beneficial_owners[ubo_id] = _beneficial_owner(ubo, ubo_id)
+
+    companies = []
+    touchpoints = []
+    for organization in document.elements(
+        "efac:Organization", parent="efac:Organizations"
+    ):
+        company = _first(XPATH_COMPANY(organization))
+        company_id = None
+        if company is not None:
+            company_id = _first(XPATH_COMPANY_ID(company)) or _first(
+                XPATH_LOWERCASE_COMPANY_ID(company)
+            )
+            org_id = _first(XPATH_ORGANIZATION_ID(company))
+            if org_id:
+                party = _company_party(organization, company, org_id)
+                # An organization lists the owners it refers to (OPT-302),
+                # with the details given under efac:Organizations (OPT-202)
+                owners = []
+                for ubo in XPATH_UBO(organization):
+                    ubo_id = _first(XPATH_UBO_ID(ubo))
+                    if ubo_id:
+                        if ubo_id in beneficial_owners:
+                            _merge_beneficial_owners(
+                                owners, [copy.deepcopy(beneficial_owners[ubo_id])]
+                            )
+                        _merge_beneficial_owners(
+                            owners, [_beneficial_owner(ubo, ubo_id)]
+                        )
+                if owners:
+                    party["beneficialOwners"] = owners
+                companies.append(party)
+
+        for touchpoint in XPATH_TOUCH_POINT(organization):
+            touchpoint_id = _first(XPATH_TOUCHPOINT_ID(touchpoint))
+            if touchpoint_id:
+                party = _party(touchpoint, touchpoint_id)
+                if company_id:
+                    party["identifier"] = {"id": company_id, "scheme": "internal"}
+                touchpoints.append(party)
+
+    parties = companies + touchpoints
+    return {"parties": parties} if parties else None
+
+
+def _merge_beneficial_owners(
+    existing_owners: list[dict[str, Any]], owners: list[dict[str, Any]]
+) -> None:
+    for owner in owners:
+        existing_owner = find_by_id(existing_owners, owner["id"])
+        if existing_owner is None:
+            existing_owners.append(owner)
+            continue
+        for key, value in owner.items():
+            if key == "address":
+                existing_owner.setdefault("address", {}).update(value)
+            else:
+                existing_owner[key] = value
+
+
+def merge_organizations(
+    release_json: dict[str, Any], organizations_data: dict[str, Any] | None
+) -> None:
+    """Merge organization parties into the parties of the release.
+
+    Parties are matched by id. Objects (address, contactPoint, details) are
+    updated key by key, identifiers, roles and beneficial owners are added
+    if missing, and any other field is replaced.
+
+    Args:
+        release_json: The release to update in place
+        organizations_data: The output of parse_organizations()
+
+    """
+    if not organizations_data:
+        logger.info("No organization data to merge")
+        return
+
+    parties = release_json.setdefault("parties", [])
+    for party in organizations_data["parties"]:
+        existing_party = find_by_id(parties, party["id"])
+        if existing_party is None:
+            parties.append(party)
+            continue
+        for key, value in party.items():
+            if key in ("address", "contactPoint", "details"):
+                existing_party.setdefault(key, {}).update(value)
+            elif key in ("additionalIdentifiers", "roles"):
+                existing_values = existing_party.setdefault(key, [])
+                existing_values.extend(
+                    item for item in value if item not in existing_values
+                )
+            elif key == "beneficialOwners":
+                _merge_beneficial_owners(
+                    existing_party.setdefault("beneficialOwners", []), value
+                )
+            else:
+                existing_party[key] = value
+
+    logger.info("Merged %d organization parties", len(organizations_data["parties"]))
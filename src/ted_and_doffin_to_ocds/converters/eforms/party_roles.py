@@ -0,0 +1,380 @@
+"""Converter for the party references of a notice (OPT-301).
+
+Lots, parts, lot results and tendering parties reference organizations and
+touchpoints by id (cac:PartyIdentification/cbc:ID). Each lot, part and lot
+result is visited once, every reference found is gathered, and the roles
+are then added to the referenced parties in one merge:
+
+- Lot and Part: additional information provider, document provider, tender
+  evaluator and tender recipient (cac:TenderingTerms), mediator, review
+  information provider and review organization (cac:AppealTerms), and the
+  issuers of fiscal, environmental and employment legislation documents,
+  which also become the documents' publisher
+- LotResult: financing party and paying party
+- TenderingParty: subcontractors and main contractors, which also become
+  the subcontracts of the notice's first lot tender
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.notice_document import XMLContent, get_document
+from ted_and_doffin_to_ocds.utils.release_builder import find_by_id
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
+logger = logging.getLogger(__name__)
+
+# Additional information and document providers of parts must be
+# organizations or touchpoints
+ORGANIZATION_OR_TOUCHPOINT_ID: Final = re.compile(r"^(ORG|TPO)-\d{4}$")
+
+
+@dataclass(frozen=True)
+class PartyReference:
+    """A party referenced from a lot, part or lot result, and its role."""
+
+    scope: str
+    party: str
+    role: str
+    scheme: str | None = None
+    pattern: re.Pattern[str] | None = None
+
+    @property
+    def path(self) -> str:
+        scheme = f"[@schemeName='{self.scheme}']" if self.scheme else ""
+        return f"{self.party}/cac:PartyIdentification/cbc:ID{scheme}/text()"
+
+
+PARTY_REFERENCES: Final[tuple[PartyReference, ...]] = (
+    PartyReference(
+        "Lot",
+        "cac:TenderingTerms/cac:AdditionalInformationParty",
+        "processContactPoint",
+    ),
+    PartyReference(
+        "Lot", "cac:TenderingTerms/cac:DocumentProviderParty", "processContactPoint"
+    ),
+    PartyReference(
+        "Lot",
+        "cac:TenderingTerms/cac:AppealTerms/cac:AppealInformationParty",
+        "reviewContactPoint",
+    ),
+    PartyReference(
+        "Lot", "cac:TenderingTerms/cac:AppealTerms/cac:MediationParty", "mediationBody"
+    ),
+    PartyReference(
+        "Lot",
+        "cac:TenderingTerms/cac:AppealTerms/cac:AppealReceiverParty",
+        "reviewBody",
+    ),
+    PartyReference(
+        "Lot", "cac:TenderingTerms/cac:TenderEvaluationParty", "evaluationBody"
+    ),
+    PartyReference(
+        "Lot", "cac:TenderingTerms/cac:TenderRecipientParty", "submissionReceiptBody"
+    ),
+    PartyReference("LotResult", "cac:FinancingParty", "funder", scheme="organization"),
+    PartyReference("LotResult", "cac:PayerParty", "payer", scheme="organization"),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:AdditionalInformationParty",
+        "processContactPoint",
+        pattern=ORGANIZATION_OR_TOUCHPOINT_ID,
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:DocumentProviderParty",
+        "processContactPoint",
+        pattern=ORGANIZATION_OR_TOUCHPOINT_ID,
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:AppealTerms/cac:MediationParty",
+        "mediationBody",
+        scheme="organization",
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:AppealTerms/cac:AppealInformationParty",
+        "reviewContactPoint",
+        scheme="touchpoint",
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:AppealTerms/cac:AppealReceiverParty",
+        "reviewBody",
+        scheme="touchpoint",
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:TenderEvaluationParty",
+        "evaluationBody",
+        scheme="touchpoint",
+    ),
+    PartyReference(
+        "Part",
+        "cac:TenderingTerms/cac:TenderRecipientParty",
+        "submissionReceiptBody",
+        scheme="touchpoint",
+    ),
+)
+
+LEGISLATION_DOCUMENTS: Final = (
+    "cac:TenderingTerms/cac:FiscalLegislationDocumentReference",
+    "cac:TenderingTerms/cac:EnvironmentalLegislationDocumentReference",
+    "cac:TenderingTerms/cac:EmploymentLegislationDocumentReference",
+)
+
+XPATH_REFERENCES: Final = {
+    reference: register_xpath(f"party_roles.{reference.path}", reference.path)
+    for reference in PARTY_REFERENCES
+}
+XPATH_LEGISLATION_DOCUMENTS: Final = {
+    path: register_xpath(f"party_roles.{path}", path) for path in LEGISLATION_DOCUMENTS
+}
+XPATH_ID = register_xpath("party_roles.XPATH_ID", "cbc:ID/text()")
+XPATH_ISSUER_ID = register_xpath(
+    "party_roles.XPATH_ISSUER_ID",
+    "cac:IssuerParty/cac:PartyIdentification/cbc:ID[@schemeName='organization']/text()",
+)
+XPATH_TENDER_ID = register_xpath(
+    "party_roles.XPATH_TENDER_ID", "cbc:ID[@schemeName='tender']/text()"
+)
+XPATH_ORGANIZATION_ID = register_xpath(
+    "party_roles.XPATH_ORGANIZATION_ID", "cbc:ID[@schemeName='organization']/text()"
+)
+XPATH_MAIN_CONTRACTOR_ID = register_xpath(
+    "party_roles.XPATH_MAIN_CONTRACTOR_ID",
+    "efac:MainContractor/cbc:ID[@schemeName='organization']/text()",
+)
+
+
+class _RoleCollector:
+    """Gathers the roles of each referenced party, in reference order."""
+
+    def __init__(self) -> None:
+        self.roles: dict[str, list[str]] = {}
+
+    def add(self, party_id: str | None, role: str) -> None:
+        if not party_id:
+            return
+        roles = self.roles.setdefault(party_id, [])
+        if role not in roles:
+            roles.append(role)
+
+    def parties(self) -> list[dict[str, Any]]:
+        return [
+            {"id": party_id, "roles": roles} for party_id, roles in self.roles.items()
+        ]
+
+
+def _collect_references(
+    collector: _RoleCollector, scope: str, element: etree._Element
+) -> None:
+    for reference, xpath in XPATH_REFERENCES.items():
+        if reference.scope != scope:
+            continue
+        for party_id in xpath(element):
+            if reference.pattern and not reference.pattern.match(party_id):
+                continue
+            collector.add(party_id, reference.role)
+
+
+def _legislation_documents(
+    collector: _RoleCollector, lot: etree._Element, lot_id: str | None
+) -> list[dict[str, Any]]:
+    documents = []
+    for xpath in XPATH_LEGISLATION_DOCUMENTS.values():
+        for reference in xpath(lot):
+            document_id = XPATH_ID(reference)
+            issuer_id = XPATH_ISSUER_ID(reference)
+            if not document_id or not issuer_id:
+                continue
+            collector.add(issuer_id[0], "informationService")
+            document = {"id": document_id[0], "publisher": {"id": issuer_id[0]}}
+            if lot_id:
+                document["relatedLots"] = [lot_id]
+            documents.append(document)
+    return documents
+
+
+def _subcontracts(
+    collector: _RoleCollector, subcontractors: list[etree._Element]
+) -> list[dict[str, Any]]:
+    subcontracts: list[dict[str, Any]] = []
+    for subcontractor in subcontractors:
+        subcontractor_id = XPATH_ORGANIZATION_ID(subcontractor)
+        if not subcontractor_id:
+            continue
+        main_contractor_id = XPATH_MAIN_CONTRACTOR_ID(subcontractor)
+        collector.add(subcontractor_id[0], "subcontractor")
+        if main_contractor_id:
+            collector.add(main_contractor_id[0], "tenderer")
+
+        subcontract = next(
+            (
+                item
+                for item in subcontracts
+                if item["subcontractor"]["id"] == subcontractor_id[0]
+            ),
+            None,
+        )
+        if subcontract is None:
+            subcontract = {
+                "id": str(len(subcontracts) + 1),
+                "subcontractor": {"id": subcontractor_id[0]},
+            }
+            subcontracts.append(subcontract)
+        if main_contractor_id:
+            main_contractors = subcontract.setdefault("mainContractors", [])
+            if {"id": main_contractor_id[0]} not in main_contractors:
+                main_contractors.append({"id": main_contractor_id[0]})
+    return subcontracts
+
+
+def parse_party_roles(xml_content: XMLContent) -> dict[str, Any] | None:
+    """Parse the party references of lots, parts, lot results and tenderers.
+
+    Args:
+        xml_content: The XML content to parse, or a parsed NoticeDocument
+
+    Returns:
+        A dictionary with the referenced "parties" and their roles, and, if
+        any, the legislation documents under "tender" and the subcontracts
+        under "bids", or None if the notice references no party
+
+    """
+    document = get_document(xml_content)
+    collector = _RoleCollector()
+    documents = []
+
+    for scope in ("Lot", "Part"):
+        for lot in document.procurement_project_lots(scope):
+            _collect_references(collector, scope, lot)
+            lot_id = XPATH_ID(lot)[0] if scope == "Lot" else None
+            documents.extend(_legislation_documents(collector, lot, lot_id))
+
+    for lot_result in document.elements("efac:LotResult", parent="efac:NoticeResult"):
+        _collect_references(collector, "LotResult", lot_result)
+
+    subcontracts = _subcontracts(
+        collector, document.elements("efac:SubContractor", parent="efac:TenderingParty")
+    )
+
+    if not collector.roles:
+        return None
+
+    result: dict[str, Any] = {"parties": collector.parties()}
+    if documents:
+        result["tender"] = {"documents": documents}
+    if subcontracts:
+        # Subcontracts are attached to the first lot tender of the notice
+        tender_ids = [
+            tender_id
+            for lot_tender in document.elements(
+                "efac:LotTender", parent="efac:NoticeResult"
+            )
+            for tender_id in XPATH_TENDER_ID(lot_tender)
+        ]
+        if tender_ids:
+            result["bids"] = {
+                "details": [
+                    {
+                        "id": tender_ids[0],
+                        "subcontracting": {"subcontracts": subcontracts},
+                    }
+                ]
+            }
+    return result
+
+
+def _merge_documents(
+    release_json: dict[str, Any], documents: list[dict[str, Any]]
+) -> None:
+    tender_documents = release_json.setdefault("tender", {}).setdefault("documents", [])
+    for document in documents:
+        existing_document = find_by_id(tender_documents, document["id"])
+        if existing_document is None:
+            tender_documents.append(document)
+            continue
+        existing_document["publisher"] = document["publisher"]
+        if "relatedLots" in document:
+            related_lots = existing_document.setdefault("relatedLots", [])
+            related_lots.extend(
+                lot_id
+                for lot_id in document["relatedLots"]
+                if lot_id not in related_lots
+            )
+
+
+def _merge_subcontracts(
+    release_json: dict[str, Any], bids: list[dict[str, Any]]
+) -> None:
+    bid_details = release_json.setdefault("bids", {}).setdefault("details", [])
+    for bid in bids:
+        existing_bid = find_by_id(bid_details, bid["id"])
+        if existing_bid is None:
+            bid_details.append(bid)
+            continue
+        existing_subcontracts = existing_bid.setdefault(
+            "subcontracting", {}
+        ).setdefault("subcontracts", [])
+        for subcontract in bid["subcontracting"]["subcontracts"]:
+            existing_subcontract = next(
+                (
+                    item
+                    for item in existing_subcontracts
+                    if item.get("subcontractor", {}).get("id")
+                    == subcontract["subcontractor"]["id"]
+                ),
+                None,
+            )
+            if existing_subcontract is None:
+                subcontract["id"] = str(len(existing_subcontracts) + 1)
+                existing_subcontracts.append(subcontract)
+                continue
+            main_contractors = existing_subcontract.setdefault("mainContractors", [])
+            main_contractors.extend(
+                main_contractor
+                for main_contractor in subcontract.get("mainContractors", [])
+                if main_contractor not in main_contractors
+            )
+
+
+def merge_party_roles(
+    release_json: dict[str, Any], party_roles_data: dict[str, Any] | None
+) -> None:
+    """Merge the roles of referenced parties into the release.
+
+    Roles are added to the parties with the same id, and parties that are not
+    in the release yet are added. Legislation documents are matched by id and
+    get their publisher, and subcontracts are matched by subcontractor.
+
+    Args:
+        release_json: The release to update in place
+        party_roles_data: The output of parse_party_roles()
+
+    """
+    if not party_roles_data:
+        logger.info("No party roles to merge")
+        return
+
+    parties = release_json.setdefault("parties", [])
+    for party in party_roles_data["parties"]:
+        existing_party = find_by_id(parties, party["id"])
+        if existing_party is None:
+            parties.append(party)
+            continue
+        roles = existing_party.setdefault("roles", [])
+        roles.extend(role for role in party["roles"] if role not in roles)
+
+    if "tender" in party_roles_data:
+        _merge_documents(release_json, party_roles_data["tender"]["documents"])
+    if "bids" in party_roles_data:
+        _merge_subcontracts(release_json, party_roles_data["bids"]["details"])
+
+    logger.info("Merged roles of %d parties", len(party_roles_data["parties"]))
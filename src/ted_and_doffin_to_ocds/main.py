@@ -1,20 +1,52 @@
 import argparse
-import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from functools import cached_property
+from multiprocessing.util import Finalize
 from pathlib import Path
 from typing import Any, Final
 
+from lxml import etree
 from tqdm import tqdm
 
 from ted_and_doffin_to_ocds.processors.bt_processors import process_bt_sections
+from ted_and_doffin_to_ocds.processors.bt_registry import load_converters
 from ted_and_doffin_to_ocds.utils.common_operations import (
     NoticeProcessor,
-    remove_empty_dicts,
-    remove_empty_elements,
+    prune_empty_elements,
 )
 from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.conversion_manifest import (
+    ConversionManifest,
+    converter_version,
+)
 from ted_and_doffin_to_ocds.utils.file_processor import NoticeFileProcessor
+from ted_and_doffin_to_ocds.utils.identifiers import use_deterministic_ids
+from ted_and_doffin_to_ocds.utils.notice_document import NoticeDocument
+from ted_and_doffin_to_ocds.utils.notice_header import NoticeHeader
+from ted_and_doffin_to_ocds.utils.notice_scheduler import NoticeScheduler
+from ted_and_doffin_to_ocds.utils.output_sinks import (
+    OUTPUT_FORMATS,
+    OutputSink,
+    create_sink,
+    prepare_output_folder,
+)
+from ted_and_doffin_to_ocds.utils.snapshot_manifest import SnapshotManifest
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import XPATHS
+
+EXECUTORS: Final[tuple[str, ...]] = ("thread", "process")
+
+# State of a process-pool worker, set up once per process by _init_worker
+_worker_state: dict[str, "NoticeConverter"] = {}
 
 
 class NoticeConverter:
@@ -23,8 +55,10 @@ class NoticeConverter:
     MAX_WORKERS: Final[int] = 4
     CHUNK_SIZE: Final[int] = 10  # Reduced chunk size for better progress updates
 
-    def __init__(self, config: Config) -> None:
+    def __init__(self, config: Config, sink_stem: str = "releases") -> None:
         self.config = config
+        self.sink_stem = sink_stem
+        use_deterministic_ids(config.deterministic_ids)
         self.logger = logging.getLogger(__name__)
         self.processor = NoticeProcessor(
             ocid_prefix=config.ocid_prefix,
@@ -35,6 +69,23 @@ class NoticeConverter:
         self.processor.tracker.init_db()
         self.processor.tracker.verify_schema()  # Changed to public method
 
+    @cached_property
+    def snapshot(self) -> SnapshotManifest | None:
+        """The snapshot manifest that input files are checked against, if any."""
+        if self.config.snapshot_manifest is None:
+            return None
+        return SnapshotManifest.load(self.config.snapshot_manifest)
+
+    @cached_property
+    def sink(self) -> OutputSink:
+        """The sink that converted releases are written to."""
+        return create_sink(self.config, self.sink_stem)
+
+    def close_sink(self) -> None:
+        """Close the output sink, if any release was written to it."""
+        if "sink" in self.__dict__:
+            self.sink.close()
+
     def _validate_input_file(self, input_path: Path) -> None:
         """Validate input file exists and has correct extension."""
         if not input_path.exists():
@@ -44,8 +95,17 @@ class NoticeConverter:
             msg = f"Expected XML file, got: {input_path}"
             raise ValueError(msg)
 
-    def process_file(self, input_path: Path, output_folder: Path) -> None:
-        """Process a single XML file."""
+    def process_file(
+        self,
+        input_path: Path,
+        output_folder: Path,
+        header: NoticeHeader | None = None,
+    ) -> list[Path]:
+        """Process a single XML file.
+
+        header is the notice header read while scheduling the file, if any.
+        Returns the files the releases were written to.
+        """
         try:
             self.logger.info("Processing file: %s", input_path)
             self._validate_input_file(input_path)
@@ -53,56 +113,167 @@ class NoticeConverter:
             # First try to read the file
             try:
                 xml_content = self._read_xml(input_path)
+                if self.snapshot is not None:
+                    self.snapshot.verify(input_path, xml_content)
             except Exception:
                 self.logger.exception("Failed to read XML file %s", input_path)
                 raise
 
-            # Then try to process it
-            releases = self._process_input_file(xml_content)
+            # Then try to process it. The notices it tracked are committed
+            # before the file counts as converted, so that a run that stops
+            # afterwards never skips a file whose notices were lost.
+            releases = self._process_input_file(xml_content, header)
+            self.processor.tracker.flush()
             if not releases:
                 self.logger.warning("No releases generated for file: %s", input_path)
-                return
+                return []
 
             # Finally try to write the output
-            self._write_releases(input_path, output_folder, releases)
+            output_files = self._write_releases(input_path, output_folder, releases)
             self.logger.info("Successfully processed file: %s", input_path)
 
         except Exception as e:
             self._handle_process_error(input_path, e)
             self.logger.exception("Error processing file %s", input_path)
             raise
+        else:
+            return output_files
 
     def process_files_parallel(self, files: list[Path]) -> None:
         """Process files in parallel with improved error handling and progress tracking."""
-        self.logger.info("Starting parallel processing of %d files", len(files))
-
-        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
-            # Submit all files individually
-            futures = {
-                executor.submit(self.process_file, f, self.config.output_folder): f
-                for f in files
-            }
-
-            # Track progress and handle errors
-            failed_files = []
-            with tqdm(total=len(files), desc="Processing files", unit="file") as pbar:
-                for future in as_completed(futures):
+        self.process_file_batches([files])
+
+    def process_file_batches(self, batches: Sequence[Sequence[Path]]) -> None:
+        """Process batches of files in order, the files of each batch in parallel.
+
+        A batch is only started once the previous one has finished, so that
+        notices are tracked before the notices that refer to them are
+        converted (see NoticeFileProcessor.NOTICE_ORDER).
+        """
+        total = sum(len(batch) for batch in batches)
+        self.logger.info(
+            "Starting parallel processing of %d files with %d %s workers",
+            total,
+            self.config.workers,
+            self.config.executor,
+        )
+
+        failed_files = []
+        with (
+            self._create_executor() as executor,
+            tqdm(total=total, desc="Processing files", unit="file") as pbar,
+        ):
+            for batch in batches:
+                failed_files.extend(self._process_batch(executor, batch, pbar))
+
+        self._raise_for_failures(failed_files)
+
+    def process_scheduled(
+        self,
+        scheduler: NoticeScheduler,
+        manifest: ConversionManifest | None = None,
+    ) -> None:
+        """Process files in parallel along their notice references.
+
+        A file is submitted as soon as every notice it refers to has been
+        processed, so only notices that depend on each other are serialised.
+        The progress of every file is recorded in manifest, as it happens.
+        """
+        self.logger.info(
+            "Starting scheduled processing of %d files with %d %s workers",
+            len(scheduler),
+            self.config.workers,
+            self.config.executor,
+        )
+
+        failed_files = []
+        with (
+            self._create_executor() as executor,
+            tqdm(total=len(scheduler), desc="Processing files", unit="file") as pbar,
+        ):
+            process = self._get_process_function(executor)
+            futures = {}
+            while not scheduler.finished:
+                for file_path in scheduler.take_ready():
+                    if manifest is not None:
+                        manifest.mark_started(file_path)
+                    future = executor.submit(
+                        process,
+                        file_path,
+                        self.config.output_folder,
+                        scheduler.get_notice(file_path).header,
+                    )
+                    futures[future] = file_path
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    file_path = futures.pop(future)
                     try:
-                        future.result()
-                        pbar.update(1)
+                        output_files = future.result()
                     except Exception as e:
-                        file_path = futures[future]
                         failed_files.append((file_path, str(e)))
                         self.logger.exception("Failed to process file: %s", file_path)
                         pbar.set_postfix({"failed": len(failed_files)}, refresh=True)
-                        pbar.update(1)
-
-            if failed_files:
-                self.logger.error("Failed to process %d files:", len(failed_files))
-                for file_path, error in failed_files:
-                    self.logger.error("  %s: %s", file_path.name, error)
-                error_msg = f"Failed to process {len(failed_files)} files. Check the log for details."
-                raise RuntimeError(error_msg)
+                        if manifest is not None:
+                            manifest.mark_failed(file_path, str(e))
+                    else:
+                        if manifest is not None:
+                            manifest.record(file_path, output_files)
+                    scheduler.mark_done(file_path)
+                    pbar.update(1)
+
+        self._raise_for_failures(failed_files)
+
+    def _raise_for_failures(self, failed_files: list[tuple[Path, str]]) -> None:
+        """Log the files that failed and raise if there are any."""
+        if failed_files:
+            self.logger.error("Failed to process %d files:", len(failed_files))
+            for file_path, error in failed_files:
+                self.logger.error("  %s: %s", file_path.name, error)
+            error_msg = f"Failed to process {len(failed_files)} files. Check the log for details."
+            raise RuntimeError(error_msg)
+
+    def _get_process_function(
+        self, executor: Executor
+    ) -> Callable[..., list[Path] | None]:
+        """Get the function that processes one file on the executor's workers."""
+        if isinstance(executor, ProcessPoolExecutor):
+            return _process_file_in_worker
+        return self.process_file
+
+    def _create_executor(self) -> Executor:
+        """Create the worker pool selected by the configuration."""
+        if self.config.executor == "process":
+            return ProcessPoolExecutor(
+                max_workers=self.config.workers,
+                initializer=_init_worker,
+                initargs=(self.config,),
+            )
+        return ThreadPoolExecutor(max_workers=self.config.workers)
+
+    def _process_batch(
+        self, executor: Executor, files: Sequence[Path], pbar: tqdm
+    ) -> list[tuple[Path, str]]:
+        """Process one batch of files and wait for all of them to finish."""
+        process = self._get_process_function(executor)
+
+        # Submit all files individually
+        futures = {
+            executor.submit(process, f, self.config.output_folder): f for f in files
+        }
+
+        # Track progress and handle errors
+        failed_files = []
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                file_path = futures[future]
+                failed_files.append((file_path, str(e)))
+                self.logger.exception("Failed to process file: %s", file_path)
+                pbar.set_postfix({"failed": len(failed_files)}, refresh=True)
+            pbar.update(1)
+        return failed_files
 
     def _handle_process_error(self, file_path: Path, error: Exception) -> None:
         """Handle processing errors for specific files."""
@@ -111,19 +282,32 @@ class NoticeConverter:
             f.write(f"Error processing {file_path}:\n{error!s}")
         self.logger.error("Failed to process %s: %s", file_path, error)
 
-    def _process_input_file(self, xml_content: bytes) -> list[dict[str, Any]]:
+    def _process_input_file(
+        self, xml_content: bytes, header: NoticeHeader | None = None
+    ) -> list[dict[str, Any]]:
         """Process input file and return list of releases."""
         releases = []
 
         try:
-            for release_json_str in self.processor.process_notice(xml_content):
+            notice_info = header.to_notice_info() if header else None
+            # Parse once; the notice processor and every release of this
+            # notice share the same document. Malformed XML is left to the
+            # notice processor's recovering parser.
+            self.processor.xml_processor.check_size(xml_content)
+            try:
+                document = NoticeDocument.from_content(xml_content)
+            except etree.XMLSyntaxError:
+                self.logger.exception("Invalid XML content, skipping business terms")
+                document = None
+            notice_releases = self.processor.process_notice_releases(
+                xml_content if document is None else document, notice_info
+            )
+
+            for release_json in notice_releases:
                 try:
-                    release_json = json.loads(release_json_str)
-                    process_bt_sections(release_json, xml_content)
+                    if document is not None:
+                        process_bt_sections(release_json, document)
                     releases.append(self._clean_release(release_json))
-                except json.JSONDecodeError:
-                    self.logger.exception("Invalid JSON in release")
-                    raise
                 except Exception:
                     self.logger.exception("Error processing release")
                     raise
@@ -136,17 +320,15 @@ class NoticeConverter:
             return releases
 
     def _clean_release(self, release: dict[str, Any]) -> dict[str, Any]:
-        """Clean up release data."""
-        release = remove_empty_elements(release)
-        return remove_empty_dicts(release)
+        """Clean up release data, in place."""
+        prune_empty_elements(release)
+        return release
 
     def _write_releases(
         self, input_path: Path, output_folder: Path, releases: list[dict[str, Any]]
-    ) -> None:
-        """Write releases to output files."""
-        for i, release in enumerate(releases):
-            output_file = output_folder / f"{input_path.stem}_release_{i}.json"
-            self._write_json(output_file, release)
+    ) -> list[Path]:
+        """Write releases to the output sink."""
+        return self.sink.write(input_path, output_folder, releases)
 
     def _read_xml(self, input_path: Path) -> bytes:
         """Read XML content from file."""
@@ -157,18 +339,33 @@ class NoticeConverter:
             )
             return content
 
-    def _write_json(self, output_file: Path, data: dict[str, Any]) -> None:
-        """Write JSON data to file."""
-        self.logger.debug("Writing to output file: %s", output_file)
-        with output_file.open("w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False)
-        self.logger.debug("Successfully wrote release to file")
 
+def _init_worker(config: Config) -> None:
+    """Initialise a process-pool worker.
+
+    Runs once per worker process: loads every converter, and creates the
+    worker's own NoticeConverter, whose NoticeTracker opens its own database
+    connection and writer thread in this process. Each worker streams
+    releases to files of its own. The files and the tracker are closed when
+    the worker process exits.
+    """
+    if not logging.getLogger().handlers:
+        configure_logging(config.log_level, mode="a")
+    load_converters()
+    converter = NoticeConverter(config, sink_stem=f"releases-{os.getpid()}")
+    Finalize(converter, converter.close_sink, exitpriority=10)
+    Finalize(converter, converter.processor.tracker.close, exitpriority=10)
+    _worker_state["converter"] = converter
 
-# json.dump(data, f, ensure_ascii=False, indent=2)
 
+def _process_file_in_worker(
+    input_path: Path, output_folder: Path, header: NoticeHeader | None = None
+) -> list[Path]:
+    """Process a single XML file with the converter of this worker process."""
+    return _worker_state["converter"].process_file(input_path, output_folder, header)
 
-def configure_logging(level: str = "INFO") -> None:
+
+def configure_logging(level: str = "INFO", mode: str = "w") -> None:
     """Configure logging system."""
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     logger = logging.getLogger()
@@ -186,7 +383,7 @@ def configure_logging(level: str = "INFO") -> None:
 
     # Add only file handler
     log_file = Path("app.log")
-    file_handler = logging.FileHandler(log_file, mode="w")
+    file_handler = logging.FileHandler(log_file, mode=mode)
     file_handler.setLevel(numeric_level)
     file_handler.setFormatter(formatter)
     logger.addHandler(file_handler)
@@ -236,7 +433,76 @@ def parse_arguments(
         default="INFO",
         help="Set the logging level",
     )
+    parser.add_argument(
+        "--workers",
+        type=positive_int,
+        default=NoticeConverter.MAX_WORKERS,
+        help=f"Number of parallel workers (default: {NoticeConverter.MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=EXECUTORS,
+        default="thread",
+        help="Run workers as threads or as separate processes (default: thread)",
+    )
+    parser.add_argument(
+        "--zero-copy",
+        action="store_true",
+        help="Read input files in place instead of copying them to a temporary directory",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Convert every input file, including files converted unchanged by "
+        "a previous run",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted run into the same output folder, skipping "
+        "the files it converted",
+    )
+    parser.add_argument(
+        "--deterministic-ids",
+        action="store_true",
+        help="Derive new OCIDs and other generated ids from the notice, so that "
+        "converting the same notice always gives the same output",
+    )
+    parser.add_argument(
+        "--output-format",
+        choices=OUTPUT_FORMATS,
+        default="files",
+        help="Write one JSON file per release, JSON Lines files, or OCDS release "
+        "packages (default: files)",
+    )
+    parser.add_argument(
+        "--rotate-releases",
+        type=positive_int,
+        default=10_000,
+        help="With --output-format jsonl or package, maximum number of releases "
+        "per output file (default: 10000)",
+    )
+    parser.add_argument(
+        "--rotate-bytes",
+        type=positive_int,
+        help="With --output-format jsonl or package, maximum size of an output "
+        "file in bytes",
+    )
+    parser.add_argument(
+        "--publisher-name",
+        help="With --output-format package, name of the publisher of the packages",
+    )
+    parser.add_argument(
+        "--snapshot-manifest",
+        help="With --zero-copy, manifest of the input files (path, size, mtime, "
+        "hash) used to detect files that change during the run; "
+        "written if it does not exist",
+    )
     args = parser.parse_args()
+    if args.snapshot_manifest and not args.zero_copy:
+        parser.error("--snapshot-manifest requires --zero-copy")
+    if args.output_format == "package" and not args.publisher_name:
+        parser.error("--output-format package requires --publisher-name")
 
     return Config(
         input_path=Path(args.input),
@@ -246,9 +512,31 @@ def parse_arguments(
         db_path=Path(args.db),
         clear_db=args.clear_db,
         log_level=args.log_level,
+        workers=args.workers,
+        executor=args.executor,
+        zero_copy=args.zero_copy,
+        snapshot_manifest=Path(args.snapshot_manifest)
+        if args.snapshot_manifest
+        else None,
+        force=args.force,
+        resume=args.resume,
+        deterministic_ids=args.deterministic_ids,
+        output_format=args.output_format,
+        rotate_releases=args.rotate_releases,
+        rotate_bytes=args.rotate_bytes,
+        publisher_name=args.publisher_name,
     )
 
 
+def positive_int(value: str) -> int:
+    """Argument type for options that take a positive integer."""
+    number = int(value)
+    if number < 1:
+        msg = f"must be a positive integer, got {value}"
+        raise argparse.ArgumentTypeError(msg)
+    return number
+
+
 def main(
     input_path: str | None = None,
     output_folder: str | None = None,
@@ -280,8 +568,10 @@ def process_files(converter: NoticeConverter, config: Config) -> None:
     """Process all input files."""
     logger = logging.getLogger(__name__)
 
+    manifest = None
     try:
         config.output_folder.mkdir(parents=True, exist_ok=True)
+        prepare_output_folder(config)
 
         # Verify database connection and schema
         try:
@@ -291,28 +581,72 @@ def process_files(converter: NoticeConverter, config: Config) -> None:
             logger.exception("Database initialization failed")
             raise
 
+        manifest = ConversionManifest(
+            config.db_path, config.output_folder, converter_version(config)
+        )
+        # JSON Lines files and packages of earlier runs are replaced unless the
+        # run is resumed, so the files converted into them must be converted
+        # again, or their releases would be lost
+        skip_unchanged = not config.force and (
+            config.output_format == "files" or config.resume
+        )
+        if not config.force and not skip_unchanged:
+            logger.info(
+                "Converting every file, as %s output replaces earlier runs' files",
+                config.output_format,
+            )
         input_path = config.input_path
         logger.info("Processing input: %s", input_path)
 
         if input_path.is_file():
             # Process single file directly
-            converter.process_file(input_path, config.output_folder)
+            files = [input_path]
+            if skip_unchanged:
+                files = manifest.select_changed(files)
+            for file_path in manifest.start_run(files, resume=config.resume):
+                manifest.mark_started(file_path)
+                try:
+                    output_files = converter.process_file(
+                        file_path, config.output_folder
+                    )
+                except Exception as e:
+                    manifest.mark_failed(file_path, str(e))
+                    raise
+                manifest.record(file_path, output_files)
             return
 
         # Process multiple files
-        with NoticeFileProcessor(input_path, config.output_folder) as processor:
-            processor.copy_input_files()
-            files = processor.get_sorted_files()
+        with NoticeFileProcessor(
+            input_path,
+            config.output_folder,
+            zero_copy=config.zero_copy,
+            snapshot_path=config.snapshot_manifest,
+        ) as processor:
+            processor.prepare_input_files()
+            files = processor.list_input_files()
+            if skip_unchanged:
+                files = manifest.select_changed(files)
+            processor.restrict_input_files(
+                manifest.start_run(files, resume=config.resume)
+            )
+            scheduler = processor.get_schedule()
 
-            if not files:
+            if not scheduler:
                 logger.warning("No XML files found to process")
                 return
 
-            converter.process_files_parallel(files)
+            converter.process_scheduled(scheduler, manifest)
 
     except Exception:
         logger.exception("Failed to process files")
         raise
+    finally:
+        converter.close_sink()
+        converter.processor.tracker.close()
+        if manifest is not None:
+            manifest.close()
+        # Worker processes keep their own counts, so only thread runs show up
+        XPATHS.log_counts()
 
 
 if __name__ == "__main__":
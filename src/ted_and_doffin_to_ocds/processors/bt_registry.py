@@ -0,0 +1,2650 @@
+# src/ted_and_doffin_to_ocds/processors/bt_registry.py
+
+import importlib
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import cache
+from typing import Final
+
+logger = logging.getLogger(__name__)
+
+CONVERTERS_PACKAGE: Final[str] = "ted_and_doffin_to_ocds.converters.eforms"
+
+NOTICE_ROOT_TAGS: Final[frozenset[str]] = frozenset(
+    {"PriorInformationNotice", "ContractNotice", "ContractAwardNotice"}
+)
+CONTRACT_AWARD_NOTICES: Final[frozenset[str]] = frozenset({"ContractAwardNotice"})
+CONTRACT_MODIFICATION_NOTICES: Final[frozenset[str]] = frozenset({"can-modif"})
+
+# eForms scopes that can only occur in one kind of notice. Converters in
+# other scopes apply to every notice unless their spec says otherwise.
+SCOPE_NOTICE_TYPES: Final[dict[str, frozenset[str]]] = {
+    "LotResult": CONTRACT_AWARD_NOTICES,
+    "Tender": CONTRACT_AWARD_NOTICES,
+    "Contract": CONTRACT_AWARD_NOTICES,
+    "Tenderer": CONTRACT_AWARD_NOTICES,
+    "Part": frozenset({"PriorInformationNotice"}),
+}
+
+
+@cache
+def _load_callables(
+    module_path: str, parse: str, merge: str
+) -> tuple[Callable, Callable]:
+    """Import a converter module and return its parse and merge functions."""
+    module = importlib.import_module(module_path)
+    logger.debug("Loaded converter module %s", module_path)
+    return getattr(module, parse), getattr(module, merge)
+
+
+@dataclass(frozen=True)
+class ConverterSpec:
+    """Declarative description of one business term converter.
+
+    Attributes:
+        bt_id: Business term identifier, e.g. "BT-21" or "BT-195(BT-541)"
+        scope: eForms scope the term belongs to, e.g. "Lot" or "LotResult"
+        module: Converter module name inside converters.eforms
+        parse: Name of the parse function in the module
+        merge: Name of the merge function in the module
+        section_name: Human readable name used in log messages
+        notice_types: Notice types the converter applies to, matched against
+            the root element name or the NoticeTypeCode. None falls back to
+            the scope default in SCOPE_NOTICE_TYPES.
+
+    The module is only imported the first time load() is called.
+    """
+
+    bt_id: str
+    scope: str
+    module: str
+    parse: str
+    merge: str
+    section_name: str
+    notice_types: frozenset[str] | None = None
+
+    @property
+    def module_path(self) -> str:
+        """Full dotted path of the converter module."""
+        return f"{CONVERTERS_PACKAGE}.{self.module}"
+
+    def load(self) -> tuple[Callable, Callable]:
+        """Import the converter module on demand and return (parse, merge)."""
+        return _load_callables(self.module_path, self.parse, self.merge)
+
+    def applies_to(self, root_tag: str, notice_type_code: str) -> bool:
+        """Check whether the converter can find data in a notice of this type.
+
+        Every eForms notice declares its NoticeTypeCode; documents without one
+        or with an unknown root element (e.g. hand-written fragments) are
+        never pruned.
+        """
+        notice_types = self.notice_types or SCOPE_NOTICE_TYPES.get(self.scope)
+        if (
+            notice_types is None
+            or not notice_type_code
+            or root_tag not in NOTICE_ROOT_TAGS
+        ):
+            return True
+        return root_tag in notice_types or notice_type_code in notice_types
+
+
+# Converters in processing order. Merges can depend on data added by earlier
+# converters, so new entries must be placed with care.
+BT_CONVERTERS: Final[tuple[ConverterSpec, ...]] = (
+    ConverterSpec(
+        "BT-01",
+        "Procedure",
+        "bt_01_procedure",
+        "parse_procedure_legal_basis",
+        "merge_procedure_legal_basis",
+        "procedure Legal Basis (BT-01)",
+    ),
+    ConverterSpec(
+        "BT-03",
+        "Notice",
+        "bt_03",
+        "parse_form_type",
+        "merge_form_type",
+        "Form Type (BT-03)",
+    ),
+    ConverterSpec(
+        "BT-04",
+        "Procedure",
+        "bt_04_procedure",
+        "parse_procedure_identifier",
+        "merge_procedure_identifier",
+        "procedure Identifier (BT-04)",
+    ),
+    ConverterSpec(
+        "BT-05",
+        "Notice",
+        "bt_05_notice",
+        "parse_notice_dispatch_date_time",
+        "merge_notice_dispatch_date_time",
+        "notice Dispatch Date and Time (BT-05)",
+    ),
+    ConverterSpec(
+        "BT-06",
+        "Lot",
+        "bt_06_lot",
+        "parse_strategic_procurement",
+        "merge_strategic_procurement",
+        "Strategic Procurement (BT-06)",
+    ),
+    ConverterSpec(
+        "BT-09",
+        "Procedure",
+        "bt_09_procedure",
+        "parse_cross_border_law",
+        "merge_cross_border_law",
+        "Cross Border Law (BT-09)",
+    ),
+    ConverterSpec(
+        "BT-10",
+        "Procedure",
+        "bt_10",
+        "parse_authority_activity",
+        "merge_authority_activity",
+        "organization Main Activity (BT-10)",
+    ),
+    ConverterSpec(
+        "BT-105",
+        "Procedure",
+        "bt_105_procedure",
+        "parse_procedure_type",
+        "merge_procedure_type",
+        "procedure Type (BT-105)",
+    ),
+    ConverterSpec(
+        "BT-106",
+        "Procedure",
+        "bt_106_procedure",
+        "parse_procedure_accelerated",
+        "merge_procedure_accelerated",
+        "procedure Accelerated (BT-106)",
+    ),
+    ConverterSpec(
+        "BT-109",
+        "Lot",
+        "bt_109_lot",
+        "parse_framework_duration_justification",
+        "merge_framework_duration_justification",
+        "Framework Duration Justification (BT-109)",
+    ),
+    ConverterSpec(
+        "BT-11",
+        "Procedure",
+        "bt_11_procedure_buyer",
+        "parse_buyer_legal_type",
+        "merge_buyer_legal_type",
+        "buyer Legal Type (BT-11)",
+    ),
+    ConverterSpec(
+        "BT-111",
+        "Lot",
+        "bt_111_lot",
+        "parse_framework_buyer_categories",
+        "merge_framework_buyer_categories",
+        "Framework buyer Categories (BT-111)",
+    ),
+    ConverterSpec(
+        "BT-113",
+        "Lot",
+        "bt_113_lot",
+        "parse_framework_max_participants",
+        "merge_framework_max_participants",
+        "Framework Maximum participants Number (BT-113)",
+    ),
+    ConverterSpec(
+        "BT-115",
+        "Lot",
+        "bt_115_gpa_coverage",
+        "parse_gpa_coverage",
+        "merge_gpa_coverage",
+        "GPA Coverage (BT-115)",
+    ),
+    ConverterSpec(
+        "BT-115",
+        "Part",
+        "bt_115_part_gpa_coverage",
+        "parse_gpa_coverage_part",
+        "merge_gpa_coverage_part",
+        "bt_115_part_gpa_coverage",
+    ),
+    ConverterSpec(
+        "BT-119",
+        "LotResult",
+        "bt_119_lotresult",
+        "parse_dps_termination",
+        "merge_dps_termination",
+        "DPS Termination (BT-119)",
+    ),
+    ConverterSpec(
+        "BT-120",
+        "Lot",
+        "bt_120_lot",
+        "parse_no_negotiation_necessary",
+        "merge_no_negotiation_necessary",
+        "No Negotiation Necessary (BT-120)",
+    ),
+    ConverterSpec(
+        "BT-122",
+        "Lot",
+        "bt_122_lot",
+        "parse_electronic_auction_description",
+        "merge_electronic_auction_description",
+        "Electronic Auction Description (BT-122)",
+    ),
+    ConverterSpec(
+        "BT-123",
+        "Lot",
+        "bt_123_lot",
+        "parse_electronic_auction_url",
+        "merge_electronic_auction_url",
+        "Electronic Auction URL (BT-123)",
+    ),
+    ConverterSpec(
+        "BT-124",
+        "Lot",
+        "bt_124_lot",
+        "parse_tool_atypical_url",
+        "merge_tool_atypical_url",
+        "Tool Atypical URL (BT-124-Lot)",
+    ),
+    ConverterSpec(
+        "BT-124",
+        "Part",
+        "bt_124_part",
+        "parse_tool_atypical_url_part",
+        "merge_tool_atypical_url_part",
+        "Tool Atypical URL (BT-124-part)",
+    ),
+    ConverterSpec(
+        "BT-125",
+        "Lot",
+        "bt_125_lot",
+        "parse_previous_planning_identifier_lot",
+        "merge_previous_planning_identifier_lot",
+        "Previous Planning Identifier (Lot) (BT-125(i))",
+    ),
+    ConverterSpec(
+        "BT-125",
+        "Part",
+        "bt_125_part",
+        "parse_previous_planning_identifier_part",
+        "merge_previous_planning_identifier_part",
+        "Previous Planning Identifier (part) (BT-125(i) and BT-1251)",
+    ),
+    ConverterSpec(
+        "BT-1252",
+        "Procedure",
+        "bt_1252_procedure",
+        "parse_direct_award_justification",
+        "merge_direct_award_justification",
+        "Direct Award Justification (BT-1252)",
+    ),
+    ConverterSpec(
+        "BT-127",
+        "Notice",
+        "bt_127_notice",
+        "parse_future_notice_date",
+        "merge_future_notice_date",
+        "Future notice Date (BT-127)",
+    ),
+    ConverterSpec(
+        "BT-13",
+        "Lot",
+        "bt_13_lot",
+        "parse_additional_info_deadline",
+        "merge_additional_info_deadline",
+        "Additional Information Deadline (BT-13)",
+    ),
+    ConverterSpec(
+        "BT-13",
+        "Part",
+        "bt_13_part",
+        "parse_additional_info_deadline_part",
+        "merge_additional_info_deadline_part",
+        "Additional Information Deadline (part) (BT-13)",
+    ),
+    ConverterSpec(
+        "BT-130",
+        "Lot",
+        "bt_130_lot",
+        "parse_dispatch_invitation_tender",
+        "merge_dispatch_invitation_tender",
+        "Dispatch Invitation Tender (BT-130)",
+    ),
+    ConverterSpec(
+        "BT-131",
+        "Lot",
+        "bt_131_lot",
+        "parse_deadline_receipt_tenders",
+        "merge_deadline_receipt_tenders",
+        "Deadline Receipt Tenders (BT-131)",
+    ),
+    ConverterSpec(
+        "BT-1311",
+        "Lot",
+        "bt_1311_lot",
+        "parse_deadline_receipt_requests",
+        "merge_deadline_receipt_requests",
+        "Deadline Receipt Requests (BT-1311)",
+    ),
+    ConverterSpec(
+        "BT-132",
+        "Lot",
+        "bt_132_lot",
+        "parse_lot_public_opening_date",
+        "merge_lot_public_opening_date",
+        "Lot Public Opening Date (BT-132)",
+    ),
+    ConverterSpec(
+        "BT-133",
+        "Lot",
+        "bt_133_lot",
+        "parse_lot_bid_opening_location",
+        "merge_lot_bid_opening_location",
+        "Lot Bid Opening Location (BT-133)",
+    ),
+    ConverterSpec(
+        "BT-134",
+        "Lot",
+        "bt_134_lot",
+        "parse_lot_public_opening_description",
+        "merge_lot_public_opening_description",
+        "Lot Public Opening Description (BT-134)",
+    ),
+    ConverterSpec(
+        "BT-135",
+        "Procedure",
+        "bt_135_procedure",
+        "parse_direct_award_justification_rationale",
+        "merge_direct_award_justification_rationale",
+        "Direct Award Justification Rationale (BT-135)",
+    ),
+    ConverterSpec(
+        "BT-1351",
+        "Procedure",
+        "bt_1351_procedure",
+        "parse_accelerated_procedure_justification",
+        "merge_accelerated_procedure_justification",
+        "Accelerated procedure Justification (BT-1351)",
+    ),
+    ConverterSpec(
+        "BT-136",
+        "Procedure",
+        "bt_136_procedure",
+        "parse_direct_award_justification_code",
+        "merge_direct_award_justification_code",
+        "Direct Award Justification Code (BT-136)",
+    ),
+    ConverterSpec(
+        "BT-137",
+        "Lot",
+        "bt_137_lot",
+        "parse_purpose_lot_identifier",
+        "merge_purpose_lot_identifier",
+        "Purpose Lot Identifier (BT-137-Lot)",
+    ),
+    ConverterSpec(
+        "BT-137",
+        "LotsGroup",
+        "bt_137_lotsgroup",
+        "parse_lots_group_identifier",
+        "merge_lots_group_identifier",
+        "Lots Group Identifier (BT-137-LotsGroup)",
+    ),
+    ConverterSpec(
+        "BT-137",
+        "Part",
+        "bt_137_part",
+        "parse_part_identifier",
+        "merge_part_identifier",
+        "part Identifier (BT-137-part)",
+    ),
+    ConverterSpec(
+        "BT-13713",
+        "LotResult",
+        "bt_13713_lotresult",
+        "parse_lot_result_identifier",
+        "merge_lot_result_identifier",
+        "Lot Result Identifier (BT-13713)",
+    ),
+    ConverterSpec(
+        "BT-13714",
+        "Tender",
+        "bt_13714_tender",
+        "parse_tender_lot_identifier",
+        "merge_tender_lot_identifier",
+        "Tender Lot Identifier (BT-13714)",
+    ),
+    ConverterSpec(
+        "BT-1375",
+        "Procedure",
+        "bt_1375_procedure",
+        "parse_group_lot_identifier",
+        "merge_group_lot_identifier",
+        "Group Lot Identifier (BT-1375)",
+    ),
+    ConverterSpec(
+        "BT-14",
+        "Lot",
+        "bt_14_lot",
+        "parse_lot_documents_restricted",
+        "merge_lot_documents_restricted",
+        "Lot Documents Restricted (BT-14-Lot)",
+    ),
+    ConverterSpec(
+        "BT-14",
+        "Part",
+        "bt_14_part",
+        "parse_part_documents_restricted",
+        "merge_part_documents_restricted",
+        "part Documents Restricted (BT-14-part)",
+    ),
+    ConverterSpec(
+        "BT-140",
+        "Notice",
+        "bt_140_notice",
+        "parse_change_reason_code",
+        "merge_change_reason_code",
+        "Change Reason Code (BT-140)",
+    ),
+    ConverterSpec(
+        "BT-142",
+        "LotResult",
+        "bt_142_lotresult",
+        "parse_winner_chosen",
+        "merge_winner_chosen",
+        "Winner Chosen (BT-142)",
+    ),
+    ConverterSpec(
+        "BT-144",
+        "LotResult",
+        "bt_144_lotresult",
+        "parse_not_awarded_reason",
+        "merge_not_awarded_reason",
+        "Not Awarded Reason (BT-144)",
+    ),
+    ConverterSpec(
+        "BT-145",
+        "Contract",
+        "bt_145_contract",
+        "parse_contract_conclusion_date",
+        "merge_contract_conclusion_date",
+        "Contract Conclusion Date (BT-145)",
+    ),
+    ConverterSpec(
+        "BT-1451",
+        "Contract",
+        "bt_1451_contract",
+        "parse_winner_decision_date",
+        "merge_winner_decision_date",
+        "Winner Decision Date (BT-1451)",
+    ),
+    ConverterSpec(
+        "BT-15",
+        "Lot",
+        "bt_15_lot_part",
+        "parse_documents_url",
+        "merge_documents_url",
+        "Documents URL (BT-15)",
+    ),
+    ConverterSpec(
+        "BT-150",
+        "Contract",
+        "bt_150_contract",
+        "parse_contract_identifier",
+        "merge_contract_identifier",
+        "Contract Identifier (BT-150)",
+    ),
+    ConverterSpec(
+        "BT-151",
+        "Contract",
+        "bt_151_contract",
+        "parse_contract_url",
+        "merge_contract_url",
+        "Contract URL (BT-151)",
+    ),
+    ConverterSpec(
+        "BT-500-OPT-302",
+        "Organization",
+        "organizations",
+        "parse_organizations",
+        "merge_organizations",
+        "Organizations, touchpoints and beneficial owners",
+    ),
+    ConverterSpec(
+        "BT-160",
+        "Tender",
+        "bt_160_tender",
+        "parse_concession_revenue_buyer",
+        "merge_concession_revenue_buyer",
+        "Concession Revenue buyer (BT-160)",
+    ),
+    ConverterSpec(
+        "BT-162",
+        "Tender",
+        "bt_162_tender",
+        "parse_concession_revenue_user",
+        "merge_concession_revenue_user",
+        "Concession Revenue User (BT-162)",
+    ),
+    ConverterSpec(
+        "BT-163",
+        "Tender",
+        "bt_163_tender",
+        "parse_concession_value_description",
+        "merge_concession_value_description",
+        "Concession Value Description (BT-163)",
+    ),
+    ConverterSpec(
+        "BT-17",
+        "Lot",
+        "bt_17_lot",
+        "parse_submission_electronic",
+        "merge_submission_electronic",
+        "Submission Electronic (BT-17)",
+    ),
+    ConverterSpec(
+        "BT-171",
+        "Tender",
+        "bt_171_tender",
+        "parse_tender_rank",
+        "merge_tender_rank",
+        "Tender Rank (BT-171)",
+    ),
+    ConverterSpec(
+        "BT-1711",
+        "Tender",
+        "bt_1711_tender",
+        "parse_tender_ranked",
+        "merge_tender_ranked",
+        "Tender Ranked (BT-1711)",
+    ),
+    ConverterSpec(
+        "BT-18",
+        "Lot",
+        "bt_18_lot",
+        "parse_submission_url",
+        "merge_submission_url",
+        "Submission URL (BT-18)",
+    ),
+    ConverterSpec(
+        "BT-19",
+        "Lot",
+        "bt_19_lot",
+        "parse_submission_nonelectronic_justification",
+        "merge_submission_nonelectronic_justification",
+        "Submission Nonelectronic Justification (BT-19)",
+    ),
+    ConverterSpec(
+        "BT-191",
+        "Tender",
+        "bt_191_tender",
+        "parse_country_origin",
+        "merge_country_origin",
+        "Country Origin (BT-191)",
+    ),
+    ConverterSpec(
+        "BT-193",
+        "Tender",
+        "bt_193_tender",
+        "parse_tender_variant",
+        "merge_tender_variant",
+        "Tender Variant (BT-193)",
+    ),
+    ConverterSpec(
+        "BT-195-BT-198",
+        "Notice",
+        "fields_privacy",
+        "parse_fields_privacy",
+        "merge_fields_privacy",
+        "Unpublished Fields (BT-195, BT-196, BT-197, BT-198)",
+    ),
+    ConverterSpec(
+        "BT-200",
+        "Contract",
+        "bt_200_contract",
+        "parse_contract_modification_reason",
+        "merge_contract_modification_reason",
+        "BT-200-Contract (Contract Modification Reason)",
+        CONTRACT_MODIFICATION_NOTICES,
+    ),
+    ConverterSpec(
+        "BT-201",
+        "Contract",
+        "bt_201_contract",
+        "parse_contract_modification_description",
+        "merge_contract_modification_description",
+        "BT-201-Contract (Contract Modification Description)",
+        CONTRACT_MODIFICATION_NOTICES,
+    ),
+    ConverterSpec(
+        "BT-202",
+        "Contract",
+        "bt_202_contract",
+        "parse_contract_modification_summary",
+        "merge_contract_modification_summary",
+        "BT-202-Contract (Contract Modification Summary)",
+        CONTRACT_MODIFICATION_NOTICES,
+    ),
+    ConverterSpec(
+        "BT-21",
+        "Lot",
+        "bt_21_lot",
+        "parse_lot_title",
+        "merge_lot_title",
+        "BT-21-Lot (Lot Title)",
+    ),
+    ConverterSpec(
+        "BT-21",
+        "LotsGroup",
+        "bt_21_lotsgroup",
+        "parse_lots_group_title",
+        "merge_lots_group_title",
+        "BT-21-LotsGroup (Lots Group Title)",
+    ),
+    ConverterSpec(
+        "BT-21",
+        "Part",
+        "bt_21_part",
+        "parse_part_title",
+        "merge_part_title",
+        "BT-21-part (part Title)",
+    ),
+    ConverterSpec(
+        "BT-21",
+        "Procedure",
+        "bt_21_procedure",
+        "parse_procedure_title",
+        "merge_procedure_title",
+        "BT-21-procedure (procedure Title)",
+    ),
+    ConverterSpec(
+        "BT-22",
+        "Lot",
+        "bt_22_lot",
+        "parse_lot_internal_identifier",
+        "merge_lot_internal_identifier",
+        "BT-22-lot",
+    ),
+    ConverterSpec(
+        "BT-22",
+        "LotsGroup",
+        "bt_22_lotsgroup",
+        "parse_lots_group_internal_identifier",
+        "merge_lots_group_internal_identifier",
+        "BT-22-lotsgroup",
+    ),
+    ConverterSpec(
+        "BT-22",
+        "Part",
+        "bt_22_part",
+        "parse_part_internal_identifier",
+        "merge_part_internal_identifier",
+        "BT-22-part",
+    ),
+    ConverterSpec(
+        "BT-22",
+        "Procedure",
+        "bt_22_procedure",
+        "parse_procedure_internal_identifier",
+        "merge_procedure_internal_identifier",
+        "BT-22-procedure",
+    ),
+    ConverterSpec(
+        "BT-23",
+        "Lot",
+        "bt_23_lot",
+        "parse_main_nature",
+        "merge_main_nature",
+        "BT-23-Lot (Main Nature)",
+    ),
+    ConverterSpec(
+        "BT-23",
+        "Part",
+        "bt_23_part",
+        "parse_main_nature_part",
+        "merge_main_nature_part",
+        "BT-23-part (Main Nature part)",
+    ),
+    ConverterSpec(
+        "BT-23",
+        "Procedure",
+        "bt_23_procedure",
+        "parse_main_nature_procedure",
+        "merge_main_nature_procedure",
+        "BT-23-procedure (Main Nature procedure)",
+    ),
+    ConverterSpec(
+        "BT-24",
+        "Lot",
+        "bt_24_lot",
+        "parse_lot_description",
+        "merge_lot_description",
+        "BT-24-Lot (Lot Description)",
+    ),
+    ConverterSpec(
+        "BT-24",
+        "LotsGroup",
+        "bt_24_lotsgroup",
+        "parse_lots_group_description",
+        "merge_lots_group_description",
+        "BT-24-LotsGroup (Lots Group Description)",
+    ),
+    ConverterSpec(
+        "BT-24",
+        "Part",
+        "bt_24_part",
+        "parse_part_description",
+        "merge_part_description",
+        "BT-24-part (part Description)",
+    ),
+    ConverterSpec(
+        "BT-24",
+        "Procedure",
+        "bt_24_procedure",
+        "parse_procedure_description",
+        "merge_procedure_description",
+        "BT-24-procedure (procedure Description)",
+    ),
+    ConverterSpec(
+        "BT-25",
+        "Lot",
+        "bt_25_lot",
+        "parse_lot_quantity",
+        "merge_lot_quantity",
+        "BT-25-Lot (Lot Quantity)",
+    ),
+    ConverterSpec(
+        "BT-26(a)",
+        "Lot",
+        "bt_26a_lot",
+        "parse_classification_type",
+        "merge_classification_type",
+        "BT-26-Lot (Classification Type)",
+    ),
+    ConverterSpec(
+        "BT-26(a)",
+        "Part",
+        "bt_26a_part",
+        "parse_classification_type_part",
+        "merge_classification_type_part",
+        "BT-26-part (Classification Type part)",
+    ),
+    ConverterSpec(
+        "BT-26(a)",
+        "Procedure",
+        "bt_26a_procedure",
+        "parse_classification_type_procedure",
+        "merge_classification_type_procedure",
+        "BT-26-procedure (Classification Type procedure)",
+    ),
+    ConverterSpec(
+        "BT-26(m)",
+        "Lot",
+        "bt_26m_lot",
+        "parse_main_classification_type_lot",
+        "merge_main_classification_type_lot",
+        "Main Classification Type for Lot (BT_26m_lot)",
+    ),
+    ConverterSpec(
+        "BT-26(m)",
+        "Part",
+        "bt_26m_part",
+        "parse_main_classification_type_part",
+        "merge_main_classification_type_part",
+        "Main Classification Type for part (BT_26m_part)",
+    ),
+    ConverterSpec(
+        "BT-26(m)",
+        "Procedure",
+        "bt_26m_procedure",
+        "parse_main_classification_type_procedure",
+        "merge_main_classification_type_procedure",
+        "Main Classification Type for procedure (BT_26m_procedure)",
+    ),
+    ConverterSpec(
+        "BT-262",
+        "Lot",
+        "bt_262_lot",
+        "parse_main_classification_code_lot",
+        "merge_main_classification_code_lot",
+        "Main Classification Code for Lot (BT_262_lot)",
+    ),
+    ConverterSpec(
+        "BT-262",
+        "Part",
+        "bt_262_part",
+        "parse_main_classification_code_part",
+        "merge_main_classification_code_part",
+        "Main Classification Code for part (BT_262_part)",
+    ),
+    ConverterSpec(
+        "BT-262",
+        "Procedure",
+        "bt_262_procedure",
+        "parse_main_classification_code_procedure",
+        "merge_main_classification_code_procedure",
+        "Main Classification Code for procedure (BT_262_procedure)",
+    ),
+    ConverterSpec(
+        "BT-263",
+        "Lot",
+        "bt_263_lot",
+        "parse_additional_classification_code",
+        "merge_additional_classification_code",
+        "Additional Classification Code (BT-263-Lot)",
+    ),
+    ConverterSpec(
+        "BT-263",
+        "Part",
+        "bt_263_part",
+        "parse_additional_classification_code_part",
+        "merge_additional_classification_code_part",
+        "Additional Classification Code for part (BT_263_part)",
+    ),
+    ConverterSpec(
+        "BT-263",
+        "Procedure",
+        "bt_263_procedure",
+        "parse_additional_classification_code_procedure",
+        "merge_additional_classification_code_procedure",
+        "Additional Classification Code for procedure (BT_263_procedure)",
+    ),
+    ConverterSpec(
+        "BT-27",
+        "Lot",
+        "bt_27_lot",
+        "parse_lot_estimated_value",
+        "merge_lot_estimated_value",
+        "Lot Estimated Value (BT-27-Lot)",
+    ),
+    ConverterSpec(
+        "BT-27",
+        "LotsGroup",
+        "bt_27_lotsgroup",
+        "parse_bt_27_lots_group",
+        "merge_bt_27_lots_group",
+        "LotsGroup Estimated Value (BT-27-LotsGroup)",
+    ),
+    ConverterSpec(
+        "BT-27",
+        "Part",
+        "bt_27_part",
+        "parse_bt_27_part",
+        "merge_bt_27_part",
+        "part Estimated Value (BT-27-part)",
+    ),
+    ConverterSpec(
+        "BT-27",
+        "Procedure",
+        "bt_27_procedure",
+        "parse_bt_27_procedure",
+        "merge_bt_27_procedure",
+        "procedure Estimated Value (BT-27-procedure)",
+    ),
+    ConverterSpec(
+        "BT-271",
+        "Lot",
+        "bt_271_lot",
+        "parse_bt_271_lot",
+        "merge_bt_271_lot",
+        "Lot Framework Maximum Value (BT-271-Lot)",
+    ),
+    ConverterSpec(
+        "BT-271",
+        "LotsGroup",
+        "bt_271_lotsgroup",
+        "parse_bt_271_lots_group",
+        "merge_bt_271_lots_group",
+        "LotsGroup Framework Maximum Value (BT-271-LotsGroup)",
+    ),
+    ConverterSpec(
+        "BT-271",
+        "Procedure",
+        "bt_271_procedure",
+        "parse_bt_271_procedure",
+        "merge_bt_271_procedure",
+        "procedure Framework Maximum Value (BT-271-procedure)",
+    ),
+    ConverterSpec(
+        "BT-300",
+        "Lot",
+        "bt_300_lot",
+        "parse_lot_additional_info",
+        "merge_lot_additional_info",
+        "BT-300-Lot (Lot Additional Information)",
+    ),
+    ConverterSpec(
+        "BT-300",
+        "LotsGroup",
+        "bt_300_lotsgroup",
+        "parse_lotsgroup_additional_info",
+        "merge_lotsgroup_additional_info",
+        "BT-300-LotsGroup (Lots Group Additional Information)",
+    ),
+    ConverterSpec(
+        "BT-300",
+        "Part",
+        "bt_300_part",
+        "parse_part_additional_info",
+        "merge_part_additional_info",
+        "BT-300-part (part Additional Information)",
+    ),
+    ConverterSpec(
+        "BT-300",
+        "Procedure",
+        "bt_300_procedure",
+        "parse_procedure_additional_info",
+        "merge_procedure_additional_info",
+        "BT-300-procedure (procedure Additional Information)",
+    ),
+    ConverterSpec(
+        "BT-31",
+        "Procedure",
+        "bt_31_procedure",
+        "parse_max_lots_allowed",
+        "merge_max_lots_allowed",
+        "BT-31-procedure (Maximum Lots Allowed)",
+    ),
+    ConverterSpec(
+        "BT-3201",
+        "Tender",
+        "bt_3201_tender",
+        "parse_tender_identifier",
+        "merge_tender_identifier",
+        "BT-3201-Tender (Tender Identifier)",
+    ),
+    ConverterSpec(
+        "BT-3202",
+        "Contract",
+        "bt_3202_contract",
+        "parse_contract_tender_id",
+        "merge_contract_tender_id",
+        "BT-3202-Contract (Contract Tender ID)",
+    ),
+    ConverterSpec(
+        "BT-33",
+        "Procedure",
+        "bt_33_procedure",
+        "parse_max_lots_awarded",
+        "merge_max_lots_awarded",
+        "BT-33 (Maximum Lots Awarded)",
+    ),
+    ConverterSpec(
+        "BT-330",
+        "Procedure",
+        "bt_330_procedure",
+        "parse_group_identifier",
+        "merge_group_identifier",
+        "BT-330 (Group Identifier)",
+    ),
+    ConverterSpec(
+        "BT-36",
+        "Lot",
+        "bt_36_lot",
+        "parse_lot_duration",
+        "merge_lot_duration",
+        "BT-36-Lot (Lot Duration)",
+    ),
+    ConverterSpec(
+        "BT-36",
+        "Part",
+        "bt_36_part",
+        "parse_part_duration",
+        "merge_part_duration",
+        "BT-36-part (part Duration)",
+    ),
+    ConverterSpec(
+        "BT-40",
+        "Lot",
+        "bt_40_lot",
+        "parse_lot_selection_criteria_second_stage",
+        "merge_lot_selection_criteria_second_stage",
+        "BT-40-Lot (Lot Selection Criteria Second Stage)",
+    ),
+    ConverterSpec(
+        "BT-41",
+        "Lot",
+        "bt_41_lot",
+        "parse_lot_following_contract",
+        "merge_lot_following_contract",
+        "BT-41-Lot (Lot Following Contract)",
+    ),
+    ConverterSpec(
+        "BT-42",
+        "Lot",
+        "bt_42_lot",
+        "parse_lot_jury_decision_binding",
+        "merge_lot_jury_decision_binding",
+        "BT-42-Lot (Lot Jury Decision Binding)",
+    ),
+    ConverterSpec(
+        "BT-44",
+        "Lot",
+        "bt_44_lot",
+        "parse_prize_rank",
+        "merge_prize_rank",
+        "BT-44-Lot (Prize Rank)",
+    ),
+    ConverterSpec(
+        "BT-45",
+        "Lot",
+        "bt_45_lot",
+        "parse_lot_rewards_other",
+        "merge_lot_rewards_other",
+        "BT-45-Lot (Lot Rewards Other)",
+    ),
+    ConverterSpec(
+        "BT-46",
+        "Lot",
+        "bt_46_lot",
+        "parse_jury_member_name",
+        "merge_jury_member_name",
+        "BT-46-Lot (Jury Member Name)",
+    ),
+    ConverterSpec(
+        "BT-47",
+        "Lot",
+        "bt_47_lot",
+        "parse_participant_name",
+        "merge_participant_name",
+        "BT-47-Lot (participant Name)",
+    ),
+    ConverterSpec(
+        "BT-50",
+        "Lot",
+        "bt_50_lot",
+        "parse_minimum_candidates",
+        "merge_minimum_candidates",
+        "BT-50-Lot (Minimum Candidates)",
+    ),
+    ConverterSpec(
+        "BT-5010",
+        "Lot",
+        "bt_5010_lot",
+        "parse_eu_funds_financing_identifier",
+        "merge_eu_funds_financing_identifier",
+        "BT-5010-Lot (EU Funds Financing Identifier)",
+    ),
+    ConverterSpec(
+        "BT-5011",
+        "Contract",
+        "bt_5011_contract",
+        "parse_contract_eu_funds_financing_identifier",
+        "merge_contract_eu_funds_financing_identifier",
+        "BT-5011-Contract (Contract EU Funds Financing Identifier)",
+    ),
+    ConverterSpec(
+        "BT-5071",
+        "Lot",
+        "bt_5071_lot",
+        "parse_place_performance_country_subdivision",
+        "merge_place_performance_country_subdivision",
+        "BT-5071-Lot (Place Performance Country Subdivision)",
+    ),
+    ConverterSpec(
+        "BT-5071",
+        "Part",
+        "bt_5071_part",
+        "parse_place_performance_country_subdivision_part",
+        "merge_place_performance_country_subdivision_part",
+        "Place Performance Country Subdivision part (BT-5071)",
+    ),
+    ConverterSpec(
+        "BT-5071",
+        "Procedure",
+        "bt_5071_procedure",
+        "parse_place_performance_country_subdivision_procedure",
+        "merge_place_performance_country_subdivision_procedure",
+        "BT-5071-procedure (procedure Place Performance Country Subdivision)",
+    ),
+    ConverterSpec(
+        "BT-508",
+        "Procedure",
+        "bt_508_procedure_buyer",
+        "parse_buyer_profile_url",
+        "merge_buyer_profile_url",
+        "BT-508-procedure-buyer (buyer Profile URL)",
+    ),
+    ConverterSpec(
+        "BT-51",
+        "Lot",
+        "bt_51_lot",
+        "parse_lot_maximum_candidates",
+        "merge_lot_maximum_candidates",
+        "BT-51-Lot (Lot Maximum Candidates Number)",
+    ),
+    ConverterSpec(
+        "BT-5101",
+        "Lot",
+        "bt_5101_lot",
+        "parse_place_performance_street_lot",
+        "merge_place_performance_street_lot",
+        "Place Performance Street Lot (BT-5101)",
+    ),
+    ConverterSpec(
+        "BT-5101(a)",
+        "Part",
+        "bt_5101a_part",
+        "parse_part_place_performance_street",
+        "merge_part_place_performance_street",
+        "BT-5101(a)-part (part Place Performance Street)",
+    ),
+    ConverterSpec(
+        "BT-5101(a)",
+        "Procedure",
+        "bt_5101a_procedure",
+        "parse_procedure_place_performance_street",
+        "merge_procedure_place_performance_street",
+        "BT-5101(a)-procedure (procedure Place Performance Street)",
+    ),
+    ConverterSpec(
+        "BT-5101(b)",
+        "Part",
+        "bt_5101b_part",
+        "parse_part_place_performance_streetline1",
+        "merge_part_place_performance_streetline1",
+        "BT-5101(b)-part (part Place Performance Streetline 1)",
+    ),
+    ConverterSpec(
+        "BT-5101(b)",
+        "Procedure",
+        "bt_5101b_procedure",
+        "parse_procedure_place_performance_streetline1",
+        "merge_procedure_place_performance_streetline1",
+        "BT-5101(b)-procedure (procedure Place Performance Streetline 1)",
+    ),
+    ConverterSpec(
+        "BT-5101(c)",
+        "Part",
+        "bt_5101c_part",
+        "parse_part_place_performance_streetline2",
+        "merge_part_place_performance_streetline2",
+        "BT-5101(c)-part (part Place Performance Streetline 2)",
+    ),
+    ConverterSpec(
+        "BT-5101(c)",
+        "Procedure",
+        "bt_5101c_procedure",
+        "parse_procedure_place_performance_streetline2",
+        "merge_procedure_place_performance_streetline2",
+        "BT-5101(c)-procedure (procedure Place Performance Streetline 2)",
+    ),
+    ConverterSpec(
+        "BT-5121",
+        "Lot",
+        "bt_5121_lot",
+        "parse_place_performance_post_code",
+        "merge_place_performance_post_code",
+        "BT-5121-Lot (Place Performance Post Code)",
+    ),
+    ConverterSpec(
+        "BT-5121",
+        "Part",
+        "bt_5121_part",
+        "parse_place_performance_post_code_part",
+        "merge_place_performance_post_code_part",
+        "BT-5121-part (Place Performance Post Code part)",
+    ),
+    ConverterSpec(
+        "BT-5121",
+        "Procedure",
+        "bt_5121_procedure",
+        "parse_place_performance_post_code_procedure",
+        "merge_place_performance_post_code_procedure",
+        "BT-5121-procedure (Place Performance Post Code)",
+    ),
+    ConverterSpec(
+        "BT-5131",
+        "Lot",
+        "bt_5131_lot",
+        "parse_place_performance_city",
+        "merge_place_performance_city",
+        "BT-5131 (Place Performance City)",
+    ),
+    ConverterSpec(
+        "BT-5131",
+        "Part",
+        "bt_5131_part",
+        "parse_place_performance_city_part",
+        "merge_place_performance_city_part",
+        "BT-5131 part (Place Performance City part)",
+    ),
+    ConverterSpec(
+        "BT-5131",
+        "Procedure",
+        "bt_5131_procedure",
+        "parse_place_performance_city_procedure",
+        "merge_place_performance_city_procedure",
+        "BT-5131 procedure (Place Performance City procedure)",
+    ),
+    ConverterSpec(
+        "BT-5141",
+        "Lot",
+        "bt_5141_lot",
+        "parse_lot_country",
+        "merge_lot_country",
+        "BT-5141-Lot (Lot Country)",
+    ),
+    ConverterSpec(
+        "BT-5141",
+        "Part",
+        "bt_5141_part",
+        "parse_part_country",
+        "merge_part_country",
+        "BT-5141-part (part Country)",
+    ),
+    ConverterSpec(
+        "BT-5141",
+        "Procedure",
+        "bt_5141_procedure",
+        "parse_procedure_country",
+        "merge_procedure_country",
+        "BT-5141-procedure (procedure Country)",
+    ),
+    ConverterSpec(
+        "BT-52",
+        "Lot",
+        "bt_52_lot",
+        "parse_successive_reduction_indicator",
+        "merge_successive_reduction_indicator",
+        "BT-52-Lot (Successive Reduction Indicator)",
+    ),
+    ConverterSpec(
+        "BT-531",
+        "Lot",
+        "bt_531_lot",
+        "parse_lot_additional_nature",
+        "merge_lot_additional_nature",
+        "BT-531-Lot (Lot Additional Nature)",
+    ),
+    ConverterSpec(
+        "BT-531",
+        "Part",
+        "bt_531_part",
+        "parse_part_additional_nature",
+        "merge_part_additional_nature",
+        "BT-531-part (part Additional Nature)",
+    ),
+    ConverterSpec(
+        "BT-531",
+        "Procedure",
+        "bt_531_procedure",
+        "parse_procedure_additional_nature",
+        "merge_procedure_additional_nature",
+        "BT-531-procedure (procedure Additional Nature)",
+    ),
+    ConverterSpec(
+        "BT-536",
+        "Lot",
+        "bt_536_lot",
+        "parse_lot_start_date",
+        "merge_lot_start_date",
+        "BT-536-Lot",
+    ),
+    ConverterSpec(
+        "BT-536",
+        "Part",
+        "bt_536_part",
+        "parse_part_contract_start_date",
+        "merge_part_contract_start_date",
+        "BT-536-part",
+    ),
+    ConverterSpec(
+        "BT-537",
+        "Lot",
+        "bt_537_lot",
+        "parse_lot_duration_end_date",
+        "merge_lot_duration_end_date",
+        "BT-537-Lot",
+    ),
+    ConverterSpec(
+        "BT-537",
+        "Part",
+        "bt_537_part",
+        "parse_part_duration_end_date",
+        "merge_part_duration_end_date",
+        "BT-537-part",
+    ),
+    ConverterSpec(
+        "BT-538",
+        "Lot",
+        "bt_538_lot",
+        "parse_lot_duration_other",
+        "merge_lot_duration_other",
+        "BT-538-Lot",
+    ),
+    ConverterSpec(
+        "BT-538",
+        "Part",
+        "bt_538_part",
+        "parse_part_duration_other",
+        "merge_part_duration_other",
+        "BT-538-part",
+    ),
+    ConverterSpec(
+        "BT-539-BT-734",
+        "Lot",
+        "award_criteria",
+        "parse_award_criteria",
+        "merge_award_criteria",
+        "Award criteria of lots and lot groups",
+    ),
+    ConverterSpec(
+        "BT-54",
+        "Lot",
+        "bt_54_lot",
+        "parse_options_description",
+        "merge_options_description",
+        "BT-54-Lot (Options Description)",
+    ),
+    ConverterSpec(
+        "BT-553",
+        "Tender",
+        "bt_553_tender",
+        "parse_subcontracting_value",
+        "merge_subcontracting_value",
+        "BT-553-Tender (Subcontracting Value)",
+    ),
+    ConverterSpec(
+        "BT-554",
+        "Tender",
+        "bt_554_tender",
+        "parse_subcontracting_description",
+        "merge_subcontracting_description",
+        "BT-554-Tender (Subcontracting Description)",
+    ),
+    ConverterSpec(
+        "BT-555",
+        "Tender",
+        "bt_555_tender",
+        "parse_subcontracting_percentage",
+        "merge_subcontracting_percentage",
+        "BT-555-Tender (Subcontracting Percentage)",
+    ),
+    ConverterSpec(
+        "BT-57",
+        "Lot",
+        "bt_57_lot",
+        "parse_renewal_description",
+        "merge_renewal_description",
+        "BT-57-Lot (Renewal Description)",
+    ),
+    ConverterSpec(
+        "BT-58",
+        "Lot",
+        "bt_58_lot",
+        "parse_renewal_maximum",
+        "merge_renewal_maximum",
+        "BT-58-Lot (Renewal Maximum)",
+    ),
+    ConverterSpec(
+        "BT-60",
+        "Lot",
+        "bt_60_lot",
+        "parse_eu_funds",
+        "merge_eu_funds",
+        "BT-60-Lot (EU Funds)",
+    ),
+    ConverterSpec(
+        "BT-610",
+        "Procedure",
+        "bt_610_procedure_buyer",
+        "parse_activity_entity",
+        "merge_activity_entity",
+        "BT-610-procedure-buyer (Activity Entity)",
+    ),
+    ConverterSpec(
+        "BT-6110",
+        "Contract",
+        "bt_6110_contract",
+        "parse_contract_eu_funds_details",
+        "merge_contract_eu_funds_details",
+        "BT-6110-Contract (Contract EU Funds Details)",
+    ),
+    ConverterSpec(
+        "BT-6140",
+        "Lot",
+        "bt_6140_lot",
+        "parse_lot_eu_funds_details",
+        "merge_lot_eu_funds_details",
+        "BT-6140-Lot (EU Funds Details)",
+    ),
+    ConverterSpec(
+        "BT-615",
+        "Lot",
+        "bt_615_lot",
+        "parse_documents_restricted_url",
+        "merge_documents_restricted_url",
+        "BT-615-Lot (Documents Restricted URL)",
+    ),
+    ConverterSpec(
+        "BT-615",
+        "Part",
+        "bt_615_part",
+        "parse_documents_restricted_url_part",
+        "merge_documents_restricted_url_part",
+        "BT-615-part (Documents Restricted URL for parts)",
+    ),
+    ConverterSpec(
+        "BT-625",
+        "Lot",
+        "bt_625_lot",
+        "parse_unit",
+        "merge_unit",
+        "BT-625-Lot (Unit)",
+    ),
+    ConverterSpec(
+        "BT-63",
+        "Lot",
+        "bt_63_lot",
+        "parse_variants",
+        "merge_variants",
+        "BT-63-Lot (Variants)",
+    ),
+    ConverterSpec(
+        "BT-630",
+        "Lot",
+        "bt_630_lot",
+        "parse_deadline_receipt_expressions",
+        "merge_deadline_receipt_expressions",
+        "BT-630-Lot Deadline Receipt Expressions",
+    ),
+    ConverterSpec(
+        "BT-631",
+        "Lot",
+        "bt_631_lot",
+        "parse_dispatch_invitation_interest",
+        "merge_dispatch_invitation_interest",
+        "BT-631-Lot (Dispatch Invitation Interest)",
+    ),
+    ConverterSpec(
+        "BT-632",
+        "Lot",
+        "bt_632_lot",
+        "parse_tool_name",
+        "merge_tool_name",
+        "BT-632-Lot (Tool Name)",
+    ),
+    ConverterSpec(
+        "BT-632",
+        "Part",
+        "bt_632_part",
+        "parse_tool_name_part",
+        "merge_tool_name_part",
+        "BT-632-part (Tool Name)",
+    ),
+    ConverterSpec(
+        "BT-635",
+        "LotResult",
+        "bt_635_lotresult",
+        "parse_buyer_review_requests_count",
+        "merge_buyer_review_requests_count",
+        "BT-635-LotResult buyer Review Requests Count",
+    ),
+    ConverterSpec(
+        "BT-636",
+        "LotResult",
+        "bt_636_lotresult",
+        "parse_buyer_review_requests_irregularity_type",
+        "merge_buyer_review_requests_irregularity_type",
+        "BT-636-LotResult Buyer Review Requests Irregularity Type",
+    ),
+    ConverterSpec(
+        "BT-64",
+        "Lot",
+        "bt_64_lot",
+        "parse_subcontracting_obligation_minimum",
+        "merge_subcontracting_obligation_minimum",
+        "BT-64-Lot (Subcontracting Obligation Minimum)",
+    ),
+    ConverterSpec(
+        "BT-644",
+        "Lot",
+        "bt_644_lot_prize_value",
+        "parse_lot_prize_value",
+        "merge_lot_prize_value",
+        "BT-644-Lot (Prize Value)",
+    ),
+    ConverterSpec(
+        "BT-65",
+        "Lot",
+        "bt_65_lot_subcontracting_obligation",
+        "parse_subcontracting_obligation",
+        "merge_subcontracting_obligation",
+        "BT-65-Lot Subcontracting Obligation",
+    ),
+    ConverterSpec(
+        "BT-651",
+        "Lot",
+        "bt_651_lot_subcontracting_tender_indication",
+        "parse_subcontracting_tender_indication",
+        "merge_subcontracting_tender_indication",
+        "BT-651-Lot Subcontracting Tender Indication",
+    ),
+    ConverterSpec(
+        "BT-660",
+        "LotResult",
+        "bt_660_lotresult",
+        "parse_framework_reestimated_value",
+        "merge_framework_reestimated_value",
+        "BT-660-LotResult (Framework Re-estimated Value)",
+    ),
+    ConverterSpec(
+        "BT-67",
+        "Procedure",
+        "bt_67_exclusion_grounds",
+        "parse_exclusion_grounds",
+        "merge_exclusion_grounds",
+        "BT-67 Exclusion Grounds",
+    ),
+    ConverterSpec(
+        "BT-681",
+        "Lot",
+        "bt_681_lot",
+        "parse_foreign_subsidies_regulation",
+        "merge_foreign_subsidies_regulation",
+        "BT-681-Lot",
+    ),
+    ConverterSpec(
+        "BT-682",
+        "Tender",
+        "bt_682_tender",
+        "parse_foreign_subsidies_measures",
+        "merge_foreign_subsidies_measures",
+        "BT-682-Tender",
+    ),
+    ConverterSpec(
+        "BT-70",
+        "Lot",
+        "bt_70_lot",
+        "parse_lot_performance_terms",
+        "merge_lot_performance_terms",
+        "BT-70-Lot (Performance Terms)",
+    ),
+    ConverterSpec(
+        "BT-702(a)",
+        "Notice",
+        "bt_702a_notice",
+        "parse_notice_language",
+        "merge_notice_language",
+        "BT-702(a)-notice (notice Official Language)",
+    ),
+    ConverterSpec(
+        "BT-707",
+        "Lot",
+        "bt_707_lot",
+        "parse_lot_documents_restricted_justification",
+        "merge_lot_documents_restricted_justification",
+        "BT-707-Lot (Documents Restricted Justification)",
+    ),
+    ConverterSpec(
+        "BT-707",
+        "Part",
+        "bt_707_part",
+        "parse_part_documents_restricted_justification",
+        "merge_part_documents_restricted_justification",
+        "BT-707-part (Documents Restricted Justification)",
+    ),
+    ConverterSpec(
+        "BT-708",
+        "Lot",
+        "bt_708_lot",
+        "parse_lot_documents_official_language",
+        "merge_lot_documents_official_language",
+        "BT-708-Lot (Documents Official Language)",
+    ),
+    ConverterSpec(
+        "BT-708",
+        "Part",
+        "bt_708_part",
+        "parse_part_documents_official_language",
+        "merge_part_documents_official_language",
+        "BT-708-part (Documents Official Language)",
+    ),
+    ConverterSpec(
+        "BT-709",
+        "LotResult",
+        "bt_709_lotresult",
+        "parse_framework_maximum_value",
+        "merge_framework_maximum_value",
+        "BT-709-LotResult (Framework Maximum Value)",
+    ),
+    ConverterSpec(
+        "BT-71",
+        "Lot",
+        "bt_71_lot",
+        "parse_reserved_participation",
+        "merge_reserved_participation",
+        "BT-71-Lot (Reserved participation)",
+    ),
+    ConverterSpec(
+        "BT-71",
+        "Part",
+        "bt_71_part",
+        "parse_reserved_participation_part",
+        "merge_reserved_participation_part",
+        "BT-71-part (Reserved participation)",
+    ),
+    ConverterSpec(
+        "BT-710",
+        "LotResult",
+        "bt_710_lotresult",
+        "parse_tender_value_lowest",
+        "merge_tender_value_lowest",
+        "BT-710-LotResult Tender Value Lowest",
+    ),
+    ConverterSpec(
+        "BT-711",
+        "LotResult",
+        "bt_711_lotresult",
+        "parse_tender_value_highest",
+        "merge_tender_value_highest",
+        "BT-711-LotResult Tender Value Highest",
+    ),
+    ConverterSpec(
+        "BT-712(a)",
+        "LotResult",
+        "bt_712a_lotresult",
+        "parse_buyer_review_complainants_code",
+        "merge_buyer_review_complainants_code",
+        "BT-712(a)-LotResult buyer Review Complainants",
+    ),
+    ConverterSpec(
+        "BT-712(b)",
+        "LotResult",
+        "bt_712b_lotresult",
+        "parse_buyer_review_complainants_number",
+        "merge_buyer_review_complainants_number",
+        "BT-712(b)-LotResult buyer Review Complainants (Number)",
+    ),
+    ConverterSpec(
+        "BT-717",
+        "Lot",
+        "bt_717_lot",
+        "parse_clean_vehicles_directive",
+        "merge_clean_vehicles_directive",
+        "Clean Vehicles Directive (BT-717-Lot)",
+    ),
+    ConverterSpec(
+        "BT-719",
+        "Notice",
+        "bt_719_notice",
+        "parse_procurement_documents_change_date",
+        "merge_procurement_documents_change_date",
+        "Procurement Documents Change Date (BT-719-notice)",
+    ),
+    ConverterSpec(
+        "BT-720",
+        "Tender",
+        "bt_720_tender",
+        "parse_tender_value",
+        "merge_tender_value",
+        "Tender Value (BT-720-Tender)",
+    ),
+    ConverterSpec(
+        "BT-721",
+        "Contract",
+        "bt_721_contract_title",
+        "parse_contract_title",
+        "merge_contract_title",
+        "Contract Title (BT-721-Contract)",
+    ),
+    ConverterSpec(
+        "BT-722",
+        "Contract",
+        "bt_722_contract",
+        "parse_contract_eu_funds",
+        "merge_contract_eu_funds",
+        "Contract EU Funds (BT-722-Contract)",
+    ),
+    ConverterSpec(
+        "BT-7220",
+        "Lot",
+        "bt_7220_lot",
+        "parse_lot_eu_funds",
+        "merge_lot_eu_funds",
+        "Lot EU Funds (BT-7220-Lot)",
+    ),
+    ConverterSpec(
+        "BT-723",
+        "LotResult",
+        "bt_723_lotresult",
+        "parse_vehicle_category",
+        "merge_vehicle_category",
+        "Vehicle Category (BT-723-LotResult)",
+    ),
+    ConverterSpec(
+        "BT-726",
+        "Lot",
+        "bt_726_lot",
+        "parse_lot_sme_suitability",
+        "merge_lot_sme_suitability",
+        "Lot SME Suitability (BT-726-Lot)",
+    ),
+    ConverterSpec(
+        "BT-726",
+        "LotsGroup",
+        "bt_726_lotsgroup",
+        "parse_lots_group_sme_suitability",
+        "merge_lots_group_sme_suitability",
+        "Lots Group SME Suitability (BT-726-LotsGroup)",
+    ),
+    ConverterSpec(
+        "BT-726",
+        "Part",
+        "bt_726_part",
+        "parse_part_sme_suitability",
+        "merge_part_sme_suitability",
+        "part SME Suitability (BT-726-part)",
+    ),
+    ConverterSpec(
+        "BT-727",
+        "Lot",
+        "bt_727_lot",
+        "parse_lot_place_performance",
+        "merge_lot_place_performance",
+        "Lot Place of Performance (BT-727-Lot)",
+    ),
+    ConverterSpec(
+        "BT-727",
+        "Part",
+        "bt_727_part",
+        "parse_part_place_performance",
+        "merge_part_place_performance",
+        "part Place of Performance (BT-727-part)",
+    ),
+    ConverterSpec(
+        "BT-727",
+        "Procedure",
+        "bt_727_procedure",
+        "parse_procedure_place_performance",
+        "merge_procedure_place_performance",
+        "procedure Place of Performance (BT-727-procedure)",
+    ),
+    ConverterSpec(
+        "BT-728",
+        "Lot",
+        "bt_728_lot",
+        "parse_lot_place_performance_additional",
+        "merge_lot_place_performance_additional",
+        "Additional Lot Place of Performance (BT-728-Lot)",
+    ),
+    ConverterSpec(
+        "BT-728",
+        "Part",
+        "bt_728_part",
+        "parse_part_place_performance_additional",
+        "merge_part_place_performance_additional",
+        "Additional part Place of Performance (BT-728-part)",
+    ),
+    ConverterSpec(
+        "BT-728",
+        "Procedure",
+        "bt_728_procedure",
+        "parse_procedure_place_performance_additional",
+        "merge_procedure_place_performance_additional",
+        "Additional procedure Place of Performance (BT-728-procedure)",
+    ),
+    ConverterSpec(
+        "BT-729",
+        "Lot",
+        "bt_729_lot",
+        "parse_lot_subcontracting_obligation_maximum",
+        "merge_lot_subcontracting_obligation_maximum",
+        "Lot Subcontracting Obligation Maximum Percentage (BT-729-Lot)",
+    ),
+    ConverterSpec(
+        "BT-732",
+        "Lot",
+        "bt_732_lot",
+        "parse_lot_security_clearance_description",
+        "merge_lot_security_clearance_description",
+        "Lot Security Clearance Description (BT-732-Lot)",
+    ),
+    ConverterSpec(
+        "BT-735",
+        "Lot",
+        "bt_735_lot",
+        "parse_cvd_contract_type",
+        "merge_cvd_contract_type",
+        "Lot CVD Contract Type (BT-735-Lot)",
+    ),
+    ConverterSpec(
+        "BT-735",
+        "LotResult",
+        "bt_735_lotresult",
+        "parse_cvd_contract_type_lotresult",
+        "merge_cvd_contract_type_lotresult",
+        "LotResult CVD Contract Type (BT-735-LotResult)",
+    ),
+    ConverterSpec(
+        "BT-736",
+        "Lot",
+        "bt_736_lot",
+        "parse_reserved_execution",
+        "merge_reserved_execution",
+        "Lot Reserved Execution (BT-736-Lot)",
+    ),
+    ConverterSpec(
+        "BT-736",
+        "Part",
+        "bt_736_part",
+        "parse_reserved_execution_part",
+        "merge_reserved_execution_part",
+        "part Reserved Execution (BT-736-part)",
+    ),
+    ConverterSpec(
+        "BT-737",
+        "Lot",
+        "bt_737_lot",
+        "parse_documents_unofficial_language",
+        "merge_documents_unofficial_language",
+        "Lot Documents Unofficial Language (BT-737-Lot)",
+    ),
+    ConverterSpec(
+        "BT-737",
+        "Part",
+        "bt_737_part",
+        "part_parse_documents_unofficial_language",
+        "part_merge_documents_unofficial_language",
+        "part Documents Unofficial Language (BT-737-part)",
+    ),
+    ConverterSpec(
+        "BT-738",
+        "Notice",
+        "bt_738_notice",
+        "parse_notice_preferred_publication_date",
+        "merge_notice_preferred_publication_date",
+        "notice Preferred Publication Date (BT-738-notice)",
+    ),
+    ConverterSpec(
+        "BT-739",
+        "Organization",
+        "bt_739_organization_touchpoint",
+        "parse_touchpoint_contact_fax",
+        "merge_touchpoint_contact_fax",
+        "touchpoint Contact Fax (BT-739-organization-touchpoint)",
+    ),
+    ConverterSpec(
+        "BT-740",
+        "Procedure",
+        "bt_740_procedure_buyer",
+        "parse_buyer_contracting_type",
+        "merge_buyer_contracting_type",
+        "buyer Contracting Entity (BT-740-procedure-buyer)",
+    ),
+    ConverterSpec(
+        "BT-743",
+        "Lot",
+        "bt_743_lot",
+        "parse_lot_einvoicing_policy",
+        "merge_lot_einvoicing_policy",
+        "Lot Electronic Invoicing (BT-743-Lot)",
+    ),
+    ConverterSpec(
+        "BT-744",
+        "Lot",
+        "bt_744_lot",
+        "parse_lot_esignature_requirement",
+        "merge_lot_esignature_requirement",
+        "Lot Submission Electronic Signature (BT-744-Lot)",
+    ),
+    ConverterSpec(
+        "BT-745",
+        "Lot",
+        "bt_745_lot",
+        "parse_submission_nonelectronic_description",
+        "merge_submission_nonelectronic_description",
+        "Lot Submission Nonelectronic Description (BT-745-Lot)",
+    ),
+    ConverterSpec(
+        "BT-75",
+        "Lot",
+        "bt_75_lot",
+        "parse_guarantee_required_description",
+        "merge_guarantee_required_description",
+        "Lot Guarantee Required Description (BT-75-Lot)",
+    ),
+    ConverterSpec(
+        "BT-750",
+        "Lot",
+        "bt_750_lot",
+        "parse_selection_criteria",
+        "merge_selection_criteria",
+        "Selection Criteria (BT-749 and BT-750)",
+    ),
+    ConverterSpec(
+        "BT-752",
+        "Lot",
+        "bt_752_lot_thresholdnumber",
+        "parse_selection_criteria_threshold_number",
+        "merge_selection_criteria_threshold_number",
+        "Selection Criteria Second Stage Invite Threshold Number (BT-752-Lot-ThresholdNumber)",
+    ),
+    ConverterSpec(
+        "BT-752",
+        "Lot",
+        "bt_752_lot_weightnumber",
+        "parse_selection_criteria_weight_number",
+        "merge_selection_criteria_weight_number",
+        "Selection Criteria Second Stage Invite Weight Number (BT-752-Lot-WeightNumber)",
+    ),
+    ConverterSpec(
+        "BT-7531",
+        "Lot",
+        "bt_7531_lot",
+        "parse_selection_criteria_number_weight",
+        "merge_selection_criteria_number_weight",
+        "Selection Criteria Second Stage Invite Number Weight (BT-7531-Lot)",
+    ),
+    ConverterSpec(
+        "BT-7532",
+        "Lot",
+        "bt_7532_lot",
+        "parse_selection_criteria_number_threshold",
+        "merge_selection_criteria_number_threshold",
+        "Selection Criteria Second Stage Invite Number Threshold (BT-7532-Lot)",
+    ),
+    ConverterSpec(
+        "BT-754",
+        "Lot",
+        "bt_754_lot",
+        "parse_accessibility_criteria",
+        "merge_accessibility_criteria",
+        "Lot Accessibility Criteria (BT-754-Lot)",
+    ),
+    ConverterSpec(
+        "BT-755",
+        "Lot",
+        "bt_755_lot",
+        "parse_accessibility_justification",
+        "merge_accessibility_justification",
+        "Lot Accessibility Justification (BT-755-Lot)",
+    ),
+    ConverterSpec(
+        "BT-756",
+        "Procedure",
+        "bt_756_procedure",
+        "parse_pin_competition_termination",
+        "merge_pin_competition_termination",
+        "PIN Competition Termination (BT-756-procedure)",
+    ),
+    ConverterSpec(
+        "BT-759",
+        "LotResult",
+        "bt_759_lotresult",
+        "parse_received_submissions_count",
+        "merge_received_submissions_count",
+        "BT-759-LotResult Received Submissions Count",
+    ),
+    ConverterSpec(
+        "BT-76",
+        "Lot",
+        "bt_76_lot",
+        "parse_tenderer_legal_form",
+        "merge_tenderer_legal_form",
+        "Lot Tenderer Legal Form Description (BT-76-Lot)",
+    ),
+    ConverterSpec(
+        "BT-760",
+        "LotResult",
+        "bt_760_lotresult",
+        "parse_received_submissions_type",
+        "merge_received_submissions_type",
+        "BT-760-LotResult Received Submissions Type",
+    ),
+    ConverterSpec(
+        "BT-762",
+        "Change",
+        "bt_762_changereasondescription",
+        "parse_change_reason_description",
+        "merge_change_reason_description",
+        "Change Reason Description (BT-762-notice)",
+    ),
+    ConverterSpec(
+        "BT-763",
+        "Procedure",
+        "bt_763_lotsallrequired",
+        "parse_lots_all_required",
+        "merge_lots_all_required",
+        "Lots All Required (BT-763-procedure)",
+    ),
+    ConverterSpec(
+        "BT-764",
+        "Lot",
+        "bt_764_submissionelectroniccatalogue",
+        "parse_submission_electronic_catalogue",
+        "merge_submission_electronic_catalogue",
+        "Submission Electronic Catalogue (BT-764-Lot)",
+    ),
+    ConverterSpec(
+        "BT-765",
+        "Lot",
+        "bt_765_frameworkagreement",
+        "parse_framework_agreement",
+        "merge_framework_agreement",
+        "Framework Agreement (BT-765-Lot)",
+    ),
+    ConverterSpec(
+        "BT-765",
+        "Part",
+        "bt_765_partframeworkagreement",
+        "parse_part_framework_agreement",
+        "merge_part_framework_agreement",
+        "part Framework Agreement (BT-765-part)",
+    ),
+    ConverterSpec(
+        "BT-766",
+        "Lot",
+        "bt_766_dynamicpurchasingsystem",
+        "parse_dynamic_purchasing_system",
+        "merge_dynamic_purchasing_system",
+        "Dynamic Purchasing System (BT-766-Lot)",
+    ),
+    ConverterSpec(
+        "BT-766",
+        "Part",
+        "bt_766_partdynamicpurchasingsystem",
+        "parse_part_dynamic_purchasing_system",
+        "merge_part_dynamic_purchasing_system",
+        "part Dynamic Purchasing System (BT-766-part)",
+    ),
+    ConverterSpec(
+        "BT-767",
+        "Lot",
+        "bt_767_lot",
+        "parse_electronic_auction",
+        "merge_electronic_auction",
+        "Electronic Auction (BT-767-Lot)",
+    ),
+    ConverterSpec(
+        "BT-769",
+        "Lot",
+        "bt_769_lot",
+        "parse_multiple_tenders",
+        "merge_multiple_tenders",
+        "Multiple Tenders (BT-769-Lot)",
+    ),
+    ConverterSpec(
+        "BT-77",
+        "Lot",
+        "bt_77_lot",
+        "parse_financial_terms",
+        "merge_financial_terms",
+        "Financial Terms (BT-77-Lot)",
+    ),
+    ConverterSpec(
+        "BT-771",
+        "Lot",
+        "bt_771_lot",
+        "parse_late_tenderer_info",
+        "merge_late_tenderer_info",
+        "Late Tenderer Information (BT-771-Lot)",
+    ),
+    ConverterSpec(
+        "BT-772",
+        "Lot",
+        "bt_772_lot",
+        "parse_late_tenderer_info_description",
+        "merge_late_tenderer_info_description",
+        "Late Tenderer Information Description (BT-772-Lot)",
+    ),
+    ConverterSpec(
+        "BT-773",
+        "Tender",
+        "bt_773_tender",
+        "parse_subcontracting",
+        "merge_subcontracting",
+        "Subcontracting (BT-773-Tender)",
+    ),
+    ConverterSpec(
+        "BT-774",
+        "Lot",
+        "bt_774_lot",
+        "parse_green_procurement",
+        "merge_green_procurement",
+        "Green Procurement (BT-774-Lot)",
+    ),
+    ConverterSpec(
+        "BT-775",
+        "Lot",
+        "bt_775_lot",
+        "parse_social_procurement",
+        "merge_social_procurement",
+        "Social Procurement (BT-775-Lot)",
+    ),
+    ConverterSpec(
+        "BT-776",
+        "Lot",
+        "bt_776_lot",
+        "parse_procurement_innovation",
+        "merge_procurement_innovation",
+        "Procurement of Innovation (BT-776-Lot)",
+    ),
+    ConverterSpec(
+        "BT-777",
+        "Lot",
+        "bt_777_lot",
+        "parse_strategic_procurement_description",
+        "merge_strategic_procurement_description",
+        "Strategic Procurement Description (BT-777-Lot)",
+    ),
+    ConverterSpec(
+        "BT-78",
+        "Lot",
+        "bt_78_lot",
+        "parse_security_clearance_deadline",
+        "merge_security_clearance_deadline",
+        "Security Clearance Deadline (BT-78-Lot)",
+    ),
+    ConverterSpec(
+        "BT-79",
+        "Lot",
+        "bt_79_lot",
+        "parse_performing_staff_qualification",
+        "merge_performing_staff_qualification",
+        "Performing Staff Qualification (BT-79-Lot)",
+    ),
+    ConverterSpec(
+        "BT-801",
+        "Lot",
+        "bt_801_lot",
+        "parse_non_disclosure_agreement",
+        "merge_non_disclosure_agreement",
+        "Non Disclosure Agreement (BT-801-Lot)",
+    ),
+    ConverterSpec(
+        "BT-802",
+        "Lot",
+        "bt_802_lot",
+        "parse_nda_description",
+        "merge_nda_description",
+        "Non Disclosure Agreement Description (BT-802-Lot)",
+    ),
+    ConverterSpec(
+        "BT-805",
+        "Lot",
+        "bt_805_lot",
+        "parse_gpp_criteria",
+        "merge_gpp_criteria",
+        "Green Procurement Criteria (BT-805-Lot)",
+    ),
+    ConverterSpec(
+        "BT-806",
+        "Procedure",
+        "bt_806_procedure",
+        "parse_exclusion_grounds_sources",
+        "merge_exclusion_grounds_sources",
+        "Exclusion Grounds Source (BT-806-Procedure)",
+    ),
+    ConverterSpec(
+        "BT-809",
+        "Lot",
+        "bt_809_lot",
+        "parse_selection_criteria_809",
+        "merge_selection_criteria_809",
+        "Selection Criteria (BT-809-Lot)",
+    ),
+    ConverterSpec(
+        "BT-821",
+        "Lot",
+        "bt_821_lot",
+        "parse_selection_criteria_source",
+        "merge_selection_criteria_source",
+        "Selection Criteria Source (BT-821-Lot)",
+    ),
+    ConverterSpec(
+        "BT-88",
+        "Procedure",
+        "bt_88_procedure",
+        "parse_procedure_features",
+        "merge_procedure_features",
+        "procedure Features (BT-88-procedure)",
+    ),
+    ConverterSpec(
+        "BT-92",
+        "Lot",
+        "bt_92_lot",
+        "parse_electronic_ordering",
+        "merge_electronic_ordering",
+        "Electronic Ordering (BT-92-Lot)",
+    ),
+    ConverterSpec(
+        "BT-93",
+        "Lot",
+        "bt_93_lot",
+        "parse_electronic_payment",
+        "merge_electronic_payment",
+        "Electronic Payment (BT-93-Lot)",
+    ),
+    ConverterSpec(
+        "BT-94",
+        "Lot",
+        "bt_94_lot",
+        "parse_recurrence",
+        "merge_recurrence",
+        "Recurrence (BT-94-Lot)",
+    ),
+    ConverterSpec(
+        "BT-95",
+        "Lot",
+        "bt_95_lot",
+        "parse_recurrence_description",
+        "merge_recurrence_description",
+        "Recurrence Description (BT-95-Lot)",
+    ),
+    ConverterSpec(
+        "BT-97",
+        "Lot",
+        "bt_97_lot",
+        "parse_submission_language",
+        "merge_submission_language",
+        "Submission Language (BT-97-Lot)",
+    ),
+    ConverterSpec(
+        "BT-98",
+        "Lot",
+        "bt_98_lot",
+        "parse_tender_validity_deadline",
+        "merge_tender_validity_deadline",
+        "Tender Validity Deadline (BT-98-Lot)",
+    ),
+    ConverterSpec(
+        "BT-99",
+        "Lot",
+        "bt_99_lot",
+        "parse_review_deadline_description",
+        "merge_review_deadline_description",
+        "Review Deadline Description (BT-99-Lot)",
+    ),
+    ConverterSpec(
+        "OPP-020",
+        "Contract",
+        "opp_020_contract",
+        "parse_extended_duration_indicator",
+        "merge_extended_duration_indicator",
+        "ExtendedDurationIndicator (OPP-020)",
+    ),
+    ConverterSpec(
+        "OPP-021",
+        "Contract",
+        "opp_021_contract",
+        "parse_used_asset",
+        "merge_used_asset",
+        "Essential Assets (OPP-021_Contract)",
+    ),
+    ConverterSpec(
+        "OPP-022",
+        "Contract",
+        "opp_022_contract",
+        "parse_asset_significance",
+        "merge_asset_significance",
+        "Asset Significance (OPP-022_Contract)",
+    ),
+    ConverterSpec(
+        "OPP-023",
+        "Contract",
+        "opp_023_contract",
+        "parse_asset_predominance",
+        "merge_asset_predominance",
+        "Asset Predominance (OPP-023_Contract)",
+    ),
+    ConverterSpec(
+        "OPP-031",
+        "Tender",
+        "opp_031_tender",
+        "parse_contract_conditions",
+        "merge_contract_conditions",
+        "Contract Conditions (OPP-031-Tender)",
+    ),
+    ConverterSpec(
+        "OPP-032",
+        "Tender",
+        "opp_032_tender",
+        "parse_revenues_allocation",
+        "merge_revenues_allocation",
+        "Revenues Allocation (OPP-032-Tender)",
+    ),
+    ConverterSpec(
+        "OPP-034",
+        "Tender",
+        "opp_034_tender",
+        "parse_penalties_and_rewards",
+        "merge_penalties_and_rewards",
+        "Penalties and Rewards (OPP-034-Tender)",
+    ),
+    ConverterSpec(
+        "OPP-040",
+        "Procedure",
+        "opp_040_procedure",
+        "parse_main_nature_sub_type",
+        "merge_main_nature_sub_type",
+        "Main Nature - Sub Type (OPP-040-procedure)",
+    ),
+    ConverterSpec(
+        "OPP-080",
+        "Tender",
+        "opp_080_tender",
+        "parse_kilometers_public_transport",
+        "merge_kilometers_public_transport",
+        "Kilometers Public Transport (OPP-080-Tender)",
+    ),
+    ConverterSpec(
+        "OPP-090",
+        "Procedure",
+        "opp_090_procedure",
+        "parse_previous_notice_identifier",
+        "merge_previous_notice_identifier",
+        "Previous notice Identifier (OPP-090-procedure)",
+    ),
+    ConverterSpec(
+        "OPT-030",
+        "Procedure",
+        "opt_030_procedure_sprovider",
+        "parse_provided_service_type",
+        "merge_provided_service_type",
+        "Provided Service Type (OPT-030-procedure-sprovider)",
+    ),
+    ConverterSpec(
+        "OPT-071",
+        "Lot",
+        "opt_071_lot",
+        "parse_quality_target_code",
+        "merge_quality_target_code",
+        "Quality Target Code (OPT-071-Lot)",
+    ),
+    ConverterSpec(
+        "OPT-072",
+        "Lot",
+        "opt_072_lot",
+        "parse_quality_target_description",
+        "merge_quality_target_description",
+        "Quality Target Description (OPT-072-Lot)",
+    ),
+    ConverterSpec(
+        "OPT-100",
+        "Contract",
+        "opt_100_contract",
+        "parse_framework_notice_identifier",
+        "merge_framework_notice_identifier",
+        "Framework notice Identifier (OPT-100-Contract)",
+    ),
+    ConverterSpec(
+        "OPT-110",
+        "Lot",
+        "opt_110_lot_fiscallegis",
+        "parse_fiscal_legislation_url",
+        "merge_fiscal_legislation_url",
+        "URL to Fiscal Legislation (OPT-110-Lot-FiscalLegis)",
+    ),
+    ConverterSpec(
+        "OPT-110",
+        "Part",
+        "opt_110_part_fiscallegis",
+        "parse_part_fiscal_legislation_url",
+        "merge_part_fiscal_legislation_url",
+        "URL to Fiscal Legislation (OPT-110-Part-FiscalLegis)",
+    ),
+    ConverterSpec(
+        "OPT-111",
+        "Lot",
+        "opt_111_lot_fiscallegis",
+        "parse_fiscal_legislation_document_id",
+        "merge_fiscal_legislation_document_id",
+        "Fiscal Legislation Document ID (OPT-111-Lot-FiscalLegis)",
+    ),
+    ConverterSpec(
+        "OPT-111",
+        "Part",
+        "opt_111_part_fiscallegis",
+        "parse_part_fiscal_legislation_document_id",
+        "merge_part_fiscal_legislation_document_id",
+        "Fiscal Legislation Document ID (OPT-111-Part-FiscalLegis)",
+    ),
+    ConverterSpec(
+        "OPT-112",
+        "Lot",
+        "opt_112_lot_environlegis",
+        "parse_environmental_legislation_document_id",
+        "merge_environmental_legislation_document_id",
+        "Environmental Legislation Document ID (OPT-112-Lot-EnvironLegis)",
+    ),
+    ConverterSpec(
+        "OPT-112",
+        "Part",
+        "opt_112_part_environlegis",
+        "parse_part_environmental_legislation_document_id",
+        "merge_part_environmental_legislation_document_id",
+        "Environmental Legislation Document ID (OPT-112-Part-EnvironLegis)",
+    ),
+    ConverterSpec(
+        "OPT-113",
+        "Lot",
+        "opt_113_lot_employlegis",
+        "parse_employment_legislation_document_id",
+        "merge_employment_legislation_document_id",
+        "Employment Legislation Document ID (OPT-113-Lot-EmployLegis)",
+    ),
+    ConverterSpec(
+        "OPT-113",
+        "Part",
+        "opt_113_part_employlegis",
+        "parse_part_employment_legislation_document_id",
+        "merge_part_employment_legislation_document_id",
+        "Employment Legislation Document ID (OPT-113-Part-EmployLegis)",
+    ),
+    ConverterSpec(
+        "OPT-120",
+        "Part",
+        "opt_120_part_environlegis",
+        "parse_environmental_legislation_url_part",
+        "merge_environmental_legislation_url_part",
+        "Environmental Legislation URL for Parts (OPT-120-Part-EnvironLegis)",
+    ),
+    ConverterSpec(
+        "OPT-120",
+        "Lot",
+        "opt_120_lot_environlegis",
+        "parse_environmental_legislation_url",
+        "merge_environmental_legislation_url",
+        "Environmental Legislation URL (OPT-120-Lot-EnvironLegis)",
+    ),
+    ConverterSpec(
+        "OPT-130",
+        "Lot",
+        "opt_130_lot_employlegis",
+        "parse_employment_legislation_url",
+        "merge_employment_legislation_url",
+        "Employment Legislation URL (OPT-130-Lot-EmployLegis)",
+    ),
+    ConverterSpec(
+        "OPT-130",
+        "Part",
+        "opt_130_part_employlegis",
+        "parse_employment_legislation_url_part",
+        "merge_employment_legislation_url_part",
+        "Employment Legislation URL for Parts (OPT-130-Part-EmployLegis)",
+    ),
+    ConverterSpec(
+        "OPT-140",
+        "Lot",
+        "opt_140_lot_procurement_docs",
+        "parse_procurement_documents_id",
+        "merge_procurement_documents_id",
+        "Procurement Documents ID (OPT-140-Lot)",
+    ),
+    ConverterSpec(
+        "OPT-140",
+        "Part",
+        "opt_140_part_procurement_docs",
+        "parse_procurement_documents_id_part",
+        "merge_procurement_documents_id_part",
+        "Procurement Documents ID for Parts (OPT-140-Part)",
+    ),
+    ConverterSpec(
+        "OPT-155",
+        "LotResult",
+        "opt_155_lotresult",
+        "parse_vehicle_type",
+        "merge_vehicle_type",
+        "Vehicle Type (OPT-155-LotResult)",
+    ),
+    ConverterSpec(
+        "OPT-156",
+        "LotResult",
+        "opt_156_lotresult",
+        "parse_vehicle_numeric",
+        "merge_vehicle_numeric",
+        "Vehicle Numeric (OPT-156-LotResult)",
+    ),
+    ConverterSpec(
+        "OPT-160",
+        "UBO",
+        "opt_160_ubo_firstname",
+        "parse_ubo_firstname",
+        "merge_ubo_firstname",
+        "UBO First Name (OPT-160-UBO)",
+    ),
+    ConverterSpec(
+        "OPT-170",
+        "Tenderer",
+        "opt_170_tenderer_leader",
+        "parse_tendering_party_leader",
+        "merge_tendering_party_leader",
+        "Tendering party Leader (OPT-170-Tenderer)",
+    ),
+    ConverterSpec(
+        "OPT-300",
+        "Contract",
+        "opt_300_contract_signatory",
+        "parse_signatory_identifier_reference",
+        "merge_signatory_identifier_reference",
+        "Signatory Identifier Reference (OPT-300-Contract-Signatory)",
+    ),
+    ConverterSpec(
+        "OPT-300",
+        "Procedure",
+        "opt_300_procedure_buyer",
+        "parse_buyer_technical_identifier",
+        "merge_buyer_technical_identifier",
+        "Buyer Technical Identifier Reference (OPT-300-Procedure-Buyer)",
+    ),
+    ConverterSpec(
+        "OPT-300",
+        "Procedure",
+        "opt_300_procedure_sprovider",
+        "parse_service_provider_identifier",
+        "merge_service_provider_identifier",
+        "Service Provider Technical Identifier Reference (OPT-300-Procedure-SProvider)",
+    ),
+    ConverterSpec(
+        "OPT-301",
+        "Notice",
+        "party_roles",
+        "parse_party_roles",
+        "merge_party_roles",
+        "Party references of lots, parts, lot results and tenderers (OPT-301)",
+    ),
+    ConverterSpec(
+        "OPT-310",
+        "Tender",
+        "opt_310_tender",
+        "parse_tendering_party_id_reference",
+        "merge_tendering_party_id_reference",
+        "Tendering party ID Reference (OPT-310-Tender)",
+    ),
+    ConverterSpec(
+        "OPT-315",
+        "LotResult",
+        "opt_315_lotresult",
+        "parse_contract_identifier_reference",
+        "merge_contract_identifier_reference",
+        "Contract Identifier Reference (OPT-315-LotResult)",
+    ),
+    ConverterSpec(
+        "OPT-316",
+        "Contract",
+        "opt_316_contract",
+        "parse_contract_technical_identifier",
+        "merge_contract_technical_identifier",
+        "Contract Technical Identifier (OPT-316-Contract)",
+    ),
+    ConverterSpec(
+        "OPT-320",
+        "LotResult",
+        "opt_320_lotresult",
+        "parse_tender_identifier_reference",
+        "merge_tender_identifier_reference",
+        "Tender Identifier Reference (OPT-320-LotResult)",
+    ),
+    ConverterSpec(
+        "OPT-321",
+        "Tender",
+        "opt_321_tender",
+        "parse_tender_technical_identifier",
+        "merge_tender_technical_identifier",
+        "Tender Technical Identifier (OPT-321-Tender)",
+    ),
+    ConverterSpec(
+        "OPT-322",
+        "LotResult",
+        "opt_322_lotresult",
+        "parse_lotresult_technical_identifier",
+        "merge_lotresult_technical_identifier",
+        "LotResult Technical Identifier (OPT-322-LotResult)",
+    ),
+)
+
+
+def get_converters() -> tuple[ConverterSpec, ...]:
+    """Return every registered converter in processing order."""
+    return BT_CONVERTERS
+
+
+def load_converters() -> int:
+    """Import every registered converter module up front.
+
+    Used by long-lived worker processes so that each one pays the import
+    cost once at start-up rather than on its first notices. Returns the
+    number of converters loaded; modules that fail to import are logged and
+    skipped, as during normal processing.
+    """
+    loaded = 0
+    for spec in BT_CONVERTERS:
+        try:
+            spec.load()
+        except (ImportError, AttributeError):
+            logger.exception("Failed to load converter %s", spec.section_name)
+        else:
+            loaded += 1
+    return loaded
+
+
+@cache
+def get_applicable_converters(
+    root_tag: str, notice_type_code: str
+) -> tuple[ConverterSpec, ...]:
+    """Return the converters that apply to a notice type, in processing order.
+
+    The result is computed once per (root tag, NoticeTypeCode) pair and then
+    served from the cache, so converters that can never find data in a
+    notice of that type are not scheduled at all.
+    """
+    applicable = tuple(
+        spec for spec in BT_CONVERTERS if spec.applies_to(root_tag, notice_type_code)
+    )
+    logger.debug(
+        "%d of %d converters apply to %s (%s)",
+        len(applicable),
+        len(BT_CONVERTERS),
+        root_tag,
+        notice_type_code,
+    )
+    return applicable
@@ -0,0 +1,601 @@
+# src/ted_and_doffin_to_ocds/utils/code_lists.py
+
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
+from typing import Final
+
+
+class CodeList(Mapping[str, str]):
+    """A read-only code list with forward and reverse lookups.
+
+    Code lists are built once, when this module is first imported, and are
+    shared by every converter in the process (and, after a fork, by every
+    worker process). Forward lookups behave like a dict; reverse() and
+    has_value() use a precomputed reverse index instead of scanning the
+    values.
+    """
+
+    __slots__ = ("_codes", "_reverse", "name")
+
+    def __init__(self, name: str, codes: Mapping[str, str]) -> None:
+        self.name = name
+        self._codes: Mapping[str, str] = MappingProxyType(dict(codes))
+        reverse: dict[str, str] = {}
+        for code, value in self._codes.items():
+            # Several codes may share a value; the first one is kept
+            reverse.setdefault(value, code)
+        self._reverse: Mapping[str, str] = MappingProxyType(reverse)
+
+    def __getitem__(self, code: str) -> str:
+        return self._codes[code]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._codes)
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __repr__(self) -> str:
+        return f"CodeList({self.name!r}, {len(self)} codes)"
+
+    def reverse(self, value: str) -> str | None:
+        """Return the first code mapped to value, or None."""
+        return self._reverse.get(value)
+
+    def has_value(self, value: str) -> bool:
+        """Return whether any code is mapped to value."""
+        return value in self._reverse
+
+
+# ISO 3166-1 alpha-3 to alpha-2 country codes. Codes of the EU country
+# authority table without an alpha-2 equivalent (e.g. "XEU") are left out, so
+# that lookups with a default fall back to the code itself.
+COUNTRY_CODES: Final = CodeList(
+    "country",
+    {
+        "ABW": "AW",
+        "AFG": "AF",
+        "AFI": "AI",
+        "AGO": "AO",
+        "AIA": "AI",
+        "ALA": "AX",
+        "ALB": "AL",
+        "AND": "AD",
+        "ANT": "AN",
+        "ARE": "AE",
+        "ARG": "AR",
+        "ARM": "AM",
+        "ASM": "AS",
+        "ATA": "AQ",
+        "ATB": "BQ",
+        "ATF": "TF",
+        "ATG": "AG",
+        "ATN": "NQ",
+        "AUS": "AU",
+        "AUT": "AT",
+        "AZE": "AZ",
+        "BDI": "BI",
+        "BEL": "BE",
+        "BEN": "BJ",
+        "BES": "BQ",
+        "BFA": "BF",
+        "BGD": "BD",
+        "BGR": "BG",
+        "BHR": "BH",
+        "BHS": "BS",
+        "BIH": "BA",
+        "BLM": "BL",
+        "BLR": "BY",
+        "BLZ": "BZ",
+        "BMU": "BM",
+        "BOL": "BO",
+        "BRA": "BR",
+        "BRB": "BB",
+        "BRN": "BN",
+        "BTN": "BT",
+        "BUR": "BU",
+        "BVT": "BV",
+        "BWA": "BW",
+        "BYS": "BY",
+        "CAF": "CF",
+        "CAN": "CA",
+        "CCK": "CC",
+        "CHE": "CH",
+        "CHL": "CL",
+        "CHN": "CN",
+        "CIV": "CI",
+        "CMR": "CM",
+        "COD": "CD",
+        "COG": "CG",
+        "COK": "CK",
+        "COL": "CO",
+        "COM": "KM",
+        "CPT": "CP",
+        "CPV": "CV",
+        "CRI": "CR",
+        "CRQ": "CQ",
+        "CSK": "CS",
+        "CTE": "CT",
+        "CUB": "CU",
+        "CUW": "CW",
+        "CXR": "CX",
+        "CYM": "KY",
+        "CYP": "CY",
+        "CZE": "CZ",
+        "DDR": "DD",
+        "DEU": "DE",
+        "DHY": "DY",
+        "DJI": "DJ",
+        "DMA": "DM",
+        "DNK": "DK",
+        "DOM": "DO",
+        "DZA": "DZ",
+        "ECU": "EC",
+        "EGY": "EG",
+        "ERI": "ER",
+        "ESH": "EH",
+        "ESP": "ES",
+        "EST": "EE",
+        "ETH": "ET",
+        "EUR": "EU",
+        "FIN": "FI",
+        "FJI": "FJ",
+        "FLK": "FK",
+        "FRA": "FR",
+        "FRO": "FO",
+        "FSM": "FM",
+        "FXX": "FX",
+        "GAB": "GA",
+        "GBR": "GB",
+        "GEL": "GE",
+        "GEO": "GE",
+        "GGY": "GG",
+        "GHA": "GH",
+        "GIB": "GI",
+        "GIN": "GN",
+        "GLP": "GP",
+        "GMB": "GM",
+        "GNB": "GW",
+        "GNQ": "GQ",
+        "GRC": "GR",
+        "GRD": "GD",
+        "GRL": "GL",
+        "GTM": "GT",
+        "GUF": "GF",
+        "GUM": "GU",
+        "GUY": "GY",
+        "HKG": "HK",
+        "HMD": "HM",
+        "HND": "HN",
+        "HRV": "HR",
+        "HTI": "HT",
+        "HUN": "HU",
+        "HVO": "HV",
+        "IDN": "ID",
+        "IMN": "IM",
+        "IND": "IN",
+        "IOT": "IO",
+        "IRL": "IE",
+        "IRN": "IR",
+        "IRQ": "IQ",
+        "ISL": "IS",
+        "ISR": "IL",
+        "ITA": "IT",
+        "JAM": "JM",
+        "JEY": "JE",
+        "JOR": "JO",
+        "JPN": "JP",
+        "JTN": "JT",
+        "KAZ": "KZ",
+        "KEN": "KE",
+        "KGZ": "KG",
+        "KHM": "KH",
+        "KIR": "KI",
+        "KNA": "KN",
+        "KOR": "KR",
+        "KWT": "KW",
+        "LAO": "LA",
+        "LBN": "LB",
+        "LBR": "LR",
+        "LBY": "LY",
+        "LCA": "LC",
+        "LIE": "LI",
+        "LKA": "LK",
+        "LSO": "LS",
+        "LTU": "LT",
+        "LUX": "LU",
+        "LVA": "LV",
+        "MAC": "MO",
+        "MAF": "MF",
+        "MAR": "MA",
+        "MCO": "MC",
+        "MDA": "MD",
+        "MDG": "MG",
+        "MDV": "MV",
+        "MEX": "MX",
+        "MHL": "MH",
+        "MID": "MI",
+        "MKD": "MK",
+        "MLI": "ML",
+        "MLT": "MT",
+        "MMR": "MM",
+        "MNE": "ME",
+        "MNG": "MN",
+        "MNP": "MP",
+        "MOZ": "MZ",
+        "MRT": "MR",
+        "MSR": "MS",
+        "MTQ": "MQ",
+        "MUS": "MU",
+        "MWI": "MW",
+        "MYS": "MY",
+        "MYT": "YT",
+        "NAM": "NA",
+        "NCL": "NC",
+        "NER": "NE",
+        "NFK": "NF",
+        "NGA": "NG",
+        "NHB": "NH",
+        "NIC": "NI",
+        "NIU": "NU",
+        "NLD": "NL",
+        "NOR": "NO",
+        "NPL": "NP",
+        "NRU": "NR",
+        "NTZ": "NT",
+        "NZL": "NZ",
+        "OMN": "OM",
+        "PAK": "PK",
+        "PAN": "PA",
+        "PCI": "PC",
+        "PCN": "PN",
+        "PCZ": "PZ",
+        "PER": "PE",
+        "PHL": "PH",
+        "PLW": "PW",
+        "PNG": "PG",
+        "POL": "PL",
+        "PRI": "PR",
+        "PRK": "KP",
+        "PRT": "PT",
+        "PRY": "PY",
+        "PSE": "PS",
+        "PUS": "PU",
+        "PYF": "PF",
+        "QAT": "QA",
+        "REU": "RE",
+        "RHO": "RH",
+        "ROU": "RO",
+        "RUS": "RU",
+        "RWA": "RW",
+        "SAU": "SA",
+        "SCG": "CS",
+        "SDN": "SD",
+        "SEN": "SN",
+        "SGP": "SG",
+        "SGS": "GS",
+        "SHN": "SH",
+        "SJM": "SJ",
+        "SKM": "SK",
+        "SLB": "SB",
+        "SLE": "SL",
+        "SLV": "SV",
+        "SMR": "SM",
+        "SOM": "SO",
+        "SPM": "PM",
+        "SRB": "RS",
+        "SSD": "SS",
+        "STP": "ST",
+        "SUN": "SU",
+        "SUR": "SR",
+        "SVK": "SK",
+        "SVN": "SI",
+        "SWE": "SE",
+        "SWZ": "SZ",
+        "SXM": "SX",
+        "SYC": "SC",
+        "SYR": "SY",
+        "TCA": "TC",
+        "TCD": "TD",
+        "TGO": "TG",
+        "THA": "TH",
+        "TJK": "TJ",
+        "TKL": "TK",
+        "TKM": "TM",
+        "TLS": "TL",
+        "TMP": "TP",
+        "TON": "TO",
+        "TTO": "TT",
+        "TUN": "TN",
+        "TUR": "TR",
+        "TUV": "TV",
+        "TWN": "TW",
+        "TZA": "TZ",
+        "UGA": "UG",
+        "UKR": "UA",
+        "UMI": "UM",
+        "URY": "UY",
+        "USA": "US",
+        "UZB": "UZ",
+        "VAT": "VA",
+        "VCT": "VC",
+        "VDR": "VD",
+        "VEN": "VE",
+        "VGB": "VG",
+        "VIR": "VI",
+        "VNM": "VN",
+        "VUT": "VU",
+        "WAK": "WK",
+        "WLF": "WF",
+        "WSM": "WS",
+        "XIC": "IC",
+        "XKX": "XK",
+        "YEM": "YE",
+        "YMD": "YD",
+        "YUG": "YU",
+        "ZAF": "ZA",
+        "ZAR": "ZR",
+        "ZMB": "ZM",
+        "ZWE": "ZW",
+    },
+)
+
+# ISO 639-2 (bibliographic and terminology) to ISO 639-1 language codes
+LANGUAGE_CODES: Final = CodeList(
+    "language",
+    {
+        "AAR": "aa",
+        "ABK": "ab",
+        "AFR": "af",
+        "AKA": "ak",
+        "ALB": "sq",
+        "AMH": "am",
+        "ARA": "ar",
+        "ARG": "an",
+        "ARM": "hy",
+        "ASM": "as",
+        "AVA": "av",
+        "AVE": "ae",
+        "AYM": "ay",
+        "AZE": "az",
+        "BAK": "ba",
+        "BAM": "bm",
+        "BAQ": "eu",
+        "BEL": "be",
+        "BEN": "bn",
+        "BIH": "bh",
+        "BIS": "bi",
+        "BOD": "bo",
+        "BOS": "bs",
+        "BRE": "br",
+        "BUL": "bg",
+        "BUR": "my",
+        "CAT": "ca",
+        "CES": "cs",
+        "CHA": "ch",
+        "CHE": "ce",
+        "CHI": "zh",
+        "CHU": "cu",
+        "CHV": "cv",
+        "COR": "kw",
+        "COS": "co",
+        "CRE": "cr",
+        "CYM": "cy",
+        "DAN": "da",
+        "DEU": "de",
+        "DIV": "dv",
+        "DZO": "dz",
+        "ELL": "el",
+        "ENG": "en",
+        "EPO": "eo",
+        "EST": "et",
+        "EUS": "eu",
+        "EWE": "ee",
+        "FAO": "fo",
+        "FAS": "fa",
+        "FIJ": "fj",
+        "FIN": "fi",
+        "FRA": "fr",
+        "FRY": "fy",
+        "FUL": "ff",
+        "GAA": "ga",
+        "GLA": "gd",
+        "GLE": "ga",
+        "GLG": "gl",
+        "GLV": "gv",
+        "GRN": "gn",
+        "GUJ": "gu",
+        "HAT": "ht",
+        "HAU": "ha",
+        "HEB": "he",
+        "HER": "hz",
+        "HIN": "hi",
+        "HMO": "ho",
+        "HRV": "hr",
+        "HUN": "hu",
+        "HYE": "hy",
+        "IBO": "ig",
+        "ICE": "is",
+        "IDO": "io",
+        "III": "ii",
+        "IKU": "iu",
+        "ILE": "ie",
+        "INA": "ia",
+        "IND": "id",
+        "IPK": "ik",
+        "ISL": "is",
+        "ITA": "it",
+        "JAV": "jv",
+        "JPN": "ja",
+        "KAL": "kl",
+        "KAN": "kn",
+        "KAS": "ks",
+        "KAT": "ka",
+        "KAU": "kr",
+        "KAZ": "kk",
+        "KHM": "km",
+        "KIK": "ki",
+        "KIN": "rw",
+        "KIR": "ky",
+        "KOM": "kv",
+        "KON": "kg",
+        "KOR": "ko",
+        "KUA": "kj",
+        "KUR": "ku",
+        "LAO": "lo",
+        "LAT": "la",
+        "LAV": "lv",
+        "LIM": "li",
+        "LIN": "ln",
+        "LIT": "lt",
+        "LTZ": "lb",
+        "LUB": "lu",
+        "LUG": "lg",
+        "MAC": "mk",
+        "MAH": "mh",
+        "MAL": "ml",
+        "MAO": "mi",
+        "MAR": "mr",
+        "MAY": "ms",
+        "MKD": "mk",
+        "MLG": "mg",
+        "MLT": "mt",
+        "MON": "mn",
+        "MRI": "mi",
+        "MSA": "ms",
+        "MYA": "my",
+        "NAU": "na",
+        "NAV": "nv",
+        "NBL": "nr",
+        "NDE": "nd",
+        "NDO": "ng",
+        "NEP": "ne",
+        "NLD": "nl",
+        "NNO": "nn",
+        "NOB": "nb",
+        "NOR": "no",
+        "NYA": "ny",
+        "OCI": "oc",
+        "OJI": "oj",
+        "ORI": "or",
+        "ORM": "om",
+        "OSS": "os",
+        "PAN": "pa",
+        "PER": "fa",
+        "PLI": "pi",
+        "POL": "pl",
+        "POR": "pt",
+        "PUS": "ps",
+        "QUE": "qu",
+        "ROH": "rm",
+        "RON": "ro",
+        "RUM": "ro",
+        "RUN": "rn",
+        "RUS": "ru",
+        "SAG": "sg",
+        "SAN": "sa",
+        "SIN": "si",
+        "SLK": "sk",
+        "SLO": "sk",
+        "SLV": "sl",
+        "SME": "se",
+        "SMO": "sm",
+        "SNA": "sn",
+        "SND": "sd",
+        "SOM": "so",
+        "SOT": "st",
+        "SPA": "es",
+        "SQI": "sq",
+        "SRD": "sc",
+        "SRP": "sr",
+        "SSW": "ss",
+        "SUN": "su",
+        "SWA": "sw",
+        "SWE": "sv",
+        "TAH": "ty",
+        "TAM": "ta",
+        "TAT": "tt",
+        "TEL": "te",
+        "TGK": "tg",
+        "TGL": "tl",
+        "THA": "th",
+        "TIB": "bo",
+        "TIR": "ti",
+        "TON": "to",
+        "TSN": "tn",
+        "TSO": "ts",
+        "TUK": "tk",
+        "TUR": "tr",
+        "TWI": "tw",
+        "UIG": "ug",
+        "UKR": "uk",
+        "URD": "ur",
+        "UZB": "uz",
+        "VEN": "ve",
+        "VIE": "vi",
+        "VOL": "vo",
+        "WEL": "cy",
+        "WLN": "wa",
+        "WOL": "wo",
+        "XHO": "xh",
+        "YID": "yi",
+        "YOR": "yo",
+        "ZHA": "za",
+        "ZHO": "zh",
+        "ZUL": "zu",
+    },
+)
+
+# award-criterion-parameter codes of the number-weight list (BT-5421)
+NUMBER_WEIGHT_CODES: Final = CodeList(
+    "number-weight",
+    {
+        "dec-exa": "decimalExact",
+        "dec-mid": "decimalRangeMiddle",
+        "ord-imp": "order",
+        "per-exa": "percentageExact",
+        "per-mid": "percentageRangeMiddle",
+        "poi-exa": "pointsExact",
+        "poi-mid": "pointsRangeMiddle",
+    },
+)
+
+# award-criterion-parameter codes of the number-threshold list (BT-5423)
+NUMBER_THRESHOLD_CODES: Final = CodeList(
+    "number-threshold",
+    {
+        "max-pass": "maximumBids",
+        "min-score": "minimumScore",
+    },
+)
+
+# Descriptions of the non-publication-justification authority table
+NON_PUBLICATION_JUSTIFICATION_CODES: Final = CodeList(
+    "non-publication-justification",
+    {
+        "eo-int": "Commercial interests of an economic operator",
+        "fair-comp": "Fair competition",
+        "law-enf": "Law enforcement",
+        "oth-int": "Other public interest",
+        "rd-ser": "Research and development (R&D) services",
+    },
+)
+NON_PUBLICATION_JUSTIFICATION_URI: Final = (
+    "http://publications.europa.eu/resource/authority/non-publication-justification/"
+)
+
+# The description and URI of each non-publication justification code, as
+# used for withheldInformation rationaleClassifications
+NON_PUBLICATION_JUSTIFICATION: Final[Mapping[str, Mapping[str, str]]] = (
+    MappingProxyType(
+        {
+            code: MappingProxyType(
+                {
+                    "description": description,
+                    "uri": f"{NON_PUBLICATION_JUSTIFICATION_URI}{code}",
+                }
+            )
+            for code, description in NON_PUBLICATION_JUSTIFICATION_CODES.items()
+        }
+    )
+)
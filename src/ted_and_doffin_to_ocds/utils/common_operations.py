@@ -3,18 +3,74 @@
 import json
 import logging
 import os
-import uuid
 from pathlib import Path
 from typing import Any
 
 from lxml import etree
 
+from .identifiers import new_ocid
+from .notice_document import EFORMS_NAMESPACES, NoticeDocument, XMLContent
 from .notice_tracker import NoticeTracker
 from .xml_processor import XMLProcessor
+from .xpath_catalogue import register_xpath
 
 logger = logging.getLogger(__name__)
 
 
+XPATH_ID_STRING = register_xpath("common_operations.XPATH_ID_STRING", "string(cbc:ID)")
+XPATH_NOTICE_REFERENCES = register_xpath(
+    "common_operations.XPATH_NOTICE_REFERENCES", "//cac:NoticeDocumentReference"
+)
+XPATH_PART_NOTICE_REFERENCES = register_xpath(
+    "common_operations.XPATH_PART_NOTICE_REFERENCES",
+    ".//cac:NoticeDocumentReference",
+)
+XPATH_REFERENCED_PART_ID = register_xpath(
+    "common_operations.XPATH_REFERENCED_PART_ID",
+    "string(cbc:ReferencedDocumentInternalAddress)",
+)
+XPATH_IS_FRAMEWORK = register_xpath(
+    "common_operations.XPATH_IS_FRAMEWORK",
+    "boolean("
+    "/*/cac:ProcurementProject//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='framework-agreement'] | "
+    "/*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='framework-agreement'])",
+)
+XPATH_IS_DPS = register_xpath(
+    "common_operations.XPATH_IS_DPS",
+    "boolean("
+    "/*/cac:ProcurementProject//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='dps'] | "
+    "/*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='dps'] | "
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess"
+    "/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']"
+    "/cbc:ContractingSystemTypeCode[text()!='none'])",
+)
+XPATH_PLANNING_NOTICE_TYPE = register_xpath(
+    "common_operations.XPATH_PLANNING_NOTICE_TYPE",
+    "string(/*/cbc:NoticeTypeCode[@listName='planning'])",
+)
+XPATH_PREVIOUS_PUBLICATION_IDS = register_xpath(
+    "common_operations.XPATH_PREVIOUS_PUBLICATION_IDS",
+    "//cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
+)
+XPATH_NOTICE_PARTS = register_xpath(
+    "common_operations.XPATH_NOTICE_PARTS",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
+)
+XPATH_NOTICE_ID = register_xpath(
+    "common_operations.XPATH_NOTICE_ID", "string(/*/cbc:ID)"
+)
+XPATH_ISSUE_DATE = register_xpath(
+    "common_operations.XPATH_ISSUE_DATE", "string(/*/cbc:IssueDate)"
+)
+XPATH_NOTICE_TYPE_CODE = register_xpath(
+    "common_operations.XPATH_NOTICE_TYPE_CODE", "string(/*/cbc:NoticeTypeCode)"
+)
+
+
 class NoticeProcessor:
     """Process XML notices and convert them to OCDS releases."""
 
@@ -46,33 +102,51 @@ class NoticeProcessor:
     @property
     def namespaces(self) -> dict[str, str]:
         """XML namespaces used in eForms."""
-        return {
-            "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-            "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-            "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-            "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-        }
+        return EFORMS_NAMESPACES
 
-    def process_notice(self, xml_content: str | bytes) -> list[str]:
+    def process_notice(
+        self, xml_content: XMLContent, notice_info: dict[str, Any] | None = None
+    ) -> list[str]:
+        """Process a notice and return its releases as JSON strings.
+
+        Thin wrapper around process_notice_releases for callers that need
+        serialized releases.
+        """
+        return [
+            json.dumps(release)
+            for release in self.process_notice_releases(xml_content, notice_info)
+        ]
+
+    def process_notice_releases(
+        self, xml_content: XMLContent, notice_info: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Main entry point for notice processing following specification rules.
         Creates separate releases for PIN-only parts, single release otherwise.
+
+        xml_content may be a NoticeDocument the caller already parsed, whose
+        tree is then used instead of parsing the notice again. notice_info
+        may be passed in when it is already known from the notice header
+        (see NoticeHeader.to_notice_info); otherwise it is extracted from the
+        parsed notice. The releases are returned as new dicts that the caller
+        may modify.
         """
-        tree = self.xml_processor.parse_xml(xml_content)
-        notice_info = self.xml_processor.extract_notice_info(tree)
+        if isinstance(xml_content, NoticeDocument):
+            tree = xml_content.root
+        else:
+            tree = self.xml_processor.parse_xml(xml_content)
+        if notice_info is None:
+            notice_info = self.xml_processor.extract_notice_info(tree)
         releases = self._process_notice(tree, notice_info)
 
         # Track notices in database
-        for release_str in releases:
-            release = json.loads(release_str)
+        for release in releases:
             self._track_notice(notice_info, release["ocid"])
 
         return releases
 
     def _process_notice(
         self, tree: etree._Element, notice_info: dict[str, Any]
-    ) -> list[str]:
+    ) -> list[dict[str, Any]]:
         """Process a notice following the specification rules:
         - Separate release for each part in PIN-only notices
         - Single release with appropriate OCID for other notices
@@ -85,8 +159,8 @@ class NoticeProcessor:
             # Process each part separately for PIN-only
             releases = []
             for part in parts:
-                part_id = part.xpath("string(cbc:ID)", namespaces=self.namespaces)
-                ocid = f"{self.ocid_prefix}-{uuid.uuid4()}"
+                part_id = XPATH_ID_STRING(part)
+                ocid = new_ocid(self.ocid_prefix, notice_info["notice_id"], part_id)
 
                 # Track the part
                 self.tracker.track_part(notice_info["notice_id"], part_id, ocid)
@@ -103,7 +177,7 @@ class NoticeProcessor:
                 if part_refs:
                     release["relatedProcesses"] = part_refs
 
-                releases.append(json.dumps(release))
+                releases.append(release)
             return releases
 
         # Create single release for non-PIN-only notices
@@ -111,7 +185,7 @@ class NoticeProcessor:
 
     def _create_single_release(
         self, tree: etree._Element, notice_info: dict[str, Any]
-    ) -> str:
+    ) -> dict[str, Any]:
         """Create a single release with appropriate OCID and references."""
         ocid = self.determine_ocid(tree)
         release = {
@@ -125,7 +199,7 @@ class NoticeProcessor:
         if prev_refs:
             release["relatedProcesses"] = prev_refs
 
-        return json.dumps(release)
+        return release
 
     def determine_ocid(self, tree: etree._Element) -> str:
         """Determine OCID following specification rules:
@@ -133,38 +207,39 @@ class NoticeProcessor:
         - New OCID if CAN for framework/DPS
         - New OCID if previous was PIN-only
         - Previous OCID otherwise
+
+        New OCIDs are named after the notice (see new_ocid).
         """
+        notice_id = XPATH_NOTICE_ID(tree)
         # Check if this is first publication
-        prev_pub_ref = tree.xpath(
-            "//cac:NoticeDocumentReference", namespaces=self.namespaces
-        )
+        prev_pub_ref = XPATH_NOTICE_REFERENCES(tree)
         if not prev_pub_ref:
             logger.info("First publication - generating new OCID")
-            return f"{self.ocid_prefix}-{uuid.uuid4()}"
+            return new_ocid(self.ocid_prefix, notice_id)
 
         # Check if this is CAN for framework/DPS
         if self.is_can_for_framework_or_dps(tree):
             logger.info("CAN for framework/DPS - generating new OCID")
-            return f"{self.ocid_prefix}-{uuid.uuid4()}"
+            return new_ocid(self.ocid_prefix, notice_id)
 
         # Get previous publication reference
         prev_pub_id = self.get_previous_publication_id(tree)
         if not prev_pub_id:
             logger.info("No previous publication ID - generating new OCID")
-            return f"{self.ocid_prefix}-{uuid.uuid4()}"
+            return new_ocid(self.ocid_prefix, notice_id)
 
         # Check if previous was PIN-only
         prev_notice = self.tracker.get_previous_notice(prev_pub_id)
         if prev_notice:
             if prev_notice[3]:  # is_pin_only
                 logger.info("Previous was PIN-only - generating new OCID")
-                return f"{self.ocid_prefix}-{uuid.uuid4()}"
+                return new_ocid(self.ocid_prefix, notice_id)
             if prev_notice[1]:  # has ocid
                 logger.info("Using previous OCID: %s", prev_notice[1])
                 return prev_notice[1]
 
         logger.warning("Previous notice referenced but OCID not found")
-        return f"{self.ocid_prefix}-{uuid.uuid4()}"
+        return new_ocid(self.ocid_prefix, notice_id)
 
     def get_previous_references(self, tree: etree._Element) -> list[dict[str, Any]]:
         """Get references to previous publications per specification:
@@ -203,16 +278,11 @@ class NoticeProcessor:
     ) -> list[dict[str, Any]]:
         """Get previous document references specific to a part."""
         refs = []
-        notice_refs = part.xpath(
-            ".//cac:NoticeDocumentReference", namespaces=self.namespaces
-        )
+        notice_refs = XPATH_PART_NOTICE_REFERENCES(part)
 
         for ref in notice_refs:
-            notice_id = ref.xpath("string(cbc:ID)", namespaces=self.namespaces)
-            part_id = ref.xpath(
-                "string(cbc:ReferencedDocumentInternalAddress)",
-                namespaces=self.namespaces,
-            )
+            notice_id = XPATH_ID_STRING(ref)
+            part_id = XPATH_REFERENCED_PART_ID(ref)
             if notice_id:
                 identifier = f"{notice_id}-{part_id}" if part_id else notice_id
                 refs.append(
@@ -230,27 +300,9 @@ class NoticeProcessor:
         if not self.is_can(tree):
             return False
 
-        is_framework = tree.xpath(
-            """boolean(/*/cac:ProcurementProject//cbc:ProcurementTypeCode[
-                @listName='contract-nature' and text()='framework-agreement'] |
-            /*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode[
-                @listName='contract-nature' and text()='framework-agreement'])""",
-            namespaces=self.namespaces,
-        )
+        is_framework = XPATH_IS_FRAMEWORK(tree)
 
-        is_dps = tree.xpath(
-            """boolean(
-                /*/cac:ProcurementProject//cbc:ProcurementTypeCode[
-                    @listName='contract-nature' and text()='dps'] |
-                /*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode[
-                    @listName='contract-nature' and text()='dps'] |
-                /*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/
-                    cac:TenderingProcess/cac:ContractingSystem[
-                        cbc:ContractingSystemTypeCode/@listName='dps-usage']/
-                        cbc:ContractingSystemTypeCode[text()!='none']
-            )""",
-            namespaces=self.namespaces,
-        )
+        is_dps = XPATH_IS_DPS(tree)
 
         return is_framework or is_dps
 
@@ -260,18 +312,12 @@ class NoticeProcessor:
 
     def is_pin_only(self, tree: etree._Element) -> bool:
         """Check if notice is a PIN used only for information."""
-        notice_type = tree.xpath(
-            "string(/*/cbc:NoticeTypeCode[@listName='planning'])",
-            namespaces=self.namespaces,
-        )
+        notice_type = XPATH_PLANNING_NOTICE_TYPE(tree)
         return notice_type == "pin-only"
 
     def get_previous_publication_id(self, tree: etree._Element) -> str | None:
         """Get ID of the previous planning notice if it exists."""
-        refs = tree.xpath(
-            "//cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
-            namespaces=self.namespaces,
-        )
+        refs = XPATH_PREVIOUS_PUBLICATION_IDS(tree)
         if refs:
             logger.info("Found previous planning notice ID: %s", refs[0])
             return refs[0]
@@ -279,22 +325,14 @@ class NoticeProcessor:
 
     def get_notice_parts(self, tree: etree._Element) -> list[etree._Element]:
         """Get all parts from a notice."""
-        return tree.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.namespaces,
-        )
+        return XPATH_NOTICE_PARTS(tree)
 
     def _extract_notice_info(self, tree: etree._Element) -> dict[str, Any]:
         """Extract basic information from notice."""
         return {
-            "notice_id": tree.xpath("string(/*/cbc:ID)", namespaces=self.namespaces),
-            "publication_date": tree.xpath(
-                "string(/*/cbc:IssueDate)", namespaces=self.namespaces
-            ),
-            "notice_type": tree.xpath(
-                "string(/*/cbc:NoticeTypeCode)", namespaces=self.namespaces
-            )
-            or "Unknown",
+            "notice_id": XPATH_NOTICE_ID(tree),
+            "publication_date": XPATH_ISSUE_DATE(tree),
+            "notice_type": XPATH_NOTICE_TYPE_CODE(tree) or "Unknown",
             "is_pin_only": self.is_pin_only(tree),
         }
 
@@ -345,6 +383,38 @@ def remove_empty_dicts(data):
     return data
 
 
+def _is_empty(value: object) -> bool:
+    return value is None or (not value and not isinstance(value, bool | int | float))
+
+
+def prune_empty_elements(data: dict[str, Any] | list[Any]) -> None:
+    """Remove empty lists, empty dicts and None elements in place, bottom-up.
+
+    Containers left empty once their own empty elements are removed are
+    removed as well, in the same pass. Preserves False boolean values and
+    zero numeric values. Unlike remove_empty_elements() and
+    remove_empty_dicts(), no dict or list is copied.
+    """
+    if isinstance(data, dict):
+        empty_keys = []
+        for key, value in data.items():
+            if isinstance(value, dict | list):
+                prune_empty_elements(value)
+            if _is_empty(value):
+                empty_keys.append(key)
+        for key in empty_keys:
+            del data[key]
+    elif isinstance(data, list):
+        kept = 0
+        for item in data:
+            if isinstance(item, dict | list):
+                prune_empty_elements(item)
+            if not _is_empty(item):
+                data[kept] = item
+                kept += 1
+        del data[kept:]
+
+
 def process_bt_section(
     release_json, xml_content, parse_funcs, merge_func, section_name
 ) -> None:
@@ -13,3 +13,14 @@ class Config:
     db_path: Path
     clear_db: bool
     log_level: str
+    workers: int = 4
+    executor: str = "thread"
+    zero_copy: bool = False
+    snapshot_manifest: Path | None = None
+    force: bool = False
+    resume: bool = False
+    deterministic_ids: bool = False
+    output_format: str = "files"
+    rotate_releases: int = 10_000
+    rotate_bytes: int | None = None
+    publisher_name: str | None = None
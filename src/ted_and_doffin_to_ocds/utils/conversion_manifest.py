@@ -0,0 +1,267 @@
+# src/ted_and_doffin_to_ocds/utils/conversion_manifest.py
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+from .config import Config
+from .notice_tracker import connect
+from .snapshot_manifest import file_digest
+
+logger = logging.getLogger(__name__)
+
+PACKAGE_ROOT: Final[Path] = Path(__file__).resolve().parent.parent
+
+# Status of a file in the current run
+PENDING: Final[str] = "pending"
+IN_PROGRESS: Final[str] = "in_progress"
+DONE: Final[str] = "done"
+FAILED: Final[str] = "failed"
+
+
+def converter_version(config: Config) -> str:
+    """Identify the converter code and the settings that shape its output.
+
+    This is a hash of every source file of the package together with the
+    OCID prefix, the related process scheme, the output format and the id
+    mode, so any change to the converters or to these settings reconverts
+    every file.
+    """
+    digest = hashlib.sha256()
+    for source in sorted(PACKAGE_ROOT.rglob("*.py")):
+        digest.update(source.relative_to(PACKAGE_ROOT).as_posix().encode())
+        digest.update(source.read_bytes())
+    for setting in (
+        config.ocid_prefix,
+        config.scheme,
+        config.output_format,
+        config.deterministic_ids,
+    ):
+        digest.update(f"\0{setting}".encode())
+    return digest.hexdigest()
+
+
+class ConversionManifest:
+    """A record of the input files converted by previous runs.
+
+    For every file converted into an output folder, the manifest holds the
+    hash of its content, the version of the converter that converted it and
+    the output files its releases were written to. It is kept in the notice
+    database, so that files are only skipped while the notices they tracked
+    are still there. Files are identified by name, as notice files are named
+    after their notice.
+
+    The manifest also keeps the status of each file of the current run
+    (pending, in progress, done or failed, with the number of attempts), as
+    it happens, so that a run that was interrupted can be resumed.
+    """
+
+    def __init__(self, db_path: Path, output_folder: Path, version: str) -> None:
+        self.db_path = db_path
+        self.output_folder = str(output_folder.resolve())
+        self.version = version
+        self._conn = connect(db_path)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS converted_files (
+                file_name TEXT NOT NULL,
+                output_folder TEXT NOT NULL,
+                sha256 TEXT NOT NULL,
+                converter_version TEXT NOT NULL,
+                outputs TEXT NOT NULL,
+                converted_at TEXT NOT NULL,
+                PRIMARY KEY (file_name, output_folder)
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_status (
+                file_name TEXT NOT NULL,
+                output_folder TEXT NOT NULL,
+                status TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (file_name, output_folder)
+            )
+        """)
+        self._conn.commit()
+        self._converted = {
+            file_name: (sha256, converter_version, json.loads(outputs))
+            for file_name, sha256, converter_version, outputs in self._conn.execute(
+                """
+                SELECT file_name, sha256, converter_version, outputs
+                FROM converted_files
+                WHERE output_folder = ?
+                """,
+                (self.output_folder,),
+            )
+        }
+        # Digests of the files selected by select_changed(), until recorded
+        self._digests: dict[Path, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._converted)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def start_run(self, files: Iterable[Path], *, resume: bool = False) -> list[Path]:
+        """Start a run over files and return the files left to convert.
+
+        A new run marks every file as pending. A resumed run keeps the
+        status of the previous run, and leaves out the files that were done
+        and whose output files still exist; other files are converted again.
+        """
+        files = list(files)
+        if resume:
+            done = {
+                file_name
+                for (file_name,) in self._conn.execute(
+                    """
+                    SELECT file_name FROM file_status
+                    WHERE output_folder = ? AND status = ?
+                    """,
+                    (self.output_folder, DONE),
+                )
+                if self._outputs_exist(file_name)
+            }
+            files = [file_path for file_path in files if file_path.name not in done]
+            logger.info("Resuming run: %d files done, %d left", len(done), len(files))
+        else:
+            self._conn.execute(
+                "DELETE FROM file_status WHERE output_folder = ?",
+                (self.output_folder,),
+            )
+        now = datetime.now(UTC).isoformat()
+        self._conn.executemany(
+            """
+            INSERT INTO file_status (file_name, output_folder, status, updated_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(file_name, output_folder) DO NOTHING
+            """,
+            [(file_path.name, self.output_folder, PENDING, now) for file_path in files],
+        )
+        self._conn.commit()
+        return files
+
+    def mark_started(self, file_path: Path) -> None:
+        """Record that the conversion of a file has started."""
+        self._set_status(file_path, IN_PROGRESS, attempt=True)
+
+    def mark_failed(self, file_path: Path, error: str) -> None:
+        """Record that the conversion of a file failed."""
+        self._set_status(file_path, FAILED, error=error)
+
+    def status(self, file_name: str) -> tuple[str, int] | None:
+        """The status and number of attempts of a file in the current run."""
+        row = self._conn.execute(
+            """
+            SELECT status, attempts FROM file_status
+            WHERE file_name = ? AND output_folder = ?
+            """,
+            (file_name, self.output_folder),
+        ).fetchone()
+        return tuple(row) if row else None
+
+    def _set_status(
+        self,
+        file_path: Path,
+        status: str,
+        *,
+        attempt: bool = False,
+        error: str | None = None,
+    ) -> None:
+        self._conn.execute(
+            """
+            INSERT INTO file_status (
+                file_name, output_folder, status, attempts, error, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(file_name, output_folder) DO UPDATE SET
+                status = excluded.status,
+                attempts = attempts + excluded.attempts,
+                error = excluded.error,
+                updated_at = excluded.updated_at
+            """,
+            (
+                file_path.name,
+                self.output_folder,
+                status,
+                int(attempt),
+                error,
+                datetime.now(UTC).isoformat(),
+            ),
+        )
+        self._conn.commit()
+
+    def select_changed(self, files: Iterable[Path]) -> list[Path]:
+        """Return the files that are new or changed since they were converted.
+
+        A file is unchanged if its content hash and the converter version
+        are those recorded when it was last converted, and the output files
+        it was written to still exist.
+        """
+        changed = []
+        skipped = 0
+        for file_path in files:
+            digest = file_digest(file_path)
+            if self._is_converted(file_path.name, digest):
+                logger.debug("Skipping unchanged file %s", file_path)
+                skipped += 1
+                continue
+            self._digests[file_path] = digest
+            changed.append(file_path)
+        logger.info("Skipping %d unchanged files, converting %d", skipped, len(changed))
+        return changed
+
+    def _is_converted(self, file_name: str, digest: str) -> bool:
+        converted = self._converted.get(file_name)
+        if converted is None:
+            return False
+        sha256, version, _ = converted
+        return (
+            sha256 == digest
+            and version == self.version
+            and self._outputs_exist(file_name)
+        )
+
+    def _outputs_exist(self, file_name: str) -> bool:
+        return all(output.exists() for output in self.outputs(file_name))
+
+    def record(self, file_path: Path, outputs: Iterable[Path]) -> None:
+        """Record that a file was converted, and the files it was written to.
+
+        The file is marked as done in the current run.
+        """
+        digest = self._digests.pop(file_path, None) or file_digest(file_path)
+        outputs = [str(output) for output in outputs]
+        self._conn.execute(
+            """
+            INSERT INTO converted_files (
+                file_name, output_folder, sha256, converter_version, outputs,
+                converted_at
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(file_name, output_folder) DO UPDATE SET
+                sha256 = excluded.sha256,
+                converter_version = excluded.converter_version,
+                outputs = excluded.outputs,
+                converted_at = excluded.converted_at
+            """,
+            (
+                file_path.name,
+                self.output_folder,
+                digest,
+                self.version,
+                json.dumps(outputs),
+                datetime.now(UTC).isoformat(),
+            ),
+        )
+        self._converted[file_path.name] = (digest, self.version, outputs)
+        self._set_status(file_path, DONE)
+
+    def outputs(self, file_name: str) -> list[Path]:
+        """The output files recorded for a converted file."""
+        converted = self._converted.get(file_name)
+        return [Path(output) for output in converted[2]] if converted else []
@@ -1,15 +1,23 @@
 import logging
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
 DATE_FORMAT = (
     r"(\d{4}-\d{2}-\d{2})(?:[T ](\d{2}:\d{2}:\d{2}(?:\.\d+)?))?([Z]|[+-]\d{2}:?\d{2})?"
 )
+DATE_PATTERN = re.compile(DATE_FORMAT)
+
+# Dates repeat heavily within and across notices (issue dates, deadlines), so
+# converted dates are memoized. The cache is bounded so that long runs over
+# many notices do not grow it without limit.
+DATE_CACHE_SIZE = 4096
 
 
 def parse_date_parts(date_string: str) -> tuple[str, str | None, str | None]:
-    match = re.match(DATE_FORMAT, date_string)
+    match = DATE_PATTERN.match(date_string)
     if not match:
         error_message = f"Invalid date format: {date_string}"
         raise ValueError(error_message)
@@ -24,28 +32,43 @@ def format_timezone(tz_part: str | None, original_date: str) -> str:
     return tz_part
 
 
-def convert_to_iso_format(date_string: str, is_start_date: bool = False) -> str:
-    logger.debug(
-        "convert_to_iso_format input: %s, is_start_date: %s",
-        date_string,
-        is_start_date,
-    )
-
-    try:
-        date_part, time_part, tz_part = parse_date_parts(date_string)
-
-        time_part = time_part or ("00:00:00" if is_start_date else "23:59:59")
-        tz_part = format_timezone(tz_part, date_string)
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _convert_to_iso_format(date_string: str, is_start_date: bool) -> str:
+    date_part, time_part, tz_part = parse_date_parts(date_string)
+    time_part = time_part or ("00:00:00" if is_start_date else "23:59:59")
+    return f"{date_part}T{time_part}{format_timezone(tz_part, date_string)}"
 
-        iso_date_string = f"{date_part}T{time_part}{tz_part}"
 
-        logger.debug("convert_to_iso_format output: %s", iso_date_string)
+def convert_to_iso_format(date_string: str, is_start_date: bool = False) -> str:
+    try:
+        return _convert_to_iso_format(date_string, is_start_date)
     except ValueError as e:
         logger.exception("Error parsing date: %s", date_string)
         error_message = f"Invalid date format: {date_string}"
         raise ValueError(error_message) from e
-    else:
-        return iso_date_string
+
+
+def convert_dates_to_iso_format(
+    date_strings: Iterable[str], is_start_date: bool = False
+) -> list[str]:
+    """Convert several date strings to ISO 8601 format at once.
+
+    Args:
+        date_strings: The input date strings to be converted.
+        is_start_date: Whether dates without a time start (00:00:00) or end
+            (23:59:59) the day.
+
+    Returns:
+        The date-time strings in ISO 8601 format, in input order.
+
+    Raises:
+        ValueError: If any of the date strings is in an invalid format.
+
+    """
+    return [
+        convert_to_iso_format(date_string, is_start_date)
+        for date_string in date_strings
+    ]
 
 
 def start_date(date_string: str) -> str:
@@ -68,7 +91,6 @@ def start_date(date_string: str) -> str:
         '2019-11-15T00:00:00+01:00'
 
     """
-    logger.debug("StartDate input: %s", date_string)
     try:
         return convert_to_iso_format(date_string, is_start_date=True)
     except ValueError as e:
@@ -97,13 +119,9 @@ def end_date(date_string: str) -> str:
         '2019-11-15T23:59:59+01:00'
 
     """
-    logger.debug("EndDate input: %s", date_string)
     try:
-        result = convert_to_iso_format(date_string, is_start_date=False)
-        logger.debug("EndDate result: %s", result)
+        return convert_to_iso_format(date_string, is_start_date=False)
     except ValueError as e:
         logger.exception("Error parsing end date: %s", date_string)
         error_message = f"Invalid end date format: {date_string}"
         raise ValueError(error_message) from e
-    else:
-        return result
@@ -0,0 +1,251 @@
+# src/ted_and_doffin_to_ocds/utils/eforms_paths.py
+
+"""Rewrite XPath expressions to match the structure of eForms notices.
+
+anchor_path() replaces a leading descendant-axis step (//cac:X) by the
+absolute paths at which the element occurs in an eForms notice, so the
+whole tree is not scanned. compile_child_path() turns a plain child path
+such as cac:ProcurementProject/cbc:Name/text() into a ChildPath, which
+walks the children with Clark-notation tags instead of running XPath.
+"""
+
+import re
+from collections.abc import Callable
+from typing import Final
+
+from lxml import etree
+
+# The eForms extension of the notice itself (not of a lot or a criterion)
+NOTICE_EXTENSION: Final[str] = (
+    "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension"
+)
+
+# The parents at which an element occurs in an eForms notice. Only elements
+# whose locations are fixed by the schema are listed; //cac:X is left alone
+# for any other element.
+ANCHORS: Final[dict[str, tuple[str, ...]]] = {
+    "cac:ProcurementProjectLot": ("/*",),
+    "cac:ProcurementProject": ("/*", "/*/cac:ProcurementProjectLot"),
+    "cac:TenderingProcess": ("/*", "/*/cac:ProcurementProjectLot"),
+    "cac:TenderingTerms": ("/*", "/*/cac:ProcurementProjectLot"),
+    "cac:ContractingParty": ("/*",),
+    "cbc:ContractFolderID": ("/*",),
+    "cbc:NoticeTypeCode": ("/*",),
+    "cbc:RegulatoryDomain": ("/*",),
+    "cac:LotDistribution": ("/*/cac:TenderingTerms",),
+    "cac:ProcurementLegislationDocumentReference": (
+        "/*/cac:TenderingTerms",
+        "/*/cac:ProcurementProjectLot/cac:TenderingTerms",
+    ),
+    "cac:NoticeDocumentReference": (
+        "/*/cac:TenderingProcess",
+        "/*/cac:ProcurementProjectLot/cac:TenderingProcess",
+        f"{NOTICE_EXTENSION}/efac:NoticeResult/efac:SettledContract",
+    ),
+    "efext:EformsExtension": (
+        "/*/ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent",
+    ),
+    "efac:NoticeResult": (NOTICE_EXTENSION,),
+    "efac:Organizations": (NOTICE_EXTENSION,),
+    "efac:Changes": (NOTICE_EXTENSION,),
+    "efac:ContractModification": (NOTICE_EXTENSION,),
+    "efac:Organization": (f"{NOTICE_EXTENSION}/efac:Organizations",),
+    "efac:UltimateBeneficialOwner": (
+        f"{NOTICE_EXTENSION}/efac:Organizations",
+        f"{NOTICE_EXTENSION}/efac:Organizations/efac:Organization",
+    ),
+    "efac:LotResult": (f"{NOTICE_EXTENSION}/efac:NoticeResult",),
+    "efac:TenderingParty": (
+        f"{NOTICE_EXTENSION}/efac:NoticeResult",
+        f"{NOTICE_EXTENSION}/efac:NoticeResult/efac:LotTender",
+    ),
+}
+
+# ext:UBLExtensions occurs in many places, but these paths below it only
+# exist in the extension of the notice itself.
+NOTICE_EXTENSION_PREFIXES: Final[tuple[str, ...]] = tuple(
+    f"//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent/efext:EformsExtension/{tag}"
+    for tag in (
+        "efac:NoticeResult",
+        "efac:Organizations",
+        "efac:Changes",
+        "efac:ContractModification",
+        "efac:Publication",
+    )
+)
+
+# A leading //prefix:Name at the start of the expression, of a union member
+# or of a function argument.
+_DESCENDANT_STEP = re.compile(r"(^|[|(,])(\s*)//([a-z]+:[A-Za-z]+)(?![\w:(-])")
+_CHILD_STEP = re.compile(r"([a-z]+):([A-Za-z]+)(?:\[@([A-Za-z]+)='([^']*)'\])?")
+
+
+def _step_end(expression: str, start: int) -> int:
+    """Return the end of the predicates that follow a step ending at start."""
+    end = start
+    while end < len(expression) and expression[end] == "[":
+        depth = 0
+        quote = None
+        for i in range(end, len(expression)):
+            char = expression[i]
+            if quote:
+                if char == quote:
+                    quote = None
+            elif char in "'\"":
+                quote = char
+            elif char == "[":
+                depth += 1
+            elif char == "]":
+                depth -= 1
+                if depth == 0:
+                    end = i + 1
+                    break
+        else:
+            return end
+    return end
+
+
+def _outside_literals(expression: str, index: int) -> bool:
+    """Whether index is outside the string literals of expression."""
+    quote = None
+    for char in expression[:index]:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+    return quote is None
+
+
+def anchor_path(expression: str) -> str:
+    """Replace leading //cac:X steps by the absolute paths of X in eForms.
+
+    An element with several locations becomes a union of the absolute paths,
+    which returns the same nodes in the same (document) order as the
+    descendant axis does for a notice that follows the eForms schema.
+    """
+    for prefix in NOTICE_EXTENSION_PREFIXES:
+        expression = expression.replace(prefix, f"/*{prefix[1:]}")
+
+    result = []
+    position = 0
+    for match in _DESCENDANT_STEP.finditer(expression):
+        anchors = ANCHORS.get(match.group(3))
+        if anchors is None or not _outside_literals(expression, match.start()):
+            continue
+        step_start = match.start(3)
+        step_end = _step_end(expression, match.end(3))
+        step = expression[step_start:step_end]
+        if len(anchors) == 1:
+            anchored = f"{anchors[0]}/{step}"
+        else:
+            anchored = "(" + " | ".join(f"{anchor}/{step}" for anchor in anchors) + ")"
+        result.append(expression[position : match.start(2)])
+        result.append(match.group(2))
+        result.append(anchored)
+        position = step_end
+    result.append(expression[position:])
+    return "".join(result)
+
+
+class ChildPath:
+    """A child-only path evaluated by walking children with Clark tags.
+
+    Returns the same list as the XPath expression it was compiled from:
+    the matching elements, or their text nodes for a path ending in text().
+    """
+
+    __slots__ = ("absolute", "steps", "text", "xpath")
+
+    def __init__(
+        self,
+        steps: tuple[tuple[str, str | None, str | None], ...],
+        xpath: etree.XPath,
+        *,
+        absolute: bool,
+        text: bool,
+    ) -> None:
+        self.steps = steps
+        self.xpath = xpath
+        self.absolute = absolute
+        self.text = text
+
+    def __call__(
+        self, node: etree._Element | etree._ElementTree, **variables: object
+    ) -> list[etree._Element] | list[str]:
+        if variables:
+            return self.xpath(node, **variables)
+        if not etree.iselement(node):
+            # The context node is the document, not its root element
+            return self.xpath(node)
+        if self.absolute:
+            node = node.getroottree().getroot()
+        nodes = [node]
+        for tag, attribute, value in self.steps:
+            if attribute is None:
+                nodes = [
+                    child for parent in nodes for child in parent.iterchildren(tag)
+                ]
+            else:
+                nodes = [
+                    child
+                    for parent in nodes
+                    for child in parent.iterchildren(tag)
+                    if child.get(attribute) == value
+                ]
+        if not self.text:
+            return nodes
+        texts = []
+        for element in nodes:
+            if len(element):
+                # Mixed content: XPath returns every text node, tails included
+                texts.extend(element.xpath("text()"))
+            elif element.text is not None:
+                texts.append(element.text)
+        return texts
+
+
+def compile_child_path(expression: str, namespaces: dict[str, str]) -> ChildPath | None:
+    """Compile a plain child path, or return None if it needs XPath.
+
+    Supported are relative paths and paths below /*, made of prefixed element
+    names with at most one [@attribute='value'] predicate each, optionally
+    ending in /text().
+    """
+    path = expression.strip()
+    absolute = path.startswith("/*/")
+    if absolute:
+        path = path[3:]
+    elif path.startswith("./"):
+        path = path[2:]
+    text = path.endswith("/text()")
+    if text:
+        path = path[: -len("/text()")]
+
+    steps = []
+    for step in path.split("/"):
+        match = _CHILD_STEP.fullmatch(step)
+        if match is None:
+            return None
+        prefix, localname, attribute, value = match.groups()
+        if prefix not in namespaces:
+            return None
+        steps.append((f"{{{namespaces[prefix]}}}{localname}", attribute, value))
+    xpath = etree.XPath(expression, namespaces=namespaces)
+    return ChildPath(tuple(steps), xpath, absolute=absolute, text=text)
+
+
+def compile_path(expression: str, namespaces: dict[str, str]) -> Callable[..., object]:
+    """Compile an expression for eForms notices as fast as it allows.
+
+    Location paths starting with // are anchored with anchor_path(), so they
+    only find elements where the eForms schema puts them. A plain child path
+    becomes a ChildPath, anything else an etree.XPath.
+    """
+    if expression.lstrip().startswith("//"):
+        expression = anchor_path(expression)
+    if "$" not in expression:
+        child_path = compile_child_path(expression, namespaces)
+        if child_path is not None:
+            return child_path
+    return etree.XPath(expression, namespaces=namespaces)
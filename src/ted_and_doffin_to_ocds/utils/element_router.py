@@ -0,0 +1,60 @@
+# src/ted_and_doffin_to_ocds/utils/element_router.py
+
+import logging
+from collections.abc import Callable, Iterable
+
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+
+class ElementRouter:
+    """Route elements of a notice to registered handlers in a single tree walk.
+
+    Handlers are registered per Clark-notation tag ("{namespace}localname").
+    walk() visits the tree once with etree.iterwalk and calls every handler
+    registered for an element's tag, in document order, instead of each
+    consumer scanning the whole document with its own XPath.
+    """
+
+    def __init__(self) -> None:
+        self._handlers: dict[str, list[Callable[[etree._Element], None]]] = {}
+
+    def register(self, tag: str, handler: Callable[[etree._Element], None]) -> None:
+        """Register a handler for every element with the given Clark tag."""
+        self._handlers.setdefault(tag, []).append(handler)
+
+    @property
+    def tags(self) -> tuple[str, ...]:
+        """Tags that have at least one handler registered."""
+        return tuple(self._handlers)
+
+    def walk(self, root: etree._Element) -> None:
+        """Walk the tree once and dispatch matching elements to their handlers."""
+        if not self._handlers:
+            return
+        for _event, element in etree.iterwalk(root, events=("start",), tag=self.tags):
+            for handler in self._handlers[element.tag]:
+                handler(element)
+
+
+def collect_elements(
+    root: etree._Element, tags: Iterable[str]
+) -> dict[str, list[etree._Element]]:
+    """Collect all elements with the given Clark tags in one pass.
+
+    Returns a mapping from tag to its elements in document order; tags that
+    do not occur map to an empty list.
+    """
+    router = ElementRouter()
+    collected: dict[str, list[etree._Element]] = {}
+    for tag in tags:
+        collected[tag] = []
+        router.register(tag, collected[tag].append)
+    router.walk(root)
+    logger.debug(
+        "Routed %d elements for %d tags",
+        sum(len(elements) for elements in collected.values()),
+        len(collected),
+    )
+    return collected
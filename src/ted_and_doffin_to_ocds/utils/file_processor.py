@@ -8,11 +8,30 @@ from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import ClassVar, Final, Self
 
-from lxml import etree
 from tqdm import tqdm
 
+from ted_and_doffin_to_ocds.utils.notice_document import EFORMS_NAMESPACES
+from ted_and_doffin_to_ocds.utils.notice_header import (
+    NoticeHeader,
+    read_notice_header,
+    read_notice_references,
+)
+from ted_and_doffin_to_ocds.utils.notice_scheduler import (
+    NoticeScheduler,
+    ScheduledNotice,
+)
+from ted_and_doffin_to_ocds.utils.snapshot_manifest import SnapshotManifest
+
 logger = logging.getLogger(__name__)
 
+# The eForms namespaces plus the default namespace of each notice type
+NOTICE_NAMESPACES: Final[dict[str, str]] = {
+    **EFORMS_NAMESPACES,
+    "pin": "urn:oasis:names:specification:ubl:schema:xsd:PriorInformationNotice-2",
+    "cn": "urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2",
+    "can": "urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2",
+}
+
 
 class UninitializedError(RuntimeError):
     """Raised when temporary directory is not initialized."""
@@ -30,15 +49,40 @@ class NoticeFileProcessor:
 
     MAX_FILE_SIZE: Final[int] = 100 * 1024 * 1024  # 100MB limit
 
-    def __init__(self, input_path: Path, output_path: Path) -> None:
-        """Initialize the processor with input and output paths."""
+    def __init__(
+        self,
+        input_path: Path,
+        output_path: Path,
+        *,
+        zero_copy: bool = False,
+        snapshot_path: Path | None = None,
+    ) -> None:
+        """Initialize the processor with input and output paths.
+
+        With zero_copy, files are read in place from input_path instead of
+        from a temporary copy. snapshot_path is the manifest used to keep a
+        consistent view of the input in that mode (see SnapshotManifest): an
+        existing manifest selects the files to process, otherwise one is
+        written for the files found.
+        """
         self.input_path = input_path
         self.output_path = output_path
+        self.zero_copy = zero_copy
+        self.snapshot_path = snapshot_path
         self.temp_dir = None
+        self.work_dir = None
+        self.snapshot: SnapshotManifest | None = None
+        self.headers: dict[Path, NoticeHeader] = {}
+        self._input_files: list[Path] | None = None
 
     def __enter__(self) -> Self:
         """Set up the context manager by creating temporary directory."""
+        if self.zero_copy:
+            self.work_dir = self.input_path
+            logger.info("Reading input files in place from %s", self.work_dir)
+            return self
         self.temp_dir = Path(tempfile.mkdtemp())
+        self.work_dir = self.temp_dir
         logger.info("Created temporary directory: %s", self.temp_dir)
         return self
 
@@ -53,70 +97,59 @@ class NoticeFileProcessor:
         Handles XML declarations, comments, and namespaces.
         """
         try:
-            # Parse the XML with lxml to handle namespaces properly
-            tree = etree.parse(str(file_path))
-            root = tree.getroot()
-
-            # Get the local name (without namespace)
-            root_tag = etree.QName(root).localname
-            logger.debug("Found root tag: %s for file %s", root_tag, file_path)
-
-            # Check for modification type in case of ContractAwardNotice
-            if root_tag == "ContractAwardNotice":
-                modification = root.xpath(
-                    "//cbc:NoticeTypeCode[@listName='cont-modif']/text()",
-                    namespaces=self.namespaces,
-                )
-                if modification and modification[0] == "can-modif":
-                    return "ContractAwardNotice-Modification"
-
-            # Verify it's one of our expected types
-            if root_tag in [
-                "PriorInformationNotice",
-                "ContractNotice",
-                "ContractAwardNotice",
-            ]:
-                return root_tag
-            logger.warning("Unexpected root tag %s in file %s", root_tag, file_path)
-            return None  # noqa: TRY300
+            header = self.get_header(file_path)
+        except Exception:
+            logger.exception("Error determining notice type for %s", file_path)
+            return None
+        return header.notice_type
+
+    def read_notice(self, file_path: Path) -> ScheduledNotice | None:
+        """Read the notice type, identifiers and references of an XML file.
 
+        The header of the file is cached so that the conversion does not need
+        to read it again (see read_notice_header); the references are read
+        from the whole file, as lots and settled contracts make them too (see
+        read_notice_references).
+        """
+        try:
+            header = self.get_header(file_path)
         except Exception:
             logger.exception("Error determining notice type for %s", file_path)
             return None
 
+        logger.debug("Found root tag: %s for file %s", header.root_tag, file_path)
+        if header.notice_type is None:
+            logger.warning(
+                "Unexpected root tag %s in file %s", header.root_tag, file_path
+            )
+            return None
+        try:
+            references = read_notice_references(file_path)
+        except Exception:
+            logger.exception("Error reading notice references of %s", file_path)
+            return None
+        return ScheduledNotice.from_header(file_path, header, references)
+
+    def get_header(self, file_path: Path) -> NoticeHeader:
+        """Get the header of an XML file, reading it on first use."""
+        header = self.headers.get(file_path)
+        if header is None:
+            header = read_notice_header(file_path)
+            self.headers[file_path] = header
+        return header
+
     @property
     def namespaces(self) -> dict[str, str]:
         """XML namespaces used in eForms."""
-        return {
-            "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-            "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-            "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-            "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-            # Add default namespaces for each notice type
-            "pin": "urn:oasis:names:specification:ubl:schema:xsd:PriorInformationNotice-2",
-            "cn": "urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2",
-            "can": "urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2",
-        }
+        return NOTICE_NAMESPACES
 
     def categorize_files(self) -> dict[str, list[Path]]:
         """Categorize files by notice type."""
-        temp_dir_error = (
-            "Temporary directory not initialized. Use with context manager."
-        )
-        if not self.temp_dir:
-            raise RuntimeError(temp_dir_error)
-
         categorized = {notice_type: [] for notice_type in self.NOTICE_ORDER}
 
-        for file_path in self.temp_dir.glob("*.xml"):
-            notice_type = self.get_notice_type(file_path)
-            if notice_type in categorized:
-                categorized[notice_type].append(file_path)
-                logger.info("Categorized %s as %s", file_path.name, notice_type)
-            else:
-                logger.warning("Unknown notice type for %s", file_path.name)
+        for notice in self.read_notices():
+            categorized[notice.notice_type].append(notice.path)
+            logger.info("Categorized %s as %s", notice.path.name, notice.notice_type)
 
         # Log summary
         for notice_type, files in categorized.items():
@@ -125,15 +158,56 @@ class NoticeFileProcessor:
 
         return categorized
 
+    def read_notices(self) -> list[ScheduledNotice]:
+        """Read every notice file of a known type among the input files."""
+        notices = []
+        for file_path in self.list_input_files():
+            notice = self.read_notice(file_path)
+            if notice and notice.notice_type in self.NOTICE_ORDER:
+                notices.append(notice)
+            else:
+                logger.warning("Unknown notice type for %s", file_path.name)
+        return notices
+
+    def get_schedule(self) -> NoticeScheduler:
+        """Get a scheduler that orders the files by their notice references."""
+        notices = self.read_notices()
+        if not notices:
+            logger.warning("No valid XML files found in any category")
+        return NoticeScheduler(notices, self.NOTICE_ORDER)
+
+    def list_input_files(self) -> list[Path]:
+        """List the XML files to process.
+
+        These are the copied files, or in zero-copy mode the files selected
+        by select_input_files().
+        """
+        temp_dir_error = (
+            "Temporary directory not initialized. Use with context manager."
+        )
+        if not self.work_dir:
+            raise RuntimeError(temp_dir_error)
+        if self._input_files is not None:
+            return list(self._input_files)
+        return sorted(self.work_dir.glob("*.xml"))
+
+    def restrict_input_files(self, files: list[Path]) -> None:
+        """Process only the given files among the input files.
+
+        Used to leave out files that need no conversion (see
+        ConversionManifest) before their headers are read.
+        """
+        self._input_files = list(files)
+
     async def categorize_files_async(self) -> dict[str, list[Path]]:
         """Async version of categorize_files."""
-        if not self.temp_dir:
+        if not self.work_dir:
             raise UninitializedError
 
         loop = asyncio.get_event_loop()
         categorized = {notice_type: [] for notice_type in self.NOTICE_ORDER}
 
-        file_paths = list(self.temp_dir.glob("*.xml"))
+        file_paths = self.list_input_files()
         tasks = [
             loop.run_in_executor(None, self.get_notice_type, file_path)
             for file_path in file_paths
@@ -146,6 +220,54 @@ class NoticeFileProcessor:
 
         return categorized
 
+    def prepare_input_files(self) -> None:
+        """Copy the input files, or select them in place in zero-copy mode."""
+        if self.zero_copy:
+            self.select_input_files()
+        else:
+            self.copy_input_files()
+
+    def select_input_files(self) -> None:
+        """Select the input files to read in place, without copying them.
+
+        Files over the size limit are skipped as when copying. If a snapshot
+        manifest path is set, an existing manifest determines the files,
+        otherwise a new manifest is written for the selected files.
+        """
+        if not self.work_dir:
+            raise UninitializedError
+
+        if self.snapshot_path and self.snapshot_path.exists():
+            self.snapshot = SnapshotManifest.load(self.snapshot_path)
+            logger.info(
+                "Using snapshot manifest %s with %d files",
+                self.snapshot_path,
+                len(self.snapshot),
+            )
+            candidates = self.snapshot.paths
+        else:
+            candidates = sorted(self.input_path.glob("*.xml"))
+
+        files = []
+        for xml_file in candidates:
+            if not xml_file.exists():
+                logger.warning("File %s in snapshot no longer exists", xml_file)
+            elif self._within_size_limit(xml_file):
+                files.append(xml_file)
+
+        if self.snapshot_path and self.snapshot is None:
+            self.snapshot = SnapshotManifest.create(files)
+            self.snapshot.write(self.snapshot_path)
+        self._input_files = files
+        logger.info("Selected %d input files in %s", len(files), self.input_path)
+
+    def _within_size_limit(self, xml_file: Path) -> bool:
+        """Check a file against MAX_FILE_SIZE, logging files that exceed it."""
+        if xml_file.stat().st_size > self.MAX_FILE_SIZE:
+            logger.warning("File %s exceeds size limit", xml_file)
+            return False
+        return True
+
     def copy_input_files(self) -> None:
         """Copy input files to temporary directory with progress tracking."""
         if not self.temp_dir:
@@ -154,8 +276,7 @@ class NoticeFileProcessor:
         files = list(self.input_path.glob("*.xml"))
         with tqdm(files, desc="Copying files") as pbar:
             for xml_file in pbar:
-                if xml_file.stat().st_size > self.MAX_FILE_SIZE:
-                    logger.warning("File %s exceeds size limit", xml_file)
+                if not self._within_size_limit(xml_file):
                     continue
 
                 try:
@@ -164,15 +285,20 @@ class NoticeFileProcessor:
                 except OSError:
                     logger.exception("Failed to copy %s", xml_file)
 
-    def get_sorted_files(self) -> list[Path]:
-        """Get files sorted in processing order."""
-        if not self.temp_dir:
+    def get_file_batches(self) -> list[list[Path]]:
+        """Get files grouped into batches in processing order.
+
+        There is one batch per notice type in NOTICE_ORDER, skipping empty
+        ones. Files within a batch do not depend on each other and may be
+        processed concurrently, but a batch must be finished before the next
+        one is started.
+        """
+        if not self.work_dir:
             raise UninitializedError
 
         categorized = self.categorize_files()
-        sorted_files = []
+        batches = []
 
-        # Add files in specified order
         for notice_type in self.NOTICE_ORDER:
             files = sorted(categorized[notice_type])
             if files:
@@ -181,16 +307,20 @@ class NoticeFileProcessor:
                     len(files),
                     notice_type,
                 )
-                sorted_files.extend(files)
+                batches.append(files)
 
-        if not sorted_files:
+        if not batches:
             logger.warning("No valid XML files found in any category")
 
-        return sorted_files
+        return batches
+
+    def get_sorted_files(self) -> list[Path]:
+        """Get files sorted in processing order."""
+        return [file_path for batch in self.get_file_batches() for file_path in batch]
 
     async def process_files_async(self) -> AsyncIterator[Path]:
         """Process files asynchronously."""
-        if not self.temp_dir:
+        if not self.work_dir:
             raise UninitializedError
 
         categorized = await self.categorize_files_async()
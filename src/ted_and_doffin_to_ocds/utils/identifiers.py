@@ -0,0 +1,43 @@
+# src/ted_and_doffin_to_ocds/utils/identifiers.py
+
+import uuid
+from typing import Final
+
+# Namespace of the name-based UUIDs minted by the converter
+ID_NAMESPACE: Final[uuid.UUID] = uuid.uuid5(
+    uuid.NAMESPACE_URL, "https://github.com/bjornjorgensen/TED-and-Doffin-to-ocds"
+)
+
+# Whether new_id() mints deterministic ids, set once per process from the
+# configuration (see use_deterministic_ids)
+_settings = {"deterministic": False}
+
+
+def use_deterministic_ids(enabled: bool = True) -> None:
+    """Switch between deterministic and random ids for this process."""
+    _settings["deterministic"] = enabled
+
+
+def deterministic_ids_enabled() -> bool:
+    """Whether new_id() mints deterministic ids in this process."""
+    return _settings["deterministic"]
+
+
+def new_id(*names: str) -> str:
+    """Return a new UUID for the object identified by names.
+
+    With deterministic ids, this is the name-based (version 5) UUID of the
+    names, so converting the same notice gives the same ids on every run and
+    every machine. names must therefore identify the object within all
+    notices: typically the notice ID, the field path (e.g. "BT-200-Contract")
+    and the IDs of the elements the object belongs to. Otherwise, it is a
+    random (version 4) UUID.
+    """
+    if _settings["deterministic"]:
+        return str(uuid.uuid5(ID_NAMESPACE, "/".join(names)))
+    return str(uuid.uuid4())
+
+
+def new_ocid(prefix: str, *names: str) -> str:
+    """Return a new OCID with the given prefix for the process named by names."""
+    return f"{prefix}-{new_id(prefix, *names)}"
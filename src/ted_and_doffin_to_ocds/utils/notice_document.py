@@ -0,0 +1,281 @@
+# src/ted_and_doffin_to_ocds/utils/notice_document.py
+
+import logging
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.element_router import collect_elements
+
+logger = logging.getLogger(__name__)
+
+EFORMS_NAMESPACES: Final[dict[str, str]] = {
+    "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
+    "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
+    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
+    "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
+    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
+    "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
+}
+
+
+def qualify(tag: str) -> str:
+    """Turn a prefixed eForms tag such as "cac:ProcurementProjectLot" into Clark notation."""
+    prefix, _, localname = tag.partition(":")
+    return f"{{{EFORMS_NAMESPACES[prefix]}}}{localname}"
+
+
+# Elements collected for every notice by a single routing pass over the tree
+ROUTED_TAGS: Final[tuple[str, ...]] = tuple(
+    qualify(tag)
+    for tag in (
+        "cac:ProcurementProjectLot",
+        "efac:LotResult",
+        "efac:LotTender",
+        "efac:SettledContract",
+        "efac:TenderingParty",
+        "efac:Organization",
+        "efac:UltimateBeneficialOwner",
+        "efac:FieldsPrivacy",
+    )
+)
+CBC_ID: Final[str] = qualify("cbc:ID")
+
+
+def _id(element: etree._Element, reference: str | None = None) -> str | None:
+    """Return the text of the first cbc:ID of an element or of one of its children.
+
+    With reference (a Clark tag), the ID of the first such child is returned,
+    e.g. the tender referenced by the efac:LotTender of a LotResult.
+    """
+    if reference is not None:
+        element = next(element.iterchildren(reference), None)
+        if element is None:
+            return None
+    id_element = next(element.iterchildren(CBC_ID), None)
+    return None if id_element is None else id_element.text
+
+
+def _reference_ids(element: etree._Element, reference: str) -> list[str]:
+    """Return the IDs of every reference child, e.g. all efac:TenderLot of a LotTender."""
+    return [
+        id_element.text
+        for child in element.iterchildren(reference)
+        for id_element in child.iterchildren(CBC_ID)
+        if id_element.text is not None
+    ]
+
+
+class NoticeIndex:
+    """Lookups between the entities of one notice, built once per notice.
+
+    Converters join lots, tenders, lot results, contracts and organizations
+    by their IDs. Instead of an XPath predicate such as
+    "//efac:LotResult[efac:SettledContract/cbc:ID=$contract_id]", which
+    scans every lot result for every contract, they look the ID up here.
+
+    Entities are keyed by the text of their cbc:ID (for organizations, the
+    cbc:ID of efac:Company/cac:PartyIdentification), whatever its schemeName.
+    If an ID occurs more than once the first element in document order wins;
+    the lists of related elements are in document order.
+    """
+
+    def __init__(self, document: "NoticeDocument") -> None:
+        self.lots: dict[str, etree._Element] = {}
+        self.parts: dict[str, etree._Element] = {}
+        self.lot_groups: dict[str, etree._Element] = {}
+        by_scheme = {"Lot": self.lots, "Part": self.parts, "LotsGroup": self.lot_groups}
+        for lot in document.elements("cac:ProcurementProjectLot"):
+            for id_element in lot.iterchildren(CBC_ID):
+                index = by_scheme.get(id_element.get("schemeName"))
+                if index is not None and id_element.text is not None:
+                    index.setdefault(id_element.text, lot)
+
+        self.organizations: dict[str, etree._Element] = {}
+        company = qualify("efac:Company")
+        party_identification = qualify("cac:PartyIdentification")
+        for organization in document.elements("efac:Organization"):
+            for company_element in organization.iterchildren(company):
+                org_id = _id(company_element, party_identification)
+                if org_id is not None:
+                    self.organizations.setdefault(org_id, organization)
+
+        lot_tender = qualify("efac:LotTender")
+        tender_lot = qualify("efac:TenderLot")
+        settled_contract = qualify("efac:SettledContract")
+
+        self.tendering_parties = self._by_id(document, "efac:TenderingParty")
+        self.lot_tenders = self._by_id(document, "efac:LotTender")
+        self.lot_results = self._by_id(document, "efac:LotResult")
+        self.settled_contracts = self._by_id(document, "efac:SettledContract")
+
+        self.tender_lots: dict[str, list[str]] = {
+            tender_id: _reference_ids(element, tender_lot)
+            for tender_id, element in self.lot_tenders.items()
+        }
+        self.result_tenders: dict[str, list[str]] = {
+            result_id: _reference_ids(element, lot_tender)
+            for result_id, element in self.lot_results.items()
+        }
+        self.tender_results: dict[str, list[etree._Element]] = {}
+        self.contract_results: dict[str, list[etree._Element]] = {}
+        for lot_result in document.elements("efac:LotResult"):
+            for tender_id in dict.fromkeys(_reference_ids(lot_result, lot_tender)):
+                self.tender_results.setdefault(tender_id, []).append(lot_result)
+            for contract_id in dict.fromkeys(
+                _reference_ids(lot_result, settled_contract)
+            ):
+                self.contract_results.setdefault(contract_id, []).append(lot_result)
+        self.tender_contracts: dict[str, list[etree._Element]] = {}
+        for contract in document.elements("efac:SettledContract", "efac:NoticeResult"):
+            for tender_id in dict.fromkeys(_reference_ids(contract, lot_tender)):
+                self.tender_contracts.setdefault(tender_id, []).append(contract)
+
+    @staticmethod
+    def _by_id(document: "NoticeDocument", tag: str) -> dict[str, etree._Element]:
+        """Index the elements of a tag that are direct children of efac:NoticeResult.
+
+        Elsewhere (e.g. the efac:LotTender of a LotResult) they are references.
+        """
+        elements: dict[str, etree._Element] = {}
+        for element in document.elements(tag, "efac:NoticeResult"):
+            element_id = _id(element)
+            if element_id is not None:
+                elements.setdefault(element_id, element)
+        return elements
+
+    def lot_results_for_contract(self, contract_id: str) -> list[etree._Element]:
+        """Return the LotResults that refer to a SettledContract."""
+        return self.contract_results.get(contract_id, [])
+
+    def lot_results_for_tender(self, tender_id: str) -> list[etree._Element]:
+        """Return the LotResults that refer to a LotTender."""
+        return self.tender_results.get(tender_id, [])
+
+    def contracts_for_tender(self, tender_id: str) -> list[etree._Element]:
+        """Return the SettledContracts that refer to a LotTender."""
+        return self.tender_contracts.get(tender_id, [])
+
+
+def build_namespace_map(root: etree._Element) -> dict[str, str]:
+    """Build the XPath namespace map for a parsed notice.
+
+    The standard eForms prefixes always win; any other prefixed namespace
+    declared on the root element is added so that XPath expressions using it
+    keep working. The default (unprefixed) namespace cannot be used in XPath
+    and is skipped.
+    """
+    namespaces = dict(EFORMS_NAMESPACES)
+    for prefix, uri in root.nsmap.items():
+        if prefix and prefix not in namespaces:
+            namespaces[prefix] = uri
+    return namespaces
+
+
+@dataclass(frozen=True)
+class NoticeDocument:
+    """A notice parsed once and shared by every BT converter.
+
+    Converters must treat the tree as read-only, since the same element
+    objects are handed to all of them.
+    """
+
+    root: etree._Element
+    namespaces: dict[str, str] = field(default_factory=lambda: dict(EFORMS_NAMESPACES))
+
+    @classmethod
+    def from_content(cls, xml_content: str | bytes) -> "NoticeDocument":
+        """Parse raw XML content into a shared notice document."""
+        if isinstance(xml_content, str):
+            xml_content = xml_content.encode("utf-8")
+        root = etree.fromstring(xml_content)
+        return cls(root=root, namespaces=build_namespace_map(root))
+
+    @cached_property
+    def _routed_elements(self) -> dict[str, list[etree._Element]]:
+        return collect_elements(self.root, ROUTED_TAGS)
+
+    def elements(self, tag: str, parent: str | None = None) -> list[etree._Element]:
+        """Return all elements with a prefixed tag, in document order.
+
+        Equivalent to the XPath "//parent/tag", or "//tag" without a parent.
+        Routed tags are served from the single pass over the tree; any other
+        tag falls back to iterating the tree.
+        """
+        clark_tag = qualify(tag)
+        elements = self._routed_elements.get(clark_tag)
+        if elements is None:
+            elements = list(self.root.iter(clark_tag))
+        if parent is None:
+            return list(elements)
+        parent_tag = qualify(parent)
+        return [
+            element
+            for element in elements
+            if (element_parent := element.getparent()) is not None
+            and element_parent.tag == parent_tag
+        ]
+
+    def procurement_project_lots(
+        self, scheme_name: str, *, top_level: bool = False
+    ) -> list[etree._Element]:
+        """Return the cac:ProcurementProjectLot elements of one ID scheme.
+
+        Equivalent to "//cac:ProcurementProjectLot[cbc:ID/@schemeName=...]",
+        or to the "/*/cac:ProcurementProjectLot[...]" form with top_level.
+        scheme_name is "Lot", "Part" or "LotsGroup".
+        """
+        return [
+            lot
+            for lot in self.elements("cac:ProcurementProjectLot")
+            if (not top_level or lot.getparent() is self.root)
+            and any(
+                lot_id.get("schemeName") == scheme_name
+                for lot_id in lot.iterchildren(CBC_ID)
+            )
+        ]
+
+    @cached_property
+    def index(self) -> NoticeIndex:
+        """The NoticeIndex of this notice, built on first use."""
+        return NoticeIndex(self)
+
+    @cached_property
+    def root_tag(self) -> str:
+        """Local name of the root element, e.g. "ContractNotice"."""
+        return etree.QName(self.root).localname
+
+    @cached_property
+    def notice_id(self) -> str:
+        """The notice's cbc:ID, or "" if missing."""
+        notice_id = self.root.findtext("cbc:ID", namespaces=self.namespaces)
+        return (notice_id or "").strip()
+
+    @cached_property
+    def notice_type_code(self) -> str:
+        """The notice's cbc:NoticeTypeCode, e.g. "cn-standard", or "" if missing."""
+        code = self.root.findtext("cbc:NoticeTypeCode", namespaces=self.namespaces)
+        return (code or "").strip()
+
+
+# Everything a converter's parse function accepts: raw XML as str or bytes
+# (kept for backward compatibility) or an already parsed NoticeDocument.
+XMLContent = str | bytes | NoticeDocument
+
+
+def get_document(xml_content: XMLContent) -> NoticeDocument:
+    """Return a NoticeDocument, parsing the content only if needed."""
+    if isinstance(xml_content, NoticeDocument):
+        return xml_content
+    return NoticeDocument.from_content(xml_content)
+
+
+def get_root(xml_content: XMLContent) -> etree._Element:
+    """Return the root element of the notice, parsing the content only if needed."""
+    if isinstance(xml_content, NoticeDocument):
+        return xml_content.root
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8")
+    return etree.fromstring(xml_content)
@@ -0,0 +1,204 @@
+# src/ted_and_doffin_to_ocds/utils/notice_header.py
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.eforms_paths import ANCHORS
+from ted_and_doffin_to_ocds.utils.notice_document import qualify
+
+logger = logging.getLogger(__name__)
+
+NOTICE_ROOT_TAGS: Final[frozenset[str]] = frozenset(
+    {"PriorInformationNotice", "ContractNotice", "ContractAwardNotice"}
+)
+CONTRACT_MODIFICATION_TYPE: Final[str] = "ContractAwardNotice-Modification"
+
+CBC_ID: Final[str] = qualify("cbc:ID")
+CBC_ISSUE_DATE: Final[str] = qualify("cbc:IssueDate")
+CBC_NOTICE_TYPE_CODE: Final[str] = qualify("cbc:NoticeTypeCode")
+CAC_NOTICE_DOCUMENT_REFERENCE: Final[str] = qualify("cac:NoticeDocumentReference")
+CAC_TENDERING_PROCESS: Final[str] = qualify("cac:TenderingProcess")
+EFBC_NOTICE_PUBLICATION_ID: Final[str] = qualify("efbc:NoticePublicationID")
+NOTICE_ID_REF: Final[str] = "notice-id-ref"
+
+# Top-level elements that follow the header in every eForms notice; reading
+# stops at the first of them.
+BODY_TAGS: Final[tuple[str, ...]] = tuple(
+    qualify(tag)
+    for tag in (
+        "cac:ProcurementProject",
+        "cac:ProcurementProjectLot",
+        "cac:TenderResult",
+    )
+)
+HEADER_CHUNK_SIZE: Final[int] = 8 * 1024
+HEADER_TAGS: Final[tuple[str, ...]] = (
+    CBC_NOTICE_TYPE_CODE,
+    CAC_TENDERING_PROCESS,
+    EFBC_NOTICE_PUBLICATION_ID,
+    *BODY_TAGS,
+)
+
+# The ancestors below the root of the cac:NoticeDocumentReference elements
+# that NoticeProcessor reads the previous notice from (the notice, its lots
+# and its settled contracts), as anchored by eforms_paths.
+REFERENCE_PARENTS: Final[frozenset[tuple[str, ...]]] = frozenset(
+    tuple(qualify(tag) for tag in parent.split("/")[2:])
+    for parent in ANCHORS["cac:NoticeDocumentReference"]
+)
+
+
+@dataclass(frozen=True)
+class NoticeHeader:
+    """Metadata from the start of a notice, read without parsing the whole file.
+
+    The notices a notice refers to are not part of the header, as lots and
+    settled contracts refer to them too (see read_notice_references).
+    """
+
+    root_tag: str
+    notice_id: str = ""
+    issue_date: str = ""
+    notice_type_code: str = ""
+    notice_type_list: str = ""
+    publication_ids: tuple[str, ...] = ()
+
+    @property
+    def notice_type(self) -> str | None:
+        """The notice type used for ordering, or None if it is not a notice."""
+        if self.root_tag not in NOTICE_ROOT_TAGS:
+            return None
+        if (
+            self.root_tag == "ContractAwardNotice"
+            and self.notice_type_list == "cont-modif"
+            and self.notice_type_code.strip() == "can-modif"
+        ):
+            return CONTRACT_MODIFICATION_TYPE
+        return self.root_tag
+
+    @property
+    def is_pin_only(self) -> bool:
+        """Whether the notice is a PIN used only for information."""
+        return (
+            self.notice_type_list == "planning" and self.notice_type_code == "pin-only"
+        )
+
+    @property
+    def identifiers(self) -> frozenset[str]:
+        """Values other notices may use to refer to this one."""
+        return frozenset(
+            value for value in (self.notice_id.strip(), *self.publication_ids) if value
+        )
+
+    def to_notice_info(self) -> dict[str, Any]:
+        """Return the notice information as extracted by XMLProcessor.extract_notice_info."""
+        return {
+            "notice_id": self.notice_id,
+            "publication_date": self.issue_date,
+            "notice_type": self.notice_type_code or "Unknown",
+            "is_pin_only": self.is_pin_only,
+        }
+
+
+def read_notice_header(source: Path | str) -> NoticeHeader:
+    """Read the header of a notice file incrementally.
+
+    The file is fed to an etree.XMLPullParser in chunks, and parsing stops at
+    the end of the top-level cac:TenderingProcess or at the first
+    cac:ProcurementProject, cac:ProcurementProjectLot or cac:TenderResult
+    child of the root, so lots and results are never read.
+    Raises etree.XMLSyntaxError if the header is not well-formed.
+    """
+    parser = etree.XMLPullParser(events=("start", "end"), tag=HEADER_TAGS)
+    values: dict[str, Any] = {"publication_ids": []}
+    root = None
+
+    with Path(source).open("rb") as xml_file:
+        while not values.get("complete"):
+            chunk = xml_file.read(HEADER_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.feed(chunk)
+            root = _read_header_events(parser, values, root)
+        if not values.get("complete"):
+            root = parser.close()
+
+    # Both precede cbc:NoticeTypeCode, so they are in the partial tree
+    header = NoticeHeader(
+        root_tag=etree.QName(root).localname,
+        notice_id=root.findtext(CBC_ID) or "",
+        issue_date=root.findtext(CBC_ISSUE_DATE) or "",
+        notice_type_code=values.get("notice_type_code", ""),
+        notice_type_list=values.get("notice_type_list", ""),
+        publication_ids=tuple(values["publication_ids"]),
+    )
+    logger.debug("Read header of %s: %s", source, header)
+    return header
+
+
+def _read_header_events(
+    parser: etree.XMLPullParser, values: dict[str, Any], root: etree._Element | None
+) -> etree._Element | None:
+    """Process the pending parser events; return the root element once known."""
+    for event, element in parser.read_events():
+        if root is None:
+            root = element.getroottree().getroot()
+        if event == "start":
+            if element.tag in BODY_TAGS and element.getparent() is root:
+                values["complete"] = True
+                break
+        elif _read_header_element(element, root, values):
+            values["complete"] = True
+            break
+    return root
+
+
+def _read_header_element(
+    element: etree._Element, root: etree._Element, values: dict[str, Any]
+) -> bool:
+    """Store the value of a header element; return True at the end of the header."""
+    tag = element.tag
+    parent = element.getparent()
+    if tag == EFBC_NOTICE_PUBLICATION_ID:
+        values["publication_ids"].append((element.text or "").strip())
+    elif parent is not root:
+        pass
+    elif tag == CBC_NOTICE_TYPE_CODE and "notice_type_code" not in values:
+        values["notice_type_code"] = element.text or ""
+        values["notice_type_list"] = element.get("listName", "")
+    elif tag == CAC_TENDERING_PROCESS:
+        return True
+    return False
+
+
+def read_notice_references(source: Path | str) -> tuple[str, ...]:
+    """Read the IDs of the notices a notice refers to, in document order.
+
+    These are the cbc:ID[@schemeName='notice-id-ref'] of the
+    cac:NoticeDocumentReference elements of the notice, of its lots and of
+    its settled contracts, the same ones NoticeProcessor looks up to reuse
+    an OCID. Unlike read_notice_header, this reads the whole file; each lot
+    is cleared once it has been read.
+    Raises etree.XMLSyntaxError if the file is not well-formed.
+    """
+    references = []
+    for _, element in etree.iterparse(
+        str(source), tag=(CAC_NOTICE_DOCUMENT_REFERENCE, *BODY_TAGS)
+    ):
+        if element.tag != CAC_NOTICE_DOCUMENT_REFERENCE:
+            if element.getparent() is element.getroottree().getroot():
+                element.clear()
+            continue
+        parents = tuple(ancestor.tag for ancestor in element.iterancestors())[-2::-1]
+        if parents in REFERENCE_PARENTS:
+            references.extend(
+                (notice_id.text or "").strip()
+                for notice_id in element.iterchildren(CBC_ID)
+                if notice_id.get("schemeName") == NOTICE_ID_REF
+            )
+    logger.debug("Read references of %s: %s", source, references)
+    return tuple(references)
@@ -0,0 +1,155 @@
+# src/ted_and_doffin_to_ocds/utils/notice_scheduler.py
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+from ted_and_doffin_to_ocds.utils.notice_header import NoticeHeader
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ScheduledNotice:
+    """A notice file together with what it is known as and what it refers to.
+
+    identifiers are the values other notices use to refer to this one (its
+    cbc:ID and its publication ID); references are the cbc:ID values of the
+    cac:NoticeDocumentReference elements of the notice, its lots and its
+    settled contracts (see read_notice_references). header is the notice header the
+    other fields were read from, if any, and is passed on to the conversion.
+    """
+
+    path: Path
+    notice_type: str
+    identifiers: frozenset[str]
+    references: frozenset[str]
+    header: NoticeHeader | None = None
+
+    @classmethod
+    def from_header(
+        cls, path: Path, header: NoticeHeader, references: Iterable[str]
+    ) -> "ScheduledNotice":
+        """Create the scheduled notice for a file from its header and references."""
+        return cls(
+            path=path,
+            notice_type=header.notice_type,
+            identifiers=header.identifiers,
+            references=frozenset(references),
+            header=header,
+        )
+
+
+class NoticeScheduler:
+    """Schedule notice files along the dependency graph of their references.
+
+    A notice that refers to another notice in the same run may only be
+    converted once the referenced notice has been converted and tracked, so
+    that it can reuse its OCID. Notices without such a dependency between
+    them can be converted concurrently, so independent procedures run fully
+    in parallel instead of in one global phase per notice type.
+
+    Usage: repeatedly take_ready() the notices that can be started and
+    mark_done() each one when it has finished, until finished is True.
+    References to notices outside the run are ignored. Should the
+    references form a cycle, the cycle is broken in notice type order.
+    """
+
+    def __init__(
+        self, notices: Iterable[ScheduledNotice], notice_order: Sequence[str]
+    ) -> None:
+        self._notices = {notice.path: notice for notice in notices}
+        rank = {notice_type: index for index, notice_type in enumerate(notice_order)}
+        self._sort_key = {
+            path: (rank.get(notice.notice_type, len(rank)), path)
+            for path, notice in self._notices.items()
+        }
+
+        providers: dict[str, list[Path]] = {}
+        for path, notice in self._notices.items():
+            for identifier in notice.identifiers:
+                providers.setdefault(identifier, []).append(path)
+
+        self._dependencies: dict[Path, set[Path]] = {}
+        self._dependents: dict[Path, list[Path]] = {path: [] for path in self._notices}
+        for path, notice in self._notices.items():
+            dependencies = {
+                provider
+                for reference in notice.references
+                for provider in providers.get(reference, ())
+                if provider != path
+            }
+            self._dependencies[path] = dependencies
+            for dependency in dependencies:
+                self._dependents[dependency].append(path)
+
+        self._pending = set(self._notices)
+        self._running: set[Path] = set()
+        logger.info(
+            "Scheduled %d notices with %d dependencies in %d independent chains",
+            len(self._notices),
+            sum(len(deps) for deps in self._dependencies.values()),
+            self.chain_count,
+        )
+
+    def __len__(self) -> int:
+        return len(self._notices)
+
+    @property
+    def finished(self) -> bool:
+        """Whether every notice has been taken and marked as done."""
+        return not self._pending and not self._running
+
+    @property
+    def chain_count(self) -> int:
+        """Number of groups of notices that are linked by references."""
+        parent = {path: path for path in self._notices}
+
+        def find(path: Path) -> Path:
+            while parent[path] != path:
+                parent[path] = parent[parent[path]]
+                path = parent[path]
+            return path
+
+        for path, dependencies in self._dependencies.items():
+            for dependency in dependencies:
+                parent[find(path)] = find(dependency)
+        return len({find(path) for path in self._notices})
+
+    def get_notice(self, path: Path) -> ScheduledNotice:
+        """The scheduled notice of a file."""
+        return self._notices[path]
+
+    def dependencies(self, path: Path) -> frozenset[Path]:
+        """The notices in this run that must be converted before the given one."""
+        return frozenset(self._dependencies[path])
+
+    def take_ready(self) -> list[Path]:
+        """Take the notices whose dependencies are all done.
+
+        The notices are returned in notice type order and then by path, and
+        are considered running until mark_done() is called for them.
+        """
+        ready = sorted(
+            (path for path in self._pending if not self._dependencies[path]),
+            key=self._sort_key.__getitem__,
+        )
+        if not ready and not self._running and self._pending:
+            # Only possible with circular references
+            path = min(self._pending, key=self._sort_key.__getitem__)
+            logger.warning(
+                "Circular notice references, converting %s before %d of its dependencies",
+                path.name,
+                len(self._dependencies[path]),
+            )
+            ready = [path]
+        self._pending.difference_update(ready)
+        self._running.update(ready)
+        return ready
+
+    def mark_done(self, path: Path) -> None:
+        """Mark a running notice as done, whether it succeeded or failed."""
+        self._running.discard(path)
+        for dependent in self._dependents[path]:
+            self._dependencies[dependent].discard(path)
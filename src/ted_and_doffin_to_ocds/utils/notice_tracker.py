@@ -1,26 +1,257 @@
 # converters/notice_tracker.py
 
 import logging
+import queue
 import sqlite3
 import threading
-from collections.abc import Generator
+import time
+import weakref
+from collections import Counter
+from collections.abc import Generator, Hashable
 from contextlib import contextmanager, suppress
 from datetime import UTC, datetime
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
 from typing import Final
 
 logger = logging.getLogger(__name__)
 
+# Writes are committed once this many are queued, or once the oldest
+# uncommitted write is this many seconds old
+BATCH_SIZE: Final[int] = 500
+BATCH_INTERVAL: Final[float] = 0.5
+
+# Seconds a connection waits for another connection's lock to be released
+BUSY_TIMEOUT: Final[float] = 30.0
+
+PRAGMAS: Final[tuple[str, ...]] = (
+    # Readers and the writer no longer block each other, and a commit is an
+    # append to the write-ahead log instead of a rewrite of the database
+    "PRAGMA journal_mode = WAL",
+    # In WAL mode, only checkpoints wait for the disk. A crash can lose the
+    # last commits, but never corrupts the database.
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -16000",
+)
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    """Open a connection to the notice database, with the tracker's pragmas."""
+    conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, check_same_thread=False)
+    for pragma in PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+class _Flush:
+    """A queue marker, set once every write queued before it is committed."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+_STOP: Final = object()
+
+
+class NoticeWriter:
+    """Write to the notice database from a single thread.
+
+    Writes are queued as (statement, parameters, key) and executed by the
+    writer thread in batches: runs of the same statement are executed with
+    executemany(), and a batch is committed once it holds batch_size writes
+    or its oldest write is batch_interval seconds old. The key names what a
+    write changes, such as the parts of a notice, so that readers can check
+    whether they must wait for it to be committed. The thread is started on
+    the first write, and stopped by close().
+
+    A batch that fails to commit is rolled back, and its error is raised to
+    every thread that queued a write of it, by its next write(), flush() or
+    close(), as well as to every flush() for one of its keys.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = BATCH_SIZE,
+        batch_interval: float = BATCH_INTERVAL,
+    ) -> None:
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._pending: Counter[Hashable] = Counter()
+        # The error of the last failed batch, by key and by writing thread
+        self._failed: dict[Hashable, Exception] = {}
+        self._errors: dict[int, Exception] = {}
+        self._thread: threading.Thread | None = None
+        self._error: Exception | None = None
+
+    def write(self, statement: str, parameters: tuple, key: Hashable) -> None:
+        """Queue a write.
+
+        The writer's connection is opened by the first write, so that a
+        database that cannot be opened fails the write.
+        """
+        self._raise_error()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(connect(self.db_path),),
+                    name="notice-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+            self._check_alive(self._thread)
+            self._pending[key] += 1
+            self._queue.put((statement, parameters, key, threading.get_ident()))
+
+    def is_pending(self, key: Hashable) -> bool:
+        """Whether a write of key is queued, or failed, and not yet committed."""
+        with self._lock:
+            return key in self._pending or key in self._failed
+
+    def flush(self, key: Hashable | None = None) -> None:
+        """Wait until every queued write is committed.
+
+        Raises the error of any batch with a write of this thread that failed
+        to commit since its last flush, or of the last failed write of key.
+        """
+        with self._lock:
+            thread = self._thread
+            marker = _Flush()
+            if thread is not None:
+                self._queue.put(marker)
+        while thread is not None and not marker.done.wait(self.batch_interval):
+            self._check_alive(thread)
+        self._raise_error()
+        with self._lock:
+            error = self._failed.get(key)
+        if error is not None:
+            raise error
+
+    def close(self) -> None:
+        """Commit every queued write and stop the writer thread.
+
+        Raises the error of any failed batch that was not raised yet.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(_STOP)
+        if thread is not None:
+            thread.join()
+        with self._lock:
+            errors, self._errors = self._errors, {}
+            error, self._error = self._error, None
+        if error is None and errors:
+            error = next(iter(errors.values()))
+        if error is not None:
+            raise error
+
+    def _check_alive(self, thread: threading.Thread) -> None:
+        if not thread.is_alive():
+            if self._error is not None:
+                raise self._error
+            msg = "The notice writer thread stopped"
+            raise RuntimeError(msg)
+
+    def _raise_error(self) -> None:
+        with self._lock:
+            error = self._errors.pop(threading.get_ident(), None)
+        if error is not None:
+            raise error
+
+    def _run(self, conn: sqlite3.Connection) -> None:
+        batch: list[tuple[str, tuple, Hashable, int]] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = max(deadline - time.monotonic(), 0) if batch else None
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    self._commit(conn, batch)
+                    continue
+                if item is _STOP:
+                    self._commit(conn, batch)
+                    return
+                if isinstance(item, _Flush):
+                    self._commit(conn, batch)
+                    item.done.set()
+                    continue
+                if not batch:
+                    deadline = time.monotonic() + self.batch_interval
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    self._commit(conn, batch)
+        except Exception as e:
+            logger.exception("The notice writer thread stopped")
+            self._error = e
+            raise
+        finally:
+            conn.close()
+
+    def _commit(
+        self, conn: sqlite3.Connection, batch: list[tuple[str, tuple, Hashable, int]]
+    ) -> None:
+        if not batch:
+            return
+        error = None
+        try:
+            for statement, writes in groupby(batch, key=itemgetter(0)):
+                conn.executemany(statement, [write[1] for write in writes])
+            conn.commit()
+            logger.debug("Committed %d notice database writes", len(batch))
+        except sqlite3.Error as e:
+            conn.rollback()
+            logger.exception("Failed to commit %d notice database writes", len(batch))
+            error = e
+        finally:
+            with self._lock:
+                for _, _, key, writer in batch:
+                    # The write is no longer queued; a failed write is kept
+                    # as failed until a later write of its key commits
+                    self._pending[key] -= 1
+                    if error is None:
+                        self._failed.pop(key, None)
+                    else:
+                        self._failed[key] = error
+                        self._errors[writer] = error
+                self._pending = +self._pending
+            batch.clear()
+
 
 class NoticeTracker:
-    """Thread-safe SQLite connection manager for notice tracking."""
+    """Thread-safe SQLite connection manager for notice tracking.
+
+    Reads use a connection per thread. Writes are queued and committed in
+    batches by a NoticeWriter; reads of a notice wait for its queued writes
+    to be committed first, and flush() or close() commit every write.
+
+    Callers must close() the tracker once they are done with it. Writes that
+    are still queued are otherwise only committed when the tracker is
+    garbage collected or the interpreter exits, and are lost if the process
+    ends without running exit handlers, as pool worker processes do.
+    """
 
     MAX_WORKERS: Final[int] = 4
+    OCID_REQUIRED_MESSAGE: Final[str] = "OCID is required to track a notice"
 
-    def __init__(self, db_path: str = "notices.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "notices.db",
+        batch_size: int = BATCH_SIZE,
+        batch_interval: float = BATCH_INTERVAL,
+    ) -> None:
         """Initialize the notice tracker."""
         self.db_path = db_path
         self._local = threading.local()
+        self.writer = NoticeWriter(db_path, batch_size, batch_interval)
+        weakref.finalize(self, self.writer.close)
 
         # Initialize database and verify schema
         self._init_db()
@@ -42,7 +273,7 @@ class NoticeTracker:
 
     def _init_db_connection(self) -> sqlite3.Connection:
         """Initialize a new database connection."""
-        conn = sqlite3.connect(self.db_path)
+        conn = connect(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
@@ -64,6 +295,19 @@ class NoticeTracker:
             conn.rollback()
             raise
 
+    def flush(self) -> None:
+        """Commit every queued write."""
+        self.writer.flush()
+
+    def close(self) -> None:
+        """Commit every queued write and stop the writer thread."""
+        self.writer.close()
+
+    def _sync(self, key: Hashable) -> None:
+        """Wait for queued writes of key to be committed, for a read of key."""
+        if self.writer.is_pending(key):
+            self.writer.flush(key)
+
     def __del__(self) -> None:
         """Clean up connections on deletion."""
         if hasattr(self._local, "connection"):
@@ -98,7 +342,7 @@ class NoticeTracker:
 
     def init_db(self) -> None:
         """Create the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with connect(self.db_path) as conn:
             cursor = conn.cursor()
 
             # Create tables if they don't exist
@@ -191,55 +435,42 @@ class NoticeTracker:
             raise ValueError(self.OCID_REQUIRED_MESSAGE)
 
         current_time = self.get_current_time()
-
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            try:
-                cursor.execute(
-                    """
-                    INSERT INTO notices (
-                        notice_id, ocid, notice_type, is_pin_only,
-                        publication_date, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    ON CONFLICT(notice_id) DO UPDATE SET
-                        ocid = excluded.ocid,
-                        notice_type = excluded.notice_type,
-                        is_pin_only = excluded.is_pin_only,
-                        publication_date = excluded.publication_date,
-                        updated_at = excluded.updated_at
-                """,
-                    (
-                        notice_id,
-                        ocid,
-                        notice_type,
-                        is_pin_only,
-                        publication_date,
-                        current_time,
-                        current_time,
-                    ),
-                )
-                conn.commit()
-                logger.info(
-                    "Successfully tracked notice: %s with OCID: %s", notice_id, ocid
-                )
-            except Exception:
-                logger.exception("Error tracking notice %s", notice_id)
-                raise
+        self.writer.write(
+            """
+            INSERT INTO notices (
+                notice_id, ocid, notice_type, is_pin_only,
+                publication_date, created_at, updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(notice_id) DO UPDATE SET
+                ocid = excluded.ocid,
+                notice_type = excluded.notice_type,
+                is_pin_only = excluded.is_pin_only,
+                publication_date = excluded.publication_date,
+                updated_at = excluded.updated_at
+            """,
+            (
+                notice_id,
+                ocid,
+                notice_type,
+                is_pin_only,
+                publication_date,
+                current_time,
+                current_time,
+            ),
+            ("notices", notice_id),
+        )
+        logger.info("Tracking notice: %s with OCID: %s", notice_id, ocid)
 
     def track_part(self, notice_id: str, part_id: str, ocid: str) -> None:
         """Track a part from a PIN-only notice."""
-        current_time = self.get_current_time()
-
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO parts (notice_id, part_id, ocid, created_at)
-                VALUES (?, ?, ?, ?)
+        self.writer.write(
+            """
+            INSERT INTO parts (notice_id, part_id, ocid, created_at)
+            VALUES (?, ?, ?, ?)
             """,
-                (notice_id, part_id, ocid, current_time),
-            )
-            conn.commit()
+            (notice_id, part_id, ocid, self.get_current_time()),
+            ("parts", notice_id),
+        )
 
     def track_related_process(
         self,
@@ -249,26 +480,22 @@ class NoticeTracker:
         scheme: str,
     ) -> None:
         """Track a relationship between notices."""
-        current_time = self.get_current_time()
-
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO related_processes (
-                    source_notice_id, target_notice_id,
-                    relationship_type, scheme, created_at
-                ) VALUES (?, ?, ?, ?, ?)
+        self.writer.write(
+            """
+            INSERT INTO related_processes (
+                source_notice_id, target_notice_id,
+                relationship_type, scheme, created_at
+            ) VALUES (?, ?, ?, ?, ?)
             """,
-                (
-                    source_notice_id,
-                    target_notice_id,
-                    relationship_type,
-                    scheme,
-                    current_time,
-                ),
-            )
-            conn.commit()
+            (
+                source_notice_id,
+                target_notice_id,
+                relationship_type,
+                scheme,
+                self.get_current_time(),
+            ),
+            ("related_processes", source_notice_id),
+        )
 
     def get_previous_notice(self, notice_id: str) -> tuple | None:
         """Get the notice details for a specific notice ID with improved error handling.
@@ -281,6 +508,7 @@ class NoticeTracker:
             or None if not found
 
         """
+        self._sync(("notices", notice_id))
         with self.get_connection() as conn:
             cursor = conn.cursor()
             try:
@@ -315,6 +543,7 @@ class NoticeTracker:
             dict: Statistics including counts of notices, parts, and relationships
 
         """
+        self.flush()
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
@@ -340,6 +569,7 @@ class NoticeTracker:
 
     def get_notice_parts(self, notice_id: str) -> list[tuple]:
         """Get all parts associated with a notice."""
+        self._sync(("parts", notice_id))
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -355,6 +585,7 @@ class NoticeTracker:
 
     def get_related_processes(self, notice_id: str) -> list[tuple]:
         """Get all related processes for a notice."""
+        self._sync(("related_processes", notice_id))
         with self.get_connection() as conn:
             cursor = conn.cursor()
             cursor.execute(
@@ -0,0 +1,301 @@
+# src/ted_and_doffin_to_ocds/utils/output_sinks.py
+
+import json
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any, BinaryIO, ClassVar, Final, Self
+
+from .config import Config
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_FORMATS: Final[tuple[str, ...]] = ("files", "jsonl", "package")
+OCDS_VERSION: Final[str] = "1.1"
+
+# Writes are collected in memory and written to the file in blocks of at
+# least this many bytes
+BUFFER_SIZE: Final[int] = 1024 * 1024
+
+# Suffix of output files while they are written. They get their final name
+# once complete, so a run that is killed never leaves a truncated output file
+# under a final name.
+PARTIAL_SUFFIX: Final[str] = ".partial"
+
+
+def partial_path(path: Path) -> Path:
+    """The path an output file is written to before it is complete."""
+    return path.with_name(path.name + PARTIAL_SUFFIX)
+
+
+class OutputSink(ABC):
+    """Where the releases of converted notices are written.
+
+    Sinks may be shared by the worker threads of a run, so write() must be
+    thread-safe. close() must be called once the run is over.
+    """
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @abstractmethod
+    def write(
+        self,
+        input_path: Path,
+        output_folder: Path,
+        releases: Sequence[dict[str, Any]],
+    ) -> list[Path]:
+        """Write the releases converted from input_path.
+
+        Returns the files the releases were written to.
+        """
+
+    def close(self) -> None:  # noqa: B027
+        """Flush and close any open output file."""
+
+
+class ReleaseFileSink(OutputSink):
+    """Write each release to its own {stem}_release_{i}.json file.
+
+    Each file is written under a temporary name and then renamed.
+    """
+
+    def write(
+        self,
+        input_path: Path,
+        output_folder: Path,
+        releases: Sequence[dict[str, Any]],
+    ) -> list[Path]:
+        output_files = []
+        for i, release in enumerate(releases):
+            output_file = output_folder / f"{input_path.stem}_release_{i}.json"
+            logger.debug("Writing to output file: %s", output_file)
+            temp_file = partial_path(output_file)
+            with temp_file.open("w", encoding="utf-8") as f:
+                json.dump(release, f, ensure_ascii=False)
+            temp_file.replace(output_file)
+            output_files.append(output_file)
+        return output_files
+
+
+class RotatingSink(OutputSink):
+    """Stream releases into a series of numbered files.
+
+    Releases are written to {stem}-00000{suffix}, {stem}-00001{suffix}, ...
+    in the output folder of the write that opens each file, skipping numbers
+    of files that already exist there. A new file is started once the
+    current one holds max_releases releases or would grow beyond max_bytes.
+    Writes are buffered in blocks of buffer_size bytes. Each file is written
+    under a {PARTIAL_SUFFIX} name and renamed once it is closed, so the
+    releases of a file only appear under its final name once it is complete.
+    """
+
+    suffix: ClassVar[str]
+
+    def __init__(
+        self,
+        stem: str = "releases",
+        max_releases: int = 10_000,
+        max_bytes: int | None = None,
+        buffer_size: int = BUFFER_SIZE,
+    ) -> None:
+        self.stem = stem
+        self.max_releases = max_releases
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        self.paths: list[Path] = []
+        self._next_index = 0
+        self._lock = threading.Lock()
+        self._file: BinaryIO | None = None
+        self._buffer: list[bytes] = []
+        self._buffered = 0
+        self._file_releases = 0
+        self._file_bytes = 0
+
+    def write(
+        self,
+        input_path: Path,
+        output_folder: Path,
+        releases: Sequence[dict[str, Any]],
+    ) -> list[Path]:
+        records = [
+            json.dumps(release, ensure_ascii=False).encode("utf-8")
+            for release in releases
+        ]
+        output_files: list[Path] = []
+        with self._lock:
+            for record in records:
+                if self._file is not None and self._is_full(len(record)):
+                    self._close_file()
+                if self._file is None:
+                    self._open_file(output_folder)
+                if self.paths[-1] not in output_files:
+                    output_files.append(self.paths[-1])
+                self._append(self._frame(record))
+                self._file_releases += 1
+        logger.debug("Wrote %d releases of %s", len(records), input_path)
+        return output_files
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._close_file()
+
+    def _is_full(self, record_size: int) -> bool:
+        if self._file_releases >= self.max_releases:
+            return True
+        return (
+            self.max_bytes is not None
+            and self._file_bytes + record_size > self.max_bytes
+        )
+
+    def _open_file(self, output_folder: Path) -> None:
+        path = self._path(output_folder)
+        while path.exists():
+            path = self._path(output_folder)
+        logger.info("Writing releases to %s", path)
+        self._file = partial_path(path).open("wb")
+        self.paths.append(path)
+        self._file_releases = 0
+        self._file_bytes = 0
+        self._append(self._header(path))
+
+    def _path(self, output_folder: Path) -> Path:
+        path = output_folder / f"{self.stem}-{self._next_index:05d}{self.suffix}"
+        self._next_index += 1
+        return path
+
+    def _close_file(self) -> None:
+        self._append(self._footer())
+        self._flush()
+        self._file.close()
+        self._file = None
+        path = self.paths[-1]
+        partial_path(path).replace(path)
+
+    def _append(self, data: bytes) -> None:
+        self._buffer.append(data)
+        self._buffered += len(data)
+        self._file_bytes += len(data)
+        if self._buffered >= self.buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._file.write(b"".join(self._buffer))
+        self._buffer.clear()
+        self._buffered = 0
+
+    def _header(self, path: Path) -> bytes:  # noqa: ARG002
+        return b""
+
+    @abstractmethod
+    def _frame(self, record: bytes) -> bytes:
+        """Return a release as it is written to the current file."""
+
+    def _footer(self) -> bytes:
+        return b""
+
+
+class JsonLinesSink(RotatingSink):
+    """Write releases as JSON Lines, one release per line."""
+
+    suffix = ".jsonl"
+
+    def _frame(self, record: bytes) -> bytes:
+        return record + b"\n"
+
+
+class ReleasePackageSink(RotatingSink):
+    """Write releases as OCDS release packages.
+
+    Each file is one release package, with the publisher's metadata, the
+    file's URI and the time the file was started.
+    """
+
+    suffix = ".json"
+
+    def __init__(self, publisher: dict[str, str], **kwargs: Any) -> None:  # noqa: ANN401
+        super().__init__(**kwargs)
+        self.publisher = publisher
+
+    def _header(self, path: Path) -> bytes:
+        package = {
+            "uri": path.resolve().as_uri(),
+            "version": OCDS_VERSION,
+            "publishedDate": datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "publisher": self.publisher,
+        }
+        # The releases array is streamed in after the package metadata
+        return json.dumps(package, ensure_ascii=False).encode("utf-8")[:-1] + (
+            b', "releases": ['
+        )
+
+    def _frame(self, record: bytes) -> bytes:
+        return record if self._file_releases == 0 else b"," + record
+
+    def _footer(self) -> bytes:
+        return b"]}\n"
+
+
+def prepare_output_folder(config: Config, stem: str = "releases") -> None:
+    """Remove the output files of earlier runs that this run replaces.
+
+    Streaming sinks number their files after the ones already in the output
+    folder, so a run that is not resumed first removes the files of earlier
+    runs, whatever process wrote them ({stem}-00000, {stem}-1234-00000, ...);
+    otherwise their releases would be written a second time. A resumed run
+    keeps them and adds its releases in new files.
+
+    Files left under a {PARTIAL_SUFFIX} name by a run that was killed are
+    always removed. Their releases were never complete, and the input files
+    they came from are converted again since their output files do not exist.
+    Must be called before any sink of the run writes to the output folder.
+    """
+    output_folder = config.output_folder
+    for path in output_folder.glob(f"*{PARTIAL_SUFFIX}"):
+        logger.info("Removing partial output file %s", path)
+        path.unlink()
+    if config.output_format == "files" or config.resume:
+        return
+    suffix = {"jsonl": JsonLinesSink.suffix, "package": ReleasePackageSink.suffix}[
+        config.output_format
+    ]
+    pattern = re.compile(rf"{re.escape(stem)}(?:-\d+)?-\d{{5}}{re.escape(suffix)}")
+    for path in output_folder.glob(f"{stem}-*{suffix}"):
+        if pattern.fullmatch(path.name):
+            logger.info("Removing output file %s of an earlier run", path)
+            path.unlink()
+
+
+def create_sink(config: Config, stem: str = "releases") -> OutputSink:
+    """Create the output sink selected by the configuration.
+
+    stem names the files of streaming sinks; processes that write to the
+    same output folder at the same time must use different stems.
+    """
+    if config.output_format == "files":
+        return ReleaseFileSink()
+    rotation = {
+        "stem": stem,
+        "max_releases": config.rotate_releases,
+        "max_bytes": config.rotate_bytes,
+    }
+    if config.output_format == "jsonl":
+        return JsonLinesSink(**rotation)
+    if config.output_format == "package":
+        return ReleasePackageSink({"name": config.publisher_name}, **rotation)
+    msg = f"Unknown output format: {config.output_format}"
+    raise ValueError(msg)
@@ -0,0 +1,125 @@
+# src/ted_and_doffin_to_ocds/utils/release_builder.py
+
+import threading
+from collections.abc import Hashable
+from types import TracebackType
+from typing import Any, Self
+
+_state = threading.local()
+
+
+class _IdIndex:
+    """An id→object index over one array of a release.
+
+    The converters mostly append to the arrays, so the index is extended with
+    the items added since the last lookup. Each entry keeps the position of
+    its item: a hit whose item is no longer at that position or no longer has
+    that id (an item was replaced, removed or changed in place) rebuilds the
+    index, as does an array that shrank or whose last indexed item was
+    replaced.
+    """
+
+    def __init__(self, items: list[dict[str, Any]]) -> None:
+        self.items = items
+        self.by_id: dict[Hashable, tuple[int, dict[str, Any]]] = {}
+        self.size = 0
+        self.last: dict[str, Any] | None = None
+
+    def refresh(self) -> None:
+        """Index the items appended since the last refresh."""
+        items = self.items
+        if len(items) < self.size or (
+            self.size and items[self.size - 1] is not self.last
+        ):
+            self.rebuild()
+        for position in range(self.size, len(items)):
+            item = items[position]
+            # next() returns the first match, so the first item with an id wins
+            self.by_id.setdefault(item.get("id"), (position, item))
+        self.size = len(items)
+        self.last = items[-1] if items else None
+
+    def rebuild(self) -> None:
+        self.by_id.clear()
+        self.size = 0
+
+    def get(self, item_id: Hashable) -> dict[str, Any] | None:
+        self.refresh()
+        entry = self.by_id.get(item_id)
+        if entry is None:
+            return None
+        position, item = entry
+        if self.items[position] is not item or item.get("id") != item_id:
+            self.rebuild()
+            self.refresh()
+            entry = self.by_id.get(item_id)
+            return None if entry is None else entry[1]
+        return item
+
+
+class ReleaseBuilder:
+    """Keeps id→object indexes for the arrays of a release while it is built.
+
+    Converters merge into plain dicts and lists (parties, tender.lots,
+    tender.lotGroups, bids.details, awards, contracts, statistics, ...) and
+    look items up with find_by_id(). While a builder is active in the
+    current thread, each array gets an index the first time it is searched,
+    so a lookup costs O(1) instead of a scan of the whole array. The release
+    itself is never wrapped, so plain dicts come out at the end.
+
+        with ReleaseBuilder(release_json):
+            process_bt_sections(release_json, document)
+    """
+
+    def __init__(self, release: dict[str, Any]) -> None:
+        self.release = release
+        self._indexes: dict[int, _IdIndex] = {}
+        self._previous: ReleaseBuilder | None = None
+
+    def __enter__(self) -> Self:
+        self._previous = getattr(_state, "builder", None)
+        _state.builder = self
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        _state.builder = self._previous
+        self._previous = None
+        self._indexes.clear()
+
+    def find_by_id(
+        self, items: list[dict[str, Any]], item_id: Hashable
+    ) -> dict[str, Any] | None:
+        """Return the first item of items whose "id" equals item_id."""
+        # The index keeps a reference to the array, so its id() is not reused
+        index = self._indexes.get(id(items))
+        if index is None or index.items is not items:
+            index = self._indexes[id(items)] = _IdIndex(items)
+        try:
+            return index.get(item_id)
+        except TypeError:
+            # Unhashable ids cannot be indexed
+            return _scan_by_id(items, item_id)
+
+
+def _scan_by_id(
+    items: list[dict[str, Any]], item_id: Hashable
+) -> dict[str, Any] | None:
+    return next((item for item in items if item.get("id") == item_id), None)
+
+
+def find_by_id(items: list[dict[str, Any]], item_id: Hashable) -> dict[str, Any] | None:
+    """Return the first item of items whose "id" equals item_id, or None.
+
+    Uses the indexes of the active ReleaseBuilder, and falls back to a linear
+    scan when no builder is active (e.g. when a merge function is called on
+    its own).
+    """
+    builder = getattr(_state, "builder", None)
+    if builder is None:
+        return _scan_by_id(items, item_id)
+    return builder.find_by_id(items, item_id)
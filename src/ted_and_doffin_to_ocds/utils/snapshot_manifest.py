@@ -0,0 +1,104 @@
+# src/ted_and_doffin_to_ocds/utils/snapshot_manifest.py
+
+import hashlib
+import json
+import logging
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Final, Self
+
+logger = logging.getLogger(__name__)
+
+HASH_ALGORITHM: Final[str] = "sha256"
+
+
+def file_digest(file_path: Path) -> str:
+    """Return the HASH_ALGORITHM hex digest of a file's content."""
+    with file_path.open("rb") as f:
+        return hashlib.file_digest(f, HASH_ALGORITHM).hexdigest()
+
+
+class SnapshotMismatchError(RuntimeError):
+    """Raised when an input file no longer matches the snapshot manifest."""
+
+
+@dataclass(frozen=True)
+class SnapshotEntry:
+    """The recorded state of one input file."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+
+
+class SnapshotManifest:
+    """A record of the input files of a run, used instead of copying them.
+
+    The manifest lists the path, size, modification time and hash of every
+    input file when the run starts. Files are read directly from the input
+    directory, and each file is checked against its entry when it is read,
+    so a file that changes during the run is reported instead of being
+    converted in an inconsistent state.
+    """
+
+    def __init__(self, entries: Iterable[SnapshotEntry]) -> None:
+        self.entries = {entry.path: entry for entry in entries}
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @property
+    def paths(self) -> list[Path]:
+        """The files in the snapshot, in the order they were recorded."""
+        return [Path(path) for path in self.entries]
+
+    @classmethod
+    def create(cls, files: Iterable[Path]) -> Self:
+        """Record the current state of the given files."""
+        entries = []
+        for file_path in files:
+            stat = file_path.stat()
+            entries.append(
+                SnapshotEntry(
+                    path=str(file_path),
+                    size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    sha256=file_digest(file_path),
+                )
+            )
+        logger.info("Created snapshot of %d input files", len(entries))
+        return cls(entries)
+
+    @classmethod
+    def load(cls, manifest_path: Path) -> Self:
+        """Load a manifest written by write()."""
+        with manifest_path.open(encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(SnapshotEntry(**entry) for entry in data["files"])
+
+    def write(self, manifest_path: Path) -> None:
+        """Write the manifest as JSON."""
+        data = {
+            "hash_algorithm": HASH_ALGORITHM,
+            "files": [asdict(entry) for entry in self.entries.values()],
+        }
+        with manifest_path.open("w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        logger.info("Wrote snapshot manifest to %s", manifest_path)
+
+    def verify(self, file_path: Path, content: bytes) -> None:
+        """Check that the content read from a file matches its snapshot entry.
+
+        Files that are not in the snapshot are not checked.
+        """
+        entry = self.entries.get(str(file_path))
+        if entry is None:
+            return
+        if len(content) != entry.size:
+            msg = f"{file_path} changed since the snapshot: size {len(content)} != {entry.size}"
+            raise SnapshotMismatchError(msg)
+        if hashlib.new(HASH_ALGORITHM, content).hexdigest() != entry.sha256:
+            msg = f"{file_path} changed since the snapshot: content hash differs"
+            raise SnapshotMismatchError(msg)
@@ -7,9 +7,53 @@ from typing import Any, Final
 from lxml import etree
 from lxml.etree import ElementBase, _Element  # Import types explicitly
 
+from ted_and_doffin_to_ocds.utils.notice_document import EFORMS_NAMESPACES
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import register_xpath
+
 logger = logging.getLogger(__name__)
 
 
+XPATH_PLANNING_NOTICE_TYPE = register_xpath(
+    "xml_processor.XPATH_PLANNING_NOTICE_TYPE",
+    "string(/*/cbc:NoticeTypeCode[@listName='planning'])",
+)
+XPATH_PREVIOUS_PUBLICATION_IDS = register_xpath(
+    "xml_processor.XPATH_PREVIOUS_PUBLICATION_IDS",
+    "//cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
+)
+XPATH_NOTICE_PARTS = register_xpath(
+    "xml_processor.XPATH_NOTICE_PARTS",
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
+)
+XPATH_IS_FRAMEWORK = register_xpath(
+    "xml_processor.XPATH_IS_FRAMEWORK",
+    "boolean("
+    "/*/cac:ProcurementProject//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='framework-agreement'] | "
+    "/*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='framework-agreement'])",
+)
+XPATH_IS_DPS = register_xpath(
+    "xml_processor.XPATH_IS_DPS",
+    "boolean("
+    "/*/cac:ProcurementProject//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='dps'] | "
+    "/*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode"
+    "[@listName='contract-nature' and text()='dps'] | "
+    "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/cac:TenderingProcess"
+    "/cac:ContractingSystem[cbc:ContractingSystemTypeCode/@listName='dps-usage']"
+    "/cbc:ContractingSystemTypeCode[text()!='none'])",
+)
+XPATH_PART_NOTICE_REFERENCES = register_xpath(
+    "xml_processor.XPATH_PART_NOTICE_REFERENCES", ".//cac:NoticeDocumentReference"
+)
+XPATH_ID_STRING = register_xpath("xml_processor.XPATH_ID_STRING", "string(cbc:ID)")
+XPATH_REFERENCED_PART_ID = register_xpath(
+    "xml_processor.XPATH_REFERENCED_PART_ID",
+    "string(cbc:ReferencedDocumentInternalAddress)",
+)
+
+
 @dataclass(frozen=True)
 class XMLError:
     """XML processing error messages."""
@@ -28,21 +72,18 @@ class XMLProcessor:
     @property
     def namespaces(self) -> dict[str, str]:
         """XML namespaces used in eForms."""
-        return {
-            "cac": "urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2",
-            "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
-            "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
-            "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
-            "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
-            "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
-        }
+        return EFORMS_NAMESPACES
 
-    def parse_xml(self, content: str | bytes) -> etree._Element:
-        """Parse XML content into an element tree."""
+    def check_size(self, content: str | bytes) -> None:
+        """Reject XML content beyond the size limit before it is parsed."""
         if len(content) > self.MAX_XML_SIZE:
             error_msg = f"XML content exceeds {self.MAX_XML_SIZE} bytes limit"
             raise ValueError(error_msg)
 
+    def parse_xml(self, content: str | bytes) -> etree._Element:
+        """Parse XML content into an element tree."""
+        self.check_size(content)
+
         if isinstance(content, str):
             content = content.encode("utf-8")
 
@@ -92,55 +133,28 @@ class XMLProcessor:
 
     def is_pin_only(self, tree: etree._Element) -> bool:
         """Check if notice is a PIN used only for information."""
-        notice_type = tree.xpath(
-            "string(/*/cbc:NoticeTypeCode[@listName='planning'])",
-            namespaces=self.namespaces,
-        )
+        notice_type = XPATH_PLANNING_NOTICE_TYPE(tree)
         return notice_type == "pin-only"
 
     def get_previous_publication_id(self, tree: etree._Element) -> str | None:
         """Get ID of the previous planning notice if it exists."""
-        refs = tree.xpath(
-            "//cac:NoticeDocumentReference/cbc:ID[@schemeName='notice-id-ref']/text()",
-            namespaces=self.namespaces,
-        )
+        refs = XPATH_PREVIOUS_PUBLICATION_IDS(tree)
         if refs:
             return refs[0]
         return None
 
     def get_notice_parts(self, tree: etree._Element) -> list[etree._Element]:
         """Get all parts from a notice."""
-        return tree.xpath(
-            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']",
-            namespaces=self.namespaces,
-        )
+        return XPATH_NOTICE_PARTS(tree)
 
     def is_can_for_framework_or_dps(self, tree: etree._Element) -> bool:
         """Check if notice is a CAN for framework agreement or DPS."""
         if not self.is_can(tree):
             return False
 
-        is_framework = tree.xpath(
-            """boolean(/*/cac:ProcurementProject//cbc:ProcurementTypeCode[
-                @listName='contract-nature' and text()='framework-agreement'] |
-            /*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode[
-                @listName='contract-nature' and text()='framework-agreement'])""",
-            namespaces=self.namespaces,
-        )
-
-        is_dps = tree.xpath(
-            """boolean(
-                /*/cac:ProcurementProject//cbc:ProcurementTypeCode[
-                    @listName='contract-nature' and text()='dps'] |
-                /*/cac:ProcurementProjectLot//cbc:ProcurementTypeCode[
-                    @listName='contract-nature' and text()='dps'] |
-                /*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']/
-                    cac:TenderingProcess/cac:ContractingSystem[
-                        cbc:ContractingSystemTypeCode/@listName='dps-usage']/
-                        cbc:ContractingSystemTypeCode[text()!='none']
-            )""",
-            namespaces=self.namespaces,
-        )
+        is_framework = XPATH_IS_FRAMEWORK(tree)
+
+        is_dps = XPATH_IS_DPS(tree)
 
         return is_framework or is_dps
 
@@ -153,16 +167,11 @@ class XMLProcessor:
     ) -> list[dict[str, Any]]:
         """Get previous document references specific to a part."""
         refs = []
-        notice_refs = part.xpath(
-            ".//cac:NoticeDocumentReference", namespaces=self.namespaces
-        )
+        notice_refs = XPATH_PART_NOTICE_REFERENCES(part)
 
         for ref in notice_refs:
-            notice_id = ref.xpath("string(cbc:ID)", namespaces=self.namespaces)
-            part_id = ref.xpath(
-                "string(cbc:ReferencedDocumentInternalAddress)",
-                namespaces=self.namespaces,
-            )
+            notice_id = XPATH_ID_STRING(ref)
+            part_id = XPATH_REFERENCED_PART_ID(ref)
             if notice_id:
                 identifier = f"{notice_id}-{part_id}" if part_id else notice_id
                 refs.append(
@@ -0,0 +1,140 @@
+# src/ted_and_doffin_to_ocds/utils/xpath_catalogue.py
+
+import logging
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, Final
+
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.eforms_paths import compile_path
+from ted_and_doffin_to_ocds.utils.notice_document import EFORMS_NAMESPACES
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogueXPath:
+    """A named, precompiled XPath expression that counts its evaluations."""
+
+    __slots__ = ("_reference", "_xpath", "count", "expression", "name")
+
+    def __init__(
+        self,
+        name: str,
+        expression: str,
+        xpath: Callable[..., Any],
+        reference: etree.XPath,
+    ) -> None:
+        self.name = name
+        self.expression = expression
+        self.count = 0
+        self._xpath = xpath
+        self._reference = reference
+
+    def __call__(
+        self, node: etree._Element | etree._ElementTree, **variables: object
+    ) -> Any:  # noqa: ANN401
+        """Evaluate the expression with node as the context node.
+
+        Keyword arguments are bound to the XPath variables of the same name.
+        """
+        self.count += 1
+        return self._xpath(node, **variables)
+
+    def __repr__(self) -> str:
+        return f"CatalogueXPath({self.name!r}, {self.expression!r})"
+
+
+class XPathCatalogue:
+    """The XPath expressions of the converters, compiled once at import.
+
+    Converters register each expression under a name at module level and call
+    the returned CatalogueXPath instead of passing a string and a namespace
+    map to element.xpath(), which compiles the expression on every call.
+    Identical expressions registered under different names share one
+    compiled evaluator, but are counted separately.
+
+    Expressions are compiled with eforms_paths.compile_path(), which anchors
+    descendant-axis steps to the eForms structure and evaluates plain child
+    paths without XPath. reference_mode() switches every entry back to the
+    expression as written, to check that both give the same results.
+    """
+
+    def __init__(self, namespaces: dict[str, str]) -> None:
+        self.namespaces = dict(namespaces)
+        self._entries: dict[str, CatalogueXPath] = {}
+        self._compiled: dict[str, tuple[Callable[..., Any], etree.XPath]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._entries
+
+    def __getitem__(self, name: str) -> CatalogueXPath:
+        return self._entries[name]
+
+    def register(self, name: str, expression: str) -> CatalogueXPath:
+        """Compile an expression and add it to the catalogue under name.
+
+        Registering the same name again returns the existing entry if the
+        expression is the same, and raises ValueError otherwise.
+        Raises etree.XPathSyntaxError if the expression is invalid.
+        """
+        entry = self._entries.get(name)
+        if entry is not None:
+            if entry.expression != expression:
+                msg = f"XPath {name!r} is already registered as {entry.expression!r}"
+                raise ValueError(msg)
+            return entry
+        compiled = self._compiled.get(expression)
+        if compiled is None:
+            reference = etree.XPath(expression, namespaces=self.namespaces)
+            compiled = (compile_path(expression, self.namespaces), reference)
+            self._compiled[expression] = compiled
+        entry = self._entries[name] = CatalogueXPath(name, expression, *compiled)
+        return entry
+
+    @contextmanager
+    def reference_mode(self) -> Iterator[None]:
+        """Evaluate every expression exactly as written while in the block."""
+        optimised = {name: entry._xpath for name, entry in self._entries.items()}  # noqa: SLF001
+        for entry in self._entries.values():
+            entry._xpath = entry._reference  # noqa: SLF001
+        try:
+            yield
+        finally:
+            for name, xpath in optimised.items():
+                self._entries[name]._xpath = xpath  # noqa: SLF001
+
+    def counts(self) -> dict[str, int]:
+        """Return the number of evaluations of each expression, by name."""
+        return {name: entry.count for name, entry in self._entries.items()}
+
+    def reset_counts(self) -> None:
+        """Set the evaluation count of every expression back to zero."""
+        for entry in self._entries.values():
+            entry.count = 0
+
+    def log_counts(self, limit: int = 20) -> None:
+        """Log the most evaluated expressions at DEBUG level."""
+        evaluated = sorted(
+            (entry for entry in self._entries.values() if entry.count),
+            key=lambda entry: entry.count,
+            reverse=True,
+        )
+        logger.debug(
+            "%d of %d catalogued XPath expressions were evaluated",
+            len(evaluated),
+            len(self._entries),
+        )
+        for entry in evaluated[:limit]:
+            logger.debug("%8d  %s: %s", entry.count, entry.name, entry.expression)
+
+
+XPATHS: Final[XPathCatalogue] = XPathCatalogue(EFORMS_NAMESPACES)
+
+
+def register_xpath(name: str, expression: str) -> CatalogueXPath:
+    """Register an expression in the shared eForms catalogue."""
+    return XPATHS.register(name, expression)
@@ -0,0 +1,312 @@
+# tests/test_award_criteria.py
+
+import pytest
+
+from ted_and_doffin_to_ocds.converters.eforms.award_criteria import (
+    merge_award_criteria,
+    parse_award_criteria,
+)
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:AwardingTerms>
+                <cac:AwardingCriterion>
+                    <cbc:CalculationExpression languageID="ENG">Weighted sum</cbc:CalculationExpression>
+                    <cbc:Description languageID="ENG"> Order of importance </cbc:Description>
+                    <cac:SubordinateAwardingCriterion>
+                        <ext:UBLExtensions>
+                            <ext:UBLExtension>
+                                <ext:ExtensionContent>
+                                    <efext:EformsExtension>
+                                        <efac:AwardCriterionParameter>
+                                            <efbc:ParameterCode listName="number-weight">per-exa</efbc:ParameterCode>
+                                            <efbc:ParameterNumeric>70</efbc:ParameterNumeric>
+                                        </efac:AwardCriterionParameter>
+                                        <efac:AwardCriterionParameter>
+                                            <efbc:ParameterCode listName="number-threshold">min-score</efbc:ParameterCode>
+                                            <efbc:ParameterNumeric>20</efbc:ParameterNumeric>
+                                        </efac:AwardCriterionParameter>
+                                    </efext:EformsExtension>
+                                </ext:ExtensionContent>
+                            </ext:UBLExtension>
+                        </ext:UBLExtensions>
+                        <cbc:AwardingCriterionTypeCode listName="award-criterion-type">quality</cbc:AwardingCriterionTypeCode>
+                        <cbc:Name languageID="ENG"> Quality </cbc:Name>
+                        <cbc:Description languageID="ENG">Quality of the service</cbc:Description>
+                    </cac:SubordinateAwardingCriterion>
+                    <cac:SubordinateAwardingCriterion>
+                        <ext:UBLExtensions>
+                            <ext:UBLExtension>
+                                <ext:ExtensionContent>
+                                    <efext:EformsExtension>
+                                        <efac:AwardCriterionParameter>
+                                            <efbc:ParameterCode listName="number-weight">per-exa</efbc:ParameterCode>
+                                            <efbc:ParameterNumeric>30</efbc:ParameterNumeric>
+                                        </efac:AwardCriterionParameter>
+                                    </efext:EformsExtension>
+                                </ext:ExtensionContent>
+                            </ext:UBLExtension>
+                        </ext:UBLExtensions>
+                        <cbc:AwardingCriterionTypeCode listName="award-criterion-type">price</cbc:AwardingCriterionTypeCode>
+                    </cac:SubordinateAwardingCriterion>
+                </cac:AwardingCriterion>
+            </cac:AwardingTerms>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:AwardingTerms>
+                <cac:AwardingCriterion>
+                    <cac:SubordinateAwardingCriterion>
+                        <ext:UBLExtensions>
+                            <ext:UBLExtension>
+                                <ext:ExtensionContent>
+                                    <efext:EformsExtension>
+                                        <efac:AwardCriterionParameter>
+                                            <efbc:ParameterCode listName="number-fixed">total</efbc:ParameterCode>
+                                        </efac:AwardCriterionParameter>
+                                    </efext:EformsExtension>
+                                </ext:ExtensionContent>
+                            </ext:UBLExtension>
+                        </ext:UBLExtensions>
+                        <cbc:AwardingCriterionTypeCode listName="award-criterion-type">cost</cbc:AwardingCriterionTypeCode>
+                    </cac:SubordinateAwardingCriterion>
+                </cac:AwardingCriterion>
+            </cac:AwardingTerms>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0002</cbc:ID>
+    </cac:ProcurementProjectLot>
+</ContractNotice>
+"""
+
+
+def test_parse_award_criteria_one_criterion_per_subordinate_criterion() -> None:
+    result = parse_award_criteria(XML_CONTENT)
+
+    assert result == {
+        "tender": {
+            "lots": [
+                {
+                    "id": "LOT-0001",
+                    "awardCriteria": {
+                        "weightingDescription": "Weighted sum",
+                        "orderRationale": "Order of importance",
+                        "criteria": [
+                            {
+                                "type": "quality",
+                                "name": "Quality",
+                                "description": "Quality of the service",
+                                "numbers": [
+                                    {"number": 70.0, "weight": "percentageExact"},
+                                    {"number": 20.0, "threshold": "minimumScore"},
+                                ],
+                            },
+                            {
+                                "type": "price",
+                                "numbers": [
+                                    {"number": 30.0, "weight": "percentageExact"}
+                                ],
+                            },
+                        ],
+                    },
+                }
+            ],
+            "lotGroups": [
+                {
+                    "id": "GLO-0001",
+                    "awardCriteria": {
+                        "criteria": [{"type": "cost", "numbers": [{"fixed": "total"}]}]
+                    },
+                }
+            ],
+        }
+    }
+
+
+def test_parse_award_criteria_without_criteria() -> None:
+    xml_content = """<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"/>"""
+
+    assert parse_award_criteria(xml_content) is None
+
+
+def test_merge_award_criteria_replaces_criteria() -> None:
+    release_json = {
+        "tender": {
+            "lots": [
+                {
+                    "id": "LOT-0001",
+                    "title": "Lot",
+                    "awardCriteria": {"criteria": [{"type": "quality"}]},
+                }
+            ]
+        }
+    }
+
+    merge_award_criteria(release_json, parse_award_criteria(XML_CONTENT))
+
+    lot = release_json["tender"]["lots"][0]
+    assert lot["title"] == "Lot"
+    assert [criterion["type"] for criterion in lot["awardCriteria"]["criteria"]] == [
+        "quality",
+        "price",
+    ]
+    assert release_json["tender"]["lotGroups"][0]["id"] == "GLO-0001"
+
+
+def criteria_notice(
+    scheme_name: str, awarding_criterion: str, subordinate: str = "", parameter: str | None = None
+) -> str:
+    """Return a notice with one lot or lot group and one awarding criterion."""
+    if parameter is not None:
+        subordinate += f"""<ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
+            <efext:EformsExtension>
+                <efac:AwardCriterionParameter>{parameter}</efac:AwardCriterionParameter>
+            </efext:EformsExtension>
+        </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>"""
+    lot_id = "LOT-0001" if scheme_name == "Lot" else "GLO-0001"
+    return f"""<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="{scheme_name}">{lot_id}</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:AwardingTerms>
+                <cac:AwardingCriterion>
+                    {awarding_criterion}
+                    <cac:SubordinateAwardingCriterion>{subordinate}</cac:SubordinateAwardingCriterion>
+                </cac:AwardingCriterion>
+            </cac:AwardingTerms>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+</ContractNotice>"""
+
+
+def parameter(list_name: str, code: str, number: str = "50") -> str:
+    return (
+        f"<efbc:ParameterCode listName=\"{list_name}\">{code}</efbc:ParameterCode>"
+        f"<efbc:ParameterNumeric>{number}</efbc:ParameterNumeric>"
+    )
+
+
+# Business term, XML of the awarding criterion, of the subordinate criterion
+# and of its parameter, expected awardCriteria
+AWARD_CRITERIA_FIELDS = [
+    (
+        "BT-543",
+        "<cbc:CalculationExpression>Price and quality are weighted 40/60</cbc:CalculationExpression>",
+        "",
+        None,
+        {"weightingDescription": "Price and quality are weighted 40/60"},
+    ),
+    (
+        "BT-733",
+        "<cbc:Description> Criteria are listed by importance </cbc:Description>",
+        "",
+        None,
+        {"orderRationale": "Criteria are listed by importance"},
+    ),
+    (
+        "BT-539",
+        "",
+        '<cbc:AwardingCriterionTypeCode listName="award-criterion-type">quality</cbc:AwardingCriterionTypeCode>',
+        None,
+        {"criteria": [{"type": "quality"}]},
+    ),
+    (
+        "BT-734",
+        "",
+        "<cbc:Name> Technical merit </cbc:Name>",
+        None,
+        {"criteria": [{"name": "Technical merit"}]},
+    ),
+    (
+        "BT-540",
+        "",
+        "<cbc:Description>Technical merit of the proposal</cbc:Description>",
+        None,
+        {"criteria": [{"description": "Technical merit of the proposal"}]},
+    ),
+    (
+        "BT-541",
+        "",
+        "",
+        "<efbc:ParameterNumeric>12.5</efbc:ParameterNumeric>",
+        {"criteria": [{"numbers": [{"number": 12.5}]}]},
+    ),
+    (
+        "BT-5421",
+        "",
+        "",
+        parameter("number-weight", "per-exa"),
+        {"criteria": [{"numbers": [{"number": 50.0, "weight": "percentageExact"}]}]},
+    ),
+    (
+        "BT-5422",
+        "",
+        "",
+        parameter("number-fixed", "total"),
+        {"criteria": [{"numbers": [{"number": 50.0, "fixed": "total"}]}]},
+    ),
+    (
+        "BT-5423",
+        "",
+        "",
+        parameter("number-threshold", "max-pass"),
+        {"criteria": [{"numbers": [{"number": 50.0, "threshold": "maximumBids"}]}]},
+    ),
+    (
+        "BT-5423",
+        "",
+        "",
+        parameter("number-threshold", "min-score"),
+        {"criteria": [{"numbers": [{"number": 50.0, "threshold": "minimumScore"}]}]},
+    ),
+]
+
+
+@pytest.mark.parametrize(("scheme_name", "key"), [("Lot", "lots"), ("LotsGroup", "lotGroups")])
+@pytest.mark.parametrize(
+    ("bt", "awarding_criterion", "subordinate", "parameter_xml", "expected"),
+    AWARD_CRITERIA_FIELDS,
+)
+def test_parse_award_criteria_maps_each_field(
+    scheme_name, key, bt, awarding_criterion, subordinate, parameter_xml, expected
+) -> None:
+    xml_content = criteria_notice(scheme_name, awarding_criterion, subordinate, parameter_xml)
+
+    result = parse_award_criteria(xml_content)
+
+    lot_id = "LOT-0001" if scheme_name == "Lot" else "GLO-0001"
+    assert result == {"tender": {key: [{"id": lot_id, "awardCriteria": expected}]}}
+
+
+def test_parse_award_criteria_skips_unknown_codes() -> None:
+    xml_content = criteria_notice(
+        "Lot", "", "", parameter("number-threshold", "not-a-code")
+    )
+
+    result = parse_award_criteria(xml_content)
+
+    assert result["tender"]["lots"][0]["awardCriteria"] == {
+        "criteria": [{"numbers": [{"number": 50.0}]}]
+    }
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -20,10 +20,12 @@ def create_xml_with_namespace(content) -> str:
 
 def test_parse_procedure_legal_basis_with_eli() -> None:
     xml_content = create_xml_with_namespace("""
+        <cac:TenderingTerms>
         <cac:ProcurementLegislationDocumentReference>
             <cbc:ID schemeName="ELI">dir201424</cbc:ID>
             <cbc:DocumentDescription>Directive 2014/24/EU</cbc:DocumentDescription>
         </cac:ProcurementLegislationDocumentReference>
+        </cac:TenderingTerms>
     """)
 
     result = parse_procedure_legal_basis(xml_content)
@@ -36,10 +38,12 @@ def test_parse_procedure_legal_basis_with_eli() -> None:
 
 def test_parse_procedure_legal_basis_non_eli_id() -> None:
     xml_content = create_xml_with_namespace("""
+        <cac:TenderingTerms>
         <cac:ProcurementLegislationDocumentReference>
             <cbc:ID schemeName="ELI">https://www.legislation.gov.uk/id/uksi/2015/102</cbc:ID>
             <cbc:DocumentDescription>UK procurement law</cbc:DocumentDescription>
         </cac:ProcurementLegislationDocumentReference>
+        </cac:TenderingTerms>
     """)
     result = parse_procedure_legal_basis(xml_content)
     assert result is not None
@@ -50,10 +54,12 @@ def test_parse_procedure_legal_basis_non_eli_id() -> None:
 
 def test_parse_procedure_legal_basis_with_eli_prefix() -> None:
     xml_content = create_xml_with_namespace(f"""
+        <cac:TenderingTerms>
         <cac:ProcurementLegislationDocumentReference>
             <cbc:ID schemeName="IGNORED">{ELI_PREFIX}/2014/24</cbc:ID>
             <cbc:DocumentDescription>Directive 2014/24/EU</cbc:DocumentDescription>
         </cac:ProcurementLegislationDocumentReference>
+        </cac:TenderingTerms>
     """)
     result = parse_procedure_legal_basis(xml_content)
     assert result is not None
@@ -63,10 +69,12 @@ def test_parse_procedure_legal_basis_with_eli_prefix() -> None:
 
 def test_parse_procedure_legal_basis_with_local_basis() -> None:
     xml_content = create_xml_with_namespace("""
+        <cac:TenderingTerms>
         <cac:ProcurementLegislationDocumentReference>
             <cbc:ID>LocalLegalBasis</cbc:ID>
             <cbc:DocumentDescription>Local procurement law</cbc:DocumentDescription>
         </cac:ProcurementLegislationDocumentReference>
+        </cac:TenderingTerms>
     """)
 
     result = parse_procedure_legal_basis(xml_content)
@@ -91,11 +99,13 @@ def test_parse_procedure_legal_basis_with_celex() -> None:
 
 def test_parse_procedure_legal_basis_multilingual() -> None:
     xml_content = create_xml_with_namespace("""
+        <cac:TenderingTerms>
         <cac:ProcurementLegislationDocumentReference>
             <cbc:ID>LocalLegalBasis</cbc:ID>
             <cbc:DocumentDescription languageID="ENG">Local procurement law</cbc:DocumentDescription>
             <cbc:DocumentDescription languageID="FRA">Loi locale sur les marchés publics</cbc:DocumentDescription>
         </cac:ProcurementLegislationDocumentReference>
+        </cac:TenderingTerms>
     """)
     result = parse_procedure_legal_basis(xml_content)
     assert result is not None
@@ -1,84 +0,0 @@
-# tests/test_bt_165_organization_company.py
-import json
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-from src.ted_and_doffin_to_ocds.converters.eforms.bt_165_organization_company import parse_winner_size
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_165_organization_company_eforms_integration(
-    tmp_path, temp_output_dir
-) -> None:
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <ext:UBLExtensions>
-            <ext:UBLExtension>
-                <ext:ExtensionContent>
-                    <efext:EformsExtension>
-                        <efac:Organizations>
-                            <efac:Organization>
-                                <efac:Company>
-                                    <cac:PartyIdentification>
-                                        <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
-                                    </cac:PartyIdentification>
-                                    <efbc:CompanySizeCode listName="economic-operator-size">large</efbc:CompanySizeCode>
-                                </efac:Company>
-                            </efac:Organization>
-                        </efac:Organizations>
-                    </efext:EformsExtension>
-                </ext:ExtensionContent>
-            </ext:UBLExtension>
-        </ext:UBLExtensions>
-    </ContractAwardNotice>
-    """
-
-    # Create input XML file
-    xml_file = tmp_path / "test_input_winner_size_eforms.xml"
-    xml_file.write_text(xml_content)
-
-    # Run main and get result
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # Verify the results
-    assert "parties" in result, "Expected 'parties' in result"
-    assert (
-        len(result["parties"]) == 1
-    ), f"Expected 1 party, got {len(result['parties'])}"
-
-    party = result["parties"][0]
-    assert party["id"] == "ORG-0001", f"Expected party id 'ORG-0001', got {party['id']}"
-    assert "details" in party, "Expected 'details' in party"
-    assert "scale" in party["details"], "Expected 'scale' in party details"
-    assert (
-        party["details"]["scale"] == "large"
-    ), f"Expected scale 'large', got {party['details']['scale']}"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
@@ -1,198 +0,0 @@
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_195_bt635_lotresult_integration(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <ext:UBLExtensions>
-            <ext:UBLExtension>
-                <ext:ExtensionContent>
-                    <efext:EformsExtension>
-                        <efac:NoticeResult>
-                            <efac:LotResult>
-                                <cbc:ID schemeName="result">RES-0001</cbc:ID>
-                                <efac:AppealRequestsStatistics>
-                                    <efbc:StatisticsCode listName="irregularity-type">total</efbc:StatisticsCode>
-                                    <efac:FieldsPrivacy>
-                                        <efbc:FieldIdentifierCode listName="non-publication-identifier">buy-rev-cou</efbc:FieldIdentifierCode>
-                                    </efac:FieldsPrivacy>
-                                </efac:AppealRequestsStatistics>
-                            </efac:LotResult>
-                        </efac:NoticeResult>
-                    </efext:EformsExtension>
-                </ext:ExtensionContent>
-            </ext:UBLExtension>
-        </ext:UBLExtensions>
-    </ContractNotice>"""
-
-    xml_file = tmp_path / "test_input_bt195_bt635.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    withheld_info = result["withheldInformation"]
-    assert (
-        len(withheld_info) == 1
-    ), f"Expected 1 withheld information item, got {len(withheld_info)}"
-
-    item = withheld_info[0]
-    assert (
-        item["id"] == "buy-rev-cou-RES-0001"
-    ), f"Expected id 'buy-rev-cou-RES-0001', got {item['id']}"
-    assert (
-        item["field"] == "buy-rev-cou"
-    ), f"Expected field 'buy-rev-cou', got {item['field']}"
-    assert (
-        item["name"] == "Buyer Review Request Count"
-    ), f"Expected name 'Buyer Review Request Count', got {item['name']}"
-
-
-def test_bt_195_bt635_lotresult_missing_data(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <ext:UBLExtensions>
-            <ext:UBLExtension>
-                <ext:ExtensionContent>
-                    <efext:EformsExtension>
-                        <efac:NoticeResult>
-                            <efac:LotResult>
-                                <cbc:ID schemeName="result">RES-0001</cbc:ID>
-                                <efac:AppealRequestsStatistics>
-                                    <efbc:StatisticsCode listName="irregularity-type">total</efbc:StatisticsCode>
-                                    <!-- Missing FieldsPrivacy element -->
-                                </efac:AppealRequestsStatistics>
-                            </efac:LotResult>
-                        </efac:NoticeResult>
-                    </efext:EformsExtension>
-                </ext:ExtensionContent>
-            </ext:UBLExtension>
-        </ext:UBLExtensions>
-    </ContractNotice>"""
-
-    xml_file = tmp_path / "test_input_bt195_bt635_missing.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert (
-        "withheldInformation" not in result or not result["withheldInformation"]
-    ), "Did not expect 'withheldInformation' in result when data is missing"
-
-
-def test_bt_195_bt635_lotresult_multiple_items(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <ext:UBLExtensions>
-            <ext:UBLExtension>
-                <ext:ExtensionContent>
-                    <efext:EformsExtension>
-                        <efac:NoticeResult>
-                            <efac:LotResult>
-                                <cbc:ID schemeName="result">RES-0001</cbc:ID>
-                                <efac:AppealRequestsStatistics>
-                                    <efbc:StatisticsCode listName="irregularity-type">total</efbc:StatisticsCode>
-                                    <efac:FieldsPrivacy>
-                                        <efbc:FieldIdentifierCode listName="non-publication-identifier">buy-rev-cou</efbc:FieldIdentifierCode>
-                                    </efac:FieldsPrivacy>
-                                </efac:AppealRequestsStatistics>
-                            </efac:LotResult>
-                            <efac:LotResult>
-                                <cbc:ID schemeName="result">RES-0002</cbc:ID>
-                                <efac:AppealRequestsStatistics>
-                                    <efbc:StatisticsCode listName="irregularity-type">total</efbc:StatisticsCode>
-                                    <efac:FieldsPrivacy>
-                                        <efbc:FieldIdentifierCode listName="non-publication-identifier">buy-rev-cou</efbc:FieldIdentifierCode>
-                                    </efac:FieldsPrivacy>
-                                </efac:AppealRequestsStatistics>
-                            </efac:LotResult>
-                        </efac:NoticeResult>
-                    </efext:EformsExtension>
-                </ext:ExtensionContent>
-            </ext:UBLExtension>
-        </ext:UBLExtensions>
-    </ContractNotice>"""
-
-    xml_file = tmp_path / "test_input_bt195_bt635_multiple.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    withheld_info = result["withheldInformation"]
-    assert (
-        len(withheld_info) == 2
-    ), f"Expected 2 withheld information items, got {len(withheld_info)}"
-
-    expected_ids = ["buy-rev-cou-RES-0001", "buy-rev-cou-RES-0002"]
-    actual_ids = [item["id"] for item in withheld_info]
-    assert sorted(actual_ids) == sorted(expected_ids), f"Expected IDs {expected_ids}, got {actual_ids}"
-
-    for item in withheld_info:
-        assert item["field"] == "buy-rev-cou"
-        assert item["name"] == "Buyer Review Request Count"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
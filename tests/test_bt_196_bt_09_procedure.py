@@ -1,91 +0,0 @@
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_196_bt_09_procedure_integration(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cbc:ContractFolderID>test-folder-id</cbc:ContractFolderID>
-        <cac:TenderingTerms>
-            <cac:ProcurementLegislationDocumentReference>
-                <cbc:ID>CrossBorderLaw</cbc:ID>
-                <ext:UBLExtensions>
-                    <ext:UBLExtension>
-                        <ext:ExtensionContent>
-                            <efext:EformsExtension>
-                                <efac:FieldsPrivacy>
-                                    <efbc:FieldIdentifierCode>cro-bor-law</efbc:FieldIdentifierCode>
-                                    <efbc:ReasonDescription>Information delayed publication because of ...</efbc:ReasonDescription>
-                                </efac:FieldsPrivacy>
-                            </efext:EformsExtension>
-                        </ext:ExtensionContent>
-                    </ext:UBLExtension>
-                </ext:UBLExtensions>
-            </cac:ProcurementLegislationDocumentReference>
-        </cac:TenderingTerms>
-    </ContractNotice>
-    """
-    xml_file = tmp_path / "test_input_unpublished_justification.xml"
-    xml_file.write_text(xml_content)
-    # logger.info("Created XML file at %s", xml_file) # Logging disabled
-    # logger.info("Output directory: %s", temp_output_dir) # Logging disabled
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    assert (
-        len(result["withheldInformation"]) == 1
-    ), f"Expected 1 withheld information item, got {len(result['withheldInformation'])}"
-
-    withheld_item = result["withheldInformation"][0]
-    assert (
-        "rationale" in withheld_item
-    ), "Expected 'rationale' in withheld information item"
-    assert (
-        withheld_item["rationale"] == "Information delayed publication because of ..."
-    ), f"Expected rationale 'Information delayed publication because of ...', got {withheld_item['rationale']}"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
@@ -1,165 +0,0 @@
-import json
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import main
-from src.ted_and_doffin_to_ocds.converters.eforms.bt_196_bt_1252_procedure import parse_bt196_bt1252_unpublished_justification
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_196_bt_1252_procedure_with_language_id(tmp_path, temp_output_dir) -> None:
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cac:TenderingProcess>
-          <cac:ProcessJustification>
-            <cbc:ProcessReasonCode listName="direct-award-justification">some-code</cbc:ProcessReasonCode>
-            <ext:UBLExtensions>
-              <ext:UBLExtension>
-                <ext:ExtensionContent>
-                  <efext:EformsExtension>
-                    <efac:FieldsPrivacy>
-                      <efbc:FieldIdentifierCode>dir-awa-pre</efbc:FieldIdentifierCode>
-                      <efbc:ReasonDescription languageID="ENG">Information delayed publication because of ...</efbc:ReasonDescription>
-                    </efac:FieldsPrivacy>
-                  </efext:EformsExtension>
-                </ext:ExtensionContent>
-              </ext:UBLExtension>
-            </ext:UBLExtensions>
-          </cac:ProcessJustification>
-        </cac:TenderingProcess>
-    </ContractNotice>
-    """
-    xml_file = tmp_path / "test_input_unpublished_justification_bt1252.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    assert (
-        len(result["withheldInformation"]) == 1
-    ), f"Expected 1 withheld information item, got {len(result['withheldInformation'])}"
-
-    withheld_info = result["withheldInformation"][0]
-    assert (
-        withheld_info["id"] == "dir-awa-pre"
-    ), f"Expected id 'dir-awa-pre', got {withheld_info['id']}"
-    assert "rationale" in withheld_info, "Expected 'rationale' in withheld_info"
-    
-    # Check for the multilingual format
-    assert isinstance(withheld_info["rationale"], dict), "Expected rationale to be a dict for multilingual text"
-    assert "eng" in withheld_info["rationale"], "Expected 'eng' key in multilingual rationale"
-    assert (
-        withheld_info["rationale"]["eng"] == "Information delayed publication because of ..."
-    ), f"Unexpected rationale text: {withheld_info['rationale']['eng']}"
-
-
-def test_bt_196_bt_1252_procedure_without_language_id(tmp_path, temp_output_dir) -> None:
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cac:TenderingProcess>
-          <cac:ProcessJustification>
-            <cbc:ProcessReasonCode listName="direct-award-justification">some-code</cbc:ProcessReasonCode>
-            <ext:UBLExtensions>
-              <ext:UBLExtension>
-                <ext:ExtensionContent>
-                  <efext:EformsExtension>
-                    <efac:FieldsPrivacy>
-                      <efbc:FieldIdentifierCode>dir-awa-pre</efbc:FieldIdentifierCode>
-                      <efbc:ReasonDescription>Simple text without language ID</efbc:ReasonDescription>
-                    </efac:FieldsPrivacy>
-                  </efext:EformsExtension>
-                </ext:ExtensionContent>
-              </ext:UBLExtension>
-            </ext:UBLExtensions>
-          </cac:ProcessJustification>
-        </cac:TenderingProcess>
-    </ContractNotice>
-    """
-    xml_file = tmp_path / "test_input_unpublished_justification_no_lang.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    withheld_info = result["withheldInformation"][0]
-    
-    # Check for plain text format when no language ID is provided
-    assert isinstance(withheld_info["rationale"], str), "Expected rationale to be a string when no language ID is provided"
-    assert withheld_info["rationale"] == "Simple text without language ID"
-
-
-def test_bt_196_bt_1252_procedure_multiple_languages(tmp_path) -> None:
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cac:TenderingProcess>
-          <cac:ProcessJustification>
-            <cbc:ProcessReasonCode listName="direct-award-justification">some-code</cbc:ProcessReasonCode>
-            <ext:UBLExtensions>
-              <ext:UBLExtension>
-                <ext:ExtensionContent>
-                  <efext:EformsExtension>
-                    <efac:FieldsPrivacy>
-                      <efbc:FieldIdentifierCode>dir-awa-pre</efbc:FieldIdentifierCode>
-                      <efbc:ReasonDescription languageID="ENG">English description</efbc:ReasonDescription>
-                      <efbc:ReasonDescription languageID="FRA">Description en français</efbc:ReasonDescription>
-                    </efac:FieldsPrivacy>
-                  </efext:EformsExtension>
-                </ext:ExtensionContent>
-              </ext:UBLExtension>
-            </ext:UBLExtensions>
-          </cac:ProcessJustification>
-        </cac:TenderingProcess>
-    </ContractNotice>
-    """
-    
-    # Direct test using the parser function
-    result = parse_bt196_bt1252_unpublished_justification(xml_content)
-    
-    assert result is not None
-    assert "withheldInformation" in result
-    assert len(result["withheldInformation"]) == 1
-    
-    withheld_info = result["withheldInformation"][0]
-    assert withheld_info["id"] == "dir-awa-pre"
-    assert isinstance(withheld_info["rationale"], dict)
-    assert "eng" in withheld_info["rationale"]
-    assert "fra" in withheld_info["rationale"]
-    assert withheld_info["rationale"]["eng"] == "English description"
-    assert withheld_info["rationale"]["fra"] == "Description en français"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
@@ -1,76 +0,0 @@
-# tests/test_bt_198_bt_09_procedure.py
-import json
-import sys
-import tempfile
-from pathlib import Path
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import main
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*_release_0.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-def test_bt_198_bt_09_procedure_integration(
-    tmp_path, temp_output_dir
-) -> None:
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cbc:ID>notice-1</cbc:ID>
-        <cbc:ContractFolderID>test-folder-id</cbc:ContractFolderID>
-        <cac:TenderingTerms>
-            <cac:ProcurementLegislationDocumentReference>
-                <cbc:ID>CrossBorderLaw</cbc:ID>
-                <ext:UBLExtensions>
-                    <ext:UBLExtension>
-                        <ext:ExtensionContent>
-                            <efext:EformsExtension>
-                                <efac:FieldsPrivacy>
-                                    <efbc:FieldIdentifierCode>cro-bor-law</efbc:FieldIdentifierCode>
-                                    <efbc:PublicationDate>2025-03-31+01:00</efbc:PublicationDate>
-                                </efac:FieldsPrivacy>
-                            </efext:EformsExtension>
-                        </ext:ExtensionContent>
-                    </ext:UBLExtension>
-                </ext:UBLExtensions>
-            </cac:ProcurementLegislationDocumentReference>
-        </cac:TenderingTerms>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_unpublished_access_date.xml"
-    xml_file.write_text(xml_content)
-
-    # Run main and get result
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    
-    assert "withheldInformation" in result, "Expected 'withheldInformation' in result"
-    assert (
-        len(result["withheldInformation"]) == 1
-    ), f"Expected 1 withheld information item, got {len(result['withheldInformation'])}"
-    
-    withheld_item = result["withheldInformation"][0]
-    assert (
-        "availabilityDate" in withheld_item
-    ), "Expected 'availabilityDate' in withheld information item"
-    assert (
-        withheld_item["availabilityDate"] == "2025-03-31T00:00:00+01:00"
-    ), f"Expected availabilityDate '2025-03-31T00:00:00+01:00', got {withheld_item['availabilityDate']}"
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
@@ -14,6 +14,8 @@ def test_parse_contract_modification_description() -> None:
           xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
           xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
           xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+        <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
+        <efext:EformsExtension>
         <efac:ContractModification>
             <efac:Change>
                 <efac:ChangedSection>
@@ -32,6 +34,8 @@ def test_parse_contract_modification_description() -> None:
                 </efac:SettledContract>
             </efac:LotResult>
         </efac:NoticeResult>
+        </efext:EformsExtension>
+        </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
     </root>
     """
 
@@ -10,9 +10,11 @@ def test_parse_max_lots_awarded() -> None:
     xml_content = """
     <root xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
           xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+        <cac:TenderingTerms>
         <cac:LotDistribution>
             <cbc:MaximumLotsAwardedNumeric>4</cbc:MaximumLotsAwardedNumeric>
         </cac:LotDistribution>
+        </cac:TenderingTerms>
     </root>
     """
     result = parse_max_lots_awarded(xml_content)
@@ -40,9 +42,11 @@ def test_parse_max_lots_awarded_invalid() -> None:
     xml_content = """
     <root xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
           xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+        <cac:TenderingTerms>
         <cac:LotDistribution>
             <cbc:MaximumLotsAwardedNumeric>invalid</cbc:MaximumLotsAwardedNumeric>
         </cac:LotDistribution>
+        </cac:TenderingTerms>
     </root>
     """
     result = parse_max_lots_awarded(xml_content)
@@ -1,115 +0,0 @@
-# tests/test_bt_510b_organization_touchpoint.py
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*_release_0.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_510b_organization_touchpoint_integration(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-        xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-        xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1">
-        <cbc:ID>notice-1</cbc:ID>
-        <cbc:ContractFolderID>cf-1</cbc:ContractFolderID>
-        <ext:UBLExtensions>
-            <ext:UBLExtension>
-                <ext:ExtensionContent>
-                    <efext:EformsExtension>
-                        <efac:Organizations>
-                            <efac:Organization>
-                                <efac:Company>
-                                    <cac:PartyLegalEntity>
-                                        <cbc:CompanyID>998298</cbc:CompanyID>
-                                    </cac:PartyLegalEntity>
-                                </efac:Company>
-                                <efac:TouchPoint>
-                                    <cac:PartyIdentification>
-                                        <cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID>
-                                    </cac:PartyIdentification>
-                                    <cac:PostalAddress>
-                                        <cbc:StreetName>2, rue de Europe</cbc:StreetName>
-                                        <cbc:AdditionalStreetName>Building A</cbc:AdditionalStreetName>
-                                        <cac:AddressLine>
-                                            <cbc:Line>3rd Floor</cbc:Line>
-                                        </cac:AddressLine>
-                                    </cac:PostalAddress>
-                                </efac:TouchPoint>
-                            </efac:Organization>
-                        </efac:Organizations>
-                    </efext:EformsExtension>
-                </ext:ExtensionContent>
-            </ext:UBLExtension>
-        </ext:UBLExtensions>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_touchpoint_streetline1.xml"
-    xml_file.write_text(xml_content)
-
-    # Run main and get result
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "parties" in result, "Expected 'parties' in result"
-    assert (
-        len(result["parties"]) == 1
-    ), f"Expected 1 party, got {len(result['parties'])}"
-
-    party = result["parties"][0]
-    assert party["id"] == "TPO-0001", f"Expected party id 'TPO-0001', got {party['id']}"
-    assert "address" in party, "Expected 'address' in party"
-    assert (
-        "streetAddress" in party["address"]
-    ), "Expected 'streetAddress' in party address"
-    expected_street_address = "2, rue de Europe, Building A, 3rd Floor"
-    assert (
-        party["address"]["streetAddress"] == expected_street_address
-    ), f"Expected street address '{expected_street_address}', got {party['address']['streetAddress']}"
-    assert "identifier" in party, "Expected 'identifier' in party"
-    assert (
-        party["identifier"]["id"] == "998298"
-    ), f"Expected identifier id '998298', got {party['identifier']['id']}"
-    assert (
-        party["identifier"]["scheme"] == "internal"
-    ), f"Expected identifier scheme 'internal', got {party['identifier']['scheme']}"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
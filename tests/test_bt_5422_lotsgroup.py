@@ -1,98 +0,0 @@
-# tests/test_bt_5422_lotsgroup.py
-import json
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import main
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*_release_0.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_5422_lotsgroup_integration(tmp_path, temp_output_dir) -> None:
-    xml_content = """
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
-          xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
-          xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
-          xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
-          xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <cbc:ID>notice-5422</cbc:ID>
-        <cbc:ContractFolderID>cf-5422</cbc:ContractFolderID>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cac:SubordinateAwardingCriterion>
-                            <ext:UBLExtensions>
-                                <ext:UBLExtension>
-                                    <ext:ExtensionContent>
-                                        <efext:EformsExtension>
-                                            <efac:AwardCriterionParameter>
-                                                <efbc:ParameterCode listName="number-fixed">total</efbc:ParameterCode>
-                                            </efac:AwardCriterionParameter>
-                                        </efext:EformsExtension>
-                                    </ext:ExtensionContent>
-                                </ext:UBLExtension>
-                            </ext:UBLExtensions>
-                        </cac:SubordinateAwardingCriterion>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_award_criterion_number_fixed_lotsgroup.xml"
-    xml_file.write_text(xml_content)
-
-    # Run main and get result
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 1
-    ), f"Expected 1 lot group, got {len(result['tender']['lotGroups'])}"
-
-    lot_group = result["tender"]["lotGroups"][0]
-    assert (
-        lot_group["id"] == "GLO-0001"
-    ), f"Expected lot group id 'GLO-0001', got {lot_group['id']}"
-    assert "awardCriteria" in lot_group, "Expected 'awardCriteria' in lot group"
-    assert (
-        "criteria" in lot_group["awardCriteria"]
-    ), "Expected 'criteria' in awardCriteria"
-    assert (
-        len(lot_group["awardCriteria"]["criteria"]) == 1
-    ), f"Expected 1 criterion, got {len(lot_group['awardCriteria']['criteria'])}"
-
-    criterion = lot_group["awardCriteria"]["criteria"][0]
-    assert "numbers" in criterion, "Expected 'numbers' in criterion"
-    assert (
-        len(criterion["numbers"]) == 1
-    ), f"Expected 1 number, got {len(criterion['numbers'])}"
-    assert (
-        criterion["numbers"][0]["fixed"] == "total"
-    ), f"Expected fixed value 'total', got {criterion['numbers'][0]['fixed']}"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
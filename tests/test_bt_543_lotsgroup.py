@@ -1,236 +0,0 @@
-# tests/test_bt_543_lotsgroup.py
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*_release_0.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_543_lotsgroup_integration(tmp_path, setup_logging, temp_output_dir) -> None:
-    logger = setup_logging
-    xml_content = """
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cbc:ID>notice-543</cbc:ID>
-        <cbc:ContractFolderID>cf-543</cbc:ContractFolderID>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cbc:CalculationExpression languageID="ENG">Price-quality score calculation is based on ...</cbc:CalculationExpression>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_award_criteria_complicated_lotsgroup.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 1
-    ), f"Expected 1 lot group, got {len(result['tender']['lotGroups'])}"
-
-    lot_group = result["tender"]["lotGroups"][0]
-    assert (
-        lot_group["id"] == "GLO-0001"
-    ), f"Expected lot group id 'GLO-0001', got {lot_group['id']}"
-    assert "awardCriteria" in lot_group, "Expected 'awardCriteria' in lot group"
-    assert (
-        "weightingDescription" in lot_group["awardCriteria"]
-    ), "Expected 'weightingDescription' in lot group awardCriteria"
-    expected_description = "Price-quality score calculation is based on ..."
-    assert (
-        lot_group["awardCriteria"]["weightingDescription"] == expected_description
-    ), f"Expected weightingDescription '{expected_description}', got {lot_group['awardCriteria']['weightingDescription']}"
-
-
-def test_bt_543_lotsgroup_multiple_groups(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cbc:ID>notice-543</cbc:ID>
-        <cbc:ContractFolderID>cf-543</cbc:ContractFolderID>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cbc:CalculationExpression languageID="ENG">Price-quality score calculation for group 1</cbc:CalculationExpression>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0002</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cbc:CalculationExpression languageID="ENG">Price-quality score calculation for group 2</cbc:CalculationExpression>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_multiple_lotsgroups.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 2
-    ), f"Expected 2 lot groups, got {len(result['tender']['lotGroups'])}"
-
-    for i, lot_group in enumerate(result["tender"]["lotGroups"], 1):
-        assert (
-            lot_group["id"] == f"GLO-000{i}"
-        ), f"Expected lot group id 'GLO-000{i}', got {lot_group['id']}"
-        assert (
-            "awardCriteria" in lot_group
-        ), f"Expected 'awardCriteria' in lot group {i}"
-        assert (
-            "weightingDescription" in lot_group["awardCriteria"]
-        ), f"Expected 'weightingDescription' in lot group {i} awardCriteria"
-        expected_description = f"Price-quality score calculation for group {i}"
-        assert (
-            lot_group["awardCriteria"]["weightingDescription"] == expected_description
-        ), f"Expected weightingDescription '{expected_description}', got {lot_group['awardCriteria']['weightingDescription']}"
-
-
-def test_bt_543_lotsgroup_missing_calculation_expression(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cbc:ID>notice-543</cbc:ID>
-        <cbc:ContractFolderID>cf-543</cbc:ContractFolderID>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <!-- CalculationExpression is missing -->
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_missing_calculation_expression.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 1
-    ), f"Expected 1 lot group, got {len(result['tender']['lotGroups'])}"
-
-    lot_group = result["tender"]["lotGroups"][0]
-    assert (
-        lot_group["id"] == "GLO-0001"
-    ), f"Expected lot group id 'GLO-0001', got {lot_group['id']}"
-    assert (
-        "awardCriteria" not in lot_group
-        or "weightingDescription" not in lot_group.get("awardCriteria", {})
-    ), "Did not expect 'weightingDescription' when CalculationExpression is missing"
-
-
-def test_bt_543_lotsgroup_empty_calculation_expression(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-    xml_content = """
-    <ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cbc:ID>notice-543</cbc:ID>
-        <cbc:ContractFolderID>cf-543</cbc:ContractFolderID>
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cbc:CalculationExpression languageID="ENG"></cbc:CalculationExpression>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractAwardNotice>
-    """
-    xml_file = tmp_path / "test_input_empty_calculation_expression.xml"
-    xml_file.write_text(xml_content)
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 1
-    ), f"Expected 1 lot group, got {len(result['tender']['lotGroups'])}"
-
-    lot_group = result["tender"]["lotGroups"][0]
-    assert (
-        lot_group["id"] == "GLO-0001"
-    ), f"Expected lot group id 'GLO-0001', got {lot_group['id']}"
-    assert (
-        "awardCriteria" not in lot_group
-        or "weightingDescription" not in lot_group.get("awardCriteria", {})
-    ), "Did not expect 'weightingDescription' when CalculationExpression is empty"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
@@ -45,26 +45,34 @@ def test_bt_636_lotresult_integration(tmp_path, setup_logging, temp_output_dir)
                           xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
                           xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
                           xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
-        <efac:NoticeResult>
-            <efac:LotResult>
-                <efac:AppealRequestsStatistics>
-                    <efbc:StatisticsCode listName="irregularity-type">unj-lim-subc</efbc:StatisticsCode>
-                    <efbc:StatisticsNumeric>2</efbc:StatisticsNumeric>
-                </efac:AppealRequestsStatistics>
-                <efac:TenderLot>
-                    <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
-                </efac:TenderLot>
-            </efac:LotResult>
-            <efac:LotResult>
-                <efac:AppealRequestsStatistics>
-                    <efbc:StatisticsCode listName="irregularity-type">ab-low</efbc:StatisticsCode>
-                    <efbc:StatisticsNumeric>3</efbc:StatisticsNumeric>
-                </efac:AppealRequestsStatistics>
-                <efac:TenderLot>
-                    <cbc:ID schemeName="Lot">LOT-0002</cbc:ID>
-                </efac:TenderLot>
-            </efac:LotResult>
-        </efac:NoticeResult>
+        <ext:UBLExtensions>
+            <ext:UBLExtension>
+                <ext:ExtensionContent>
+                    <efext:EformsExtension>
+                        <efac:NoticeResult>
+                            <efac:LotResult>
+                                <efac:AppealRequestsStatistics>
+                                    <efbc:StatisticsCode listName="irregularity-type">unj-lim-subc</efbc:StatisticsCode>
+                                    <efbc:StatisticsNumeric>2</efbc:StatisticsNumeric>
+                                </efac:AppealRequestsStatistics>
+                                <efac:TenderLot>
+                                    <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+                                </efac:TenderLot>
+                            </efac:LotResult>
+                            <efac:LotResult>
+                                <efac:AppealRequestsStatistics>
+                                    <efbc:StatisticsCode listName="irregularity-type">ab-low</efbc:StatisticsCode>
+                                    <efbc:StatisticsNumeric>3</efbc:StatisticsNumeric>
+                                </efac:AppealRequestsStatistics>
+                                <efac:TenderLot>
+                                    <cbc:ID schemeName="Lot">LOT-0002</cbc:ID>
+                                </efac:TenderLot>
+                            </efac:LotResult>
+                        </efac:NoticeResult>
+                    </efext:EformsExtension>
+                </ext:ExtensionContent>
+            </ext:UBLExtension>
+        </ext:UBLExtensions>
     </ContractAwardNotice>
     """
     xml_file = tmp_path / "test_input_buyer_review_requests_irregularity_type.xml"
@@ -8,11 +8,12 @@ from src.ted_and_doffin_to_ocds.converters.eforms.bt_682_tender import (
 
 def test_parse_foreign_subsidies_measures():
     xml_content = """
-    <ext:UBLExtensions xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    <ContractAwardNotice xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
                        xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
                        xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
                        xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
                        xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <ext:UBLExtensions>
         <ext:UBLExtension>
             <ext:ExtensionContent>
                 <efext:EformsExtension>
@@ -29,6 +30,7 @@ def test_parse_foreign_subsidies_measures():
             </ext:ExtensionContent>
         </ext:UBLExtension>
     </ext:UBLExtensions>
+    </ContractAwardNotice>
     """
     expected_result = {
         "bids": {
@@ -9,6 +9,8 @@ from src.ted_and_doffin_to_ocds.converters.eforms.bt_712b_lotresult import (
 )
 
 NAMESPACES = {
+    "ext": "urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2",
+    "efext": "http://data.europa.eu/p27/eforms-ubl-extensions/1",
     "efac": "http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1",
     "cbc": "urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2",
     "efbc": "http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1",
@@ -17,7 +19,14 @@ NAMESPACES = {
 
 def create_xml_content(lot_data):
     root = etree.Element("root", nsmap=NAMESPACES)
-    notice_result = etree.SubElement(root, f"{{{NAMESPACES['efac']}}}NoticeResult")
+    extension = root
+    for tag in ("ext:UBLExtensions", "ext:UBLExtension", "ext:ExtensionContent"):
+        prefix, name = tag.split(":")
+        extension = etree.SubElement(extension, f"{{{NAMESPACES[prefix]}}}{name}")
+    extension = etree.SubElement(extension, f"{{{NAMESPACES['efext']}}}EformsExtension")
+    notice_result = etree.SubElement(
+        extension, f"{{{NAMESPACES['efac']}}}NoticeResult"
+    )
 
     for lot_id, number in lot_data.items():
         lot_result = etree.SubElement(
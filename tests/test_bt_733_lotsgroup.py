@@ -1,87 +0,0 @@
-# tests/test_bt_733_LotsGroup.py
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_733_lots_group_integration(
-    tmp_path, setup_logging, temp_output_dir
-) -> None:
-    logger = setup_logging
-
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cbc:Description languageID="ENG">Each criterion is evaluated separately ...</cbc:Description>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractNotice>
-    """
-    xml_file = tmp_path / "test_input_lots_group_award_criteria_order_justification.xml"
-    xml_file.write_text(xml_content)
-    # logger.info("Created XML file at %s", xml_file) # Logging disabled
-    # logger.info("Output directory: %s", temp_output_dir) # Logging disabled
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lotGroups" in result["tender"], "Expected 'lotGroups' in tender"
-    assert (
-        len(result["tender"]["lotGroups"]) == 1
-    ), f"Expected 1 lot group, got {len(result['tender']['lotGroups'])}"
-
-    lot_group = result["tender"]["lotGroups"][0]
-    assert (
-        lot_group["id"] == "GLO-0001"
-    ), f"Expected lot group id 'GLO-0001', got {lot_group['id']}"
-    assert "awardCriteria" in lot_group, "Expected 'awardCriteria' in lot group"
-    assert (
-        "orderRationale" in lot_group["awardCriteria"]
-    ), "Expected 'orderRationale' in awardCriteria"
-    expected_rationale = "Each criterion is evaluated separately ..."
-    assert (
-        lot_group["awardCriteria"]["orderRationale"] == expected_rationale
-    ), f"Expected order rationale '{expected_rationale}', got '{lot_group['awardCriteria']['orderRationale']}'"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
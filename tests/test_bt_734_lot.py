@@ -1,91 +0,0 @@
-# tests/test_bt_734_Lot.py
-import json
-import logging
-import sys
-import tempfile
-from pathlib import Path
-
-import pytest
-
-# Add the parent directory to sys.path to import main
-sys.path.append(str(Path(__file__).parent.parent))
-from src.ted_and_doffin_to_ocds.main import configure_logging, main
-
-
-@pytest.fixture(scope="module")
-def setup_logging():
-    # Logging disabled for tests
-    logger = logging.getLogger(__name__)
-    logger.disabled = True
-    return logger
-
-
-@pytest.fixture
-def temp_output_dir():
-    with tempfile.TemporaryDirectory() as tmpdirname:
-        yield Path(tmpdirname)
-
-
-def run_main_and_get_result(xml_file, output_dir):
-    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
-    output_files = list(output_dir.glob("*.json"))
-    assert len(output_files) == 1, f"Expected 1 output file, got {len(output_files)}"
-    with output_files[0].open() as f:
-        return json.load(f)
-
-
-def test_bt_734_lot_integration(tmp_path, setup_logging, temp_output_dir) -> None:
-    logger = setup_logging
-
-    xml_content = """<?xml version="1.0" encoding="UTF-8"?>
-    <ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
-          xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
-          xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
-        <cac:ProcurementProjectLot>
-            <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
-            <cac:TenderingTerms>
-                <cac:AwardingTerms>
-                    <cac:AwardingCriterion>
-                        <cac:SubordinateAwardingCriterion>
-                            <cbc:Name languageID="ENG">Technical merit</cbc:Name>
-                        </cac:SubordinateAwardingCriterion>
-                        <cac:SubordinateAwardingCriterion>
-                            <cbc:Name languageID="ENG">Price</cbc:Name>
-                        </cac:SubordinateAwardingCriterion>
-                    </cac:AwardingCriterion>
-                </cac:AwardingTerms>
-            </cac:TenderingTerms>
-        </cac:ProcurementProjectLot>
-    </ContractNotice>
-    """
-    xml_file = tmp_path / "test_input_award_criterion_name.xml"
-    xml_file.write_text(xml_content)
-    # logger.info("Created XML file at %s", xml_file) # Logging disabled
-    # logger.info("Output directory: %s", temp_output_dir) # Logging disabled
-
-    result = run_main_and_get_result(xml_file, temp_output_dir)
-    # logger.info("Result: %s", json.dumps(result, indent=2) # Logging disabled)
-
-    assert "tender" in result, "Expected 'tender' in result"
-    assert "lots" in result["tender"], "Expected 'lots' in tender"
-    assert (
-        len(result["tender"]["lots"]) == 1
-    ), f"Expected 1 lot, got {len(result['tender']['lots'])}"
-
-    lot = result["tender"]["lots"][0]
-    assert lot["id"] == "LOT-0001", f"Expected lot id 'LOT-0001', got {lot['id']}"
-    assert "awardCriteria" in lot, "Expected 'awardCriteria' in lot"
-    assert "criteria" in lot["awardCriteria"], "Expected 'criteria' in awardCriteria"
-    assert (
-        len(lot["awardCriteria"]["criteria"]) == 2
-    ), f"Expected 2 criteria, got {len(lot['awardCriteria']['criteria'])}"
-
-    criteria_names = [c["name"] for c in lot["awardCriteria"]["criteria"]]
-    assert (
-        "Technical merit" in criteria_names
-    ), "Expected 'Technical merit' in criteria names"
-    assert "Price" in criteria_names, "Expected 'Price' in criteria names"
-
-
-if __name__ == "__main__":
-    pytest.main(["-v", "-s"])
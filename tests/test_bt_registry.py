@@ -0,0 +1,137 @@
+# tests/test_bt_registry.py
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.processors.bt_registry import (
+    BT_CONVERTERS,
+    ConverterSpec,
+    get_applicable_converters,
+    get_converters,
+)
+
+SRC_PATH = Path(__file__).parent.parent / "src"
+
+# Cold start budget of `python -m ted_and_doffin_to_ocds.main --help` (see
+# the README), and the bound the benchmark enforces. Lazy loading takes it to
+# about 0.1 s; loading every converter eagerly took about 0.8 s. The bound
+# leaves room for slow or busy machines.
+COLD_START_BUDGET_SECONDS = 0.5
+COLD_START_LIMIT_SECONDS = 4 * COLD_START_BUDGET_SECONDS
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "PYTHONPATH": str(SRC_PATH)}
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def test_registry_keeps_processing_order() -> None:
+    converters = get_converters()
+    assert converters is BT_CONVERTERS
+    assert converters[0].bt_id == "BT-01"
+    assert converters[-1].bt_id == "OPT-322"
+
+
+def test_registry_entries_are_unique() -> None:
+    section_names = [spec.section_name for spec in BT_CONVERTERS]
+    assert len(section_names) == len(set(section_names))
+    parse_funcs = [(spec.module, spec.parse) for spec in BT_CONVERTERS]
+    assert len(parse_funcs) == len(set(parse_funcs))
+
+
+@pytest.mark.parametrize("spec", BT_CONVERTERS, ids=lambda spec: spec.section_name)
+def test_registry_entry_loads(spec: ConverterSpec) -> None:
+    parse_func, merge_func = spec.load()
+    assert callable(parse_func)
+    assert callable(merge_func)
+    assert parse_func.__module__.endswith(spec.module)
+
+
+def test_applicable_converters_prune_award_scopes_on_pin_and_cn() -> None:
+    for root_tag, notice_type in [
+        ("PriorInformationNotice", "pin-only"),
+        ("ContractNotice", "cn-standard"),
+    ]:
+        scopes = {spec.scope for spec in get_applicable_converters(root_tag, notice_type)}
+        assert "Lot" in scopes
+        assert "Organization" in scopes
+        assert scopes.isdisjoint({"LotResult", "Tender", "Contract", "Tenderer"})
+
+    cn_scopes = {
+        spec.scope for spec in get_applicable_converters("ContractNotice", "cn-standard")
+    }
+    assert "Part" not in cn_scopes
+
+
+def test_applicable_converters_keep_award_scopes_on_can() -> None:
+    scopes = {
+        spec.scope
+        for spec in get_applicable_converters("ContractAwardNotice", "can-standard")
+    }
+    assert {"LotResult", "Tender", "Contract", "Tenderer"} <= scopes
+    assert "Part" not in scopes
+
+
+def test_applicable_converters_use_notice_type_code() -> None:
+    modification = {
+        spec.module
+        for spec in get_applicable_converters("ContractAwardNotice", "can-modif")
+    }
+    standard = {
+        spec.module
+        for spec in get_applicable_converters("ContractAwardNotice", "can-standard")
+    }
+    assert "bt_200_contract" in modification
+    assert "bt_200_contract" not in standard
+
+
+def test_applicable_converters_keep_order_and_undeclared_types() -> None:
+    applicable = get_applicable_converters("ContractNotice", "cn-standard")
+    positions = [BT_CONVERTERS.index(spec) for spec in applicable]
+    assert positions == sorted(positions)
+    assert get_applicable_converters("root", "cn-standard") == BT_CONVERTERS
+    assert get_applicable_converters("ContractNotice", "") == BT_CONVERTERS
+    assert get_applicable_converters("ContractNotice", "cn-standard") is applicable
+
+
+def test_load_is_lazy() -> None:
+    result = run_python(
+        "-c",
+        "import sys; import ted_and_doffin_to_ocds.main; "
+        "print(sum(m.startswith('ted_and_doffin_to_ocds.converters.eforms.') "
+        "for m in sys.modules))",
+    )
+    assert result.stdout.strip() == "0"
+
+
+def test_cli_cold_start_imports_no_converter() -> None:
+    # Loading every converter eagerly made `--help` about four times slower
+    result = run_python("-X", "importtime", "-m", "ted_and_doffin_to_ocds.main", "--help")
+    assert result.returncode == 0
+    assert "ted_and_doffin_to_ocds.processors.bt_registry" in result.stderr
+    assert "ted_and_doffin_to_ocds.converters.eforms." not in result.stderr
+
+
+@pytest.mark.slow
+def test_cli_cold_start_benchmark() -> None:
+    timings = []
+    for _ in range(5):
+        start = time.perf_counter()
+        run_python("-m", "ted_and_doffin_to_ocds.main", "--help")
+        timings.append(time.perf_counter() - start)
+    assert min(timings) < COLD_START_LIMIT_SECONDS, timings
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
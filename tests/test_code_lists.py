@@ -0,0 +1,50 @@
+# tests/test_code_lists.py
+
+import pytest
+
+from ted_and_doffin_to_ocds.utils.code_lists import (
+    COUNTRY_CODES,
+    LANGUAGE_CODES,
+    NON_PUBLICATION_JUSTIFICATION,
+    NUMBER_WEIGHT_CODES,
+    CodeList,
+)
+
+
+def test_code_list_forward_and_reverse_lookups() -> None:
+    assert COUNTRY_CODES["BEL"] == "BE"
+    assert COUNTRY_CODES["XKX"] == "XK"
+    assert COUNTRY_CODES.get("XEU", "XEU") == "XEU"
+    assert COUNTRY_CODES.has_value("BE")
+    assert not COUNTRY_CODES.has_value("BEL")
+    assert COUNTRY_CODES.reverse("LU") == "LUX"
+    assert COUNTRY_CODES.reverse("ZZ") is None
+
+    assert LANGUAGE_CODES["ALB"] == "sq"
+    assert NUMBER_WEIGHT_CODES["per-exa"] == "percentageExact"
+
+
+def test_code_list_keeps_first_code_of_shared_values() -> None:
+    code_list = CodeList("test", {"AAA": "A", "BBB": "A"})
+
+    assert code_list.reverse("A") == "AAA"
+    assert len(code_list) == 2
+    assert repr(code_list) == "CodeList('test', 2 codes)"
+
+
+def test_code_lists_are_read_only() -> None:
+    with pytest.raises(TypeError):
+        COUNTRY_CODES["BEL"] = "XX"  # type: ignore[index]
+    with pytest.raises(TypeError):
+        NON_PUBLICATION_JUSTIFICATION["oth-int"]["uri"] = ""  # type: ignore[index]
+
+
+def test_non_publication_justification() -> None:
+    assert NON_PUBLICATION_JUSTIFICATION["oth-int"] == {
+        "description": "Other public interest",
+        "uri": "http://publications.europa.eu/resource/authority/non-publication-justification/oth-int",
+    }
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,191 @@
+# tests/test_conversion_manifest.py
+
+import dataclasses
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter, parse_arguments, process_files
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.conversion_manifest import (
+    ConversionManifest,
+    converter_version,
+)
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+NOTICES = [
+    "can_24_minimal.xml",
+    "ContractNotice_cn-standard_2022-963627.xml",
+    "PriorInformationNotice_pin-buyer_2023-100372.xml",
+]
+
+
+@pytest.fixture
+def config(tmp_path) -> Config:
+    (tmp_path / "input").mkdir()
+    for name in NOTICES:
+        shutil.copy(XMLFILE_PATH / name, tmp_path / "input" / name)
+    return Config(
+        input_path=tmp_path / "input",
+        output_folder=tmp_path / "output",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+        workers=2,
+        zero_copy=True,
+    )
+
+
+def run(config: Config, fail: str | None = None) -> list[str]:
+    """Run a conversion and return the names of the files it converted.
+
+    The conversion of the file named fail raises an error.
+    """
+    converter = NoticeConverter(config)
+    converted = []
+    process_file = converter.process_file
+
+    def spy(input_path: Path, *args) -> list[Path]:
+        converted.append(input_path.name)
+        if input_path.name == fail:
+            msg = "Killed"
+            raise MemoryError(msg)
+        return process_file(input_path, *args)
+
+    converter.process_file = spy
+    try:
+        process_files(converter, config)
+    except RuntimeError:
+        if fail is None:
+            raise
+    return sorted(converted)
+
+
+def test_unchanged_files_are_skipped(config) -> None:
+    assert run(config) == sorted(NOTICES)
+    assert run(config) == []
+
+    changed = config.input_path / "can_24_minimal.xml"
+    changed.write_bytes(changed.read_bytes() + b"\n")
+    assert run(config) == ["can_24_minimal.xml"]
+
+
+def test_force_converts_every_file(config) -> None:
+    run(config)
+
+    assert run(dataclasses.replace(config, force=True)) == sorted(NOTICES)
+
+
+def test_files_are_converted_again_without_their_outputs(config, tmp_path) -> None:
+    run(config)
+    for output in config.output_folder.glob("can_24_minimal_release_*.json"):
+        output.unlink()
+
+    assert run(config) == ["can_24_minimal.xml"]
+    assert run(dataclasses.replace(config, output_folder=tmp_path / "other")) == sorted(
+        NOTICES
+    )
+
+
+def test_manifest_records_outputs(config) -> None:
+    run(config)
+
+    manifest = ConversionManifest(
+        config.db_path, config.output_folder, converter_version(config)
+    )
+    assert len(manifest) == len(NOTICES)
+    assert manifest.outputs("can_24_minimal.xml") == [
+        config.output_folder / "can_24_minimal_release_0.json"
+    ]
+    manifest.close()
+
+
+def test_file_status_is_recorded(config) -> None:
+    run(config, fail="can_24_minimal.xml")
+
+    manifest = ConversionManifest(
+        config.db_path, config.output_folder, converter_version(config)
+    )
+    assert manifest.status("can_24_minimal.xml") == ("failed", 1)
+    assert manifest.status("ContractNotice_cn-standard_2022-963627.xml") == (
+        "done",
+        1,
+    )
+    manifest.close()
+
+
+def test_resume_converts_only_the_files_left(config) -> None:
+    forced = dataclasses.replace(config, force=True)
+    run(forced)
+    assert run(forced, fail="can_24_minimal.xml") == sorted(NOTICES)
+
+    resumed = dataclasses.replace(forced, resume=True)
+    assert run(resumed) == ["can_24_minimal.xml"]
+    assert run(resumed) == []
+    assert run(forced) == sorted(NOTICES)
+
+    manifest = ConversionManifest(
+        config.db_path, config.output_folder, converter_version(config)
+    )
+    assert manifest.status("can_24_minimal.xml") == ("done", 1)
+    manifest.close()
+
+
+def test_resume_converts_files_without_outputs(config) -> None:
+    forced = dataclasses.replace(config, force=True)
+    run(forced)
+    for output in config.output_folder.glob("can_24_minimal_release_*.json"):
+        output.unlink()
+
+    assert run(dataclasses.replace(forced, resume=True)) == ["can_24_minimal.xml"]
+
+
+def test_streamed_files_are_converted_again(config) -> None:
+    streamed = dataclasses.replace(config, output_format="jsonl")
+
+    def release_ids() -> list[str]:
+        return sorted(
+            json.loads(line)["id"]
+            for path in config.output_folder.glob("*.jsonl")
+            for line in path.read_text(encoding="utf-8").splitlines()
+        )
+
+    assert run(streamed) == sorted(NOTICES)
+    releases = release_ids()
+    assert run(streamed) == sorted(NOTICES)
+    assert release_ids() == releases
+    assert run(dataclasses.replace(streamed, resume=True)) == []
+    assert release_ids() == releases
+
+
+def test_converter_version_covers_output_settings(config) -> None:
+    version = converter_version(config)
+
+    assert converter_version(dataclasses.replace(config, workers=8)) == version
+    assert converter_version(dataclasses.replace(config, ocid_prefix="x")) != version
+    assert (
+        converter_version(dataclasses.replace(config, output_format="jsonl")) != version
+    )
+
+
+def test_parse_arguments_force_and_resume(monkeypatch) -> None:
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "in", "out", "ocds-test", "--force", "--resume"]
+    )
+    config = parse_arguments()
+    assert config.force
+    assert config.resume
+
+    monkeypatch.setattr(sys, "argv", ["main.py", "in", "out", "ocds-test"])
+    config = parse_arguments()
+    assert not config.force
+    assert not config.resume
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,55 @@
+# tests/test_date_utils.py
+
+import pytest
+
+from ted_and_doffin_to_ocds.utils.date_utils import (
+    convert_dates_to_iso_format,
+    convert_to_iso_format,
+    end_date,
+    start_date,
+)
+
+
+@pytest.mark.parametrize(
+    ("date_string", "expected"),
+    [
+        ("2019-11-15+01:00", "2019-11-15T00:00:00+01:00"),
+        ("2019-11-15", "2019-11-15T00:00:00Z"),
+        ("2019-11-15Z", "2019-11-15T00:00:00Z"),
+        ("2019-11-15-0500", "2019-11-15T00:00:00-05:00"),
+        ("2019-11-15T10:30:00+02:00", "2019-11-15T10:30:00+02:00"),
+        ("2019-11-15 10:30:00.5Z", "2019-11-15T10:30:00.5Z"),
+    ],
+)
+def test_start_date(date_string: str, expected: str) -> None:
+    assert start_date(date_string) == expected
+
+
+def test_end_date() -> None:
+    assert end_date("2019-11-15+01:00") == "2019-11-15T23:59:59+01:00"
+    # Repeated values are served from the cache, for either kind of date
+    assert end_date("2019-11-15+01:00") == "2019-11-15T23:59:59+01:00"
+    assert start_date("2019-11-15+01:00") == "2019-11-15T00:00:00+01:00"
+
+
+def test_invalid_dates_raise_every_time() -> None:
+    for _ in range(2):
+        with pytest.raises(ValueError, match="Invalid date format"):
+            convert_to_iso_format("15/11/2019")
+        with pytest.raises(ValueError, match="Invalid end date format"):
+            end_date("not a date")
+
+
+def test_convert_dates_to_iso_format() -> None:
+    assert convert_dates_to_iso_format(
+        ["2019-11-15+01:00", "2020-01-01Z", "2019-11-15+01:00"], is_start_date=True
+    ) == [
+        "2019-11-15T00:00:00+01:00",
+        "2020-01-01T00:00:00Z",
+        "2019-11-15T00:00:00+01:00",
+    ]
+    assert convert_dates_to_iso_format([]) == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
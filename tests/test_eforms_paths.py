@@ -0,0 +1,281 @@
+# tests/test_eforms_paths.py
+
+import json
+import re
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.main import NoticeConverter
+from ted_and_doffin_to_ocds.processors.bt_registry import load_converters
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.eforms_paths import (
+    NOTICE_EXTENSION,
+    ChildPath,
+    anchor_path,
+    compile_child_path,
+    compile_path,
+)
+from ted_and_doffin_to_ocds.utils.notice_document import EFORMS_NAMESPACES
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import XPATHS
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+CORPUS = sorted(XMLFILE_PATH.glob("*.xml"))
+NAMESPACES = " ".join(
+    f'xmlns:{prefix}="{uri}"' for prefix, uri in EFORMS_NAMESPACES.items()
+)
+UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+NOTICE = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+    <cac:ProcurementProject>
+        <cbc:Name>Procedure</cbc:Name>
+    </cac:ProcurementProject>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:ProcurementProject>
+            <cbc:Name>First <!-- comment --> lot</cbc:Name>
+        </cac:ProcurementProject>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Part">PAR-0001</cbc:ID>
+        <cac:ProcurementProject>
+            <cbc:Name/>
+        </cac:ProcurementProject>
+    </cac:ProcurementProjectLot>
+</ContractNotice>
+"""
+
+
+@pytest.fixture
+def root() -> etree._Element:
+    return etree.fromstring(NOTICE.encode())
+
+
+@pytest.mark.parametrize(
+    ("expression", "anchored"),
+    [
+        (
+            "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+            "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        ),
+        (
+            "//cac:ProcurementProject/cbc:Name/text()",
+            "(/*/cac:ProcurementProject | /*/cac:ProcurementProjectLot/cac:ProcurementProject)"
+            "/cbc:Name/text()",
+        ),
+        (
+            "//efac:NoticeResult/efac:LotResult | //cbc:NoticeTypeCode",
+            f"{NOTICE_EXTENSION}/efac:NoticeResult/efac:LotResult | /*/cbc:NoticeTypeCode",
+        ),
+        (
+            "//ext:UBLExtensions/ext:UBLExtension/ext:ExtensionContent"
+            "/efext:EformsExtension/efac:Organizations/efac:Organization",
+            f"{NOTICE_EXTENSION}/efac:Organizations/efac:Organization",
+        ),
+        # Unknown elements, relative paths and literals are left alone
+        ("//efac:FieldsPrivacy", "//efac:FieldsPrivacy"),
+        (".//cac:ProcurementProjectLot", ".//cac:ProcurementProjectLot"),
+        ("cbc:ID[.='//cac:TenderingTerms']", "cbc:ID[.='//cac:TenderingTerms']"),
+        ("//cac:ProcurementProjectLotX", "//cac:ProcurementProjectLotX"),
+    ],
+)
+def test_anchor_path(expression, anchored) -> None:
+    assert anchor_path(expression) == anchored
+
+
+def test_compile_child_path(root) -> None:
+    lot_ids = compile_child_path(
+        "cac:ProcurementProjectLot/cbc:ID[@schemeName='Lot']/text()", EFORMS_NAMESPACES
+    )
+    names = compile_child_path(
+        "/*/cac:ProcurementProjectLot/cac:ProcurementProject/cbc:Name/text()",
+        EFORMS_NAMESPACES,
+    )
+
+    assert lot_ids(root) == ["LOT-0001"]
+    assert names(root[1]) == ["First ", " lot"]
+    assert names(etree.ElementTree(root)) == ["First ", " lot"]
+
+
+@pytest.mark.parametrize(
+    "expression",
+    [
+        "cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']",
+        "cac:ProcurementProjectLot[1]",
+        ".//cbc:ID",
+        "string(cbc:ID)",
+        "cbc:ID/@schemeName",
+        "*/cbc:ID",
+    ],
+)
+def test_compile_child_path_needs_xpath(expression) -> None:
+    assert compile_child_path(expression, EFORMS_NAMESPACES) is None
+
+
+def test_anchored_path_only_finds_eforms_locations() -> None:
+    root = etree.fromstring(
+        f"""<ContractAwardNotice {NAMESPACES}>
+        <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
+        <efext:EformsExtension>
+            <efac:NoticeResult><efac:LotResult/></efac:NoticeResult>
+        </efext:EformsExtension>
+        </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+        <efac:NoticeResult><efac:LotResult/></efac:NoticeResult>
+        </ContractAwardNotice>""".encode()
+    )
+    lot_results = compile_path("//efac:NoticeResult/efac:LotResult", EFORMS_NAMESPACES)
+
+    assert isinstance(lot_results, ChildPath)
+    assert lot_results(root) == [root[0][0][0][0][0][0]]
+
+
+# A notice with every element that the lot, contracting party and lot result
+# scans of the converters look for, where the eForms schema puts it
+SCANNED_NOTICE = f"""<ContractAwardNotice {NAMESPACES}>
+    <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
+    <efext:EformsExtension>
+        <efac:NoticeResult>
+            <efac:LotResult>
+                <efac:AppealRequestsStatistics>
+                    <efbc:StatisticsCode listName="irregularity-type">ab-low</efbc:StatisticsCode>
+                </efac:AppealRequestsStatistics>
+                <efac:AppealRequestsStatistics>
+                    <efbc:StatisticsCode listName="review-type">complainants</efbc:StatisticsCode>
+                </efac:AppealRequestsStatistics>
+            </efac:LotResult>
+        </efac:NoticeResult>
+    </efext:EformsExtension>
+    </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+    <cac:ContractingParty>
+        <cac:ContractingActivity>
+            <cbc:ActivityTypeCode listName="authority-activity">gas-oil</cbc:ActivityTypeCode>
+        </cac:ContractingActivity>
+    </cac:ContractingParty>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingProcess>
+            <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
+            <efext:EformsExtension>
+                <efac:InterestExpressionReceptionPeriod>
+                    <cbc:EndDate>2024-01-01+01:00</cbc:EndDate>
+                    <cbc:EndTime>12:00:00+01:00</cbc:EndTime>
+                </efac:InterestExpressionReceptionPeriod>
+            </efext:EformsExtension>
+            </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+            <cbc:CandidateReductionConstraintIndicator>true</cbc:CandidateReductionConstraintIndicator>
+            <cac:EconomicOperatorShortList>
+                <cbc:MinimumQuantity>3</cbc:MinimumQuantity>
+                <cbc:MaximumQuantity>5</cbc:MaximumQuantity>
+            </cac:EconomicOperatorShortList>
+        </cac:TenderingProcess>
+        <cac:TenderingTerms>
+            <cbc:VariantConstraintCode listName="permission">allowed</cbc:VariantConstraintCode>
+            <cac:AwardingTerms>
+                <cac:TechnicalCommitteePerson>
+                    <cbc:FamilyName>Smith</cbc:FamilyName>
+                </cac:TechnicalCommitteePerson>
+            </cac:AwardingTerms>
+        </cac:TenderingTerms>
+        <cac:ProcurementProject>
+            <cac:AdditionalCommodityClassification>
+                <cbc:ItemClassificationCode listName="cpv">45000000</cbc:ItemClassificationCode>
+            </cac:AdditionalCommodityClassification>
+            <cac:ContractExtension>
+                <cbc:OptionsDescription>Options</cbc:OptionsDescription>
+                <cbc:MaximumNumberNumeric>2</cbc:MaximumNumberNumeric>
+                <cac:Renewal><cac:Period><cbc:Description>Renewal</cbc:Description></cac:Period></cac:Renewal>
+            </cac:ContractExtension>
+        </cac:ProcurementProject>
+    </cac:ProcurementProjectLot>
+</ContractAwardNotice>"""
+
+# Whole-notice scans that used to search every descendant of the root
+SCANS = [
+    "bt_10.XPATH_AUTHORITY_ACTIVITY_TYPE_CODE",
+    "bt_263_lot.XPATH_LOT_ADDITIONAL_CLASSIFICATION_CODE",
+    "bt_46_lot.XPATH_LOT_TECHNICAL_COMMITTEE_PERSON_FAMILY_NAME",
+    "bt_50_lot.XPATH_LOT_MINIMUM_QUANTITY",
+    "bt_51_lot.XPATH_LOT_MAXIMUM_QUANTITY",
+    "bt_52_lot.XPATH_LOT_CANDIDATE_REDUCTION_CONSTRAINT_INDICATOR",
+    "bt_54_lot.XPATH_LOT_OPTIONS_DESCRIPTION",
+    "bt_57_lot.XPATH_LOT_RENEWAL_PERIOD_DESCRIPTION",
+    "bt_58_lot.XPATH_LOT_CONTRACT_EXTENSION_MAXIMUM_NUMBER_NUMERIC",
+    "bt_63_lot.XPATH_LOT_VARIANT_CONSTRAINT_CODE_PERMISSION",
+    "bt_635_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE",
+    "bt_636_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_IRREGULARITY_TYPE",
+    "bt_712a_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE",
+    "bt_712b_lotresult.XPATH_APPEAL_REQUESTS_STATISTICS_REVIEW_TYPE",
+    "bt_745_lot.XPATH_PROCUREMENT_PROJECT_LOT",
+    "bt_75_lot.XPATH_PROCUREMENT_PROJECT_LOT",
+]
+
+
+@pytest.mark.parametrize("name", SCANS)
+def test_scans_are_anchored(name) -> None:
+    load_converters()
+    root = etree.fromstring(SCANNED_NOTICE.encode())
+    entry = XPATHS[name]
+
+    assert "//" not in anchor_path(entry.expression)
+    assert entry(root)
+    with XPATHS.reference_mode():
+        expected = entry(root)
+    assert entry(root) == expected
+
+
+@pytest.fixture(scope="module")
+def catalogue() -> dict:
+    load_converters()
+    return dict(XPATHS._compiled)
+
+
+def contexts(root: etree._Element, evaluator: object) -> list[etree._Element]:
+    if getattr(evaluator, "absolute", True):
+        return [root]
+    # Relative child paths: every parent of an element matching the first step
+    parents = (element.getparent() for element in root.iter(evaluator.steps[0][0]))
+    return list(dict.fromkeys(parent for parent in parents if parent is not None))
+
+
+@pytest.mark.parametrize(
+    "path", [*CORPUS, None], ids=lambda path: path.name if path else "scanned"
+)
+def test_catalogue_matches_xpath_on_corpus(path, catalogue) -> None:
+    if path is None:
+        root = etree.fromstring(SCANNED_NOTICE.encode())
+    else:
+        root = etree.parse(str(path)).getroot()
+    for expression, (evaluator, reference) in catalogue.items():
+        if "$" in expression or getattr(evaluator, "path", None) == expression:
+            continue
+        for context in contexts(root, evaluator):
+            assert evaluator(context) == reference(context), expression
+
+
+def convert(path: Path, tmp_path: Path) -> str:
+    config = Config(
+        input_path=path,
+        output_folder=tmp_path,
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / f"{len(list(tmp_path.glob('*.db')))}.db",
+        clear_db=False,
+        log_level="INFO",
+    )
+    releases = NoticeConverter(config)._process_input_file(path.read_bytes())
+    return UUID.sub("UUID", json.dumps(releases, sort_keys=True))
+
+
+@pytest.mark.parametrize("path", CORPUS, ids=lambda path: path.name)
+def test_conversion_output_is_unchanged(path, tmp_path) -> None:
+    with XPATHS.reference_mode():
+        expected = convert(path, tmp_path)
+    assert convert(path, tmp_path) == expected
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,141 @@
+# tests/test_element_router.py
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.utils.element_router import ElementRouter, collect_elements
+from ted_and_doffin_to_ocds.utils.notice_document import NoticeDocument, qualify
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1">
+    <ext:UBLExtensions>
+        <ext:UBLExtension>
+            <ext:ExtensionContent>
+                <efext:EformsExtension>
+                    <efac:NoticeResult>
+                        <efac:LotResult><cbc:ID schemeName="result">RES-0001</cbc:ID></efac:LotResult>
+                        <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+                        <efac:LotResult><cbc:ID schemeName="result">RES-0002</cbc:ID></efac:LotResult>
+                    </efac:NoticeResult>
+                    <efac:Organizations>
+                        <efac:Organization><efac:Company/></efac:Organization>
+                    </efac:Organizations>
+                </efext:EformsExtension>
+            </ext:ExtensionContent>
+        </ext:UBLExtension>
+    </ext:UBLExtensions>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
+    </cac:ProcurementProjectLot>
+    <cac:Wrapper>
+        <cac:ProcurementProjectLot>
+            <cbc:ID schemeName="Lot">LOT-0002</cbc:ID>
+        </cac:ProcurementProjectLot>
+    </cac:Wrapper>
+    <efac:LotResult><cbc:ID schemeName="result">RES-0003</cbc:ID></efac:LotResult>
+</ContractAwardNotice>
+"""
+
+
+@pytest.fixture
+def document() -> NoticeDocument:
+    return NoticeDocument.from_content(XML_CONTENT)
+
+
+def ids(elements: list) -> list[str]:
+    return [element.findtext(qualify("cbc:ID")) for element in elements]
+
+
+def test_router_dispatches_in_document_order(document) -> None:
+    seen = []
+    router = ElementRouter()
+    router.register(qualify("efac:LotResult"), lambda e: seen.append(("r", ids([e])[0])))
+    router.register(qualify("efac:LotTender"), lambda e: seen.append(("t", ids([e])[0])))
+    router.register(qualify("efac:LotResult"), lambda _e: seen.append(("second", None)))
+    router.walk(document.root)
+
+    assert seen == [
+        ("r", "RES-0001"),
+        ("second", None),
+        ("t", "TEN-0001"),
+        ("r", "RES-0002"),
+        ("second", None),
+        ("r", "RES-0003"),
+        ("second", None),
+    ]
+
+
+def test_router_walks_tree_once(document, monkeypatch) -> None:
+    walks = []
+    original = etree.iterwalk
+
+    def counting_iterwalk(*args, **kwargs):
+        walks.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(etree, "iterwalk", counting_iterwalk)
+    collected = collect_elements(
+        document.root, [qualify("efac:LotResult"), qualify("efac:Organization")]
+    )
+
+    assert len(walks) == 1
+    assert len(collected[qualify("efac:LotResult")]) == 3
+    assert len(collected[qualify("efac:Organization")]) == 1
+
+
+def test_router_without_handlers_does_nothing(document) -> None:
+    ElementRouter().walk(document.root)
+
+
+@pytest.mark.parametrize(
+    ("tag", "parent", "xpath"),
+    [
+        ("efac:LotResult", None, "//efac:LotResult"),
+        ("efac:LotResult", "efac:NoticeResult", "//efac:NoticeResult/efac:LotResult"),
+        ("efac:LotTender", "efac:NoticeResult", "//efac:NoticeResult/efac:LotTender"),
+        (
+            "efac:Organization",
+            "efac:Organizations",
+            "//efac:Organizations/efac:Organization",
+        ),
+        ("efac:Company", None, "//efac:Company"),
+    ],
+)
+def test_elements_matches_xpath(document, tag, parent, xpath) -> None:
+    expected = document.root.xpath(xpath, namespaces=document.namespaces)
+    assert document.elements(tag, parent=parent) == expected
+
+
+@pytest.mark.parametrize(
+    ("scheme_name", "top_level", "xpath"),
+    [
+        ("Lot", False, "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']"),
+        ("Lot", True, "/*/cac:ProcurementProjectLot[cbc:ID/@schemeName='Lot']"),
+        ("LotsGroup", False, "//cac:ProcurementProjectLot[cbc:ID/@schemeName='LotsGroup']"),
+        ("Part", False, "//cac:ProcurementProjectLot[cbc:ID/@schemeName='Part']"),
+    ],
+)
+def test_procurement_project_lots_matches_xpath(
+    document, scheme_name, top_level, xpath
+) -> None:
+    expected = document.root.xpath(xpath, namespaces=document.namespaces)
+    result = document.procurement_project_lots(scheme_name, top_level=top_level)
+    assert result == expected
+
+
+def test_elements_returns_independent_lists(document) -> None:
+    first = document.elements("efac:LotResult")
+    first.clear()
+    assert len(document.elements("efac:LotResult")) == 3
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
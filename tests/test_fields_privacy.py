@@ -0,0 +1,420 @@
+# tests/test_fields_privacy.py
+
+import json
+
+import pytest
+
+from ted_and_doffin_to_ocds.converters.eforms.fields_privacy import (
+    FIELDS_PRIVACY,
+    merge_fields_privacy,
+    parse_fields_privacy,
+)
+from ted_and_doffin_to_ocds.main import main
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <ext:UBLExtensions>
+        <ext:UBLExtension>
+            <ext:ExtensionContent>
+                <efext:EformsExtension>
+                    <efac:NoticeResult>
+                        <efac:LotResult>
+                            <cbc:ID schemeName="result">RES-0001</cbc:ID>
+                            <efac:FieldsPrivacy>
+                                <efbc:FieldIdentifierCode>win-cho</efbc:FieldIdentifierCode>
+                                <efbc:ReasonDescription languageID="ENG">Delayed</efbc:ReasonDescription>
+                                <efbc:ReasonDescription languageID="FRA">Retardé</efbc:ReasonDescription>
+                                <cbc:ReasonCode listName="non-publication-justification">oth-int</cbc:ReasonCode>
+                                <efbc:PublicationDate>2025-03-31+01:00</efbc:PublicationDate>
+                            </efac:FieldsPrivacy>
+                        </efac:LotResult>
+                        <efac:LotTender>
+                            <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+                            <efac:FieldsPrivacy>
+                                <efbc:FieldIdentifierCode>ten-ran</efbc:FieldIdentifierCode>
+                            </efac:FieldsPrivacy>
+                        </efac:LotTender>
+                    </efac:NoticeResult>
+                </efext:EformsExtension>
+            </ext:ExtensionContent>
+        </ext:UBLExtension>
+    </ext:UBLExtensions>
+    <cbc:ContractFolderID>1e86a664-ae3c-41eb-8529-0242ac130003</cbc:ContractFolderID>
+    <cac:TenderingProcess>
+        <cbc:ProcedureCode listName="procurement-procedure-type">open
+            <ext:UBLExtensions>
+                <ext:UBLExtension>
+                    <ext:ExtensionContent>
+                        <efext:EformsExtension>
+                            <efac:FieldsPrivacy>
+                                <efbc:FieldIdentifierCode>pro-typ</efbc:FieldIdentifierCode>
+                                <cbc:ReasonCode listName="non-publication-justification">unknown</cbc:ReasonCode>
+                            </efac:FieldsPrivacy>
+                            <efac:FieldsPrivacy>
+                                <efbc:FieldIdentifierCode>not-a-field</efbc:FieldIdentifierCode>
+                            </efac:FieldsPrivacy>
+                        </efext:EformsExtension>
+                    </ext:ExtensionContent>
+                </ext:UBLExtension>
+            </ext:UBLExtensions>
+        </cbc:ProcedureCode>
+    </cac:TenderingProcess>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:AwardingTerms>
+                <cac:AwardingCriterion>
+                    <cac:SubordinateAwardingCriterion>
+                        <ext:UBLExtensions>
+                            <ext:UBLExtension>
+                                <ext:ExtensionContent>
+                                    <efext:EformsExtension>
+                                        <efac:AwardCriterionParameter>
+                                            <efbc:ParameterCode listName="number-weight">per-exa</efbc:ParameterCode>
+                                            <efac:FieldsPrivacy>
+                                                <efbc:FieldIdentifierCode>awa-cri-num</efbc:FieldIdentifierCode>
+                                            </efac:FieldsPrivacy>
+                                        </efac:AwardCriterionParameter>
+                                    </efext:EformsExtension>
+                                </ext:ExtensionContent>
+                            </ext:UBLExtension>
+                        </ext:UBLExtensions>
+                    </cac:SubordinateAwardingCriterion>
+                </cac:AwardingCriterion>
+            </cac:AwardingTerms>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+</ContractAwardNotice>
+"""
+
+
+def test_parse_fields_privacy_maps_every_scope() -> None:
+    result = parse_fields_privacy(XML_CONTENT)
+
+    # Document order, unknown field identifier codes are skipped
+    assert result["withheldInformation"] == [
+        {
+            "id": "win-cho-RES-0001",
+            "field": "win-cho",
+            "name": "Winner Chosen",
+            "rationale": {"ENG": "Delayed", "FRA": "Retardé"},
+            "rationaleClassifications": [
+                {
+                    "scheme": "eu-non-publication-justification",
+                    "id": "oth-int",
+                    "description": "Other public interest",
+                    "uri": "http://publications.europa.eu/resource/authority/non-publication-justification/oth-int",
+                }
+            ],
+            "availabilityDate": "2025-03-31T00:00:00+01:00",
+        },
+        {"id": "ten-ran-TEN-0001", "field": "ten-ran", "name": "Tender Rank"},
+        {
+            "id": "pro-typ-1e86a664-ae3c-41eb-8529-0242ac130003",
+            "field": "pro-typ",
+            "name": "Procedure Type",
+        },
+        {
+            "id": "awa-cri-num-weight-GLO-0001",
+            "field": "awa-cri-num",
+            "name": "Award Criterion Number Weight",
+        },
+    ]
+
+
+def test_parse_fields_privacy_without_fields_privacy() -> None:
+    xml_content = """<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"/>"""
+
+    assert parse_fields_privacy(xml_content) is None
+
+
+def test_parse_fields_privacy_keeps_unidentified_items_apart() -> None:
+    xml_content = """<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <efac:LotTender>
+        <efac:FieldsPrivacy>
+            <efbc:FieldIdentifierCode>ten-ran</efbc:FieldIdentifierCode>
+            <efbc:ReasonDescription>First</efbc:ReasonDescription>
+        </efac:FieldsPrivacy>
+    </efac:LotTender>
+    <efac:LotTender>
+        <efac:FieldsPrivacy>
+            <efbc:FieldIdentifierCode>ten-ran</efbc:FieldIdentifierCode>
+            <efbc:ReasonDescription>Second</efbc:ReasonDescription>
+        </efac:FieldsPrivacy>
+    </efac:LotTender>
+</ContractAwardNotice>"""
+    release_json = {}
+
+    merge_fields_privacy(release_json, parse_fields_privacy(xml_content))
+
+    assert release_json["withheldInformation"] == [
+        {"id": "ten-ran-1", "field": "ten-ran", "name": "Tender Rank", "rationale": "First"},
+        {"id": "ten-ran-2", "field": "ten-ran", "name": "Tender Rank", "rationale": "Second"},
+    ]
+
+
+def test_merge_fields_privacy_updates_items_by_id() -> None:
+    release_json = {
+        "withheldInformation": [
+            {"id": "ten-ran-TEN-0001", "field": "ten-ran", "rationale": "Old"}
+        ]
+    }
+
+    merge_fields_privacy(release_json, parse_fields_privacy(XML_CONTENT))
+
+    withheld_information = release_json["withheldInformation"]
+    assert [item["id"] for item in withheld_information] == [
+        "ten-ran-TEN-0001",
+        "win-cho-RES-0001",
+        "pro-typ-1e86a664-ae3c-41eb-8529-0242ac130003",
+        "awa-cri-num-weight-GLO-0001",
+    ]
+    assert withheld_information[0] == {
+        "id": "ten-ran-TEN-0001",
+        "field": "ten-ran",
+        "name": "Tender Rank",
+        "rationale": "Old",
+    }
+
+
+NAMESPACES = """xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1\""""
+
+FOLDER_ID = "18d27a53-0109-4f93-9231-6659d931bce0"
+
+
+def extension(content: str) -> str:
+    return (
+        "<ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>"
+        f"<efext:EformsExtension>{content}</efext:EformsExtension>"
+        "</ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>"
+    )
+
+
+def fields_privacy(field_code: str) -> str:
+    return f"""<efac:FieldsPrivacy>
+        <efbc:FieldIdentifierCode>{field_code}</efbc:FieldIdentifierCode>
+        <efbc:ReasonDescription languageID="ENG">Information delayed</efbc:ReasonDescription>
+        <efbc:ReasonDescription languageID="FRA">Information différée</efbc:ReasonDescription>
+        <cbc:ReasonCode listName="non-publication-justification">oth-int</cbc:ReasonCode>
+        <efbc:PublicationDate>2025-03-31+01:00</efbc:PublicationDate>
+    </efac:FieldsPrivacy>"""
+
+
+def notice(field_code: str, owner: str, number: str | None = None) -> str:
+    """Return a notice withholding a field of the owner, as in the eForms SDK."""
+    privacy = fields_privacy(field_code)
+    if owner == "Procedure":
+        body = f"""<cbc:ContractFolderID>{FOLDER_ID}</cbc:ContractFolderID>
+        <cac:TenderingProcess>
+            <cbc:ProcedureCode listName="procurement-procedure-type">open{extension(privacy)}</cbc:ProcedureCode>
+        </cac:TenderingProcess>"""
+    elif owner.startswith(("LOT-", "GLO-")):
+        scheme = "Lot" if owner.startswith("LOT-") else "LotsGroup"
+        if number is not None:
+            privacy = f"""<efac:AwardCriterionParameter>
+                <efbc:ParameterCode listName="number-{number}">per-exa</efbc:ParameterCode>
+                {privacy}
+            </efac:AwardCriterionParameter>"""
+        body = f"""<cac:ProcurementProjectLot>
+            <cbc:ID schemeName="{scheme}">{owner}</cbc:ID>
+            <cac:TenderingTerms><cac:AwardingTerms><cac:AwardingCriterion>
+                <cac:SubordinateAwardingCriterion>{extension(privacy)}</cac:SubordinateAwardingCriterion>
+            </cac:AwardingCriterion></cac:AwardingTerms></cac:TenderingTerms>
+        </cac:ProcurementProjectLot>"""
+    else:
+        element = "efac:LotResult" if owner.startswith("RES-") else "efac:LotTender"
+        result = f"""<efac:NoticeResult>
+            <{element}><cbc:ID>{owner}</cbc:ID>{privacy}</{element}>
+        </efac:NoticeResult>"""
+        body = extension(result)
+    return f"""<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    {NAMESPACES}>{body}</ContractAwardNotice>"""
+
+
+# field code, owner, kind of BT-541 number, expected id, expected name
+WITHHELD_FIELDS = [
+    ("cro-bor-law", "Procedure", None, f"cro-bor-law-{FOLDER_ID}", "Cross Border Law"),
+    ("pro-typ", "Procedure", None, f"pro-typ-{FOLDER_ID}", "Procedure Type"),
+    ("pro-acc", "Procedure", None, f"pro-acc-{FOLDER_ID}", "Procedure Accelerated"),
+    ("pro-acc-jus", "Procedure", None, f"pro-acc-jus-{FOLDER_ID}", "Procedure Accelerated Justification"),
+    ("pro-fea", "Procedure", None, f"pro-fea-{FOLDER_ID}", "Procedure Features"),
+    ("dir-awa-tex", "Procedure", None, f"dir-awa-tex-{FOLDER_ID}", "Direct Award Justification"),
+    ("dir-awa-jus", "Procedure", None, f"dir-awa-jus-{FOLDER_ID}", "Direct Award Justification"),
+    (
+        "dir-awa-pre",
+        "Procedure",
+        None,
+        f"dir-awa-pre-{FOLDER_ID}",
+        "Direct Award Justification Previous Procedure Identifier",
+    ),
+    ("awa-cri-typ", "LOT-0001", None, "awa-cri-typ-LOT-0001", "Award Criterion Type"),
+    ("awa-cri-typ", "GLO-0001", None, "awa-cri-typ-GLO-0001", "Award Criterion Type"),
+    ("awa-cri-des", "LOT-0001", None, "awa-cri-des-LOT-0001", "Award Criterion Description"),
+    ("awa-cri-des", "GLO-0001", None, "awa-cri-des-GLO-0001", "Award Criterion Description"),
+    ("awa-cri-num", "LOT-0001", "fixed", "awa-cri-num-fixed-LOT-0001", "Award Criterion Number Fixed"),
+    ("awa-cri-num", "LOT-0001", "threshold", "awa-cri-num-threshold-LOT-0001", "Award Criterion Number Threshold"),
+    ("awa-cri-num", "LOT-0001", "weight", "awa-cri-num-weight-LOT-0001", "Award Criterion Number Weight"),
+    ("awa-cri-num", "GLO-0001", "fixed", "awa-cri-num-fixed-GLO-0001", "Award Criterion Number Fixed"),
+    ("awa-cri-num", "GLO-0001", "threshold", "awa-cri-num-threshold-GLO-0001", "Award Criterion Number Threshold"),
+    ("awa-cri-num", "GLO-0001", "weight", "awa-cri-num-weight-GLO-0001", "Award Criterion Number Weight"),
+    ("awa-cri-wei", "LOT-0001", None, "awa-cri-wei-LOT-0001", "Award Criterion Number Weight"),
+    ("awa-cri-wei", "GLO-0001", None, "awa-cri-wei-GLO-0001", "Award Criterion Number Weight"),
+    ("awa-cri-fix", "LOT-0001", None, "awa-cri-fix-LOT-0001", "Award Criterion Number Fixed"),
+    ("awa-cri-fix", "GLO-0001", None, "awa-cri-fix-GLO-0001", "Award Criterion Number Fixed"),
+    ("awa-cri-thr", "LOT-0001", None, "awa-cri-thr-LOT-0001", "Award Criterion Number Threshold"),
+    ("awa-cri-thr", "GLO-0001", None, "awa-cri-thr-GLO-0001", "Award Criterion Number Threshold"),
+    ("awa-cri-com", "LOT-0001", None, "awa-cri-com-LOT-0001", "Award Criteria Complicated"),
+    ("awa-cri-com", "GLO-0001", None, "awa-cri-com-GLO-0001", "Award Criteria Complicated"),
+    ("awa-cri-ord", "LOT-0001", None, "awa-cri-ord-LOT-0001", "Award Criteria Order Justification"),
+    ("awa-cri-ord", "GLO-0001", None, "awa-cri-ord-GLO-0001", "Award Criteria Order Justification"),
+    ("awa-cri-nam", "LOT-0001", None, "awa-cri-nam-LOT-0001", "Award Criterion Name"),
+    ("awa-cri-nam", "GLO-0001", None, "awa-cri-nam-GLO-0001", "Award Criterion Name"),
+    ("win-cho", "RES-0001", None, "win-cho-RES-0001", "Winner Chosen"),
+    ("no-awa-rea", "RES-0001", None, "no-awa-rea-RES-0001", "Not Awarded Reason"),
+    ("buy-rev-cou", "RES-0001", None, "buy-rev-cou-RES-0001", "Buyer Review Request Count"),
+    ("buy-rev-typ", "RES-0001", None, "buy-rev-typ-RES-0001", "Buyer Review Request Irregularity Type"),
+    ("ree-val", "RES-0001", None, "ree-val-RES-0001", "Framework Re-estimated Value"),
+    ("max-val", "RES-0001", None, "max-val-RES-0001", "Maximum Value"),
+    ("ten-val-low", "RES-0001", None, "ten-val-low-RES-0001", "Tender Lowest Value"),
+    ("ten-val-hig", "RES-0001", None, "ten-val-hig-RES-0001", "Tender Highest Value"),
+    ("rev-req", "RES-0001", None, "rev-req-RES-0001", "Buyer Review Complainants"),
+    ("rec-sub-cou", "RES-0001", None, "rec-sub-cou-RES-0001", "Received Submissions Count"),
+    ("rec-sub-typ", "RES-0001", None, "rec-sub-typ-RES-0001", "Received Submissions Type"),
+    ("con-rev-buy", "TEN-0001", None, "con-rev-buy-TEN-0001", "Concession Revenue Buyer"),
+    ("con-rev-use", "TEN-0001", None, "con-rev-use-TEN-0001", "Concession Revenue User"),
+    ("val-con-des", "TEN-0001", None, "val-con-des-TEN-0001", "Concession Value Description"),
+    ("ten-ran", "TEN-0001", None, "ten-ran-TEN-0001", "Tender Rank"),
+    ("cou-ori", "TEN-0001", None, "cou-ori-TEN-0001", "Country Origin"),
+    ("win-ten-var", "TEN-0001", None, "win-ten-var-TEN-0001", "Winning Tender Variant"),
+    ("win-ten-val", "TEN-0001", None, "win-ten-val-TEN-0001", "Winning Tender Value"),
+    ("sub-con", "TEN-0001", None, "sub-con-TEN-0001", "Subcontracting"),
+    ("sub-val", "TEN-0001", None, "sub-val-TEN-0001", "Subcontracting Value"),
+    ("sub-des", "TEN-0001", None, "sub-des-TEN-0001", "Subcontracting Description"),
+    ("sub-per", "TEN-0001", None, "sub-per-TEN-0001", "Subcontracting Percentage"),
+]
+
+
+@pytest.mark.parametrize(
+    ("field_code", "owner", "number", "item_id", "name"), WITHHELD_FIELDS
+)
+def test_parse_fields_privacy_maps_each_field(
+    field_code, owner, number, item_id, name
+) -> None:
+    result = parse_fields_privacy(notice(field_code, owner, number))
+
+    expected = {"id": item_id, "field": field_code, "name": name}
+    expected["rationale"] = {"ENG": "Information delayed", "FRA": "Information différée"}
+    expected["rationaleClassifications"] = [
+        {
+            "scheme": "non-publication-justification"
+            if field_code == "cro-bor-law"
+            else "eu-non-publication-justification",
+            "id": "oth-int",
+            "description": "Other public interest",
+            "uri": "http://publications.europa.eu/resource/authority/non-publication-justification/oth-int",
+        }
+    ]
+    expected["availabilityDate"] = "2025-03-31T00:00:00+01:00"
+    assert result == {"withheldInformation": [expected]}
+
+
+def test_every_field_is_tested() -> None:
+    assert {row[0] for row in WITHHELD_FIELDS} == set(FIELDS_PRIVACY)
+
+
+def test_parse_fields_privacy_keeps_one_item_per_owner() -> None:
+    xml_content = notice("sub-per", "TEN-0001").replace(
+        "</efac:NoticeResult>",
+        f"<efac:LotTender><cbc:ID>TEN-0002</cbc:ID>{fields_privacy('sub-per')}</efac:LotTender>"
+        "</efac:NoticeResult>",
+    )
+
+    result = parse_fields_privacy(xml_content)
+
+    assert [item["id"] for item in result["withheldInformation"]] == [
+        "sub-per-TEN-0001",
+        "sub-per-TEN-0002",
+    ]
+
+
+def test_parse_fields_privacy_skips_invalid_codes_and_dates() -> None:
+    xml_content = (
+        notice("win-cho", "RES-0001")
+        .replace(">oth-int<", ">not-a-code<")
+        .replace("2025-03-31+01:00", "not-a-date")
+    )
+
+    (item,) = parse_fields_privacy(xml_content)["withheldInformation"]
+
+    assert "rationaleClassifications" not in item
+    assert "availabilityDate" not in item
+
+
+def test_fields_privacy_integration(tmp_path) -> None:
+    xml_file = tmp_path / "test_input_fields_privacy.xml"
+    xml_file.write_text(notice("win-cho", "RES-0001"), encoding="utf-8")
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
+
+    (output_file,) = output_dir.glob("*.json")
+    release = json.loads(output_file.read_text(encoding="utf-8"))
+    assert release["withheldInformation"] == parse_fields_privacy(
+        notice("win-cho", "RES-0001")
+    )["withheldInformation"]
+
+
+@pytest.mark.parametrize(
+    ("field_code", "list_name"),
+    [
+        ("dir-awa-pre", "direct-award-justification"),
+        ("pro-acc-jus", "accelerated-procedure"),
+    ],
+)
+def test_process_justification_integration(tmp_path, field_code, list_name) -> None:
+    # BT-196 of BT-1252 and BT-1351 is the rationale of the single item
+    justification = f"""<cbc:ContractFolderID>{FOLDER_ID}</cbc:ContractFolderID>
+        <cac:TenderingProcess>
+            <cac:ProcessJustification>
+                <cbc:ProcessReasonCode listName="{list_name}">some-code</cbc:ProcessReasonCode>
+                {extension(fields_privacy(field_code))}
+            </cac:ProcessJustification>
+        </cac:TenderingProcess>"""
+    xml_file = tmp_path / "test_input_process_justification.xml"
+    xml_file.write_text(
+        f"""<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    {NAMESPACES}>{justification}</ContractNotice>""",
+        encoding="utf-8",
+    )
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
+
+    (output_file,) = output_dir.glob("*.json")
+    release = json.loads(output_file.read_text(encoding="utf-8"))
+    (item,) = release["withheldInformation"]
+    assert item["id"] == f"{field_code}-{FOLDER_ID}"
+    assert item["rationale"] == {
+        "ENG": "Information delayed",
+        "FRA": "Information différée",
+    }
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
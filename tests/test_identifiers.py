@@ -0,0 +1,163 @@
+# tests/test_identifiers.py
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter, parse_arguments, process_files
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.identifiers import (
+    deterministic_ids_enabled,
+    new_id,
+    new_ocid,
+    use_deterministic_ids,
+)
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+SRC_PATH = Path(__file__).parent.parent / "src"
+NOTICES = [
+    "can_24_maximal.xml",
+    "ContractAwardNotice_can-modif_2023-101032.xml",
+    "PriorInformationNotice_pin-buyer_2023-100372.xml",
+]
+# Two lots share one procurement document, so its relatedLots are merged.
+# Hash seeds 0 and 5 iterate a set of the two lot ids in different orders.
+SHARED_DOCUMENT_NOTICE = "ContractNotice_cn-social_2023-629257.xml"
+HASH_SEEDS = ("0", "5")
+
+
+@pytest.fixture(autouse=True)
+def _random_ids_afterwards():
+    yield
+    use_deterministic_ids(False)
+
+
+def test_deterministic_ids() -> None:
+    use_deterministic_ids()
+
+    assert deterministic_ids_enabled()
+    assert new_id("notice", "BT-200-Contract", "0") == new_id(
+        "notice", "BT-200-Contract", "0"
+    )
+    assert new_id("notice", "BT-200-Contract", "0") != new_id(
+        "notice", "BT-201-Contract", "0"
+    )
+    assert uuid.UUID(new_id("notice")).version == 5
+    assert new_ocid("ocds-a", "notice") != new_ocid("ocds-b", "notice")
+    assert new_ocid("ocds-a", "notice").startswith("ocds-a-")
+
+
+def test_random_ids() -> None:
+    use_deterministic_ids(False)
+
+    assert not deterministic_ids_enabled()
+    assert new_id("notice") != new_id("notice")
+    assert uuid.UUID(new_id("notice")).version == 4
+
+
+def run(tmp_path: Path, name: str, *, deterministic_ids: bool) -> dict[str, str]:
+    input_folder = tmp_path / "input"
+    if not input_folder.exists():
+        input_folder.mkdir()
+        for notice in NOTICES:
+            shutil.copy(XMLFILE_PATH / notice, input_folder / notice)
+    config = Config(
+        input_path=input_folder,
+        output_folder=tmp_path / name,
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / f"{name}.db",
+        clear_db=False,
+        log_level="INFO",
+        zero_copy=True,
+        deterministic_ids=deterministic_ids,
+    )
+    process_files(NoticeConverter(config), config)
+    return {
+        path.name: path.read_text(encoding="utf-8")
+        for path in sorted(config.output_folder.glob("*.json"))
+    }
+
+
+def test_deterministic_ids_give_identical_output(tmp_path) -> None:
+    first = run(tmp_path, "first", deterministic_ids=True)
+    second = run(tmp_path, "second", deterministic_ids=True)
+
+    assert len(first) >= len(NOTICES)
+    assert first == second
+    releases = [json.loads(release) for release in first.values()]
+    assert any(
+        amendment["id"]
+        for release in releases
+        for contract in release.get("contracts", [])
+        for amendment in contract.get("amendments", [])
+    )
+    assert any(
+        finance["id"]
+        for release in releases
+        for finance in release.get("planning", {}).get("budget", {}).get("finance", [])
+    )
+
+
+def test_random_ids_differ_between_runs(tmp_path) -> None:
+    assert run(tmp_path, "first", deterministic_ids=False) != run(
+        tmp_path, "second", deterministic_ids=False
+    )
+
+
+def run_cli(tmp_path: Path, name: str, hash_seed: str) -> dict[str, bytes]:
+    input_folder = tmp_path / "input"
+    if not input_folder.exists():
+        input_folder.mkdir()
+        for notice in [*NOTICES, SHARED_DOCUMENT_NOTICE]:
+            shutil.copy(XMLFILE_PATH / notice, input_folder / notice)
+    workdir = tmp_path / f"{name}-run"
+    workdir.mkdir()
+    env = {**os.environ, "PYTHONPATH": str(SRC_PATH), "PYTHONHASHSEED": hash_seed}
+    subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "ted_and_doffin_to_ocds.main",
+            str(input_folder),
+            str(tmp_path / name),
+            "ocds-test",
+            "--deterministic-ids",
+        ],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        check=True,
+    )
+    return {
+        path.name: path.read_bytes()
+        for path in sorted((tmp_path / name).glob("*.json"))
+    }
+
+
+def test_deterministic_ids_ignore_hash_seed(tmp_path) -> None:
+    first = run_cli(tmp_path, "first", HASH_SEEDS[0])
+    second = run_cli(tmp_path, "second", HASH_SEEDS[1])
+
+    assert len(first) > len(NOTICES)
+    assert first == second
+
+
+def test_parse_arguments_deterministic_ids(monkeypatch) -> None:
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "in", "out", "ocds-test", "--deterministic-ids"]
+    )
+    assert parse_arguments().deterministic_ids
+
+    monkeypatch.setattr(sys, "argv", ["main.py", "in", "out", "ocds-test"])
+    assert not parse_arguments().deterministic_ids
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
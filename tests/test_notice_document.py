@@ -0,0 +1,178 @@
+# tests/test_notice_document.py
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.converters.eforms.bt_21_lot import parse_lot_title
+from ted_and_doffin_to_ocds.processors.bt_processors import process_bt_sections
+from ted_and_doffin_to_ocds.utils.notice_document import (
+    EFORMS_NAMESPACES,
+    NoticeDocument,
+    get_document,
+    get_root,
+)
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:extra="urn:example:extra">
+    <cbc:ID>notice-1</cbc:ID>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:ProcurementProject>
+            <cbc:Name>Computer Network extension</cbc:Name>
+        </cac:ProcurementProject>
+    </cac:ProcurementProjectLot>
+</ContractNotice>
+"""
+
+
+def test_from_content_builds_namespace_map() -> None:
+    document = NoticeDocument.from_content(XML_CONTENT)
+
+    assert etree.QName(document.root).localname == "ContractNotice"
+    for prefix, uri in EFORMS_NAMESPACES.items():
+        assert document.namespaces[prefix] == uri
+    assert document.namespaces["extra"] == "urn:example:extra"
+    assert None not in document.namespaces
+
+
+def test_get_root_accepts_str_bytes_and_document() -> None:
+    document = NoticeDocument.from_content(XML_CONTENT)
+
+    assert get_root(document) is document.root
+    assert etree.QName(get_root(XML_CONTENT)).localname == "ContractNotice"
+    assert etree.QName(get_root(XML_CONTENT.encode())).localname == "ContractNotice"
+
+
+def test_get_document_reuses_existing_document() -> None:
+    document = NoticeDocument.from_content(XML_CONTENT)
+
+    assert get_document(document) is document
+    assert get_document(XML_CONTENT.encode()).root is not document.root
+
+
+def test_converter_gives_same_result_for_bytes_and_document() -> None:
+    document = NoticeDocument.from_content(XML_CONTENT)
+
+    assert parse_lot_title(document) == parse_lot_title(XML_CONTENT.encode())
+    assert parse_lot_title(document) == {
+        "tender": {"lots": [{"id": "LOT-0001", "title": "Computer Network extension"}]}
+    }
+
+
+def test_process_bt_sections_parses_notice_once(monkeypatch) -> None:
+    document = NoticeDocument.from_content(XML_CONTENT)
+    monkeypatch.setattr(
+        etree,
+        "fromstring",
+        lambda *_args, **_kwargs: pytest.fail("converter re-parsed the notice"),
+    )
+
+    release_json = {"id": "notice-1"}
+    process_bt_sections(release_json, document)
+
+    assert release_json["tender"]["lots"][0]["title"] == "Computer Network extension"
+
+
+def test_process_bt_sections_skips_invalid_xml() -> None:
+    release_json = {"id": "notice-1"}
+    process_bt_sections(release_json, b"<not-closed>")
+
+    assert release_json == {"id": "notice-1"}
+
+
+RESULT_XML = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1">
+    <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent><efext:EformsExtension>
+        <efac:NoticeResult>
+            <efac:LotResult>
+                <cbc:ID schemeName="result">RES-0001</cbc:ID>
+                <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+                <efac:LotTender><cbc:ID schemeName="tender">TEN-0002</cbc:ID></efac:LotTender>
+                <efac:SettledContract><cbc:ID schemeName="contract">CON-0001</cbc:ID></efac:SettledContract>
+                <efac:TenderLot><cbc:ID schemeName="Lot">LOT-0001</cbc:ID></efac:TenderLot>
+            </efac:LotResult>
+            <efac:LotResult>
+                <cbc:ID schemeName="result">RES-0002</cbc:ID>
+                <efac:LotTender><cbc:ID schemeName="tender">TEN-0002</cbc:ID></efac:LotTender>
+                <efac:SettledContract><cbc:ID schemeName="contract">CON-0001</cbc:ID></efac:SettledContract>
+            </efac:LotResult>
+            <efac:LotTender>
+                <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+                <efac:TenderingParty><cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID></efac:TenderingParty>
+                <efac:TenderLot><cbc:ID schemeName="Lot">LOT-0001</cbc:ID></efac:TenderLot>
+            </efac:LotTender>
+            <efac:SettledContract>
+                <cbc:ID schemeName="contract">CON-0001</cbc:ID>
+                <efac:LotTender><cbc:ID schemeName="tender">TEN-0001</cbc:ID></efac:LotTender>
+            </efac:SettledContract>
+            <efac:TenderingParty>
+                <cbc:ID schemeName="tendering-party">TPA-0001</cbc:ID>
+            </efac:TenderingParty>
+        </efac:NoticeResult>
+        <efac:Organizations>
+            <efac:Organization>
+                <efac:Company>
+                    <cac:PartyIdentification>
+                        <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
+                    </cac:PartyIdentification>
+                </efac:Company>
+            </efac:Organization>
+        </efac:Organizations>
+    </efext:EformsExtension></ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+    <cac:ProcurementProjectLot><cbc:ID schemeName="Lot">LOT-0001</cbc:ID></cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot><cbc:ID schemeName="Part">PAR-0001</cbc:ID></cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot><cbc:ID schemeName="LotsGroup">GLO-0001</cbc:ID></cac:ProcurementProjectLot>
+</ContractAwardNotice>
+"""
+
+
+def test_index_maps_ids_to_elements() -> None:
+    document = NoticeDocument.from_content(RESULT_XML)
+    index = document.index
+
+    assert index is document.index
+    assert list(index.lots) == ["LOT-0001"]
+    assert list(index.parts) == ["PAR-0001"]
+    assert list(index.lot_groups) == ["GLO-0001"]
+    assert etree.QName(index.organizations["ORG-0001"]).localname == "Organization"
+    # References inside LotResult and SettledContract are not entities
+    assert list(index.lot_tenders) == ["TEN-0001"]
+    assert list(index.settled_contracts) == ["CON-0001"]
+    assert list(index.tendering_parties) == ["TPA-0001"]
+    assert list(index.lot_results) == ["RES-0001", "RES-0002"]
+
+
+def test_index_joins() -> None:
+    index = NoticeDocument.from_content(RESULT_XML).index
+    results = index.lot_results
+
+    assert index.tender_lots == {"TEN-0001": ["LOT-0001"]}
+    assert index.result_tenders == {
+        "RES-0001": ["TEN-0001", "TEN-0002"],
+        "RES-0002": ["TEN-0002"],
+    }
+    assert index.lot_results_for_tender("TEN-0001") == [results["RES-0001"]]
+    assert index.lot_results_for_tender("TEN-0002") == [
+        results["RES-0001"],
+        results["RES-0002"],
+    ]
+    assert index.lot_results_for_contract("CON-0001") == [
+        results["RES-0001"],
+        results["RES-0002"],
+    ]
+    assert index.contracts_for_tender("TEN-0001") == [
+        index.settled_contracts["CON-0001"]
+    ]
+    assert index.lot_results_for_contract("CON-9999") == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
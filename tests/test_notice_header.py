@@ -0,0 +1,218 @@
+# tests/test_notice_header.py
+
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.main import NoticeConverter
+from ted_and_doffin_to_ocds.utils import file_processor
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.file_processor import NoticeFileProcessor
+from ted_and_doffin_to_ocds.utils.notice_header import (
+    HEADER_CHUNK_SIZE,
+    NoticeHeader,
+    read_notice_header,
+    read_notice_references,
+)
+from ted_and_doffin_to_ocds.utils.xml_processor import (
+    XPATH_PREVIOUS_PUBLICATION_IDS,
+    XMLProcessor,
+)
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+
+NOTICE_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1">
+    <ext:UBLExtensions>
+        <ext:UBLExtension>
+            <ext:ExtensionContent>
+                <efext:EformsExtension>
+                    <efac:Organizations>
+                        <efac:Organization>
+                            <efac:Company>
+                                <cac:PartyIdentification>
+                                    <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
+                                </cac:PartyIdentification>
+                            </efac:Company>
+                        </efac:Organization>
+                    </efac:Organizations>
+                    <efac:Publication>
+                        <efbc:NoticePublicationID schemeName="ojs-notice-id">00123456-2024</efbc:NoticePublicationID>
+                    </efac:Publication>
+                </efext:EformsExtension>
+            </ext:ExtensionContent>
+        </ext:UBLExtension>
+    </ext:UBLExtensions>
+    <cbc:ID schemeName="notice-id">can-1</cbc:ID>
+    <cbc:IssueDate>2024-03-01+01:00</cbc:IssueDate>
+    <cbc:NoticeTypeCode listName="cont-modif">can-modif</cbc:NoticeTypeCode>
+    <cac:TenderingProcess>
+        <cac:NoticeDocumentReference>
+            <cbc:ID schemeName="notice-id-ref">cn-1</cbc:ID>
+        </cac:NoticeDocumentReference>
+    </cac:TenderingProcess>
+"""
+NOTICE_BODY = """    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingProcess>
+            <cac:NoticeDocumentReference>
+                <cbc:ID schemeName="notice-id-ref">pin-1</cbc:ID>
+            </cac:NoticeDocumentReference>
+        </cac:TenderingProcess>
+    </cac:ProcurementProjectLot>
+</ContractAwardNotice>
+"""
+
+
+def test_read_notice_header(tmp_path) -> None:
+    path = tmp_path / "notice.xml"
+    path.write_text(NOTICE_HEADER + NOTICE_BODY, encoding="utf-8")
+
+    header = read_notice_header(path)
+
+    assert header == NoticeHeader(
+        root_tag="ContractAwardNotice",
+        notice_id="can-1",
+        issue_date="2024-03-01+01:00",
+        notice_type_code="can-modif",
+        notice_type_list="cont-modif",
+        publication_ids=("00123456-2024",),
+    )
+    assert header.notice_type == "ContractAwardNotice-Modification"
+    assert header.identifiers == {"can-1", "00123456-2024"}
+    assert not header.is_pin_only
+
+
+def test_read_notice_references(tmp_path) -> None:
+    path = tmp_path / "notice.xml"
+    settled_contract = """
+                    <efac:NoticeResult>
+                        <efac:SettledContract>
+                            <cac:NoticeDocumentReference>
+                                <cbc:ID schemeName="notice-id-ref">can-0</cbc:ID>
+                            </cac:NoticeDocumentReference>
+                        </efac:SettledContract>
+                    </efac:NoticeResult>
+                    <efac:Publication>"""
+    other_scheme = """<cbc:ID schemeName="notice-id-ref">cn-1</cbc:ID>
+            <cbc:ID schemeName="ojs-notice-id">00000001-2024</cbc:ID>"""
+    path.write_text(
+        (NOTICE_HEADER + NOTICE_BODY)
+        .replace("<efac:Publication>", settled_contract)
+        .replace('<cbc:ID schemeName="notice-id-ref">cn-1</cbc:ID>', other_scheme),
+        encoding="utf-8",
+    )
+
+    assert read_notice_references(path) == ("can-0", "cn-1", "pin-1")
+
+
+def test_read_notice_header_stops_after_header(tmp_path) -> None:
+    # The end of the file is malformed, so reading must stop before it
+    path = tmp_path / "notice.xml"
+    path.write_text(
+        NOTICE_HEADER
+        + "    <cac:ProcurementProject>"
+        + " " * 2 * HEADER_CHUNK_SIZE
+        + "<broken></ContractAwardNotice>",
+        encoding="utf-8",
+    )
+    assert read_notice_header(path).notice_id == "can-1"
+
+    with pytest.raises(etree.XMLSyntaxError):
+        etree.parse(str(path))
+
+
+def test_read_notice_header_without_header_elements(tmp_path) -> None:
+    path = tmp_path / "other.xml"
+    path.write_text("<root><child/></root>", encoding="utf-8")
+
+    header = read_notice_header(path)
+
+    assert header.root_tag == "root"
+    assert header.notice_type is None
+    assert header.to_notice_info()["notice_type"] == "Unknown"
+
+
+def test_read_notice_header_rejects_invalid_xml(tmp_path) -> None:
+    path = tmp_path / "invalid.xml"
+    path.write_text("<root><unclosed></root>", encoding="utf-8")
+
+    with pytest.raises(etree.XMLSyntaxError):
+        read_notice_header(path)
+
+
+@pytest.mark.parametrize(
+    "path", sorted(XMLFILE_PATH.glob("*.xml")), ids=lambda path: path.name
+)
+def test_header_matches_parsed_notice(path) -> None:
+    xml_processor = XMLProcessor()
+    root = etree.parse(str(path)).getroot()
+    header = read_notice_header(path)
+
+    assert header.to_notice_info() == xml_processor.extract_notice_info(root)
+    assert header.root_tag == etree.QName(root).localname
+    references = XPATH_PREVIOUS_PUBLICATION_IDS(root)
+    assert list(read_notice_references(path)) == [
+        reference.strip() for reference in references
+    ]
+
+
+def test_file_processor_reads_each_header_once(tmp_path, monkeypatch) -> None:
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    (input_folder / "notice.xml").write_text(
+        NOTICE_HEADER + NOTICE_BODY, encoding="utf-8"
+    )
+    calls = []
+
+    def counting_read_notice_header(path: Path) -> NoticeHeader:
+        calls.append(path)
+        return read_notice_header(path)
+
+    monkeypatch.setattr(
+        file_processor, "read_notice_header", counting_read_notice_header
+    )
+    with NoticeFileProcessor(input_folder, tmp_path) as processor:
+        processor.copy_input_files()
+        assert processor.categorize_files()["ContractAwardNotice-Modification"]
+        scheduler = processor.get_schedule()
+
+    path = processor.temp_dir / "notice.xml"
+    assert calls == [path]
+    assert scheduler.get_notice(path).header is processor.headers[path]
+
+
+def test_conversion_uses_header_notice_info(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "notice.xml"
+    path.write_text(NOTICE_HEADER + NOTICE_BODY, encoding="utf-8")
+    config = Config(
+        input_path=path,
+        output_folder=tmp_path,
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+    )
+    converter = NoticeConverter(config)
+
+    def fail(*_args) -> None:
+        pytest.fail("notice information must come from the header")
+
+    monkeypatch.setattr(converter.processor.xml_processor, "extract_notice_info", fail)
+    releases = converter._process_input_file(
+        path.read_bytes(), read_notice_header(path)
+    )
+
+    assert releases[0]["id"] == "can-1"
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
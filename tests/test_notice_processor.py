@@ -0,0 +1,137 @@
+# tests/test_notice_processor.py
+
+import json
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.main import NoticeConverter
+from ted_and_doffin_to_ocds.utils import common_operations
+from ted_and_doffin_to_ocds.utils.common_operations import NoticeProcessor
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.notice_document import NoticeDocument
+from ted_and_doffin_to_ocds.utils.notice_header import read_notice_header
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+
+PIN_ONLY_NOTICE = """<?xml version="1.0" encoding="UTF-8"?>
+<PriorInformationNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:PriorInformationNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+    <cbc:ID schemeName="notice-id">pin-1</cbc:ID>
+    <cbc:IssueDate>2024-01-01+01:00</cbc:IssueDate>
+    <cbc:NoticeTypeCode listName="planning">pin-only</cbc:NoticeTypeCode>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Part">PAR-0001</cbc:ID>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Part">PAR-0002</cbc:ID>
+        <cac:TenderingProcess>
+            <cac:NoticeDocumentReference>
+                <cbc:ID>pin-0</cbc:ID>
+                <cbc:ReferencedDocumentInternalAddress>PAR-0003</cbc:ReferencedDocumentInternalAddress>
+            </cac:NoticeDocumentReference>
+        </cac:TenderingProcess>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Part">PAR-0003</cbc:ID>
+    </cac:ProcurementProjectLot>
+</PriorInformationNotice>
+"""
+
+
+@pytest.fixture
+def processor(tmp_path) -> NoticeProcessor:
+    return NoticeProcessor(
+        ocid_prefix="ocds-test", scheme="eu-oj", db_path=str(tmp_path / "notices.db")
+    )
+
+
+def test_process_notice_releases_returns_dicts(processor, monkeypatch) -> None:
+    def fail(*_args, **_kwargs) -> None:
+        pytest.fail("releases must not be serialized")
+
+    monkeypatch.setattr(common_operations.json, "dumps", fail)
+    monkeypatch.setattr(common_operations.json, "loads", fail)
+
+    releases = processor.process_notice_releases(PIN_ONLY_NOTICE)
+
+    assert [release["id"] for release in releases] == ["pin-1"] * 3
+    assert len({release["ocid"] for release in releases}) == 3
+    assert releases[1]["relatedProcesses"] == [
+        {
+            "id": "1",
+            "relationship": ["planning"],
+            "scheme": "eu-oj",
+            "identifier": "pin-0-PAR-0003",
+        }
+    ]
+    parts = processor.tracker.get_notice_parts("pin-1")
+    assert [(part[0], part[1]) for part in parts] == [
+        ("PAR-0001", releases[0]["ocid"]),
+        ("PAR-0002", releases[1]["ocid"]),
+        ("PAR-0003", releases[2]["ocid"]),
+    ]
+    assert processor.tracker.get_previous_notice("pin-1")[1] == releases[-1]["ocid"]
+
+
+def test_process_notice_wraps_dict_api(processor) -> None:
+    release_strs = processor.process_notice(PIN_ONLY_NOTICE)
+
+    releases = [json.loads(release_str) for release_str in release_strs]
+    assert [release["id"] for release in releases] == ["pin-1"] * 3
+    assert all(release["ocid"].startswith("ocds-test-") for release in releases)
+    assert "relatedProcesses" in releases[1]
+
+
+def test_process_notice_releases_are_independent(processor) -> None:
+    releases = processor.process_notice_releases(PIN_ONLY_NOTICE)
+    releases[0]["tender"] = {"id": "PAR-0001"}
+
+    assert all("tender" not in release for release in releases[1:])
+
+
+@pytest.mark.parametrize("with_header", [False, True])
+def test_conversion_parses_the_notice_once(tmp_path, monkeypatch, with_header) -> None:
+    path = XMLFILE_PATH / "can_24_maximal.xml"
+    header = read_notice_header(path) if with_header else None
+    config = Config(
+        input_path=path,
+        output_folder=tmp_path,
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+    )
+    converter = NoticeConverter(config)
+    parses = []
+    fromstring = etree.fromstring
+
+    def counting_fromstring(*args, **kwargs) -> etree._Element:
+        parses.append(args[0])
+        return fromstring(*args, **kwargs)
+
+    monkeypatch.setattr(etree, "fromstring", counting_fromstring)
+    releases = converter._process_input_file(path.read_bytes(), header)
+
+    assert releases[0]["id"]
+    assert "awards" in releases[0]
+    assert len(parses) == 1
+
+
+def test_process_notice_releases_accepts_document(processor, monkeypatch) -> None:
+    document = NoticeDocument.from_content(PIN_ONLY_NOTICE)
+
+    def fail(*_args) -> None:
+        pytest.fail("a parsed document must not be parsed again")
+
+    monkeypatch.setattr(processor.xml_processor, "parse_xml", fail)
+    releases = processor.process_notice_releases(document)
+
+    assert [release["id"] for release in releases] == ["pin-1"] * 3
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
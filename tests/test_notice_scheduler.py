@@ -0,0 +1,233 @@
+# tests/test_notice_scheduler.py
+
+import json
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter, process_files
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.file_processor import NoticeFileProcessor
+from ted_and_doffin_to_ocds.utils.notice_scheduler import (
+    NoticeScheduler,
+    ScheduledNotice,
+)
+
+NOTICE_ORDER = NoticeFileProcessor.NOTICE_ORDER
+
+NOTICE_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<{root} xmlns="urn:oasis:names:specification:ubl:schema:xsd:{root}-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+    <cbc:ID schemeName="notice-id">{notice_id}</cbc:ID>
+    <cbc:IssueDate>2024-01-01+01:00</cbc:IssueDate>
+    <cbc:NoticeTypeCode listName="{list_name}">{type_code}</cbc:NoticeTypeCode>
+    {reference}
+</{root}>
+"""
+REFERENCE_TEMPLATE = """<cac:TenderingProcess>
+        <cac:NoticeDocumentReference>
+            <cbc:ID schemeName="notice-id-ref">{reference}</cbc:ID>
+        </cac:NoticeDocumentReference>
+    </cac:TenderingProcess>"""
+LOT_REFERENCE_TEMPLATE = """<cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingProcess>
+            <cac:NoticeDocumentReference>
+                <cbc:ID schemeName="notice-id-ref">{reference}</cbc:ID>
+            </cac:NoticeDocumentReference>
+        </cac:TenderingProcess>
+    </cac:ProcurementProjectLot>"""
+
+
+def notice(name: str, notice_type: str, ids=(), refs=()) -> ScheduledNotice:
+    return ScheduledNotice(
+        path=Path(name),
+        notice_type=notice_type,
+        identifiers=frozenset(ids),
+        references=frozenset(refs),
+    )
+
+
+def run(scheduler: NoticeScheduler) -> list[list[str]]:
+    """Run the scheduler to completion, one wave of ready notices at a time."""
+    waves = []
+    while not scheduler.finished:
+        ready = scheduler.take_ready()
+        waves.append([path.name for path in ready])
+        for path in ready:
+            scheduler.mark_done(path)
+    return waves
+
+
+def test_independent_chains_run_in_parallel() -> None:
+    scheduler = NoticeScheduler(
+        [
+            notice("can_a.xml", "ContractAwardNotice", ["can-a"], ["cn-a"]),
+            notice("cn_a.xml", "ContractNotice", ["cn-a"], ["pin-a"]),
+            notice("pin_a.xml", "PriorInformationNotice", ["pin-a"]),
+            notice("can_b.xml", "ContractAwardNotice", ["can-b"], ["cn-b"]),
+            notice("cn_b.xml", "ContractNotice", ["cn-b"]),
+            notice("can_c.xml", "ContractAwardNotice", ["can-c"]),
+        ],
+        NOTICE_ORDER,
+    )
+
+    assert len(scheduler) == 6
+    assert scheduler.chain_count == 3
+    assert scheduler.dependencies(Path("cn_a.xml")) == {Path("pin_a.xml")}
+    assert run(scheduler) == [
+        ["pin_a.xml", "cn_b.xml", "can_c.xml"],
+        ["cn_a.xml", "can_b.xml"],
+        ["can_a.xml"],
+    ]
+
+
+def test_notice_waits_until_all_dependencies_are_done() -> None:
+    scheduler = NoticeScheduler(
+        [
+            notice("pin.xml", "PriorInformationNotice", ["pin"]),
+            notice("cn.xml", "ContractNotice", ["cn"]),
+            notice("can.xml", "ContractAwardNotice", ["can"], ["pin", "cn"]),
+        ],
+        NOTICE_ORDER,
+    )
+
+    assert [path.name for path in scheduler.take_ready()] == ["pin.xml", "cn.xml"]
+    scheduler.mark_done(Path("pin.xml"))
+    assert scheduler.take_ready() == []
+    assert not scheduler.finished
+    scheduler.mark_done(Path("cn.xml"))
+    assert scheduler.take_ready() == [Path("can.xml")]
+    scheduler.mark_done(Path("can.xml"))
+    assert scheduler.finished
+
+
+def test_references_outside_the_run_and_to_itself_are_ignored() -> None:
+    scheduler = NoticeScheduler(
+        [
+            notice("cn.xml", "ContractNotice", ["cn"], ["unknown", "cn"]),
+            notice("can.xml", "ContractAwardNotice", ["can"], ["2024/S 001-000001"]),
+            notice("pin.xml", "PriorInformationNotice", ["pin", "2024/S 001-000001"]),
+        ],
+        NOTICE_ORDER,
+    )
+
+    assert scheduler.dependencies(Path("cn.xml")) == frozenset()
+    assert scheduler.dependencies(Path("can.xml")) == {Path("pin.xml")}
+    assert run(scheduler) == [["pin.xml", "cn.xml"], ["can.xml"]]
+
+
+def test_circular_references_are_broken_in_notice_order() -> None:
+    scheduler = NoticeScheduler(
+        [
+            notice("can.xml", "ContractAwardNotice", ["can"], ["cn"]),
+            notice("cn.xml", "ContractNotice", ["cn"], ["can"]),
+        ],
+        NOTICE_ORDER,
+    )
+
+    assert run(scheduler) == [["cn.xml"], ["can.xml"]]
+
+
+def write_notice(
+    folder: Path,
+    name: str,
+    root: str,
+    notice_id: str,
+    ref=None,
+    template=REFERENCE_TEMPLATE,
+) -> None:
+    list_names = {
+        "PriorInformationNotice": ("planning", "pin-buyer"),
+        "ContractNotice": ("competition", "cn-standard"),
+        "ContractAwardNotice": ("result", "can-standard"),
+    }
+    list_name, type_code = list_names[root]
+    reference = template.format(reference=ref) if ref else ""
+    (folder / name).write_text(
+        NOTICE_TEMPLATE.format(
+            root=root,
+            notice_id=notice_id,
+            list_name=list_name,
+            type_code=type_code,
+            reference=reference,
+        ),
+        encoding="utf-8",
+    )
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_scheduled_chain_reuses_ocid(tmp_path, executor) -> None:
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    # Names sort the referencing notices first, so only the references give
+    # the right order within each notice type
+    write_notice(input_folder, "a_can.xml", "ContractAwardNotice", "can-1", "cn-1")
+    write_notice(input_folder, "b_cn.xml", "ContractNotice", "cn-1", "pin-1")
+    write_notice(input_folder, "c_pin.xml", "PriorInformationNotice", "pin-1")
+    write_notice(input_folder, "d_cn.xml", "ContractNotice", "cn-2")
+
+    config = Config(
+        input_path=input_folder,
+        output_folder=tmp_path / "output",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+        workers=4,
+        executor=executor,
+    )
+    process_files(NoticeConverter(config), config)
+
+    ocids = {
+        path.name.split("_release")[0]: json.loads(path.read_text())["ocid"]
+        for path in config.output_folder.glob("*.json")
+    }
+    assert ocids["a_can"] == ocids["b_cn"] == ocids["c_pin"]
+    assert ocids["d_cn"] != ocids["c_pin"]
+
+
+def test_file_processor_reads_identifiers_and_references(tmp_path) -> None:
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    write_notice(input_folder, "cn.xml", "ContractNotice", "cn-1", "pin-1")
+
+    with NoticeFileProcessor(input_folder, tmp_path) as processor:
+        processor.copy_input_files()
+        scheduled = processor.read_notice(processor.temp_dir / "cn.xml")
+
+    assert scheduled.notice_type == "ContractNotice"
+    assert scheduled.identifiers == {"cn-1"}
+    assert scheduled.references == {"pin-1"}
+
+
+def test_lot_reference_orders_the_notices(tmp_path) -> None:
+    input_folder = tmp_path / "input"
+    input_folder.mkdir()
+    # The award notice only refers to the contract notice from its lot
+    write_notice(
+        input_folder,
+        "a_can.xml",
+        "ContractAwardNotice",
+        "can-1",
+        "cn-1",
+        template=LOT_REFERENCE_TEMPLATE,
+    )
+    write_notice(input_folder, "b_cn.xml", "ContractNotice", "cn-1")
+    write_notice(input_folder, "c_cn.xml", "ContractNotice", "cn-2")
+
+    with NoticeFileProcessor(input_folder, tmp_path) as processor:
+        processor.copy_input_files()
+        scheduler = processor.get_schedule()
+
+    assert scheduler.chain_count == 2
+    assert scheduler.dependencies(processor.temp_dir / "a_can.xml") == {
+        processor.temp_dir / "b_cn.xml"
+    }
+    assert run(scheduler) == [["b_cn.xml", "c_cn.xml"], ["a_can.xml"]]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
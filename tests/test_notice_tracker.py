@@ -0,0 +1,222 @@
+# tests/test_notice_tracker.py
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.notice_tracker import NoticeTracker
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    tracker = NoticeTracker(str(tmp_path / "notices.db"), batch_interval=60)
+    yield tracker
+    tracker.close()
+
+
+def committed(tracker: NoticeTracker, table: str) -> int:
+    """Count the rows of table that other connections can read."""
+    with sqlite3.connect(tracker.db_path) as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]  # noqa: S608
+
+
+def wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def track(tracker: NoticeTracker, notice_id: str) -> None:
+    tracker.track_notice(notice_id, f"ocds-test-{notice_id}", "PIN", True, "2024-01-01")
+
+
+def test_connections_use_wal(tracker) -> None:
+    conn = tracker.connection
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+    assert conn.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+
+
+def test_writes_are_batched_until_flush(tracker) -> None:
+    track(tracker, "pin-1")
+    tracker.track_part("pin-1", "PAR-0001", "ocds-test-1")
+    tracker.track_related_process("pin-1", "pin-0", "planning", "eu-oj")
+
+    assert committed(tracker, "notices") == 0
+
+    tracker.flush()
+    assert committed(tracker, "notices") == 1
+    assert committed(tracker, "parts") == 1
+    assert committed(tracker, "related_processes") == 1
+
+
+def test_reads_see_queued_writes(tracker) -> None:
+    track(tracker, "pin-1")
+    tracker.track_part("pin-1", "PAR-0001", "ocds-test-1")
+    tracker.track_part("pin-1", "PAR-0002", "ocds-test-2")
+    tracker.track_related_process("pin-1", "pin-0", "planning", "eu-oj")
+
+    assert tracker.get_previous_notice("pin-1")[1] == "ocds-test-pin-1"
+    assert [tuple(part) for part in tracker.get_notice_parts("pin-1")] == [
+        ("PAR-0001", "ocds-test-1"),
+        ("PAR-0002", "ocds-test-2"),
+    ]
+    assert [tuple(row) for row in tracker.get_related_processes("pin-1")] == [
+        ("pin-0", "planning", "eu-oj")
+    ]
+    with tracker.get_statistics() as stats:
+        assert stats == {"notice_count": 1, "parts_count": 2, "relationship_count": 1}
+
+
+def test_reads_of_other_notices_do_not_wait(tracker) -> None:
+    track(tracker, "pin-1")
+
+    assert tracker.get_previous_notice("pin-2") is None
+    assert tracker.get_notice_parts("pin-2") == []
+    assert committed(tracker, "notices") == 0
+
+
+def test_batches_commit_on_size(tmp_path) -> None:
+    tracker = NoticeTracker(str(tmp_path / "notices.db"), batch_size=3, batch_interval=60)
+    for i in range(4):
+        track(tracker, f"pin-{i}")
+
+    assert wait_for(lambda: committed(tracker, "notices") == 3)
+    time.sleep(0.1)
+    assert committed(tracker, "notices") == 3
+    tracker.close()
+    assert committed(tracker, "notices") == 4
+
+
+def test_batches_commit_on_time(tmp_path) -> None:
+    tracker = NoticeTracker(str(tmp_path / "notices.db"), batch_interval=0.05)
+    track(tracker, "pin-1")
+
+    assert wait_for(lambda: committed(tracker, "notices") == 1)
+    tracker.close()
+
+
+def test_concurrent_writers(tracker) -> None:
+    def work(worker: int) -> None:
+        for i in range(50):
+            notice_id = f"notice-{worker}-{i}"
+            track(tracker, notice_id)
+            tracker.track_part(notice_id, "PAR-0001", f"ocds-test-{worker}-{i}")
+            assert tracker.get_previous_notice(notice_id)[0] == notice_id
+
+    threads = [threading.Thread(target=work, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tracker.close()
+
+    assert committed(tracker, "notices") == 200
+    assert committed(tracker, "parts") == 200
+
+
+def writer_threads() -> int:
+    return sum(thread.name == "notice-writer" for thread in threading.enumerate())
+
+
+def test_close_stops_the_writer_thread(tracker) -> None:
+    running = writer_threads()
+    track(tracker, "pin-1")
+    assert writer_threads() == running + 1
+    tracker.close()
+
+    assert writer_threads() == running
+    assert committed(tracker, "notices") == 1
+
+    track(tracker, "pin-2")
+    tracker.close()
+    assert committed(tracker, "notices") == 2
+
+
+def test_failed_batches_are_raised(tracker) -> None:
+    with sqlite3.connect(tracker.db_path) as conn:
+        conn.execute("DROP TABLE parts")
+    tracker.track_part("pin-1", "PAR-0001", "ocds-test-1")
+
+    with pytest.raises(sqlite3.OperationalError):
+        tracker.flush()
+    tracker.flush()
+
+
+def test_failed_batches_are_raised_to_every_writer(tracker) -> None:
+    with sqlite3.connect(tracker.db_path) as conn:
+        conn.execute("DROP TABLE parts")
+    written = threading.Barrier(2)
+    errors = {}
+
+    def convert(notice_id: str) -> None:
+        # Both writes are queued before either file flushes, so they are
+        # committed, and fail, in the same batch
+        tracker.track_part(notice_id, "PAR-0001", f"ocds-test-{notice_id}")
+        written.wait()
+        try:
+            tracker.flush()
+        except sqlite3.Error as e:
+            errors[notice_id] = e
+
+    threads = [
+        threading.Thread(target=convert, args=(notice_id,))
+        for notice_id in ("pin-1", "pin-2")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(errors) == ["pin-1", "pin-2"]
+    assert tracker.writer.is_pending(("parts", "pin-1"))
+    with pytest.raises(sqlite3.OperationalError):
+        tracker.get_notice_parts("pin-1")
+    tracker.flush()
+
+
+def test_connection_errors_are_raised(tracker, tmp_path) -> None:
+    tracker.writer.db_path = str(tmp_path / "missing" / "notices.db")
+
+    with pytest.raises(sqlite3.OperationalError):
+        track(tracker, "pin-1")
+    tracker.flush()
+
+
+def test_process_file_commits_tracked_notices(tmp_path) -> None:
+    config = Config(
+        input_path=XMLFILE_PATH / "can_24_minimal.xml",
+        output_folder=tmp_path / "output",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+    )
+    config.output_folder.mkdir()
+    converter = NoticeConverter(config)
+    converter.processor.tracker.writer.batch_interval = 60
+
+    converter.process_file(config.input_path, config.output_folder)
+
+    assert committed(converter.processor.tracker, "notices") == 1
+    converter.processor.tracker.close()
+
+
+def test_ocid_is_required(tracker) -> None:
+    with pytest.raises(ValueError, match="OCID"):
+        tracker.track_notice("pin-1", "", "PIN", True, "2024-01-01")
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -24,6 +24,16 @@ def test_parse_ubo_firstname() -> None:
                                         <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
                                     </cac:PartyIdentification>
                                 </efac:Company>
+                                <efac:UltimateBeneficialOwner>
+                                    <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+                                </efac:UltimateBeneficialOwner>
+                            </efac:Organization>
+                            <efac:Organization>
+                                <efac:Company>
+                                    <cac:PartyIdentification>
+                                        <cbc:ID schemeName="organization">ORG-0002</cbc:ID>
+                                    </cac:PartyIdentification>
+                                </efac:Company>
                             </efac:Organization>
                             <efac:UltimateBeneficialOwner>
                                 <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
@@ -13,6 +13,7 @@ def test_parse_signatory_identifier_reference() -> None:
           xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
           xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
           xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1">
+        <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent>
         <efext:EformsExtension>
             <efac:Organizations>
                 <efac:Organization>
@@ -37,6 +38,7 @@ def test_parse_signatory_identifier_reference() -> None:
                 </efac:SettledContract>
             </efac:NoticeResult>
         </efext:EformsExtension>
+        </ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
     </root>
     """
 
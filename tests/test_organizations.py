@@ -0,0 +1,442 @@
+# tests/test_organizations.py
+
+import json
+
+import pytest
+
+from ted_and_doffin_to_ocds.converters.eforms.organizations import (
+    merge_organizations,
+    parse_organizations,
+)
+from ted_and_doffin_to_ocds.main import main
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <ext:UBLExtensions>
+        <ext:UBLExtension>
+            <ext:ExtensionContent>
+                <efext:EformsExtension>
+                    <efac:Organizations>
+                        <efac:Organization>
+                            <efbc:GroupLeadIndicator>true</efbc:GroupLeadIndicator>
+                            <efac:Company>
+                                <cbc:WebsiteURI>http://xyz.europa.eu/</cbc:WebsiteURI>
+                                <cac:PartyIdentification>
+                                    <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
+                                </cac:PartyIdentification>
+                                <cac:PartyName>
+                                    <cbc:Name languageID="ENG">Ministry</cbc:Name>
+                                </cac:PartyName>
+                                <cac:PostalAddress>
+                                    <cbc:StreetName>Main Street 1</cbc:StreetName>
+                                    <cbc:CityName>Luxembourg</cbc:CityName>
+                                    <cbc:PostalZone>2345</cbc:PostalZone>
+                                    <cbc:CountrySubentityCode listName="nuts">LU000</cbc:CountrySubentityCode>
+                                    <cac:Country>
+                                        <cbc:IdentificationCode listName="country">LUX</cbc:IdentificationCode>
+                                    </cac:Country>
+                                    <cbc:Department>Procurement</cbc:Department>
+                                </cac:PostalAddress>
+                                <cac:PartyLegalEntity>
+                                    <cbc:CompanyID>998298</cbc:CompanyID>
+                                </cac:PartyLegalEntity>
+                                <cac:Contact>
+                                    <cbc:Telephone>+352 123</cbc:Telephone>
+                                    <cbc:ElectronicMail>info@example.lu</cbc:ElectronicMail>
+                                </cac:Contact>
+                            </efac:Company>
+                            <efac:TouchPoint>
+                                <cac:PartyIdentification>
+                                    <cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID>
+                                </cac:PartyIdentification>
+                                <cac:PartyName>
+                                    <cbc:Name languageID="ENG">Desk</cbc:Name>
+                                </cac:PartyName>
+                            </efac:TouchPoint>
+                            <efac:UltimateBeneficialOwner>
+                                <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+                            </efac:UltimateBeneficialOwner>
+                        </efac:Organization>
+                        <efac:UltimateBeneficialOwner>
+                            <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+                            <cbc:FamilyName>Smith</cbc:FamilyName>
+                            <efac:Nationality>
+                                <cbc:NationalityID>BEL</cbc:NationalityID>
+                            </efac:Nationality>
+                        </efac:UltimateBeneficialOwner>
+                    </efac:Organizations>
+                </efext:EformsExtension>
+            </ext:ExtensionContent>
+        </ext:UBLExtension>
+    </ext:UBLExtensions>
+</ContractAwardNotice>
+"""
+
+
+def test_parse_organizations_in_one_pass() -> None:
+    company, touchpoint = parse_organizations(XML_CONTENT)["parties"]
+
+    assert company["id"] == "ORG-0001"
+    assert company["name"] == "Ministry - Procurement"
+    assert company["address"]["country"] == "LU"
+    assert company["contactPoint"] == {
+        "telephone": "+352 123",
+        "email": "info@example.lu",
+    }
+    assert company["details"]["url"] == "http://xyz.europa.eu/"
+    assert company["roles"] == ["leadBuyer"]
+    assert company["additionalIdentifiers"] == [{"id": "998298", "scheme": "GB-COH"}]
+    assert company["beneficialOwners"] == [
+        {"id": "UBO-0001", "name": "Smith", "nationalities": ["BE"]}
+    ]
+
+    assert touchpoint["id"] == "TPO-0001"
+    assert touchpoint["name"] == "Desk"
+    assert touchpoint["identifier"] == {"id": "998298", "scheme": "internal"}
+
+
+def test_parse_organizations_lists_the_owners_an_organization_refers_to() -> None:
+    organization = """
+        <efac:Organization>
+            {owner}
+            <efac:Company>
+                <cac:PartyIdentification>
+                    <cbc:ID schemeName="organization">{org_id}</cbc:ID>
+                </cac:PartyIdentification>
+            </efac:Company>
+        </efac:Organization>"""
+    reference = """<efac:UltimateBeneficialOwner>
+                <cbc:ID schemeName="ubo">{ubo_id}</cbc:ID>
+            </efac:UltimateBeneficialOwner>"""
+    owner = """
+        <efac:UltimateBeneficialOwner>
+            <cbc:ID schemeName="ubo">{ubo_id}</cbc:ID>
+            <cbc:FamilyName>{name}</cbc:FamilyName>
+        </efac:UltimateBeneficialOwner>"""
+    organizations = "".join(
+        [
+            organization.format(
+                org_id="ORG-0001", owner=reference.format(ubo_id="UBO-0001")
+            ),
+            organization.format(
+                org_id="ORG-0002", owner=reference.format(ubo_id="UBO-0002")
+            ),
+            organization.format(org_id="ORG-0003", owner=""),
+            owner.format(ubo_id="UBO-0001", name="Smith"),
+            owner.format(ubo_id="UBO-0002", name="Jones"),
+        ]
+    )
+    start = XML_CONTENT.index("<efac:Organizations>") + len("<efac:Organizations>")
+    end = XML_CONTENT.index("</efac:Organizations>")
+    xml_content = XML_CONTENT[:start] + organizations + XML_CONTENT[end:]
+
+    parties = parse_organizations(xml_content)["parties"]
+
+    assert [party.get("beneficialOwners") for party in parties] == [
+        [{"id": "UBO-0001", "name": "Smith"}],
+        [{"id": "UBO-0002", "name": "Jones"}],
+        None,
+    ]
+
+
+def test_parse_organizations_without_organizations() -> None:
+    xml_content = """<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"/>"""
+
+    assert parse_organizations(xml_content) is None
+
+
+def test_merge_organizations_updates_parties_by_id() -> None:
+    release_json = {
+        "parties": [
+            {
+                "id": "ORG-0001",
+                "roles": ["buyer"],
+                "details": {"classifications": []},
+                "beneficialOwners": [{"id": "UBO-0001", "email": "a@b.eu"}],
+            }
+        ]
+    }
+
+    merge_organizations(release_json, parse_organizations(XML_CONTENT))
+
+    parties = release_json["parties"]
+    assert [party["id"] for party in parties] == ["ORG-0001", "TPO-0001"]
+    assert parties[0]["roles"] == ["buyer", "leadBuyer"]
+    assert parties[0]["details"] == {
+        "classifications": [],
+        "url": "http://xyz.europa.eu/",
+    }
+    assert parties[0]["beneficialOwners"] == [
+        {
+            "id": "UBO-0001",
+            "email": "a@b.eu",
+            "name": "Smith",
+            "nationalities": ["BE"],
+        }
+    ]
+
+
+def organizations_notice(
+    company: str = "", touchpoint: str = "", organization: str = "", ubo: str | None = None
+) -> str:
+    """Return a notice with ORG-0001, its touchpoint TPO-0001 and owner UBO-0001."""
+    ubo_reference = owner = ""
+    if ubo is not None:
+        ubo_reference = """<efac:UltimateBeneficialOwner>
+            <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+        </efac:UltimateBeneficialOwner>"""
+        owner = f"""<efac:UltimateBeneficialOwner>
+            <cbc:ID schemeName="ubo">UBO-0001</cbc:ID>
+            {ubo}
+        </efac:UltimateBeneficialOwner>"""
+    return f"""<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1"
+    xmlns:efbc="http://data.europa.eu/p27/eforms-ubl-extension-basic-components/1">
+    <ext:UBLExtensions><ext:UBLExtension><ext:ExtensionContent><efext:EformsExtension>
+        <efac:Organizations>
+            <efac:Organization>
+                {organization}
+                {ubo_reference}
+                <efac:Company>
+                    <cac:PartyIdentification>
+                        <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
+                    </cac:PartyIdentification>
+                    {company}
+                </efac:Company>
+                <efac:TouchPoint>
+                    <cac:PartyIdentification>
+                        <cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID>
+                    </cac:PartyIdentification>
+                    {touchpoint}
+                </efac:TouchPoint>
+            </efac:Organization>
+            {owner}
+        </efac:Organizations>
+    </efext:EformsExtension></ext:ExtensionContent></ext:UBLExtension></ext:UBLExtensions>
+</ContractAwardNotice>"""
+
+
+NAME = "<cac:PartyName><cbc:Name>Ministry of Education</cbc:Name></cac:PartyName>"
+
+# Business term, XML, expected address
+ADDRESS_FIELDS = [
+    (
+        "BT-507",
+        '<cbc:CountrySubentityCode listName="nuts-lvl3">XY374</cbc:CountrySubentityCode>',
+        {"region": "XY374"},
+    ),
+    ("BT-510(a)", "<cbc:StreetName>Main Street</cbc:StreetName>", {"streetAddress": "Main Street"}),
+    (
+        "BT-510(b)",
+        "<cbc:StreetName>Main Street</cbc:StreetName>"
+        "<cbc:AdditionalStreetName>Building B1</cbc:AdditionalStreetName>",
+        {"streetAddress": "Main Street, Building B1"},
+    ),
+    (
+        "BT-510(c)",
+        "<cbc:StreetName>Main Street</cbc:StreetName>"
+        "<cbc:AdditionalStreetName>Building B1</cbc:AdditionalStreetName>"
+        "<cac:AddressLine><cbc:Line>3rd floor</cbc:Line></cac:AddressLine>"
+        "<cac:AddressLine><cbc:Line>Suite 300</cbc:Line></cac:AddressLine>",
+        {"streetAddress": "Main Street, Building B1, 3rd floor, Suite 300"},
+    ),
+    ("BT-512", "<cbc:PostalZone>2345</cbc:PostalZone>", {"postalCode": "2345"}),
+    ("BT-513", "<cbc:CityName>Nowhere</cbc:CityName>", {"locality": "Nowhere"}),
+    (
+        "BT-514",
+        "<cac:Country><cbc:IdentificationCode>GBR</cbc:IdentificationCode></cac:Country>",
+        {"country": "GB"},
+    ),
+]
+
+# Business term, XML of a company or touchpoint, expected party fields
+PARTY_FIELDS = [
+    ("BT-500", NAME, {"name": "Ministry of Education"}),
+    (
+        "BT-500",
+        "<cac:PartyName>"
+        '<cbc:Name languageID="ENG">Ministry of Education</cbc:Name>'
+        '<cbc:Name languageID="NOR">Utdanningsdepartementet</cbc:Name>'
+        "</cac:PartyName>",
+        {"name": "Ministry of Education"},
+    ),
+    (
+        "BT-16",
+        f"{NAME}<cac:PostalAddress><cbc:Department>Procurement</cbc:Department></cac:PostalAddress>",
+        {"name": "Ministry of Education - Procurement"},
+    ),
+    (
+        "BT-502",
+        "<cac:Contact><cbc:Name>Press Office</cbc:Name></cac:Contact>",
+        {"contactPoint": {"name": "Press Office"}},
+    ),
+    (
+        "BT-503",
+        "<cac:Contact><cbc:Telephone>+123 45678</cbc:Telephone></cac:Contact>",
+        {"contactPoint": {"telephone": "+123 45678"}},
+    ),
+    (
+        "BT-506",
+        "<cac:Contact><cbc:ElectronicMail>press@example.com</cbc:ElectronicMail></cac:Contact>",
+        {"contactPoint": {"email": "press@example.com"}},
+    ),
+    (
+        "BT-739",
+        "<cac:Contact><cbc:Telefax> (+33) 2 34 56 78 91 </cbc:Telefax></cac:Contact>",
+        {"contactPoint": {"faxNumber": "(+33) 2 34 56 78 91"}},
+    ),
+    (
+        "BT-505",
+        "<cbc:WebsiteURI>http://xyz.europa.eu/</cbc:WebsiteURI>",
+        {"details": {"url": "http://xyz.europa.eu/"}},
+    ),
+    (
+        "BT-509",
+        "<cbc:EndpointID>https://drive.xpertpro.eu/</cbc:EndpointID>",
+        {"eDeliveryGateway": "https://drive.xpertpro.eu/"},
+    ),
+    *(
+        (bt, f"<cac:PostalAddress>{xml}</cac:PostalAddress>", {"address": address})
+        for bt, xml, address in ADDRESS_FIELDS
+    ),
+]
+
+# Business term, XML of the organization, XML of the company, expected fields
+COMPANY_FIELDS = [
+    (
+        "BT-501",
+        "",
+        "<cac:PartyLegalEntity><cbc:CompanyID>998298</cbc:CompanyID></cac:PartyLegalEntity>",
+        {"additionalIdentifiers": [{"id": "998298", "scheme": "GB-COH"}]},
+    ),
+    (
+        "BT-165",
+        "",
+        '<efbc:CompanySizeCode listName="economic-operator-size">large</efbc:CompanySizeCode>',
+        {"details": {"scale": "large"}},
+    ),
+    (
+        "BT-633",
+        "<efbc:NaturalPersonIndicator>true</efbc:NaturalPersonIndicator>",
+        "",
+        {"details": {"scale": "selfEmployed"}},
+    ),
+    (
+        "BT-746",
+        "<efbc:ListedOnRegulatedMarketIndicator>false</efbc:ListedOnRegulatedMarketIndicator>",
+        "",
+        {"details": {"listedOnRegulatedMarket": False}},
+    ),
+    ("OPP-050", "<efbc:GroupLeadIndicator>true</efbc:GroupLeadIndicator>", "", {"roles": ["leadBuyer"]}),
+    (
+        "OPP-051",
+        "<efbc:AwardingCPBIndicator>true</efbc:AwardingCPBIndicator>",
+        "",
+        {"roles": ["procuringEntity"]},
+    ),
+    (
+        "OPP-052",
+        "<efbc:AcquiringCPBIndicator>true</efbc:AcquiringCPBIndicator>",
+        "",
+        {"roles": ["wholesaleBuyer"]},
+    ),
+]
+
+# Business term, XML of the beneficial owner, expected owner fields
+UBO_FIELDS = [
+    ("BT-500", "<cbc:FamilyName>Smith</cbc:FamilyName>", {"name": "Smith"}),
+    ("BT-503", "<cbc:Telephone>+123 45678</cbc:Telephone>", {"telephone": "+123 45678"}),
+    ("BT-506", "<cbc:ElectronicMail>ubo@example.com</cbc:ElectronicMail>", {"email": "ubo@example.com"}),
+    (
+        "BT-739",
+        "<cac:Contact><cbc:Telefax>+123 4567891 </cbc:Telefax></cac:Contact>",
+        {"faxNumber": "+123 4567891"},
+    ),
+    (
+        "BT-706",
+        "<efac:Nationality><cbc:NationalityID>DEU</cbc:NationalityID></efac:Nationality>",
+        {"nationalities": ["DE"]},
+    ),
+    *(
+        (bt, f"<cac:ResidenceAddress>{xml}</cac:ResidenceAddress>", {"address": address})
+        for bt, xml, address in ADDRESS_FIELDS
+    ),
+]
+
+
+@pytest.mark.parametrize(("bt", "xml", "expected"), PARTY_FIELDS)
+def test_parse_organizations_maps_each_company_field(bt, xml, expected) -> None:
+    result = parse_organizations(organizations_notice(company=xml))
+
+    # OPT-200
+    assert result["parties"][0] == {"id": "ORG-0001", **expected}
+
+
+@pytest.mark.parametrize(("bt", "xml", "expected"), PARTY_FIELDS)
+def test_parse_organizations_maps_each_touchpoint_field(bt, xml, expected) -> None:
+    result = parse_organizations(organizations_notice(touchpoint=xml))
+
+    # OPT-201
+    assert result["parties"][1] == {"id": "TPO-0001", **expected}
+
+
+@pytest.mark.parametrize(("bt", "organization", "company", "expected"), COMPANY_FIELDS)
+def test_parse_organizations_maps_each_organization_field(
+    bt, organization, company, expected
+) -> None:
+    result = parse_organizations(
+        organizations_notice(company=company, organization=organization)
+    )
+
+    assert result["parties"][0] == {"id": "ORG-0001", **expected}
+
+
+def test_parse_organizations_identifies_touchpoints_by_company() -> None:
+    xml_content = organizations_notice(
+        company="<cac:PartyLegalEntity><cbc:CompanyID>998298</cbc:CompanyID></cac:PartyLegalEntity>"
+    )
+
+    result = parse_organizations(xml_content)
+
+    assert result["parties"][1] == {
+        "id": "TPO-0001",
+        "identifier": {"id": "998298", "scheme": "internal"},
+    }
+
+
+@pytest.mark.parametrize(("bt", "xml", "expected"), UBO_FIELDS)
+def test_parse_organizations_maps_each_owner_field(bt, xml, expected) -> None:
+    result = parse_organizations(organizations_notice(ubo=xml))
+
+    # OPT-202 and OPT-302
+    assert result["parties"][0]["beneficialOwners"] == [{"id": "UBO-0001", **expected}]
+
+
+def test_organizations_integration(tmp_path) -> None:
+    xml_content = organizations_notice(company=NAME, ubo="<cbc:FamilyName>Smith</cbc:FamilyName>")
+    xml_file = tmp_path / "test_input_organizations.xml"
+    xml_file.write_text(xml_content, encoding="utf-8")
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    main(str(xml_file), str(output_dir), "ocds-test-prefix", "test-scheme")
+
+    (output_file,) = output_dir.glob("*.json")
+    release = json.loads(output_file.read_text(encoding="utf-8"))
+    party = next(party for party in release["parties"] if party["id"] == "ORG-0001")
+    assert party["name"] == "Ministry of Education"
+    assert party["beneficialOwners"] == [{"id": "UBO-0001", "name": "Smith"}]
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,223 @@
+# tests/test_output_sinks.py
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter, parse_arguments, process_files
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.output_sinks import (
+    JsonLinesSink,
+    ReleaseFileSink,
+    ReleasePackageSink,
+    create_sink,
+    prepare_output_folder,
+)
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+NOTICES = [
+    "can_24_minimal.xml",
+    "ContractNotice_cn-standard_2022-963627.xml",
+    "PriorInformationNotice_pin-buyer_2023-100372.xml",
+]
+RELEASES = [{"id": str(i), "tag": ["tender"], "title": "Été"} for i in range(5)]
+
+
+def make_config(tmp_path: Path, executor: str = "thread", **kwargs) -> Config:
+    return Config(
+        input_path=tmp_path / "input",
+        output_folder=tmp_path / "output",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+        workers=2,
+        executor=executor,
+        **kwargs,
+    )
+
+
+def read_lines(paths: list[Path]) -> list[list[dict]]:
+    return [
+        [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        for path in paths
+    ]
+
+
+def test_release_file_sink_writes_one_file_per_release(tmp_path) -> None:
+    with ReleaseFileSink() as sink:
+        sink.write(Path("notice.xml"), tmp_path, RELEASES[:2])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "notice_release_0.json",
+        "notice_release_1.json",
+    ]
+    assert json.loads((tmp_path / "notice_release_1.json").read_text()) == RELEASES[1]
+
+
+def test_json_lines_sink_rotates_by_release_count(tmp_path) -> None:
+    with JsonLinesSink(max_releases=2, buffer_size=1) as sink:
+        sink.write(Path("a.xml"), tmp_path, RELEASES[:3])
+        sink.write(Path("b.xml"), tmp_path, RELEASES[3:])
+
+    assert [path.name for path in sink.paths] == [
+        "releases-00000.jsonl",
+        "releases-00001.jsonl",
+        "releases-00002.jsonl",
+    ]
+    assert read_lines(sink.paths) == [RELEASES[:2], RELEASES[2:4], RELEASES[4:]]
+
+
+def test_rotating_sink_renames_files_once_complete(tmp_path) -> None:
+    sink = JsonLinesSink(max_releases=2)
+    sink.write(Path("a.xml"), tmp_path, RELEASES[:3])
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "releases-00000.jsonl",
+        "releases-00001.jsonl.partial",
+    ]
+
+    sink.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "releases-00000.jsonl",
+        "releases-00001.jsonl",
+    ]
+
+
+def test_json_lines_sink_rotates_by_size(tmp_path) -> None:
+    record_size = len(json.dumps(RELEASES[0], ensure_ascii=False).encode()) + 1
+    with JsonLinesSink(stem="part", max_bytes=2 * record_size) as sink:
+        sink.write(Path("a.xml"), tmp_path, RELEASES)
+
+    assert [path.name for path in sink.paths] == [
+        "part-00000.jsonl",
+        "part-00001.jsonl",
+        "part-00002.jsonl",
+    ]
+    assert all(path.stat().st_size <= 2 * record_size for path in sink.paths)
+    assert read_lines(sink.paths) == [RELEASES[:2], RELEASES[2:4], RELEASES[4:]]
+
+
+def test_release_package_sink_writes_valid_packages(tmp_path) -> None:
+    with ReleasePackageSink({"name": "Publisher"}, max_releases=3) as sink:
+        sink.write(Path("a.xml"), tmp_path, RELEASES)
+
+    packages = [json.loads(path.read_text(encoding="utf-8")) for path in sink.paths]
+    assert [package["releases"] for package in packages] == [RELEASES[:3], RELEASES[3:]]
+    for path, package in zip(sink.paths, packages, strict=True):
+        assert package["uri"] == path.resolve().as_uri()
+        assert package["version"] == "1.1"
+        assert package["publisher"] == {"name": "Publisher"}
+        assert package["publishedDate"].endswith("Z")
+
+
+def test_create_sink(tmp_path) -> None:
+    assert isinstance(create_sink(make_config(tmp_path)), ReleaseFileSink)
+
+    sink = create_sink(
+        make_config(tmp_path, output_format="package", publisher_name="Publisher"),
+        stem="worker",
+    )
+    assert isinstance(sink, ReleasePackageSink)
+    assert sink.stem == "worker"
+    assert sink.publisher == {"name": "Publisher"}
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_process_files_streams_releases(tmp_path, executor) -> None:
+    (tmp_path / "input").mkdir()
+    for name in NOTICES:
+        shutil.copy(XMLFILE_PATH / name, tmp_path / "input" / name)
+    config = make_config(tmp_path, executor, output_format="jsonl")
+
+    process_files(NoticeConverter(config), config)
+
+    output_files = sorted(config.output_folder.glob("releases*.jsonl"))
+    releases = [release for lines in read_lines(output_files) for release in lines]
+    assert len(releases) >= len(NOTICES)
+    assert not list(config.output_folder.glob("*_release_*.json"))
+
+
+def test_rerun_replaces_earlier_streams(tmp_path) -> None:
+    (tmp_path / "input").mkdir()
+    for name in NOTICES:
+        shutil.copy(XMLFILE_PATH / name, tmp_path / "input" / name)
+    config = make_config(tmp_path, output_format="jsonl", force=True)
+    process_files(NoticeConverter(config), config)
+    first = read_lines(sorted(config.output_folder.glob("*.jsonl")))
+    stale = [
+        config.output_folder / "releases-4242-00000.jsonl",
+        config.output_folder / "releases-00001.jsonl.partial",
+    ]
+    for path in stale:
+        path.write_text('{"id": "stale"}\n', encoding="utf-8")
+
+    process_files(NoticeConverter(config), config)
+
+    output_files = sorted(config.output_folder.glob("*.jsonl"))
+    assert [path.name for path in output_files] == ["releases-00000.jsonl"]
+    assert not any(path.exists() for path in stale)
+    assert len(read_lines(output_files)[0]) == len(first[0])
+
+
+@pytest.mark.parametrize("resume", [False, True])
+def test_prepare_output_folder(tmp_path, resume) -> None:
+    config = make_config(tmp_path, output_format="package", resume=resume)
+    config.output_folder.mkdir()
+    kept = [
+        config.output_folder / "notice_release_0.json",
+        config.output_folder / "releases-index.json",
+    ]
+    streams = [
+        config.output_folder / "releases-00000.json",
+        config.output_folder / "releases-4242-00000.json",
+    ]
+    partial = config.output_folder / "releases-00001.json.partial"
+    for path in [*kept, *streams, partial]:
+        path.write_text("{}", encoding="utf-8")
+
+    prepare_output_folder(config)
+
+    assert all(path.exists() for path in kept)
+    assert all(path.exists() == resume for path in streams)
+    assert not partial.exists()
+
+
+def test_parse_arguments_output_format(monkeypatch) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "main.py",
+            "in",
+            "out",
+            "ocds-test",
+            "--output-format",
+            "package",
+            "--publisher-name",
+            "Publisher",
+            "--rotate-releases",
+            "500",
+            "--rotate-bytes",
+            "1000000",
+        ],
+    )
+    config = parse_arguments()
+    assert config.output_format == "package"
+    assert config.publisher_name == "Publisher"
+    assert config.rotate_releases == 500
+    assert config.rotate_bytes == 1_000_000
+
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "in", "out", "ocds-test", "--output-format", "package"]
+    )
+    with pytest.raises(SystemExit):
+        parse_arguments()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,145 @@
+# tests/test_parallel_processing.py
+
+import json
+import re
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds import main as main_module
+from ted_and_doffin_to_ocds.main import NoticeConverter, parse_arguments, process_files
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.file_processor import NoticeFileProcessor
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+NOTICES = [
+    "ContractAwardNotice_can-modif_2023-677604.xml",
+    "can_24_minimal.xml",
+    "ContractNotice_cn-standard_2022-963627.xml",
+    "PriorInformationNotice_pin-buyer_2023-100372.xml",
+]
+UUID = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
+
+@pytest.fixture
+def input_folder(tmp_path) -> Path:
+    folder = tmp_path / "input"
+    folder.mkdir()
+    for name in NOTICES:
+        shutil.copy(XMLFILE_PATH / name, folder / name)
+    return folder
+
+
+def make_config(input_path: Path, tmp_path: Path, executor: str) -> Config:
+    return Config(
+        input_path=input_path,
+        output_folder=tmp_path / f"output_{executor}",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / f"{executor}.db",
+        clear_db=False,
+        log_level="INFO",
+        workers=2,
+        executor=executor,
+    )
+
+
+def read_output(folder: Path) -> dict[str, str]:
+    # OCIDs are random, so compare the releases with their UUIDs masked
+    return {
+        path.name: UUID.sub("UUID", json.dumps(json.loads(path.read_text()), sort_keys=True))
+        for path in sorted(folder.glob("*.json"))
+    }
+
+
+def test_file_batches_follow_notice_order(input_folder, tmp_path) -> None:
+    with NoticeFileProcessor(input_folder, tmp_path) as processor:
+        processor.copy_input_files()
+        batches = processor.get_file_batches()
+        sorted_files = processor.get_sorted_files()
+
+    assert [[path.name for path in batch] for batch in batches] == [
+        ["PriorInformationNotice_pin-buyer_2023-100372.xml"],
+        ["ContractNotice_cn-standard_2022-963627.xml"],
+        ["can_24_minimal.xml"],
+        ["ContractAwardNotice_can-modif_2023-677604.xml"],
+    ]
+    assert sorted_files == [path for batch in batches for path in batch]
+
+
+def test_batches_are_processed_one_after_another(tmp_path, monkeypatch) -> None:
+    config = make_config(tmp_path, tmp_path, "thread")
+    config.output_folder.mkdir()
+    converter = NoticeConverter(config)
+    events = []
+
+    def fake_process_file(input_path: Path, _output_folder: Path) -> None:
+        events.append(input_path.name)
+
+    monkeypatch.setattr(converter, "process_file", fake_process_file)
+    batches = [
+        [Path("pin_1.xml"), Path("pin_2.xml"), Path("pin_3.xml")],
+        [Path("cn_1.xml"), Path("cn_2.xml")],
+        [Path("can_1.xml")],
+    ]
+    converter.process_file_batches(batches)
+
+    assert sorted(events[:3]) == ["pin_1.xml", "pin_2.xml", "pin_3.xml"]
+    assert sorted(events[3:5]) == ["cn_1.xml", "cn_2.xml"]
+    assert events[5:] == ["can_1.xml"]
+
+
+def test_process_executor_matches_thread_executor(input_folder, tmp_path) -> None:
+    outputs = {}
+    for executor in ("thread", "process"):
+        config = make_config(input_folder, tmp_path, executor)
+        process_files(NoticeConverter(config), config)
+        outputs[executor] = read_output(config.output_folder)
+
+    assert len(outputs["thread"]) >= len(NOTICES)
+    assert outputs["process"] == outputs["thread"]
+
+
+def test_init_worker_sets_up_converter(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(main_module, "_worker_state", {})
+    loaded = []
+    monkeypatch.setattr(main_module, "load_converters", lambda: loaded.append(True))
+    config = make_config(tmp_path, tmp_path, "process")
+
+    main_module._init_worker(config)
+
+    converter = main_module._worker_state["converter"]
+    assert loaded == [True]
+    assert converter.config is config
+    assert converter.processor.tracker.db_path == str(config.db_path)
+
+
+def test_parse_arguments_workers_and_executor(monkeypatch) -> None:
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        ["main.py", "in", "out", "ocds-test", "--workers", "8", "--executor", "process"],
+    )
+    config = parse_arguments()
+    assert config.workers == 8
+    assert config.executor == "process"
+
+    monkeypatch.setattr(sys, "argv", ["main.py", "in", "out", "ocds-test"])
+    config = parse_arguments()
+    assert config.workers == NoticeConverter.MAX_WORKERS
+    assert config.executor == "thread"
+
+
+@pytest.mark.parametrize("workers", ["0", "-1", "two"])
+def test_parse_arguments_rejects_invalid_workers(monkeypatch, workers) -> None:
+    monkeypatch.setattr(
+        sys, "argv", ["main.py", "in", "out", "ocds-test", "--workers", workers]
+    )
+    with pytest.raises(SystemExit):
+        parse_arguments()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
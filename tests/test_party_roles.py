@@ -0,0 +1,276 @@
+# tests/test_party_roles.py
+
+import pytest
+
+from ted_and_doffin_to_ocds.converters.eforms.party_roles import (
+    merge_party_roles,
+    parse_party_roles,
+)
+
+XML_CONTENT = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractAwardNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractAwardNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2"
+    xmlns:ext="urn:oasis:names:specification:ubl:schema:xsd:CommonExtensionComponents-2"
+    xmlns:efext="http://data.europa.eu/p27/eforms-ubl-extensions/1"
+    xmlns:efac="http://data.europa.eu/p27/eforms-ubl-extension-aggregate-components/1">
+    <ext:UBLExtensions>
+        <ext:UBLExtension>
+            <ext:ExtensionContent>
+                <efext:EformsExtension>
+                    <efac:NoticeResult>
+                        <efac:LotResult>
+                            <cac:FinancingParty>
+                                <cac:PartyIdentification>
+                                    <cbc:ID schemeName="organization">ORG-0003</cbc:ID>
+                                </cac:PartyIdentification>
+                            </cac:FinancingParty>
+                            <cac:PayerParty>
+                                <cac:PartyIdentification>
+                                    <cbc:ID schemeName="organization">ORG-0003</cbc:ID>
+                                </cac:PartyIdentification>
+                            </cac:PayerParty>
+                        </efac:LotResult>
+                        <efac:LotTender>
+                            <cbc:ID schemeName="tender">TEN-0001</cbc:ID>
+                        </efac:LotTender>
+                        <efac:TenderingParty>
+                            <efac:SubContractor>
+                                <cbc:ID schemeName="organization">ORG-0005</cbc:ID>
+                                <efac:MainContractor>
+                                    <cbc:ID schemeName="organization">ORG-0004</cbc:ID>
+                                </efac:MainContractor>
+                            </efac:SubContractor>
+                        </efac:TenderingParty>
+                    </efac:NoticeResult>
+                </efext:EformsExtension>
+            </ext:ExtensionContent>
+        </ext:UBLExtension>
+    </ext:UBLExtensions>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:FiscalLegislationDocumentReference>
+                <cbc:ID>Fiscal1</cbc:ID>
+                <cac:IssuerParty>
+                    <cac:PartyIdentification>
+                        <cbc:ID schemeName="organization">ORG-0001</cbc:ID>
+                    </cac:PartyIdentification>
+                </cac:IssuerParty>
+            </cac:FiscalLegislationDocumentReference>
+            <cac:TenderRecipientParty>
+                <cac:PartyIdentification>
+                    <cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID>
+                </cac:PartyIdentification>
+            </cac:TenderRecipientParty>
+            <cac:AppealTerms>
+                <cac:MediationParty>
+                    <cac:PartyIdentification>
+                        <cbc:ID schemeName="organization">ORG-0002</cbc:ID>
+                    </cac:PartyIdentification>
+                </cac:MediationParty>
+            </cac:AppealTerms>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Part">PAR-0001</cbc:ID>
+        <cac:TenderingTerms>
+            <cac:AdditionalInformationParty>
+                <cac:PartyIdentification>
+                    <cbc:ID>INVALID-ID</cbc:ID>
+                </cac:PartyIdentification>
+            </cac:AdditionalInformationParty>
+            <cac:TenderRecipientParty>
+                <cac:PartyIdentification>
+                    <cbc:ID schemeName="touchpoint">TPO-0001</cbc:ID>
+                </cac:PartyIdentification>
+            </cac:TenderRecipientParty>
+        </cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+</ContractAwardNotice>
+"""
+
+
+def test_parse_party_roles_in_one_pass() -> None:
+    result = parse_party_roles(XML_CONTENT)
+
+    assert result["parties"] == [
+        {"id": "ORG-0002", "roles": ["mediationBody"]},
+        {"id": "TPO-0001", "roles": ["submissionReceiptBody"]},
+        {"id": "ORG-0001", "roles": ["informationService"]},
+        {"id": "ORG-0003", "roles": ["funder", "payer"]},
+        {"id": "ORG-0005", "roles": ["subcontractor"]},
+        {"id": "ORG-0004", "roles": ["tenderer"]},
+    ]
+    assert result["tender"] == {
+        "documents": [
+            {"id": "Fiscal1", "publisher": {"id": "ORG-0001"}, "relatedLots": ["LOT-0001"]}
+        ]
+    }
+    assert result["bids"] == {
+        "details": [
+            {
+                "id": "TEN-0001",
+                "subcontracting": {
+                    "subcontracts": [
+                        {
+                            "id": "1",
+                            "subcontractor": {"id": "ORG-0005"},
+                            "mainContractors": [{"id": "ORG-0004"}],
+                        }
+                    ]
+                },
+            }
+        ]
+    }
+
+
+def test_parse_party_roles_without_references() -> None:
+    xml_content = """<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"/>"""
+
+    assert parse_party_roles(xml_content) is None
+
+
+def test_merge_party_roles_adds_roles_to_indexed_parties() -> None:
+    release_json = {
+        "parties": [
+            {"id": "ORG-0003", "roles": ["buyer", "payer"]},
+            {"id": "TPO-0001", "name": "Desk"},
+        ],
+        "tender": {"documents": [{"id": "Fiscal1", "relatedLots": ["LOT-0002"]}]},
+        "bids": {
+            "details": [
+                {
+                    "id": "TEN-0001",
+                    "subcontracting": {
+                        "subcontracts": [
+                            {"id": "1", "subcontractor": {"id": "ORG-0005"}}
+                        ]
+                    },
+                }
+            ]
+        },
+    }
+
+    merge_party_roles(release_json, parse_party_roles(XML_CONTENT))
+
+    parties = {party["id"]: party for party in release_json["parties"]}
+    assert parties["ORG-0003"]["roles"] == ["buyer", "payer", "funder"]
+    assert parties["TPO-0001"] == {
+        "id": "TPO-0001",
+        "name": "Desk",
+        "roles": ["submissionReceiptBody"],
+    }
+    assert parties["ORG-0004"] == {"id": "ORG-0004", "roles": ["tenderer"]}
+    assert release_json["tender"]["documents"] == [
+        {
+            "id": "Fiscal1",
+            "relatedLots": ["LOT-0002", "LOT-0001"],
+            "publisher": {"id": "ORG-0001"},
+        }
+    ]
+    assert release_json["bids"]["details"][0]["subcontracting"]["subcontracts"] == [
+        {
+            "id": "1",
+            "subcontractor": {"id": "ORG-0005"},
+            "mainContractors": [{"id": "ORG-0004"}],
+        }
+    ]
+
+
+def lot_notice(scope: str, tendering_terms: str) -> str:
+    """Return a notice with one lot or part and the given tendering terms."""
+    lot_id = "LOT-0001" if scope == "Lot" else "PAR-0001"
+    return f"""<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="{scope}">{lot_id}</cbc:ID>
+        <cac:TenderingTerms>{tendering_terms}</cac:TenderingTerms>
+    </cac:ProcurementProjectLot>
+</ContractNotice>"""
+
+
+def party(path: str, party_id: str, scheme: str | None) -> str:
+    """Return the elements of path around a party identification."""
+    scheme_name = f' schemeName="{scheme}"' if scheme else ""
+    xml = f"<cac:PartyIdentification><cbc:ID{scheme_name}>{party_id}</cbc:ID></cac:PartyIdentification>"
+    for tag in reversed(path.split("/")):
+        xml = f"<{tag}>{xml}</{tag}>"
+    return xml
+
+
+# Scope, party element under cac:TenderingTerms, party id, scheme, role
+REFERENCES = [
+    ("Lot", "cac:AdditionalInformationParty", "TPO-0001", "touchpoint", "processContactPoint"),
+    ("Lot", "cac:DocumentProviderParty", "TPO-0001", "touchpoint", "processContactPoint"),
+    (
+        "Lot",
+        "cac:AppealTerms/cac:AppealInformationParty",
+        "TPO-0001",
+        "touchpoint",
+        "reviewContactPoint",
+    ),
+    ("Lot", "cac:AppealTerms/cac:MediationParty", "ORG-0002", "organization", "mediationBody"),
+    ("Lot", "cac:AppealTerms/cac:AppealReceiverParty", "TPO-0001", "touchpoint", "reviewBody"),
+    ("Lot", "cac:TenderEvaluationParty", "TPO-0001", "touchpoint", "evaluationBody"),
+    ("Lot", "cac:TenderRecipientParty", "TPO-0001", "touchpoint", "submissionReceiptBody"),
+    ("Part", "cac:AdditionalInformationParty", "TPO-0001", "touchpoint", "processContactPoint"),
+    ("Part", "cac:AdditionalInformationParty", "ORG-0002", None, "processContactPoint"),
+    ("Part", "cac:AdditionalInformationParty", "INVALID-ID", None, None),
+    ("Part", "cac:DocumentProviderParty", "TPO-0001", "touchpoint", "processContactPoint"),
+    ("Part", "cac:DocumentProviderParty", "INVALID-ID", None, None),
+    (
+        "Part",
+        "cac:AppealTerms/cac:AppealInformationParty",
+        "TPO-0001",
+        "touchpoint",
+        "reviewContactPoint",
+    ),
+    ("Part", "cac:AppealTerms/cac:MediationParty", "ORG-0002", "organization", "mediationBody"),
+    ("Part", "cac:AppealTerms/cac:MediationParty", "TPO-0001", "touchpoint", None),
+    ("Part", "cac:AppealTerms/cac:AppealReceiverParty", "TPO-0001", "touchpoint", "reviewBody"),
+    ("Part", "cac:TenderEvaluationParty", "TPO-0001", "touchpoint", "evaluationBody"),
+    ("Part", "cac:TenderRecipientParty", "TPO-0001", "touchpoint", "submissionReceiptBody"),
+]
+
+
+@pytest.mark.parametrize(("scope", "path", "party_id", "scheme", "role"), REFERENCES)
+def test_parse_party_roles_maps_each_reference(scope, path, party_id, scheme, role) -> None:
+    result = parse_party_roles(lot_notice(scope, party(path, party_id, scheme)))
+
+    if role is None:
+        assert result is None
+    else:
+        assert result == {"parties": [{"id": party_id, "roles": [role]}]}
+
+
+@pytest.mark.parametrize("scope", ["Lot", "Part"])
+@pytest.mark.parametrize(
+    ("reference", "document_id"),
+    [
+        ("cac:FiscalLegislationDocumentReference", "Fiscal1"),
+        ("cac:EnvironmentalLegislationDocumentReference", "Env1"),
+        ("cac:EmploymentLegislationDocumentReference", "Empl1"),
+    ],
+)
+def test_parse_party_roles_maps_each_legislation_issuer(scope, reference, document_id) -> None:
+    issuer = party("cac:IssuerParty", "ORG-0001", "organization")
+    xml_content = lot_notice(
+        scope, f"<{reference}><cbc:ID>{document_id}</cbc:ID>{issuer}</{reference}>"
+    )
+
+    result = parse_party_roles(xml_content)
+
+    document = {"id": document_id, "publisher": {"id": "ORG-0001"}}
+    # Only the documents of lots are related to their lot
+    if scope == "Lot":
+        document["relatedLots"] = ["LOT-0001"]
+    assert result == {
+        "parties": [{"id": "ORG-0001", "roles": ["informationService"]}],
+        "tender": {"documents": [document]},
+    }
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
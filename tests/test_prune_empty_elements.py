@@ -0,0 +1,58 @@
+# tests/test_prune_empty_elements.py
+
+import pytest
+
+from ted_and_doffin_to_ocds.utils.common_operations import (
+    prune_empty_elements,
+    remove_empty_dicts,
+    remove_empty_elements,
+)
+
+
+def test_prune_empty_elements_in_place() -> None:
+    lot = {"id": "LOT-0001", "hasOptions": False, "value": {"amount": 0}}
+    release = {
+        "id": "1",
+        "description": "",
+        "tag": [],
+        "parties": [{}, None, {"id": "ORG-0001", "roles": ["buyer", None]}],
+        "tender": {"lots": [lot], "value": None, "amount": 0.0},
+    }
+
+    prune_empty_elements(release)
+
+    assert release == {
+        "id": "1",
+        "parties": [{"id": "ORG-0001", "roles": ["buyer"]}],
+        "tender": {
+            "lots": [{"id": "LOT-0001", "hasOptions": False, "value": {"amount": 0}}],
+            "amount": 0.0,
+        },
+    }
+    assert release["tender"]["lots"][0] is lot
+
+
+def test_prune_empty_elements_removes_nested_empties_bottom_up() -> None:
+    release = {"id": "1", "tender": {"lots": [{"value": {"currency": None}}]}}
+
+    prune_empty_elements(release)
+
+    assert release == {"id": "1"}
+
+
+def test_prune_empty_elements_matches_two_pass_cleanup() -> None:
+    release = {
+        "id": "1",
+        "awards": [{"id": "1", "items": [], "status": None}, {}],
+        "bids": {"details": [{"id": "TEN-0001", "value": {}}]},
+        "tender": {"techniques": {"hasElectronicAuction": False}},
+    }
+    expected = remove_empty_dicts(remove_empty_elements(release))
+
+    prune_empty_elements(release)
+
+    assert release == expected
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
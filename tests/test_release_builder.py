@@ -0,0 +1,95 @@
+# tests/test_release_builder.py
+
+import json
+
+import pytest
+
+from ted_and_doffin_to_ocds.converters.eforms.bt_21_lot import merge_lot_title
+from ted_and_doffin_to_ocds.converters.eforms.organizations import (
+    merge_organizations,
+)
+from ted_and_doffin_to_ocds.utils import release_builder
+from ted_and_doffin_to_ocds.utils.release_builder import ReleaseBuilder, find_by_id
+
+
+def test_find_by_id_without_builder() -> None:
+    parties = [{"id": "ORG-0001"}, {"name": "no id"}, {"id": "ORG-0001", "x": 1}]
+
+    assert find_by_id(parties, "ORG-0001") is parties[0]
+    assert find_by_id(parties, "ORG-0002") is None
+    assert find_by_id(parties, None) is parties[1]
+
+
+def test_find_by_id_indexes_appended_items(monkeypatch) -> None:
+    lots = [{"id": f"LOT-{i:04}"} for i in range(3)]
+    with ReleaseBuilder({"tender": {"lots": lots}}):
+        assert find_by_id(lots, "LOT-0001") is lots[1]
+
+        def fail(*_args) -> None:
+            pytest.fail("lookups must use the index")
+
+        monkeypatch.setattr(release_builder, "_scan_by_id", fail)
+        lots.append({"id": "LOT-0003"})
+        assert find_by_id(lots, "LOT-0003") is lots[3]
+        assert find_by_id(lots, "LOT-0004") is None
+
+
+def test_find_by_id_rebuilds_changed_index() -> None:
+    lots = [{"id": "LOT-0001"}, {"id": "LOT-0002"}]
+    with ReleaseBuilder({}):
+        assert find_by_id(lots, "LOT-0002") is lots[1]
+
+        lots[:] = [{"id": "LOT-0002", "new": True}]
+        assert find_by_id(lots, "LOT-0002") is lots[0]
+        assert find_by_id(lots, "LOT-0001") is None
+
+        lots[0]["id"] = "LOT-0003"
+        assert find_by_id(lots, "LOT-0002") is None
+
+
+def test_find_by_id_sees_a_replaced_middle_item() -> None:
+    statistics = [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+    with ReleaseBuilder({}):
+        assert find_by_id(statistics, "2") is statistics[1]
+
+        statistics[1] = {"id": "2", "value": 4}
+        assert find_by_id(statistics, "2") is statistics[1]
+
+        statistics[1] = {"id": "4"}
+        assert find_by_id(statistics, "2") is None
+        assert find_by_id(statistics, "4") is statistics[1]
+        assert find_by_id(statistics, "3") is statistics[2]
+
+
+def test_builders_are_nested_and_cleared() -> None:
+    with ReleaseBuilder({}) as outer:
+        with ReleaseBuilder({}) as inner:
+            assert release_builder._state.builder is inner
+        assert release_builder._state.builder is outer
+    assert release_builder._state.builder is None
+
+
+def test_merges_produce_plain_dicts() -> None:
+    release_json = {}
+    with ReleaseBuilder(release_json):
+        merge_organizations(
+            release_json, {"parties": [{"id": "ORG-0001", "name": "A"}]}
+        )
+        merge_organizations(
+            release_json,
+            {"parties": [{"id": "ORG-0001", "name": "B"}, {"id": "ORG-0002", "name": "C"}]},
+        )
+        merge_lot_title(
+            release_json, {"tender": {"lots": [{"id": "LOT-0001", "title": "T"}]}}
+        )
+
+    assert release_json == {
+        "parties": [{"id": "ORG-0001", "name": "B"}, {"id": "ORG-0002", "name": "C"}],
+        "tender": {"lots": [{"id": "LOT-0001", "title": "T"}]},
+    }
+    assert type(release_json["parties"]) is list
+    assert json.loads(json.dumps(release_json)) == release_json
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
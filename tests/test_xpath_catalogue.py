@@ -0,0 +1,138 @@
+# tests/test_xpath_catalogue.py
+
+import ast
+from pathlib import Path
+
+import pytest
+from lxml import etree
+
+from ted_and_doffin_to_ocds.converters.eforms import bt_21_lot
+from ted_and_doffin_to_ocds.utils.notice_document import EFORMS_NAMESPACES
+from ted_and_doffin_to_ocds.utils.xpath_catalogue import XPATHS, XPathCatalogue
+
+CONVERTERS_PATH = (
+    Path(__file__).parent.parent / "src" / "ted_and_doffin_to_ocds" / "converters"
+)
+# Converters that may call element.xpath() directly, with the reason. The TED
+# converters read TED XML, whose namespaces are not in the eForms catalogue.
+RAW_XPATH_EXCEPTIONS = {
+    "TED": "TED XML",
+    "eforms/bt_113_lot.py": "TED XML fallback",
+}
+
+NOTICE = """<?xml version="1.0" encoding="UTF-8"?>
+<ContractNotice xmlns="urn:oasis:names:specification:ubl:schema:xsd:ContractNotice-2"
+    xmlns:cac="urn:oasis:names:specification:ubl:schema:xsd:CommonAggregateComponents-2"
+    xmlns:cbc="urn:oasis:names:specification:ubl:schema:xsd:CommonBasicComponents-2">
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0001</cbc:ID>
+        <cac:ProcurementProject>
+            <cbc:Name languageID="ENG">Lot title</cbc:Name>
+        </cac:ProcurementProject>
+    </cac:ProcurementProjectLot>
+    <cac:ProcurementProjectLot>
+        <cbc:ID schemeName="Lot">LOT-0002</cbc:ID>
+    </cac:ProcurementProjectLot>
+</ContractNotice>
+"""
+
+
+@pytest.fixture
+def catalogue() -> XPathCatalogue:
+    return XPathCatalogue(EFORMS_NAMESPACES)
+
+
+@pytest.fixture
+def root() -> etree._Element:
+    return etree.fromstring(NOTICE.encode())
+
+
+def test_register_compiles_with_eforms_namespaces(catalogue, root) -> None:
+    lot_ids = catalogue.register(
+        "test.lot_ids", "/*/cac:ProcurementProjectLot/cbc:ID/text()"
+    )
+
+    assert lot_ids(root) == ["LOT-0001", "LOT-0002"]
+    assert catalogue["test.lot_ids"] is lot_ids
+    assert "test.lot_ids" in catalogue
+    assert len(catalogue) == 1
+
+
+def test_register_binds_variables(catalogue, root) -> None:
+    lot = catalogue.register(
+        "test.lot", "/*/cac:ProcurementProjectLot[cbc:ID=$lot_id]/cbc:ID/text()"
+    )
+
+    assert lot(root, lot_id="LOT-0002") == ["LOT-0002"]
+    assert lot(root, lot_id="it's") == []
+
+
+def test_register_same_name(catalogue) -> None:
+    first = catalogue.register("test.id", "cbc:ID/text()")
+    assert catalogue.register("test.id", "cbc:ID/text()") is first
+
+    with pytest.raises(ValueError, match="already registered"):
+        catalogue.register("test.id", "cbc:Name/text()")
+
+
+def test_identical_expressions_share_compiled_xpath(catalogue) -> None:
+    first = catalogue.register("test.first", "cbc:ID/text()")
+    second = catalogue.register("test.second", "cbc:ID/text()")
+
+    assert first is not second
+    assert first._xpath is second._xpath
+
+
+def test_register_rejects_invalid_expression(catalogue) -> None:
+    with pytest.raises(etree.XPathSyntaxError):
+        catalogue.register("test.invalid", "cbc:ID[")
+
+
+def test_counts(catalogue, root) -> None:
+    lot_ids = catalogue.register("test.lot_ids", "//cac:ProcurementProjectLot")
+    catalogue.register("test.unused", "cbc:ID")
+
+    lot_ids(root)
+    lot_ids(root)
+
+    assert catalogue.counts() == {"test.lot_ids": 2, "test.unused": 0}
+    catalogue.reset_counts()
+    assert catalogue.counts() == {"test.lot_ids": 0, "test.unused": 0}
+
+
+def test_converters_register_at_import(root) -> None:
+    entry = XPATHS["bt_21_lot.XPATH_PROCUREMENT_PROJECT_NAME"]
+    before = entry.count
+
+    result = bt_21_lot.parse_lot_title(etree.tostring(root))
+
+    assert result == {"tender": {"lots": [{"id": "LOT-0001", "title": "Lot title"}]}}
+    assert entry.count == before + 2
+
+
+def raw_xpath_calls(path: Path) -> list[int]:
+    """Return the lines of path that call .xpath() on an element."""
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    return [
+        node.lineno
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Call)
+        and isinstance(node.func, ast.Attribute)
+        and node.func.attr == "xpath"
+    ]
+
+
+def test_converters_use_the_catalogue() -> None:
+    calls = []
+    for path in sorted(CONVERTERS_PATH.rglob("*.py")):
+        relative = path.relative_to(CONVERTERS_PATH).as_posix()
+        if relative in RAW_XPATH_EXCEPTIONS or path.parent.name in RAW_XPATH_EXCEPTIONS:
+            continue
+        calls.extend(f"{relative}:{line}" for line in raw_xpath_calls(path))
+
+    # Register the expression with register_xpath() instead
+    assert calls == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])
@@ -0,0 +1,142 @@
+# tests/test_zero_copy.py
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ted_and_doffin_to_ocds.main import NoticeConverter, process_files
+from ted_and_doffin_to_ocds.utils import file_processor
+from ted_and_doffin_to_ocds.utils.config import Config
+from ted_and_doffin_to_ocds.utils.file_processor import NoticeFileProcessor
+from ted_and_doffin_to_ocds.utils.snapshot_manifest import (
+    SnapshotManifest,
+    SnapshotMismatchError,
+)
+
+XMLFILE_PATH = Path(__file__).parent.parent / "xmlfile"
+NOTICES = [
+    "can_24_minimal.xml",
+    "ContractNotice_cn-standard_2022-963627.xml",
+    "PriorInformationNotice_pin-buyer_2023-100372.xml",
+]
+
+
+@pytest.fixture
+def input_folder(tmp_path) -> Path:
+    folder = tmp_path / "input"
+    folder.mkdir()
+    for name in NOTICES:
+        shutil.copy(XMLFILE_PATH / name, folder / name)
+    return folder
+
+
+def make_config(input_folder: Path, tmp_path: Path, **kwargs) -> Config:
+    return Config(
+        input_path=input_folder,
+        output_folder=tmp_path / "output",
+        ocid_prefix="ocds-test",
+        scheme="eu-oj",
+        db_path=tmp_path / "notices.db",
+        clear_db=False,
+        log_level="INFO",
+        zero_copy=True,
+        **kwargs,
+    )
+
+
+def test_zero_copy_reads_files_in_place(input_folder, tmp_path, monkeypatch) -> None:
+    def fail_copy(*_args) -> None:
+        pytest.fail("input files must not be copied")
+
+    monkeypatch.setattr(file_processor.shutil, "copy2", fail_copy)
+    with NoticeFileProcessor(input_folder, tmp_path, zero_copy=True) as processor:
+        processor.prepare_input_files()
+        files = processor.get_sorted_files()
+
+    assert processor.temp_dir is None
+    assert {path.parent for path in files} == {input_folder}
+    assert [path.name for path in files] == [
+        "PriorInformationNotice_pin-buyer_2023-100372.xml",
+        "ContractNotice_cn-standard_2022-963627.xml",
+        "can_24_minimal.xml",
+    ]
+
+
+def test_zero_copy_keeps_size_limit(input_folder, tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(NoticeFileProcessor, "MAX_FILE_SIZE", 8000)
+    with NoticeFileProcessor(input_folder, tmp_path, zero_copy=True) as processor:
+        processor.prepare_input_files()
+        files = processor.list_input_files()
+
+    assert [path.name for path in files] == [
+        "PriorInformationNotice_pin-buyer_2023-100372.xml"
+    ]
+
+
+def test_snapshot_manifest_is_written_and_reused(input_folder, tmp_path) -> None:
+    manifest_path = tmp_path / "snapshot.json"
+    with NoticeFileProcessor(
+        input_folder, tmp_path, zero_copy=True, snapshot_path=manifest_path
+    ) as processor:
+        processor.prepare_input_files()
+
+    entries = json.loads(manifest_path.read_text())["files"]
+    assert sorted(Path(entry["path"]).name for entry in entries) == sorted(NOTICES)
+    entry = entries[0]
+    stat = Path(entry["path"]).stat()
+    assert entry["size"] == stat.st_size
+    assert entry["mtime_ns"] == stat.st_mtime_ns
+    assert len(entry["sha256"]) == 64
+
+    # Files added after the snapshot are not part of the run
+    shutil.copy(XMLFILE_PATH / "can_24_minimal.xml", input_folder / "new.xml")
+    with NoticeFileProcessor(
+        input_folder, tmp_path, zero_copy=True, snapshot_path=manifest_path
+    ) as processor:
+        processor.prepare_input_files()
+        files = processor.list_input_files()
+
+    assert sorted(path.name for path in files) == sorted(NOTICES)
+
+
+def test_snapshot_verify_detects_changes(input_folder) -> None:
+    path = input_folder / NOTICES[0]
+    snapshot = SnapshotManifest.create([path])
+    content = path.read_bytes()
+
+    snapshot.verify(path, content)
+    snapshot.verify(input_folder / "not-in-snapshot.xml", b"<root/>")
+    with pytest.raises(SnapshotMismatchError, match="size"):
+        snapshot.verify(path, content + b" ")
+    with pytest.raises(SnapshotMismatchError, match="hash"):
+        snapshot.verify(path, content.replace(b"<", b"[", 1))
+
+
+def test_zero_copy_conversion(input_folder, tmp_path) -> None:
+    config = make_config(
+        input_folder, tmp_path, snapshot_manifest=tmp_path / "snapshot.json"
+    )
+    process_files(NoticeConverter(config), config)
+
+    outputs = sorted(path.name for path in config.output_folder.glob("*.json"))
+    assert outputs == sorted(f"{Path(name).stem}_release_0.json" for name in NOTICES)
+
+
+def test_changed_file_fails_conversion(input_folder, tmp_path) -> None:
+    manifest_path = tmp_path / "snapshot.json"
+    config = make_config(input_folder, tmp_path, snapshot_manifest=manifest_path)
+    path = input_folder / NOTICES[0]
+    SnapshotManifest.create([path]).write(manifest_path)
+    path.write_bytes(path.read_bytes() + b"\n")
+
+    with pytest.raises(RuntimeError, match="Failed to process 1 files"):
+        process_files(NoticeConverter(config), config)
+
+    error_log = config.output_folder / f"{path.stem}_error.log"
+    assert "changed since the snapshot" in error_log.read_text()
+
+
+if __name__ == "__main__":
+    pytest.main(["-v"])